@@ -1,11 +1,13 @@
-"""組み込みprimitiveを名前付きの4列×5行で一覧表示するスケッチ。"""
+"""組み込みprimitiveを名前付きの4列×6行で一覧表示するスケッチ。"""
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from grafix import E, G, run
 
 CANVAS_WIDTH = 360
-CANVAS_HEIGHT = 450
+CANVAS_HEIGHT = 530
 
 _COLUMNS = 4
 _CELL_WIDTH = CANVAS_WIDTH / _COLUMNS
@@ -13,6 +15,7 @@ _CELL_HEIGHT = 80.0
 _GRID_TOP = 26.0
 _SAMPLE_Y_OFFSET = 34.0
 _LABEL_Y_OFFSET = 65.0
+_GEOMETRY_FILE_SAMPLE = Path(__file__).with_name("geometry_file_sample.ggeom")
 
 PRIMITIVE_NAMES = (
     "arc",
@@ -20,6 +23,7 @@ PRIMITIVE_NAMES = (
     "bezier",
     "circle",
     "ellipse",
+    "geometry_file",
     "grid",
     "line",
     "lissajous",
@@ -94,18 +98,23 @@ def _primitive_samples():
         segments=72,
         center=centers[4],
     )
-    grid = G.grid(nx=5, ny=4, center=centers[5], scale=48.0)
-    line = G.line(center=centers[6], length=52.0, angle=28.0)
+    geometry_file = G.geometry_file(
+        path=str(_GEOMETRY_FILE_SAMPLE),
+        center=centers[5],
+        scale=24.0,
+    )
+    grid = G.grid(nx=5, ny=4, center=centers[6], scale=48.0)
+    line = G.line(center=centers[7], length=52.0, angle=28.0)
     lissajous = G.lissajous(
         a=3,
         b=2,
         phase=35.0,
         samples=160,
         turns=1.0,
-        center=centers[7],
+        center=centers[8],
         scale=44.0,
     )
-    cx, cy, cz = centers[8]
+    cx, cy, cz = centers[9]
     laplace_field_grid = G.laplace_field_grid(
         preset="cylinder_uniform",
         u_min=-3.0,
@@ -125,7 +134,7 @@ def _primitive_samples():
         clip_ymax=cy + 25.0,
         boundary_samples=64,
     )
-    cx, cy, cz = centers[9]
+    cx, cy, cz = centers[10]
     lsystem = G.lsystem(
         kind="plant",
         iters=3,
@@ -139,10 +148,10 @@ def _primitive_samples():
     polygon = G.polygon(
         n_sides=6,
         phase=30.0,
-        center=centers[10],
+        center=centers[11],
         scale=44.0,
     )
-    cx, cy, cz = centers[11]
+    cx, cy, cz = centers[12]
     polyline = G.polyline(
         points=(
             (cx - 25.0, cy - 12.0, cz),
@@ -158,7 +167,7 @@ def _primitive_samples():
     )(
         G.polyhedron(
             kind="icosahedron",
-            center=centers[12],
+            center=centers[13],
             scale=40.0,
         )
     )
@@ -166,7 +175,7 @@ def _primitive_samples():
         width=50.0,
         height=29.0,
         angle=18.0,
-        center=centers[13],
+        center=centers[14],
     )
     sphere = E.rotate(
         auto_center=True,
@@ -176,7 +185,7 @@ def _primitive_samples():
             subdivisions=0,
             style="rings",
             line_mode="both",
-            center=centers[14],
+            center=centers[15],
             scale=42.0,
         )
     )
@@ -186,9 +195,9 @@ def _primitive_samples():
         turns=4.0,
         phase=15.0,
         samples=160,
-        center=centers[15],
+        center=centers[16],
     )
-    cx, cy, cz = centers[16]
+    cx, cy, cz = centers[17]
     spline = G.spline(
         points=(
             (cx - 25.0, cy - 12.0, cz),
@@ -200,7 +209,7 @@ def _primitive_samples():
         tension=0.1,
         segments_per_span=18,
     )
-    cx, cy, cz = centers[17]
+    cx, cy, cz = centers[18]
     text = G.text(
         text="Aa",
         text_align="center",
@@ -217,7 +226,7 @@ def _primitive_samples():
             minor_radius=0.38,
             major_segments=12,
             minor_segments=7,
-            center=centers[18],
+            center=centers[19],
             scale=17.0,
         )
     )
@@ -229,7 +238,7 @@ def _primitive_samples():
         phase=15.0,
         samples=128,
         angle=0.0,
-        center=centers[19],
+        center=centers[20],
     )
 
     return (
@@ -238,6 +247,7 @@ def _primitive_samples():
         ("bezier", bezier),
         ("circle", circle),
         ("ellipse", ellipse),
+        ("geometry_file", geometry_file),
         ("grid", grid),
         ("line", line),
         ("lissajous", lissajous),
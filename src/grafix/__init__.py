@@ -22,12 +22,14 @@ from grafix.api import (
     RuntimeLimits,
     VariationBatchResult,
     VariationRenderResult,
+    VideoRenderResult,
     effect,
     export,
     preset,
     primitive,
     render,
     render_variation_batch,
+    render_video,
     run,
 )
 from grafix.cc import cc
@@ -50,6 +52,7 @@ __all__ = [
     "RuntimeLimits",
     "VariationBatchResult",
     "VariationRenderResult",
+    "VideoRenderResult",
     "cc",
     "effect",
     "export",
@@ -57,5 +60,6 @@ __all__ = [
     "primitive",
     "render",
     "render_variation_batch",
+    "render_video",
     "run",
 ]
@@ -25,6 +25,7 @@ from .variation_batch import (
     VariationRenderResult,
     render_variation_batch,
 )
+from .video import VideoRenderResult, render_video
 from grafix.core.operation_authoring import effect, primitive
 from grafix.core.resource_budget import ResourceBudget, ResourceLimitError
 from grafix.core.runtime_limits import RuntimeLimitProfiles, RuntimeLimits
@@ -47,12 +48,14 @@ __all__ = [
     "RuntimeLimits",
     "VariationBatchResult",
     "VariationRenderResult",
+    "VideoRenderResult",
     "effect",
     "export",
     "preset",
     "primitive",
     "render",
     "render_variation_batch",
+    "render_video",
     "run",
 ]
 
@@ -9,6 +9,8 @@ from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
 from typing import Any, Literal, Protocol, TypeAlias
 
+import numpy as np
+
 from grafix.core.geometry import Geometry
 from grafix.core.layer import Layer
 from grafix.core.operation_catalog import OperationCatalogEntry
@@ -16,6 +18,29 @@ from grafix.core.scene import SceneItem
 
 Vec3: TypeAlias = tuple[float, float, float]
 
+class _CircleFactory(Protocol):
+    def __call__(self, *, activate: bool = ..., radius: float = ..., segments: int = ..., center: Vec3 = ..., key: str | int | None = ..., instance_key: str | int | None = ..., shared: bool = ...) -> Geometry:
+        """
+        円を閉じたpolylineとして生成する。
+
+        引数:
+            activate: このプリミティブによる形状生成を有効にする。, bool
+            radius: 円の中心から輪郭までの半径を指定します。, float, range [0.0, 200.0]
+            segments: 円周を近似する直線セグメントの数を指定します。, int, range [3, 512]
+            center: 円の中心となる XYZ 座標を指定します。, vec3, range [-300.0, 300.0]
+            key: コード移動後も同じパラメータグループとして扱うための semantic identity。
+            instance_key: loop/comprehension の反復ごとにパラメータグループを分ける identity。
+            shared: True なら反復呼び出しで同じ semantic parameter group を意図的に共有する。instance_key とは同時指定できない。
+        """
+        ...
+    def many(self, *, activate: bool = ..., radius: float | np.ndarray = ..., segments: int = ..., center: Vec3 | np.ndarray = ..., key: str | int | None = ..., instance_key: str | int | None = ..., shared: bool = ...) -> Geometry:
+        """
+        要素ごとの配列引数から N 個の circle を 1 node で生成する。
+
+        配列で渡せる引数: radius, center。共有引数だけを Parameter GUI に公開する。
+        """
+        ...
+
 class _G(Protocol):
     def __call__(self, name: str | None = None) -> _G:
         """ラベル付き primitive 名前空間を返す。"""
@@ -103,31 +128,33 @@ class _G(Protocol):
             shared: True なら反復呼び出しで同じ semantic parameter group を意図的に共有する。instance_key とは同時指定できない。
         """
         ...
-    def circle(self, *, activate: bool = ..., radius: float = ..., segments: int = ..., center: Vec3 = ..., key: str | int | None = ..., instance_key: str | int | None = ..., shared: bool = ...) -> Geometry:
+    circle: _CircleFactory
+    def ellipse(self, *, activate: bool = ..., radius_x: float = ..., radius_y: float = ..., angle: float = ..., segments: int = ..., center: Vec3 = ..., key: str | int | None = ..., instance_key: str | int | None = ..., shared: bool = ...) -> Geometry:
         """
-        円を閉じたpolylineとして生成する。
+        楕円を閉じたpolylineとして生成する。
 
         引数:
             activate: このプリミティブによる形状生成を有効にする。, bool
-            radius: 円の中心から輪郭までの半径を指定します。, float, range [0.0, 200.0]
-            segments: 円周を近似する直線セグメントの数を指定します。, int, range [3, 512]
-            center: 円の中心となる XYZ 座標を指定します。, vec3, range [-300.0, 300.0]
+            radius_x: 回転前の X 軸方向における楕円の半径を指定します。, float, range [0.0, 200.0]
+            radius_y: 回転前の Y 軸方向における楕円の半径を指定します。, float, range [0.0, 200.0]
+            angle: 楕円を中心まわりに回転させる角度を度単位で指定します。, float, range [-180.0, 180.0]
+            segments: 楕円周を近似する直線セグメントの数を指定します。, int, range [3, 512]
+            center: 楕円の中心となる XYZ 座標を指定します。, vec3, range [-300.0, 300.0]
             key: コード移動後も同じパラメータグループとして扱うための semantic identity。
             instance_key: loop/comprehension の反復ごとにパラメータグループを分ける identity。
             shared: True なら反復呼び出しで同じ semantic parameter group を意図的に共有する。instance_key とは同時指定できない。
         """
         ...
-    def ellipse(self, *, activate: bool = ..., radius_x: float = ..., radius_y: float = ..., angle: float = ..., segments: int = ..., center: Vec3 = ..., key: str | int | None = ..., instance_key: str | int | None = ..., shared: bool = ...) -> Geometry:
+    def geometry_file(self, *, activate: bool = ..., path: str = ..., layer: int = ..., center: Vec3 = ..., scale: float = ..., key: str | int | None = ..., instance_key: str | int | None = ..., shared: bool = ...) -> Geometry:
         """
-        楕円を閉じたpolylineとして生成する。
+        grafix geometry file の 1 layer をポリライン列として読み込む。
 
         引数:
             activate: このプリミティブによる形状生成を有効にする。, bool
-            radius_x: 回転前の X 軸方向における楕円の半径を指定します。, float, range [0.0, 200.0]
-            radius_y: 回転前の Y 軸方向における楕円の半径を指定します。, float, range [0.0, 200.0]
-            angle: 楕円を中心まわりに回転させる角度を度単位で指定します。, float, range [-180.0, 180.0]
-            segments: 楕円周を近似する直線セグメントの数を指定します。, int, range [3, 512]
-            center: 楕円の中心となる XYZ 座標を指定します。, vec3, range [-300.0, 300.0]
+            path: 読み込む grafix geometry file のパスを指定し、空文字では何も生成しません。, str
+            layer: file 内で読み込む layer を保存順の番号で指定します。, int, range [0, 32]
+            center: 読み込んだ layer 全体を平行移動する XYZ 座標を指定します。, vec3, range [0.0, 300.0]
+            scale: 保存時の座標に対して適用する等方スケールを指定します。, float, range [0.0, 10.0]
             key: コード移動後も同じパラメータグループとして扱うための semantic identity。
             instance_key: loop/comprehension の反復ごとにパラメータグループを分ける identity。
             shared: True なら反復呼び出しで同じ semantic parameter group を意図的に共有する。instance_key とは同時指定できない。
@@ -274,7 +301,7 @@ class _G(Protocol):
             shared: True なら反復呼び出しで同じ semantic parameter group を意図的に共有する。instance_key とは同時指定できない。
         """
         ...
-    def polyline(self, *, activate: bool = ..., points: tuple[tuple[float, ...], ...] = ..., closed: bool = ..., key: str | int | None = ..., instance_key: str | int | None = ..., shared: bool = ...) -> Geometry:
+    def polyline(self, *, activate: bool = ..., points: tuple[tuple[float, ...], ...] | np.ndarray = ..., closed: bool = ..., key: str | int | None = ..., instance_key: str | int | None = ..., shared: bool = ...) -> Geometry:
         """
         2D/3D point列から単一polylineを生成する。
 
@@ -1923,6 +1950,7 @@ P: _P
 from grafix.api.export import export as export
 from grafix.api.render import (Color as Color, ExportFormat as ExportFormat, ExportResult as ExportResult, Frame as Frame, RenderOptions as RenderOptions, RenderSession as RenderSession, RenderSessionMetadata as RenderSessionMetadata, render as render)
 from grafix.api.variation_batch import (VariationBatchResult as VariationBatchResult, VariationRenderResult as VariationRenderResult, render_variation_batch as render_variation_batch)
+from grafix.api.video import (VideoRenderResult as VideoRenderResult, render_video as render_video)
 from grafix.api.preset import preset as preset
 from grafix.core.operation_authoring import effect as effect
 from grafix.core.operation_authoring import primitive as primitive
@@ -1950,6 +1978,7 @@ def run(
     midi_mode: str = ...,
     n_worker: int = ...,
     evaluation_timeout: float | None = ...,
+    refine_after: float | None = ...,
     fps: float = ...,
     seed: int | None = ...,
     runtime_limit_profiles: RuntimeLimitProfiles = ...,
@@ -1960,4 +1989,4 @@ def run(
     """
     ...
 
-__all__ = ['Color', 'E', 'ExportFormat', 'ExportResult', 'Frame', 'G', 'L', 'P', 'RenderOptions', 'RenderSession', 'RenderSessionMetadata', 'ResourceBudget', 'ResourceLimitError', 'RuntimeLimitProfiles', 'RuntimeLimits', 'VariationBatchResult', 'VariationRenderResult', 'effect', 'export', 'preset', 'primitive', 'render', 'render_variation_batch', 'run']
+__all__ = ['Color', 'E', 'ExportFormat', 'ExportResult', 'Frame', 'G', 'L', 'P', 'RenderOptions', 'RenderSession', 'RenderSessionMetadata', 'ResourceBudget', 'ResourceLimitError', 'RuntimeLimitProfiles', 'RuntimeLimits', 'VariationBatchResult', 'VariationRenderResult', 'VideoRenderResult', 'effect', 'export', 'preset', 'primitive', 'render', 'render_variation_batch', 'render_video', 'run']
@@ -6,6 +6,9 @@ from collections.abc import Mapping
 from difflib import get_close_matches
 from typing import Any, Protocol
 
+import numpy as np
+
+from grafix.core.array_argument import ArrayArgument
 from grafix.core.geometry import normalize_args
 from grafix.core.operation_declaration import OpKind
 from grafix.core.operation_schema import ParameterOpSchema
@@ -87,6 +90,16 @@ def validate_operation_kwargs(
         meta = schema.meta.get(name)
         if meta is None:
             if name in fixed_args:
+                if type(value) is ArrayArgument or (
+                    isinstance(value, np.ndarray) and value.dtype.kind == "f"
+                ):
+                    # 点列などの大きな code-owned 入力は tuple tree へ展開しない。
+                    try:
+                        canonical[name] = ArrayArgument(value)
+                    except (TypeError, ValueError) as exc:
+                        message = f"{spec.kind} {op!r} の {name!r} が不正です: {exc}"
+                        raise type(exc)(message) from exc
+                    continue
                 canonical[name] = canonical_immutable_value(
                     value,
                     name=f"{spec.kind} {op!r} の {name!r}",
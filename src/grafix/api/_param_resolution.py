@@ -7,6 +7,7 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any
 
+from grafix.core.geometry import Geometry
 from grafix.core.parameters import current_frame_params, current_param_store, resolve_params
 from grafix.core.parameters.context import current_param_recording_enabled
 from grafix.core.parameters.identity import identity_string
@@ -42,6 +43,24 @@ def set_api_label(*, op: str, site_id: str, label: str | None) -> None:
     raise RuntimeError(_NO_STORE_FOR_LABEL_ERROR)
 
 
+def record_api_geometry(*, op: str, site_id: str, geometry: Geometry) -> Geometry:
+    """(op, site_id) の parameter を消費した Geometry node を frame へ記録する。
+
+    依存追跡が ParameterKey から影響を受ける node を引けるようにする。
+    記録 context の外では何もせず、``geometry`` をそのまま返す。
+    """
+
+    if current_param_recording_enabled():
+        frame_params = current_frame_params()
+        if frame_params is not None:
+            frame_params.record_geometry_site(
+                op=op,
+                site_id=site_id,
+                geometry_id=geometry.id,
+            )
+    return geometry
+
+
 def resolve_api_params(
     *,
     op: str,
@@ -80,4 +99,4 @@ def resolve_api_params(
     return base_params
 
 
-__all__ = ["resolve_api_params", "set_api_label"]
+__all__ = ["record_api_geometry", "resolve_api_params", "set_api_label"]
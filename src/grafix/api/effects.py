@@ -8,7 +8,7 @@ from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any, Callable, Literal
 
-from ._param_resolution import resolve_api_params, set_api_label
+from ._param_resolution import record_api_geometry, resolve_api_params, set_api_label
 from ._operation_selector import (
     FrozenParamsByTarget,
     freeze_params_by_target,
@@ -388,12 +388,16 @@ class EffectBuilder:
                         f": {lowered.op!r}"
                     )
                 inputs = (result,)
-            result = Geometry._from_canonical_args(
-                op=lowered.op,
-                operation=lowered.ref.operation,
-                inputs=inputs,
-                args=lowered.args,
-                cache_policy=lowered.cache_policy,
+            result = record_api_geometry(
+                op=lowered.parameter_op,
+                site_id=lowered.site_id,
+                geometry=Geometry._from_canonical_args(
+                    op=lowered.op,
+                    operation=lowered.ref.operation,
+                    inputs=inputs,
+                    args=lowered.args,
+                    cache_policy=lowered.cache_policy,
+                ),
             )
         return result
 
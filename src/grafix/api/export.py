@@ -4,13 +4,13 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from grafix.api.render import ExportFormat, ExportResult, Frame
+from grafix.api.render import ExportFormat, ExportResult, Frame, FrameStream
 from grafix.export.capture import CaptureService
 from grafix.export.image import png_output_size
 
 
 def export(
-    frame: Frame,
+    frame: Frame | FrameStream,
     path: str | Path,
     *,
     overwrite: bool = False,
@@ -19,8 +19,9 @@ def export(
 
     Parameters
     ----------
-    frame : Frame
+    frame : Frame or FrameStream
         :func:`grafix.render` または :class:`grafix.RenderSession` が返したフレーム。
+        ``RenderSession.stream`` の `FrameStream` は layer を realize しながら書き出す。
     path : str or Path
         ``.svg``、``.png``、``.gcode`` のいずれかで終わる要求 path。
     overwrite : bool, optional
@@ -33,8 +34,8 @@ def export(
         連番付与を含む実 artifact path、形式、manifest path。
     """
 
-    if not isinstance(frame, Frame):
-        raise TypeError("frame は Frame である必要があります")
+    if not isinstance(frame, (Frame, FrameStream)):
+        raise TypeError("frame は Frame または FrameStream である必要があります")
     if type(overwrite) is not bool:
         raise TypeError("overwrite は bool である必要があります")
     artifact_format = ExportFormat.from_path(path)
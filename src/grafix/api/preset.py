@@ -29,7 +29,9 @@ from grafix.core.preset_catalog import (
     attach_preset_declaration,
     preset_op,
 )
-from grafix.core.scene import SceneItem
+from grafix.core.scene import SceneItem, normalize_scene
+
+from ._param_resolution import record_api_geometry
 
 _PSpec = ParamSpec("_PSpec")
 _PRESET_ACTIVATE_META = ParamMeta(
@@ -217,7 +219,17 @@ def preset(
             # preset 内部で生成される Geometry（G.* / E.*）は公開 API の外に置き、
             # GUI/永続化は “preset の公開引数” に限定する。
             with parameter_recording_muted():
-                return func(*bound.args, **bound.kwargs)
+                result = func(*bound.args, **bound.kwargs)
+            if current_param_recording_enabled() and current_frame_params() is not None:
+                # 本体内部の node は記録されないため、公開引数の依存先として
+                # preset が返した Geometry を記録する。
+                for layer in normalize_scene(result):
+                    record_api_geometry(
+                        op=parameter_op,
+                        site_id=site_id,
+                        geometry=layer.geometry,
+                    )
+            return result
 
         direct_identity = PresetIdentity(
             name=None,
@@ -7,11 +7,15 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any, Callable
 
+import numpy as np
+
+from grafix.core.array_argument import ArrayArgument
 from grafix.core.geometry import Geometry
 from grafix.core.operation_catalog import (
     OperationCatalogEntry,
     current_operation_catalog,
 )
+from grafix.core.operation_declaration import OpDeclaration
 from grafix.core.operation_selector import selector_spec as build_selector_spec
 from grafix.core.parameters import caller_site_id
 from grafix.core.parameters.identity import identity_string
@@ -21,10 +25,48 @@ from ._operation_selector import (
     freeze_params_by_target,
     resolve_primitive_selection,
 )
-from ._param_resolution import resolve_api_params, set_api_label
+from ._param_resolution import record_api_geometry, resolve_api_params, set_api_label
 from ._unset import _UNSET_TARGET, _UnsetTarget
 
 
+def _batched_arguments(
+    *,
+    op: str,
+    declaration: OpDeclaration,
+    params: Mapping[str, Any],
+) -> dict[str, ArrayArgument]:
+    """``many`` の配列引数を検証し、要素数をそろえた float64 配列引数にする。"""
+
+    batched: dict[str, ArrayArgument] = {}
+    count: int | None = None
+    for arg in declaration.batch_args:
+        value = params.get(arg)
+        if not isinstance(value, np.ndarray):
+            continue
+        if value.dtype.kind not in "fiu":
+            raise TypeError(f"primitive {op!r} の {arg!r} 配列は数値 dtype である必要があります")
+        expected_ndim = 2 if declaration.schema.meta[arg].kind == "vec3" else 1
+        if value.ndim != expected_ndim or (expected_ndim == 2 and value.shape[1] != 3):
+            shape = "(N, 3)" if expected_ndim == 2 else "(N,)"
+            raise ValueError(
+                f"primitive {op!r} の {arg!r} 配列は shape {shape} である必要があります"
+            )
+        if count is None:
+            count = int(value.shape[0])
+        elif int(value.shape[0]) != count:
+            raise ValueError(f"primitive {op!r} の配列引数は同じ要素数である必要があります")
+        try:
+            batched[arg] = ArrayArgument(value.astype(np.float64, copy=False))
+        except ValueError as exc:
+            raise ValueError(f"primitive {op!r} の {arg!r} が不正です: {exc}") from exc
+    if not batched:
+        names = ", ".join(repr(arg) for arg in declaration.batch_args)
+        raise TypeError(
+            f"primitive {op!r} の many には配列引数（{names} のいずれか）が必要です"
+        )
+    return batched
+
+
 class PrimitiveNamespace:
     """primitive Geometry ノードを生成する名前空間。
 
@@ -136,12 +178,16 @@ class PrimitiveNamespace:
             label=self._pending_label,
         )
         declaration = catalog.resolve("primitive", selected.target).declaration
-        return Geometry._from_canonical_args(
-            op=selected.target,
-            operation=declaration.ref,
-            inputs=(),
-            args=tuple(sorted(selected.params.items())),
-            cache_policy=declaration.cache_policy,
+        return record_api_geometry(
+            op=selected.selector_op,
+            site_id=site_id,
+            geometry=Geometry._from_canonical_args(
+                op=selected.target,
+                operation=declaration.ref,
+                inputs=(),
+                args=tuple(sorted(selected.params.items())),
+                cache_policy=declaration.cache_policy,
+            ),
         )
 
     def __getattr__(self, name: str) -> Callable[..., Geometry]:
@@ -221,14 +267,89 @@ class PrimitiveNamespace:
             )
             # 値は operation validator / parameter resolver で canonical 化済み。
             # 再走査せず、署名計算だけを行う core-owned factory へ渡す。
-            return Geometry._from_canonical_args(
+            return record_api_geometry(
                 op=name,
-                operation=declaration.ref,
-                inputs=(),
-                args=tuple(sorted(resolved.items())),
-                cache_policy=declaration.cache_policy,
+                site_id=site_id,
+                geometry=Geometry._from_canonical_args(
+                    op=name,
+                    operation=declaration.ref,
+                    inputs=(),
+                    args=tuple(sorted(resolved.items())),
+                    cache_policy=declaration.cache_policy,
+                ),
+            )
+
+        if not declaration.batch_args:
+            return factory
+
+        def many(**params: Any) -> Geometry:
+            """要素ごとの配列引数から N 個の primitive を 1 node で生成する。
+
+            Parameters
+            ----------
+            **params : Any
+                ``batch_args`` に宣言された引数は shape ``(N,)``（float）または
+                ``(N, 3)``（vec3）の配列で渡せる。それ以外の引数は全要素で共有し、
+                Parameter GUI へ公開するのは共有引数だけとする。
+
+            Returns
+            -------
+            Geometry
+                N 本の polyline を一度に評価する Geometry ノード。
+            """
+
+            key = params.pop("key", None)
+            instance_key = params.pop("instance_key", None)
+            shared = params.pop("shared", False)
+            batched = _batched_arguments(
+                op=name,
+                declaration=declaration,
+                params=params,
+            )
+            params = validate_operation_kwargs(
+                op=name,
+                spec=declaration,
+                params={
+                    arg: value for arg, value in params.items() if arg not in batched
+                },
+            )
+            site_id = caller_site_id(
+                skip=1,
+                key=key,
+                instance_key=instance_key,
+                shared=shared,
+            )
+            set_api_label(op=name, site_id=site_id, label=self._pending_label)
+            # 配列で渡した引数は要素ごとの値なので GUI に観測させない。
+            resolved = resolve_api_params(
+                op=name,
+                site_id=site_id,
+                user_params=params,
+                defaults={
+                    arg: value
+                    for arg, value in declaration.schema.defaults.items()
+                    if arg not in batched
+                },
+                meta={
+                    arg: arg_meta
+                    for arg, arg_meta in declaration.schema.meta.items()
+                    if arg not in batched
+                },
+            )
+            resolved.update(batched)
+            return record_api_geometry(
+                op=name,
+                site_id=site_id,
+                geometry=Geometry._from_canonical_args(
+                    op=name,
+                    operation=declaration.ref,
+                    inputs=(),
+                    args=tuple(sorted(resolved.items())),
+                    cache_policy=declaration.cache_policy,
+                ),
             )
 
+        factory.many = many  # type: ignore[attr-defined]
         return factory
 
     def __call__(self, name: str | None = None) -> "PrimitiveNamespace":
@@ -8,7 +8,8 @@ Geometry の realize cache を再利用できる。ファイルへの保存は
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import contextlib
+from collections.abc import Callable, Generator, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
@@ -34,7 +35,7 @@ from grafix.core.parameters.runtime import LoadProvenance
 from grafix.core.parameters.source import ParameterLoadMode
 from grafix.core.parameters.store import ParamStore
 from grafix.core.parameters.style_resolver import FrameStyle, StyleResolver
-from grafix.core.pipeline import RealizedLayer, realize_scene
+from grafix.core.pipeline import RealizedLayer, iter_realize_scene, realize_scene
 from grafix.core.preview_quality import current_preview_quality, preview_quality_context
 from grafix.core.preset_catalog import bind_preset_catalog
 from grafix.core.realize import RealizeCacheStore, RealizeSession
@@ -159,6 +160,94 @@ class Frame:
         return self.style.bg_color_rgb01
 
 
+
+class FrameStream:
+    """``RenderSession.stream`` が返す、layer を realize しながら渡す 1 フレーム。
+
+    ``layers`` は一度だけ列挙できる iterator で、次の layer は要求された時点で
+    realize する。新しく評価した Geometry は session の realize cache に残らないため、
+    :func:`grafix.export` に渡すと encoder が書き出した layer から手放され、peak
+    memory は scene 全体ではなく概ね最大 layer 分になる。``provenance`` は全 layer
+    を列挙し終えた時点で確定する。
+    """
+
+    __slots__ = ("_t", "_options", "_style", "_metadata", "_layers", "_provenance")
+
+    def __init__(
+        self,
+        *,
+        t: float,
+        options: RenderOptions,
+        style: FrameStyle,
+        metadata: RenderSessionMetadata,
+        layers: Generator[RealizedLayer, None, CaptureProvenance],
+    ) -> None:
+        self._t = t
+        self._options = options
+        self._style = style
+        self._metadata = metadata
+        self._layers: Generator[RealizedLayer, None, CaptureProvenance] | None = layers
+        self._provenance: CaptureProvenance | None = None
+
+    @property
+    def t(self) -> float:
+        return self._t
+
+    @property
+    def options(self) -> RenderOptions:
+        return self._options
+
+    @property
+    def style(self) -> FrameStyle:
+        return self._style
+
+    @property
+    def metadata(self) -> RenderSessionMetadata:
+        return self._metadata
+
+    @property
+    def layers(self) -> Iterator[RealizedLayer]:
+        """realize しながら layer を返す iterator。2 回目の参照は RuntimeError。"""
+
+        layers = self._layers
+        if layers is None:
+            raise RuntimeError("FrameStream.layers は一度だけ列挙できます")
+        self._layers = None
+        return self._iterate(layers)
+
+    @property
+    def provenance(self) -> CaptureProvenance:
+        """全 layer の列挙後に確定する provenance。"""
+
+        if self._provenance is None:
+            raise RuntimeError("FrameStream.provenance は全 layer の列挙後に確定します")
+        return self._provenance
+
+    @property
+    def canvas_size(self) -> tuple[int, int]:
+        """論理キャンバス寸法を返す。"""
+
+        return self._options.canvas_size
+
+    @property
+    def background_color(self) -> Color:
+        """ParamStore override 適用後の背景色を返す。"""
+
+        return Color(self._style.bg_color_rgb01)
+
+    @property
+    def background_color_rgb01(self) -> RGB01:
+        """ParamStore override 適用後の背景色を内部 RGB01 で返す。"""
+
+        return self._style.bg_color_rgb01
+
+    def _iterate(
+        self,
+        layers: Generator[RealizedLayer, None, CaptureProvenance],
+    ) -> Iterator[RealizedLayer]:
+        self._provenance = yield from layers
+
+
 def _load_parameter_store(
     draw: Callable[[float], SceneItem],
     *,
@@ -395,44 +484,20 @@ class RenderSession:
             や draw の実行環境は変更しない。
         """
 
-        if self._closed:
-            raise RuntimeError("close 済みの RenderSession は使用できません")
-        if provenance_seed != "session" and provenance_seed is not None and (
-            isinstance(provenance_seed, bool)
-            or not isinstance(provenance_seed, int)
-        ):
-            raise TypeError("provenance_seed は int、None、'session' のいずれかです")
-        render_t = finite_real(t, name="t")
+        render_t = self._validated_render_args(t, provenance_seed)
 
-        # RenderSession は headless/final 契約を所有する。呼び出し元が interactive
-        # preview の draft context 内にいても、その暗黙状態を session へ漏らさない。
-        with (
-            bind_runtime_config(self._config),
-            preview_quality_context("final"),
-            bind_preset_catalog(self._definitions.presets),
-        ):
+        with self._final_scope():
             style = self._style_resolver.resolve()
-            defaults = LayerStyleDefaults(
-                color=style.global_line_color_rgb01,
-                thickness=style.global_thickness,
-            )
             with parameter_context(self._store):
                 layers = tuple(
                     realize_scene(
                         self._draw,
                         render_t,
-                        defaults,
+                        _layer_style_defaults(style),
                         session=self._realize_session,
                     )
                 )
-            provenance = self._provenance_builder.frame(
-                self._store,
-                t=render_t,
-                frame_index=self._frame_index,
-                quality=current_preview_quality(),
-                origin="headless",
-                provenance_seed=provenance_seed,
-            )
+            provenance = self._frame_provenance(render_t, provenance_seed)
         frame = Frame(
             t=render_t,
             layers=layers,
@@ -444,6 +509,98 @@ class RenderSession:
         self._frame_index += 1
         return frame
 
+    def stream(
+        self,
+        t: float,
+        *,
+        provenance_seed: int | None | Literal["session"] = "session",
+    ) -> FrameStream:
+        """時刻 ``t`` を layer ごとに realize しながら渡す ``FrameStream`` を返す。
+
+        引数は :meth:`render` と同じ。``draw(t)`` は ``layers`` を最初に進めた時点で
+        呼ばれる。大きな scene を :func:`grafix.export` で保存する場合に、realize 済み
+        scene 全体を同時に保持しないために使う。
+        """
+
+        render_t = self._validated_render_args(t, provenance_seed)
+        with self._final_scope():
+            style = self._style_resolver.resolve()
+        return FrameStream(
+            t=render_t,
+            options=self._options,
+            style=style,
+            metadata=self._metadata,
+            layers=self._stream_layers(render_t, style, provenance_seed),
+        )
+
+    def _stream_layers(
+        self,
+        t: float,
+        style: FrameStyle,
+        provenance_seed: int | None | Literal["session"],
+    ) -> Generator[RealizedLayer, None, CaptureProvenance]:
+        layers = iter_realize_scene(
+            self._draw,
+            t,
+            _layer_style_defaults(style),
+            session=self._realize_session,
+        )
+        try:
+            while True:
+                if self._closed:
+                    raise RuntimeError("close 済みの RenderSession は使用できません")
+                # context の束縛は yield をまたがせず、layer を進める間だけ有効にする。
+                with self._final_scope(), parameter_context(self._store):
+                    layer = next(layers, None)
+                if layer is None:
+                    break
+                yield layer
+            with self._final_scope():
+                provenance = self._frame_provenance(t, provenance_seed)
+        finally:
+            layers.close()
+        self._frame_index += 1
+        return provenance
+
+    def _validated_render_args(
+        self,
+        t: float,
+        provenance_seed: int | None | Literal["session"],
+    ) -> float:
+        if self._closed:
+            raise RuntimeError("close 済みの RenderSession は使用できません")
+        if provenance_seed != "session" and provenance_seed is not None and (
+            isinstance(provenance_seed, bool)
+            or not isinstance(provenance_seed, int)
+        ):
+            raise TypeError("provenance_seed は int、None、'session' のいずれかです")
+        return finite_real(t, name="t")
+
+    @contextlib.contextmanager
+    def _final_scope(self) -> Iterator[None]:
+        # RenderSession は headless/final 契約を所有する。呼び出し元が interactive
+        # preview の draft context 内にいても、その暗黙状態を session へ漏らさない。
+        with (
+            bind_runtime_config(self._config),
+            preview_quality_context("final"),
+            bind_preset_catalog(self._definitions.presets),
+        ):
+            yield
+
+    def _frame_provenance(
+        self,
+        t: float,
+        provenance_seed: int | None | Literal["session"],
+    ) -> CaptureProvenance:
+        return self._provenance_builder.frame(
+            self._store,
+            t=t,
+            frame_index=self._frame_index,
+            quality=current_preview_quality(),
+            origin="headless",
+            provenance_seed=provenance_seed,
+        )
+
     def close(self) -> None:
         """realize cache を解放し、以後の評価を禁止する。"""
 
@@ -459,6 +616,13 @@ class RenderSession:
                 self._cache_store.close()
 
 
+def _layer_style_defaults(style: FrameStyle) -> LayerStyleDefaults:
+    return LayerStyleDefaults(
+        color=style.global_line_color_rgb01,
+        thickness=style.global_thickness,
+    )
+
+
 def render(
     draw: Callable[[float], SceneItem],
     t: float = 0.0,
@@ -527,6 +691,7 @@ __all__ = [
     "ExportFormat",
     "ExportResult",
     "Frame",
+    "FrameStream",
     "ParameterLoadMode",
     "RGB01",
     "RGB8",
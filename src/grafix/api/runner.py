@@ -111,6 +111,7 @@ def run(
     midi_mode: str = "7bit",
     n_worker: int = 1,
     evaluation_timeout: float | None = 5.0,
+    refine_after: float | None = None,
     fps: float = 60.0,
     seed: int | None = None,
     runtime_limit_profiles: RuntimeLimitProfiles = DEFAULT_RUNTIME_LIMIT_PROFILES,
@@ -167,6 +168,13 @@ def run(
     evaluation_timeout : float | None
         background worker の 1 回の `draw(t)` を待つ秒数。超過時は直近の成功表示を
         保ったまま worker を再起動する。`None` の場合は timeout を無効にする。
+    refine_after : float | None
+        preview の scene が変化しないまま経過したらこの秒数後に、final quality の
+        scene を background thread で評価して表示を差し替える。growth などの
+        draft 上限を外した見た目を export せずに確認するため。次の編集・時刻変化で
+        取り消す。既定の `None` では仕上げ評価を行わない。final 評価は CPU を
+        draft と取り合うため opt-in で、`run(draw, refine_after=1.0)` のように
+        静止とみなす秒数を渡して有効にする。
     fps : float
         目標フレームレート。`<=0` の場合はフレーム末尾で sleep せず、可能な限り速く回す。
         録画機能（V キー）は fps > 0 が必要。
@@ -204,6 +212,11 @@ def run(
             minimum_inclusive=False,
         )
     )
+    refine_idle_s = (
+        None
+        if refine_after is None
+        else finite_real(refine_after, name="refine_after", minimum=0.0)
+    )
     frame_rate = finite_real(fps, name="fps")
     preview_scale = finite_real(
         render_scale,
@@ -393,6 +406,7 @@ def run(
             fps=frame_rate,
             n_worker=worker_count,
             evaluation_timeout=timeout,
+            refine_after=refine_idle_s,
             run_id=run_id,
             runtime_limit_profiles=profiles,
             source_reload=source_reload,
@@ -0,0 +1,225 @@
+"""``RenderSession`` の frame 列を headless で動画へ書き出す公開 API。"""
+
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from grafix.api.render import Frame, RenderSession
+from grafix.core.authoring_definitions import AuthoringDefinitionsSnapshot
+from grafix.core.parameters.source import ParameterLoadMode
+from grafix.core.render_options import RenderOptions
+from grafix.core.runtime_config import RuntimeConfig
+from grafix.core.runtime_limits import DEFAULT_FINAL_RUNTIME_LIMITS, RuntimeLimits
+from grafix.core.scene import SceneItem
+from grafix.core.value_validation import (
+    exact_integer,
+    finite_real,
+    positive_integer_pair,
+)
+from grafix.export.capture import CaptureService
+from grafix.export.image import png_output_size
+from grafix.export.output_paths import output_path_for_draw
+from grafix.export.video import DEFAULT_FRAME_TIMEOUT_S, encode_video_frames
+
+# rasterize は resvg subprocess 待ちが主なので、CPU 数までの thread で十分に重なる。
+_MAX_DEFAULT_RASTERIZER_THREADS = 8
+
+
+def _t_range(value: object) -> tuple[float, float]:
+    """``(start, stop)`` の有限実数 pair を検証する。"""
+
+    if type(value) is not tuple or len(value) != 2:
+        raise TypeError("t_range は (start, stop) の tuple である必要があります")
+    start = finite_real(value[0], name="t_range[0]")
+    stop = finite_real(value[1], name="t_range[1]")
+    if not stop > start:
+        raise ValueError("t_range は start < stop である必要があります")
+    return start, stop
+
+
+def video_frame_times(
+    t_range: tuple[float, float],
+    fps: float,
+) -> tuple[float, ...]:
+    """``[start, stop)`` を ``1 / fps`` 刻みで評価する frame 時刻列を返す。
+
+    時刻は累積加算ではなく ``start + index / fps`` で求め、長い動画でも誤差が
+    frame ごとに蓄積しないようにする。
+    """
+
+    start, stop = _t_range(t_range)
+    frame_rate = finite_real(fps, name="fps", minimum=0.0, minimum_inclusive=False)
+    # 浮動小数で (stop - start) * fps が整数をわずかに超えても余分な 1 frame を足さない。
+    count = max(1, math.ceil((stop - start) * frame_rate - 1e-9))
+    return tuple(start + index / frame_rate for index in range(count))
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VideoRenderResult:
+    """:func:`render_video` が保存した動画の要約。"""
+
+    path: Path
+    frame_count: int
+    fps: float
+    t_range: tuple[float, float]
+    output_size: tuple[int, int]
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.path, Path):
+            raise TypeError("path は Path である必要があります")
+        object.__setattr__(
+            self,
+            "frame_count",
+            exact_integer(self.frame_count, name="frame_count", minimum=1),
+        )
+        object.__setattr__(
+            self,
+            "fps",
+            finite_real(self.fps, name="fps", minimum=0.0, minimum_inclusive=False),
+        )
+        object.__setattr__(self, "t_range", _t_range(self.t_range))
+        object.__setattr__(
+            self,
+            "output_size",
+            positive_integer_pair(self.output_size, name="output_size"),
+        )
+
+
+def _default_rasterizer_threads() -> int:
+    return max(1, min(_MAX_DEFAULT_RASTERIZER_THREADS, os.cpu_count() or 1))
+
+
+def render_video(
+    draw: Callable[[float], SceneItem],
+    t_range: tuple[float, float],
+    fps: float,
+    *,
+    path: str | Path | None = None,
+    options: RenderOptions | None = None,
+    scale: float | None = None,
+    rasterizer_threads: int | None = None,
+    max_pending_frames: int | None = None,
+    parameter_source: ParameterLoadMode = "code",
+    config_path: str | Path | None = None,
+    config: RuntimeConfig | None = None,
+    run_id: str | None = None,
+    runtime_limits: RuntimeLimits = DEFAULT_FINAL_RUNTIME_LIMITS,
+    seed: int | None = None,
+    definitions: AuthoringDefinitionsSnapshot | None = None,
+    frame_timeout_s: float = DEFAULT_FRAME_TIMEOUT_S,
+) -> VideoRenderResult:
+    """``draw`` を ``t_range`` の各 frame 時刻で final 品質評価し、mp4 へ保存する。
+
+    GPU と window を使わない。1 つの :class:`RenderSession` が frame を順に render し、
+    rasterizer thread 群が SVG -> PNG (resvg) を並列に行い、ffmpeg が PNG stream を
+    H.264 へ encode する。3 段は bounded queue で繋がり、同時に保持する frame は
+    ``max_pending_frames`` 件までに制限される。
+
+    Parameters
+    ----------
+    draw : Callable[[float], SceneItem]
+        フレーム時刻を受け取り SceneItem を返す作品関数。
+    t_range : tuple[float, float]
+        評価する時刻範囲 ``(start, stop)``。``stop`` は含まない。
+    fps : float
+        frame rate。frame 時刻は ``start + index / fps``。
+    path : str, Path or None, optional
+        出力 path。省略時は ``output/video/`` 配下の既定 path を連番付きで予約する。
+        明示 path は既存ファイルを置換する。
+    options : RenderOptions or None, optional
+        描画設定。省略時は ``RenderOptions()``。
+    scale : float or None, optional
+        canvas 寸法に掛ける出力倍率。省略時は config の ``export.png.scale``。
+    rasterizer_threads : int or None, optional
+        SVG -> PNG を並列に行う thread 数。省略時は CPU 数（最大 8）。
+    max_pending_frames : int or None, optional
+        rasterize 中または encode 待ちの frame 上限。省略時は
+        ``2 * rasterizer_threads``。
+    parameter_source, config_path, config, run_id, runtime_limits, seed, definitions
+        :class:`RenderSession` へそのまま渡す。
+    frame_timeout_s : float, optional
+        1 frame の resvg 実行上限秒数。
+
+    Returns
+    -------
+    VideoRenderResult
+        保存先、frame 数、出力ピクセルサイズ。
+
+    Raises
+    ------
+    RuntimeError
+        ffmpeg/resvg が見つからない、または encode に失敗した場合。
+    """
+
+    frame_times = video_frame_times(t_range, fps)
+    normalized_range = _t_range(t_range)
+    frame_rate = finite_real(fps, name="fps", minimum=0.0, minimum_inclusive=False)
+    threads = (
+        _default_rasterizer_threads()
+        if rasterizer_threads is None
+        else exact_integer(rasterizer_threads, name="rasterizer_threads", minimum=1)
+    )
+    pending_limit = (
+        2 * threads
+        if max_pending_frames is None
+        else exact_integer(max_pending_frames, name="max_pending_frames", minimum=1)
+    )
+    if path is not None and type(path) is not str and not isinstance(path, Path):
+        raise TypeError("path は str、Path、None のいずれかである必要があります")
+
+    with RenderSession(
+        draw,
+        options=options,
+        parameter_source=parameter_source,
+        config_path=config_path,
+        config=config,
+        run_id=run_id,
+        runtime_limits=runtime_limits,
+        seed=seed,
+        definitions=definitions,
+    ) as session:
+        output_size = png_output_size(
+            session.options.canvas_size,
+            scale=session.config.png_scale if scale is None else scale,
+        )
+        output_path = (
+            CaptureService().reserve_path(
+                output_path_for_draw(
+                    kind="video",
+                    ext="mp4",
+                    draw=draw,
+                    run_id=run_id,
+                    config=session.config,
+                )
+            )
+            if path is None
+            else Path(path)
+        )
+
+        def frames() -> Iterator[Frame]:
+            for t in frame_times:
+                yield session.render(t)
+
+        frame_count = encode_video_frames(
+            frames(),
+            output_path,
+            fps=frame_rate,
+            output_size=output_size,
+            rasterizer_threads=threads,
+            max_pending_frames=pending_limit,
+            frame_timeout_s=frame_timeout_s,
+        )
+    return VideoRenderResult(
+        path=output_path,
+        frame_count=frame_count,
+        fps=frame_rate,
+        t_range=normalized_range,
+        output_size=output_size,
+    )
+
+
+__all__ = ["VideoRenderResult", "render_video", "video_frame_times"]
@@ -0,0 +1,138 @@
+# src/grafix/core/array_argument.py
+# Geometry 引数として渡す不変な浮動小数配列と、その内容 digest。
+
+from __future__ import annotations
+
+from hashlib import blake2b
+from typing import Any
+
+import numpy as np
+
+_DIGEST_PERSON = b"grafix.array.v1"
+_ACCEPTED_ITEMSIZES = frozenset({4, 8})
+
+
+def _is_bytes_backed(array: np.ndarray) -> bool:
+    """base を辿った先が immutable bytes の read-only C-order 配列かを返す。"""
+
+    if not array.flags.c_contiguous:
+        return False
+    current: object = array
+    while type(current) is np.ndarray:
+        if current.flags.writeable:
+            return False
+        current = current.base
+    return type(current) is bytes
+
+
+def _content_digest(array: np.ndarray) -> str:
+    """dtype・shape・C-order bytes から内容 digest を計算する。"""
+
+    hasher = blake2b(digest_size=16, person=_DIGEST_PERSON)
+    hasher.update(array.dtype.str.encode("ascii"))
+    hasher.update(repr(array.shape).encode("ascii"))
+    # bytes-backed の C-contiguous 配列なので buffer を copy せずに読む。
+    hasher.update(memoryview(array).cast("B"))
+    return hasher.hexdigest()
+
+
+class ArrayArgument:
+    """Geometry 引数として保存する read-only float32/float64 配列。
+
+    Parameters
+    ----------
+    value : np.ndarray or ArrayArgument
+        浮動小数配列。mutable な caller 配列は一度だけ immutable bytes へ copy し、
+        既に bytes-backed な read-only 配列はそのまま共有する。
+
+    Notes
+    -----
+    GeometryId には要素列ではなく ``dtype``・``shape``・blake2b digest だけが入る。
+    evaluator へは :attr:`array` の read-only view を copy せずに渡し、pickle では
+    連続 bytes 1 つとして運ぶ。
+    """
+
+    __slots__ = ("array", "digest")
+
+    array: np.ndarray
+    digest: str
+
+    def __init__(self, value: object) -> None:
+        if type(value) is ArrayArgument:
+            object.__setattr__(self, "array", value.array)
+            object.__setattr__(self, "digest", value.digest)
+            return
+        if not isinstance(value, np.ndarray):
+            raise TypeError(f"配列引数は np.ndarray である必要がある: {type(value)!r}")
+        if value.dtype.kind != "f" or value.dtype.itemsize not in _ACCEPTED_ITEMSIZES:
+            raise TypeError(
+                f"配列引数の dtype は float32 または float64 である必要がある: {value.dtype}"
+            )
+        if not np.isfinite(value).all():
+            raise ValueError("配列引数は有限値だけを含む必要がある")
+        if type(value) is np.ndarray and value.dtype.isnative and _is_bytes_backed(value):
+            array = value
+        else:
+            native = value.dtype.newbyteorder("=")
+            payload = np.ascontiguousarray(value, dtype=native).tobytes(order="C")
+            array = np.frombuffer(payload, dtype=native).reshape(value.shape)
+        object.__setattr__(self, "array", array)
+        object.__setattr__(self, "digest", _content_digest(array))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ArrayArgument は不変です")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("ArrayArgument は不変です")
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not ArrayArgument:
+            return NotImplemented
+        return self.digest == other.digest
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __repr__(self) -> str:
+        # GeometryId の repr 署名に使うため、要素ではなく内容 digest だけを示す。
+        return (
+            f"ArrayArgument(dtype={self.array.dtype.str!r}, "
+            f"shape={self.array.shape!r}, digest={self.digest!r})"
+        )
+
+    def __reduce__(self) -> tuple[object, tuple[object, ...]]:
+        """連続 bytes 1 つで pickle 化する。"""
+
+        return (
+            _restore_array_argument,
+            (self.array.dtype.str, self.array.shape, self.array.tobytes(), self.digest),
+        )
+
+
+def _restore_array_argument(
+    dtype: str,
+    shape: tuple[int, ...],
+    payload: bytes,
+    digest: str,
+) -> ArrayArgument:
+    """pickle の bytes を copy せずに包み、digest を照合して復元する。"""
+
+    if type(payload) is not bytes:
+        raise TypeError("ArrayArgument pickle payload は bytes である必要がある")
+    array = np.frombuffer(payload, dtype=np.dtype(dtype)).reshape(shape)
+    restored = ArrayArgument(array)
+    if restored.digest != digest:
+        raise ValueError("ArrayArgument pickle の digest が内容と一致しません")
+    return restored
+
+
+def evaluator_params(args: tuple[tuple[str, Any], ...]) -> dict[str, Any]:
+    """canonical args を evaluator 用 kwargs にし、配列引数を read-only view へ戻す。"""
+
+    return {
+        name: value.array if type(value) is ArrayArgument else value
+        for name, value in args
+    }
+
+
+__all__ = ["ArrayArgument", "evaluator_params"]
@@ -67,6 +67,7 @@ _PRIMITIVE_NAMES = (
     "bezier",
     "circle",
     "ellipse",
+    "geometry_file",
     "grid",
     "line",
     "lissajous",
@@ -0,0 +1,94 @@
+"""長時間の geometry evaluation を協調的に打ち切る cancellation token。
+
+token を束縛するのは background thread で final quality を評価する
+`grafix.interactive.runtime.refinement.ProgressiveRefiner` だけである。draft preview は
+main thread の `SceneRunner.run()` 内で同期的に realize され、parameter snapshot も同じ
+thread が frame の合間に更新するため、評価中に新しい snapshot が届くことはなく、
+取り消しの対象にしない。
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import threading
+from collections.abc import Iterator
+
+
+class EvaluationCancelled(Exception):
+    """bound token の取り消しにより evaluation を途中で打ち切ったことを表す。
+
+    Notes
+    -----
+    失敗ではないため `RealizeError` に包まず、結果も cache しない。
+    """
+
+
+class CancellationToken:
+    """別 thread から取り消しを要求できる一方向の flag。"""
+
+    __slots__ = ("_event",)
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """取り消しが要求済みか。"""
+
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """取り消しを要求する。冪等で、どの thread からでも呼べる。"""
+
+        self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        """取り消し済みなら `EvaluationCancelled` を送出する。"""
+
+        if self._event.is_set():
+            raise EvaluationCancelled("evaluation was cancelled")
+
+
+_cancellation_token_var: contextvars.ContextVar[CancellationToken | None] = (
+    contextvars.ContextVar("cancellation_token", default=None)
+)
+
+
+def current_cancellation_token() -> CancellationToken | None:
+    """現在 evaluation に束縛された token を返す。context 外は None。"""
+
+    return _cancellation_token_var.get()
+
+
+@contextlib.contextmanager
+def cancellation_context(token: CancellationToken | None) -> Iterator[None]:
+    """evaluation 中だけ token を束縛し、終了時に復元する。"""
+
+    if token is not None and type(token) is not CancellationToken:
+        raise TypeError("token は CancellationToken または None である必要があります")
+    previous = _cancellation_token_var.set(token)
+    try:
+        yield
+    finally:
+        _cancellation_token_var.reset(previous)
+
+
+def check_cancelled() -> None:
+    """kernel の反復 chunk 間で呼び、束縛中の token が取り消されていれば中断する。
+
+    token が無い headless 評価では ContextVar の参照だけで戻る。
+    """
+
+    token = _cancellation_token_var.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+__all__ = [
+    "CancellationToken",
+    "EvaluationCancelled",
+    "cancellation_context",
+    "check_cancelled",
+    "current_cancellation_token",
+]
@@ -0,0 +1,245 @@
+# src/grafix/core/compact_geometry.py
+# RealizeCacheStore の compact tier が保持する、bit 単位で可逆な RealizedGeometry 表現。
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+
+from grafix.core.realized_geometry import (
+    RealizedGeometry,
+    realized_geometry_from_readonly_views,
+)
+from grafix.core.value_validation import exact_integer
+
+CompactEncoding = Literal["planar", "quantized", "delta"]
+"""compact entry の座標表現。
+
+- ``"planar"``: z が全頂点で同じ bit 列なので、xy の float32 2 列と z 1 値で持つ。
+- ``"quantized"``: ``10**-decimals`` 格子番号から戻した値が元の float32 と bit 一致する
+  とき、列ごとの bbox 最小格子番号からの差を uint16 で持つ。
+- ``"delta"``: 同じ格子番号を polyline ごとの先頭頂点（int32）と頂点間差分（int16）で
+  持つ。bbox は uint16 に収まらないが隣接頂点間の移動が小さい、mm 単位 canvas 上の
+  曲線向け。
+"""
+
+_QUANTIZED_MAX = int(np.iinfo(np.uint16).max)
+_DELTA_MAX = int(np.iinfo(np.int16).max)
+_SAMPLE_ROWS = 64
+"""格子上にあるかを全体の変換前に確かめる先頭行数。"""
+
+
+@dataclass(frozen=True, slots=True)
+class CompactGeometry:
+    """RealizedGeometry を cache 上で小さく持つ read-only entry。
+
+    Parameters
+    ----------
+    encoding : {"planar", "quantized", "delta"}
+        ``columns`` の表現。
+    columns : np.ndarray
+        ``"planar"`` では float32 shape (N, 2)、``"quantized"`` では uint16、
+        ``"delta"`` では int16 の shape (N, C)（C は planar なら 2、そうでなければ 3）。
+    grid_base : np.ndarray
+        格子番号の基準。quantized では bbox 最小値（int64 shape (C,)）、delta では
+        polyline ごとの先頭頂点の値（int32 shape (M, C)）。planar では空。
+    decimals : int
+        格子の小数桁数。座標は ``格子番号 / 10**decimals``。
+    z : np.float32
+        2 列表現で省いた z の値（全頂点で同じ bit 列）。
+    offsets : np.ndarray
+        元 geometry の bytes-backed offsets をそのまま共有する。
+    """
+
+    encoding: CompactEncoding
+    columns: np.ndarray
+    grid_base: np.ndarray
+    decimals: int
+    z: np.float32
+    offsets: np.ndarray
+
+    @property
+    def byte_size(self) -> int:
+        """compact 表現が実際に占有する byte 数を返す。"""
+
+        return int(self.columns.nbytes + self.grid_base.nbytes + 4 + self.offsets.nbytes)
+
+    @property
+    def logical_byte_size(self) -> int:
+        """展開後の RealizedGeometry が占有する byte 数を返す。"""
+
+        return int(self.columns.shape[0] * 3 * 4 + self.offsets.nbytes)
+
+    def decode(self) -> RealizedGeometry:
+        """元と bit 一致する RealizedGeometry を新しい read-only 配列で返す。"""
+
+        count = int(self.columns.shape[0])
+        width = int(self.columns.shape[1])
+        coords = np.empty((count, 3), dtype=np.float32)
+        if self.encoding == "quantized":
+            grid = self.columns.astype(np.int64)
+            grid += self.grid_base
+            coords[:, :width] = _grid_values(grid, decimals=self.decimals)
+        elif self.encoding == "delta":
+            # 各 line 先頭の差分は 0 なので、累積和から line 先頭時点の値を引き直す。
+            grid = np.cumsum(self.columns, axis=0, dtype=np.int64)
+            starts = self.offsets[:-1]
+            counts = np.diff(self.offsets)
+            nonempty = counts > 0
+            shift = self.grid_base.astype(np.int64)
+            shift[nonempty] -= grid[starts[nonempty]]
+            grid += np.repeat(shift, counts, axis=0)
+            coords[:, :width] = _grid_values(grid, decimals=self.decimals)
+        else:
+            coords[:, :width] = self.columns
+        if width == 2:
+            coords[:, 2] = self.z
+        coords.flags.writeable = False
+        return realized_geometry_from_readonly_views(coords, self.offsets)
+
+
+def _bits(values: np.ndarray) -> np.ndarray:
+    return values.view(np.uint32)
+
+
+def _grid_values(grid: np.ndarray, *, decimals: int) -> np.ndarray:
+    """格子番号を float32 座標へ戻す。encode の検証と decode で同じ式を使う。"""
+
+    return (grid / float(10**decimals)).astype(np.float32)
+
+
+def _grid_numbers(values: np.ndarray, *, scale: float) -> np.ndarray:
+    return np.rint(values.astype(np.float64) * scale).astype(np.int64)
+
+
+def _on_grid(values: np.ndarray, grid: np.ndarray, *, decimals: int) -> bool:
+    restored = _grid_values(grid, decimals=decimals)
+    return bool(np.array_equal(_bits(restored), _bits(values)))
+
+
+def _line_steps(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """polyline 内の隣接頂点間差分を返す。line 境界をまたぐ行は 0 にする。"""
+
+    steps = np.diff(values, axis=0)
+    boundaries = offsets[1:-1]
+    boundaries = boundaries[(boundaries > 0) & (boundaries < values.shape[0])]
+    steps[boundaries - 1] = 0
+    return steps
+
+
+def _quantize(
+    values: np.ndarray,
+    offsets: np.ndarray,
+    *,
+    decimals: int,
+) -> tuple[CompactEncoding, np.ndarray, np.ndarray] | None:
+    """values が ``10**-decimals`` 格子上に bit 単位で乗るときだけ整数表現を返す。
+
+    大きな配列を確保する前に、先頭行の格子判定・bbox の幅・line 内の最大移動で
+    表現が成立しない入力を落とす。
+    """
+
+    scale = float(10**decimals)
+    sample = values[:_SAMPLE_ROWS]
+    if not _on_grid(sample, _grid_numbers(sample, scale=scale), decimals=decimals):
+        return None
+
+    low = values.min(axis=0).astype(np.float64) * scale
+    high = values.max(axis=0).astype(np.float64) * scale
+    if float(np.max(np.rint(high) - np.rint(low))) <= _QUANTIZED_MAX:
+        encoding: CompactEncoding = "quantized"
+    else:
+        int32 = np.iinfo(np.int32)
+        if float(np.min(low)) < int32.min or float(np.max(high)) > int32.max:
+            return None
+        # float32 の差分と格子差分のずれは 1 格子未満なので、余裕を 1 取って判定する。
+        largest_step = float(np.abs(_line_steps(values, offsets)).max(initial=0.0))
+        if largest_step * scale + 1.0 > _DELTA_MAX:
+            return None
+        encoding = "delta"
+
+    grid = _grid_numbers(values, scale=scale)
+    if not _on_grid(values, grid, decimals=decimals):
+        return None
+    if encoding == "quantized":
+        grid_base = grid.min(axis=0)
+        grid -= grid_base
+        return encoding, grid.astype(np.uint16), grid_base
+
+    steps = _line_steps(grid, offsets)
+    if int(np.abs(steps).max(initial=0)) > _DELTA_MAX:
+        return None
+    deltas = np.empty(grid.shape, dtype=np.int16)
+    deltas[0] = 0
+    deltas[1:] = steps
+    counts = np.diff(offsets)
+    line_base = np.zeros((counts.shape[0], grid.shape[1]), dtype=np.int32)
+    nonempty = counts > 0
+    line_base[nonempty] = grid[offsets[:-1][nonempty]]
+    return encoding, deltas, line_base
+
+
+def compact_geometry(
+    geometry: RealizedGeometry,
+    *,
+    decimals: int,
+) -> CompactGeometry | None:
+    """geometry を可逆に縮められる場合だけ CompactGeometry を返す。
+
+    Parameters
+    ----------
+    geometry : RealizedGeometry
+        縮める対象。
+    decimals : int
+        quantized 表現で試す格子の小数桁数（格子間隔 ``10**-decimals``）。
+
+    Returns
+    -------
+    CompactGeometry or None
+        元より小さく、decode が全座標を bit 単位で再現できる表現。どちらの表現も
+        成立しない、または空 geometry の場合は None。
+
+    Notes
+    -----
+    quantized は export の小数桁で丸め済みの座標のような格子上の値だけが対象で、
+    格子から外れた値は丸めずに planar または非圧縮へ落とす。cache hit が miss と
+    異なる座標を返すことはない。
+    """
+
+    if type(geometry) is not RealizedGeometry:
+        raise TypeError("geometry は exact RealizedGeometry です")
+    digits = exact_integer(decimals, name="compact decimals", minimum=0)
+    coords = geometry.coords
+    if coords.shape[0] == 0:
+        return None
+
+    z_bits = _bits(coords[:, 2])
+    planar = bool(np.all(z_bits == z_bits[0]))
+    width = 2 if planar else 3
+    values = np.ascontiguousarray(coords[:, :width])
+
+    quantized = _quantize(values, geometry.offsets, decimals=digits)
+    if quantized is not None:
+        encoding, columns, grid_base = quantized
+    elif planar:
+        columns = values
+        grid_base = np.empty(0, dtype=np.int64)
+        encoding: CompactEncoding = "planar"
+    else:
+        return None
+
+    columns.flags.writeable = False
+    grid_base.flags.writeable = False
+    return CompactGeometry(
+        encoding=encoding,
+        columns=columns,
+        grid_base=grid_base,
+        decimals=digits,
+        z=np.float32(coords[0, 2]),
+        offsets=geometry.offsets,
+    )
+
+
+__all__ = ["CompactEncoding", "CompactGeometry", "compact_geometry"]
@@ -7,7 +7,10 @@ import dis
 import functools
 import hashlib
 import inspect
+import io
+import marshal
 import math
+import pickle
 import struct
 import sys
 import types
@@ -17,11 +20,16 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Final, NoReturn, cast
 
+from grafix.core.fingerprint_cache import (
+    FingerprintCacheEntry,
+    current_fingerprint_cache,
+)
 from grafix.core.operation_schema import ParameterOpSchema
 
 _DIGEST_LENGTH: Final = 64
 _LOCATION_GLOBALS: Final = frozenset({"__file__", "__cached__", "__loader__"})
 _MODULE_CONTENT_FINGERPRINT_ATTRIBUTE: Final = "__grafix_content_fingerprint__"
+_CACHE_KEY_PICKLE_PROTOCOL: Final = 5
 
 
 class DefinitionFingerprintError(ValueError):
@@ -134,6 +142,61 @@ class _CanonicalEncoder:
 
     def __init__(self) -> None:
         self._active: set[int] = set()
+        self._dependencies: dict[int, types.ModuleType] = {}
+        self._global_names: dict[int, set[str]] = {}
+        self._untracked = False
+
+    def dependency_tokens(self) -> tuple[tuple[str, str], ...] | None:
+        """encode 中に内容を参照した module の identity 列を返す。
+
+        module に属さない namespace の function や型を辿った場合、その内容は
+        module identity で照合できないため None を返す。
+        """
+
+        if self._untracked:
+            return None
+        tokens = {
+            self._fingerprint_module_name(module): _module_token(module)
+            for module in self._dependencies.values()
+        }
+        return tuple(sorted(tokens.items()))
+
+    def global_value_tokens(self) -> tuple[tuple[str, str, str], ...] | None:
+        """encode 中に解決した module global の現在値 token 列を返す。
+
+        module identity は source の内容しか表さないため、import 後に代入し直された
+        global は値で照合する。値で照合できない global を参照した場合は None を返す。
+        """
+
+        if self._untracked:
+            return None
+        tokens: list[tuple[str, str, str]] = []
+        for module_id, names in self._global_names.items():
+            module = self._dependencies[module_id]
+            module_name = self._fingerprint_module_name(module)
+            for name in names:
+                token = _global_value_token(module, name)
+                if token is None:
+                    return None
+                tokens.append((module_name, name, token))
+        return tuple(sorted(tokens))
+
+    def _depend_on(self, module_name: object, *, namespace: object = None) -> None:
+        """``module_name`` の module を依存として記録する。"""
+
+        module = sys.modules.get(module_name) if type(module_name) is str else None
+        if module is None or (namespace is not None and namespace is not vars(module)):
+            self._untracked = True
+            return
+        self._dependencies[id(module)] = module
+
+    def _depend_on_global(self, namespace: Mapping[str, object], name: str) -> None:
+        """``namespace`` を持つ依存 module の global ``name`` を値照合の対象にする。"""
+
+        for module_id, module in self._dependencies.items():
+            if vars(module) is namespace:
+                self._global_names.setdefault(module_id, set()).add(name)
+                return
 
     def encode(
         self,
@@ -191,6 +254,7 @@ class _CanonicalEncoder:
             )
         if isinstance(value, Enum):
             enum_type = type(value)
+            self._depend_on(enum_type.__module__)
             return _frame(
                 b"enum",
                 enum_type.__module__.encode("utf-8"),
@@ -334,6 +398,7 @@ class _CanonicalEncoder:
         self._enter(value, path=path)
         try:
             value_type = type(value)
+            self._depend_on(value_type.__module__)
             parts = [
                 value_type.__module__.encode("utf-8"),
                 value_type.__qualname__.encode("utf-8"),
@@ -420,6 +485,7 @@ class _CanonicalEncoder:
         self._enter(value, path=path)
         try:
             module_name = value.__module__ if type(value.__module__) is str else ""
+            self._depend_on(module_name, namespace=value.__globals__)
             closure_parts: list[bytes] = []
             closure = value.__closure__ or ()
             if len(closure) != len(value.__code__.co_freevars):
@@ -453,6 +519,7 @@ class _CanonicalEncoder:
                     raise DefinitionFingerprintError(
                         f"{path}.globals.{name}: location-dependent global は使用できません"
                     )
+                self._depend_on_global(value.__globals__, name)
                 if name in value.__globals__:
                     dependency = value.__globals__[name]
                 elif name in builtins_namespace:
@@ -531,10 +598,17 @@ class _CanonicalEncoder:
             self.encode(value.co_exceptiontable, path=f"{path}.exceptiontable"),
         )
 
-    @staticmethod
-    def _fingerprint_module_name(value: types.ModuleType) -> str:
+    @classmethod
+    def _fingerprint_module_name(cls, value: types.ModuleType) -> str:
         """module または最長 parent package の canonical 名を返す。"""
 
+        canonical_root, actual_root = cls._fingerprint_module_alias(value)
+        return canonical_root + value.__name__[len(actual_root):]
+
+    @staticmethod
+    def _fingerprint_module_alias(value: types.ModuleType) -> tuple[str, str]:
+        """canonical 名を与える ``(canonical 名, 実 module 名)`` の root を返す。"""
+
         actual_name = value.__name__
         explicit = getattr(value, "__grafix_fingerprint_name__", None)
         if explicit is not None:
@@ -542,7 +616,7 @@ class _CanonicalEncoder:
                 raise DefinitionFingerprintError(
                     "module.__grafix_fingerprint_name__: 空でない str が必要です"
                 )
-            return explicit
+            return explicit, actual_name
         parts = actual_name.split(".")
         for count in range(len(parts) - 1, 0, -1):
             parent_name = ".".join(parts[:count])
@@ -560,11 +634,11 @@ class _CanonicalEncoder:
                 raise DefinitionFingerprintError(
                     f"{parent_name}.__grafix_fingerprint_name__: 空でない str が必要です"
                 )
-            suffix = ".".join(parts[count:])
-            return f"{parent_fingerprint_name}.{suffix}"
-        return actual_name
+            return parent_fingerprint_name, parent_name
+        return actual_name, actual_name
 
     def _encode_module(self, value: types.ModuleType, *, path: str) -> bytes:
+        self._dependencies[id(value)] = value
         name = self._fingerprint_module_name(value)
         if type(name) is not str or not name:
             self._error(path, value, "module name がありません")
@@ -602,7 +676,7 @@ class _CanonicalEncoder:
         source_path = self._module_content_path(value)
         if source_path is not None:
             try:
-                content = source_path.read_bytes()
+                content_digest = _file_content_digest(source_path)
             except OSError as exc:
                 raise DefinitionFingerprintError(
                     f"{path}: module content を読み取れません: {name}"
@@ -610,7 +684,7 @@ class _CanonicalEncoder:
             return _frame(
                 b"module-content-v1",
                 name.encode("utf-8"),
-                hashlib.sha256(content).digest(),
+                content_digest,
             )
 
         return _frame(
@@ -683,6 +757,289 @@ def _sha256(payload: bytes) -> str:
     return hashlib.sha256(payload).hexdigest()
 
 
+_file_content_digests: dict[str, tuple[int, int, bytes]] = {}
+
+
+def _file_content_digest(path: Path) -> bytes:
+    """file 内容の SHA-256 を、mtime と size が変わるまで process 内で再利用する。"""
+
+    stat = path.stat()
+    key = str(path)
+    cached = _file_content_digests.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    digest = hashlib.sha256(path.read_bytes()).digest()
+    _file_content_digests[key] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def _module_token(module: types.ModuleType) -> str:
+    """fingerprint が module を参照するときと同じ規則の module identity digest。"""
+
+    return _sha256(_CanonicalEncoder()._encode_module(module, path="module"))
+
+
+@functools.cache
+def _cache_runtime_tag() -> bytes:
+    """cache key に含める interpreter・numba・encoder 実装の identity。"""
+
+    import numba
+
+    return _frame(
+        b"fingerprint-cache-runtime-v1",
+        sys.implementation.name.encode("utf-8"),
+        str(sys.implementation.cache_tag).encode("utf-8"),
+        sys.version.encode("utf-8"),
+        str(numba.__version__).encode("utf-8"),
+        _module_token(sys.modules[__name__]).encode("ascii"),
+    )
+
+
+def _resolves_to(module: types.ModuleType, qualname: str, value: object) -> bool:
+    target: object = module
+    for part in qualname.split("."):
+        target = getattr(target, part, _resolves_to)
+        if target is _resolves_to:
+            return False
+    return target is value
+
+
+_SCALAR_GLOBAL_TYPES: Final = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _global_value_payload(value: object) -> bytes | None:
+    """global の値を cache entry で照合できる bytes にする。照合できなければ None。
+
+    scalar とその tuple / frozenset は値そのもの、名前で引ける function・型・module は
+    canonical な symbol 名で表す。symbol の中身は依存 module の identity が照合する。
+    list や dict、配列など後から中身を変えられる値は None。
+    """
+
+    if type(value) in _SCALAR_GLOBAL_TYPES:
+        return _frame(
+            b"scalar",
+            type(value).__name__.encode("ascii"),
+            repr(value).encode("utf-8"),
+        )
+    if type(value) in (tuple, frozenset):
+        parts: list[bytes] = []
+        for item in value:  # type: ignore[attr-defined]
+            part = _global_value_payload(item)
+            if part is None:
+                return None
+            parts.append(part)
+        if type(value) is frozenset:
+            return _frame(b"frozenset", *sorted(parts))
+        return _frame(b"tuple", *parts)
+    try:
+        if isinstance(value, types.ModuleType):
+            module_name = _CanonicalEncoder._fingerprint_module_name(value)
+            return _frame(b"module", module_name.encode("utf-8"))
+        owner_name = getattr(value, "__module__", None)
+        qualname = getattr(value, "__qualname__", None)
+        owner = sys.modules.get(owner_name) if type(owner_name) is str else None
+        if owner is None or type(qualname) is not str or not _resolves_to(owner, qualname, value):
+            return None
+        return _frame(
+            b"symbol",
+            _CanonicalEncoder._fingerprint_module_name(owner).encode("utf-8"),
+            qualname.encode("utf-8"),
+        )
+    except DefinitionFingerprintError:
+        return None
+
+
+def _global_value_token(module: types.ModuleType, name: str) -> str | None:
+    """module global ``name`` の現在値 token を返す。未定義なら builtin 参照を表す。"""
+
+    namespace = vars(module)
+    if name not in namespace:
+        return _sha256(_frame(b"unbound-global"))
+    payload = _global_value_payload(namespace[name])
+    return None if payload is None else _sha256(payload)
+
+
+def _key_reference(*parts: object) -> tuple[object, ...]:
+    """cache key 内で symbol 参照を表す marker。key は unpickle しない。"""
+
+    return parts
+
+
+class _CacheKeyPickler(pickle.Pickler):
+    """cache lookup 用に定義 graph を canonical 化せず直列化する。
+
+    module から名前で引ける function・型・module は canonical module 名と qualname の
+    参照として書き、その中身は entry の依存 module identity で照合する。lambda や
+    closure は code と束縛値を書く。key は一致判定にだけ使うため、mapping 順などで
+    同じ定義が別 key になっても miss が増えるだけで誤った hit にはならない。
+    """
+
+    def __init__(self, file: io.BytesIO) -> None:
+        super().__init__(file, protocol=_CACHE_KEY_PICKLE_PROTOCOL)
+        self.aliases: set[tuple[str, str]] = set()
+        self._canonical_names: dict[int, str] = {}
+
+    def reducer_override(self, obj: object) -> object:
+        if obj is _key_reference:
+            return NotImplemented
+        if isinstance(obj, types.ModuleType):
+            return _key_reference, ("module", self._canonical_name(obj))
+        if isinstance(obj, types.FunctionType):
+            module = sys.modules.get(obj.__module__) if type(obj.__module__) is str else None
+            if module is None or obj.__globals__ is not vars(module):
+                raise pickle.PicklingError("module に属さない function は key にできません")
+            if _resolves_to(module, obj.__qualname__, obj):
+                return _key_reference, (
+                    "symbol",
+                    self._canonical_name(module),
+                    obj.__qualname__,
+                )
+            return _key_reference, (
+                "function",
+                self._canonical_name(module),
+                obj.__qualname__,
+                marshal.dumps(obj.__code__),
+                obj.__defaults__,
+                obj.__kwdefaults__,
+                tuple(_cell_key(cell) for cell in obj.__closure__ or ()),
+            )
+        if callable(obj):
+            module_name = getattr(obj, "__module__", None)
+            qualname = getattr(obj, "__qualname__", None)
+            module = sys.modules.get(module_name) if type(module_name) is str else None
+            if (
+                module is not None
+                and type(qualname) is str
+                and _resolves_to(module, qualname, obj)
+            ):
+                return _key_reference, ("symbol", self._canonical_name(module), qualname)
+            if isinstance(obj, (type, types.BuiltinFunctionType)):
+                raise pickle.PicklingError("名前で引けない symbol は key にできません")
+        # encoder は mapping を item 集合としてだけ扱うため、mappingproxy 等も dict と同じ。
+        if isinstance(obj, Mapping):
+            return dict, (dict(obj),)
+        return NotImplemented
+
+    def _canonical_name(self, module: types.ModuleType) -> str:
+        cached = self._canonical_names.get(id(module))
+        if cached is not None:
+            return cached
+        canonical_root, actual_root = _CanonicalEncoder._fingerprint_module_alias(module)
+        if canonical_root != actual_root:
+            self.aliases.add((canonical_root, actual_root))
+        name = canonical_root + module.__name__[len(actual_root):]
+        self._canonical_names[id(module)] = name
+        return name
+
+
+def _cell_key(cell: types.CellType) -> tuple[object, ...]:
+    try:
+        return (True, cell.cell_contents)
+    except ValueError:
+        return (False,)
+
+
+def _cache_key(tag: bytes, subject: object) -> tuple[str, frozenset[tuple[str, str]]] | None:
+    """``subject`` の cache key と、依存 module 解決に使う名前 alias を返す。"""
+
+    buffer = io.BytesIO()
+    pickler = _CacheKeyPickler(buffer)
+    try:
+        pickler.dump(subject)
+    except Exception:
+        # 直列化できない定義は cache せず、従来どおり毎回 fingerprint を計算する。
+        return None
+    key = _sha256(_frame(tag, _cache_runtime_tag(), buffer.getvalue()))
+    return key, frozenset(pickler.aliases)
+
+
+def _resolve_dependency_module(
+    name: str,
+    aliases: frozenset[tuple[str, str]],
+) -> types.ModuleType | None:
+    """canonical module 名を、現在の process で同じ名前を与える module へ戻す。"""
+
+    candidates = [name]
+    for canonical_root, actual_root in sorted(aliases):
+        if name == canonical_root or name.startswith(f"{canonical_root}."):
+            candidates.append(actual_root + name[len(canonical_root):])
+    for candidate in candidates:
+        module = sys.modules.get(candidate)
+        if module is None:
+            continue
+        try:
+            if _CanonicalEncoder._fingerprint_module_name(module) == name:
+                return module
+        except DefinitionFingerprintError:
+            return None
+    return None
+
+
+def _dependencies_current(
+    dependencies: tuple[tuple[str, str], ...],
+    aliases: frozenset[tuple[str, str]],
+) -> bool:
+    for name, token in dependencies:
+        module = _resolve_dependency_module(name, aliases)
+        if module is None:
+            return False
+        try:
+            if _module_token(module) != token:
+                return False
+        except DefinitionFingerprintError:
+            return False
+    return True
+
+
+def _global_values_current(
+    global_values: tuple[tuple[str, str, str], ...],
+    aliases: frozenset[tuple[str, str]],
+) -> bool:
+    for module_name, name, token in global_values:
+        module = _resolve_dependency_module(module_name, aliases)
+        if module is None or _global_value_token(module, name) != token:
+            return False
+    return True
+
+
+def _memoized_digest(
+    tag: bytes,
+    subject: object,
+    build: Callable[[_CanonicalEncoder], bytes],
+) -> str:
+    """``build`` の payload digest を on-disk cache 経由で返す。
+
+    entry は依存 module の identity と、参照した module global の現在値がすべて
+    保存時と一致する場合だけ使う。値で照合できない global を参照した定義は保存しない。
+    """
+
+    cache = current_fingerprint_cache()
+    key = None if cache is None else _cache_key(tag, subject)
+    if cache is not None and key is not None:
+        entry = cache.load(key[0])
+        if (
+            entry is not None
+            and _global_values_current(entry.global_values, key[1])
+            and _dependencies_current(entry.dependencies, key[1])
+        ):
+            return entry.digest
+    encoder = _CanonicalEncoder()
+    digest = _sha256(build(encoder))
+    if cache is not None and key is not None:
+        dependencies = encoder.dependency_tokens()
+        global_values = encoder.global_value_tokens()
+        if dependencies is not None and global_values is not None:
+            cache.store(
+                key[0],
+                FingerprintCacheEntry(
+                    digest=digest,
+                    dependencies=dependencies,
+                    global_values=global_values,
+                ),
+            )
+    return digest
+
+
 def fingerprint_evaluation_spec(
     evaluator: Callable[..., object],
     *,
@@ -716,16 +1073,18 @@ def fingerprint_evaluation_spec(
     if decorator_options is not None and not isinstance(decorator_options, Mapping):
         raise TypeError("decorator_options は mapping または None である必要があります")
 
-    encoder = _CanonicalEncoder()
-    payload = _frame(
-        b"evaluation-spec-fingerprint-v1",
-        encoder.encode(evaluator, path="evaluator"),
-        encoder.encode(
-            {} if decorator_options is None else decorator_options,
-            path="decorator_options",
-        ),
+    options: Mapping[str, object] = {} if decorator_options is None else decorator_options
+
+    def build(encoder: _CanonicalEncoder) -> bytes:
+        return _frame(
+            b"evaluation-spec-fingerprint-v1",
+            encoder.encode(evaluator, path="evaluator"),
+            encoder.encode(options, path="decorator_options"),
+        )
+
+    return EvaluationSpecFingerprint(
+        _memoized_digest(b"evaluation-spec", (evaluator, options), build)
     )
-    return EvaluationSpecFingerprint(_sha256(payload))
 
 
 def fingerprint_parameter_schema(
@@ -753,15 +1112,23 @@ def fingerprint_parameter_schema(
 
     if type(schema) is not ParameterOpSchema:
         raise TypeError("schema は exact ParameterOpSchema である必要があります")
-    encoder = _CanonicalEncoder()
-    payload = _frame(
-        b"parameter-schema-fingerprint-v1",
-        encoder.encode(schema.meta, path="schema.meta"),
-        encoder.encode(schema.defaults, path="schema.defaults"),
-        encoder.encode(schema.param_order, path="schema.param_order"),
-        encoder.encode(schema.ui_visible, path="schema.ui_visible"),
+
+    def build(encoder: _CanonicalEncoder) -> bytes:
+        return _frame(
+            b"parameter-schema-fingerprint-v1",
+            encoder.encode(schema.meta, path="schema.meta"),
+            encoder.encode(schema.defaults, path="schema.defaults"),
+            encoder.encode(schema.param_order, path="schema.param_order"),
+            encoder.encode(schema.ui_visible, path="schema.ui_visible"),
+        )
+
+    return ParameterSchemaFingerprint(
+        _memoized_digest(
+            b"parameter-schema",
+            (schema.meta, schema.defaults, schema.param_order, schema.ui_visible),
+            build,
+        )
     )
-    return ParameterSchemaFingerprint(_sha256(payload))
 
 
 __all__ = [
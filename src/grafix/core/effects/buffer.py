@@ -13,6 +13,7 @@ from grafix.core.geometry_kernels.packed import empty_packed_geometry
 from grafix.core.geometry_kernels.planar import (
     canonical_planar_frame,
     close_curve,
+    shared_planar_frame,
 )
 
 buffer_meta = {
@@ -162,9 +163,10 @@ def buffer(
 
     out_lines: list[np.ndarray] = []
     if union:
-        frame = canonical_planar_frame(
+        frame = shared_planar_frame(
             coords,
             offsets,
+            canonical=True,
             allow_linear=True,
         )
 
@@ -29,6 +29,8 @@ from grafix.core.geometry_kernels.packed import (
 from grafix.core.geometry_kernels.planar import (
     PlanarFrame,
     planarity_threshold,
+    shared_local_coords,
+    shared_planar_frame,
 )
 
 # `ndarray.tolist()` は各座標を Python object 化する。1 vertex を 384 bytes、
@@ -209,13 +211,13 @@ def clip(
     if mask_coords.shape[0] == 0:
         return base_coords, base_offsets
 
-    frame = PlanarFrame.from_points(mask_coords, mask_offsets)
+    frame = shared_planar_frame(mask_coords, mask_offsets)
     threshold = planarity_threshold(mask_coords)
     if not frame.is_planar(threshold):
         return base_coords, base_offsets
 
-    aligned_base = frame.to_local(base_coords)
-    aligned_mask = frame.to_local(mask_coords)
+    aligned_base = shared_local_coords(frame, base_coords)
+    aligned_mask = shared_local_coords(frame, mask_coords)
 
     if float(np.max(np.abs(aligned_base[:, 2]))) > threshold:
         return base_coords, base_offsets
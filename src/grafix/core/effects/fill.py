@@ -23,6 +23,8 @@ from grafix.core.geometry_kernels.packed import (
 from grafix.core.geometry_kernels.planar import (
     PlanarFrame,
     planarity_threshold,
+    shared_local_coords,
+    shared_planar_frame,
 )
 
 # 生成する塗り線の最大本数（密度の上限）。
@@ -839,9 +841,9 @@ def fill(
     # （0° と 180° は同方向扱いなので 2π ではなく π）
     # 1) 全体がほぼ平面なら、外周＋穴をグルーピングして even-odd 塗りを行う。
     # 3D -> XY 平面への整列で 2D 化し、生成した線分を元姿勢へ戻す。
-    global_frame = PlanarFrame.from_points(coords, offsets)
+    global_frame = shared_planar_frame(coords, offsets)
     if global_frame.is_planar(planarity_threshold(coords)):
-        coords_xy_all = global_frame.to_local(coords)
+        coords_xy_all = shared_local_coords(global_frame, coords)
         coords2d_all = coords_xy_all[:, :2].astype(np.float32, copy=False)
         if _is_degenerate_fill_input(coords2d_all, offsets):
             _emit_fill_fallback(
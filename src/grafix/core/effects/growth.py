@@ -16,11 +16,17 @@ from typing import Literal
 import numpy as np
 from numba import njit, prange  # type: ignore[attr-defined, import-untyped]
 
+from grafix.core.cancellation import check_cancelled
 from grafix.core.operation_authoring import effect
 from grafix.core.operation_diagnostics import emit_operation_diagnostic
 from grafix.core.parameters.meta import ParamMeta
 from grafix.core.preview_quality import current_preview_quality
 from grafix.core.realized_geometry import GeomTuple, concat_geom_tuples
+from grafix.core.simulation_checkpoints import (
+    SimulationCheckpoint,
+    current_simulation_checkpoints,
+    simulation_checkpoint_key,
+)
 
 from grafix.core.geometry_kernels.grid import GridSpec, plan_grid_from_bbox
 from grafix.core.geometry_kernels.packed import (
@@ -28,11 +34,12 @@ from grafix.core.geometry_kernels.packed import (
     pack_polylines,
 )
 from grafix.core.geometry_kernels.planar import (
-    PlanarFrame,
     PlanarRing,
     extract_planar_rings,
     pack_planar_rings,
     planarity_threshold,
+    shared_local_coords,
+    shared_planar_frame,
 )
 from grafix.core.geometry_kernels.raster import signed_distance_grid_edt
 
@@ -44,6 +51,9 @@ _MAX_POINTS_PER_RING = 20_000
 DRAFT_MAX_ITERS = 32
 DRAFT_MAX_TOTAL_POINTS = 4_096
 DRAFT_MAX_FORCE_GRID_CELLS = 65_536
+# simulation 途中状態を checkpoint tier へ残す反復間隔（最終反復は常に残す）。
+_CHECKPOINT_INTERVAL = 64
+_CHECKPOINT_NAMESPACE = "grafix.growth.simulation.v1"
 
 _BOUNDARY_PUSH_GAIN = 0.1
 _MAX_SDF_GRID_CELLS = 1_000_000
@@ -925,7 +935,40 @@ def _simulate_growth_in_mask_xy(
     force_grid_requested_cells = 0
     force_grid_effective_cells = 0
 
-    for _it in range(iters_i):
+    # iters 以外の全入力が同じなら、途中状態から続きを回した結果は最初からと一致する。
+    checkpoints = current_simulation_checkpoints()
+    checkpoint_key: str | None = None
+    if checkpoints is not None:
+        checkpoint_key = simulation_checkpoint_key(
+            _CHECKPOINT_NAMESPACE,
+            spacing,
+            avoid_f,
+            mode_i,
+            point_limit,
+            max_total_points is not None,
+            max_force_grid_cells,
+            sdf,
+            float(sdf_origin_x),
+            float(sdf_origin_y),
+            float(sdf_pitch),
+            len(rings),
+            *rings,
+        )
+        resumed = checkpoints.nearest(checkpoint_key, iters_i)
+        if resumed is not None:
+            state = resumed.state
+            assert isinstance(state, _GrowthSimulationResult)
+            rings = list(state.rings)
+            executed_iterations = state.iterations
+            max_points_observed = state.max_total_points
+            point_budget_hit = state.point_budget_hit
+            rejected_total_points = state.rejected_total_points
+            force_grid_requested_cells = state.force_grid_requested_cells
+            force_grid_effective_cells = state.force_grid_effective_cells
+
+    for _it in range(executed_iterations, iters_i):
+        # final refinement 中に scene が変わったら、古い simulation を iteration 境界で打ち切る。
+        check_cancelled()
         total_points = int(sum(int(r.shape[0]) for r in rings))
         if total_points <= 0:
             return _GrowthSimulationResult(
@@ -1040,6 +1083,27 @@ def _simulate_growth_in_mask_xy(
                 out_rings.append(points[s:e].copy())
         rings = out_rings
         executed_iterations += 1
+        if checkpoint_key is not None and (
+            executed_iterations % _CHECKPOINT_INTERVAL == 0
+            or executed_iterations == iters_i
+        ):
+            assert checkpoints is not None
+            checkpoints.put(
+                checkpoint_key,
+                SimulationCheckpoint(
+                    iteration=executed_iterations,
+                    state=_GrowthSimulationResult(
+                        list(rings),
+                        executed_iterations,
+                        max_points_observed,
+                        point_budget_hit,
+                        rejected_total_points,
+                        force_grid_requested_cells,
+                        force_grid_effective_cells,
+                    ),
+                    byte_size=int(sum(int(ring.nbytes) for ring in rings)),
+                ),
+            )
 
     return _GrowthSimulationResult(
         rings,
@@ -1119,7 +1183,7 @@ def growth(
         )
         return empty_packed_geometry()
 
-    frame = PlanarFrame.from_points(mask_coords, mask_offsets)
+    frame = shared_planar_frame(mask_coords, mask_offsets)
     if not frame.valid:
         emit_operation_diagnostic(
             op="growth.mask",
@@ -1137,7 +1201,7 @@ def growth(
         )
         return empty_packed_geometry()
 
-    aligned_mask = frame.to_local(mask_coords)
+    aligned_mask = shared_local_coords(frame, mask_coords)
 
     rings = extract_planar_rings(
         aligned_mask,
@@ -41,10 +41,11 @@ from grafix.core.geometry_kernels.packed import (
     pack_polylines,
 )
 from grafix.core.geometry_kernels.planar import (
-    PlanarFrame,
     extract_planar_rings,
     pack_planar_rings,
     planarity_threshold,
+    shared_local_coords,
+    shared_planar_frame,
 )
 from grafix.core.geometry_kernels.raster import signed_distance_grid_edt
 
@@ -201,10 +202,10 @@ def isocontour(
 
     pitch = grid_pitch
 
-    frame = PlanarFrame.from_points(mask_coords, mask_offsets)
+    frame = shared_planar_frame(mask_coords, mask_offsets)
     if not frame.is_planar(planarity_threshold(mask_coords)):
         return empty_packed_geometry()
-    coords_xy_all = frame.to_local(mask_coords)
+    coords_xy_all = shared_local_coords(frame, mask_coords)
 
     # 閉曲線のみを抽出（外周＋穴）。
     rings = extract_planar_rings(
@@ -25,11 +25,12 @@ from grafix.core.geometry_kernels.grid import (
 from grafix.core.geometry_kernels.marching import marching_squares_loops
 from grafix.core.geometry_kernels.packed import pack_polylines
 from grafix.core.geometry_kernels.planar import (
-    PlanarFrame,
     PlanarRing,
     extract_planar_rings,
     pack_planar_rings,
     planarity_threshold,
+    shared_local_coords,
+    shared_planar_frame,
 )
 from grafix.core.geometry_kernels.raster import scanline_evenodd_mask
 
@@ -803,10 +804,10 @@ def metaball(
     if coords.shape[0] == 0:
         return coords, offsets
 
-    frame = PlanarFrame.from_points(coords, offsets)
+    frame = shared_planar_frame(coords, offsets)
     if not frame.is_planar(planarity_threshold(coords)):
         return coords, offsets
-    coords_xy_all = frame.to_local(coords)
+    coords_xy_all = shared_local_coords(frame, coords)
 
     rings = extract_planar_rings(
         coords_xy_all,
@@ -7,6 +7,7 @@ from collections.abc import Iterable
 import numpy as np
 from numba import njit  # type: ignore[attr-defined, import-untyped]
 
+from grafix.core.instanced_geometry import GeomInstances, expand_geom_instances
 from grafix.core.operation_authoring import effect
 from grafix.core.parameters.meta import ParamMeta
 from grafix.core.realized_geometry import GeomTuple
@@ -57,7 +58,151 @@ mirror_ui_visible = {
     "source_positive_y": lambda v: v.get("n_mirror", 1) == 2,
 }
 
-@effect(meta=mirror_meta, ui_visible=mirror_ui_visible)
+def _clip_wedge_source(
+    coords: np.ndarray,
+    offsets: np.ndarray,
+    *,
+    n: int,
+    cx: float,
+    cy: float,
+) -> tuple[np.ndarray, np.ndarray, bool]:
+    """楔 [0, π/n) へクリップした複製元と、境界上の重複除去が必要かを返す。"""
+
+    delta = float(np.pi / n)
+
+    # 楔 [0, delta) をソース領域とする（中心 (cx,cy) を原点として角度で定義）。
+    # 法線は単位長（sin^2+cos^2=1）。クリップは include-boundary。
+    n0x, n0y = 0.0, 1.0  # y>=cy
+    n1x = float(-np.sin(delta))
+    n1y = float(np.cos(delta))
+
+    c0_coords, c0_offsets = _clip_polylines_halfplane_nb(
+        coords,
+        offsets,
+        cx,
+        cy,
+        n0x,
+        n0y,
+    )
+    c1_coords, c1_offsets = _clip_polylines_halfplane_nb(
+        c0_coords,
+        c0_offsets,
+        cx,
+        cy,
+        -n1x,
+        -n1y,
+    )
+    need_dedup = False
+    for i1 in range(int(c1_offsets.size) - 1):
+        p1 = c1_coords[int(c1_offsets[i1]) : int(c1_offsets[i1 + 1])]
+        if p1.shape[0] > 0 and _has_wedge_boundary_segment(
+            p1, cx=cx, cy=cy, n1x=n1x, n1y=n1y
+        ):
+            need_dedup = True
+            break
+    return c1_coords, c1_offsets, need_dedup
+
+
+def _wedge_rotations(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """2n 対称の各回転角の float32 cos/sin を返す。"""
+
+    step = float(2.0 * np.pi / n)
+    angles = (np.arange(n, dtype=np.float32) * np.float32(step)).astype(
+        np.float32, copy=False
+    )
+    cos = np.cos(angles).astype(np.float32, copy=False)
+    sin = np.sin(angles).astype(np.float32, copy=False)
+    return cos, sin
+
+
+def _mirror_instances(
+    g: GeomTuple,
+    *,
+    n_mirror: int,
+    cx: float,
+    cy: float,
+    source_positive_x: bool,
+    source_positive_y: bool,
+    show_planes: bool,
+) -> GeomInstances | None:
+    """放射対称（n_mirror >= 3）の出力を、楔内の複製元と 2n 個の変換で返す。
+
+    軸・象限対称、境界上の重複除去が必要な入力、``show_planes`` は平坦な出力が
+    必要なため None を返す。
+    """
+
+    del source_positive_x, source_positive_y
+    if n_mirror < 1:
+        raise ValueError("mirror の n_mirror は 1 以上である必要がある")
+    coords, offsets = g
+    if n_mirror < 3 or show_planes or coords.shape[0] == 0:
+        return None
+
+    c1_coords, c1_offsets, need_dedup = _clip_wedge_source(
+        coords,
+        offsets,
+        n=n_mirror,
+        cx=cx,
+        cy=cy,
+    )
+    if need_dedup:
+        return None
+    return _wedge_instances(c1_coords, c1_offsets, n=n_mirror, cx=cx, cy=cy)
+
+
+def _wedge_instances(
+    c1_coords: np.ndarray,
+    c1_offsets: np.ndarray,
+    *,
+    n: int,
+    cx: float,
+    cy: float,
+) -> GeomInstances | None:
+    """楔内の複製元を base に、回転 n 個と反転 + 回転 n 個の変換を作る。
+
+    展開は piece ごとに 2n 個のコピーを並べる（line 順）。piece が無ければ None。
+    """
+
+    lengths = np.diff(c1_offsets)
+    if not np.any(lengths > 0):
+        return None
+    if np.any(lengths == 0):
+        # 空の piece は平坦な出力にも現れないため境界から除く。
+        c1_offsets = np.concatenate(
+            (np.zeros((1,), dtype=np.int32), c1_offsets[1:][lengths > 0])
+        ).astype(np.int32, copy=False)
+
+    cos, sin = _wedge_rotations(n)
+    c = cos.astype(np.float64)
+    s = sin.astype(np.float64)
+    # 中心は float32 に丸めてから変換へ入れる（frozen な出力と同じ精度）。
+    px = float(np.float32(cx))
+    py = float(np.float32(cy))
+    transforms = np.zeros((2 * n, 4, 4), dtype=np.float64)
+    rotated = transforms[:n]
+    rotated[:, 0, 0] = c
+    rotated[:, 0, 1] = -s
+    rotated[:, 0, 3] = px - c * px + s * py
+    rotated[:, 1, 0] = s
+    rotated[:, 1, 1] = c
+    rotated[:, 1, 3] = py - s * px - c * py
+    reflected = transforms[n:]
+    reflected[:, 0, 0] = c
+    reflected[:, 0, 1] = s
+    reflected[:, 0, 3] = px - c * px - s * py
+    reflected[:, 1, 0] = s
+    reflected[:, 1, 1] = -c
+    reflected[:, 1, 3] = py - s * px + c * py
+    transforms[:, 2, 2] = 1.0
+    transforms[:, 3, 3] = 1.0
+    return GeomInstances(
+        base=(np.ascontiguousarray(c1_coords), c1_offsets),
+        transforms=transforms,
+        order="line",
+    )
+
+
+@effect(meta=mirror_meta, ui_visible=mirror_ui_visible, instances=_mirror_instances)
 def mirror(
     g: GeomTuple,
     *,
@@ -100,6 +245,8 @@ def mirror(
     -----
     - クリップは線分の半空間交差で行い、重心判定はしない。
     - 境界は内側扱い（include boundary）とし、EPS=1e-6 を使用する。
+    - 放射対称で重複除去と対称面表示が不要な場合、realize 経由では楔内の piece を
+      base とする `InstancedGeometry` を返す。
     """
     if n_mirror < 1:
         raise ValueError("mirror の n_mirror は 1 以上である必要がある")
@@ -151,81 +298,17 @@ def mirror(
             out_lines.extend([px, py, pxy])
 
     else:
-        delta = float(np.pi / n)
-        step = float(2.0 * np.pi / n)
-
-        # 楔 [0, delta) をソース領域とする（中心 (cx,cy) を原点として角度で定義）。
-        # 法線は単位長（sin^2+cos^2=1）。クリップは include-boundary。
-        n0x, n0y = 0.0, 1.0  # y>=cy
-        n1x = float(-np.sin(delta))
-        n1y = float(np.cos(delta))
-
-        wedge_pieces: list[np.ndarray] = []
-        need_dedup = False
-
-        c0_coords, c0_offsets = _clip_polylines_halfplane_nb(
+        c1_coords, c1_offsets, need_dedup = _clip_wedge_source(
             coords,
             offsets,
-            cx_f,
-            cy_f,
-            n0x,
-            n0y,
-        )
-        c1_coords, c1_offsets = _clip_polylines_halfplane_nb(
-            c0_coords,
-            c0_offsets,
-            cx_f,
-            cy_f,
-            -n1x,
-            -n1y,
+            n=n,
+            cx=cx_f,
+            cy=cy_f,
         )
-        for i1 in range(int(c1_offsets.size) - 1):
-            s1 = int(c1_offsets[i1])
-            e1 = int(c1_offsets[i1 + 1])
-            p1 = c1_coords[s1:e1]
-            if p1.shape[0] == 0:
-                continue
-            wedge_pieces.append(p1)
-            if (not need_dedup) and _has_wedge_boundary_segment(
-                p1, cx=cx_f, cy=cy_f, n1x=n1x, n1y=n1y
-            ):
-                need_dedup = True
-
-        if not wedge_pieces:
+        instances = _wedge_instances(c1_coords, c1_offsets, n=n, cx=cx_f, cy=cy_f)
+        if instances is None:
             return empty_packed_geometry()
-
-        angles = (np.arange(n, dtype=np.float32) * np.float32(step)).astype(
-            np.float32, copy=False
-        )
-        cos = np.cos(angles).astype(np.float32, copy=False)
-        sin = np.sin(angles).astype(np.float32, copy=False)
-
-        n_lines = len(wedge_pieces) * 2 * n
-        total_vertices = sum(int(p.shape[0]) for p in wedge_pieces) * 2 * n
-        out_coords_arr = np.empty((total_vertices, 3), dtype=np.float32)
-        out_offsets_arr = np.empty((n_lines + 1,), dtype=np.int32)
-        out_offsets_arr[0] = 0
-
-        v_cursor = 0
-        o_cursor = 0
-        for p in wedge_pieces:
-            ln = int(p.shape[0])
-            block = 2 * n * ln
-            _fill_wedge_mirror_copies_nb(
-                p.astype(np.float32, copy=False),
-                np.float32(cx_f),
-                np.float32(cy_f),
-                cos,
-                sin,
-                out_coords_arr[v_cursor : v_cursor + block],
-            )
-            # 各コピーは同じ頂点数なので offsets は等差で埋める。
-            offset_base = int(out_offsets_arr[o_cursor])
-            out_offsets_arr[o_cursor + 1 : o_cursor + 2 * n + 1] = (
-                offset_base + ln * np.arange(1, 2 * n + 1, dtype=np.int32)
-            )
-            o_cursor += 2 * n
-            v_cursor += block
+        out_coords_arr, out_offsets_arr = expand_geom_instances(instances)
 
         # 通常ケースは重複が出にくいので、dedup は必要時のみ。
         if need_dedup:
@@ -576,41 +659,6 @@ def _clip_polylines_halfplane_nb(
     return out_coords[:out_n], out_offsets[: out_lines + 1]
 
 
-@njit(cache=True, fastmath=True)  # type: ignore[misc]
-def _fill_wedge_mirror_copies_nb(
-    piece: np.ndarray,
-    cx: np.float32,
-    cy: np.float32,
-    cos: np.ndarray,
-    sin: np.ndarray,
-    out: np.ndarray,
-) -> None:
-    n = int(cos.shape[0])
-    ln = int(piece.shape[0])
-
-    for m in range(n):
-        c = float(cos[m])
-        s = float(sin[m])
-        base = m * ln
-        for i in range(ln):
-            x0 = float(piece[i, 0]) - float(cx)
-            y0 = float(piece[i, 1]) - float(cy)
-            out[base + i, 0] = x0 * c - y0 * s + float(cx)
-            out[base + i, 1] = x0 * s + y0 * c + float(cy)
-            out[base + i, 2] = float(piece[i, 2])
-
-    for m in range(n):
-        c = float(cos[m])
-        s = float(sin[m])
-        base = (n + m) * ln
-        for i in range(ln):
-            x0 = float(piece[i, 0]) - float(cx)
-            y0 = float(cy) - float(piece[i, 1])
-            out[base + i, 0] = x0 * c - y0 * s + float(cx)
-            out[base + i, 1] = x0 * s + y0 * c + float(cy)
-            out[base + i, 2] = float(piece[i, 2])
-
-
 def _append_wedge_planes(
     coords: np.ndarray,
     offsets: np.ndarray,
@@ -14,8 +14,9 @@ from grafix.core.resource_budget import ensure_geometry_output
 from grafix.core.geometry_kernels.packed import empty_packed_geometry
 from grafix.core.geometry_kernels.planar import (
     PlanarFrame,
-    canonical_planar_frame,
     planarity_threshold,
+    shared_local_coords,
+    shared_planar_frame,
 )
 from grafix.core.geometry_kernels.resample import RESAMPLE_CLOSED_DISTANCE_EPS
 
@@ -370,14 +371,14 @@ def offset_curve(
     if coords.shape[0] == 0:
         return coords, offsets
 
-    frame = canonical_planar_frame(coords, offsets, allow_linear=True)
+    frame = shared_planar_frame(coords, offsets, canonical=True, allow_linear=True)
     threshold = planarity_threshold(coords)
     if not frame.is_planar(threshold):
         raise ValueError(
             "offset_curve: 入力は有限な同一平面上にある必要がある"
             f"（status={frame.status}, residual={frame.residual:.6g}）"
         )
-    local = frame.to_local(coords)
+    local = shared_local_coords(frame, coords)
 
     from shapely.geometry import (  # type: ignore[import-not-found, import-untyped]
         LineString,
@@ -20,8 +20,8 @@ from grafix.core.realized_geometry import GeomTuple
 from grafix.core.parameters.meta import ParamMeta
 from grafix.core.geometry_kernels.packed import pack_polylines
 from grafix.core.geometry_kernels.planar import (
-    canonical_planar_frame,
     planarity_threshold,
+    shared_planar_frame,
 )
 
 partition_meta = {
@@ -272,7 +272,7 @@ def partition(
     coords, offsets = g
     if coords.shape[0] == 0:
         return coords, offsets
-    frame = canonical_planar_frame(coords, offsets)
+    frame = shared_planar_frame(coords, offsets, canonical=True)
     if not frame.is_planar(planarity_threshold(coords)):
         return coords, offsets
 
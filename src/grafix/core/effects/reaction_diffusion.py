@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Literal, cast
 
 import numpy as np
 from numba import get_num_threads, njit, prange  # type: ignore[attr-defined, import-untyped]
 
+from grafix.core.cancellation import (
+    EvaluationCancelled,
+    check_cancelled,
+    current_cancellation_token,
+)
 from grafix.core.operation_authoring import effect
 from grafix.core.operation_diagnostics import emit_operation_diagnostic
 from grafix.core.parameters.meta import ParamMeta
 from grafix.core.preview_quality import current_preview_quality
 from grafix.core.realized_geometry import GeomTuple
+from grafix.core.simulation_checkpoints import (
+    SimulationCheckpoint,
+    current_simulation_checkpoints,
+    simulation_checkpoint_key,
+)
 
 from grafix.core.geometry_kernels.grid import (
     DEFAULT_MAX_GRID_CELLS,
@@ -24,8 +34,9 @@ from grafix.core.geometry_kernels.packed import (
     pack_polylines,
 )
 from grafix.core.geometry_kernels.planar import (
-    PlanarFrame,
     planarity_threshold,
+    shared_local_coords,
+    shared_planar_frame,
 )
 from grafix.core.geometry_kernels.raster import (
     scanline_evenodd_mask,
@@ -38,6 +49,9 @@ DRAFT_MAX_STEPS = 600
 DRAFT_MAX_CELL_STEPS = 14_000_000
 _PARALLEL_MIN_GRID_CELLS = 65_536
 _PARALLEL_MIN_STEPS = 8
+# cancellation token 束縛時に 1 回の kernel 呼び出しで進める cells × steps の上限。
+_CANCELLATION_CHUNK_CELL_STEPS = 4_000_000
+_CHECKPOINT_NAMESPACE = "grafix.reaction_diffusion.simulation.v1"
 _BOUNDARY_CHOICES = ("noflux", "dirichlet")
 
 
@@ -193,11 +207,10 @@ def _pack_mask_rings_xy(
 
 
 @njit(cache=True)
-def _gray_scott_simulate_masked_serial(
-    u0: np.ndarray,
-    v0: np.ndarray,
+def _gray_scott_advance_masked_serial(
+    u_state: np.ndarray,
+    v_state: np.ndarray,
     mask: np.ndarray,
-    *,
     steps: int,
     du: float,
     dv: float,
@@ -205,11 +218,11 @@ def _gray_scott_simulate_masked_serial(
     kill: float,
     dt: float,
     boundary: int,  # 0: noflux, 1: dirichlet
-) -> np.ndarray:
-    ny = int(u0.shape[0])
-    nx = int(u0.shape[1])
-    u = u0.copy()
-    v = v0.copy()
+) -> None:
+    ny = int(u_state.shape[0])
+    nx = int(u_state.shape[1])
+    u = u_state
+    v = v_state
     u2 = np.empty_like(u)
     v2 = np.empty_like(v)
 
@@ -292,15 +305,16 @@ def _gray_scott_simulate_masked_serial(
         u, u2 = u2, u
         v, v2 = v2, v
 
-    return v
+    if steps % 2 == 1:
+        u_state[:, :] = u
+        v_state[:, :] = v
 
 
 @njit(cache=True, parallel=True)
-def _gray_scott_simulate_masked_parallel(
-    u0: np.ndarray,
-    v0: np.ndarray,
+def _gray_scott_advance_masked_parallel(
+    u_state: np.ndarray,
+    v_state: np.ndarray,
     mask: np.ndarray,
-    *,
     steps: int,
     du: float,
     dv: float,
@@ -308,13 +322,13 @@ def _gray_scott_simulate_masked_parallel(
     kill: float,
     dt: float,
     boundary: int,  # 0: noflux, 1: dirichlet
-) -> np.ndarray:
-    ny = int(u0.shape[0])
-    nx = int(u0.shape[1])
-    u = u0.copy()
-    v = v0.copy()
+) -> None:
+    ny = int(u_state.shape[0])
+    nx = int(u_state.shape[1])
     if steps <= 0:
-        return v
+        return
+    u = u_state
+    v = v_state
     u2 = np.empty_like(u)
     v2 = np.empty_like(v)
 
@@ -410,6 +424,49 @@ def _gray_scott_simulate_masked_parallel(
         u, u2 = u2, u
         v, v2 = v2, v
 
+    if steps % 2 == 1:
+        u_state[:, :] = u
+        v_state[:, :] = v
+
+
+@njit(cache=True)
+def _gray_scott_simulate_masked_serial(
+    u0: np.ndarray,
+    v0: np.ndarray,
+    mask: np.ndarray,
+    *,
+    steps: int,
+    du: float,
+    dv: float,
+    feed: float,
+    kill: float,
+    dt: float,
+    boundary: int,  # 0: noflux, 1: dirichlet
+) -> np.ndarray:
+    u = u0.copy()
+    v = v0.copy()
+    # numba の njit 間呼び出しは keyword-only 引数を扱えないため位置引数で渡す。
+    _gray_scott_advance_masked_serial(u, v, mask, steps, du, dv, feed, kill, dt, boundary)
+    return v
+
+
+@njit(cache=True)
+def _gray_scott_simulate_masked_parallel(
+    u0: np.ndarray,
+    v0: np.ndarray,
+    mask: np.ndarray,
+    *,
+    steps: int,
+    du: float,
+    dv: float,
+    feed: float,
+    kill: float,
+    dt: float,
+    boundary: int,  # 0: noflux, 1: dirichlet
+) -> np.ndarray:
+    u = u0.copy()
+    v = v0.copy()
+    _gray_scott_advance_masked_parallel(u, v, mask, steps, du, dv, feed, kill, dt, boundary)
     return v
 
 
@@ -434,23 +491,87 @@ def _gray_scott_simulate_masked(
         and bool(np.isfinite(u0).all())
         and bool(np.isfinite(v0).all())
     )
-    simulate = (
-        _gray_scott_simulate_masked_parallel
+    checkpoints = current_simulation_checkpoints()
+    cancellable = current_cancellation_token() is not None
+    chunk_steps = max(1, _CANCELLATION_CHUNK_CELL_STEPS // max(1, int(u0.size)))
+    if checkpoints is None and (not cancellable or steps <= chunk_steps):
+        simulate = (
+            _gray_scott_simulate_masked_parallel
+            if use_parallel
+            else _gray_scott_simulate_masked_serial
+        )
+        return simulate(
+            u0,
+            v0,
+            mask,
+            steps=steps,
+            du=du,
+            dv=dv,
+            feed=feed,
+            kill=kill,
+            dt=dt,
+            boundary=boundary,
+        )
+
+    # 取り消し可能な評価では state を chunk ごとに進め、境界で token を確認する。
+    # 各 step は (u, v) だけに依存するため、chunk 分割や checkpoint からの再開でも
+    # 結果は一括実行と bit 単位で一致する。
+    advance = (
+        _gray_scott_advance_masked_parallel
         if use_parallel
-        else _gray_scott_simulate_masked_serial
-    )
-    return simulate(
-        u0,
-        v0,
-        mask,
-        steps=steps,
-        du=du,
-        dv=dv,
-        feed=feed,
-        kill=kill,
-        dt=dt,
-        boundary=boundary,
+        else _gray_scott_advance_masked_serial
     )
+    u = u0.copy()
+    v = v0.copy()
+    completed = 0
+    checkpoint_key: str | None = None
+    if checkpoints is not None and steps > 0:
+        checkpoint_key = simulation_checkpoint_key(
+            _CHECKPOINT_NAMESPACE,
+            u0,
+            v0,
+            mask,
+            float(du),
+            float(dv),
+            float(feed),
+            float(kill),
+            float(dt),
+            int(boundary),
+        )
+        resumed = checkpoints.nearest(checkpoint_key, steps)
+        if resumed is not None:
+            u_saved, v_saved = cast(tuple[np.ndarray, np.ndarray], resumed.state)
+            u = u_saved.copy()
+            v = v_saved.copy()
+            completed = resumed.iteration
+    resumed_from = completed
+
+    def save_checkpoint() -> None:
+        if checkpoints is None or checkpoint_key is None or completed <= resumed_from:
+            return
+        checkpoints.put(
+            checkpoint_key,
+            SimulationCheckpoint(
+                iteration=completed,
+                state=(u.copy(), v.copy()),
+                byte_size=int(u.nbytes + v.nbytes),
+            ),
+        )
+
+    if not cancellable:
+        chunk_steps = steps
+    try:
+        while completed < steps:
+            check_cancelled()
+            chunk = min(steps - completed, chunk_steps)
+            advance(u, v, mask, chunk, du, dv, feed, kill, dt, boundary)
+            completed += chunk
+    except EvaluationCancelled:
+        # chunk 境界までの進捗を残し、次の評価はそこから再開する。
+        save_checkpoint()
+        raise
+    save_checkpoint()
+    return v
 
 
 
@@ -533,11 +654,11 @@ def reaction_diffusion(
 
     pitch = grid_pitch
 
-    frame = PlanarFrame.from_points(mask_coords, mask_offsets)
+    frame = shared_planar_frame(mask_coords, mask_offsets)
     if not frame.is_planar(planarity_threshold(mask_coords)):
         return empty_packed_geometry()
 
-    aligned_mask = frame.to_local(mask_coords)
+    aligned_mask = shared_local_coords(frame, mask_coords)
 
     packed = _pack_mask_rings_xy(aligned_mask, mask_offsets)
     if packed is None:
@@ -7,8 +7,8 @@ from collections.abc import Mapping
 from typing import Any
 
 import numpy as np
-from numba import njit  # type: ignore[attr-defined, import-untyped]
 
+from grafix.core.instanced_geometry import GeomInstances, expand_geom_instances
 from grafix.core.operation_authoring import effect
 from grafix.core.parameters.meta import ParamMeta
 from grafix.core.realized_geometry import GeomTuple
@@ -132,154 +132,165 @@ repeat_ui_visible = {
 }
 
 
-@njit(cache=True, fastmath=True)  # type: ignore[misc]
-def _repeat_fill_all(
-    base_coords: np.ndarray,
-    base_offsets_tail: np.ndarray,
-    n_dups: int,
+def _affine_transforms(
+    center: np.ndarray,
+    scale: np.ndarray,
+    rotate: np.ndarray,
+    translate: np.ndarray,
+) -> np.ndarray:
+    """コピーごとのスケール・回転・移動から (K,4,4) の affine 変換列を作る。
+
+    各コピーは「中心移動 → スケール → 回転 → 平行移動 → 中心に戻す」を表し、
+    回転は Rz・Ry・Rx の順に合成する。引数は全て float64 で、``center`` は (3,)、
+    それ以外は (K,3)。
+    """
+
+    sin_x, sin_y, sin_z = np.sin(rotate).T
+    cos_x, cos_y, cos_z = np.cos(rotate).T
+
+    rotation = np.empty((rotate.shape[0], 3, 3), dtype=np.float64)
+    rotation[:, 0, 0] = cos_y * cos_z
+    rotation[:, 0, 1] = sin_x * sin_y * cos_z - cos_x * sin_z
+    rotation[:, 0, 2] = cos_x * sin_y * cos_z + sin_x * sin_z
+    rotation[:, 1, 0] = cos_y * sin_z
+    rotation[:, 1, 1] = sin_x * sin_y * sin_z + cos_x * cos_z
+    rotation[:, 1, 2] = cos_x * sin_y * sin_z - sin_x * cos_z
+    rotation[:, 2, 0] = -sin_y
+    rotation[:, 2, 1] = sin_x * cos_y
+    rotation[:, 2, 2] = cos_x * cos_y
+
+    linear = rotation * scale[:, np.newaxis, :]
+    transforms = np.zeros((rotate.shape[0], 4, 4), dtype=np.float64)
+    transforms[:, :3, :3] = linear
+    transforms[:, :3, 3] = center + translate - linear @ center
+    transforms[:, 3, 3] = 1.0
+    return transforms
+
+
+def _interpolated_transforms(
+    t: np.ndarray,
+    *,
     curve: float,
     cumulative_scale: bool,
     cumulative_offset: bool,
     cumulative_rotate: bool,
     center: np.ndarray,
-    out_coords: np.ndarray,
-    out_offsets: np.ndarray,
-    offset_end: np.ndarray,
     scale_end: np.ndarray,
     rotate_end: np.ndarray,
-) -> None:
-    """repeat の全コピーを 1 カーネルで生成する。"""
-    n_vertices = base_coords.shape[0]
-    n_lines = base_offsets_tail.shape[0]
-    copies = n_dups + 1
-
-    out_offsets[0] = 0
-
-    cx = float(center[0])
-    cy = float(center[1])
-    cz = float(center[2])
-
-    off_end_x = float(offset_end[0])
-    off_end_y = float(offset_end[1])
-    off_end_z = float(offset_end[2])
-    scale_end_x = float(scale_end[0])
-    scale_end_y = float(scale_end[1])
-    scale_end_z = float(scale_end[2])
-    rot_end_x = float(rotate_end[0])
-    rot_end_y = float(rotate_end[1])
-    rot_end_z = float(rotate_end[2])
-    curve_f = float(curve)
-
-    for k in range(copies):
-        v_start = k * n_vertices
-
-        o_start = 1 + k * n_lines
-        for li in range(n_lines):
-            out_offsets[o_start + li] = int(base_offsets_tail[li]) + int(v_start)
-
-        if k == 0:
-            for i in range(n_vertices):
-                out_coords[v_start + i, 0] = base_coords[i, 0]
-                out_coords[v_start + i, 1] = base_coords[i, 1]
-                out_coords[v_start + i, 2] = base_coords[i, 2]
-            continue
-
-        t = float(k) / float(n_dups)
-        if cumulative_scale or cumulative_offset or cumulative_rotate:
-            t_curve = t**curve_f
-        else:
-            t_curve = t
-
-        t_scale = t_curve if cumulative_scale else t
-        t_offset = t_curve if cumulative_offset else t
-        t_rotate = t_curve if cumulative_rotate else t
-
-        sx = 1.0 + (scale_end_x - 1.0) * t_scale
-        sy = 1.0 + (scale_end_y - 1.0) * t_scale
-        sz = 1.0 + (scale_end_z - 1.0) * t_scale
-
-        ox = off_end_x * t_offset
-        oy = off_end_y * t_offset
-        oz = off_end_z * t_offset
-
-        rx = rot_end_x * t_rotate
-        ry = rot_end_y * t_rotate
-        rz = rot_end_z * t_rotate
-
-        sin_x = math.sin(rx)
-        cos_x = math.cos(rx)
-        sin_y = math.sin(ry)
-        cos_y = math.cos(ry)
-        sin_z = math.sin(rz)
-        cos_z = math.cos(rz)
-
-        r00 = cos_y * cos_z
-        r01 = sin_x * sin_y * cos_z - cos_x * sin_z
-        r02 = cos_x * sin_y * cos_z + sin_x * sin_z
-        r10 = cos_y * sin_z
-        r11 = sin_x * sin_y * sin_z + cos_x * cos_z
-        r12 = cos_x * sin_y * sin_z - sin_x * cos_z
-        r20 = -sin_y
-        r21 = sin_x * cos_y
-        r22 = cos_x * cos_y
-
-        for i in range(n_vertices):
-            x = (float(base_coords[i, 0]) - cx) * sx
-            y = (float(base_coords[i, 1]) - cy) * sy
-            z = (float(base_coords[i, 2]) - cz) * sz
-
-            rx0 = x * r00 + y * r01 + z * r02
-            ry0 = x * r10 + y * r11 + z * r12
-            rz0 = x * r20 + y * r21 + z * r22
-
-            out_coords[v_start + i, 0] = rx0 + cx + ox
-            out_coords[v_start + i, 1] = ry0 + cy + oy
-            out_coords[v_start + i, 2] = rz0 + cz + oz
-
-
-@njit(cache=True, fastmath=True)  # type: ignore[misc]
-def _repeat_fill_radial(
-    base_coords: np.ndarray,
-    base_offsets_tail: np.ndarray,
-    curve: float,
-    cumulative_scale: bool,
-    cumulative_rotate: bool,
-    center: np.ndarray,
-    out_coords: np.ndarray,
-    out_offsets: np.ndarray,
+    offset_end: np.ndarray,
+    ring_offsets: np.ndarray | None = None,
+) -> np.ndarray:
+    """補間パラメータ t 列（0→1）から各コピーの変換列を作る。"""
+
+    if cumulative_scale or cumulative_offset or cumulative_rotate:
+        t_curve = t ** float(curve)
+    else:
+        t_curve = t
+    t_scale = (t_curve if cumulative_scale else t)[:, np.newaxis]
+    t_offset = (t_curve if cumulative_offset else t)[:, np.newaxis]
+    t_rotate = (t_curve if cumulative_rotate else t)[:, np.newaxis]
+
+    scale = 1.0 + (scale_end - 1.0) * t_scale
+    rotate = rotate_end * t_rotate
+    translate = offset_end * t_offset if ring_offsets is None else ring_offsets
+    return _affine_transforms(center, scale, rotate, translate)
+
+
+def _repeat_instances(
+    g: GeomTuple,
+    *,
+    layout: str,
+    count: int,
     radius: float,
-    theta0: float,
+    theta: float,
     n_theta: int,
     n_radius: int,
-    scale_end: np.ndarray,
-    rotate_end: np.ndarray,
-) -> None:
-    """radial レイアウトの全コピーを 1 カーネルで生成する。"""
-    n_vertices = base_coords.shape[0]
-    n_lines = base_offsets_tail.shape[0]
+    cumulative_scale: bool,
+    cumulative_offset: bool,
+    cumulative_rotate: bool,
+    offset: tuple[float, float, float],
+    rotation_step: tuple[float, float, float],
+    scale: tuple[float, float, float],
+    curve: float,
+    auto_center: bool,
+    pivot: tuple[float, float, float],
+) -> GeomInstances | None:
+    """repeat の出力を入力 geometry と複製変換列で返す（no-op のときは None）。"""
+
+    if count < 0:
+        raise ValueError("repeat: count は 0 以上である必要がある")
+    if n_theta <= 0:
+        raise ValueError("repeat: n_theta は正の整数である必要がある")
+    if n_radius <= 0:
+        raise ValueError("repeat: n_radius は正の整数である必要がある")
+
+    if radius < 0.0:
+        raise ValueError("repeat: radius は 0 以上の有限値である必要がある")
+    if curve < 0.1:
+        raise ValueError("repeat: curve は 0.1 以上の有限値である必要がある")
+
+    coords, offsets = g
+    if coords.shape[0] == 0:
+        return None
 
-    out_offsets[0] = 0
+    n_vertices = int(coords.shape[0])
+    n_lines = int(offsets.size) - 1
+    if n_lines <= 0:
+        return None
 
-    cx = float(center[0])
-    cy = float(center[1])
-    cz = float(center[2])
+    if auto_center:
+        center = coords.astype(np.float64, copy=False).mean(axis=0)
+    else:
+        center = np.asarray(pivot, dtype=np.float64)
 
-    scale_end_x = float(scale_end[0])
-    scale_end_y = float(scale_end[1])
-    scale_end_z = float(scale_end[2])
-    rot_end_x = float(rotate_end[0])
-    rot_end_y = float(rotate_end[1])
-    rot_end_z = float(rotate_end[2])
+    # 変換パラメータは float32 に丸めてから float64 で合成する（従来の kernel と同じ精度）。
+    center64 = np.asarray(center, dtype=np.float32).astype(np.float64)
+    scale_end = np.asarray(scale, dtype=np.float32).astype(np.float64)
+    rotate_end_deg = np.asarray(rotation_step, dtype=np.float32)
+    rotate_end = np.deg2rad(rotate_end_deg).astype(np.float32).astype(np.float64)
 
-    curve_f = float(curve)
-    two_pi = 2.0 * math.pi
+    if layout == "grid":
+        n_dups = count
+        if n_dups == 0:
+            return None
+
+        copies = n_dups + 1
+        ensure_geometry_output(
+            "repeat",
+            vertices=n_vertices * copies,
+            lines=n_lines * copies,
+            hint="count または入力 geometry の複雑さを減らしてください",
+        )
+        transforms = _interpolated_transforms(
+            np.arange(copies, dtype=np.float64) / float(n_dups),
+            curve=curve,
+            cumulative_scale=cumulative_scale,
+            cumulative_offset=cumulative_offset,
+            cumulative_rotate=cumulative_rotate,
+            center=center64,
+            scale_end=scale_end,
+            rotate_end=rotate_end,
+            offset_end=np.asarray(offset, dtype=np.float32).astype(np.float64),
+        )
+        # 先頭コピーは入力そのもの。
+        transforms[0] = np.eye(4, dtype=np.float64)
+        return GeomInstances(base=g, transforms=transforms)
 
-    if n_radius <= 1:
+    if n_radius == 1:
         copies = n_theta
     else:
         copies = 1 + (n_radius - 1) * n_theta
-    denom_copy = float(copies - 1) if copies > 1 else 1.0
 
+    ensure_geometry_output(
+        "repeat",
+        vertices=n_vertices * copies,
+        lines=n_lines * copies,
+        hint="n_theta/n_radius または入力 geometry の複雑さを減らしてください",
+    )
+
+    theta_rad = float(np.deg2rad(theta))
+    two_pi = 2.0 * math.pi
+    ring_offsets = np.zeros((copies, 3), dtype=np.float64)
     k = 0
     n_rings = 1 if n_radius <= 1 else n_radius
     denom_r = float(n_radius - 1) if n_radius > 1 else 1.0
@@ -288,61 +299,31 @@ def _repeat_fill_radial(
         r = float(radius) * ring_t
         n_j = n_theta if (n_radius <= 1 or ring_i != 0) else 1
         for j in range(n_j):
-            angle = theta0 + two_pi * float(j) / float(n_theta)
-            ox = r * math.cos(angle)
-            oy = r * math.sin(angle)
-
-            t = 1.0 if copies <= 1 else float(k) / denom_copy
-            t_curve = t**curve_f if (cumulative_scale or cumulative_rotate) else t
-            t_scale = t_curve if cumulative_scale else t
-            t_rotate = t_curve if cumulative_rotate else t
-
-            sx = 1.0 + (scale_end_x - 1.0) * t_scale
-            sy = 1.0 + (scale_end_y - 1.0) * t_scale
-            sz = 1.0 + (scale_end_z - 1.0) * t_scale
-
-            rx = rot_end_x * t_rotate
-            ry = rot_end_y * t_rotate
-            rz = rot_end_z * t_rotate
-
-            sin_x = math.sin(rx)
-            cos_x = math.cos(rx)
-            sin_y = math.sin(ry)
-            cos_y = math.cos(ry)
-            sin_z = math.sin(rz)
-            cos_z = math.cos(rz)
-
-            r00 = cos_y * cos_z
-            r01 = sin_x * sin_y * cos_z - cos_x * sin_z
-            r02 = cos_x * sin_y * cos_z + sin_x * sin_z
-            r10 = cos_y * sin_z
-            r11 = sin_x * sin_y * sin_z + cos_x * cos_z
-            r12 = cos_x * sin_y * sin_z - sin_x * cos_z
-            r20 = -sin_y
-            r21 = sin_x * cos_y
-            r22 = cos_x * cos_y
-
-            v_start = k * n_vertices
-            o_start = 1 + k * n_lines
-            for li in range(n_lines):
-                out_offsets[o_start + li] = int(base_offsets_tail[li]) + int(v_start)
-
-            for i in range(n_vertices):
-                x = (float(base_coords[i, 0]) - cx) * sx
-                y = (float(base_coords[i, 1]) - cy) * sy
-                z = (float(base_coords[i, 2]) - cz) * sz
-
-                rx0 = x * r00 + y * r01 + z * r02
-                ry0 = x * r10 + y * r11 + z * r12
-                rz0 = x * r20 + y * r21 + z * r22
-
-                out_coords[v_start + i, 0] = rx0 + cx + ox
-                out_coords[v_start + i, 1] = ry0 + cy + oy
-                out_coords[v_start + i, 2] = rz0 + cz
+            angle = theta_rad + two_pi * float(j) / float(n_theta)
+            ring_offsets[k, 0] = r * math.cos(angle)
+            ring_offsets[k, 1] = r * math.sin(angle)
             k += 1
 
+    if copies <= 1:
+        t = np.ones((copies,), dtype=np.float64)
+    else:
+        t = np.arange(copies, dtype=np.float64) / float(copies - 1)
+    transforms = _interpolated_transforms(
+        t,
+        curve=curve,
+        cumulative_scale=cumulative_scale,
+        cumulative_offset=False,
+        cumulative_rotate=cumulative_rotate,
+        center=center64,
+        scale_end=scale_end,
+        rotate_end=rotate_end,
+        offset_end=np.zeros((3,), dtype=np.float64),
+        ring_offsets=ring_offsets,
+    )
+    return GeomInstances(base=g, transforms=transforms)
+
 
-@effect(meta=repeat_meta, ui_visible=repeat_ui_visible)
+@effect(meta=repeat_meta, ui_visible=repeat_ui_visible, instances=_repeat_instances)
 def repeat(
     g: GeomTuple,
     *,
@@ -413,103 +394,27 @@ def repeat(
     変換順序は「中心移動 → スケール → 回転 → 平行移動 → 中心に戻す」。
     回転は Rz・Ry・Rx の順に合成する。
     `layout="radial"` のとき、スケール/回転の補間パラメータ t は生成されるコピーの順序で 0→1 に変化する（位相でも変化する）。
+    realize 経由では入力を base とする `InstancedGeometry` を返し、平坦な座標は
+    下流の effect や exporter が必要とした時点で展開する。
     """
-    if count < 0:
-        raise ValueError("repeat: count は 0 以上である必要がある")
-    if n_theta <= 0:
-        raise ValueError("repeat: n_theta は正の整数である必要がある")
-    if n_radius <= 0:
-        raise ValueError("repeat: n_radius は正の整数である必要がある")
-
-    if radius < 0.0:
-        raise ValueError("repeat: radius は 0 以上の有限値である必要がある")
-    if curve < 0.1:
-        raise ValueError("repeat: curve は 0.1 以上の有限値である必要がある")
-
-    coords, offsets = g
-    if coords.shape[0] == 0:
-        return coords, offsets
-
-    n_vertices = int(coords.shape[0])
-    n_lines = int(offsets.size) - 1
-    if n_lines <= 0:
-        return coords, offsets
-
-    if auto_center:
-        center = coords.astype(np.float64, copy=False).mean(axis=0)
-    else:
-        center = np.asarray(pivot, dtype=np.float64)
-
-    center32 = np.asarray(center, dtype=np.float32)
-    scale_end = np.asarray(scale, dtype=np.float32)
-    rotate_end_deg = np.asarray(rotation_step, dtype=np.float32)
-    rotate_end = np.deg2rad(rotate_end_deg).astype(np.float32, copy=False)
-
-    base_tail = offsets[1:]
-
-    if layout == "grid":
-        n_dups = count
-        if n_dups == 0:
-            return coords, offsets
-
-        offset_end = np.asarray(offset, dtype=np.float32)
-
-        copies = n_dups + 1
-        ensure_geometry_output(
-            "repeat",
-            vertices=n_vertices * copies,
-            lines=n_lines * copies,
-            hint="count または入力 geometry の複雑さを減らしてください",
-        )
-        out_coords = np.empty((n_vertices * copies, 3), dtype=np.float32)
-        out_offsets = np.empty((n_lines * copies + 1,), dtype=np.int32)
-        _repeat_fill_all(
-            coords,
-            base_tail,
-            n_dups,
-            curve,
-            cumulative_scale,
-            cumulative_offset,
-            cumulative_rotate,
-            center32,
-            out_coords,
-            out_offsets,
-            offset_end,
-            scale_end,
-            rotate_end,
-        )
-        return out_coords, out_offsets
-
-    if n_radius == 1:
-        copies = n_theta
-    else:
-        copies = 1 + (n_radius - 1) * n_theta
-
-    ensure_geometry_output(
-        "repeat",
-        vertices=n_vertices * copies,
-        lines=n_lines * copies,
-        hint="n_theta/n_radius または入力 geometry の複雑さを減らしてください",
-    )
-
-    theta_rad = float(np.deg2rad(theta))
-
-    out_coords = np.empty((n_vertices * copies, 3), dtype=np.float32)
-    out_offsets = np.empty((n_lines * copies + 1,), dtype=np.int32)
-    _repeat_fill_radial(
-        coords,
-        base_tail,
-        curve,
-        cumulative_scale,
-        cumulative_rotate,
-        center32,
-        out_coords,
-        out_offsets,
-        radius,
-        float(theta_rad),
-        n_theta,
-        n_radius,
-        scale_end,
-        rotate_end,
+    instances = _repeat_instances(
+        g,
+        layout=layout,
+        count=count,
+        radius=radius,
+        theta=theta,
+        n_theta=n_theta,
+        n_radius=n_radius,
+        cumulative_scale=cumulative_scale,
+        cumulative_offset=cumulative_offset,
+        cumulative_rotate=cumulative_rotate,
+        offset=offset,
+        rotation_step=rotation_step,
+        scale=scale,
+        curve=curve,
+        auto_center=auto_center,
+        pivot=pivot,
     )
-    return out_coords, out_offsets
+    if instances is None:
+        return g
+    return expand_geom_instances(instances)
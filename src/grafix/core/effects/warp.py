@@ -21,10 +21,11 @@ from grafix.core.parameters.meta import ParamMeta
 from grafix.core.realized_geometry import GeomTuple, concat_geom_tuples
 
 from grafix.core.geometry_kernels.planar import (
-    PlanarFrame,
     extract_planar_rings,
     pack_planar_rings,
     planarity_threshold,
+    shared_local_coords,
+    shared_planar_frame,
 )
 
 _AUTO_CLOSE_THRESHOLD_DEFAULT = 1e-3
@@ -619,13 +620,13 @@ def warp(
     else:
         dir_sign = 1.0 if direction == "attract" else -1.0
 
-    frame = PlanarFrame.from_points(mask_coords, mask_offsets)
+    frame = shared_planar_frame(mask_coords, mask_offsets)
     threshold = planarity_threshold(mask_coords)
     if not frame.is_planar(threshold):
         return _with_extras(base)
 
-    aligned_base = frame.to_local(base_coords)
-    aligned_mask = frame.to_local(mask_coords)
+    aligned_base = shared_local_coords(frame, base_coords)
+    aligned_mask = shared_local_coords(frame, mask_coords)
 
     if float(np.max(np.abs(aligned_base[:, 2]))) > threshold:
         return _with_extras(base)
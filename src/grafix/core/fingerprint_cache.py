@@ -0,0 +1,217 @@
+"""operation 定義 fingerprint を process 間で共有する on-disk cache。
+
+catalog bootstrap は builtin / custom operation ごとに evaluator と parameter schema を
+canonical bytes へ展開して hash する。cold process、spawn された worker、source reload
+の candidate は同じ定義を毎回展開し直すため、結果の digest を ``key`` ごとに 1 file
+として保存し、次回は依存 module の identity と参照した module global の値を照合する
+だけで再利用する。
+
+key の組み立てと依存 module の照合は `grafix.core.definition_fingerprint` が行う。
+この module は entry の保存形式と保存先だけを扱う。
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
+import os
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Final
+
+from grafix.core.value_validation import exact_string
+from grafix.file_io import atomic_write_text
+
+_FORMAT_VERSION: Final = 2
+_DIGEST_PATTERN: Final = re.compile(r"[0-9a-f]{64}")
+_CACHE_DIR_ENV: Final = "GRAFIX_FINGERPRINT_CACHE_DIR"
+
+
+def _is_digest(value: object) -> bool:
+    return type(value) is str and _DIGEST_PATTERN.fullmatch(value) is not None
+
+
+@dataclass(frozen=True, slots=True)
+class FingerprintCacheEntry:
+    """保存済み fingerprint と、それが依存した module identity の組。
+
+    Parameters
+    ----------
+    digest : str
+        fingerprint の SHA-256 lowercase hex。
+    dependencies : tuple[tuple[str, str], ...]
+        ``(canonical module 名, module identity digest)`` の列。一つでも現在の
+        module と一致しなければ entry は使わない。
+    global_values : tuple[tuple[str, str, str], ...]
+        ``(canonical module 名, global 名, 値 token digest)`` の列。import 後に
+        書き換えられた module global を検出するため、hit 時に現在の値と照合する。
+    """
+
+    digest: str
+    dependencies: tuple[tuple[str, str], ...]
+    global_values: tuple[tuple[str, str, str], ...] = ()
+
+    def __post_init__(self) -> None:
+        if not _is_digest(self.digest):
+            raise ValueError("digest は SHA-256 lowercase hex 文字列である必要があります")
+        dependencies = tuple(self.dependencies)
+        for dependency in dependencies:
+            if type(dependency) is not tuple or len(dependency) != 2:
+                raise TypeError("dependencies の要素は (module 名, digest) です")
+            name, token = dependency
+            exact_string(name, name="dependency module name")
+            if not _is_digest(token):
+                raise ValueError("dependency digest は SHA-256 lowercase hex 文字列です")
+        object.__setattr__(self, "dependencies", dependencies)
+        global_values = tuple(self.global_values)
+        for global_value in global_values:
+            if type(global_value) is not tuple or len(global_value) != 3:
+                raise TypeError("global_values の要素は (module 名, global 名, digest) です")
+            module_name, global_name, token = global_value
+            exact_string(module_name, name="global module name")
+            exact_string(global_name, name="global name")
+            if not _is_digest(token):
+                raise ValueError("global value digest は SHA-256 lowercase hex 文字列です")
+        object.__setattr__(self, "global_values", global_values)
+
+
+class FingerprintCache:
+    """``key`` ごとに 1 JSON file を置く fingerprint store。
+
+    Notes
+    -----
+    entry は再計算できるため、読めない・壊れた file は miss として扱い、書き込み
+    失敗も握りつぶす。書き込みは `atomic_write_text` なので、並行する worker が
+    途中までの file を読むことはない。
+    """
+
+    __slots__ = ("_directory",)
+
+    def __init__(self, directory: str | Path) -> None:
+        if not isinstance(directory, (str, Path)):
+            raise TypeError("directory は str または Path である必要があります")
+        self._directory = Path(directory)
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def load(self, key: str) -> FingerprintCacheEntry | None:
+        """``key`` の entry を返す。無い・壊れている場合は None。"""
+
+        path = self._entry_path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if type(payload) is not dict or payload.get("format") != _FORMAT_VERSION:
+            return None
+        raw_dependencies = payload.get("dependencies")
+        raw_global_values = payload.get("global_values")
+        if type(raw_dependencies) is not list or type(raw_global_values) is not list:
+            return None
+        try:
+            return FingerprintCacheEntry(
+                digest=payload.get("digest"),  # type: ignore[arg-type]
+                dependencies=tuple(
+                    tuple(item) if type(item) is list else item
+                    for item in raw_dependencies
+                ),
+                global_values=tuple(
+                    tuple(item) if type(item) is list else item
+                    for item in raw_global_values
+                ),
+            )
+        except (TypeError, ValueError):
+            return None
+
+    def store(self, key: str, entry: FingerprintCacheEntry) -> None:
+        """entry を保存する。失敗しても例外にしない。"""
+
+        if type(entry) is not FingerprintCacheEntry:
+            raise TypeError("entry は exact FingerprintCacheEntry です")
+        path = self._entry_path(key)
+        text = json.dumps(
+            {
+                "format": _FORMAT_VERSION,
+                "digest": entry.digest,
+                "dependencies": [list(item) for item in entry.dependencies],
+                "global_values": [list(item) for item in entry.global_values],
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        try:
+            atomic_write_text(path, text)
+        except OSError:
+            return
+
+    def _entry_path(self, key: str) -> Path:
+        if not _is_digest(key):
+            raise ValueError("key は SHA-256 lowercase hex 文字列である必要があります")
+        return self._directory / key[:2] / f"{key[2:]}.json"
+
+
+def default_fingerprint_cache_directory() -> Path | None:
+    """環境変数と XDG 規約から既定の保存先を返す。
+
+    ``GRAFIX_FINGERPRINT_CACHE_DIR`` が設定されていればそれを使い、空文字なら
+    cache を無効化する。未設定なら ``$XDG_CACHE_HOME/grafix/fingerprints``
+    （既定 ``~/.cache/grafix/fingerprints``）。
+    """
+
+    explicit = os.environ.get(_CACHE_DIR_ENV)
+    if explicit is not None:
+        explicit = explicit.strip()
+        return Path(explicit).expanduser() if explicit else None
+    xdg_cache = os.environ.get("XDG_CACHE_HOME", "").strip()
+    base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / ".cache"
+    return base / "grafix" / "fingerprints"
+
+
+@cache
+def _default_fingerprint_cache() -> FingerprintCache | None:
+    directory = default_fingerprint_cache_directory()
+    return None if directory is None else FingerprintCache(directory)
+
+
+_UNSET: Final = object()
+_fingerprint_cache_var: contextvars.ContextVar[object] = contextvars.ContextVar(
+    "fingerprint_cache",
+    default=_UNSET,
+)
+
+
+def current_fingerprint_cache() -> FingerprintCache | None:
+    """現在有効な cache を返す。context で未指定なら process 既定、無効なら None。"""
+
+    value = _fingerprint_cache_var.get()
+    if value is _UNSET:
+        return _default_fingerprint_cache()
+    return value  # type: ignore[return-value]
+
+
+@contextlib.contextmanager
+def fingerprint_cache_context(cache: FingerprintCache | None) -> Iterator[None]:
+    """範囲内だけ使う cache を差し替える。None は cache を使わない。"""
+
+    if cache is not None and type(cache) is not FingerprintCache:
+        raise TypeError("cache は FingerprintCache または None です")
+    token = _fingerprint_cache_var.set(cache)
+    try:
+        yield
+    finally:
+        _fingerprint_cache_var.reset(token)
+
+
+__all__ = [
+    "FingerprintCache",
+    "FingerprintCacheEntry",
+    "current_fingerprint_cache",
+    "default_fingerprint_cache_directory",
+    "fingerprint_cache_context",
+]
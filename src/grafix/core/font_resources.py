@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import os
 import threading
 from collections import OrderedDict
@@ -15,6 +16,12 @@ from typing import Any, Generic, TypeVar
 import numpy as np
 
 from grafix.core.font_resolver import resolve_font_path
+from grafix.core.glyph_outline_cache import (
+    CONTOUR_CLOSED,
+    EMPTY_GLYPH_OUTLINE,
+    GlyphOutline,
+    current_glyph_outline_cache,
+)
 from grafix.core.runtime_config import RuntimeConfig
 from grafix.core.value_validation import exact_integer
 
@@ -25,6 +32,7 @@ _DEFAULT_MAX_GLYPH_COMMANDS = 4096
 _DEFAULT_MAX_GLYPH_POLYLINES = 256
 _DEFAULT_MAX_GLYPH_POLYLINE_BYTES = 32 * 1024 * 1024
 _DIGEST_LENGTH = 64
+_GLYPH_OUTLINE_KEY_VERSION = "grafix.glyph-outline.v1"
 
 _KeyT = TypeVar("_KeyT", bound=Hashable)
 _ValueT = TypeVar("_ValueT")
@@ -236,44 +244,61 @@ def _glyph_polyline_bytes(value: tuple[np.ndarray, ...]) -> int:
     return sum(int(polyline.nbytes) for polyline in value)
 
 
-def _glyph_commands_to_polylines_font_units(
-    glyph_commands: Iterable[tuple[str, tuple]],
-) -> tuple[np.ndarray, ...]:
-    """RecordingPen command を配置前の read-only font-unit 輪郭へ変換する。"""
+def _glyph_outline_polylines_font_units(outline: GlyphOutline) -> tuple[np.ndarray, ...]:
+    """平坦化済み輪郭を配置前の read-only font-unit 輪郭（y 下向き float32）へ変換する。"""
 
+    coords = outline.coords
+    offsets = outline.contour_offsets.tolist()
     polylines: list[np.ndarray] = []
-    current: list[list[float]] = []
-
-    def flush(*, close: bool) -> None:
-        nonlocal current
-        if not current:
-            return
-        if close and len(current) > 1 and current[0] != current[-1]:
-            current.append(current[0].copy())
-        array = np.asarray(current, dtype=np.float32)
+    for index, closure in enumerate(outline.contour_closures.tolist()):
+        contour = coords[offsets[index] : offsets[index + 1]]
+        if contour.shape[0] == 0:
+            continue
+        if (
+            closure == CONTOUR_CLOSED
+            and contour.shape[0] > 1
+            and bool(np.any(contour[0] != contour[-1]))
+        ):
+            contour = np.concatenate((contour, contour[:1]))
+        array = contour.astype(np.float32)
         array[:, 1] *= -1.0
         array.setflags(write=False)
         polylines.append(array)
-        current = []
-
-    for command, arguments in glyph_commands:
-        if command == "moveTo":
-            flush(close=False)
-            x, y = arguments[0]
-            current.append([float(x), float(y)])
-        elif command == "lineTo":
-            x, y = arguments[0]
-            current.append([float(x), float(y)])
-        elif command == "closePath":
-            flush(close=True)
-    flush(close=False)
     return tuple(polylines)
 
 
+def _glyph_outline_cache_key(
+    fingerprint: FontAssetFingerprint,
+    glyph_name: str,
+    segment_length: int,
+) -> str:
+    """on-disk glyph cache の key。
+
+    輪郭を決めるのは font の内容と face だけなので、path と stat は含めない。同じ
+    font を別の場所へ置いても entry を共有できる。
+    """
+
+    from grafix.core.primitives._text_flatten import flattener_identity
+
+    payload = json.dumps(
+        [
+            _GLYPH_OUTLINE_KEY_VERSION,
+            flattener_identity(),
+            fingerprint.content_digest,
+            fingerprint.face_index,
+            glyph_name,
+            segment_length,
+        ],
+        ensure_ascii=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("ascii")).hexdigest()
+
+
 class TextRenderer:
     """一 session の TTFont・glyph outline を bounded に再利用する。"""
 
-    __slots__ = ("_closed", "_fonts", "_glyph_commands", "_glyph_polylines", "_lock")
+    __slots__ = ("_closed", "_fonts", "_glyph_outlines", "_glyph_polylines", "_lock")
 
     def __init__(
         self,
@@ -289,9 +314,10 @@ class TextRenderer:
             maxsize=max_fonts,
             on_evict=lambda opened: opened.close(),
         )
-        self._glyph_commands = _BoundedLru[tuple[FontAssetFingerprint, str, float], tuple](
-            maxsize=max_glyph_commands
-        )
+        # 平坦化済み輪郭。RecordingPen 互換 command は要求時にここから組み立てる。
+        self._glyph_outlines = _BoundedLru[
+            tuple[FontAssetFingerprint, str, float], GlyphOutline
+        ](maxsize=max_glyph_commands)
         self._glyph_polylines = _BoundedLru[
             tuple[FontAssetFingerprint, str, float], tuple[np.ndarray, ...]
         ](
@@ -341,16 +367,16 @@ class TextRenderer:
             self._fonts.set(lease.fingerprint, opened)
             return font
 
-    def get_glyph_commands(
+    def _glyph_outline(
         self,
         *,
         char: str,
         lease: ResolvedFontLease,
         flat_seg_len_units: float,
-        tt_font: Any | None = None,
-        cmap: Any | None = None,
-    ) -> tuple:
-        """平坦化済みの RecordingPen 互換 command を返す。"""
+        tt_font: Any | None,
+        cmap: Any | None,
+    ) -> GlyphOutline:
+        """平坦化済み輪郭を session LRU・on-disk cache・平坦化の順に探す。"""
 
         if type(char) is not str or len(char) != 1:
             raise ValueError("char は1文字の str です")
@@ -360,49 +386,101 @@ class TextRenderer:
         key = (lease.fingerprint, char, segment_length)
         with self._lock:
             self._ensure_open()
-            cached = self._glyph_commands.get(key)
+            cached = self._glyph_outlines.get(key)
             if cached is not None:
                 return cached
 
-            from fontTools.pens.recordingPen import (  # type: ignore[import-untyped]
-                DecomposingRecordingPen,
-            )
-
-            from grafix.core.primitives._text_flatten import flatten_recording
-
             font = self.get_font(lease) if tt_font is None else tt_font
             cmap_value = font.getBestCmap() if cmap is None else cmap
             if cmap_value is None:
-                self._glyph_commands.set(key, ())
-                return ()
+                self._glyph_outlines.set(key, EMPTY_GLYPH_OUTLINE)
+                return EMPTY_GLYPH_OUTLINE
 
             glyph_name = cmap_value.get(ord(char))
             if glyph_name is None:
                 if char.isascii() and char.isprintable():
                     glyph_name = char
                 else:
-                    self._glyph_commands.set(key, ())
-                    return ()
+                    self._glyph_outlines.set(key, EMPTY_GLYPH_OUTLINE)
+                    return EMPTY_GLYPH_OUTLINE
+
+            flatten_length = int(round(float(flat_seg_len_units)))
+            disk_cache = current_glyph_outline_cache()
+            disk_key: str | None = None
+            if disk_cache is not None:
+                disk_key = _glyph_outline_cache_key(
+                    lease.fingerprint,
+                    str(glyph_name),
+                    flatten_length,
+                )
+                stored = disk_cache.load(disk_key)
+                if stored is not None:
+                    self._glyph_outlines.set(key, stored)
+                    return stored
+
+            outline = self._flatten_glyph(
+                font,
+                glyph_name,
+                approximate_segment_length=flatten_length,
+            )
+            if outline is None:
+                self._glyph_outlines.set(key, EMPTY_GLYPH_OUTLINE)
+                return EMPTY_GLYPH_OUTLINE
+            if disk_cache is not None and disk_key is not None:
+                disk_cache.store(disk_key, outline)
+            self._glyph_outlines.set(key, outline)
+            return outline
+
+    @staticmethod
+    def _flatten_glyph(
+        font: Any,
+        glyph_name: str,
+        *,
+        approximate_segment_length: int,
+    ) -> GlyphOutline | None:
+        from fontTools.pens.recordingPen import (  # type: ignore[import-untyped]
+            DecomposingRecordingPen,
+        )
 
-            glyph_set = font.getGlyphSet()
-            glyph = glyph_set.get(glyph_name)
-            if glyph is None:
-                self._glyph_commands.set(key, ())
-                return ()
+        from grafix.core.primitives._text_flatten import flatten_glyph_outline
 
-            recording = DecomposingRecordingPen(glyph_set, reverseFlipped=True)
-            try:
-                glyph.draw(recording)
-            except recording.MissingComponentError:  # type: ignore[attr-defined]
-                self._glyph_commands.set(key, ())
-                return ()
-
-            result = flatten_recording(
-                recording,
-                approximate_segment_length=int(round(float(flat_seg_len_units))),
+        glyph_set = font.getGlyphSet()
+        glyph = glyph_set.get(glyph_name)
+        if glyph is None:
+            return None
+
+        recording = DecomposingRecordingPen(glyph_set, reverseFlipped=True)
+        try:
+            glyph.draw(recording)
+        except recording.MissingComponentError:  # type: ignore[attr-defined]
+            return None
+        return flatten_glyph_outline(
+            recording,
+            approximate_segment_length=approximate_segment_length,
+        )
+
+    def get_glyph_commands(
+        self,
+        *,
+        char: str,
+        lease: ResolvedFontLease,
+        flat_seg_len_units: float,
+        tt_font: Any | None = None,
+        cmap: Any | None = None,
+    ) -> tuple:
+        """平坦化済みの RecordingPen 互換 command を返す。"""
+
+        from grafix.core.primitives._text_flatten import outline_commands
+
+        return outline_commands(
+            self._glyph_outline(
+                char=char,
+                lease=lease,
+                flat_seg_len_units=flat_seg_len_units,
+                tt_font=tt_font,
+                cmap=cmap,
             )
-            self._glyph_commands.set(key, result)
-            return result
+        )
 
     def get_glyph_polylines(
         self,
@@ -422,14 +500,14 @@ class TextRenderer:
             cached = self._glyph_polylines.get(key)
             if cached is not None:
                 return cached
-            commands = self.get_glyph_commands(
+            outline = self._glyph_outline(
                 char=char,
                 lease=lease,
                 flat_seg_len_units=flat_seg_len_units,
                 tt_font=tt_font,
                 cmap=cmap,
             )
-            polylines = _glyph_commands_to_polylines_font_units(commands)
+            polylines = _glyph_outline_polylines_font_units(outline)
             self._glyph_polylines.set(key, polylines)
             return polylines
 
@@ -439,7 +517,7 @@ class TextRenderer:
         with self._lock:
             return _TextRendererStats(
                 fonts=len(self._fonts),
-                glyph_commands=len(self._glyph_commands),
+                glyph_commands=len(self._glyph_outlines),
                 glyph_polylines=len(self._glyph_polylines),
                 glyph_polyline_bytes=self._glyph_polylines.byte_size,
             )
@@ -451,7 +529,7 @@ class TextRenderer:
             if self._closed:
                 return
             self._glyph_polylines.clear()
-            self._glyph_commands.clear()
+            self._glyph_outlines.clear()
             self._fonts.clear()
 
     def close(self) -> None:
@@ -462,7 +540,7 @@ class TextRenderer:
                 return
             self._closed = True
             self._glyph_polylines.clear()
-            self._glyph_commands.clear()
+            self._glyph_outlines.clear()
             self._fonts.clear()
 
 
@@ -4,6 +4,9 @@
 
 from __future__ import annotations
 
+import marshal
+import threading
+import weakref
 from dataclasses import dataclass
 from enum import Enum
 from hashlib import blake2b
@@ -12,6 +15,9 @@ from struct import Struct
 from types import NotImplementedType
 from typing import Any, Iterable, Literal, Mapping, Sequence, cast
 
+import numpy as np
+
+from grafix.core.array_argument import ArrayArgument
 from grafix.core.operation_declaration import CachePolicy, EvaluationOpRef
 
 GeometryId = str
@@ -30,11 +36,25 @@ _FLOAT64 = Struct(">d")
 _PACK_UINT64 = _UINT64.pack
 _PACK_FLOAT64 = _FLOAT64.pack
 _REPR_PERSON = b"grafix.geom.v3r"
+_TAG_ARRAY = ord("a")
 _TAG_FLOAT = ord("f")
 _TAG_INT = ord("i")
 _TAG_NONE = ord("n")
 _TAG_STR = ord("s")
 _TAG_TUPLE = ord("t")
+_INTERN_MARSHAL_VERSION = 2
+
+_InternKey = tuple[
+    str,
+    EvaluationOpRef | None,
+    str,
+    tuple[GeometryId, ...],
+    bytes,
+]
+_INTERNED_GEOMETRIES: weakref.WeakValueDictionary[_InternKey, "Geometry"] = (
+    weakref.WeakValueDictionary()
+)
+_INTERN_LOCK = threading.Lock()
 
 
 def _append_frame(buffer: bytearray, payload: bytes) -> None:
@@ -80,6 +100,10 @@ def _append_signature_value(buffer: bytearray, value: Any) -> None:
         for item in value:
             _append_signature_value(buffer, item)
         return
+    if value_type is ArrayArgument:
+        buffer.append(_TAG_ARRAY)
+        _append_frame(buffer, value.digest.encode("ascii"))
+        return
     raise TypeError(f"署名に使用できない値型: {type(value)!r}")
 
 
@@ -157,6 +181,11 @@ def normalize_args(params: Mapping[str, Any]) -> tuple[tuple[str, Any], ...]:
     -------
     tuple[tuple[str, Any], ...]
         キーでソートされた (名前, 正規化値) のタプル列。
+
+    Notes
+    -----
+    最上位の値が float32/float64 の ``np.ndarray`` なら :class:`ArrayArgument` に
+    固定する。署名は内容 digest だけを使い、evaluator には read-only view を渡す。
     """
     if not isinstance(params, Mapping):
         raise TypeError("Geometry 引数は mapping である必要がある")
@@ -168,7 +197,13 @@ def normalize_args(params: Mapping[str, Any]) -> tuple[tuple[str, Any], ...]:
     items: list[tuple[str, Any]] = []
     for name in sorted(names):
         raw_value = params[name]
-        normalized = _normalize_value(raw_value)
+        # 配列は最上位の引数値としてだけ受け付け、要素 tuple へ展開せず digest で扱う。
+        if type(raw_value) is ArrayArgument or (
+            isinstance(raw_value, np.ndarray) and raw_value.dtype.kind == "f"
+        ):
+            normalized = ArrayArgument(raw_value)
+        else:
+            normalized = _normalize_value(raw_value)
         items.append((name, normalized))
     return tuple(items)
 
@@ -238,7 +273,37 @@ def compute_geometry_id(
     ).hexdigest()
 
 
-@dataclass(frozen=True, slots=True, eq=False, repr=False, init=False)
+def _intern_args_key(args: tuple[tuple[str, Any], ...]) -> bytes | None:
+    """canonical args の型まで区別する interning 用 bytes を返す。
+
+    tuple の ``==`` は ``True == 1 == 1.0`` を同一視するため、型を保存する
+    marshal 表現を key にする。参照共有で bytes が揺れない version 2 を使う。
+    最上位の :class:`ArrayArgument` は、canonical 値に現れない ``bytes`` の
+    digest へ置き換える。marshal できない値は ``None``（interning しない）。
+    """
+
+    try:
+        return marshal.dumps(args, _INTERN_MARSHAL_VERSION)
+    except ValueError:
+        pass
+    replaced = tuple(
+        (name, value.digest.encode("ascii") if type(value) is ArrayArgument else value)
+        for name, value in args
+    )
+    try:
+        return marshal.dumps(replaced, _INTERN_MARSHAL_VERSION)
+    except ValueError:
+        return None
+
+
+@dataclass(
+    frozen=True,
+    slots=True,
+    eq=False,
+    repr=False,
+    init=False,
+    weakref_slot=True,
+)
 class Geometry:
     """幾何レシピを表す不変 Geometry ノード。
 
@@ -261,6 +326,8 @@ class Geometry:
     外部入力は :meth:`create` で正規化し、core 内で検証済みの引数だけを
     :meth:`_from_canonical_args` へ渡す。どちらも ``id`` は ``op``、exact
     ``operation`` reference、``inputs``、``args`` の正規化済み内容から必ず計算する。
+    同じ内容の node が生存していれば、:meth:`_from_canonical_args` は弱参照
+    intern table からその node をそのまま返す。
     """
 
     id: GeometryId
@@ -385,7 +452,12 @@ class Geometry:
         args: tuple[tuple[str, Any], ...],
         cache_policy: CachePolicy,
     ) -> "Geometry":
-        """core が検証・正規化済みの recipe から Geometry を一度で生成する。"""
+        """core が検証・正規化済みの recipe から Geometry を一度で生成する。
+
+        op/operation/cache_policy/入力 id/args が型まで一致する node が生存して
+        いれば、署名計算を省いて既存 node を返す。table は弱参照だけを持つため、
+        draw() が毎フレーム同じ recipe を組み直しても node 数以上には増えない。
+        """
 
         if type(op) is not str:
             raise TypeError("Geometry op は exact str である必要がある")
@@ -404,7 +476,23 @@ class Geometry:
             type(item) is not Geometry for item in inputs
         ):
             raise TypeError("Geometry inputs は Geometry の列である必要がある")
-        if type(args) is not tuple or any(
+        if type(args) is not tuple:
+            raise TypeError("Geometry args は canonical (name, value) tuple が必要です")
+        args_key = _intern_args_key(args)
+        intern_key: _InternKey | None = None
+        if args_key is not None and type(cache_policy) is str:
+            intern_key = (
+                op,
+                operation,
+                cache_policy,
+                tuple(item.id for item in inputs),
+                args_key,
+            )
+            # key が型まで一致する node は以降の検証を通過済みである。
+            existing = _INTERNED_GEOMETRIES.get(intern_key)
+            if existing is not None:
+                return existing
+        if any(
             type(item) is not tuple
             or len(item) != 2
             or type(item[0]) is not str
@@ -457,6 +545,10 @@ class Geometry:
             and all(item.fully_bound for item in inputs),
         )
         object.__setattr__(result, "operation_refs", sorted_refs)
+        if intern_key is not None:
+            with _INTERN_LOCK:
+                # 並行生成で先に登録された node があれば、そちらに揃える。
+                return _INTERNED_GEOMETRIES.setdefault(intern_key, result)
         return result
 
     @staticmethod
@@ -0,0 +1,401 @@
+"""realize 済み layer 列を保存する compact binary container。
+
+SVG/G-code は人や機械向けのテキストで、読み戻すと parse と float 変換が要る。この
+container は layer ごとの style と packed geometry（float32 ``(N, 3)`` coords・int32
+offsets）をそのまま並べ、無圧縮なら ``np.memmap`` の view として読み戻す。重い
+scene を job 間で使い回したり、下流 tool へ SVG parse なしで渡すための形式。
+
+形式（すべて little-endian）::
+
+    header   magic ``GRAFIXGB`` | version u16 | codec u16
+    layer    coords section | offsets section | name（UTF-8）   … layer 数だけ
+    table    layer entry（style・件数・section 位置）            … layer 数だけ
+    trailer  table 位置 u64 | layer 数 u32 | SHA-256 | magic
+
+layer 数と digest を末尾に置くので、writer は layer 列を 1 度だけ前から流して書ける。
+section は 64 byte 境界に揃え、memmap の view がそのまま aligned になる。path の
+確保や publish は export 側が行い、この module は stream と file の読み書きだけを扱う。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Final, Literal
+
+import numpy as np
+
+from grafix.core.value_validation import finite_real, rgb01_tuple
+
+GeometryFileCompression = Literal["none", "zlib"]
+
+_MAGIC: Final = b"GRAFIXGB"
+_FORMAT_VERSION: Final = 1
+_CODECS: Final[tuple[GeometryFileCompression, ...]] = ("none", "zlib")
+_HEADER: Final = struct.Struct("<8sHH")
+# color r/g/b・thickness、頂点数・polyline 数、coords/offsets/name の (位置, byte 数)。
+_LAYER_ENTRY: Final = struct.Struct("<4d2Q6Q")
+_TRAILER: Final = struct.Struct("<QI32s8s")
+_ALIGNMENT: Final = 64
+_NO_NAME: Final = 2**64 - 1
+_ZLIB_LEVEL: Final = 6
+_VERIFY_CHUNK_BYTES: Final = 1 << 24
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class GeometryFileLayer:
+    """container 内の 1 layer。
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        float32 ``(N, 3)`` の頂点配列。
+    offsets : np.ndarray
+        int32 ``(M + 1,)`` の polyline 境界配列。
+    color : tuple[float, float, float]
+        0..1 RGB の線色。
+    thickness : float
+        正の線幅。
+    name : str | None, optional
+        layer 名。
+
+    Notes
+    -----
+    配列は read-only の contiguous array として保持する。書き込み可能な配列は copy
+    してから凍結し、memmap の read-only view はそのまま共有する。
+    """
+
+    coords: np.ndarray
+    offsets: np.ndarray
+    color: tuple[float, float, float]
+    thickness: float
+    name: str | None = None
+
+    def __post_init__(self) -> None:
+        coords = _readonly(self.coords, np.float32, name="coords")
+        offsets = _readonly(self.offsets, np.int32, name="offsets")
+        if coords.ndim != 2 or coords.shape[1] != 3:
+            raise ValueError("coords は (N, 3) 配列である必要があります")
+        if offsets.ndim != 1 or offsets.shape[0] < 1:
+            raise ValueError("offsets は (M + 1,) 配列である必要があります")
+        if (
+            int(offsets[0]) != 0
+            or int(offsets[-1]) != coords.shape[0]
+            or bool(np.any(np.diff(offsets) < 0))
+        ):
+            raise ValueError("offsets は 0 から頂点数までの単調増加列です")
+        if self.name is not None and type(self.name) is not str:
+            raise TypeError("name は str または None である必要があります")
+        object.__setattr__(self, "coords", coords)
+        object.__setattr__(self, "offsets", offsets)
+        object.__setattr__(self, "color", rgb01_tuple(self.color, name="color"))
+        object.__setattr__(
+            self,
+            "thickness",
+            finite_real(self.thickness, name="thickness", minimum=0.0, minimum_inclusive=False),
+        )
+
+    @property
+    def vertex_count(self) -> int:
+        return int(self.coords.shape[0])
+
+    @property
+    def line_count(self) -> int:
+        return int(self.offsets.shape[0] - 1)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class GeometryFile:
+    """読み込んだ container。
+
+    Parameters
+    ----------
+    layers : tuple[GeometryFileLayer, ...]
+        保存順の layer 列。
+    compression : {"none", "zlib"}
+        section の圧縮方式。``"none"`` の layer 配列は file の memmap view。
+    digest : str
+        trailer より前の全 byte の SHA-256（lowercase hex）。内容の identity に使う。
+    """
+
+    layers: tuple[GeometryFileLayer, ...]
+    compression: GeometryFileCompression
+    digest: str
+
+
+def _readonly(value: object, dtype: type[np.generic], *, name: str) -> np.ndarray:
+    if not isinstance(value, np.ndarray):
+        raise TypeError(f"{name} は numpy.ndarray である必要があります")
+    if value.dtype == dtype and value.flags.c_contiguous and not value.flags.writeable:
+        return value.view(np.ndarray) if type(value) is not np.ndarray else value
+    array = np.array(value, dtype=dtype, order="C", copy=True)
+    array.setflags(write=False)
+    return array
+
+
+def _compression(value: object) -> GeometryFileCompression:
+    if type(value) is not str or value not in _CODECS:
+        raise ValueError(f"compression は {_CODECS!r} のいずれかである必要があります")
+    return value  # type: ignore[return-value]
+
+
+def _encode_coords(
+    coords: np.ndarray,
+    compression: GeometryFileCompression,
+) -> bytes | memoryview:
+    """coords section を作る。zlib では XOR delta と byte 分割を掛けてから圧縮する。"""
+
+    little = coords.astype("<f4", copy=False)
+    if compression == "none":
+        return memoryview(little.reshape(-1).view(np.uint8))
+    # 隣接頂点は近いので、float32 の bit 列を直前頂点と XOR すると上位 byte が 0 に
+    # 揃う。byte 位置ごとの面へ並べ替えると 0 が連続し、deflate がよく効く。
+    # bit 列の XOR なので可逆（float の差分と違い丸めが入らない）。
+    bits = little.view("<u4")
+    delta = bits.copy()
+    delta[1:] ^= bits[:-1]
+    planes = delta.view(np.uint8).reshape(-1, 3, 4).transpose(1, 2, 0)
+    return zlib.compress(np.ascontiguousarray(planes).tobytes(), _ZLIB_LEVEL)
+
+
+def _decode_coords(payload: bytes, vertex_count: int) -> np.ndarray:
+    raw = zlib.decompress(payload)
+    if len(raw) != vertex_count * 12:
+        raise ValueError("geometry file の coords section が頂点数と一致しません")
+    planes = np.frombuffer(raw, dtype=np.uint8).reshape(3, 4, vertex_count)
+    delta = np.ascontiguousarray(planes.transpose(2, 0, 1)).view("<u4").reshape(vertex_count, 3)
+    coords = np.bitwise_xor.accumulate(delta, axis=0).view("<f4").astype(np.float32, copy=False)
+    coords.setflags(write=False)
+    return coords
+
+
+def _encode_offsets(
+    offsets: np.ndarray,
+    compression: GeometryFileCompression,
+) -> bytes | memoryview:
+    if compression == "none":
+        return memoryview(offsets.astype("<i4", copy=False).view(np.uint8))
+    # polyline 長の列にすると値が小さく揃い、圧縮しやすい。
+    return zlib.compress(np.diff(offsets).astype("<u4").tobytes(), _ZLIB_LEVEL)
+
+
+def _decode_offsets(payload: bytes, line_count: int) -> np.ndarray:
+    raw = zlib.decompress(payload)
+    if len(raw) != line_count * 4:
+        raise ValueError("geometry file の offsets section が polyline 数と一致しません")
+    offsets = np.zeros(line_count + 1, dtype=np.int64)
+    np.cumsum(np.frombuffer(raw, dtype="<u4"), out=offsets[1:])
+    if line_count and int(offsets[-1]) > np.iinfo(np.int32).max:
+        raise ValueError("geometry file の offsets が int32 の範囲を超えています")
+    result = offsets.astype(np.int32)
+    result.setflags(write=False)
+    return result
+
+
+class _DigestWriter:
+    """書いた byte 数と SHA-256 を追跡する薄い stream wrapper。"""
+
+    __slots__ = ("_hasher", "_stream", "position")
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+        self._hasher = hashlib.sha256()
+        self.position = 0
+
+    def write(self, payload: bytes | memoryview) -> int:
+        self._stream.write(payload)
+        self._hasher.update(payload)
+        start = self.position
+        self.position += len(payload)
+        return start
+
+    def align(self) -> None:
+        padding = -self.position % _ALIGNMENT
+        if padding:
+            self.write(b"\0" * padding)
+
+    def digest(self) -> bytes:
+        return self._hasher.digest()
+
+
+def write_geometry_file(
+    stream: BinaryIO,
+    layers: Iterable[GeometryFileLayer],
+    *,
+    compression: GeometryFileCompression = "none",
+) -> str:
+    """layer 列を binary stream へ書き、内容 digest を返す。
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        書き込み先。先頭から順に書くだけで seek は使わない。
+    layers : Iterable[GeometryFileLayer]
+        保存する layer 列。受け取った順に 1 layer ずつ書く。
+    compression : {"none", "zlib"}, optional
+        ``"none"`` は memmap で読める無圧縮 section、``"zlib"`` は XOR delta と
+        byte 分割の後に deflate で圧縮する（読み込み時は展開して memory に置く）。
+
+    Returns
+    -------
+    str
+        trailer より前の全 byte の SHA-256（lowercase hex）。
+    """
+
+    codec = _compression(compression)
+    writer = _DigestWriter(stream)
+    writer.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, _CODECS.index(codec)))
+    entries: list[bytes] = []
+    for layer in layers:
+        if type(layer) is not GeometryFileLayer:
+            raise TypeError("layers の要素は exact GeometryFileLayer である必要があります")
+        writer.align()
+        coords_payload = _encode_coords(layer.coords, codec)
+        coords_at = writer.write(coords_payload)
+        writer.align()
+        offsets_payload = _encode_offsets(layer.offsets, codec)
+        offsets_at = writer.write(offsets_payload)
+        if layer.name is None:
+            name_at, name_nbytes = _NO_NAME, 0
+        else:
+            name_payload = layer.name.encode("utf-8")
+            name_at, name_nbytes = writer.write(name_payload), len(name_payload)
+        entries.append(
+            _LAYER_ENTRY.pack(
+                *layer.color,
+                layer.thickness,
+                layer.vertex_count,
+                layer.line_count,
+                coords_at,
+                len(coords_payload),
+                offsets_at,
+                len(offsets_payload),
+                name_at,
+                name_nbytes,
+            )
+        )
+    writer.align()
+    table_at = writer.write(b"".join(entries))
+    digest = writer.digest()
+    stream.write(_TRAILER.pack(table_at, len(entries), digest, _MAGIC))
+    return digest.hex()
+
+
+def read_geometry_file(path: str | Path, *, verify: bool = False) -> GeometryFile:
+    """`write_geometry_file` が書いた file を読む。
+
+    Parameters
+    ----------
+    path : str or Path
+        読み込む file。
+    verify : bool, optional
+        True なら trailer の SHA-256 を全 byte で照合する。既定では section の
+        範囲と offsets だけを検査し、無圧縮 coords は触れた page だけ読む。
+
+    Returns
+    -------
+    GeometryFile
+        layer 列。無圧縮なら配列は read-only memmap の view で、file を開いたまま
+        保持する。
+
+    Raises
+    ------
+    ValueError
+        形式が違う・壊れている、または ``verify`` で digest が一致しない場合。
+    """
+
+    if type(verify) is not bool:
+        raise TypeError("verify は bool である必要があります")
+    file_path = Path(path)
+    size = file_path.stat().st_size
+    if size < _HEADER.size + _TRAILER.size:
+        raise ValueError(f"geometry file が短すぎます: {file_path}")
+    mapped = np.memmap(file_path, dtype=np.uint8, mode="r")
+    magic, version, codec_index = _HEADER.unpack_from(mapped)
+    if magic != _MAGIC or version != _FORMAT_VERSION or codec_index >= len(_CODECS):
+        raise ValueError(f"geometry file の形式が違います: {file_path}")
+    body_end = size - _TRAILER.size
+    table_at, layer_count, digest, end_magic = _TRAILER.unpack_from(mapped, body_end)
+    table_end = table_at + layer_count * _LAYER_ENTRY.size
+    if end_magic != _MAGIC or table_at < _HEADER.size or table_end != body_end:
+        raise ValueError(f"geometry file の trailer が壊れています: {file_path}")
+    if verify:
+        hasher = hashlib.sha256()
+        for start in range(0, body_end, _VERIFY_CHUNK_BYTES):
+            hasher.update(mapped[start : min(body_end, start + _VERIFY_CHUNK_BYTES)])
+        if hasher.digest() != digest:
+            raise ValueError(f"geometry file の digest が内容と一致しません: {file_path}")
+
+    codec = _CODECS[codec_index]
+    layers = tuple(
+        _read_layer(mapped, table_at + index * _LAYER_ENTRY.size, codec, limit=table_at)
+        for index in range(layer_count)
+    )
+    return GeometryFile(layers=layers, compression=codec, digest=digest.hex())
+
+
+def _read_layer(
+    mapped: np.ndarray,
+    entry_at: int,
+    codec: GeometryFileCompression,
+    *,
+    limit: int,
+) -> GeometryFileLayer:
+    (
+        red,
+        green,
+        blue,
+        thickness,
+        vertex_count,
+        line_count,
+        coords_at,
+        coords_nbytes,
+        offsets_at,
+        offsets_nbytes,
+        name_at,
+        name_nbytes,
+    ) = _LAYER_ENTRY.unpack_from(mapped, entry_at)
+
+    def section(start: int, nbytes: int) -> np.ndarray:
+        if start < _HEADER.size or start + nbytes > limit:
+            raise ValueError("geometry file の section が file 範囲外を指しています")
+        return mapped[start : start + nbytes].view(np.ndarray)
+
+    coords_bytes = section(coords_at, coords_nbytes)
+    offsets_bytes = section(offsets_at, offsets_nbytes)
+    if codec == "none":
+        if coords_nbytes != vertex_count * 12 or offsets_nbytes != (line_count + 1) * 4:
+            raise ValueError("geometry file の section 長が件数と一致しません")
+        if coords_at % 4 or offsets_at % 4:
+            raise ValueError("geometry file の section が 4 byte 境界にありません")
+        coords = coords_bytes.view("<f4").reshape(vertex_count, 3)
+        offsets = offsets_bytes.view("<i4")
+    else:
+        coords = _decode_coords(coords_bytes.tobytes(), vertex_count)
+        offsets = _decode_offsets(offsets_bytes.tobytes(), line_count)
+    name = None
+    if name_at != _NO_NAME:
+        try:
+            name = section(name_at, name_nbytes).tobytes().decode("utf-8")
+        except UnicodeDecodeError as exc:
+            raise ValueError("geometry file の layer 名が UTF-8 ではありません") from exc
+    return GeometryFileLayer(
+        coords=coords,
+        offsets=offsets,
+        color=(red, green, blue),
+        thickness=thickness,
+        name=name,
+    )
+
+
+__all__ = [
+    "GeometryFile",
+    "GeometryFileCompression",
+    "GeometryFileLayer",
+    "read_geometry_file",
+    "write_geometry_file",
+]
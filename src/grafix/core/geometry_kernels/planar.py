@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+import contextlib
 import math
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, Sequence
+from contextvars import ContextVar
 from dataclasses import dataclass
 
 import numpy as np
@@ -845,3 +851,267 @@ def canonical_planar_frame(
         rank=2,
         status="planar",
     )
+
+
+_SHARED_FRAME_MAX_ENTRIES = 256
+"""shared frame memo が保持する frame / 局所座標 entry の最大件数。"""
+
+_SHARED_FRAME_MAX_BYTES = 64 * 1024 * 1024
+"""shared frame memo が保持する局所座標配列の最大 byte 数。"""
+
+
+@dataclass(frozen=True, slots=True)
+class SharedFrameStats:
+    """shared frame memo の統計スナップショット。"""
+
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+
+
+@dataclass(frozen=True, slots=True)
+class _SharedFrameEntry:
+    anchors: tuple[weakref.ref[np.ndarray], ...]
+    frame: PlanarFrame
+    local: np.ndarray | None
+
+    @property
+    def nbytes(self) -> int:
+        return 0 if self.local is None else int(self.local.nbytes)
+
+
+def _is_immutable_snapshot(array: object) -> bool:
+    """RealizedGeometry が所有する bytes-backed snapshot なら True。
+
+    snapshot は内容が変わらないため、配列 identity を内容の key として使える。
+    writeable を戻せる配列や共有 memory 上の view は対象にしない。
+    """
+
+    current = array
+    while type(current) is np.ndarray:
+        if current.flags.writeable:
+            return False
+        current = current.base
+    return type(current) is bytes
+
+
+_content_keys: ContextVar[dict[int, tuple[np.ndarray, Hashable]] | None] = ContextVar(
+    "grafix_planar_content_keys",
+    default=None,
+)
+
+
+@contextlib.contextmanager
+def planar_content_key_context(
+    bindings: Sequence[tuple[np.ndarray, Hashable]],
+) -> Iterator[None]:
+    """入力配列へ内容を表す key を結び付け、shared frame memo の key にする。
+
+    realize は effect 入力の coords / offsets へ GeometryCacheKey 由来の key を渡す。
+    compact tier の展開結果や InstancedGeometry の展開配列は評価ごとに別配列になるが、
+    同じ key なら内容も同じなので frame と局所座標を共有できる。
+    """
+
+    mapping = {id(array): (array, key) for array, key in bindings}
+    token = _content_keys.set(mapping or None)
+    try:
+        yield
+    finally:
+        _content_keys.reset(token)
+
+
+def _snapshot_token(array: np.ndarray) -> tuple[Hashable, np.ndarray | None] | None:
+    """memo key に使う識別子と、identity で照合する anchor を返す。
+
+    内容 key が結び付いた配列は anchor なし、immutable snapshot は id と配列自身を返す。
+    どちらでもない配列は memo しないため None を返す。
+    """
+
+    bound = _content_keys.get()
+    if bound is not None:
+        item = bound.get(id(array))
+        if item is not None and item[0] is array:
+            return ("content", item[1]), None
+    if _is_immutable_snapshot(array):
+        return id(array), array
+    return None
+
+
+class _SharedFrameMemo:
+    """内容 key または immutable snapshot の identity を key にした bounded LRU。
+
+    同じ RealizedGeometry を入力に持つ effect（fill と clip の mask、parameter 編集で
+    再評価される effect など）が frame 推定と局所座標変換を共有する。identity key の
+    配列は weakref で照合し、解放後に同じ id を得た別配列へ古い結果を返さない。
+    """
+
+    def __init__(self, *, max_entries: int, max_bytes: int) -> None:
+        self._max_entries = int(max_entries)
+        self._max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[object, ...], _SharedFrameEntry] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(
+        self,
+        key: tuple[object, ...],
+        anchors: tuple[np.ndarray, ...],
+    ) -> _SharedFrameEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and any(
+                ref() is not anchor for ref, anchor in zip(entry.anchors, anchors, strict=True)
+            ):
+                self._bytes -= self._entries.pop(key).nbytes
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def store(
+        self,
+        key: tuple[object, ...],
+        anchors: tuple[np.ndarray, ...],
+        *,
+        frame: PlanarFrame,
+        local: np.ndarray | None = None,
+    ) -> None:
+        entry = _SharedFrameEntry(
+            anchors=tuple(weakref.ref(anchor) for anchor in anchors),
+            frame=frame,
+            local=local,
+        )
+        if entry.nbytes > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            while self._entries and (
+                len(self._entries) >= self._max_entries
+                or self._bytes + entry.nbytes > self._max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+            self._entries[key] = entry
+            self._bytes += entry.nbytes
+
+    def stats(self) -> SharedFrameStats:
+        with self._lock:
+            return SharedFrameStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_shared_frames = _SharedFrameMemo(
+    max_entries=_SHARED_FRAME_MAX_ENTRIES,
+    max_bytes=_SHARED_FRAME_MAX_BYTES,
+)
+
+
+def shared_planar_frame(
+    points: np.ndarray,
+    offsets: np.ndarray | None = None,
+    *,
+    canonical: bool = False,
+    allow_linear: bool = False,
+) -> PlanarFrame:
+    """入力 geometry ごとに memo した PlanarFrame を返す。
+
+    ``canonical=False`` は ``PlanarFrame.from_points``、``canonical=True`` は
+    ``canonical_planar_frame`` と同じ frame を返す。``points`` と ``offsets`` が
+    RealizedGeometry の immutable snapshot か、:func:`planar_content_key_context` で
+    内容 key を結び付けた配列のときだけ結果を共有し、それ以外は毎回計算する。
+
+    Parameters
+    ----------
+    points : np.ndarray
+        shape ``(N, 3)`` の world 座標。
+    offsets : np.ndarray or None, default None
+        packed polyline の境界。
+    canonical : bool, default False
+        world 基準へ canonicalize した frame を使うか。
+    allow_linear : bool, default False
+        ``canonical_planar_frame`` の ``allow_linear``。``canonical=True`` のときだけ有効。
+
+    Returns
+    -------
+    PlanarFrame
+        推定した frame。
+    """
+
+    compute: Callable[[], PlanarFrame]
+    if canonical:
+        linear = bool(allow_linear)
+
+        def compute() -> PlanarFrame:
+            return canonical_planar_frame(points, offsets, allow_linear=linear)
+
+        variant: tuple[object, ...] = ("canonical", linear)
+    else:
+        if allow_linear:
+            raise ValueError("allow_linear は canonical=True のときだけ指定できる")
+
+        def compute() -> PlanarFrame:
+            return PlanarFrame.from_points(points, offsets)
+
+        variant = ("estimated",)
+
+    arrays = (points,) if offsets is None else (points, offsets)
+    tokens = [_snapshot_token(array) for array in arrays]
+    if any(token is None for token in tokens):
+        return compute()
+    key = ("frame", *variant, *(token[0] for token in tokens if token is not None))
+    anchors = tuple(
+        token[1] for token in tokens if token is not None and token[1] is not None
+    )
+    entry = _shared_frames.lookup(key, anchors)
+    if entry is not None:
+        return entry.frame
+    frame = compute()
+    _shared_frames.store(key, anchors, frame=frame)
+    return frame
+
+
+def shared_local_coords(frame: PlanarFrame, points: np.ndarray) -> np.ndarray:
+    """``frame.to_local(points)`` を memo し、read-only 配列で返す。
+
+    同じ frame object と、同じ immutable snapshot または内容 key の組だけを共有する。
+    呼び出し側で書き換える場合は copy する。
+    """
+
+    token = _snapshot_token(points)
+    if token is None:
+        local = frame.to_local(points)
+        local.setflags(write=False)
+        return local
+    # frame は entry が保持するため、生存中に id が別 frame へ再利用されない。
+    key = ("local", id(frame), token[0])
+    anchors = () if token[1] is None else (token[1],)
+    entry = _shared_frames.lookup(key, anchors)
+    if entry is not None and entry.frame is frame and entry.local is not None:
+        return entry.local
+    local = frame.to_local(points)
+    local.setflags(write=False)
+    _shared_frames.store(key, anchors, frame=frame, local=local)
+    return local
+
+
+def shared_frame_stats() -> SharedFrameStats:
+    """shared frame memo の process 内累積統計を返す。"""
+
+    return _shared_frames.stats()
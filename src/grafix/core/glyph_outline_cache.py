@@ -0,0 +1,272 @@
+"""平坦化済み glyph 輪郭を process / session 間で共有する on-disk cache。
+
+text primitive は glyph ごとに fontTools の輪郭を線分列へ平坦化する。`TextRenderer`
+の LRU は session 内でしか効かないため、CJK の文字を大量に並べる layout は毎回の
+起動で平坦化をやり直していた。平坦化結果を ``key`` ごとに 1 file として保存し、
+次の session では file を読むだけで済ませる。
+
+key の組み立て（font の内容 identity・glyph 名・分割長・平坦化実装の digest）は
+`grafix.core.font_resources` が行う。この module は輪郭の表現と保存形式・保存先
+だけを扱う。
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import os
+import re
+import struct
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Final
+
+import numpy as np
+
+CONTOUR_OPEN: Final = 0
+CONTOUR_CLOSED: Final = 1
+CONTOUR_ENDED: Final = 2
+
+_MAGIC: Final = b"GRAFIXGO"
+_FORMAT_VERSION: Final = 1
+_HEADER: Final = struct.Struct("<8sIII")
+_DIGEST_PATTERN: Final = re.compile(r"[0-9a-f]{64}")
+_CACHE_DIR_ENV: Final = "GRAFIX_GLYPH_CACHE_DIR"
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class GlyphOutline:
+    """平坦化済みの glyph 輪郭。座標は font unit・y 上向き。
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        全 contour の頂点を連結した ``(N, 2)`` float64。
+    contour_offsets : np.ndarray
+        contour ``i`` が ``coords[offsets[i]:offsets[i + 1]]`` になる ``(C + 1,)`` int64。
+    contour_closures : np.ndarray
+        contour ごとの終端を表す ``(C,)`` uint8。`CONTOUR_CLOSED` は closePath、
+        `CONTOUR_ENDED` は endPath、`CONTOUR_OPEN` は終端 command 無し。
+
+    Notes
+    -----
+    配列は read-only の contiguous array として保持する。書き込み可能な配列は copy
+    してから凍結する。
+    """
+
+    coords: np.ndarray
+    contour_offsets: np.ndarray
+    contour_closures: np.ndarray
+
+    def __post_init__(self) -> None:
+        coords = _readonly(self.coords, np.float64, name="coords")
+        offsets = _readonly(self.contour_offsets, np.int64, name="contour_offsets")
+        closures = _readonly(self.contour_closures, np.uint8, name="contour_closures")
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError("coords は (N, 2) 配列である必要があります")
+        if offsets.ndim != 1 or closures.ndim != 1 or offsets.shape[0] != closures.shape[0] + 1:
+            raise ValueError("contour_offsets は contour 数 + 1 個である必要があります")
+        if (
+            int(offsets[0]) != 0
+            or int(offsets[-1]) != coords.shape[0]
+            or bool(np.any(np.diff(offsets) < 0))
+        ):
+            raise ValueError("contour_offsets は 0 から頂点数までの単調増加列です")
+        if bool(np.any(closures > CONTOUR_ENDED)):
+            raise ValueError("contour_closures に未知の終端があります")
+        object.__setattr__(self, "coords", coords)
+        object.__setattr__(self, "contour_offsets", offsets)
+        object.__setattr__(self, "contour_closures", closures)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.coords.nbytes + self.contour_offsets.nbytes + self.contour_closures.nbytes)
+
+    def to_bytes(self) -> bytes:
+        """cache file の内容（header・coords・offsets・closures）を返す。"""
+
+        header = _HEADER.pack(
+            _MAGIC,
+            _FORMAT_VERSION,
+            self.coords.shape[0],
+            self.contour_closures.shape[0],
+        )
+        return b"".join(
+            (
+                header,
+                self.coords.astype("<f8", copy=False).tobytes(),
+                self.contour_offsets.astype("<i8", copy=False).tobytes(),
+                self.contour_closures.tobytes(),
+            )
+        )
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> GlyphOutline:
+        """`to_bytes()` の逆変換。形式が合わなければ ValueError。"""
+
+        if len(payload) < _HEADER.size:
+            raise ValueError("glyph outline payload が短すぎます")
+        magic, version, points, contours = _HEADER.unpack_from(payload)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("glyph outline payload の形式が違います")
+        coords_end = _HEADER.size + points * 16
+        offsets_end = coords_end + (contours + 1) * 8
+        if len(payload) != offsets_end + contours:
+            raise ValueError("glyph outline payload の長さが header と一致しません")
+        return cls(
+            coords=np.frombuffer(payload, dtype="<f8", count=points * 2, offset=_HEADER.size)
+            .reshape(points, 2),
+            contour_offsets=np.frombuffer(
+                payload,
+                dtype="<i8",
+                count=contours + 1,
+                offset=coords_end,
+            ),
+            contour_closures=np.frombuffer(
+                payload,
+                dtype=np.uint8,
+                count=contours,
+                offset=offsets_end,
+            ),
+        )
+
+
+def _readonly(value: object, dtype: type[np.generic], *, name: str) -> np.ndarray:
+    if not isinstance(value, np.ndarray):
+        raise TypeError(f"{name} は numpy.ndarray である必要があります")
+    if value.dtype == dtype and value.flags.c_contiguous and not value.flags.writeable:
+        return value
+    array = np.array(value, dtype=dtype, order="C", copy=True)
+    array.setflags(write=False)
+    return array
+
+
+EMPTY_GLYPH_OUTLINE: Final = GlyphOutline(
+    coords=np.empty((0, 2), dtype=np.float64),
+    contour_offsets=np.zeros(1, dtype=np.int64),
+    contour_closures=np.empty(0, dtype=np.uint8),
+)
+
+
+class GlyphOutlineCache:
+    """``key`` ごとに 1 binary file を置く glyph 輪郭 store。
+
+    Notes
+    -----
+    entry は再計算できるため、読めない・壊れた file は miss として扱い、書き込み
+    失敗も握りつぶす。書き込みは sibling の一時 file から ``os.replace`` するので
+    並行する worker が途中までの file を読むことはない。glyph 数が多いため fsync は
+    しない。crash で中身が欠けた file は長さ検査で miss になる。
+    """
+
+    __slots__ = ("_directory",)
+
+    def __init__(self, directory: str | Path) -> None:
+        if not isinstance(directory, (str, Path)):
+            raise TypeError("directory は str または Path である必要があります")
+        self._directory = Path(directory)
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def load(self, key: str) -> GlyphOutline | None:
+        """``key`` の輪郭を返す。無い・壊れている場合は None。"""
+
+        path = self._entry_path(key)
+        try:
+            payload = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            return GlyphOutline.from_bytes(payload)
+        except ValueError:
+            return None
+
+    def store(self, key: str, outline: GlyphOutline) -> None:
+        """輪郭を保存する。失敗しても例外にしない。"""
+
+        if type(outline) is not GlyphOutline:
+            raise TypeError("outline は exact GlyphOutline です")
+        path = self._entry_path(key)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(outline.to_bytes())
+            os.replace(temp_path, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                temp_path.unlink(missing_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        if type(key) is not str or _DIGEST_PATTERN.fullmatch(key) is None:
+            raise ValueError("key は SHA-256 lowercase hex 文字列である必要があります")
+        return self._directory / key[:2] / f"{key[2:]}.outline"
+
+
+def default_glyph_outline_cache_directory() -> Path | None:
+    """環境変数と XDG 規約から既定の保存先を返す。
+
+    ``GRAFIX_GLYPH_CACHE_DIR`` が設定されていればそれを使い、空文字なら cache を
+    無効化する。未設定なら ``$XDG_CACHE_HOME/grafix/glyphs``
+    （既定 ``~/.cache/grafix/glyphs``）。
+    """
+
+    explicit = os.environ.get(_CACHE_DIR_ENV)
+    if explicit is not None:
+        explicit = explicit.strip()
+        return Path(explicit).expanduser() if explicit else None
+    xdg_cache = os.environ.get("XDG_CACHE_HOME", "").strip()
+    base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / ".cache"
+    return base / "grafix" / "glyphs"
+
+
+@cache
+def _default_glyph_outline_cache() -> GlyphOutlineCache | None:
+    directory = default_glyph_outline_cache_directory()
+    return None if directory is None else GlyphOutlineCache(directory)
+
+
+_UNSET: Final = object()
+_glyph_outline_cache_var: contextvars.ContextVar[object] = contextvars.ContextVar(
+    "glyph_outline_cache",
+    default=_UNSET,
+)
+
+
+def current_glyph_outline_cache() -> GlyphOutlineCache | None:
+    """現在有効な cache を返す。context で未指定なら process 既定、無効なら None。"""
+
+    value = _glyph_outline_cache_var.get()
+    if value is _UNSET:
+        return _default_glyph_outline_cache()
+    return value  # type: ignore[return-value]
+
+
+@contextlib.contextmanager
+def glyph_outline_cache_context(cache: GlyphOutlineCache | None) -> Iterator[None]:
+    """範囲内だけ使う cache を差し替える。None は cache を使わない。"""
+
+    if cache is not None and type(cache) is not GlyphOutlineCache:
+        raise TypeError("cache は GlyphOutlineCache または None です")
+    token = _glyph_outline_cache_var.set(cache)
+    try:
+        yield
+    finally:
+        _glyph_outline_cache_var.reset(token)
+
+
+__all__ = [
+    "CONTOUR_CLOSED",
+    "CONTOUR_ENDED",
+    "CONTOUR_OPEN",
+    "EMPTY_GLYPH_OUTLINE",
+    "GlyphOutline",
+    "GlyphOutlineCache",
+    "current_glyph_outline_cache",
+    "default_glyph_outline_cache_directory",
+    "glyph_outline_cache_context",
+]
@@ -0,0 +1,396 @@
+# src/grafix/core/instanced_geometry.py
+# 1 つの base geometry と 4x4 変換列で複製結果を表す InstancedGeometry。
+
+from __future__ import annotations
+
+import weakref
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+from numba import njit  # type: ignore[attr-defined, import-untyped]
+
+from grafix.core.realized_geometry import (
+    GeomTuple,
+    RealizedGeometry,
+    realized_geometry_from_readonly_views,
+    realized_geometry_from_tuple,
+)
+
+InstanceOrder = Literal["instance", "line"]
+"""展開時のポリライン順序。
+
+- ``"instance"``: instance ごとに base の全ポリラインを並べる。
+- ``"line"``: base のポリラインごとに全 instance を並べる。
+"""
+
+_INSTANCE_ORDERS = frozenset({"instance", "line"})
+_AFFINE_BOTTOM_ROW = np.array([0.0, 0.0, 0.0, 1.0], dtype=np.float64)
+
+
+@dataclass(frozen=True, slots=True)
+class GeomInstances:
+    """effect の instancer が返す、複製前 geometry と複製変換の組。
+
+    Parameters
+    ----------
+    base : tuple[np.ndarray, np.ndarray]
+        複製元の ``(coords, offsets)``。入力 tuple をそのまま渡すと入力の
+        RealizedGeometry を copy せずに共有する。
+    transforms : np.ndarray
+        float64 shape ``(K, 4, 4)`` の affine 変換列。``p' = M @ (x, y, z, 1)``。
+    order : {"instance", "line"}, default "instance"
+        展開時のポリライン順序。
+    """
+
+    base: GeomTuple
+    transforms: np.ndarray
+    order: InstanceOrder = "instance"
+
+
+def _validate_transforms(transforms: object) -> np.ndarray:
+    """affine 変換列を検証し、read-only snapshot にして返す。"""
+
+    if type(transforms) is not np.ndarray:
+        raise TypeError("transforms は exact np.ndarray である必要がある")
+    if transforms.ndim != 3 or transforms.shape[1:] != (4, 4):
+        raise ValueError("transforms は shape (K,4,4) である必要がある")
+    if transforms.shape[0] == 0:
+        raise ValueError("transforms は少なくとも 1 instance を含む必要がある")
+    if transforms.dtype != np.float64:
+        raise TypeError("transforms は dtype float64 である必要がある")
+    if not np.isfinite(transforms).all():
+        raise ValueError("transforms は有限値だけを含む必要がある")
+    if not np.array_equal(
+        transforms[:, 3, :],
+        np.broadcast_to(_AFFINE_BOTTOM_ROW, (transforms.shape[0], 4)),
+    ):
+        raise ValueError("transforms の最終行は (0, 0, 0, 1) である必要がある")
+    snapshot = np.array(transforms, dtype=np.float64, order="C", copy=True)
+    snapshot.flags.writeable = False
+    return snapshot
+
+
+class InstancedGeometry(RealizedGeometry):
+    """base geometry を affine 変換列で複製した結果を、展開せずに保持する。
+
+    Notes
+    -----
+    ``coords`` / ``offsets`` へ触れた時点で初めて展開する。展開配列は弱参照でだけ
+    memo し、利用側が保持している間は同じ配列を返す。保持されなくなった展開配列は
+    解放されるため、realize cache 上の占有量は常に :attr:`byte_size`
+    （base + 変換列）に留まる。realize は入力として使った展開配列を 1 回の DAG 評価の
+    間だけ保持し、同じ評価内の consumer が再展開しないようにする。描画は
+    :attr:`base` と :attr:`transforms` を使い、instanced draw で展開を避ける。
+    """
+
+    __slots__ = (
+        "base",
+        "transforms",
+        "order",
+        "_coords_ref",
+        "_offsets_ref",
+        "_gpu_transforms",
+    )
+
+    base: RealizedGeometry
+    transforms: np.ndarray
+    order: InstanceOrder
+
+    def __init__(self) -> None:
+        raise TypeError("InstancedGeometry は instanced_geometry() で作成する")
+
+    @property  # type: ignore[override]
+    def coords(self) -> np.ndarray:
+        """展開後の float32 shape (N*K, 3) 頂点配列。"""
+
+        cached = None if self._coords_ref is None else self._coords_ref()
+        if cached is not None:
+            return cached
+        coords = np.empty((self.vertex_count, 3), dtype=np.float32)
+        if self.order == "instance":
+            _expand_coords_instance_major(self.base.coords, self.transforms, coords)
+        else:
+            _expand_coords_line_major(
+                self.base.coords,
+                self.base.offsets,
+                self.transforms,
+                coords,
+            )
+        coords.flags.writeable = False
+        object.__setattr__(self, "_coords_ref", weakref.ref(coords))
+        return coords
+
+    @property  # type: ignore[override]
+    def offsets(self) -> np.ndarray:
+        """展開後の int32 shape (M*K+1,) 境界配列。"""
+
+        cached = None if self._offsets_ref is None else self._offsets_ref()
+        if cached is not None:
+            return cached
+        offsets = np.empty((self.line_count + 1,), dtype=np.int32)
+        if self.order == "instance":
+            _expand_offsets_instance_major(
+                self.base.offsets,
+                self.instance_count,
+                offsets,
+            )
+        else:
+            _expand_offsets_line_major(self.base.offsets, self.instance_count, offsets)
+        offsets.flags.writeable = False
+        object.__setattr__(self, "_offsets_ref", weakref.ref(offsets))
+        return offsets
+
+    @property
+    def instance_count(self) -> int:
+        """instance 数 K を返す。"""
+
+        return int(self.transforms.shape[0])
+
+    @property
+    def vertex_count(self) -> int:
+        """展開後の頂点数を、展開せずに返す。"""
+
+        return self.base.vertex_count * self.instance_count
+
+    @property
+    def line_count(self) -> int:
+        """展開後のポリライン本数を、展開せずに返す。"""
+
+        return self.base.line_count * self.instance_count
+
+    @property
+    def byte_size(self) -> int:
+        """保持する base 配列と変換列の byte 数を返す（展開配列は含めない）。"""
+
+        return int(self.base.byte_size + self.transforms.nbytes)
+
+    @property
+    def gpu_transforms(self) -> np.ndarray:
+        """GL の ``mat4`` instance attribute 用 float32 column-major 変換列。"""
+
+        cached = self._gpu_transforms
+        if cached is None:
+            cached = np.ascontiguousarray(
+                self.transforms.transpose(0, 2, 1),
+                dtype=np.float32,
+            ).reshape(self.instance_count, 16)
+            cached.flags.writeable = False
+            object.__setattr__(self, "_gpu_transforms", cached)
+        return cached
+
+    def expand(self) -> RealizedGeometry:
+        """展開配列を強参照で持つ通常の RealizedGeometry を返す。"""
+
+        return realized_geometry_from_readonly_views(self.coords, self.offsets)
+
+    def __repr__(self) -> str:
+        return (
+            f"InstancedGeometry(instances={self.instance_count}, order={self.order!r}, "
+            f"base_vertices={self.base.vertex_count}, base_lines={self.base.line_count})"
+        )
+
+    def __reduce__(self) -> tuple[object, tuple[object, ...]]:
+        """展開せず base と変換列だけで pickle 化する。"""
+
+        return (_restore_instanced_geometry, (self.base, self.transforms, self.order))
+
+
+def _restore_instanced_geometry(
+    base: RealizedGeometry,
+    transforms: np.ndarray,
+    order: InstanceOrder,
+) -> InstancedGeometry:
+    return instanced_geometry(base, transforms, order=order)
+
+
+def instanced_geometry(
+    base: RealizedGeometry,
+    transforms: np.ndarray,
+    *,
+    order: InstanceOrder = "instance",
+) -> InstancedGeometry:
+    """base と affine 変換列から InstancedGeometry を作る。
+
+    Parameters
+    ----------
+    base : RealizedGeometry
+        複製元。InstancedGeometry は受け付けない（合成は呼び出し側で行う）。
+    transforms : np.ndarray
+        float64 shape ``(K, 4, 4)`` の affine 変換列。
+    order : {"instance", "line"}, default "instance"
+        展開時のポリライン順序。
+
+    Raises
+    ------
+    TypeError
+        base が通常の RealizedGeometry でない、または transforms の型が不正な場合。
+    ValueError
+        transforms の shape・値が不正、または展開後の数が int32 を超える場合。
+    """
+
+    if type(base) is not RealizedGeometry:
+        raise TypeError("base は exact RealizedGeometry である必要がある")
+    if order not in _INSTANCE_ORDERS:
+        raise ValueError(f"order は 'instance' または 'line' である必要がある: {order!r}")
+    transforms_arr = _validate_transforms(transforms)
+    count = int(transforms_arr.shape[0])
+    int32_max = int(np.iinfo(np.int32).max)
+    if base.vertex_count * count > int32_max or base.line_count * count + 1 > int32_max:
+        raise ValueError("展開後の geometry が int32 の表現範囲を超える")
+
+    result = object.__new__(InstancedGeometry)
+    object.__setattr__(result, "base", base)
+    object.__setattr__(result, "transforms", transforms_arr)
+    object.__setattr__(result, "order", order)
+    object.__setattr__(result, "_coords_ref", None)
+    object.__setattr__(result, "_offsets_ref", None)
+    object.__setattr__(result, "_gpu_transforms", None)
+    return result
+
+
+def realized_from_instances(
+    produced: object,
+    inputs: Sequence[RealizedGeometry],
+    *,
+    context: str,
+) -> RealizedGeometry:
+    """instancer の戻り値を InstancedGeometry へ変換する。
+
+    base が入力 tuple そのものなら入力の配列を共有する。入力が instance 順の
+    InstancedGeometry で、出力も instance 順なら変換を合成して base を共有し、
+    複製の複製でも展開しない。
+    """
+
+    if type(produced) is not GeomInstances:
+        raise TypeError(f"{context}: instancer は GeomInstances を返す必要がある")
+    base_coords, base_offsets = produced.base
+    for geometry in inputs:
+        if base_coords is not geometry.coords or base_offsets is not geometry.offsets:
+            continue
+        if type(geometry) is InstancedGeometry:
+            if geometry.order == "instance" and produced.order == "instance":
+                outer = _validate_transforms(produced.transforms)
+                combined = np.matmul(
+                    outer[:, np.newaxis, :, :],
+                    geometry.transforms[np.newaxis, :, :, :],
+                ).reshape(-1, 4, 4)
+                return instanced_geometry(geometry.base, combined, order="instance")
+            # 展開済み配列は検証済みの read-only view なので copy せずに包む。
+            base = realized_geometry_from_readonly_views(base_coords, base_offsets)
+        else:
+            base = geometry
+        return instanced_geometry(base, produced.transforms, order=produced.order)
+    base = realized_geometry_from_tuple(produced.base, context=context)
+    return instanced_geometry(base, produced.transforms, order=produced.order)
+
+
+def expand_geom_instances(instances: GeomInstances) -> GeomTuple:
+    """GeomInstances を通常の ``(coords, offsets)`` へ展開する。"""
+
+    base_coords, base_offsets = instances.base
+    transforms = _validate_transforms(instances.transforms)
+    count = int(transforms.shape[0])
+    n_lines = max(0, int(base_offsets.size) - 1)
+    coords = np.empty((int(base_coords.shape[0]) * count, 3), dtype=np.float32)
+    offsets = np.empty((n_lines * count + 1,), dtype=np.int32)
+    if instances.order == "instance":
+        _expand_coords_instance_major(base_coords, transforms, coords)
+        _expand_offsets_instance_major(base_offsets, count, offsets)
+    elif instances.order == "line":
+        _expand_coords_line_major(base_coords, base_offsets, transforms, coords)
+        _expand_offsets_line_major(base_offsets, count, offsets)
+    else:
+        raise ValueError(f"order は 'instance' または 'line' である必要がある: {instances.order!r}")
+    return coords, offsets
+
+
+@njit(cache=True)  # type: ignore[misc]
+def _transform_into(
+    base_coords: np.ndarray,
+    start: int,
+    stop: int,
+    m: np.ndarray,
+    out_coords: np.ndarray,
+    out_start: int,
+) -> None:
+    for i in range(start, stop):
+        x = float(base_coords[i, 0])
+        y = float(base_coords[i, 1])
+        z = float(base_coords[i, 2])
+        o = out_start + i - start
+        out_coords[o, 0] = m[0, 0] * x + m[0, 1] * y + m[0, 2] * z + m[0, 3]
+        out_coords[o, 1] = m[1, 0] * x + m[1, 1] * y + m[1, 2] * z + m[1, 3]
+        out_coords[o, 2] = m[2, 0] * x + m[2, 1] * y + m[2, 2] * z + m[2, 3]
+
+
+@njit(cache=True)  # type: ignore[misc]
+def _expand_coords_instance_major(
+    base_coords: np.ndarray,
+    transforms: np.ndarray,
+    out_coords: np.ndarray,
+) -> None:
+    n_vertices = base_coords.shape[0]
+    for k in range(transforms.shape[0]):
+        _transform_into(
+            base_coords, 0, n_vertices, transforms[k], out_coords, k * n_vertices
+        )
+
+
+@njit(cache=True)  # type: ignore[misc]
+def _expand_coords_line_major(
+    base_coords: np.ndarray,
+    base_offsets: np.ndarray,
+    transforms: np.ndarray,
+    out_coords: np.ndarray,
+) -> None:
+    cursor = 0
+    for li in range(base_offsets.shape[0] - 1):
+        start = int(base_offsets[li])
+        stop = int(base_offsets[li + 1])
+        for k in range(transforms.shape[0]):
+            _transform_into(base_coords, start, stop, transforms[k], out_coords, cursor)
+            cursor += stop - start
+
+
+@njit(cache=True)  # type: ignore[misc]
+def _expand_offsets_instance_major(
+    base_offsets: np.ndarray,
+    count: int,
+    out_offsets: np.ndarray,
+) -> None:
+    n_lines = base_offsets.shape[0] - 1
+    n_vertices = int(base_offsets[n_lines])
+    out_offsets[0] = 0
+    for k in range(count):
+        shift = k * n_vertices
+        for li in range(n_lines):
+            out_offsets[1 + k * n_lines + li] = int(base_offsets[li + 1]) + shift
+
+
+@njit(cache=True)  # type: ignore[misc]
+def _expand_offsets_line_major(
+    base_offsets: np.ndarray,
+    count: int,
+    out_offsets: np.ndarray,
+) -> None:
+    out_offsets[0] = 0
+    cursor = 0
+    o = 1
+    for li in range(base_offsets.shape[0] - 1):
+        length = int(base_offsets[li + 1]) - int(base_offsets[li])
+        for _k in range(count):
+            cursor += length
+            out_offsets[o] = cursor
+            o += 1
+
+
+__all__ = [
+    "GeomInstances",
+    "InstanceOrder",
+    "InstancedGeometry",
+    "expand_geom_instances",
+    "instanced_geometry",
+    "realized_from_instances",
+]
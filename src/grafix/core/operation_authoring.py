@@ -7,8 +7,10 @@ import sys
 from collections.abc import Callable, Mapping, Sequence
 from typing import Any, TypeAlias, cast
 
+from grafix.core.array_argument import evaluator_params
 from grafix.core.authoring_definitions import register_authoring_declaration
 from grafix.core.builtins import builtin_evaluator_abi
+from grafix.core.instanced_geometry import GeomInstances, realized_from_instances
 from grafix.core.operation_declaration import (
     CachePolicy,
     ExternalDependencyHook,
@@ -230,6 +232,7 @@ def primitive(
     external_dependency_hook: ExternalDependencyHook | None = None,
     meta: Mapping[str, ParamMeta | Mapping[str, object]] | None = None,
     ui_visible: Mapping[str, UiVisiblePred] | None = None,
+    batch_args: Sequence[str] = (),
 ):
     """関数を primitive として宣言する公開 decorator。
 
@@ -250,6 +253,10 @@ def primitive(
         Parameter GUI に公開する引数の metadata。None は GUI 非公開を表す。
     ui_visible : Mapping or None, optional
         現在値から各公開引数の GUI 表示可否を決める predicate。
+    batch_args : Sequence[str], default=()
+        ``G.<name>.many(...)`` で要素ごとの配列として渡せる float/vec3 引数。
+        宣言した関数は、その引数に shape ``(N,)``/``(N, 3)`` の read-only
+        配列を受け取り、N 本の polyline を一度に返す必要がある。
 
     Returns
     -------
@@ -259,6 +266,9 @@ def primitive(
 
     overwrite_b = exact_bool(overwrite, name="overwrite")
     normalized_meta = _normalized_meta(kind="primitive", meta=meta)
+    if isinstance(batch_args, str) or not isinstance(batch_args, Sequence):
+        raise TypeError("batch_args は引数名の sequence である必要があります")
+    batch_args_t = tuple(batch_args)
 
     def decorator(f: Callable[..., GeomTuple]) -> Callable[..., GeomTuple]:
         module = identity_string(f.__module__, name="primitive module")
@@ -281,7 +291,7 @@ def primitive(
         )
 
         def evaluate(args: tuple[tuple[str, Any], ...]) -> RealizedGeometry:
-            params = dict(args)
+            params = evaluator_params(args)
             if normalized_meta is not None and params.pop("activate") is False:
                 return concat_realized_geometries()
             return realized_geometry_from_tuple(
@@ -314,6 +324,7 @@ def primitive(
             fingerprint_source=(
                 None if builtin_abi is None else _builtin_evaluation_contract
             ),
+            batch_args=batch_args_t,
         )
         if builtin_abi is None:
             register_authoring_declaration(declaration, overwrite=overwrite_b)
@@ -334,6 +345,7 @@ def effect(
     n_inputs: int = 1,
     meta: Mapping[str, ParamMeta | Mapping[str, object]] | None = None,
     ui_visible: Mapping[str, UiVisiblePred] | None = None,
+    instances: Callable[..., GeomInstances | None] | None = None,
 ):
     """関数を effect として宣言する公開 decorator。
 
@@ -353,6 +365,10 @@ def effect(
         Parameter GUI に公開する引数の metadata。None は GUI 非公開を表す。
     ui_visible : Mapping or None, optional
         現在値から各公開引数の GUI 表示可否を決める predicate。
+    instances : Callable or None, optional
+        effect 本体と同じ引数を受け取り、出力を「base + affine 変換列」で表せる
+        場合に ``GeomInstances`` を返す instancer。``None`` を返した場合と未指定の
+        場合は effect 本体を呼ぶ。展開結果は本体の戻り値と一致させる。
 
     Returns
     -------
@@ -361,6 +377,8 @@ def effect(
     """
 
     overwrite_b = exact_bool(overwrite, name="overwrite")
+    if instances is not None and not callable(instances):
+        raise TypeError("instances は callable または None である必要がある")
     n_inputs_i = exact_integer(n_inputs, name="n_inputs", minimum=1)
     normalized_meta = _normalized_meta(kind="effect", meta=meta)
 
@@ -393,13 +411,21 @@ def effect(
                     f"effect '{f.__name__}' は入力 Geometry を {n_inputs_i} 個必要とします"
                     f"（受け取った数: {len(inputs)}）"
                 )
-            params = dict(args)
+            params = evaluator_params(args)
             if normalized_meta is not None and params.pop("activate") is False:
                 if len(inputs) == 1:
                     return inputs[0]
                 return concat_realized_geometries(*inputs)
 
             inputs_as_tuples = tuple((geometry.coords, geometry.offsets) for geometry in inputs)
+            if instances is not None:
+                produced = instances(*inputs_as_tuples, **params)
+                if produced is not None:
+                    return realized_from_instances(
+                        produced,
+                        inputs,
+                        context=f"@effect {f.__module__}.{f.__name__}",
+                    )
             out = f(*inputs_as_tuples, **params)
             if type(out) is tuple and len(out) == 2:
                 out_coords, out_offsets = out
@@ -415,6 +441,17 @@ def effect(
                 context=f"@effect {f.__module__}.{f.__name__}",
             )
 
+        decorator_options: dict[str, object] = {
+            "adapter": "effect-v1",
+            "builtin_locator": (
+                None if builtin_abi is None else (module, f.__name__, builtin_abi)
+            ),
+        }
+        if instances is not None:
+            # instancer の差し替えも評価結果の表現を変えるため、宣言の同一性へ含める。
+            decorator_options["instances"] = (
+                f"{instances.__module__}.{instances.__qualname__}"
+            )
         declaration = create_op_declaration(
             name=f.__name__,
             kind="effect",
@@ -428,12 +465,7 @@ def effect(
                 else f"grafix-builtin-effect-{builtin_abi}"
             ),
             version=version,
-            decorator_options={
-                "adapter": "effect-v1",
-                "builtin_locator": (
-                    None if builtin_abi is None else (module, f.__name__, builtin_abi)
-                ),
-            },
+            decorator_options=decorator_options,
             source_owner=_source_owner(f, kind="effect"),
             signature_source=f,
             fingerprint_source=(
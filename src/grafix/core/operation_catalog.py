@@ -139,6 +139,12 @@ class OperationCatalogEntry:
 
         return self.declaration.accepts_var_kwargs
 
+    @property
+    def batch_args(self) -> tuple[str, ...]:
+        """``G.<name>.many`` で要素ごとの配列として渡せる argument 名。"""
+
+        return self.declaration.batch_args
+
     @property
     def cache_policy(self):
         """evaluation cache policy。"""
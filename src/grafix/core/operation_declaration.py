@@ -32,6 +32,7 @@ ExternalDependencyHook = Callable[..., object]
 _OP_DECLARATION_ATTRIBUTE = "__grafix_operation_declaration__"
 
 _WRAPPER_OWNED_ARGUMENTS = frozenset({"activate", "instance_key", "key", "shared"})
+_BATCHABLE_KINDS = frozenset({"float", "vec3"})
 
 
 def _dynamic_evaluation_contract() -> None:
@@ -125,7 +126,9 @@ class OpDeclaration(Generic[EvaluatorT]):
     Notes
     -----
     ``evaluation_fingerprint`` と ``schema_fingerprint`` は factory で一度だけ
-    計算する。catalog snapshot の作成時には再発行しない。
+    計算する。catalog snapshot の作成時には再発行しない。``batch_args`` は
+    ``G.<name>.many(...)`` で要素ごとの配列として渡せる primitive 引数で、
+    evaluator はその引数に shape ``(N,)``/``(N, 3)`` の read-only 配列も受け取る。
     """
 
     name: str
@@ -147,6 +150,7 @@ class OpDeclaration(Generic[EvaluatorT]):
     accepted_args: tuple[str, ...]
     required_args: tuple[str, ...]
     accepts_var_kwargs: bool
+    batch_args: tuple[str, ...] = ()
 
     def __post_init__(self) -> None:
         name = identity_string(self.name, name="operation name")
@@ -240,6 +244,11 @@ class OpDeclaration(Generic[EvaluatorT]):
             "accepts_var_kwargs",
             exact_bool(self.accepts_var_kwargs, name="accepts_var_kwargs"),
         )
+        object.__setattr__(
+            self,
+            "batch_args",
+            _batch_args(self.batch_args, kind=kind, schema=self.schema),
+        )
 
     @property
     def ref(self) -> EvaluationOpRef:
@@ -281,6 +290,30 @@ class OpDeclaration(Generic[EvaluatorT]):
         )
 
 
+def _batch_args(
+    value: object,
+    *,
+    kind: OpKind,
+    schema: ParameterOpSchema,
+) -> tuple[str, ...]:
+    """要素ごとの配列として受け取れる primitive 引数名を検証する。"""
+
+    if type(value) is not tuple:
+        raise TypeError("batch_args は str の tuple である必要があります")
+    names = tuple(identity_string(name, name="batch_args item") for name in value)
+    if len(set(names)) != len(names):
+        raise ValueError("batch_args に重複があります")
+    if names and kind != "primitive":
+        raise ValueError("batch_args は primitive だけが宣言できます")
+    for name in names:
+        meta = schema.meta.get(name)
+        if meta is None or meta.kind not in _BATCHABLE_KINDS:
+            raise ValueError(
+                f"batch_args {name!r} は kind が float/vec3 の meta 引数である必要があります"
+            )
+    return names
+
+
 def _operation_parameters(
     *,
     kind: OpKind,
@@ -379,6 +412,7 @@ def create_op_declaration(
     source_owner: str | None = None,
     signature_source: Callable[..., object] | None = None,
     fingerprint_source: Callable[..., object] | None = None,
+    batch_args: tuple[str, ...] = (),
 ) -> OpDeclaration[EvaluatorT]:
     """検証済み evaluator と schema から immutable declaration を作る。
 
@@ -411,6 +445,8 @@ def create_op_declaration(
         decorator は元の user callable を渡す。
     fingerprint_source : Callable[..., object] | None, default=None
         evaluator を直接 canonical 化できない builtin だけが使う manifest ABI marker。
+    batch_args : tuple[str, ...], default=()
+        ``G.<name>.many(...)`` で要素ごとの配列として渡せる float/vec3 引数。
 
     Returns
     -------
@@ -452,6 +488,7 @@ def create_op_declaration(
         raise TypeError("external_dependency_hook は callable または None です")
     if decorator_options is not None and not isinstance(decorator_options, Mapping):
         raise TypeError("decorator_options は mapping または None です")
+    batch_args_t = _batch_args(batch_args, kind=kind_s, schema=schema)
 
     authoring_callable = evaluator if signature_source is None else signature_source
     if not callable(authoring_callable):
@@ -507,6 +544,10 @@ def create_op_declaration(
             else (owner, qualname)
         ),
     }
+    if batch_args_t:
+        # 配列入力の受理は evaluator contract の一部。未宣言の operation の
+        # fingerprint は変えない。
+        evaluation_options["batch_args"] = batch_args_t
     try:
         evaluation_fingerprint = fingerprint_evaluation_spec(
             evaluation_callable,
@@ -550,6 +591,7 @@ def create_op_declaration(
         accepts_var_kwargs=any(
             parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters
         ),
+        batch_args=batch_args_t,
     )
 
 
@@ -0,0 +1,154 @@
+"""ParameterKey から影響を受ける Geometry node を引く frame 単位の依存グラフ。"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+
+from grafix.core.geometry import Geometry, GeometryId
+from grafix.core.layer import Layer
+from grafix.core.parameters.frame_params import FrameGeometrySiteRecord
+from grafix.core.parameters.key import ParameterKey
+from grafix.core.value_validation import exact_integer
+
+
+@dataclass(frozen=True, slots=True)
+class ParameterEditPrediction:
+    """1 つの parameter を編集したときの再計算見積もり。
+
+    Parameters
+    ----------
+    nodes : int
+        再評価が必要になる scene 内 node 数。
+    measured_nodes : int
+        そのうち評価時間の記録があった node 数。
+    predicted_ns : int
+        記録済み node の評価時間合計。
+    dominant_op : str | None
+        最も時間を占める op 名。記録が無ければ None。
+    """
+
+    nodes: int
+    measured_nodes: int
+    predicted_ns: int
+    dominant_op: str | None
+
+    def __post_init__(self) -> None:
+        nodes = exact_integer(self.nodes, name="nodes", minimum=0)
+        measured = exact_integer(self.measured_nodes, name="measured_nodes", minimum=0)
+        if measured > nodes:
+            raise ValueError("measured_nodes は nodes 以下である必要があります")
+        exact_integer(self.predicted_ns, name="predicted_ns", minimum=0)
+        if self.dominant_op is not None and type(self.dominant_op) is not str:
+            raise TypeError("dominant_op は str または None である必要があります")
+
+
+class ParameterDependencyGraph:
+    """scene の Geometry DAG と site 記録から、編集時の dirty node 集合を求める。
+
+    Notes
+    -----
+    Geometry は content address なので、parameter を変えると記録 node から root まで
+    の祖先だけが新しい id になる。dirty 集合はその祖先集合であり、兄弟の subtree は
+    cache にそのまま残る。scene から到達できない記録 node は無視する。
+    """
+
+    __slots__ = ("_consumers", "_ops", "_site_nodes")
+
+    def __init__(
+        self,
+        roots: Iterable[Geometry],
+        sites: Iterable[FrameGeometrySiteRecord],
+    ) -> None:
+        ops: dict[GeometryId, str] = {}
+        consumers: dict[GeometryId, list[GeometryId]] = {}
+        stack = [root for root in roots]
+        for root in stack:
+            if type(root) is not Geometry:
+                raise TypeError("roots は Geometry だけを含む必要があります")
+        # 深い effect chain でも再帰上限に当たらないよう明示 stack で辿る。
+        while stack:
+            node = stack.pop()
+            if node.id in ops:
+                continue
+            ops[node.id] = node.op
+            for child in node.inputs:
+                consumers.setdefault(child.id, []).append(node.id)
+                if child.id not in ops:
+                    stack.append(child)
+
+        site_nodes: dict[tuple[str, str], set[GeometryId]] = {}
+        for record in sites:
+            if type(record) is not FrameGeometrySiteRecord:
+                raise TypeError("sites は FrameGeometrySiteRecord だけを含む必要があります")
+            if record.geometry_id in ops:
+                site_nodes.setdefault((record.op, record.site_id), set()).add(
+                    record.geometry_id
+                )
+
+        self._ops = ops
+        self._consumers = {key: tuple(value) for key, value in consumers.items()}
+        self._site_nodes = {key: frozenset(value) for key, value in site_nodes.items()}
+
+    @classmethod
+    def from_layers(
+        cls,
+        layers: Sequence[Layer],
+        sites: Iterable[FrameGeometrySiteRecord],
+    ) -> ParameterDependencyGraph:
+        """正規化済み Layer 列から依存グラフを作る。"""
+
+        return cls((layer.geometry for layer in layers), sites)
+
+    @property
+    def node_count(self) -> int:
+        """scene から到達できる node 数を返す。"""
+
+        return len(self._ops)
+
+    def dirty_nodes(self, key: ParameterKey) -> frozenset[GeometryId]:
+        """``key`` の編集で再評価が必要になる node id 集合を返す。"""
+
+        if type(key) is not ParameterKey:
+            raise TypeError("key は ParameterKey である必要があります")
+        seeds = self._site_nodes.get((key.op, key.site_id))
+        if not seeds:
+            return frozenset()
+        dirty = set(seeds)
+        stack = list(seeds)
+        while stack:
+            for parent in self._consumers.get(stack.pop(), ()):
+                if parent not in dirty:
+                    dirty.add(parent)
+                    stack.append(parent)
+        return frozenset(dirty)
+
+    def predict(
+        self,
+        key: ParameterKey,
+        cost_ns: Callable[[GeometryId], int | None],
+    ) -> ParameterEditPrediction:
+        """dirty node の記録済み評価時間から編集後の再計算時間を見積もる。"""
+
+        dirty = self.dirty_nodes(key)
+        total = 0
+        measured = 0
+        per_op: dict[str, int] = {}
+        for geometry_id in dirty:
+            cost = cost_ns(geometry_id)
+            if cost is None:
+                continue
+            measured += 1
+            total += cost
+            op = self._ops[geometry_id]
+            per_op[op] = per_op.get(op, 0) + cost
+        dominant = max(per_op, key=per_op.__getitem__) if per_op else None
+        return ParameterEditPrediction(
+            nodes=len(dirty),
+            measured_nodes=measured,
+            predicted_ns=total,
+            dominant_op=dominant,
+        )
+
+
+__all__ = ["ParameterDependencyGraph", "ParameterEditPrediction"]
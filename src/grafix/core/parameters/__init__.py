@@ -63,6 +63,7 @@ from .variations import (
 from .autosave import ParamStoreAutosave
 from .frame_params import (
     FrameEffectChainRecord,
+    FrameGeometrySiteRecord,
     FrameLabelRecord,
     FrameParamRecord,
     FrameParamsBuffer,
@@ -134,6 +135,7 @@ __all__ = [
     "FrameParamRecord",
     "FrameLabelRecord",
     "FrameEffectChainRecord",
+    "FrameGeometrySiteRecord",
     "resolve_params",
     "ParameterRow",
     "rows_from_snapshot",
@@ -90,6 +90,24 @@ class FrameLabelRecord:
         exact_string(self.label, name="FrameLabelRecord.label")
 
 
+@dataclass(frozen=True, slots=True)
+class FrameGeometrySiteRecord:
+    """(op, site_id) の呼び出しが生成した Geometry node の記録。
+
+    ``ParameterKey`` の op/site_id と同じ identity で、どの node がその site の
+    parameter を消費したかを依存追跡へ渡す。
+    """
+
+    op: str
+    site_id: str
+    geometry_id: str
+
+    def __post_init__(self) -> None:
+        identity_string(self.op, name="FrameGeometrySiteRecord.op")
+        identity_string(self.site_id, name="FrameGeometrySiteRecord.site_id")
+        identity_string(self.geometry_id, name="FrameGeometrySiteRecord.geometry_id")
+
+
 @dataclass(frozen=True, slots=True)
 class FrameEffectChainRecord:
     """1回のEffectBuilder適用で観測した完全なcode topology。"""
@@ -112,6 +130,7 @@ class FrameParamsBuffer:
         self._records: list[FrameParamRecord] = []
         self._labels: list[FrameLabelRecord] = []
         self._effect_chains: list[FrameEffectChainRecord] = []
+        self._geometry_sites: list[FrameGeometrySiteRecord] = []
         self._effect_chain_observation_complete = False
 
     def record(
@@ -140,6 +159,13 @@ class FrameParamsBuffer:
             FrameLabelRecord(op=op, site_id=site_id, label=label)
         )
 
+    def record_geometry_site(self, *, op: str, site_id: str, geometry_id: str) -> None:
+        """(op, site_id) が生成した Geometry node を記録する。"""
+
+        self._geometry_sites.append(
+            FrameGeometrySiteRecord(op=op, site_id=site_id, geometry_id=geometry_id)
+        )
+
     def record_effect_chain(
         self,
         *,
@@ -167,6 +193,10 @@ class FrameParamsBuffer:
     def effect_chains(self) -> list[FrameEffectChainRecord]:
         return self._effect_chains
 
+    @property
+    def geometry_sites(self) -> list[FrameGeometrySiteRecord]:
+        return self._geometry_sites
+
     @property
     def effect_chain_observation_complete(self) -> bool:
         """このbufferが一つの完全な成功evaluationを表すか返す。"""
@@ -182,4 +212,5 @@ class FrameParamsBuffer:
         self._records.clear()
         self._labels.clear()
         self._effect_chains.clear()
+        self._geometry_sites.clear()
         self._effect_chain_observation_complete = False
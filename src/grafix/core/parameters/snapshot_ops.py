@@ -210,8 +210,44 @@ def materialize_snapshot(snapshot: ParamSnapshot) -> dict[ParameterKey, ParamSna
     return dict(snapshot)
 
 
+def snapshot_delta(
+    previous: ParamSnapshot,
+    current: ParamSnapshot,
+) -> dict[ParameterKey, ParamSnapshotEntry] | None:
+    """previous から current へ変わった entry だけを plain dict で返す。
+
+    両者が同じ full base 上の overlay（または base 自身）である場合だけ、
+    override された key を比較して差分を決める。key 集合が変わり得る構造変更など、
+    overlay から差分を決められない場合は None を返し、呼び出し側は全体を送る。
+    """
+
+    if previous is current:
+        return {}
+    previous_base, previous_overrides = _overlay_parts(previous)
+    current_base, current_overrides = _overlay_parts(current)
+    if previous_base is not current_base:
+        return None
+    changed: dict[ParameterKey, ParamSnapshotEntry] = {}
+    for key in previous_overrides.keys() | current_overrides.keys():
+        entry = current[key]
+        if previous[key] != entry:
+            changed[key] = entry
+    return changed
+
+
+def _overlay_parts(
+    snapshot: ParamSnapshot,
+) -> tuple[ParamSnapshot, Mapping[ParameterKey, ParamSnapshotEntry]]:
+    """snapshot を (full base, base からの override) に分解する。"""
+
+    if isinstance(snapshot, _SnapshotOverlay):
+        return snapshot._base, snapshot._overrides
+    return snapshot, {}
+
+
 __all__ = [
     "materialize_snapshot",
+    "snapshot_delta",
     "store_snapshot",
     "store_snapshot_for_gui",
 ]
@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+import contextlib
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Callable
 
@@ -98,93 +100,176 @@ def realize_scene(
         realize 済みの Layer 列。
     """
 
-    if presets is not None and type(presets) is not PresetCatalog:
-        raise TypeError("presets は exact PresetCatalog または None です")
-
-    owned_session = session is None
-    owned_resources: EvaluationResources | None = None
-    owned_store: RealizeCacheStore | None = None
-    if session is None:
-        context = EvaluationContext(
-            catalog=current_operation_catalog(),
-            quality=current_preview_quality(),
-            config=current_runtime_config(),
-        )
-        owned_resources = EvaluationResources()
-        owned_store = RealizeCacheStore.from_runtime_limits(DEFAULT_FINAL_RUNTIME_LIMITS)
-        active_session = RealizeSession(
-            context=context,
-            resources=owned_resources,
-            cache_store=owned_store,
-        )
-    else:
-        active_session = session
-    try:
-        preset_catalog = current_preset_catalog() if presets is None else presets
-        context = active_session.context
-        with (
-            bind_operation_catalog(context.catalog),
-            bind_preset_catalog(preset_catalog),
-            bind_runtime_config(context.config),
-            preview_quality_context(context.quality),
-        ):
-            scene = draw(t)
-        layers = normalize_scene(scene)
-
+    _validate_presets(presets)
+    with _scene_session(session) as active_session:
+        layers = _evaluate_scene(draw, t, session=active_session, presets=presets)
         out: list[RealizedLayer] = []
-        total_vertices = 0
-        total_lines = 0
-        total_bytes = 0
+        totals = _SceneTotals()
         # 各 layer を評価しないと scene 実測量は分からないため、新しい CPU cache
         # entry は aggregate 検査が完了するまで transaction 内に留める。
         with active_session.cache_transaction() as cache_transaction:
             for layer_index, layer in enumerate(layers):
-                layer_label = layer.name or layer.site_id or f"Layer {layer_index + 1}"
-                with active_session.profile_layer(layer_label):
-                    resolved = resolve_layer_style(layer, defaults)
-                    thickness, color = observe_and_apply_layer_style(
-                        layer_site_id=layer.site_id,
-                        layer_name=layer.name,
-                        base_line_thickness=float(resolved.thickness),
-                        base_line_color_rgb01=resolved.color,
-                        explicit_line_thickness=(layer.thickness is not None),
-                        explicit_line_color=(layer.color is not None),
+                out.append(
+                    _realize_layer(
+                        active_session,
+                        layer,
+                        layer_index=layer_index,
+                        defaults=defaults,
+                        totals=totals,
                     )
+                )
+            cache_transaction.commit()
+        return out
 
-                    geometry = resolved.layer.geometry
-                    # Geometry は L 側で concat 済みのためそのまま扱う。
-                    realized, cache_key = active_session.realize_with_key(geometry)
-                    total_vertices += int(realized.coords.shape[0])
-                    total_lines += max(0, int(realized.offsets.size) - 1)
-                    total_bytes += int(realized.byte_size)
-                    ensure_resource_usage(
-                        "scene aggregate",
-                        vertices=total_vertices,
-                        lines=total_lines,
-                        byte_size=total_bytes,
-                        budget=active_session.runtime_limits.scene,
-                        hint=(
-                            "layer 数、各 layer の密度、または final 出力設定を"
-                            "見直してください"
-                        ),
-                    )
-                    out.append(
-                        RealizedLayer(
-                            layer=resolved.layer,
-                            realized=realized,
-                            cache_key=cache_key,
-                            color=color,
-                            thickness=thickness,
-                        )
-                    )
 
-            cache_transaction.commit()
+def iter_realize_scene(
+    draw: Callable[[float], SceneItem],
+    t: float,
+    defaults: LayerStyleDefaults,
+    *,
+    session: RealizeSession | None = None,
+    presets: PresetCatalog | None = None,
+) -> Iterator[RealizedLayer]:
+    """`realize_scene` の streaming 版。layer を 1 つずつ realize して yield する。
 
-        return out
+    引数は `realize_scene` と同じ。``draw(t)`` は最初の ``next()`` で呼ばれる。
+
+    Notes
+    -----
+    新しく評価した Geometry は layer ごとの cache transaction に留め、commit せずに
+    捨てる。既存の cache entry は読むが、yield 済み layer を cache が抱え続けることは
+    ないので、消費側が layer を書き出して手放せば、peak memory は概ね最大 layer
+    分に収まる。scene aggregate 上限は各 layer の yield 前に累計で検査する。
+
+    context 変数の束縛は yield をまたがない。呼び出し側は ``next()`` ごとに
+    parameter context などを束縛してよい。
+    """
+
+    _validate_presets(presets)
+    with _scene_session(session) as active_session:
+        layers = _evaluate_scene(draw, t, session=active_session, presets=presets)
+        totals = _SceneTotals()
+        for layer_index, layer in enumerate(layers):
+            with active_session.cache_transaction():
+                realized = _realize_layer(
+                    active_session,
+                    layer,
+                    layer_index=layer_index,
+                    defaults=defaults,
+                    totals=totals,
+                )
+            yield realized
+
+
+def _validate_presets(presets: PresetCatalog | None) -> None:
+    if presets is not None and type(presets) is not PresetCatalog:
+        raise TypeError("presets は exact PresetCatalog または None です")
+
+
+@contextlib.contextmanager
+def _scene_session(session: RealizeSession | None) -> Iterator[RealizeSession]:
+    """``session`` をそのまま、省略時はこの scene だけが所有する session を返す。"""
+
+    if session is not None:
+        yield session
+        return
+
+    context = EvaluationContext(
+        catalog=current_operation_catalog(),
+        quality=current_preview_quality(),
+        config=current_runtime_config(),
+    )
+    owned_resources = EvaluationResources()
+    owned_store = RealizeCacheStore.from_runtime_limits(DEFAULT_FINAL_RUNTIME_LIMITS)
+    owned_session = RealizeSession(
+        context=context,
+        resources=owned_resources,
+        cache_store=owned_store,
+    )
+    try:
+        yield owned_session
     finally:
-        if owned_session:
-            active_session.close()
-            assert owned_resources is not None
-            assert owned_store is not None
-            owned_resources.close()
-            owned_store.close()
+        owned_session.close()
+        owned_resources.close()
+        owned_store.close()
+
+
+def _evaluate_scene(
+    draw: Callable[[float], SceneItem],
+    t: float,
+    *,
+    session: RealizeSession,
+    presets: PresetCatalog | None,
+) -> list[Layer]:
+    """session の catalog/config/quality を束縛して ``draw(t)`` を呼び、正規化する。"""
+
+    preset_catalog = current_preset_catalog() if presets is None else presets
+    context = session.context
+    with (
+        bind_operation_catalog(context.catalog),
+        bind_preset_catalog(preset_catalog),
+        bind_runtime_config(context.config),
+        preview_quality_context(context.quality),
+    ):
+        scene = draw(t)
+    return normalize_scene(scene)
+
+
+@dataclass(slots=True)
+class _SceneTotals:
+    """scene aggregate 上限の検査に使う realize 済み layer の累計。"""
+
+    vertices: int = 0
+    lines: int = 0
+    byte_size: int = 0
+
+    def add(self, realized: RealizedGeometry, *, session: RealizeSession) -> None:
+        self.vertices += realized.vertex_count
+        self.lines += realized.line_count
+        self.byte_size += int(realized.byte_size)
+        ensure_resource_usage(
+            "scene aggregate",
+            vertices=self.vertices,
+            lines=self.lines,
+            byte_size=self.byte_size,
+            budget=session.runtime_limits.scene,
+            hint=(
+                "layer 数、各 layer の密度、または final 出力設定を"
+                "見直してください"
+            ),
+        )
+
+
+def _realize_layer(
+    session: RealizeSession,
+    layer: Layer,
+    *,
+    layer_index: int,
+    defaults: LayerStyleDefaults,
+    totals: _SceneTotals,
+) -> RealizedLayer:
+    """1 layer の style を解決して realize し、scene 累計へ加える。"""
+
+    layer_label = layer.name or layer.site_id or f"Layer {layer_index + 1}"
+    with session.profile_layer(layer_label):
+        resolved = resolve_layer_style(layer, defaults)
+        thickness, color = observe_and_apply_layer_style(
+            layer_site_id=layer.site_id,
+            layer_name=layer.name,
+            base_line_thickness=float(resolved.thickness),
+            base_line_color_rgb01=resolved.color,
+            explicit_line_thickness=(layer.thickness is not None),
+            explicit_line_color=(layer.color is not None),
+        )
+
+        geometry = resolved.layer.geometry
+        # Geometry は L 側で concat 済みのためそのまま扱う。
+        realized, cache_key = session.realize_with_key(geometry)
+        totals.add(realized, session=session)
+        return RealizedLayer(
+            layer=resolved.layer,
+            realized=realized,
+            cache_key=cache_key,
+            color=color,
+            thickness=thickness,
+        )
@@ -1,136 +1,283 @@
-"""fontTools pen の曲線コマンドを線分列へ平坦化する。"""
+"""fontTools pen の曲線コマンドを線分列へ平坦化する。
+
+BasePen で輪郭を move / line / quadratic / cubic 区間へ分解して配列に集め、弧長の
+概算・分割数・分割点は glyph 単位の numba kernel でまとめて計算する。式と評価順は
+per-point の Python 実装（quadratic の弧長は fontTools ``calcQuadraticArcLength``）と
+同じにしてあり、出力は bit 単位で一致する。CPython の ``x ** 2`` は libm ``pow`` を
+呼ぶため、kernel にも指数を実行時引数で渡し、LLVM が乗算へ畳み込まないようにする。
+"""
 
 from __future__ import annotations
 
+import hashlib
 import math
+from functools import cache
+from pathlib import Path
 from typing import Any, cast
 
-from fontTools.misc.bezierTools import (  # type: ignore[import-untyped]
-    calcQuadraticArcLength,
-    quadraticPointAtT,
-)
+import numpy as np
+from fontTools import version as _FONTTOOLS_VERSION  # type: ignore[import-untyped]
 from fontTools.pens.basePen import BasePen  # type: ignore[import-untyped]
-from fontTools.pens.recordingPen import RecordingPen  # type: ignore[import-untyped]
+from numba import njit  # type: ignore[import-untyped]
+
+from grafix.core.glyph_outline_cache import (
+    CONTOUR_CLOSED,
+    CONTOUR_ENDED,
+    CONTOUR_OPEN,
+    GlyphOutline,
+)
 
 _Point = tuple[float, float]
 _CUBIC_LENGTH_SAMPLES = 10
+_QUADRATIC_LENGTH_EPSILON = 1e-10
 
+_SEGMENT_MOVE = 0
+_SEGMENT_LINE = 1
+_SEGMENT_QUADRATIC = 2
+_SEGMENT_CUBIC = 3
 
-def _distance(left: _Point, right: _Point) -> float:
-    return math.sqrt(
-        (left[0] - right[0]) ** 2 + (left[1] - right[1]) ** 2
-    )
-
-
-def _interpolate(left: _Point, right: _Point, factor: float) -> _Point:
-    return (
-        left[0] + (right[0] - left[0]) * factor,
-        left[1] + (right[1] - left[1]) * factor,
-    )
+# 区間ごとの ``(start, control_1, control_2, end)``。quadratic は control_2 を使わず、
+# move は end だけを使う。
+_SEGMENT_VALUES = 8
 
 
-def _midpoint(left: _Point, right: _Point) -> _Point:
-    return (
-        0.5 * (left[0] + right[0]),
-        0.5 * (left[1] + right[1]),
-    )
+@njit(cache=True)
+def _distance(
+    left_x: float,
+    left_y: float,
+    right_x: float,
+    right_y: float,
+    square: float,
+) -> float:
+    return math.sqrt((left_x - right_x) ** square + (left_y - right_y) ** square)
 
 
+@njit(cache=True)
 def _cubic_polynomial_point(
     factor: float,
-    start: _Point,
-    control_1: _Point,
-    control_2: _Point,
-    end: _Point,
-) -> _Point:
-    cx = (control_1[0] - start[0]) * 3.0
-    cy = (control_1[1] - start[1]) * 3.0
-    bx = (control_2[0] - control_1[0]) * 3.0 - cx
-    by = (control_2[1] - control_1[1]) * 3.0 - cy
-    ax = end[0] - start[0] - cx - bx
-    ay = end[1] - start[1] - cy - by
+    segment: np.ndarray,
+    cube: float,
+) -> tuple[float, float]:
+    cx = (segment[2] - segment[0]) * 3.0
+    cy = (segment[3] - segment[1]) * 3.0
+    bx = (segment[4] - segment[2]) * 3.0 - cx
+    by = (segment[5] - segment[3]) * 3.0 - cy
+    ax = segment[6] - segment[0] - cx - bx
+    ay = segment[7] - segment[1] - cy - by
     factor_2 = factor * factor
-    factor_3 = factor**3
+    factor_3 = factor**cube
     return (
-        ax * factor_3 + bx * factor_2 + cx * factor + start[0],
-        ay * factor_3 + by * factor_2 + cy * factor + start[1],
+        ax * factor_3 + bx * factor_2 + cx * factor + segment[0],
+        ay * factor_3 + by * factor_2 + cy * factor + segment[1],
     )
 
 
-def _cubic_point(
-    factor: float,
-    start: _Point,
-    control_1: _Point,
-    control_2: _Point,
-    end: _Point,
-) -> _Point:
-    if factor == 1.0:
-        return end
-    if factor == 0.5:
-        left = _midpoint(start, control_1)
-        middle = _midpoint(control_1, control_2)
-        right = _midpoint(control_2, end)
-        return _midpoint(_midpoint(left, middle), _midpoint(middle, right))
-    return _cubic_polynomial_point(
-        factor,
-        start,
-        control_1,
-        control_2,
-        end,
-    )
-
-
-def _estimate_cubic_length(
-    start: _Point,
-    control_1: _Point,
-    control_2: _Point,
-    end: _Point,
-) -> float:
+@njit(cache=True)
+def _estimate_cubic_length(segment: np.ndarray, square: float, cube: float) -> float:
     length = 0.0
-    previous = start
+    previous_x = segment[0]
+    previous_y = segment[1]
     step = 1.0 / _CUBIC_LENGTH_SAMPLES
     for index in range(1, _CUBIC_LENGTH_SAMPLES + 1):
-        point = _cubic_polynomial_point(
-            index * step,
-            start,
-            control_1,
-            control_2,
-            end,
-        )
-        length += _distance(previous, point)
-        previous = point
+        x, y = _cubic_polynomial_point(index * step, segment, cube)
+        length += _distance(previous_x, previous_y, x, y, square)
+        previous_x = x
+        previous_y = y
     return length
 
 
-class _AdaptiveFlattenPen(BasePen):
-    """概算弧長に応じた数の線分を出力 pen へ渡す。"""
+@njit(cache=True)
+def _integrated_secant_arctangent(x: float) -> float:
+    return x * math.sqrt(x * x + 1.0) / 2.0 + math.asinh(x) / 2.0
+
+
+@njit(cache=True)
+def _quadratic_arc_length(segment: np.ndarray) -> float:
+    """fontTools ``calcQuadraticArcLength`` の複素数演算を実部・虚部で展開したもの。"""
+
+    d0x = segment[2] - segment[0]
+    d0y = segment[3] - segment[1]
+    d1x = segment[6] - segment[2]
+    d1y = segment[7] - segment[3]
+    dx = d1x - d0x
+    dy = d1y - d0y
+    scale = math.hypot(dy, dx)
+    if scale == 0.0:
+        return math.hypot(segment[6] - segment[0], segment[7] - segment[1])
+    origin_distance = dx * d0y - dy * d0x
+    if abs(origin_distance) < _QUADRATIC_LENGTH_EPSILON:
+        if d0x * d1x + d0y * d1y >= 0.0:
+            return math.hypot(segment[6] - segment[0], segment[7] - segment[1])
+        a = math.hypot(d0x, d0y)
+        b = math.hypot(d1x, d1y)
+        return (a * a + b * b) / (a + b)
+    x0 = (dx * d0x + dy * d0y) / origin_distance
+    x1 = (dx * d1x + dy * d1y) / origin_distance
+    return abs(
+        2.0
+        * (_integrated_secant_arctangent(x1) - _integrated_secant_arctangent(x0))
+        * origin_distance
+        / (scale * (x1 - x0))
+    )
+
+
+@njit(cache=True)
+def _effective_kind(kind: int, segment: np.ndarray) -> int:
+    """直線へ退化した曲線を line として扱う。"""
+
+    if kind == _SEGMENT_CUBIC:
+        if (
+            segment[2] == segment[0]
+            and segment[3] == segment[1]
+            and segment[4] == segment[6]
+            and segment[5] == segment[7]
+        ):
+            return _SEGMENT_LINE
+    elif kind == _SEGMENT_QUADRATIC:
+        if (segment[2] == segment[0] and segment[3] == segment[1]) or (
+            segment[2] == segment[6] and segment[3] == segment[7]
+        ):
+            return _SEGMENT_LINE
+    return kind
+
+
+@njit(cache=True)
+def _segment_point_count(
+    kind: int,
+    segment: np.ndarray,
+    segment_length: float,
+    square: float,
+    cube: float,
+) -> int:
+    if kind == _SEGMENT_MOVE:
+        return 1
+    if kind == _SEGMENT_LINE:
+        if segment[0] == segment[6] and segment[1] == segment[7]:
+            return 0
+        length = _distance(segment[0], segment[1], segment[6], segment[7], square)
+    elif kind == _SEGMENT_QUADRATIC:
+        length = _quadratic_arc_length(segment)
+    else:
+        length = _estimate_cubic_length(segment, square, cube)
+    return max(1, int(np.rint(length / segment_length)))
+
+
+@njit(cache=True)
+def _flatten_segments(
+    kinds: np.ndarray,
+    segments: np.ndarray,
+    segment_length: float,
+    square: float,
+    cube: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    count = kinds.shape[0]
+    point_counts = np.empty(count, dtype=np.int64)
+    total = 0
+    for index in range(count):
+        kind = _effective_kind(kinds[index], segments[index])
+        point_counts[index] = _segment_point_count(
+            kind,
+            segments[index],
+            segment_length,
+            square,
+            cube,
+        )
+        total += point_counts[index]
+
+    coords = np.empty((total, 2), dtype=np.float64)
+    cursor = 0
+    for index in range(count):
+        segment = segments[index]
+        kind = _effective_kind(kinds[index], segment)
+        steps = point_counts[index]
+        if kind == _SEGMENT_MOVE:
+            coords[cursor, 0] = segment[6]
+            coords[cursor, 1] = segment[7]
+            cursor += 1
+            continue
+        if steps == 0:
+            continue
+        step = 1.0 / steps
+        for point_index in range(1, steps + 1):
+            factor = point_index * step
+            if kind == _SEGMENT_LINE:
+                x = segment[0] + (segment[6] - segment[0]) * factor
+                y = segment[1] + (segment[7] - segment[1]) * factor
+            elif kind == _SEGMENT_QUADRATIC:
+                x = (
+                    (1 - factor) * (1 - factor) * segment[0]
+                    + 2 * (1 - factor) * factor * segment[2]
+                    + factor * factor * segment[6]
+                )
+                y = (
+                    (1 - factor) * (1 - factor) * segment[1]
+                    + 2 * (1 - factor) * factor * segment[3]
+                    + factor * factor * segment[7]
+                )
+            elif factor == 1.0:
+                x = segment[6]
+                y = segment[7]
+            elif factor == 0.5:
+                left_x = 0.5 * (segment[0] + segment[2])
+                left_y = 0.5 * (segment[1] + segment[3])
+                middle_x = 0.5 * (segment[2] + segment[4])
+                middle_y = 0.5 * (segment[3] + segment[5])
+                right_x = 0.5 * (segment[4] + segment[6])
+                right_y = 0.5 * (segment[5] + segment[7])
+                x = 0.5 * (0.5 * (left_x + middle_x) + 0.5 * (middle_x + right_x))
+                y = 0.5 * (0.5 * (left_y + middle_y) + 0.5 * (middle_y + right_y))
+            else:
+                x, y = _cubic_polynomial_point(factor, segment, cube)
+            coords[cursor, 0] = x
+            coords[cursor, 1] = y
+            cursor += 1
+    return coords, point_counts
+
+
+class _SegmentCollectorPen(BasePen):
+    """BasePen が分解した区間を kernel 入力の flat list へ集める。"""
 
-    def __init__(self, output_pen: Any, *, segment_length: float) -> None:
+    def __init__(self) -> None:
         super().__init__()
-        self._output_pen = output_pen
-        self._segment_length = float(segment_length)
+        self.kinds: list[int] = []
+        self.values: list[float] = []
+        self.contour_segments: list[int] = []
+        self.contour_closures: list[int] = []
         self._current_point: _Point | None = None
         self._first_point: _Point | None = None
 
-    def _steps(self, length: float) -> int:
-        return max(1, int(round(float(length) / self._segment_length)))
+    def _append(
+        self,
+        kind: int,
+        start: _Point,
+        control_1: _Point,
+        control_2: _Point,
+        end: _Point,
+    ) -> None:
+        self.kinds.append(kind)
+        self.values.extend(
+            (
+                start[0],
+                start[1],
+                control_1[0],
+                control_1[1],
+                control_2[0],
+                control_2[1],
+                end[0],
+                end[1],
+            )
+        )
+        self._current_point = end
 
     def _moveTo(self, point: _Point) -> None:
-        self._output_pen.moveTo(point)
-        self._current_point = point
+        self.contour_segments.append(len(self.kinds))
+        self.contour_closures.append(CONTOUR_OPEN)
+        self._append(_SEGMENT_MOVE, point, point, point, point)
         self._first_point = point
 
     def _lineTo(self, point: _Point) -> None:
-        current = cast(_Point, self._current_point)
-        if point == current:
-            return
-        steps = self._steps(_distance(current, point))
-        step = 1.0 / steps
-        for index in range(1, steps + 1):
-            self._output_pen.lineTo(
-                _interpolate(current, point, index * step)
-            )
-        self._current_point = point
+        start = cast(_Point, self._current_point)
+        self._append(_SEGMENT_LINE, start, start, point, point)
 
     def _curveToOne(
         self,
@@ -139,50 +286,81 @@ class _AdaptiveFlattenPen(BasePen):
         end: _Point,
     ) -> None:
         start = cast(_Point, self._current_point)
-        if control_1 == start and control_2 == end:
-            self._lineTo(end)
-            return
-        steps = self._steps(
-            _estimate_cubic_length(start, control_1, control_2, end)
-        )
-        step = 1.0 / steps
-        for index in range(1, steps + 1):
-            self._output_pen.lineTo(
-                _cubic_point(
-                    index * step,
-                    start,
-                    control_1,
-                    control_2,
-                    end,
-                )
-            )
-        self._current_point = end
+        self._append(_SEGMENT_CUBIC, start, control_1, control_2, end)
 
     def _qCurveToOne(self, control: _Point, end: _Point) -> None:
         start = cast(_Point, self._current_point)
-        if control == start or control == end:
-            self._lineTo(end)
-            return
-        steps = self._steps(calcQuadraticArcLength(start, control, end))
-        step = 1.0 / steps
-        for index in range(1, steps + 1):
-            self._output_pen.lineTo(
-                quadraticPointAtT(start, control, end, index * step)
-            )
-        self._current_point = end
+        self._append(_SEGMENT_QUADRATIC, start, control, control, end)
 
     def _closePath(self) -> None:
         self.lineTo(cast(_Point, self._first_point))
-        self._output_pen.closePath()
+        self.contour_closures[-1] = CONTOUR_CLOSED
         self._current_point = None
         self._first_point = None
 
     def _endPath(self) -> None:
-        self._output_pen.endPath()
+        self.contour_closures[-1] = CONTOUR_ENDED
         self._current_point = None
         self._first_point = None
 
 
+def flatten_glyph_outline(
+    recording: Any,
+    *,
+    approximate_segment_length: float,
+) -> GlyphOutline:
+    """recording pen の輪郭を、概算弧長に応じた数の線分からなる輪郭へ平坦化する。"""
+
+    collector = _SegmentCollectorPen()
+    recording.replay(collector)
+    kinds = np.asarray(collector.kinds, dtype=np.int8)
+    segments = np.asarray(collector.values, dtype=np.float64).reshape(
+        -1,
+        _SEGMENT_VALUES,
+    )
+    coords, point_counts = _flatten_segments(
+        kinds,
+        segments,
+        float(approximate_segment_length),
+        2.0,
+        3.0,
+    )
+    # contour は先頭の move 区間から始まるので、その直前までの出力点数が contour offset。
+    emitted = np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(point_counts)))
+    contour_offsets = np.append(
+        emitted[collector.contour_segments],
+        np.int64(coords.shape[0]),
+    )
+    contour_closures = np.asarray(collector.contour_closures, dtype=np.uint8)
+    for array in (coords, contour_offsets, contour_closures):
+        array.setflags(write=False)
+    return GlyphOutline(
+        coords=coords,
+        contour_offsets=contour_offsets,
+        contour_closures=contour_closures,
+    )
+
+
+def outline_commands(outline: GlyphOutline) -> tuple:
+    """平坦化済み輪郭を RecordingPen 互換の move/line/close コマンドへ戻す。"""
+
+    if type(outline) is not GlyphOutline:
+        raise TypeError("outline は exact GlyphOutline です")
+    points = [(float(x), float(y)) for x, y in outline.coords.tolist()]
+    offsets = outline.contour_offsets.tolist()
+    commands: list[tuple[str, tuple]] = []
+    for index, closure in enumerate(outline.contour_closures.tolist()):
+        start = offsets[index]
+        stop = offsets[index + 1]
+        commands.append(("moveTo", (points[start],)))
+        commands.extend(("lineTo", (point,)) for point in points[start + 1 : stop])
+        if closure == CONTOUR_CLOSED:
+            commands.append(("closePath", ()))
+        elif closure == CONTOUR_ENDED:
+            commands.append(("endPath", ()))
+    return tuple(commands)
+
+
 def flatten_recording(
     recording: Any,
     *,
@@ -190,11 +368,22 @@ def flatten_recording(
 ) -> tuple:
     """recording pen の輪郭を move/line/close コマンドへ平坦化する。"""
 
-    output = RecordingPen()
-    recording.replay(
-        _AdaptiveFlattenPen(
-            output,
-            segment_length=float(approximate_segment_length),
+    return outline_commands(
+        flatten_glyph_outline(
+            recording,
+            approximate_segment_length=approximate_segment_length,
         )
     )
-    return tuple(output.value)
+
+
+@cache
+def flattener_identity() -> str:
+    """平坦化結果を左右する実装（この module と fontTools）の digest を返す。
+
+    on-disk glyph cache の key に含め、実装が変わった entry を使わないようにする。
+    """
+
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(b"\x00fontTools=")
+    digest.update(str(_FONTTOOLS_VERSION).encode("utf-8"))
+    return digest.hexdigest()
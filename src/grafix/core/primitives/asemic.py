@@ -27,7 +27,9 @@ from grafix.core.realized_geometry import GeomTuple
 
 _NUMPY_RNG_MAX_NODES = 32
 _MAX_CACHED_BEZIER_SAMPLES = 64
+_DELAUNAY_RNG_MIN_NODES = 160
 _NUMBA_RNG_KERNEL: Callable[[np.ndarray], np.ndarray] | None = None
+_NUMBA_RNG_CANDIDATE_KERNEL: Callable[[np.ndarray, np.ndarray], np.ndarray] | None = None
 _STROKE_STYLE_CHOICES = ("line", "bezier")
 _TEXT_ALIGN_CHOICES = ("left", "center", "right")
 
@@ -205,19 +207,69 @@ def _build_rng_adjacency(
     *,
     use_numpy: bool = True,
 ) -> list[set[int]]:
-    """Relative Neighborhood Graph (RNG) を構築し、隣接集合を返す。"""
+    """Relative Neighborhood Graph (RNG) を構築し、隣接集合を返す。
+
+    ノード数が多い glyph は Delaunay 辺だけを候補にして O(n log n) で求める。
+    どの経路も同じ比較式で判定するため、同じ点列からは同じ辺が得られる。
+    """
     n = int(points.shape[0])
     if n <= 0:
         return []
 
-    points64 = np.asarray(points, dtype=np.float64)
+    points64 = np.ascontiguousarray(points, dtype=np.float64)
     if use_numpy and n <= _NUMPY_RNG_MAX_NODES:
         matrix = _build_rng_adjacency_matrix_numpy(points64)
+    elif n >= _DELAUNAY_RNG_MIN_NODES:
+        candidates = _delaunay_edge_candidates(points64)
+        if candidates is not None:
+            edges = _filter_rng_candidate_edges(points64, candidates)
+            return _adjacency_sets_from_edges(edges, n)
+        matrix = _build_rng_adjacency_matrix(points64)
     else:
         matrix = _build_rng_adjacency_matrix(points64)
     return [set(np.flatnonzero(matrix[i]).tolist()) for i in range(n)]
 
 
+def _adjacency_sets_from_edges(edges: np.ndarray, n: int) -> list[set[int]]:
+    """無向辺列から、行列経路と同じ昇順挿入の隣接集合を作る。"""
+
+    rows = np.concatenate([edges[:, 0], edges[:, 1]])
+    cols = np.concatenate([edges[:, 1], edges[:, 0]])
+    order = np.lexsort((cols, rows))
+    neighbors = cols[order].tolist()
+    bounds = np.searchsorted(rows[order], np.arange(n + 1)).tolist()
+    return [set(neighbors[bounds[i] : bounds[i + 1]]) for i in range(n)]
+
+
+def _delaunay_edge_candidates(points: np.ndarray) -> np.ndarray | None:
+    """Delaunay 三角形分割の辺を点 index の ``(m, 2)`` 配列で返す。
+
+    RNG 辺は端点を直径とする閉円板に他の点を含まないため、どの Delaunay 三角形分割
+    にも含まれる。重複点や全点共線で三角形分割が RNG を覆えない場合は None を返し、
+    呼び出し側は全組を調べる kernel へ戻る。
+    """
+
+    import shapely  # type: ignore[import-untyped]
+
+    if not np.all(np.isfinite(points)):
+        return None
+    keys = points.view(np.complex128).reshape(-1)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    if np.any(sorted_keys[1:] == sorted_keys[:-1]):
+        return None
+
+    edges = shapely.delaunay_triangles(shapely.multipoints(points), only_edges=True)
+    coords = np.ascontiguousarray(shapely.get_coordinates(edges), dtype=np.float64)
+    if coords.shape[0] < 2 * (points.shape[0] - 1):
+        return None
+    query = coords.view(np.complex128).reshape(-1)
+    positions = np.minimum(np.searchsorted(sorted_keys, query), sorted_keys.shape[0] - 1)
+    if not np.array_equal(sorted_keys[positions], query):
+        return None
+    return np.ascontiguousarray(order[positions].reshape(-1, 2), dtype=np.int64)
+
+
 def _build_rng_adjacency_matrix_numpy(points: np.ndarray) -> np.ndarray:
     """小規模glyph用にRNG adjacencyを一括計算する。"""
 
@@ -282,6 +334,111 @@ def _build_rng_adjacency_matrix(points: np.ndarray) -> np.ndarray:
     return kernel(points)
 
 
+def _filter_rng_candidate_edges_impl(points: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """候補辺のうち lune に他の点を含まないものを ``(m, 2)`` 配列で返す。
+
+    点を一様 grid に振り分け、lune を包む矩形と重なる cell の点だけを調べる。
+    矩形は距離二乗の丸め誤差より広く取るので、全組 kernel と同じ判定になる。
+    """
+
+    n = points.shape[0]
+    x_min = points[0, 0]
+    x_max = points[0, 0]
+    y_min = points[0, 1]
+    y_max = points[0, 1]
+    for i in range(1, n):
+        x_min = min(x_min, points[i, 0])
+        x_max = max(x_max, points[i, 0])
+        y_min = min(y_min, points[i, 1])
+        y_max = max(y_max, points[i, 1])
+    cells_per_axis = max(1, int(np.sqrt(n / 2.0)))
+    cell_size = max(x_max - x_min, y_max - y_min) / cells_per_axis
+    if not cell_size > 0.0:
+        cell_size = 1.0
+    nx = min(int((x_max - x_min) / cell_size) + 1, cells_per_axis + 1)
+    ny = min(int((y_max - y_min) / cell_size) + 1, cells_per_axis + 1)
+
+    cell_of = np.empty(n, dtype=np.int64)
+    cell_start = np.zeros(nx * ny + 1, dtype=np.int64)
+    for i in range(n):
+        cx = min(int((points[i, 0] - x_min) / cell_size), nx - 1)
+        cy = min(int((points[i, 1] - y_min) / cell_size), ny - 1)
+        cell_of[i] = cy * nx + cx
+        cell_start[cell_of[i] + 1] += 1
+    for c in range(nx * ny):
+        cell_start[c + 1] += cell_start[c]
+    cell_fill = cell_start[:-1].copy()
+    cell_points = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        cell_points[cell_fill[cell_of[i]]] = i
+        cell_fill[cell_of[i]] += 1
+
+    m = candidates.shape[0]
+    kept = np.zeros(m, dtype=np.bool_)
+    for e in range(m):
+        i = min(candidates[e, 0], candidates[e, 1])
+        j = max(candidates[e, 0], candidates[e, 1])
+        if i == j:
+            continue
+        dx = points[i, 0] - points[j, 0]
+        dy = points[i, 1] - points[j, 1]
+        dij = dx * dx + dy * dy
+        if not np.isfinite(dij) or dij <= 0.0:
+            continue
+        reach = np.sqrt(dij) * (1.0 + 1e-9)
+        lo_x = max(points[i, 0], points[j, 0]) - reach
+        hi_x = min(points[i, 0], points[j, 0]) + reach
+        lo_y = max(points[i, 1], points[j, 1]) - reach
+        hi_y = min(points[i, 1], points[j, 1]) + reach
+        cx0 = max(0, int(np.floor((lo_x - x_min) / cell_size)))
+        cx1 = min(nx - 1, int(np.floor((hi_x - x_min) / cell_size)))
+        cy0 = max(0, int(np.floor((lo_y - y_min) / cell_size)))
+        cy1 = min(ny - 1, int(np.floor((hi_y - y_min) / cell_size)))
+        blocked = False
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                c = cy * nx + cx
+                for t in range(cell_start[c], cell_start[c + 1]):
+                    k = cell_points[t]
+                    if k == i or k == j:
+                        continue
+                    dx = points[i, 0] - points[k, 0]
+                    dy = points[i, 1] - points[k, 1]
+                    if dx * dx + dy * dy < dij:
+                        dx = points[j, 0] - points[k, 0]
+                        dy = points[j, 1] - points[k, 1]
+                        if dx * dx + dy * dy < dij:
+                            blocked = True
+                            break
+                if blocked:
+                    break
+            if blocked:
+                break
+        kept[e] = not blocked
+
+    edges = np.empty((int(kept.sum()), 2), dtype=np.int64)
+    count = 0
+    for e in range(m):
+        if kept[e]:
+            edges[count, 0] = min(candidates[e, 0], candidates[e, 1])
+            edges[count, 1] = max(candidates[e, 0], candidates[e, 1])
+            count += 1
+    return edges
+
+
+def _filter_rng_candidate_edges(points: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """候補辺の lune 判定 kernel を遅延作成して実行する。"""
+
+    global _NUMBA_RNG_CANDIDATE_KERNEL
+    kernel = _NUMBA_RNG_CANDIDATE_KERNEL
+    if kernel is None:
+        from numba import njit  # type: ignore[attr-defined, import-untyped]
+
+        kernel = njit(cache=True)(_filter_rng_candidate_edges_impl)
+        _NUMBA_RNG_CANDIDATE_KERNEL = kernel
+    return kernel(points, candidates)
+
+
 def _random_walk_strokes(
     rng: np.random.Generator,
     *,
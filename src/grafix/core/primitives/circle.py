@@ -9,6 +9,7 @@ import numpy as np
 from grafix.core.parameters.meta import ParamMeta
 from grafix.core.operation_authoring import primitive
 from grafix.core.realized_geometry import GeomTuple
+from grafix.core.resource_budget import ensure_geometry_output
 
 from ._shape_utils import segment_count, xy_polyline
 
@@ -34,7 +35,50 @@ circle_meta = {
 }
 
 
-@primitive(meta=circle_meta)
+def _circle_batch(
+    radius: float | np.ndarray,
+    segments: int,
+    center: tuple[float, float, float] | np.ndarray,
+) -> GeomTuple:
+    """要素ごとの半径/中心配列から N 個の円を一度に生成する。
+
+    各円の座標は単体の ``circle`` と同じ float64 演算順で求め、bit 単位で一致させる。
+    """
+
+    radii = np.asarray(radius, dtype=np.float64)
+    centers = np.asarray(center, dtype=np.float64)
+    if radii.ndim > 1:
+        raise ValueError("circle の radius 配列は shape (N,) である必要がある")
+    if centers.shape != (3,) and (centers.ndim != 2 or centers.shape[1] != 3):
+        raise ValueError("circle の center 配列は shape (N, 3) である必要がある")
+    counts: set[int] = set()
+    if radii.ndim == 1:
+        counts.add(int(radii.shape[0]))
+    if centers.ndim == 2:
+        counts.add(int(centers.shape[0]))
+    if len(counts) != 1:
+        raise ValueError("circle の配列引数は同じ要素数である必要がある")
+    (n_circles,) = counts
+    if np.any(radii < 0.0):
+        raise ValueError("circle の radius は0以上である必要がある")
+    if segments < 3:
+        raise ValueError("circle の segments は 3 以上である必要がある")
+    n_points = segments + 1
+    ensure_geometry_output("circle", vertices=n_circles * n_points, lines=n_circles)
+
+    angles = np.linspace(0.0, 2.0 * math.pi, n_points, dtype=np.float64)
+    radii_column = np.broadcast_to(radii, (n_circles,))[:, None]
+    centers_rows = np.broadcast_to(centers, (n_circles, 3))
+    coords64 = np.empty((n_circles, n_points, 3), dtype=np.float64)
+    coords64[:, :, 0] = radii_column * np.cos(angles) + centers_rows[:, 0:1]
+    coords64[:, :, 1] = radii_column * np.sin(angles) + centers_rows[:, 1:2]
+    coords64[:, :, 2] = centers_rows[:, 2:3]
+    coords = coords64.reshape(-1, 3).astype(np.float32)
+    offsets = (np.arange(n_circles + 1, dtype=np.int64) * n_points).astype(np.int32)
+    return coords, offsets
+
+
+@primitive(meta=circle_meta, batch_args=("radius", "center"))
 def circle(
     *,
     radius: float = 0.5,
@@ -43,6 +87,9 @@ def circle(
 ) -> GeomTuple:
     """円を閉じたpolylineとして生成する。
 
+    ``G.circle.many(radius=..., center=...)`` では ``radius`` に shape ``(N,)``、
+    ``center`` に shape ``(N, 3)`` の配列を渡し、N 個の円を 1 node で生成できる。
+
     Parameters
     ----------
     radius : float, optional
@@ -53,6 +100,8 @@ def circle(
         円の中心。
     """
 
+    if isinstance(radius, np.ndarray) or isinstance(center, np.ndarray):
+        return _circle_batch(radius, segments, center)
     radius_f = radius
     if radius_f < 0.0:
         raise ValueError("circle の radius は0以上である必要がある")
@@ -0,0 +1,145 @@
+"""
+どこで: `src/grafix/core/primitives/geometry_file.py`。grafix geometry file を読むプリミティブ。
+何を: `grafix.export.geometry_file` が保存した container の 1 layer を memmap で読み、配置して返す。
+なぜ: 別 job で realize 済みの重い scene を、再計算せずに新しい scene の入力として使うため。
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from grafix.core.evaluation_context import (
+    EvaluationContext,
+    EvaluationResources,
+    ExternalDependencyLease,
+    current_external_dependency,
+)
+from grafix.core.geometry_file import GeometryFile, read_geometry_file
+from grafix.core.operation_authoring import primitive
+from grafix.core.parameters.meta import ParamMeta
+from grafix.core.realized_geometry import GeomTuple
+from grafix.core.resource_budget import ensure_geometry_output
+from grafix.core.value_validation import exact_integer
+
+geometry_file_meta = {
+    "path": ParamMeta(
+        kind="str",
+        description="読み込む grafix geometry file のパスを指定し、空文字では何も生成しません。",
+    ),
+    "layer": ParamMeta(
+        kind="int",
+        ui_min=0,
+        ui_max=32,
+        description="file 内で読み込む layer を保存順の番号で指定します。",
+    ),
+    "center": ParamMeta(
+        kind="vec3",
+        ui_min=0.0,
+        ui_max=300.0,
+        description="読み込んだ layer 全体を平行移動する XYZ 座標を指定します。",
+    ),
+    "scale": ParamMeta(
+        kind="float",
+        ui_min=0.0,
+        ui_max=10.0,
+        description="保存時の座標に対して適用する等方スケールを指定します。",
+    ),
+}
+
+
+def _geometry_file_dependency(
+    *,
+    args: tuple[tuple[str, object], ...],
+    context: EvaluationContext,
+    resources: EvaluationResources,
+) -> ExternalDependencyLease:
+    """file を cache lookup 前に開き、内容 digest を cache key へ含める。"""
+
+    values = dict(args)
+    path = values["path"]
+    if type(path) is not str:
+        raise TypeError("geometry_file の path が canonical args ではありません")
+    if values.get("activate") is False or not path:
+        return ExternalDependencyLease(
+            fingerprint=("grafix.geometry-file.inactive.v1",),
+            resource=None,
+        )
+    # 同じ path へ書き直された file は digest が変わり、古い cache entry に当たらない。
+    # export は別 inode へ置換するので、開いた memmap が途中で書き換わることもない。
+    loaded = read_geometry_file(Path(path).expanduser())
+    return ExternalDependencyLease(
+        fingerprint=("grafix.geometry-file.v1", loaded.digest),
+        resource=loaded,
+    )
+
+
+@primitive(meta=geometry_file_meta, external_dependency_hook=_geometry_file_dependency)
+def geometry_file(
+    *,
+    path: str = "",
+    layer: int = 0,
+    center: tuple[float, float, float] = (0.0, 0.0, 0.0),
+    scale: float = 1.0,
+) -> GeomTuple:
+    """grafix geometry file の 1 layer をポリライン列として読み込む。
+
+    Parameters
+    ----------
+    path : str, optional
+        `grafix.export.geometry_file.export_geometry_file` が保存した file の
+        パス。空文字なら空の Geometry を返す。
+    layer : int, optional
+        読み込む layer の番号（保存順、0 始まり）。
+    center : tuple[float, float, float], optional
+        平行移動ベクトル (cx, cy, cz)。
+    scale : float, optional
+        等方スケール倍率 s。
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        保存された layer の座標に ``scale`` と ``center`` を適用した実体ジオメトリ。
+
+    Raises
+    ------
+    ValueError
+        ``layer`` が file の layer 数の範囲外、または file が壊れている場合。
+    FileNotFoundError
+        ``path`` の file が無い場合。
+
+    Notes
+    -----
+    layer の色・線幅は読み込まない。無圧縮 file は memmap で開くため、読むのは
+    選んだ layer の page だけになる。cache key には file の内容 digest が入り、
+    同じ path の file を書き直すと次の評価で読み直す。
+    """
+
+    index = exact_integer(layer, name="geometry_file の layer", minimum=0)
+    if not path:
+        ensure_geometry_output("geometry_file", vertices=0, lines=0)
+        return np.empty((0, 3), dtype=np.float32), np.zeros(1, dtype=np.int32)
+
+    loaded = current_external_dependency(GeometryFile)
+    if index >= len(loaded.layers):
+        raise ValueError(
+            f"geometry_file の layer は 0 以上 {len(loaded.layers)} 未満である必要があります"
+            f": layer={index}"
+        )
+    source = loaded.layers[index]
+    ensure_geometry_output(
+        "geometry_file",
+        vertices=source.vertex_count,
+        lines=source.line_count,
+    )
+
+    coords = np.array(source.coords, dtype=np.float32)
+    if scale != 1.0:
+        coords *= np.float32(scale)
+    if center != (0.0, 0.0, 0.0):
+        coords += np.array(center, dtype=np.float32)
+    return coords, np.array(source.offsets, dtype=np.int32)
+
+
+__all__ = ["geometry_file", "geometry_file_meta"]
@@ -2,6 +2,10 @@
 どこで: `src/grafix/core/primitives/lsystem.py`。L-system（植物/回路）プリミティブの実体生成。
 何を: 文字列規則の展開（L-system）とタートル解釈で、枝ポリライン列を生成する。
 なぜ: 記号的な枝分かれ線（植物/回路）を、少ないパラメータで安定して得るため。
+
+展開結果は記号 code の uint8 配列として持ち、タートル解釈は numba kernel で行う。
+展開前に世代ごとの記号数だけを数えて長さ上限と resource budget を検査し、
+解釈は「線ごとの頂点数を数える pass」と「確保済み coords へ直接書く pass」に分ける。
 """
 
 from __future__ import annotations
@@ -11,13 +15,35 @@ import warnings
 from functools import lru_cache
 
 import numpy as np
+from numba import njit  # type: ignore[attr-defined, import-untyped]
 
 from grafix.core.parameters.meta import ParamMeta
 from grafix.core.operation_authoring import primitive
 from grafix.core.geometry_kernels.packed import empty_packed_geometry
 from grafix.core.realized_geometry import GeomTuple
-
-_MAX_EXPANDED_CHARS = 500_000
+from grafix.core.resource_budget import ensure_geometry_output
+
+_MAX_EXPANDED_CHARS = 32_000_000
+# preset 展開結果を LRU に残す 1 件あたりの上限。16 件で最大 16 MiB に収める。
+_PRESET_CACHE_MAX_BYTES = 1 << 20
+
+# program の記号 code。タートルが解釈する 6 記号は固定 code、それ以外の rules 左辺は
+# 7 以降、どれにも当たらない記号は no-op の 0 にまとめる。
+_CODE_OTHER = 0
+_CODE_DRAW = 1
+_CODE_MOVE = 2
+_CODE_LEFT = 3
+_CODE_RIGHT = 4
+_CODE_PUSH = 5
+_CODE_POP = 6
+_TURTLE_CODES = {
+    "F": _CODE_DRAW,
+    "f": _CODE_MOVE,
+    "+": _CODE_LEFT,
+    "-": _CODE_RIGHT,
+    "[": _CODE_PUSH,
+    "]": _CODE_POP,
+}
 
 _PRESETS: dict[str, tuple[str, dict[str, str]]] = {
     "plant": (
@@ -132,173 +158,375 @@ def _parse_rules_text(rules: str) -> dict[str, str]:
     return out
 
 
-def _expand_lsystem(axiom: str, rules: dict[str, str], *, iters: int) -> str:
-    """L-system を展開して最終文字列を返す。"""
-    s = axiom
+def _encode_lsystem(
+    axiom: str,
+    rules: dict[str, str],
+) -> tuple[np.ndarray, tuple[np.ndarray, ...]]:
+    """axiom と rules を、program code 列と code ごとの置換 code 列へ変換する。"""
+    codes = dict(_TURTLE_CODES)
+    for symbol in rules:
+        codes.setdefault(symbol, len(codes) + 1)
+    # rules 左辺が 249 種を超える場合だけ uint8 に収まらない。
+    dtype = np.uint8 if len(codes) < 256 else np.uint32
+
+    def encode(text: str) -> np.ndarray:
+        return np.fromiter(
+            (codes.get(ch, _CODE_OTHER) for ch in text),
+            dtype=dtype,
+            count=len(text),
+        )
+
+    replacements = [np.array([code], dtype=dtype) for code in range(len(codes) + 1)]
+    for symbol, replacement in rules.items():
+        replacements[codes[symbol]] = encode(replacement)
+    return encode(axiom), tuple(replacements)
+
+
+def _count_expanded_symbols(
+    axiom: np.ndarray,
+    replacements: tuple[np.ndarray, ...],
+    *,
+    iters: int,
+) -> list[int]:
+    """展開せずに、最終世代の code ごとの記号数を返す。
+
+    途中世代も含めて長さが上限を超えた時点で ValueError にする。
+    """
+    alphabet = len(replacements)
+    produced = [np.bincount(item, minlength=alphabet).tolist() for item in replacements]
+    counts = np.bincount(axiom, minlength=alphabet).tolist()
     for _ in range(iters):
-        parts: list[str] = []
-        for ch in s:
-            parts.append(rules.get(ch, ch))
-        s = "".join(parts)
-        if len(s) > _MAX_EXPANDED_CHARS:
+        following = [0] * alphabet
+        for code, count in enumerate(counts):
+            if count:
+                for symbol, amount in enumerate(produced[code]):
+                    following[symbol] += count * amount
+        counts = following
+        if sum(counts) > _MAX_EXPANDED_CHARS:
             raise ValueError(
                 "lsystem の展開結果が大きすぎます（iters/rules を下げてください）"
             )
-    return s
+    return counts
+
+
+@njit(cache=True)
+def _expand_generation(
+    program: np.ndarray,
+    rule_start: np.ndarray,
+    rule_length: np.ndarray,
+    rule_symbols: np.ndarray,
+) -> np.ndarray:
+    """1 世代分の置換を適用した code 列を返す。"""
+    total = 0
+    for i in range(program.shape[0]):
+        total += rule_length[program[i]]
+    out = np.empty(total, dtype=program.dtype)
+    at = 0
+    for i in range(program.shape[0]):
+        start = rule_start[program[i]]
+        length = rule_length[program[i]]
+        for k in range(length):
+            out[at + k] = rule_symbols[start + k]
+        at += length
+    return out
 
 
-@lru_cache(maxsize=16)
-def _expand_preset(kind: str, iters: int) -> str:
-    """組み込みpresetの展開結果を、変更不能な文字列として再利用する。"""
+def _expand_codes(
+    axiom: np.ndarray,
+    replacements: tuple[np.ndarray, ...],
+    *,
+    iters: int,
+) -> np.ndarray:
+    """code 化した L-system を ``iters`` 世代展開する。"""
+    _count_expanded_symbols(axiom, replacements, iters=iters)
+    rule_length = np.array([item.shape[0] for item in replacements], dtype=np.int64)
+    rule_start = np.zeros_like(rule_length)
+    np.cumsum(rule_length[:-1], out=rule_start[1:])
+    rule_symbols = np.concatenate(replacements)
+    program = axiom
+    for _ in range(iters):
+        program = _expand_generation(program, rule_start, rule_length, rule_symbols)
+    return program
+
+
+def _expand_lsystem(axiom: str, rules: dict[str, str], *, iters: int) -> np.ndarray:
+    """L-system を展開して最終 program（code 列）を返す。"""
+    encoded_axiom, replacements = _encode_lsystem(axiom, rules)
+    return _expand_codes(encoded_axiom, replacements, iters=iters)
+
+
+@lru_cache(maxsize=len(_PRESETS))
+def _encode_preset(kind: str) -> tuple[np.ndarray, tuple[np.ndarray, ...]]:
+    """組み込みpresetの code 化結果を再利用する。"""
 
     axiom, rules = _PRESETS[kind]
-    return _expand_lsystem(axiom, rules, iters=iters)
+    return _encode_lsystem(axiom, rules)
 
 
-def _turtle_to_geom_tuple(
-    program: str,
-    *,
-    start_xy: tuple[float, float],
-    heading_deg: float,
-    angle_deg: float,
+@lru_cache(maxsize=16)
+def _expand_preset(kind: str, iters: int) -> np.ndarray:
+    """組み込みpresetの展開結果を、変更不能な code 列として再利用する。
+
+    呼び出し側は展開後の byte 数が ``_PRESET_CACHE_MAX_BYTES`` 以下の場合だけ使う。
+    """
+
+    axiom, replacements = _encode_preset(kind)
+    program = _expand_codes(axiom, replacements, iters=iters)
+    program.flags.writeable = False
+    return program
+
+
+@njit(cache=True)
+def _turtle_layout(
+    program: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, int, int, int, int, int]:
+    """座標を計算せずに、線ごとの頂点数と出力順を数える。
+
+    線は生成順に id を振る（開始線、``f`` と ``[`` が新しい線を始める）。
+    ``rank`` は 2 頂点以上で確定した線の出力順で、捨てる線は -1。
+
+    Returns
+    -------
+    tuple
+        ``(length, rank, kept_lines, max_depth, extra_close, unclosed, random_count)``。
+    """
+    n_ids = 1
+    for i in range(program.shape[0]):
+        code = program[i]
+        if code == _CODE_MOVE or code == _CODE_PUSH:
+            n_ids += 1
+    length = np.zeros(n_ids, dtype=np.int64)
+    rank = np.full(n_ids, -1, dtype=np.int64)
+    stack = np.empty(n_ids, dtype=np.int64)
+
+    current = 0
+    length[0] = 1
+    next_id = 1
+    depth = 0
+    max_depth = 0
+    kept = 0
+    extra_close = 0
+    random_count = 0
+    for i in range(program.shape[0]):
+        code = program[i]
+        if code == _CODE_DRAW:
+            length[current] += 1
+            random_count += 1
+        elif code == _CODE_MOVE:
+            random_count += 1
+            if length[current] >= 2:
+                rank[current] = kept
+                kept += 1
+            current = next_id
+            next_id += 1
+            length[current] = 1
+        elif code == _CODE_LEFT or code == _CODE_RIGHT:
+            random_count += 1
+        elif code == _CODE_PUSH:
+            stack[depth] = current
+            depth += 1
+            max_depth = max(max_depth, depth)
+            current = next_id
+            next_id += 1
+            length[current] = 1
+        elif code == _CODE_POP:
+            if depth == 0:
+                extra_close += 1
+                continue
+            if length[current] >= 2:
+                rank[current] = kept
+                kept += 1
+            depth -= 1
+            current = stack[depth]
+
+    unclosed = depth
+    if length[current] >= 2:
+        rank[current] = kept
+        kept += 1
+    while depth > 0:
+        depth -= 1
+        if length[stack[depth]] >= 2:
+            rank[stack[depth]] = kept
+            kept += 1
+    return length, rank, kept, max_depth, extra_close, unclosed, random_count
+
+
+@njit(cache=True)
+def _turtle_draw(
+    program: np.ndarray,
+    line_start: np.ndarray,
+    max_depth: int,
+    x: float,
+    y: float,
+    heading: float,
+    angle: float,
     step: float,
-    jitter: float,
-    seed: int,
+    random_values: np.ndarray,
     z: float,
-    batch_random: bool,
-) -> GeomTuple:
-    """タートル解釈し、開ポリライン列をpacked geometryとして返す。"""
-    x, y = start_xy
-    heading = math.radians(heading_deg)
-    angle_base = math.radians(angle_deg)
-    step_base = step
-    jitter_f = jitter
+    coords: np.ndarray,
+) -> None:
+    """`_turtle_layout` と同じ順に線 id を振り、各頂点を ``coords`` の確定位置へ書く。
 
-    rng = np.random.default_rng(seed)
-    random_values: np.ndarray | None = None
+    ``line_start`` が -1 の線（2 頂点未満で捨てる線）は書かない。
+    ``random_values`` が空なら jitter なし、そうでなければ ``F f + -`` ごとに 1 つ消費する。
+    """
+    cursor = line_start.copy()
+    stack_line = np.empty(max(max_depth, 1), dtype=np.int64)
+    stack_x = np.empty(max(max_depth, 1), dtype=np.float64)
+    stack_y = np.empty(max(max_depth, 1), dtype=np.float64)
+    stack_heading = np.empty(max(max_depth, 1), dtype=np.float64)
+    jittered = random_values.shape[0] > 0
+
+    current = 0
+    next_id = 1
+    depth = 0
     random_at = 0
-    if (
-        batch_random
-        and 0.0 < jitter_f <= 0.25
-        and abs(heading) <= 20.0 * math.pi
-        and abs(angle_base) <= 2.0 * math.pi
-    ):
-        random_count = sum(program.count(symbol) for symbol in "Ff+-")
-        if random_count:
-            random_values = rng.uniform(
-                -jitter_f,
-                jitter_f,
-                size=random_count,
-            )
-
-    lines_xy: list[list[tuple[float, float]]] = []
-    current: list[tuple[float, float]] = [(x, y)]
-    stack: list[tuple[float, float, float, list[tuple[float, float]]]] = []
-    direction_cache: dict[object, tuple[float, float]] = {}
-
-    def finish_current() -> None:
-        nonlocal current
-        if len(current) >= 2:
-            lines_xy.append(current)
-
-    for ch in program:
-        if ch == "F" or ch == "f":
-            if jitter_f <= 0.0:
-                dist = step_base
-                direction_key: object = (
-                    heading
-                    if heading != 0.0
-                    else (0.0, math.copysign(1.0, heading))
-                )
-                direction = direction_cache.get(direction_key)
-                if direction is None:
-                    direction = (math.cos(heading), math.sin(heading))
-                    if len(direction_cache) < 256:
-                        direction_cache[direction_key] = direction
-                cos_heading, sin_heading = direction
-            else:
-                if random_values is None:
-                    random_value = float(rng.uniform(-jitter_f, jitter_f))
-                else:
-                    random_value = float(random_values[random_at])
-                    random_at += 1
-                dist = step_base * (
-                    1.0 + random_value
-                )
+    cos_heading = 0.0
+    sin_heading = 0.0
+    direction_stale = True
+
+    position = cursor[current]
+    if position >= 0:
+        coords[position, 0] = x
+        coords[position, 1] = y
+        coords[position, 2] = z
+        cursor[current] = position + 1
+
+    for i in range(program.shape[0]):
+        code = program[i]
+        if code == _CODE_DRAW or code == _CODE_MOVE:
+            dist = step
+            if jittered:
+                dist = step * (1.0 + random_values[random_at])
+                random_at += 1
+            if direction_stale:
                 cos_heading = math.cos(heading)
                 sin_heading = math.sin(heading)
+                direction_stale = False
             x += dist * cos_heading
             y += dist * sin_heading
-            if ch == "F":
-                current.append((x, y))
+            if code == _CODE_MOVE:
+                current = next_id
+                next_id += 1
+        elif code == _CODE_LEFT or code == _CODE_RIGHT:
+            turn = angle
+            if jittered:
+                turn = angle * (1.0 + random_values[random_at])
+                random_at += 1
+            if code == _CODE_LEFT:
+                heading = heading + turn
             else:
-                finish_current()
-                current = [(x, y)]
+                heading = heading - turn
+            direction_stale = True
             continue
-
-        if ch == "+" or ch == "-":
-            if jitter_f <= 0.0:
-                d = angle_base
-            else:
-                if random_values is None:
-                    random_value = float(rng.uniform(-jitter_f, jitter_f))
-                else:
-                    random_value = float(random_values[random_at])
-                    random_at += 1
-                d = angle_base * (
-                    1.0 + random_value
-                )
-            heading = heading + d if ch == "+" else heading - d
+        elif code == _CODE_PUSH:
+            stack_line[depth] = current
+            stack_x[depth] = x
+            stack_y[depth] = y
+            stack_heading[depth] = heading
+            depth += 1
+            current = next_id
+            next_id += 1
+        elif code == _CODE_POP:
+            if depth > 0:
+                depth -= 1
+                current = stack_line[depth]
+                x = stack_x[depth]
+                y = stack_y[depth]
+                heading = stack_heading[depth]
+                direction_stale = True
             continue
-
-        if ch == "[":
-            stack.append((x, y, heading, current))
-            current = [(x, y)]
+        else:
             continue
 
-        if ch == "]":
-            if not stack:
-                warnings.warn(
-                    "lsystem のプログラムに余分な ']' があるため無視します",
-                    UserWarning,
-                    stacklevel=3,
-                )
-                continue
-            finish_current()
-            x, y, heading, current = stack.pop()
-            continue
+        position = cursor[current]
+        if position >= 0:
+            coords[position, 0] = x
+            coords[position, 1] = y
+            coords[position, 2] = z
+            cursor[current] = position + 1
+
 
-        # 未知の記号（例: X）は no-op とする。
+def _turtle_to_geom_tuple(
+    program: np.ndarray,
+    *,
+    start_xy: tuple[float, float],
+    heading_deg: float,
+    angle_deg: float,
+    step: float,
+    jitter: float,
+    seed: int,
+    z: float,
+    batch_random: bool = True,
+) -> GeomTuple:
+    """タートル解釈し、開ポリライン列をpacked geometryとして返す。
 
-    if stack:
+    ``batch_random=False`` は乱数を 1 記号ずつ scalar draw する（一括生成と同じ系列）。
+    """
+    length, rank, kept_lines, max_depth, extra_close, unclosed, random_count = (
+        _turtle_layout(program)
+    )
+    for _ in range(extra_close):
+        warnings.warn(
+            "lsystem のプログラムに余分な ']' があるため無視します",
+            UserWarning,
+            stacklevel=3,
+        )
+    if unclosed:
         warnings.warn(
             "lsystem のプログラムに閉じていない '[' があるため、残りを無視します",
             UserWarning,
             stacklevel=3,
         )
 
-    finish_current()
-    while stack:
-        _x, _y, _heading, prev = stack.pop()
-        if len(prev) >= 2:
-            lines_xy.append(prev)
+    random_values = np.zeros(0, dtype=np.float64)
+    if not jitter <= 0.0 and random_count:
+        rng = np.random.default_rng(seed)
+        if batch_random:
+            random_values = rng.uniform(-jitter, jitter, size=random_count)
+        else:
+            random_values = np.array(
+                [float(rng.uniform(-jitter, jitter)) for _ in range(random_count)],
+                dtype=np.float64,
+            )
 
-    zf = z
-    if not lines_xy:
+    if kept_lines == 0:
         return empty_packed_geometry()
 
-    total_vertices = sum(len(poly) for poly in lines_xy)
-    coords = np.empty((total_vertices, 3), dtype=np.float32)
-    offsets = np.empty((len(lines_xy) + 1,), dtype=np.int32)
+    order = np.empty(kept_lines, dtype=np.int64)
+    kept = rank >= 0
+    order[rank[kept]] = np.flatnonzero(kept)
+    vertex_ends = np.cumsum(length[order])
+    total_vertices = int(vertex_ends[-1])
+    ensure_geometry_output(
+        "lsystem",
+        vertices=total_vertices,
+        lines=int(kept_lines),
+        # layout/draw の線 id ごとの int64 配列 4 本と乱数列。
+        scratch_bytes=int(length.shape[0]) * 4 * 8 + random_values.nbytes,
+        hint="iters を下げるか rules を見直してください",
+    )
+
+    offsets = np.empty((kept_lines + 1,), dtype=np.int32)
     offsets[0] = 0
-    cursor = 0
-    for index, poly in enumerate(lines_xy, start=1):
-        xy = np.asarray(poly, dtype=np.float32)
-        next_cursor = cursor + int(xy.shape[0])
-        coords[cursor:next_cursor, :2] = xy
-        coords[cursor:next_cursor, 2] = zf
-        cursor = next_cursor
-        offsets[index] = cursor
+    offsets[1:] = vertex_ends
+    line_start = np.full(length.shape[0], -1, dtype=np.int64)
+    line_start[order] = offsets[:-1]
+    coords = np.empty((total_vertices, 3), dtype=np.float32)
+    x, y = start_xy
+    _turtle_draw(
+        program,
+        line_start,
+        max_depth,
+        float(x),
+        float(y),
+        math.radians(heading_deg),
+        math.radians(angle_deg),
+        float(step),
+        random_values,
+        float(z),
+        coords,
+    )
     return coords, offsets
 
 
@@ -415,14 +643,25 @@ def lsystem(
     cx, cy, cz = center
 
     if kind_s == "custom":
-        rules_map = _parse_rules_text(rules_text)
-        program = _expand_lsystem(ax, rules_map, iters=iters_i)
-        batch_random = False
+        encoded_axiom, replacements = _encode_lsystem(ax, _parse_rules_text(rules_text))
     else:
-        program = _expand_preset(kind_s, iters_i)
-        batch_random = True
-    if not program:
+        encoded_axiom, replacements = _encode_preset(kind_s)
+    counts = _count_expanded_symbols(encoded_axiom, replacements, iters=iters_i)
+    if not sum(counts):
         return empty_packed_geometry()
+    # 各 F は必ず 2 頂点以上の線へ 1 頂点を足すので、展開前に下限で budget を検査できる。
+    ensure_geometry_output(
+        "lsystem",
+        vertices=counts[_CODE_DRAW],
+        lines=0,
+        scratch_bytes=sum(counts),
+        hint="iters を下げるか rules を見直してください",
+    )
+    if kind_s != "custom" and sum(counts) * encoded_axiom.itemsize <= _PRESET_CACHE_MAX_BYTES:
+        program = _expand_preset(kind_s, iters_i)
+    else:
+        # custom と大きな preset 展開は cache に残さず、評価ごとに展開する。
+        program = _expand_codes(encoded_axiom, replacements, iters=iters_i)
 
     return _turtle_to_geom_tuple(
         program,
@@ -433,5 +672,4 @@ def lsystem(
         jitter=jitter,
         seed=seed_i,
         z=cz,
-        batch_random=batch_random,
     )
@@ -32,20 +32,56 @@ def _endpoint3(point: tuple[float, ...]) -> tuple[float, float, float]:
         raise ValueError("polyline の座標は float64 に変換可能である必要があります") from exc
 
 
+def _polyline_from_array(points: np.ndarray, *, closed: bool) -> GeomTuple:
+    """shape (N,2)/(N,3) の浮動小数配列から単一 polyline を作る。"""
+
+    if points.ndim != 2 or points.shape[1] not in {2, 3}:
+        raise ValueError(
+            "polyline の points 配列は shape (N,2) または (N,3) である必要があります"
+        )
+    if points.dtype.kind != "f":
+        raise TypeError("polyline の points 配列は浮動小数 dtype である必要があります")
+    count = int(points.shape[0])
+    if count == 0:
+        ensure_geometry_output("polyline", vertices=0, lines=0)
+        return np.empty((0, 3), dtype=np.float32), np.zeros(1, dtype=np.int32)
+    if not np.isfinite(points).all():
+        raise ValueError("polyline の座標は有限値である必要があります")
+    if np.max(np.abs(points)) > _FLOAT32_MAX:
+        raise ValueError("polyline の座標は float32 の範囲内である必要があります")
+
+    dimension = int(points.shape[1])
+    first = points[0]
+    last = points[-1]
+    append_start = closed and bool(np.any(first != last))
+    vertex_count = count + int(append_start)
+    ensure_geometry_output("polyline", vertices=vertex_count, lines=1)
+
+    coords = np.empty((vertex_count, 3), dtype=np.float32)
+    coords[:count, :dimension] = points
+    if dimension == 2:
+        coords[:count, 2] = 0.0
+    if append_start:
+        coords[-1] = coords[0]
+    return coords, np.array([0, coords.shape[0]], dtype=np.int32)
+
+
 @primitive(meta=polyline_meta)
 def polyline(
     *,
-    points: tuple[tuple[float, ...], ...] = ((-0.5, 0.0), (0.5, 0.0)),
+    points: tuple[tuple[float, ...], ...] | np.ndarray = ((-0.5, 0.0), (0.5, 0.0)),
     closed: bool = False,
 ) -> GeomTuple:
     """2D/3D point列から単一polylineを生成する。
 
     ``points`` はcode-owned引数で、Parameter GUIには表示しない。
     ``closed=True`` では必要な場合だけ先頭点を末尾へ追加する。
+    大きな点列は shape ``(N, 2)``/``(N, 3)`` の float32/float64 配列で渡すと、
+    tuple へ展開せず内容 digest で署名される。
 
     Parameters
     ----------
-    points : tuple[tuple[float, ...], ...], optional
+    points : tuple[tuple[float, ...], ...] or np.ndarray, optional
         入力順に単一ポリラインを構成する 2 次元または 3 次元点列。
         2 次元点の Z 座標は 0 とし、空列からは空の Geometry を生成する。
     closed : bool, optional
@@ -57,8 +93,12 @@ def polyline(
         単一ポリラインを表す座標配列とオフセット配列。
     """
 
+    if isinstance(points, np.ndarray):
+        return _polyline_from_array(points, closed=closed)
     if type(points) is not tuple:
-        raise TypeError("polyline の points は exact tuple である必要があります")
+        raise TypeError(
+            "polyline の points は exact tuple または np.ndarray である必要があります"
+        )
 
     count = len(points)
     if count == 0:
@@ -10,6 +10,10 @@ from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from typing import NoReturn, Protocol
 
+import numpy as np
+
+from grafix.core.cancellation import EvaluationCancelled, check_cancelled
+from grafix.core.compact_geometry import CompactGeometry, compact_geometry
 from grafix.core.evaluation_context import (
     EvaluationContext,
     EvaluationFingerprint,
@@ -18,6 +22,8 @@ from grafix.core.evaluation_context import (
     bind_external_dependency,
 )
 from grafix.core.geometry import Geometry, GeometryId
+from grafix.core.geometry_kernels.planar import planar_content_key_context
+from grafix.core.instanced_geometry import InstancedGeometry
 from grafix.core.lifecycle import CleanupErrors
 from grafix.core.operation_catalog import bind_operation_catalog, current_operation_catalog
 from grafix.core.operation_diagnostics import emit_operation_diagnostic
@@ -29,9 +35,26 @@ from grafix.core.runtime_config import (
     current_runtime_config,
 )
 from grafix.core.runtime_limits import DEFAULT_FINAL_RUNTIME_LIMITS, RuntimeLimits
+from grafix.core.simulation_checkpoints import (
+    SimulationCheckpoints,
+    simulation_checkpoint_context,
+)
+from grafix.core.thread_budget import ThreadBudget
 from grafix.core.value_validation import exact_integer, exact_string
 
 
+_NODE_COST_CAPACITY = 4096
+"""RealizeSession が保持する node 単位評価時間の最大件数。"""
+
+_CHECKPOINT_BYTES_DIVISOR = 4
+"""RealizeCacheStore の byte 上限のうち simulation checkpoint へ割く割合の逆数。"""
+
+_DEFAULT_COMPACT_DECIMALS = 3
+"""compact tier が quantized 表現で試す格子の小数桁数（G-code export の既定と同じ）。"""
+
+_CacheEntry = RealizedGeometry | InstancedGeometry | CompactGeometry
+
+
 class PerformanceRecorder(Protocol):
     """RealizeSession が依存する最小 performance 記録契約。"""
 
@@ -102,6 +125,17 @@ class CacheStats:
     evictions: int
     entries: int
     bytes: int
+    logical_bytes: int
+    compact_entries: int
+    checkpoint_bytes: int
+
+    @property
+    def compression_ratio(self) -> float:
+        """展開後 byte 数 / 実占有 byte 数。compact tier 無効時や空 cache では 1.0。"""
+
+        if self.bytes == 0:
+            return 1.0
+        return self.logical_bytes / self.bytes
 
 
 class RealizeCacheStore:
@@ -110,24 +144,53 @@ class RealizeCacheStore:
     __slots__ = (
         "_cache",
         "_cache_bytes",
+        "_checkpoints",
         "_closed",
+        "_compact",
+        "_compact_decimals",
+        "_compact_entries",
         "_evictions",
+        "_geometry_max_bytes",
         "_hits",
         "_lock",
+        "_logical_bytes",
         "_max_bytes",
         "_max_entries",
         "_misses",
     )
 
-    def __init__(self, *, max_bytes: int, max_entries: int) -> None:
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        max_entries: int,
+        compact: bool = False,
+        compact_decimals: int = _DEFAULT_COMPACT_DECIMALS,
+    ) -> None:
+        if type(compact) is not bool:
+            raise TypeError("compact は bool です")
         self._max_bytes = exact_integer(max_bytes, name="max_bytes", minimum=0)
         self._max_entries = exact_integer(max_entries, name="max_entries", minimum=0)
+        self._compact = compact
+        self._compact_decimals = exact_integer(
+            compact_decimals,
+            name="compact_decimals",
+            minimum=0,
+        )
         self._lock = threading.Lock()
-        self._cache: OrderedDict[GeometryCacheKey, RealizedGeometry] = OrderedDict()
+        self._cache: OrderedDict[GeometryCacheKey, _CacheEntry] = OrderedDict()
         self._cache_bytes = 0
+        # compact entry を展開したときの byte 数。圧縮率の統計にだけ使う。
+        self._logical_bytes = 0
+        self._compact_entries = 0
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        # simulation の途中状態は geometry と別 tier に置き、CPU cache 上限を二つに分ける。
+        # 両 tier の合計は max_bytes を超えない。
+        checkpoint_max_bytes = self._max_bytes // _CHECKPOINT_BYTES_DIVISOR
+        self._geometry_max_bytes = self._max_bytes - checkpoint_max_bytes
+        self._checkpoints = SimulationCheckpoints(max_bytes=checkpoint_max_bytes)
         self._closed = False
 
     @classmethod
@@ -139,6 +202,7 @@ class RealizeCacheStore:
         return cls(
             max_bytes=limits.cpu_cache_bytes,
             max_entries=limits.cpu_cache_entries,
+            compact=limits.cpu_cache_compact,
         )
 
     @property
@@ -146,8 +210,17 @@ class RealizeCacheStore:
         with self._lock:
             return self._closed
 
+    @property
+    def checkpoints(self) -> SimulationCheckpoints:
+        """growth などが反復途中の状態を再利用する checkpoint tier を返す。"""
+
+        return self._checkpoints
+
     def get(self, key: GeometryCacheKey) -> RealizedGeometry | None:
-        """key を lookup し、hit 時だけ LRU/stat を更新する。"""
+        """key を lookup し、hit 時だけ LRU/stat を更新する。
+
+        compact entry は lock の外で毎回新しい RealizedGeometry へ展開する。
+        """
 
         if type(key) is not GeometryCacheKey:
             raise TypeError("key は exact GeometryCacheKey です")
@@ -158,7 +231,9 @@ class RealizeCacheStore:
             if cached is not None:
                 self._cache.move_to_end(key)
                 self._hits += 1
-            return cached
+        if type(cached) is CompactGeometry:
+            return cached.decode()
+        return cached
 
     def record_staged_hit(self) -> None:
         """transaction-local entry の hit を store-wide stats へ加える。"""
@@ -181,17 +256,23 @@ class RealizeCacheStore:
 
         if type(key) is not GeometryCacheKey:
             raise TypeError("key は exact GeometryCacheKey です")
-        if type(result) is not RealizedGeometry:
-            raise TypeError("result は exact RealizedGeometry です")
-        size = result.byte_size
+        if type(result) is not RealizedGeometry and type(result) is not InstancedGeometry:
+            raise TypeError("result は exact RealizedGeometry または InstancedGeometry です")
+        entry: _CacheEntry = result
+        if self._compact and type(result) is RealizedGeometry:
+            # 可逆に縮められる entry だけ置き換える。encode は lock の外で行う。
+            compacted = compact_geometry(result, decimals=self._compact_decimals)
+            if compacted is not None and compacted.byte_size < result.byte_size:
+                entry = compacted
+        size = entry.byte_size
         with self._lock:
             if self._closed:
                 raise RuntimeError("close 済みの RealizeCacheStore は使用できません")
-            if size > self._max_bytes:
+            if size > self._geometry_max_bytes:
                 emit_operation_diagnostic(
                     op="runtime.cpu_cache",
                     original_value=size,
-                    effective_value=self._max_bytes,
+                    effective_value=self._geometry_max_bytes,
                     reason="result exceeded the CPU cache limit and was not cached",
                     severity="warning",
                 )
@@ -201,17 +282,17 @@ class RealizeCacheStore:
 
             previous = self._cache.pop(key, None)
             if previous is not None:
-                self._cache_bytes -= previous.byte_size
+                self._forget_entry(previous)
 
             projected_bytes = self._cache_bytes + size
-            byte_limit_reached = projected_bytes > self._max_bytes
+            byte_limit_reached = projected_bytes > self._geometry_max_bytes
             evicted_count = 0
             while self._cache and (
                 len(self._cache) >= self._max_entries
-                or self._cache_bytes + size > self._max_bytes
+                or self._cache_bytes + size > self._geometry_max_bytes
             ):
                 _, evicted = self._cache.popitem(last=False)
-                self._cache_bytes -= evicted.byte_size
+                self._forget_entry(evicted)
                 evicted_count += 1
             self._evictions += evicted_count
 
@@ -219,15 +300,30 @@ class RealizeCacheStore:
                 emit_operation_diagnostic(
                     op="runtime.cpu_cache",
                     original_value=projected_bytes,
-                    effective_value=self._max_bytes,
+                    effective_value=self._geometry_max_bytes,
                     reason=f"CPU cache limit evicted {evicted_count} entrie(s)",
                     severity="info",
                 )
 
-            self._cache[key] = result
+            self._cache[key] = entry
             self._cache_bytes += size
+            if type(entry) is CompactGeometry:
+                self._logical_bytes += entry.logical_byte_size
+                self._compact_entries += 1
+            else:
+                self._logical_bytes += size
             return evicted_count
 
+    def _forget_entry(self, entry: _CacheEntry) -> None:
+        """取り除いた entry の byte 数を lock 内で統計から引く。"""
+
+        self._cache_bytes -= entry.byte_size
+        if type(entry) is CompactGeometry:
+            self._logical_bytes -= entry.logical_byte_size
+            self._compact_entries -= 1
+        else:
+            self._logical_bytes -= entry.byte_size
+
     def stats(self) -> CacheStats:
         """store-wide cache statistics を返す。"""
 
@@ -238,6 +334,9 @@ class RealizeCacheStore:
                 evictions=self._evictions,
                 entries=len(self._cache),
                 bytes=self._cache_bytes,
+                logical_bytes=self._logical_bytes,
+                compact_entries=self._compact_entries,
+                checkpoint_bytes=self._checkpoints.bytes,
             )
 
     def clear(self) -> None:
@@ -248,6 +347,9 @@ class RealizeCacheStore:
                 return
             self._cache.clear()
             self._cache_bytes = 0
+            self._logical_bytes = 0
+            self._compact_entries = 0
+        self._checkpoints.clear()
 
     def close(self) -> None:
         """store を一度だけ閉じて全 entry を解放する。"""
@@ -258,6 +360,9 @@ class RealizeCacheStore:
             self._closed = True
             self._cache.clear()
             self._cache_bytes = 0
+            self._logical_bytes = 0
+            self._compact_entries = 0
+        self._checkpoints.clear()
 
 
 @dataclass(slots=True)
@@ -315,9 +420,12 @@ class RealizeSession:
         cache_store: RealizeCacheStore | None = None,
         runtime_limits: RuntimeLimits = DEFAULT_FINAL_RUNTIME_LIMITS,
         profiler: PerformanceRecorder | None = None,
+        thread_budget: ThreadBudget | None = None,
     ) -> None:
         if type(runtime_limits) is not RuntimeLimits:
             raise TypeError("runtime_limits は exact RuntimeLimits です")
+        if thread_budget is not None and type(thread_budget) is not ThreadBudget:
+            raise TypeError("thread_budget は exact ThreadBudget または None です")
         owns_resources = resources is None
         owns_cache_store = cache_store is None
         selected_resources: EvaluationResources | None = None
@@ -360,12 +468,14 @@ class RealizeSession:
             self._cache_store = selected_store
             self._runtime_limits = runtime_limits
             self._profiler = profiler
+            self._thread_budget = thread_budget
             self._lock = threading.Lock()
             self._cache_transaction_local = threading.local()
             self._evaluation_local = threading.local()
             self._inflight: dict[GeometryCacheKey, _InflightEntry] = {}
             self._uncached_generation = 0
             self._active_realizations = 0
+            self._node_costs: OrderedDict[GeometryId, int] = OrderedDict()
             self._owns_resources = owns_resources
             self._owns_cache_store = owns_cache_store
             self._closed = False
@@ -434,6 +544,15 @@ class RealizeSession:
     def stats(self) -> CacheStats:
         return self._cache_store.stats()
 
+    def node_cost_ns(self, geometry_id: GeometryId) -> int | None:
+        """直近に評価した node 単体（入力の評価を除く）の所要時間を返す。
+
+        未評価、または記録上限から外れた node は None を返す。
+        """
+
+        with self._lock:
+            return self._node_costs.get(geometry_id)
+
     @contextlib.contextmanager
     def profile_layer(self, name: str) -> Iterator[None]:
         profiler = self._profiler
@@ -587,11 +706,18 @@ class RealizeSession:
         root_key: GeometryCacheKey,
     ) -> RealizedGeometry:
         frames: list[_EvaluationFrame] = []
+        # node 単体の評価時間はこの呼び出し内で貯め、最後に一度だけ session へ反映する。
+        node_costs: list[tuple[GeometryId, int]] = []
+        # InstancedGeometry 入力の展開配列は弱参照でしか memo されないため、この walk の
+        # 間だけ強参照で保持し、同じ入力を使う後続 node が再展開しないようにする。
+        expansions: dict[int, tuple[InstancedGeometry, np.ndarray, np.ndarray]] = {}
         current: Geometry | None = geometry
         pending: RealizedGeometry | None = None
         try:
             while True:
                 if current is not None:
+                    # kernel 内の chunk 境界に加え、node の開始前にも取り消しを確認する。
+                    check_cancelled()
                     started = self._start_evaluation(
                         current,
                         self._node_key(current, root_key),
@@ -606,7 +732,7 @@ class RealizeSession:
                             current = started.inputs[0]
                             started.next_input = 1
                             continue
-                        pending = self._finish_evaluation(started)
+                        pending = self._finish_evaluation(started, node_costs, expansions)
                         frames.pop()
                         current = None
 
@@ -622,11 +748,14 @@ class RealizeSession:
                     current = parent.inputs[parent.next_input]
                     parent.next_input += 1
                     continue
-                pending = self._finish_evaluation(parent)
+                pending = self._finish_evaluation(parent, node_costs, expansions)
                 frames.pop()
                 current = None
         except BaseException as error:  # noqa: BLE001
             self._abort_evaluations(frames, error)
+        finally:
+            if node_costs:
+                self._merge_node_costs(node_costs)
 
     def _start_evaluation(
         self,
@@ -654,18 +783,23 @@ class RealizeSession:
                 raise RealizeError(f"Geometry の評価に失敗した: id={geometry.id}") from error
 
         with self._lock:
-            cached = self._get_cached(key)
-            if cached is not None:
-                return cached
-            entry = self._inflight.get(key)
-            if entry is None:
-                entry = _InflightEntry(condition=threading.Condition(self._lock))
-                self._inflight[key] = entry
-                self._cache_store.record_miss()
-                self._record_cache(misses=1)
-            else:
+            while True:
+                cached = self._get_cached(key)
+                if cached is not None:
+                    return cached
+                entry = self._inflight.get(key)
+                if entry is None:
+                    entry = _InflightEntry(condition=threading.Condition(self._lock))
+                    self._inflight[key] = entry
+                    self._cache_store.record_miss()
+                    self._record_cache(misses=1)
+                    break
                 while not entry.done:
                     entry.condition.wait()
+                if isinstance(entry.error, EvaluationCancelled):
+                    # owner 側の取り消しは待機側の評価を止める理由にならない。
+                    # entry は既に外れているので、次の周回でこの thread が引き継ぐ。
+                    continue
                 if entry.error is not None:
                     if not isinstance(entry.error, Exception):
                         raise entry.error
@@ -703,8 +837,19 @@ class RealizeSession:
             return geometry.inputs
         return Geometry._flatten_concat_inputs(geometry.inputs)
 
-    def _finish_evaluation(self, frame: _EvaluationFrame) -> RealizedGeometry:
-        result = self._evaluate_geometry_node(frame.geometry, frame.realized_inputs)
+    def _finish_evaluation(
+        self,
+        frame: _EvaluationFrame,
+        node_costs: list[tuple[GeometryId, int]],
+        expansions: dict[int, tuple[InstancedGeometry, np.ndarray, np.ndarray]],
+    ) -> RealizedGeometry:
+        for realized in frame.realized_inputs:
+            if type(realized) is InstancedGeometry and id(realized) not in expansions:
+                expansions[id(realized)] = (realized, realized.coords, realized.offsets)
+        started_ns = time.perf_counter_ns()
+        with planar_content_key_context(self._planar_content_keys(frame)):
+            result = self._evaluate_geometry_node(frame.geometry, frame.realized_inputs)
+        node_costs.append((frame.geometry.id, time.perf_counter_ns() - started_ns))
         if not frame.cacheable:
             return result
         entry = frame.inflight
@@ -721,6 +866,38 @@ class RealizeSession:
             completed.condition.notify_all()
         return result
 
+    def _planar_content_keys(
+        self,
+        frame: _EvaluationFrame,
+    ) -> tuple[tuple[np.ndarray, tuple[GeometryCacheKey, str]], ...]:
+        """cacheable な effect 入力の配列へ、内容を表す GeometryCacheKey を対応させる。
+
+        compact tier の展開結果や InstancedGeometry の展開配列は評価ごとに別配列になるため、
+        shared frame memo は配列 identity ではなくこの key で結果を共有する。
+        """
+
+        if frame.geometry.op == "concat":
+            return ()
+        bindings: list[tuple[np.ndarray, tuple[GeometryCacheKey, str]]] = []
+        for source, realized in zip(frame.inputs, frame.realized_inputs, strict=True):
+            if not source.cacheable:
+                continue
+            key = self._node_key(source, frame.key)
+            bindings.append((realized.coords, (key, "coords")))
+            bindings.append((realized.offsets, (key, "offsets")))
+        return tuple(bindings)
+
+    def _merge_node_costs(self, node_costs: Sequence[tuple[GeometryId, int]]) -> None:
+        """1 回の realize で貯めた node 単体の評価時間を上限付き LRU へ反映する。"""
+
+        with self._lock:
+            costs = self._node_costs
+            for geometry_id, elapsed_ns in node_costs:
+                costs.pop(geometry_id, None)
+                costs[geometry_id] = elapsed_ns
+            while len(costs) > _NODE_COST_CAPACITY:
+                costs.popitem(last=False)
+
     def _abort_evaluations(
         self,
         frames: list[_EvaluationFrame],
@@ -737,7 +914,10 @@ class RealizeSession:
                         completed.error = current_error
                         completed.done = True
                         completed.condition.notify_all()
-            if isinstance(current_error, Exception):
+            # 取り消しは失敗ではないため、caller が識別できるよう包まずに送出する。
+            if isinstance(current_error, Exception) and not isinstance(
+                current_error, EvaluationCancelled
+            ):
                 wrapped = RealizeError(
                     f"Geometry の評価に失敗した: id={frame.geometry.id}"
                 )
@@ -770,6 +950,15 @@ class RealizeSession:
         if profiler is not None and profiler.enabled:
             profiler.record_cache(hits=hits, misses=misses, evictions=evictions)
 
+    @contextlib.contextmanager
+    def _thread_allowance(self) -> Iterator[None]:
+        budget = self._thread_budget
+        if budget is None:
+            yield
+            return
+        with budget.evaluation():
+            yield
+
     @contextlib.contextmanager
     def _profile_operation(self, op: str) -> Iterator[None]:
         profiler = self._profiler
@@ -794,10 +983,8 @@ class RealizeSession:
                 def evaluate() -> RealizedGeometry:
                     ensure_geometry_output(
                         "concat",
-                        vertices=sum(int(item.coords.shape[0]) for item in realized_inputs),
-                        lines=sum(
-                            max(0, int(item.offsets.size) - 1) for item in realized_inputs
-                        ),
+                        vertices=sum(item.vertex_count for item in realized_inputs),
+                        lines=sum(item.line_count for item in realized_inputs),
                         hint="入力 geometry または concat 対象数を減らしてください",
                     )
                     return concat_realized_geometries(*realized_inputs)
@@ -844,12 +1031,14 @@ class RealizeSession:
                 bind_runtime_config(self._context.config),
                 preview_quality_context(self._context.quality),
                 bind_external_dependency(external_snapshot, geometry.id),
+                simulation_checkpoint_context(self._cache_store.checkpoints),
+                self._thread_allowance(),
             ):
                 result = evaluate()
                 ensure_geometry_output(
                     op,
-                    vertices=int(result.coords.shape[0]),
-                    lines=max(0, int(result.offsets.size) - 1),
+                    vertices=result.vertex_count,
+                    lines=result.line_count,
                     hint="operation の入力または出力パラメータを減らしてください",
                 )
                 return result
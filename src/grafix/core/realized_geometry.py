@@ -119,6 +119,18 @@ class RealizedGeometry:
 
         return int(self.coords.nbytes + self.offsets.nbytes)
 
+    @property
+    def vertex_count(self) -> int:
+        """頂点数を返す。"""
+
+        return int(self.coords.shape[0])
+
+    @property
+    def line_count(self) -> int:
+        """ポリライン本数を返す。"""
+
+        return max(0, int(self.offsets.size) - 1)
+
     def _with_coords(self, coords: object) -> RealizedGeometry | None:
         """検証済み offsets を共有できる場合だけ新しい内部 geometry を返す。
 
@@ -139,6 +151,37 @@ class RealizedGeometry:
         return result
 
 
+def realized_geometry_from_readonly_views(
+    coords: np.ndarray,
+    offsets: np.ndarray,
+) -> RealizedGeometry:
+    """検証済み geometry の read-only view を copy せずに包む。
+
+    shared memory 上の配列など、生成元 process で ``RealizedGeometry`` として検証済みの
+    内容だけを渡す。shape/dtype/layout と端点は確認するが、全要素の有限性・単調性の
+    走査は省く。
+    """
+
+    for name, array in (("coords", coords), ("offsets", offsets)):
+        if type(array) is not np.ndarray:
+            raise TypeError(f"{name} は exact np.ndarray である必要がある")
+        if array.flags.writeable:
+            raise ValueError(f"{name} は read-only view である必要がある")
+        if not array.flags.c_contiguous:
+            raise ValueError(f"{name} は C-contiguous である必要がある")
+    if coords.ndim != 2 or coords.shape[1] != 3 or coords.dtype != np.float32:
+        raise TypeError("coords は float32 shape (N,3) である必要がある")
+    if offsets.ndim != 1 or offsets.size == 0 or offsets.dtype != np.int32:
+        raise TypeError("offsets は int32 shape (M+1,) である必要がある")
+    if offsets[0] != 0 or offsets[-1] != coords.shape[0]:
+        raise ValueError("offsets の端点が coords 行数と一致しない")
+
+    result = object.__new__(RealizedGeometry)
+    object.__setattr__(result, "coords", coords)
+    object.__setattr__(result, "offsets", offsets)
+    return result
+
+
 def realized_geometry_from_tuple(value: object, *, context: str) -> RealizedGeometry:
     """`(coords, offsets)` を `RealizedGeometry` に変換する。
 
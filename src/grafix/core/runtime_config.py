@@ -106,6 +106,9 @@ class RuntimeConfig:
         `python -m grafix export` における G-code 出力設定。
     midi_inputs:
         MIDI 入力の設定。各要素は (port_name, mode)。
+    cpu_threads:
+        numba kernel と worker process が共有する CPU thread 数。None は
+        ``os.cpu_count()``。
     """
 
     config_path: Path | None
@@ -122,6 +125,7 @@ class RuntimeConfig:
     png_scale: float
     gcode: GCodeParams
     midi_inputs: tuple[tuple[str, str], ...]
+    cpu_threads: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -964,6 +968,21 @@ def _parse_midi_section(payload: dict[str, Any]) -> tuple[tuple[str, str], ...]:
     return tuple(_as_midi_inputs(midi.get("inputs")))
 
 
+def _parse_performance_section(payload: dict[str, Any]) -> int | None:
+    """``performance`` section を検証して CPU thread 数を返す。"""
+
+    performance = _as_mapping(payload.get("performance"), key="performance")
+    cpu_threads = _as_int(
+        performance.get("cpu_threads"),
+        key="performance.cpu_threads",
+    )
+    if cpu_threads is not None and cpu_threads < 1:
+        raise ValueError(
+            f"performance.cpu_threads は 1 以上である必要があります: got={cpu_threads}"
+        )
+    return cpu_threads
+
+
 def load_runtime_config_report(
     config_path: str | Path | None = None,
 ) -> RuntimeConfigReport:
@@ -1056,6 +1075,7 @@ def load_runtime_config_report(
     ui = _parse_ui_section(payload)
     export = _parse_export_section(payload)
     midi_inputs = _parse_midi_section(payload)
+    cpu_threads = _parse_performance_section(payload)
 
     cfg = RuntimeConfig(
         # config_path は「ユーザー設定の出典」を記録する用途（同梱デフォルトにはパスが無い）。
@@ -1073,6 +1093,7 @@ def load_runtime_config_report(
         png_scale=export.png_scale,
         gcode=export.gcode,
         midi_inputs=midi_inputs,
+        cpu_threads=cpu_threads,
     )
     raw_leaves = _flatten_config_leaves(raw_effective)
     report_values: list[RuntimeConfigValue] = []
@@ -1133,6 +1154,7 @@ def _packaged_runtime_config_report() -> RuntimeConfigReport:
     ui = _parse_ui_section(payload)
     export = _parse_export_section(payload)
     midi_inputs = _parse_midi_section(payload)
+    cpu_threads = _parse_performance_section(payload)
     cfg = RuntimeConfig(
         config_path=None,
         output_dir=paths.output_dir,
@@ -1148,6 +1170,7 @@ def _packaged_runtime_config_report() -> RuntimeConfigReport:
         png_scale=export.png_scale,
         gcode=export.gcode,
         midi_inputs=midi_inputs,
+        cpu_threads=cpu_threads,
     )
     values: list[RuntimeConfigValue] = []
     base_dir = Path.cwd().resolve()
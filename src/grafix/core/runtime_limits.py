@@ -26,9 +26,13 @@ class RuntimeLimits:
     scene : ResourceBudget
         1 scene 全体の集約上限。
     cpu_cache_bytes : int
-        realize cache が保持できる推定 byte 数。
+        realize cache が保持できる推定 byte 数。1/4 を simulation checkpoint、
+        残りを geometry entry に割り当て、両者の合計はこの値を超えない。
     cpu_cache_entries : int
         realize cache が保持できる entry 数。
+    cpu_cache_compact : bool
+        True なら realize cache が planar/格子上の geometry を可逆な compact 表現で
+        保持し、hit 時に展開する。
     gpu_cache_bytes : int
         renderer の GPU mesh cache 上限。
     capture_queue_pending_jobs : int
@@ -41,6 +45,7 @@ class RuntimeLimits:
     scene: ResourceBudget = DEFAULT_RESOURCE_BUDGET
     cpu_cache_bytes: int = DEFAULT_CPU_CACHE_BYTES
     cpu_cache_entries: int = DEFAULT_CPU_CACHE_ENTRIES
+    cpu_cache_compact: bool = False
     gpu_cache_bytes: int = DEFAULT_GPU_CACHE_BYTES
     capture_queue_pending_jobs: int = DEFAULT_CAPTURE_QUEUE_PENDING_JOBS
     capture_queue_bytes: int = DEFAULT_CAPTURE_QUEUE_BYTES
@@ -50,6 +55,8 @@ class RuntimeLimits:
             raise TypeError("per_operation は ResourceBudget である必要があります")
         if not isinstance(self.scene, ResourceBudget):
             raise TypeError("scene は ResourceBudget である必要があります")
+        if type(self.cpu_cache_compact) is not bool:
+            raise TypeError("cpu_cache_compact は bool である必要があります")
         for name in (
             "cpu_cache_bytes",
             "cpu_cache_entries",
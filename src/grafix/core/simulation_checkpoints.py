@@ -0,0 +1,169 @@
+"""反復 simulation の途中状態を反復数ごとに保持する checkpoint tier。"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import numpy as np
+
+from grafix.core.value_validation import exact_integer, exact_string
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationCheckpoint:
+    """``iteration`` 回進めた時点の simulation 状態。
+
+    Parameters
+    ----------
+    iteration : int
+        状態に到達するまでに実行した反復数。
+    state : object
+        effect 固有の不変な状態。格納後に配列を書き換えてはならない。
+    byte_size : int
+        tier の容量計算に使う状態の大きさ。
+    """
+
+    iteration: int
+    state: object
+    byte_size: int
+
+    def __post_init__(self) -> None:
+        exact_integer(self.iteration, name="iteration", minimum=0)
+        exact_integer(self.byte_size, name="byte_size", minimum=0)
+
+
+class SimulationCheckpoints:
+    """反復数を除く全入力の digest を key にした bounded LRU。
+
+    Notes
+    -----
+    simulation は決定的なので、同じ key の k 反復目の状態から続きを回した結果は
+    最初から回した結果と一致する。`iters` を増やす編集や時間で `iters` を動かす
+    animation は、直前の checkpoint から差分だけを計算できる。
+    """
+
+    __slots__ = ("_bytes", "_entries", "_iterations", "_lock", "_max_bytes")
+
+    def __init__(self, *, max_bytes: int) -> None:
+        self._max_bytes = exact_integer(max_bytes, name="max_bytes", minimum=0)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, int], SimulationCheckpoint] = OrderedDict()
+        self._iterations: dict[str, set[int]] = {}
+        self._bytes = 0
+
+    @property
+    def entries(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def bytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def nearest(self, key: str, iteration: int) -> SimulationCheckpoint | None:
+        """``iteration`` 以下で最も進んだ checkpoint を返す。"""
+
+        exact_string(key, name="key")
+        target = exact_integer(iteration, name="iteration", minimum=0)
+        with self._lock:
+            candidates = self._iterations.get(key)
+            if not candidates:
+                return None
+            best = max((item for item in candidates if item <= target), default=None)
+            if best is None:
+                return None
+            entry_key = (key, best)
+            self._entries.move_to_end(entry_key)
+            return self._entries[entry_key]
+
+    def put(self, key: str, checkpoint: SimulationCheckpoint) -> None:
+        """checkpoint を格納し、容量を超えた分を古い順に捨てる。"""
+
+        exact_string(key, name="key")
+        if type(checkpoint) is not SimulationCheckpoint:
+            raise TypeError("checkpoint は exact SimulationCheckpoint です")
+        if checkpoint.iteration == 0 or checkpoint.byte_size > self._max_bytes:
+            return
+        entry_key = (key, checkpoint.iteration)
+        with self._lock:
+            previous = self._entries.pop(entry_key, None)
+            if previous is not None:
+                self._bytes -= previous.byte_size
+            while self._entries and self._bytes + checkpoint.byte_size > self._max_bytes:
+                (evicted_key, evicted_iteration), evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.byte_size
+                iterations = self._iterations[evicted_key]
+                iterations.discard(evicted_iteration)
+                if not iterations:
+                    del self._iterations[evicted_key]
+            self._entries[entry_key] = checkpoint
+            self._iterations.setdefault(key, set()).add(checkpoint.iteration)
+            self._bytes += checkpoint.byte_size
+
+    def clear(self) -> None:
+        """全 checkpoint を破棄する。"""
+
+        with self._lock:
+            self._entries.clear()
+            self._iterations.clear()
+            self._bytes = 0
+
+
+def simulation_checkpoint_key(namespace: str, *parts: object) -> str:
+    """simulation の反復数以外の入力から checkpoint key を作る。
+
+    ndarray は dtype・shape・内容で、それ以外は ``repr`` で区別する。
+    """
+
+    digest = hashlib.sha256(exact_string(namespace, name="namespace").encode("utf-8"))
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            array = np.ascontiguousarray(part)
+            digest.update(f"ndarray:{array.dtype.str}:{array.shape}".encode("ascii"))
+            digest.update(array.view(np.uint8).reshape(-1).data)
+        else:
+            digest.update(f"{type(part).__name__}:{part!r}".encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+_simulation_checkpoints_var: contextvars.ContextVar[SimulationCheckpoints | None] = (
+    contextvars.ContextVar("simulation_checkpoints", default=None)
+)
+
+
+def current_simulation_checkpoints() -> SimulationCheckpoints | None:
+    """現在 evaluation の checkpoint tier を返す。realize の外では None。"""
+
+    return _simulation_checkpoints_var.get()
+
+
+@contextlib.contextmanager
+def simulation_checkpoint_context(
+    checkpoints: SimulationCheckpoints | None,
+) -> Iterator[None]:
+    """evaluation 中だけ checkpoint tier を束縛し、終了時に復元する。"""
+
+    if checkpoints is not None and type(checkpoints) is not SimulationCheckpoints:
+        raise TypeError("checkpoints は SimulationCheckpoints または None です")
+    token = _simulation_checkpoints_var.set(checkpoints)
+    try:
+        yield
+    finally:
+        _simulation_checkpoints_var.reset(token)
+
+
+__all__ = [
+    "SimulationCheckpoint",
+    "SimulationCheckpoints",
+    "current_simulation_checkpoints",
+    "simulation_checkpoint_context",
+    "simulation_checkpoint_key",
+]
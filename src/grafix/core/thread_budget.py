@@ -0,0 +1,253 @@
+"""numba kernel と worker process が共有する CPU thread budget。
+
+mp-draw や export の worker はそれぞれ別 process で numba を初期化するため、何もしないと
+全 process が全 core を自分のものとして使い、worker 数 × core 数の thread が競合する。
+`ThreadBudget` は子 process と evaluation ごとに thread 数の上限（allowance）を配り、
+numba の ``set_num_threads`` を evaluation 中だけ下げる。kernel 側は従来どおり
+``get_num_threads()`` で serial / parallel を選ぶので、allowance が 1 なら serial
+kernel が選ばれる。
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import numba
+
+from grafix.core.runtime_config import RuntimeConfig
+from grafix.core.value_validation import exact_integer
+
+
+def _numba_thread_limit() -> int:
+    """``set_num_threads`` に渡せる最大値（起動時に確定した numba pool の大きさ）。"""
+
+    return max(1, int(numba.config.NUMBA_NUM_THREADS))
+
+
+def apply_process_thread_allowance(allowance: int) -> int:
+    """worker process の起動時に呼び、呼び出し thread の numba thread 数を制限する。
+
+    Returns
+    -------
+    int
+        実際に設定した thread 数。numba pool より大きい allowance は切り詰める。
+    """
+
+    threads = min(
+        exact_integer(allowance, name="allowance", minimum=1),
+        _numba_thread_limit(),
+    )
+    numba.set_num_threads(threads)
+    return threads
+
+
+@dataclass(frozen=True, slots=True)
+class ThreadBudgetSnapshot:
+    """thread budget の配分状況。perf telemetry へ渡す。
+
+    Attributes
+    ----------
+    total_threads : int
+        budget 全体の thread 数。
+    reserved_threads : int
+        稼働中の子 process が予約している thread 数。
+    process_allowance : int
+        自 process が evaluation へ配れる thread 数。
+    active_evaluations : int
+        現在実行中の evaluation 数。
+    demand_threads : int
+        予約 thread と、自 process で実行中 evaluation の allowance 合計（最低 1）の和。
+    peak_demand_threads : int
+        生成以降の ``demand_threads`` の最大値。
+    oversubscribed_evaluations : int
+        demand が total を超えた状態で開始した evaluation の累計。
+    """
+
+    total_threads: int
+    reserved_threads: int
+    process_allowance: int
+    active_evaluations: int
+    demand_threads: int
+    peak_demand_threads: int
+    oversubscribed_evaluations: int
+
+    @property
+    def oversubscribed(self) -> bool:
+        """現在の demand が budget を超えているか。"""
+
+        return self.demand_threads > self.total_threads
+
+
+class ThreadReservation:
+    """`ThreadBudget.reserve()` が返す子 process 分の thread 予約。"""
+
+    __slots__ = ("_budget", "_released", "_threads")
+
+    def __init__(self, budget: ThreadBudget, threads: int) -> None:
+        self._budget = budget
+        self._threads = threads
+        self._released = False
+
+    @property
+    def threads(self) -> int:
+        """予約した thread 数。"""
+
+        return self._threads
+
+    def release(self) -> None:
+        """予約を返却する。冪等。"""
+
+        if self._released:
+            return
+        self._released = True
+        self._budget._release(self._threads)
+
+
+class ThreadBudget:
+    """子 process と evaluation へ CPU thread を配分する。
+
+    Parameters
+    ----------
+    total_threads : int or None, optional
+        budget 全体の thread 数。None は ``os.cpu_count()``。
+
+    Notes
+    -----
+    spawn 済み process の thread 数は後から変えられないため、子 process の allowance は
+    `child_allowance()` で spawn 時に確定し、子が実際に CPU を使う間だけ `reserve()` で
+    予約する。自 process の allowance は予約の残りで、同時に走る evaluation 数で
+    さらに等分する。どの配分も最低 1 thread で、下限に張り付いた分が
+    oversubscription として telemetry に現れる。
+    """
+
+    __slots__ = (
+        "_active_allowances",
+        "_active_evaluations",
+        "_lock",
+        "_oversubscribed_evaluations",
+        "_peak_demand_threads",
+        "_reserved_threads",
+        "_total_threads",
+    )
+
+    def __init__(self, *, total_threads: int | None = None) -> None:
+        self._total_threads = (
+            max(1, os.cpu_count() or 1)
+            if total_threads is None
+            else exact_integer(total_threads, name="total_threads", minimum=1)
+        )
+        self._lock = threading.Lock()
+        self._reserved_threads = 0
+        self._active_evaluations = 0
+        self._active_allowances = 0
+        self._peak_demand_threads = 1
+        self._oversubscribed_evaluations = 0
+
+    @classmethod
+    def from_config(cls, config: RuntimeConfig) -> ThreadBudget:
+        """``performance.cpu_threads`` から budget を作る。"""
+
+        if not isinstance(config, RuntimeConfig):
+            raise TypeError("config は RuntimeConfig である必要があります")
+        return cls(total_threads=config.cpu_threads)
+
+    @property
+    def total_threads(self) -> int:
+        return self._total_threads
+
+    def process_allowance(self) -> int:
+        """予約の残りとして自 process が使ってよい thread 数を返す。"""
+
+        with self._lock:
+            return self._process_allowance_locked()
+
+    def child_allowance(self, count: int = 1) -> int:
+        """自 process と ``count`` 個の子 process で残りを等分した 1 子分を返す。"""
+
+        process_count = exact_integer(count, name="count", minimum=1)
+        with self._lock:
+            return max(
+                1,
+                (self._total_threads - self._reserved_threads) // (1 + process_count),
+            )
+
+    def reserve(self, threads: int) -> ThreadReservation:
+        """子 process が CPU を使う間の thread を予約する。"""
+
+        reserved = exact_integer(threads, name="threads", minimum=0)
+        with self._lock:
+            self._reserved_threads += reserved
+            self._update_peak_locked()
+        return ThreadReservation(self, reserved)
+
+    @contextlib.contextmanager
+    def evaluation(self) -> Iterator[int]:
+        """evaluation 中だけ呼び出し thread の numba thread 数を allowance へ下げる。
+
+        numba の thread 数は thread-local なので、別 thread の evaluation とは
+        互いに干渉しない。終了時は直前の値へ戻す。
+        """
+
+        with self._lock:
+            self._active_evaluations += 1
+            allowance = max(
+                1,
+                self._process_allowance_locked() // self._active_evaluations,
+            )
+            self._active_allowances += allowance
+            if self._demand_threads_locked() > self._total_threads:
+                self._oversubscribed_evaluations += 1
+            self._update_peak_locked()
+        try:
+            previous = numba.get_num_threads()
+            numba.set_num_threads(min(allowance, _numba_thread_limit()))
+            try:
+                yield allowance
+            finally:
+                numba.set_num_threads(previous)
+        finally:
+            with self._lock:
+                self._active_evaluations -= 1
+                self._active_allowances -= allowance
+
+    def snapshot(self) -> ThreadBudgetSnapshot:
+        """現在の配分状況を返す。"""
+
+        with self._lock:
+            return ThreadBudgetSnapshot(
+                total_threads=self._total_threads,
+                reserved_threads=self._reserved_threads,
+                process_allowance=self._process_allowance_locked(),
+                active_evaluations=self._active_evaluations,
+                demand_threads=self._demand_threads_locked(),
+                peak_demand_threads=self._peak_demand_threads,
+                oversubscribed_evaluations=self._oversubscribed_evaluations,
+            )
+
+    def _release(self, threads: int) -> None:
+        with self._lock:
+            self._reserved_threads -= threads
+
+    def _process_allowance_locked(self) -> int:
+        return max(1, self._total_threads - self._reserved_threads)
+
+    def _demand_threads_locked(self) -> int:
+        return self._reserved_threads + max(1, self._active_allowances)
+
+    def _update_peak_locked(self) -> None:
+        self._peak_demand_threads = max(
+            self._peak_demand_threads,
+            self._demand_threads_locked(),
+        )
+
+
+__all__ = [
+    "ThreadBudget",
+    "ThreadBudgetSnapshot",
+    "ThreadReservation",
+    "apply_process_thread_allowance",
+]
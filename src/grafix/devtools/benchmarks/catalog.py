@@ -8,6 +8,7 @@ from grafix.devtools.benchmarks import (
     mp_draw_benchmark,
     parameter_edit_benchmark,
     parameter_hotpath_benchmark,
+    parameter_table_render_benchmark,
     perf_hotpath_benchmark,
     primitive_benchmark,
     remaining_effect_benchmark,
@@ -28,6 +29,7 @@ def case_definitions() -> tuple[CaseDefinition, ...]:
             primitive_benchmark,
             parameter_hotpath_benchmark,
             parameter_edit_benchmark,
+            parameter_table_render_benchmark,
             perf_hotpath_benchmark,
             interactive_scenario_benchmark,
             renderer_benchmark,
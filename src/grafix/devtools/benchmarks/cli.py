@@ -336,6 +336,8 @@ def _effective_child_environment(*, mode: str) -> dict[str, str | None]:
     }
     if mode == "compile-cold":
         overrides["NUMBA_CACHE_DIR"] = "<isolated-empty>"
+        overrides["GRAFIX_FINGERPRINT_CACHE_DIR"] = "<isolated-empty>"
+        overrides["GRAFIX_GLYPH_CACHE_DIR"] = "<isolated-empty>"
     return overrides
 
 
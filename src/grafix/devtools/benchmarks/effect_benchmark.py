@@ -58,6 +58,24 @@ def case_definitions() -> tuple[CaseDefinition, ...]:
         ),
         *_effect_definitions(),
         *_target_effect_speedup_definitions(),
+        define_case(
+            "effect.chain.fill_clip_boolean.rings_2",
+            "fill -> clip -> boolean / shared planar frame",
+            category="effect",
+            suite="effects",
+            fixture="rings_2",
+            parameters={
+                "fixture": "rings_2",
+                "union_fixture": "many_rings",
+                "density": 200.0,
+                "angle": 30.0,
+            },
+            tags=("chain", "rings", "shared-planar-frame", "exact-checksum"),
+            selectable_suites=("effects",),
+            setup=_setup_planar_chain,
+            workload=_workload_planar_chain,
+            support_source_files=(_CASES_SOURCE_FILE,),
+        ),
     )
 
 
@@ -322,6 +340,78 @@ def _setup_effect(parameters: dict[str, Any], seed: int) -> object:
     )
 
 
+def _setup_planar_chain(parameters: dict[str, Any], seed: int) -> object:
+    from grafix.core.builtins import builtin_operation_catalog
+    from grafix.devtools.benchmarks.cases import build_default_cases
+
+    fixtures = {case.case_id: case for case in build_default_cases(seed=seed)}
+    region = fixtures[str(parameters["fixture"])].inputs[0]
+    other = fixtures[str(parameters["union_fixture"])].inputs[0]
+    catalog = builtin_operation_catalog()
+
+    def prepare(name: str, **overrides: Any) -> tuple[Any, tuple[tuple[str, object], ...]]:
+        spec = catalog.resolve("effect", name)
+        return spec.evaluator, tuple(sorted({**spec.schema.defaults, **overrides}.items()))
+
+    return (
+        region,
+        other,
+        prepare(
+            "fill",
+            density=float(parameters["density"]),
+            angle=float(parameters["angle"]),
+            remove_boundary=True,
+        ),
+        prepare("clip", mode="inside"),
+        prepare("boolean", mode="union"),
+    )
+
+
+def _workload_planar_chain(state: object) -> BenchmarkOutput:
+    from grafix.core.geometry_kernels.planar import shared_frame_stats
+    from grafix.core.realized_geometry import concat_realized_geometries
+
+    def realized(output: Any) -> RealizedGeometry:
+        if isinstance(output, RealizedGeometry):
+            return output
+        return RealizedGeometry(coords=output[0], offsets=output[1])
+
+    region, other, (fill, fill_args), (clip, clip_args), (boolean, boolean_args) = cast(
+        tuple[RealizedGeometry, RealizedGeometry, Any, Any, Any],
+        state,
+    )
+    before = shared_frame_stats()
+    # effect 間は RealizeSession と同じく immutable な RealizedGeometry で受け渡す。
+    # fill と clip の mask は同じ region snapshot なので frame と局所座標を共有する。
+    hatch = realized(fill((region,), fill_args))
+    clipped = realized(clip((hatch, region), clip_args))
+    outline = realized(boolean((region, other), boolean_args))
+    after = shared_frame_stats()
+    geometry = concat_realized_geometries(clipped, outline)
+    return BenchmarkOutput(
+        value=geometry,
+        metrics=(
+            *(
+                Metric(
+                    name=name,
+                    kind="counter",
+                    unit="count",
+                    phase="measure",
+                    scope="effect",
+                    value=value,
+                )
+                for name, value in (
+                    ("n_vertices", int(geometry.coords.shape[0])),
+                    ("n_lines", int(geometry.offsets.size - 1)),
+                    ("work.hatch_lines", int(hatch.offsets.size - 1)),
+                    ("work.shared_frame_hits", after.hits - before.hits),
+                    ("work.shared_frame_misses", after.misses - before.misses),
+                )
+            ),
+        ),
+    )
+
+
 def _diagnostic_effective_value(
     diagnostics: tuple[OperationDiagnostic, ...],
     *,
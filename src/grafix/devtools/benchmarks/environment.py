@@ -31,6 +31,8 @@ _DEPENDENCIES = (
 )
 _ENVIRONMENT_VARIABLES = (
     "GRAFIX_CONFIG",
+    "GRAFIX_FINGERPRINT_CACHE_DIR",
+    "GRAFIX_GLYPH_CACHE_DIR",
     "GRAFIX_PERF",
     "GRAFIX_PERF_GPU_FINISH",
     "MKL_NUM_THREADS",
@@ -230,6 +230,12 @@ def _run_child(
             cache_dir = temp / "numba-cache"
             cache_dir.mkdir()
             environment["NUMBA_CACHE_DIR"] = str(cache_dir)
+            fingerprint_cache_dir = temp / "fingerprint-cache"
+            fingerprint_cache_dir.mkdir()
+            environment["GRAFIX_FINGERPRINT_CACHE_DIR"] = str(fingerprint_cache_dir)
+            glyph_cache_dir = temp / "glyph-cache"
+            glyph_cache_dir.mkdir()
+            environment["GRAFIX_GLYPH_CACHE_DIR"] = str(glyph_cache_dir)
         try:
             completed = run_isolated_process(
                 list(child_command(request_path, result_path)),
@@ -34,7 +34,7 @@ def geometry_checksum(geometry: RealizedGeometry) -> str:
 def canonical_checksum(value: object) -> tuple[str, str]:
     """Benchmark output を exact checksum 化する。"""
 
-    if type(value) is RealizedGeometry:
+    if isinstance(value, RealizedGeometry):
         return geometry_checksum(value), "realized_geometry_exact_v1"
     if type(value) is Geometry:
         digest = hashlib.sha256(b"grafix.geometry.concat-semantics.v1\0")
@@ -332,7 +332,7 @@ def _hash_array(digest: Any, array: np.ndarray) -> None:
 
 
 def _json_value(value: object) -> object:
-    if type(value) is RealizedGeometry:
+    if isinstance(value, RealizedGeometry):
         return {
             "$grafix_checksum_type": "realized_geometry",
             "coords": _json_value(value.coords),
@@ -71,6 +71,20 @@ def case_definitions() -> tuple[CaseDefinition, ...]:
             support_source_files=(Path(__file__),),
             self_sampling=True,
         ),
+        define_case(
+            "mp.draw.reload",
+            "MpDraw source reload to first frame (hot swap / restart)",
+            category="mp",
+            suite="mp",
+            fixture="light_draw_source_generations",
+            parameters={"reloads": 6, "n_worker": 2},
+            tags=("multiprocessing", "source-reload", "reload-to-first-frame"),
+            selectable_suites=("mp",),
+            setup=setup_passthrough,
+            workload=workload_mp_reload,
+            support_source_files=(Path(__file__),),
+            self_sampling=True,
+        ),
     )
 
 
@@ -350,6 +364,9 @@ def _measure_slider_sequence(
             "checksum_matches_sync": final_checksum == expected_checksum,
             "snapshot_broadcasts": mp_draw.snapshot_broadcast_count,
             "snapshot_payload_copies": mp_draw.snapshot_payload_copy_count,
+            "snapshot_keyframes": mp_draw.snapshot_keyframe_count,
+            "snapshot_deltas": mp_draw.snapshot_delta_count,
+            "snapshot_delta_entries": mp_draw.snapshot_delta_entry_count,
             "snapshot_acks": mp_draw.snapshot_ack_count,
             "submitted_tasks": submitted,
             "enqueued_tasks": mp_draw.task_enqueue_count,
@@ -364,6 +381,90 @@ def _measure_slider_sequence(
         mp_draw.close()
 
 
+def run_mp_reload_benchmarks(*, reloads: int, n_worker: int) -> dict[str, Any]:
+    """source reload から新 draw の first result までを hot swap と restart で比較する。
+
+    restart は reload 毎に MpDraw を作り直す従来経路（spawn + ready 待ち）を再現する。
+    どちらも draw を交互に差し替え、受け取った scene が新 draw の checksum と
+    一致することを確認する。
+    """
+
+    reload_count = max(1, int(reloads))
+    worker_count = max(1, int(n_worker))
+    draws = (light_translate_draw, light_scale_draw)
+    expected = {draw: _scene_checksum(draw, {}) for draw in draws}
+    modes: dict[str, Any] = {}
+    for mode_name in ("hot_swap", "restart"):
+        effective_config = runtime_config()
+        mp_draw = MpDraw(light_draw, n_worker=worker_count, effective_config=effective_config)
+        latencies_ms: list[float] = []
+        checksum_matches = 0
+        try:
+            _first_result_for_generation(mp_draw)
+            for reload_index in range(reload_count):
+                draw = draws[reload_index % len(draws)]
+                started = time.perf_counter_ns()
+                if mode_name == "hot_swap":
+                    mp_draw.swap_draw(draw)
+                else:
+                    previous = mp_draw
+                    mp_draw = MpDraw(draw, n_worker=worker_count, effective_config=effective_config)
+                    previous.close()
+                result = _first_result_for_generation(mp_draw)
+                latencies_ms.append((time.perf_counter_ns() - started) / 1_000_000.0)
+                if tuple(str(layer.geometry.id) for layer in result.layers) == expected[draw]:
+                    checksum_matches += 1
+            modes[mode_name] = {
+                "reload_to_first_frame_ms": _summarize_distribution(latencies_ms),
+                "reloads": reload_count,
+                "checksum_matches": checksum_matches,
+                "source_swaps": mp_draw.source_swap_count,
+                "swap_fallbacks": mp_draw.source_swap_fallback_count,
+                "restarts": mp_draw.restart_count,
+            }
+        finally:
+            mp_draw.close()
+
+    hot_swap_median = float(modes["hot_swap"]["reload_to_first_frame_ms"]["median"])
+    restart_median = float(modes["restart"]["reload_to_first_frame_ms"]["median"])
+    return {
+        "output": {
+            "reloads": reload_count,
+            "n_worker": worker_count,
+            "measurement_scope": "reload call -> first result of the new draw generation",
+        },
+        "modes": modes,
+        "restart_to_hot_swap_ratio": (
+            0.0 if hot_swap_median <= 0.0 else restart_median / hot_swap_median
+        ),
+    }
+
+
+def _first_result_for_generation(mp_draw: MpDraw) -> Any:
+    """現在世代の結果が届くまで latest-wins で submit を続ける。"""
+
+    generation = mp_draw.generation
+    deadline = time.monotonic() + _RESULT_TIMEOUT_S
+    frame = 0
+    while time.monotonic() < deadline:
+        mp_draw.submit(
+            t=float(frame),
+            snapshot_revision=0,
+            snapshot={},
+            effect_order_snapshot={},
+            epoch=mp_draw.current_epoch,
+            quality="draft",
+        )
+        frame += 1
+        result = mp_draw.poll_latest()
+        if result is not None and result.generation == generation:
+            if result.error is not None:
+                raise RuntimeError(f"mp-draw reload benchmark draw failed:\n{result.error}")
+            return result
+        time.sleep(0.0002)
+    raise TimeoutError("mp-draw reload first result timeout")
+
+
 def _scene_checksum(draw: Any, snapshot: ParamSnapshot) -> tuple[str, ...]:
     with parameter_context_from_snapshot(snapshot):
         layers = normalize_scene(draw(0.0))
@@ -757,6 +858,9 @@ def workload_mp_slider_churn(state: object) -> BenchmarkOutput:
                 "final_input_revision",
                 "snapshot_broadcasts",
                 "snapshot_payload_copies",
+                "snapshot_keyframes",
+                "snapshot_deltas",
+                "snapshot_delta_entries",
                 "snapshot_acks",
                 "submitted_tasks",
                 "enqueued_tasks",
@@ -862,3 +966,74 @@ __all__ = [
     "run_mp_draw_benchmarks",
     "run_mp_slider_churn_benchmarks",
 ]
+
+
+def workload_mp_reload(state: object) -> BenchmarkOutput:
+    parameters = cast(dict[str, Any], state)
+    payload = run_mp_reload_benchmarks(
+        reloads=int(parameters["reloads"]),
+        n_worker=int(parameters["n_worker"]),
+    )
+    output = cast(dict[str, Any], payload["output"])
+    metrics: list[Metric] = [
+        gauge_metric(
+            "restart_to_hot_swap_ratio",
+            float(payload["restart_to_hot_swap_ratio"]),
+            unit="ratio",
+            phase="measure",
+            scope="mp_reload",
+        ),
+    ]
+    contracts: list[ContractResult] = []
+    for mode_name, mode in cast(dict[str, Any], payload["modes"]).items():
+        metrics.extend(
+            percentile_summary_metrics(
+                f"modes.{mode_name}.reload_to_first_frame_ms",
+                cast(dict[str, Any], mode["reload_to_first_frame_ms"]),
+                unit="ms",
+                phase="measure",
+                scope="mp_reload",
+            )
+        )
+        for name in ("reloads", "checksum_matches", "source_swaps", "swap_fallbacks", "restarts"):
+            metrics.append(
+                counter_metric(
+                    f"modes.{mode_name}.{name}",
+                    int(mode[name]),
+                    unit="count",
+                    phase="measure",
+                    scope="mp_reload",
+                )
+            )
+        contracts.append(
+            evaluate_contract(
+                contract_id=f"mp.reload.{mode_name}.checksum",
+                severity="hard",
+                actual=int(mode["checksum_matches"]),
+                comparator="eq",
+                limit=int(mode["reloads"]),
+                reason="reload 後の first result は新しい draw の scene と一致する",
+            )
+        )
+    hot_swap = cast(dict[str, Any], payload["modes"]["hot_swap"])
+    contracts.extend(
+        (
+            evaluate_contract(
+                contract_id="mp.reload.hot_swap.no_respawn",
+                severity="hard",
+                actual=int(hot_swap["restarts"]),
+                comparator="eq",
+                limit=0,
+                reason="hot swap は worker process を起動し直さない",
+            ),
+            evaluate_contract(
+                contract_id="mp.reload.hot_swap.faster_than_restart",
+                severity="soft",
+                actual=float(payload["restart_to_hot_swap_ratio"]),
+                comparator="ge",
+                limit=1.0,
+                reason="hot swap の reload-to-first-frame は restart より短い",
+            ),
+        )
+    )
+    return BenchmarkOutput(value=output, metrics=tuple(metrics), contracts=tuple(contracts))
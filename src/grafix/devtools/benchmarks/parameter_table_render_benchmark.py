@@ -0,0 +1,331 @@
+"""PARAM-02: 実 ImGui で描く parameter table の frame cost benchmark。"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from grafix.devtools.benchmarks.definition import CaseDefinition, define_case
+from grafix.devtools.benchmarks.metrics import counter_metric, gauge_metric
+from grafix.devtools.benchmarks.parameter_hotpath_benchmark import (
+    parameter_store_fixture,
+)
+from grafix.devtools.benchmarks.schema import (
+    BenchmarkOutput,
+    ContractResult,
+    Metric,
+    evaluate_contract,
+    summarize_distribution,
+)
+from grafix.interactive.parameter_gui import store_bridge
+from grafix.interactive.parameter_gui import table as table_module
+from grafix.interactive.parameter_gui.table import TableEdits, TableRenderInput
+
+_SCOPE = "parameter-table-renderer(real-imgui,headless,no-gpu)"
+_WINDOW_SIZE = (1200.0, 800.0)
+# 800 px の view に入る行数 + overscan を十分に上回る上限。行数に比例して
+# 描画すると 100 行 case でも超えるため、仮想化の退行を検出できる。
+_RENDERED_ROWS_LIMIT = 64
+
+
+def case_definitions() -> tuple[CaseDefinition, ...]:
+    """PARAM-02 の 100/1,000/10,000-row formal cases を返す。"""
+
+    return tuple(
+        define_case(
+            f"gui.parameter_table_frame.rows_{rows}",
+            f"parameter table ImGui frame ({rows:,} rows)",
+            category="gui",
+            suite="gui",
+            fixture="parameter_store_single_key_edit",
+            parameters={"rows": rows, "frames": frames},
+            tags=(
+                "PARAM-02",
+                "real-imgui",
+                "virtualized-table",
+                "exact-checksum",
+            ),
+            selectable_suites=selectable_suites,
+            setup=setup_parameter_table_render_scenario,
+            workload=workload_parameter_table_render_scenario,
+            support_source_files=(
+                Path(__file__),
+                Path(__file__).with_name("parameter_hotpath_benchmark.py"),
+            ),
+            self_sampling=True,
+        )
+        for rows, frames, selectable_suites in (
+            (100, 12, ("smoke", "gui")),
+            (1_000, 12, ("gui",)),
+            (10_000, 12, ("gui", "soak")),
+        )
+    )
+
+
+def setup_parameter_table_render_scenario(
+    parameters: dict[str, Any],
+    _seed: int,
+) -> object:
+    """Parameter table render scenario を構築する。"""
+
+    return make_parameter_table_render_scenario(parameters)
+
+
+def workload_parameter_table_render_scenario(state: object) -> BenchmarkOutput:
+    """Parameter table render scenario を一回実行する。"""
+
+    if not isinstance(state, ParameterTableRenderScenario):
+        raise TypeError("parameter table render scenario state is invalid")
+    return run_parameter_table_render_scenario(state)
+
+
+@dataclass(frozen=True, slots=True)
+class ParameterTableRenderScenario:
+    """再利用可能な parameter table render benchmark state。"""
+
+    rows: int
+    frames: int
+    render_input: TableRenderInput
+
+
+def make_parameter_table_render_scenario(
+    parameters: dict[str, Any],
+) -> ParameterTableRenderScenario:
+    """JSON-compatible parameters から検証済み benchmark state を作る。"""
+
+    rows = int(parameters["rows"])
+    frames = int(parameters["frames"])
+    if rows < 1:
+        raise ValueError("rows は 1 以上である必要があります")
+    if frames < 1:
+        raise ValueError("frames は 1 以上である必要があります")
+
+    store_bridge.clear_parameter_table_model_cache()
+    store = parameter_store_fixture(rows=rows)
+    table_view = store_bridge.parameter_table_view_for_store(
+        store,
+        show_inactive_params=True,
+    )
+    render_rows, _view_rows = store_bridge._rows_for_table_view(table_view)
+    render_input = TableRenderInput(
+        group_layout=table_view.group_layout,
+        model_rows=render_rows,
+        catalog=table_view.model.catalog,
+        collapsed_headers=store.collapsed_headers(),
+    )
+    return ParameterTableRenderScenario(
+        rows=rows,
+        frames=frames,
+        render_input=render_input,
+    )
+
+
+def run_parameter_table_render_scenario(
+    scenario: ParameterTableRenderScenario,
+) -> BenchmarkOutput:
+    """headless ImGui context で table を描き、frame cost と描画行数を測る。
+
+    GPU 描画と input event は scope に含めない。先頭 frame で block 高さを
+    計測した後、先頭・中央・末尾へ scroll した定常 frame を計測する。
+    """
+
+    import imgui
+
+    render_input = scenario.render_input
+    expected_rows = [
+        render_input.model_rows[item.row_index]
+        for block in render_input.group_layout
+        for item in block.items
+    ]
+    rendered_rows = 0
+    original_row_renderer = table_module.render_parameter_row_4cols
+
+    def counted_row_renderer(row, **kwargs):
+        nonlocal rendered_rows
+        rendered_rows += 1
+        return original_row_renderer(row, **kwargs)
+
+    first_frame_ms = 0.0
+    frame_ms: list[float] = []
+    max_rendered_rows = 0
+    edit_rows_exact = 0
+    identity_preserved_frames = 0
+    content_heights: set[float] = set()
+
+    context = imgui.create_context()
+    try:
+        io = imgui.get_io()
+        # 計測のたびに cwd へ imgui.ini を書き出さない。
+        io.ini_file_name = None
+        io.display_size = _WINDOW_SIZE
+        io.delta_time = 1.0 / 60.0
+        io.fonts.get_tex_data_as_rgba32()
+
+        def render_frame(scroll_fraction: float | None) -> tuple[TableEdits, float]:
+            imgui.new_frame()
+            imgui.set_next_window_position(0.0, 0.0)
+            imgui.set_next_window_size(*_WINDOW_SIZE)
+            imgui.begin("##parameter_table_benchmark")
+            imgui.begin_child("##parameter_table_scroll", 0.0, 0.0)
+            try:
+                if scroll_fraction is not None:
+                    imgui.set_scroll_y(float(imgui.get_scroll_max_y()) * scroll_fraction)
+                started = time.perf_counter_ns()
+                edits = table_module.render_parameter_table(render_input)
+                elapsed_ms = (time.perf_counter_ns() - started) / 1_000_000.0
+                content_heights.add(float(imgui.get_scroll_max_y()))
+            finally:
+                imgui.end_child()
+                imgui.end()
+            imgui.render()
+            return edits, elapsed_ms
+
+        with patch.object(table_module, "render_parameter_row_4cols", counted_row_renderer):
+            _edits, first_frame_ms = render_frame(None)
+            # scroll 指定は次 frame から反映されるため、各位置で 2 frame 描く。
+            render_frame(None)
+            content_heights.clear()
+            scroll_fractions = (0.0, 0.5, 1.0)
+            for frame_index in range(scenario.frames):
+                render_frame(scroll_fractions[frame_index % len(scroll_fractions)])
+                rendered_rows = 0
+                edits, elapsed_ms = render_frame(None)
+                frame_ms.append(elapsed_ms)
+                max_rendered_rows = max(max_rendered_rows, rendered_rows)
+                if len(edits.rows) == scenario.rows:
+                    edit_rows_exact += 1
+                if all(
+                    after is before
+                    for after, before in zip(edits.rows, expected_rows, strict=False)
+                ):
+                    identity_preserved_frames += 1
+    finally:
+        imgui.destroy_context(context)
+
+    rendered_rows_limit = min(scenario.rows, _RENDERED_ROWS_LIMIT)
+    output_value = {
+        "scope": _SCOPE,
+        "rows": scenario.rows,
+        "frames": scenario.frames,
+        "rendered_rows_bounded": max_rendered_rows <= rendered_rows_limit,
+        "edit_rows_exact": edit_rows_exact == scenario.frames,
+        "identity_preserved": identity_preserved_frames == scenario.frames,
+        "content_height_stable": len(content_heights) == 1,
+        "real_imgui_measured": True,
+        "gpu_measured": False,
+    }
+    metrics = (
+        Metric(
+            name="param_table.frame.render",
+            kind="distribution",
+            unit="ms",
+            phase="measure",
+            scope=_SCOPE,
+            distribution=summarize_distribution(frame_ms),
+        ),
+        gauge_metric(
+            "param_table.first_frame.render",
+            first_frame_ms,
+            unit="ms",
+            phase="warmup",
+            scope=_SCOPE,
+        ),
+        counter_metric(
+            "param_table.rows",
+            scenario.rows,
+            unit="count",
+            phase="measure",
+            scope=_SCOPE,
+        ),
+        counter_metric(
+            "param_table.frames",
+            scenario.frames,
+            unit="count",
+            phase="measure",
+            scope=_SCOPE,
+        ),
+        gauge_metric(
+            "param_table.frame.max_rendered_rows",
+            max_rendered_rows,
+            unit="rows",
+            phase="measure",
+            scope=_SCOPE,
+        ),
+        gauge_metric(
+            "param_table.content_height_variants",
+            len(content_heights),
+            unit="count",
+            phase="measure",
+            scope=_SCOPE,
+        ),
+    )
+    contracts = (
+        _hard_contract(
+            "param_table.frame.rendered_rows_bound",
+            max_rendered_rows,
+            "le",
+            rendered_rows_limit,
+            "table must draw only rows near the scroll view",
+        ),
+        _hard_contract(
+            "param_table.frame.rendered_rows_nonzero",
+            max_rendered_rows,
+            "ge",
+            1,
+            "visible rows must still be drawn",
+        ),
+        _hard_contract(
+            "param_table.edits.rows_exact",
+            edit_rows_exact,
+            "eq",
+            scenario.frames,
+            "TableEdits.rows must cover every layout row, drawn or not",
+        ),
+        _hard_contract(
+            "param_table.edits.identity_preserved",
+            identity_preserved_frames,
+            "eq",
+            scenario.frames,
+            "unedited rows must be returned as the same model row objects",
+        ),
+        _hard_contract(
+            "param_table.content_height.stable",
+            len(content_heights),
+            "eq",
+            1,
+            "skipped rows must keep the scrollable content height stable",
+        ),
+    )
+    return BenchmarkOutput(
+        value=output_value,
+        metrics=metrics,
+        contracts=contracts,
+    )
+
+
+def _hard_contract(
+    contract_id: str,
+    actual: object,
+    comparator: str,
+    limit: object,
+    reason: str,
+) -> ContractResult:
+    return evaluate_contract(
+        contract_id=contract_id,
+        severity="hard",
+        actual=actual,
+        comparator=comparator,
+        limit=limit,
+        reason=reason,
+    )
+
+
+__all__ = [
+    "case_definitions",
+    "ParameterTableRenderScenario",
+    "make_parameter_table_render_scenario",
+    "run_parameter_table_render_scenario",
+]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import importlib
+import tempfile
 from collections.abc import Callable, Iterator, Mapping
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -19,6 +20,12 @@ from grafix.core.evaluation_context import (
 )
 from grafix.core.font_resources import FontResources, ResolvedFontLease
 from grafix.core.geometry import normalize_args
+from grafix.core.geometry_file import (
+    GeometryFile,
+    GeometryFileLayer,
+    read_geometry_file,
+    write_geometry_file,
+)
 from grafix.core.realized_geometry import GeomTuple, RealizedGeometry
 from grafix.core.runtime_config import runtime_config
 from grafix.devtools.benchmarks.definition import CaseDefinition, define_case
@@ -33,6 +40,7 @@ from grafix.devtools.benchmarks.schema import (
 _FONT_SHA256 = "d930d5d52d15231c283089760f84584272ad5e37e14607ba0d19c798e7a9caec"
 _POLYHEDRON_SHA256 = "416bb767cb68fe1e66ca16a1b8476ae9141922dc1720f314cf28f10392556d52"
 _TEXT_EXTERNAL_DEPENDENCY_ID = "primitive-benchmark.text"
+_GEOMETRY_FILE_EXTERNAL_DEPENDENCY_ID = "primitive-benchmark.geometry_file"
 
 
 def case_definitions() -> tuple[CaseDefinition, ...]:
@@ -117,10 +125,12 @@ class PrimitiveBenchmarkState:
     work: dict[str, int | float | str | bool]
     font_resources: FontResources | None
     font_lease: ResolvedFontLease | None
+    geometry_file: GeometryFile | None
+    fixture_directory: tempfile.TemporaryDirectory[str] | None
 
 
 def primitive_benchmark_cases() -> tuple[PrimitiveBenchmarkCase, ...]:
-    """全20組み込み primitive の actual-work case を返す。"""
+    """全21組み込み primitive の actual-work case を返す。"""
 
     center = [7.0, -11.0, 3.0]
     primary = (
@@ -161,6 +171,32 @@ def primitive_benchmark_cases() -> tuple[PrimitiveBenchmarkCase, ...]:
             },
             run_seed_argument="seed",
         ),
+        PrimitiveBenchmarkCase(
+            "primitive.asemic.dense_paragraph",
+            "asemic / long paragraph / 200 nodes",
+            "asemic",
+            "dense_paragraph",
+            {
+                "text": (
+                    "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG\n"
+                    "PACK MY BOX WITH FIVE DOZEN LIQUOR JUGS\n"
+                    "SPHINX OF BLACK QUARTZ JUDGE MY VOW 0123456789"
+                ),
+                "n_nodes": 200,
+                "candidates": 8,
+                "stroke_min": 4,
+                "stroke_max": 8,
+                "walk_min_steps": 4,
+                "walk_max_steps": 10,
+                "stroke_style": "line",
+                "bezier_samples": 16,
+                "bezier_tension": 0.4,
+                "line_height": 1.3,
+                "center": center,
+                "scale": 10.0,
+            },
+            run_seed_argument="seed",
+        ),
         PrimitiveBenchmarkCase(
             "primitive.bezier.3d_segments_512",
             "bezier / 3D / 512 segments",
@@ -194,6 +230,14 @@ def primitive_benchmark_cases() -> tuple[PrimitiveBenchmarkCase, ...]:
                 "center": center,
             },
         ),
+        PrimitiveBenchmarkCase(
+            "primitive.geometry_file.memmap_wave_50k",
+            "geometry file / memmap / 50k points / 64 polylines",
+            "geometry_file",
+            "memmap_wave_50k",
+            {"layer": 1, "center": center, "scale": 2.0},
+            input_fixture="geometry_file_wave_50k",
+        ),
         PrimitiveBenchmarkCase(
             "primitive.grid.500x500_transformed",
             "grid / 500 x 500 / transformed",
@@ -586,8 +630,17 @@ def setup_primitive_benchmark(
     arguments = dict(cast(dict[str, Any], parameters["arguments"]))
     input_points: int | None = None
     input_sha256: str | None = None
+    fixture_directory: tempfile.TemporaryDirectory[str] | None = None
     input_fixture = parameters.get("input_fixture")
-    if input_fixture is not None:
+    if input_fixture == "geometry_file_wave_50k":
+        # file は timed 区間の外で書き、計測後に measurement context が削除する。
+        fixture_directory = tempfile.TemporaryDirectory(prefix="grafix-benchmark-")
+        arguments["path"] = _write_geometry_file_fixture(
+            Path(fixture_directory.name) / "wave.ggeom",
+            n_points=50_000,
+        )
+        input_points = 50_000
+    elif input_fixture is not None:
         points_array: np.ndarray
         if input_fixture == "wave_3d_tuple_50k":
             points_array = _wave_points_3d(n_points=50_000)
@@ -654,6 +707,10 @@ def setup_primitive_benchmark(
             font_resources.close()
             raise
 
+    geometry_file: GeometryFile | None = None
+    if primitive == "geometry_file":
+        geometry_file = read_geometry_file(str(arguments["path"]))
+
     return PrimitiveBenchmarkState(
         primitive=primitive,
         raw_function=cast(Callable[..., GeomTuple], raw_function),
@@ -670,14 +727,32 @@ def setup_primitive_benchmark(
         ),
         font_resources=font_resources,
         font_lease=font_lease,
+        geometry_file=geometry_file,
+        fixture_directory=fixture_directory,
     )
 
 
 @contextmanager
 def primitive_measurement_context(state: object) -> Iterator[object]:
-    """text の preflight lease を raw call 群へ束縛し、最後に owner を閉じる。"""
+    """text / geometry_file の preflight resource を raw call 群へ束縛し、最後に owner を閉じる。"""
 
     primitive_state = cast(PrimitiveBenchmarkState, state)
+    geometry_file = primitive_state.geometry_file
+    if geometry_file is not None:
+        snapshot = ExternalDependencySnapshot(
+            fingerprint=EMPTY_EXTERNAL_DEPENDENCIES_FINGERPRINT,
+            leases={_GEOMETRY_FILE_EXTERNAL_DEPENDENCY_ID: geometry_file},
+        )
+        try:
+            with bind_external_dependency(snapshot, _GEOMETRY_FILE_EXTERNAL_DEPENDENCY_ID):
+                yield None
+        finally:
+            # memmap を先に手放してから fixture directory を消す。
+            primitive_state.geometry_file = None
+            if primitive_state.fixture_directory is not None:
+                primitive_state.fixture_directory.cleanup()
+        return
+
     owner = primitive_state.font_resources
     lease = primitive_state.font_lease
     if owner is None:
@@ -871,6 +946,33 @@ def _wave_points_3d(*, n_points: int) -> np.ndarray:
     return points
 
 
+def _write_geometry_file_fixture(path: Path, *, n_points: int) -> str:
+    """小さな layer と、wave 点列を 64 本に分けた layer を無圧縮で保存する。"""
+
+    wave = _wave_points_3d(n_points=n_points).astype(np.float32)
+    outline = np.array(
+        [[0.0, 0.0, 0.0], [10.0, 0.0, 0.0], [10.0, 10.0, 0.0], [0.0, 0.0, 0.0]],
+        dtype=np.float32,
+    )
+    layers = (
+        GeometryFileLayer(
+            coords=outline,
+            offsets=np.array([0, outline.shape[0]], dtype=np.int32),
+            color=(0.0, 0.0, 0.0),
+            thickness=0.001,
+        ),
+        GeometryFileLayer(
+            coords=wave,
+            offsets=np.linspace(0, wave.shape[0], num=65).astype(np.int32),
+            color=(0.0, 0.0, 0.0),
+            thickness=0.001,
+        ),
+    )
+    with path.open("wb") as stream:
+        write_geometry_file(stream, layers)
+    return str(path)
+
+
 def _spline_points_3d(*, n_points: int) -> np.ndarray:
     count = max(2, int(n_points))
     t = np.linspace(0.0, 16.0 * np.pi, num=count, endpoint=False, dtype=np.float64)
@@ -956,6 +1058,9 @@ def _specific_metrics(
             bool(args.get("closed")) and geometry.coords.shape[0] == input_points + 1,
             unit="boolean",
         )
+    elif primitive == "geometry_file":
+        counter("work.input_points", int(state.input_points or 0))
+        counter("work.file_layers", len(state.geometry_file.layers) if state.geometry_file else 0)
     elif primitive == "grid":
         nx = int(args["nx"])
         ny = int(args["ny"])
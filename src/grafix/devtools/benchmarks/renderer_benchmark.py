@@ -666,6 +666,8 @@ class BenchmarkFakeMesh:
         self.vertex_only_upload_bytes = 0
         self.last_vertices: np.ndarray | None = None
         self.last_indices: np.ndarray | None = None
+        self.instance_count = 1
+        self.instance_transforms: np.ndarray | None = None
         self.released = False
         self.instances.append(self)
 
@@ -689,6 +691,15 @@ class BenchmarkFakeMesh:
         self.last_vertices = vertices_f32
         self.vbo.size = max(self.vbo.size, int(vertices_f32.nbytes))
 
+    def upload_instances(self, transforms: np.ndarray | None) -> bool:
+        """instanced layer の変換列 upload を再現する。"""
+
+        if transforms is self.instance_transforms:
+            return False
+        self.instance_transforms = transforms
+        self.instance_count = 1 if transforms is None else int(transforms.shape[0])
+        return True
+
     def release(self) -> None:
         self.released = True
 
@@ -729,11 +740,20 @@ def _draw_geometry(*, frame: int, sides: int) -> Geometry:
     )
 
 
+def _soak_cache_limit(geometry_bytes: int) -> int:
+    """geometry tier に ``geometry_bytes`` が収まる ``cpu_cache_bytes`` を返す。
+
+    realize cache は上限の 1/4 を simulation checkpoint tier へ割くため、その分を上乗せする。
+    """
+
+    return geometry_bytes + -(-geometry_bytes // 3)
+
+
 def animated_soak(*, frames: int, sides: int) -> dict[str, Any]:
     estimated_bytes = (int(sides) + 1) * 3 * np.dtype(np.float32).itemsize + 2 * np.dtype(
         np.int32
     ).itemsize
-    cache_limit = max(1_024, 2 * int(estimated_bytes) + 64)
+    cache_limit = _soak_cache_limit(max(1_024, 2 * int(estimated_bytes) + 64))
     last: RealizedGeometry | None = None
     with RealizeSession(runtime_limits=RuntimeLimits(cpu_cache_bytes=cache_limit)) as session:
         for frame in range(max(1, int(frames))):
@@ -1056,7 +1076,7 @@ def workload_animated_soak(state: object) -> BenchmarkOutput:
     frames = int(values["frames"])
     sides = int(values["sides"])
     estimated_bytes = (sides + 1) * 3 * np.dtype(np.float32).itemsize + 8
-    cache_limit = max(1024, 2 * estimated_bytes + 64)
+    cache_limit = _soak_cache_limit(max(1024, 2 * estimated_bytes + 64))
     last: RealizedGeometry | None = None
     with RealizeSession(runtime_limits=RuntimeLimits(cpu_cache_bytes=cache_limit)) as session:
         for frame in range(frames):
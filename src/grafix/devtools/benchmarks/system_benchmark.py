@@ -135,6 +135,20 @@ def case_definitions() -> tuple[CaseDefinition, ...]:
             suites=(("smoke", "micro"), ("micro",), ("soak",)),
         )
     )
+    definitions.extend(
+        scaled_case_definitions(
+            prefix="core.dag_construction",
+            label="per-frame scene DAG rebuild",
+            values=(1_000, 10_000, 50_000),
+            parameter_name="nodes",
+            category="core",
+            suite="pipeline",
+            fixture="sprite_recipe_scene",
+            setup=setup_dag_construction,
+            workload=workload_dag_construction,
+            suites=(("smoke", "pipeline"), ("pipeline",), ("soak",)),
+        )
+    )
     definitions.append(
         define_case(
             "core.deep_dag.depth_5000",
@@ -463,6 +477,66 @@ def workload_concat_recipe(state: object) -> BenchmarkOutput:
     )
 
 
+def _sprite_scene(sprites: int) -> tuple[Geometry, tuple[Geometry, ...]]:
+    """draw() が毎フレーム組み直す polygon→rotate→translate の scene を返す。"""
+
+    from grafix import E, G
+
+    leaves: list[Geometry] = []
+    for index in range(sprites):
+        shape = G.polygon(n_sides=6, scale=2.0)
+        moved = E.rotate(rotation=(0.0, 0.0, float(index % 12) * 30.0)).translate(
+            delta=(float(index % 100), float(index // 100), 0.0)
+        )(shape)
+        leaves.append(moved)
+    return Geometry.concat(leaves), tuple(leaves)
+
+
+def setup_dag_construction(parameters: dict[str, Any], _seed: int) -> object:
+    # 前フレームの DAG を保持した状態で組み直す、draw() の steady state を再現する。
+    sprites = max(1, int(parameters["nodes"]) // 3)
+    root, leaves = _sprite_scene(sprites)
+    return {"sprites": sprites, "root": root, "leaves": leaves}
+
+
+def workload_dag_construction(state: object) -> BenchmarkOutput:
+    values = cast(dict[str, Any], state)
+    previous_leaves = cast(tuple[Geometry, ...], values["leaves"])
+    root, leaves = _sprite_scene(int(values["sprites"]))
+    reused = sum(
+        current is previous
+        for current, previous in zip(leaves, previous_leaves, strict=True)
+    )
+    values["root"] = root
+    values["leaves"] = leaves
+    return BenchmarkOutput(
+        value=root,
+        metrics=(
+            counter_metric(
+                "nodes",
+                3 * len(leaves) + 1,
+                unit="count",
+                phase="measure",
+                scope="core",
+            ),
+            counter_metric(
+                "reused_leaves",
+                reused,
+                unit="count",
+                phase="measure",
+                scope="core",
+            ),
+            gauge_metric(
+                "recipe_id",
+                root.id,
+                unit="sha256",
+                phase="measure",
+                scope="core",
+            ),
+        ),
+    )
+
+
 def setup_deep_dag(parameters: dict[str, Any], _seed: int) -> object:
     from grafix import G
     from grafix.core.builtins import ensure_builtin_effect_registered
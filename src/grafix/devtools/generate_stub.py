@@ -85,6 +85,8 @@ _RESOLVABLE_TYPE_IDENTS = {
     "SceneItem",
     "Sequence",
     "Vec3",
+    "np",
+    "ndarray",
 }
 
 _PARAMETER_IDENTITY_STUB_PARAMS = (
@@ -597,7 +599,12 @@ def _render_g_protocol(
     *,
     catalog: OperationCatalog,
 ) -> str:
-    """`G`（primitive 名前空間）の `Protocol` 定義を生成する。"""
+    """`G`（primitive 名前空間）の `Protocol` 定義を生成する。
+
+    ``batch_args`` を宣言した primitive は ``__call__`` と ``many`` を持つ factory
+    `Protocol` を先に出力し、`_G` ではその型の属性として公開する。
+    """
+    factory_lines: list[str] = []
     lines: list[str] = []
     lines.append("class _G(Protocol):\n")
 
@@ -664,18 +671,56 @@ def _render_g_protocol(
             meta_by_name=meta_by_name,
         )
 
-        lines.append(
+        if not spec.batch_args:
+            lines.append(
+                _render_method(
+                    indent="    ",
+                    name=prim,
+                    return_type="Geometry",
+                    params=params,
+                    doc_lines=doc_lines,
+                )
+            )
+            continue
+
+        factory_name = f"_{''.join(part.title() for part in prim.split('_'))}Factory"
+        batch_params: list[str] = []
+        for param in params:
+            param_name, _, annotation = param.partition(":")
+            if param_name in spec.batch_args:
+                type_str = annotation.split("=", 1)[0].strip()
+                param = f"{param_name}: {type_str} | np.ndarray = ..."
+            batch_params.append(param)
+        factory_lines.append(f"class {factory_name}(Protocol):\n")
+        factory_lines.append(
             _render_method(
                 indent="    ",
-                name=prim,
+                name="__call__",
                 return_type="Geometry",
                 params=params,
                 doc_lines=doc_lines,
             )
         )
+        factory_lines.append(
+            _render_method(
+                indent="    ",
+                name="many",
+                return_type="Geometry",
+                params=batch_params,
+                doc_lines=[
+                    f"要素ごとの配列引数から N 個の {prim} を 1 node で生成する。",
+                    "",
+                    "配列で渡せる引数: "
+                    + ", ".join(spec.batch_args)
+                    + "。共有引数だけを Parameter GUI に公開する。",
+                ],
+            )
+        )
+        factory_lines.append("\n")
+        lines.append(f"    {prim}: {factory_name}\n")
 
     lines.append("\n")
-    return "".join(lines)
+    return "".join(factory_lines) + "".join(lines)
 
 
 def _render_effect_builder_protocol(
@@ -1055,6 +1100,7 @@ def generate_stubs_str(
     lines.append("from collections.abc import Callable, Mapping, Sequence\n")
     lines.append("from pathlib import Path\n")
     lines.append("from typing import Any, Literal, Protocol, TypeAlias\n\n")
+    lines.append("import numpy as np\n\n")
 
     lines.append("from grafix.core.geometry import Geometry\n")
     lines.append("from grafix.core.layer import Layer\n")
@@ -1088,6 +1134,11 @@ def generate_stubs_str(
         "VariationRenderResult as VariationRenderResult, "
         "render_variation_batch as render_variation_batch)\n"
     )
+    lines.append(
+        "from grafix.api.video import ("
+        "VideoRenderResult as VideoRenderResult, "
+        "render_video as render_video)\n"
+    )
     lines.append("from grafix.api.preset import preset as preset\n")
     lines.append("from grafix.core.operation_authoring import effect as effect\n")
     lines.append("from grafix.core.operation_authoring import primitive as primitive\n")
@@ -1122,6 +1173,7 @@ def generate_stubs_str(
         "    midi_mode: str = ...,\n"
         "    n_worker: int = ...,\n"
         "    evaluation_timeout: float | None = ...,\n"
+        "    refine_after: float | None = ...,\n"
         "    fps: float = ...,\n"
         "    seed: int | None = ...,\n"
         "    runtime_limit_profiles: RuntimeLimitProfiles = ...,\n"
@@ -1137,8 +1189,8 @@ def generate_stubs_str(
         "'G', 'L', 'P', 'RenderOptions', 'RenderSession', 'RenderSessionMetadata', "
         "'ResourceBudget', 'ResourceLimitError', 'RuntimeLimitProfiles', "
         "'RuntimeLimits', 'VariationBatchResult', 'VariationRenderResult', "
-        "'effect', 'export', 'preset', 'primitive', 'render', "
-        "'render_variation_batch', 'run']\n"
+        "'VideoRenderResult', 'effect', 'export', 'preset', 'primitive', 'render', "
+        "'render_variation_batch', 'render_video', 'run']\n"
     )
     return "".join(lines)
 
@@ -1204,12 +1256,14 @@ _ROOT_STUB = """from grafix.api import (
     RuntimeLimits as RuntimeLimits,
     VariationBatchResult as VariationBatchResult,
     VariationRenderResult as VariationRenderResult,
+    VideoRenderResult as VideoRenderResult,
     effect as effect,
     export as export,
     preset as preset,
     primitive as primitive,
     render as render,
     render_variation_batch as render_variation_batch,
+    render_video as render_video,
     run as run,
 )
 from grafix.cc import cc as cc
@@ -1232,6 +1286,7 @@ __all__ = [
     "RuntimeLimits",
     "VariationBatchResult",
     "VariationRenderResult",
+    "VideoRenderResult",
     "cc",
     "effect",
     "export",
@@ -1239,6 +1294,7 @@ __all__ = [
     "primitive",
     "render",
     "render_variation_batch",
+    "render_video",
     "run",
 ]
 """
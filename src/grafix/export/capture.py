@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import tempfile
 import time
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Protocol
 
@@ -46,7 +46,9 @@ class CaptureFrame(Protocol):
     """CaptureService が必要とする immutable frame の最小 read-only 契約。"""
 
     @property
-    def layers(self) -> Sequence[RealizedLayer]: ...
+    def layers(self) -> Iterable[RealizedLayer]:
+        """layer 列。Sequence でない場合は一度だけ列挙され、layer 別 G-code には使えない。"""
+        ...
 
     @property
     def canvas_size(self) -> tuple[int, int]: ...
@@ -216,12 +218,15 @@ class CaptureService:
             raise ValueError("layer 別 G-code encode には gcode_params が必要です")
         if not isinstance(gcode_params, GCodeParams):
             raise TypeError("gcode_params は GCodeParams である必要があります")
+        layers = frame.layers
+        if not isinstance(layers, Sequence):
+            raise ValueError("layer 別 G-code encode には layer の Sequence が必要です")
         paths: list[Path] = []
-        for index, layer in enumerate(frame.layers, start=1):
+        for index, layer in enumerate(layers, start=1):
             layer_path = gcode_layer_output_path(
                 output_path,
                 layer_index=index,
-                n_layers=len(frame.layers),
+                n_layers=len(layers),
                 layer_name=layer.layer.name,
             )
             export_gcode(
@@ -250,14 +255,17 @@ class CaptureService:
         output_path = Path(path)
         if not split_gcode_layers:
             return (output_path,)
+        layers = frame.layers
+        if not isinstance(layers, Sequence):
+            raise ValueError("layer 別 G-code path には layer の Sequence が必要です")
         return tuple(
             gcode_layer_output_path(
                 output_path,
                 layer_index=index,
-                n_layers=len(frame.layers),
+                n_layers=len(layers),
                 layer_name=layer.layer.name,
             )
-            for index, layer in enumerate(frame.layers, start=1)
+            for index, layer in enumerate(layers, start=1)
         )
 
     def publish_staged(
@@ -6,18 +6,23 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+import io
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from math import hypot
 from math import isqrt
 from pathlib import Path
-from typing import TextIO
+from typing import Final, TextIO
 
 import numpy as np
+from numba import get_num_threads, njit  # type: ignore[import-untyped]
 
-from grafix.file_io import atomic_text_writer
+from grafix.file_io import atomic_output_path
 from grafix.core.gcode_params import GCodeParams
 from grafix.core.pipeline import RealizedLayer
+from grafix.core.value_validation import exact_integer
 
 # --- 実装全体の前提（概要）---
 #
@@ -32,6 +37,10 @@ from grafix.core.pipeline import RealizedLayer
 #    - 異なる元 polyline の入力順・境界は常に保持する
 # 5) move ごとに (canvas -> machine) 変換 → 丸め → bed 範囲検証 → `G1 X.. Y..` を出す
 #
+# 1 layer の 2)〜5) は他 layer に依存しない。layer をまたぐ状態は直前の feed と最終 XY
+# だけなので、layer ごとの準備（clip・順序・量子化・検証）と整形（numba による bulk 文字列化）
+# を worker thread で並列に進め、出力は layer 順に連結する（_encode_layers）。
+#
 # 決定性（同一入力→同一出力）のための工夫:
 # - 数値は常に固定小数フォーマット（_fmt_float）
 # - bed 検証は「実際に出力する値（丸め後）」に対して行う（_quantize_xy→_validate_bed_xy）
@@ -56,178 +65,233 @@ def _fmt_float(value: float, *, decimals: int) -> str:
     return text
 
 
+# クリップで 1 点に潰れた線分とみなす長さと、fragment の点を同一・連続とみなす距離。
+_CLIP_EPS: Final = 1e-12
+_JOIN_EPS: Final = 1e-9
+
+
+@njit(cache=True, nogil=True, inline="always")
 def _is_inside_rect(
-    xy: tuple[float, float], rect: tuple[float, float, float, float]
+    x: float,
+    y: float,
+    x_min: float,
+    x_max: float,
+    y_min: float,
+    y_max: float,
 ) -> bool:
     """点が矩形（閉区間）に含まれるなら True を返す。"""
 
     # クリップと整合するよう「閉区間（境界を含む）」で判定する。
     # 紙境界上の点は描画許可としないと、出入口で意図せず途切れやすい。
-    x, y = xy
-    x_min, x_max, y_min, y_max = rect
     return (x_min <= x <= x_max) and (y_min <= y <= y_max)
 
 
+@njit(cache=True, nogil=True, inline="always")
+def _narrow_clip_range(p: float, q: float, u1: float, u2: float) -> tuple[bool, float, float]:
+    """制約 ``p*u <= q`` で可視区間 ``[u1, u2]`` を狭める。空になれば False。"""
+
+    # 方向成分が 0 に近い（= 辺と平行）場合:
+    # - q < 0 なら「矩形の外側に平行」なので交差なし
+    # - それ以外は u 制約を更新しない
+    if abs(p) < _CLIP_EPS:
+        return q >= 0.0, u1, u2
+
+    # 辺との交点に対応する u 値。
+    # u の許容範囲を狭めるだけなので、交点座標は最後に 1 回だけ計算する。
+    r = q / p
+    if p < 0.0:
+        # こちら側は下限更新（u >= r）。
+        if r > u2:
+            return False, u1, u2
+        if r > u1:
+            u1 = r
+    else:
+        # こちら側は上限更新（u <= r）。
+        if r < u1:
+            return False, u1, u2
+        if r < u2:
+            u2 = r
+    return True, u1, u2
+
+
+@njit(cache=True, nogil=True, inline="always")
 def _clip_segment_to_rect(
-    p0: tuple[float, float],
-    p1: tuple[float, float],
-    rect: tuple[float, float, float, float],
-    *,
-    eps: float = 1e-12,
-) -> tuple[tuple[float, float], tuple[float, float]] | None:
-    """線分を矩形へクリップし、内側部分の端点 2 点を返す。"""
+    x0: float,
+    y0: float,
+    x1: float,
+    y1: float,
+    x_min: float,
+    x_max: float,
+    y_min: float,
+    y_max: float,
+) -> tuple[bool, float, float, float, float]:
+    """線分を矩形へクリップし、``(残るか, ax, ay, bx, by)`` を返す。"""
 
     # Liang–Barsky line clipping を使う。
     # 線分をパラメータ表現 `P(u)=P0 + u*(P1-P0), u in [0,1]` にして、
     # 矩形の 4 辺に対する不等式制約を u の範囲 `[u1, u2]` として更新する。
     #
-    # 重要: この関数は「交点 1 点だけ」になるような極短線分を None 扱いにする。
+    # 重要: この関数は「交点 1 点だけ」になるような極短線分を残さない。
     # クリップの境界交点が連続して出るケースで、無意味なゼロ移動 G1 を増やさないため。
-
-    x0, y0 = p0
-    x1, y1 = p1
-    x_min, x_max, y_min, y_max = rect
-
     dx = x1 - x0
     dy = y1 - y0
 
-    # 可視区間の u 範囲（最初は線分全体）。
-    # 以降の制約更新で、矩形内に残る u の範囲へ狭めていく。
-    u1 = 0.0
-    u2 = 1.0
-
     # 各辺の不等式を `p*u <= q` の形に落とし込む。
     #   x >= x_min  -> -dx*u <= x0 - x_min
     #   x <= x_max  ->  dx*u <= x_max - x0
     #   y >= y_min  -> -dy*u <= y0 - y_min
     #   y <= y_max  ->  dy*u <= y_max - y0
-    p = (-dx, dx, -dy, dy)
-    q = (x0 - x_min, x_max - x0, y0 - y_min, y_max - y0)
-
-    for pi, qi in zip(p, q):
-        # 方向成分が 0 に近い（= 辺と平行）場合:
-        # - qi < 0 なら「矩形の外側に平行」なので交差なし
-        # - それ以外は u 制約を更新しない
-        if abs(pi) < eps:
-            if qi < 0.0:
-                return None
-            continue
-
-        # 辺との交点に対応する u 値。
-        # u の許容範囲を狭めるだけなので、交点座標は最後に 1 回だけ計算する。
-        r = qi / pi
-        if pi < 0.0:
-            # こちら側は下限更新（u >= r）。
-            if r > u2:
-                return None
-            if r > u1:
-                u1 = r
-        else:
-            # こちら側は上限更新（u <= r）。
-            if r < u1:
-                return None
-            if r < u2:
-                u2 = r
-
-    if u1 > u2:
-        return None
+    ok, u1, u2 = _narrow_clip_range(-dx, x0 - x_min, 0.0, 1.0)
+    if ok:
+        ok, u1, u2 = _narrow_clip_range(dx, x_max - x0, u1, u2)
+    if ok:
+        ok, u1, u2 = _narrow_clip_range(-dy, y0 - y_min, u1, u2)
+    if ok:
+        ok, u1, u2 = _narrow_clip_range(dy, y_max - y0, u1, u2)
+    if not ok or u1 > u2:
+        return False, 0.0, 0.0, 0.0, 0.0
 
     # クリップ後の端点（u1/u2 が更新された線分）。
-    # u1==u2 に近い場合は「点」に潰れるので後段で None 扱いにする。
     ax = x0 + u1 * dx
     ay = y0 + u1 * dy
     bx = x0 + u2 * dx
     by = y0 + u2 * dy
 
     # 交点が 1 点に潰れてしまう場合は「線分なし」として扱う。
-    if hypot(bx - ax, by - ay) < eps:
-        return None
-
-    return (ax, ay), (bx, by)
+    if hypot(bx - ax, by - ay) < _CLIP_EPS:
+        return False, 0.0, 0.0, 0.0, 0.0
+    return True, ax, ay, bx, by
 
 
+@njit(cache=True, nogil=True, inline="always")
 def _append_point(
-    points: list[tuple[float, float]],
-    xy: tuple[float, float],
-    *,
-    eps: float = 1e-9,
-) -> None:
+    points: np.ndarray,
+    write: int,
+    count: int,
+    x: float,
+    y: float,
+) -> tuple[int, int]:
     """直前点と同一（極近傍）なら追加せず、そうでなければ追加する。"""
 
     # クリップ処理では境界交点が連続しやすく、
     # そのまま出力すると「同一点へ移動する G1」が増えてファイルが読みにくくなる。
     # ここでは微小差を許容して点を間引き、G-code の冗長さを抑える。
-    if points:
-        x0, y0 = points[-1]
-        x1, y1 = xy
-        if hypot(x1 - x0, y1 - y0) < eps:
-            return
-    points.append(xy)
-
+    if count > 0 and hypot(x - points[write - 1, 0], y - points[write - 1, 1]) < _JOIN_EPS:
+        return write, count
+    points[write, 0] = x
+    points[write, 1] = y
+    return write + 1, count + 1
+
+
+@njit(cache=True, nogil=True)
+def _clip_polylines_to_rect(
+    coords: np.ndarray,
+    offsets: np.ndarray,
+    x_min: float,
+    x_max: float,
+    y_min: float,
+    y_max: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """layer の全 polyline を矩形へクリップし、紙内に残る fragment を連結して返す。
 
-def _clip_polyline_to_rect(
-    polyline_xy: np.ndarray,
-    rect: tuple[float, float, float, float],
-) -> list[list[tuple[float, float]]]:
-    """polyline を矩形へクリップし、紙内に残る polyline 群を返す。"""
+    Returns
+    -------
+    points : np.ndarray
+        全 fragment の点を連結した ``(M, 2)`` float64。
+    fragment_offsets : np.ndarray
+        fragment ``i`` が ``points[offsets[i]:offsets[i + 1]]`` になる ``(F + 1,)`` int64。
+    fragment_polylines : np.ndarray
+        fragment ごとの元 polyline index。入力順なので非減少。
+    fragment_segments : np.ndarray
+        元 polyline 内での fragment 番号（0 始まり）。
+    """
 
     # 方針:
     # - 元 polyline を「連続点の線分列」として扱う
     # - 各線分を矩形へクリップする
-    # - クリップ結果が連続する範囲を 1 つの polyline としてまとめ、断絶があれば分割する
+    # - クリップ結果が連続する範囲を 1 つの fragment としてまとめ、断絶があれば分割する
     #
-    # 出力は「紙内に残る polyline 群」なので、紙外を跨ぐ部分はここで断ち切られる。
+    # 出力は「紙内に残る fragment 群」なので、紙外を跨ぐ部分はここで断ち切られる。
     # これにより export 側は「分断された区間は必ずペンアップ移動」を簡単に実現できる。
-
-    if polyline_xy.shape[0] < 2:
-        return []
-
-    out: list[list[tuple[float, float]]] = []
-    current: list[tuple[float, float]] = []
-
-    for i in range(int(polyline_xy.shape[0]) - 1):
-        # 元線分の端点。
-        p0 = (float(polyline_xy[i, 0]), float(polyline_xy[i, 1]))
-        p1 = (float(polyline_xy[i + 1, 0]), float(polyline_xy[i + 1, 1]))
-        clipped = _clip_segment_to_rect(p0, p1, rect)
-
-        if clipped is None:
-            # 今の線分は紙内に寄与しないので、溜めていた polyline を確定してリセットする。
-            if current and len(current) >= 2:
-                out.append(current)
-            current = []
+    #
+    # 線分ごとに追加される点は高々 2 点なので、出力は入力頂点数の 2 倍で足りる。
+    points = np.empty((2 * coords.shape[0], 2), dtype=np.float64)
+    fragment_offsets = np.empty(coords.shape[0] + 1, dtype=np.int64)
+    fragment_polylines = np.empty(coords.shape[0], dtype=np.int64)
+    fragment_segments = np.empty(coords.shape[0], dtype=np.int64)
+    fragment_offsets[0] = 0
+    fragments = 0
+    write = 0
+
+    for polyline in range(offsets.shape[0] - 1):
+        start = offsets[polyline]
+        end = offsets[polyline + 1]
+        if end - start < 2:
             continue
+        segment = 0
+        count = 0
+        for i in range(start, end - 1):
+            # 元線分の端点。
+            x0 = coords[i, 0]
+            y0 = coords[i, 1]
+            x1 = coords[i + 1, 0]
+            y1 = coords[i + 1, 1]
+            ok, ax, ay, bx, by = _clip_segment_to_rect(
+                x0, y0, x1, y1, x_min, x_max, y_min, y_max
+            )
+            # 今の線分が紙内に寄与しない・連続性が崩れた（紙外を跨いだ / 別辺から
+            # 再侵入した等）・次の元点が紙外へ出た、のいずれかで溜めていた fragment を
+            # 確定する。2 点未満の fragment は捨てる。
+            flush = not ok or (
+                count > 0
+                and hypot(ax - points[write - 1, 0], ay - points[write - 1, 1]) > _JOIN_EPS
+            )
+            if flush and count > 0:
+                if count >= 2:
+                    fragment_polylines[fragments] = polyline
+                    fragment_segments[fragments] = segment
+                    fragments += 1
+                    fragment_offsets[fragments] = write
+                    segment += 1
+                else:
+                    write = fragment_offsets[fragments]
+                count = 0
+            if not ok:
+                continue
 
-        a, b = clipped
-        if not current:
-            # 新しい紙内 polyline を開始する。
-            current = []
-            _append_point(current, a)
-            _append_point(current, b)
+            if count == 0:
+                # 新しい紙内 fragment を開始する。
+                write, count = _append_point(points, write, count, ax, ay)
+            # 直前点から連続しているので末尾へ延長する。
+            write, count = _append_point(points, write, count, bx, by)
+
+            if not _is_inside_rect(x1, y1, x_min, x_max, y_min, y_max):
+                # 次の元点が紙外なら「ここで紙外へ出た」ことになるので flush する。
+                # （紙外を跨いで直線で繋ぐと、紙の外周をショートカットして事故りやすい）
+                if count >= 2:
+                    fragment_polylines[fragments] = polyline
+                    fragment_segments[fragments] = segment
+                    fragments += 1
+                    fragment_offsets[fragments] = write
+                    segment += 1
+                else:
+                    write = fragment_offsets[fragments]
+                count = 0
+
+        if count >= 2:
+            fragment_polylines[fragments] = polyline
+            fragment_segments[fragments] = segment
+            fragments += 1
+            fragment_offsets[fragments] = write
         else:
-            if hypot(a[0] - current[-1][0], a[1] - current[-1][1]) > 1e-9:
-                # 連続性が崩れた（紙外を跨いだ / 別辺から再侵入した等）ので分割する。
-                if len(current) >= 2:
-                    out.append(current)
-                current = []
-                _append_point(current, a)
-                _append_point(current, b)
-            else:
-                # 直前点から連続しているので末尾へ延長する。
-                _append_point(current, b)
-
-        if not _is_inside_rect(p1, rect):
-            # 次の元点が紙外なら「ここで紙外へ出た」ことになるので flush する。
-            # これにより export 側で「次の紙内復帰は必ずペンアップ移動」とできる。
-            # （紙外を跨いで直線で繋ぐと、紙の外周をショートカットして事故りやすい）
-            if current and len(current) >= 2:
-                out.append(current)
-            current = []
-
-    if current and len(current) >= 2:
-        out.append(current)
-
-    return out
+            write = fragment_offsets[fragments]
+
+    return (
+        points[:write].copy(),
+        fragment_offsets[: fragments + 1].copy(),
+        fragment_polylines[:fragments].copy(),
+        fragment_segments[:fragments].copy(),
+    )
 
 
 def _paper_safe_rect(
@@ -332,7 +396,8 @@ class _Stroke:
     Notes
     -----
     points_canvas:
-        canvas 座標系の点列（この順に辿ると「描画線」になる）。
+        canvas 座標系の ``(N, 2)`` 点列（この順に辿ると「描画線」になる）。
+        layer 単位の連結配列の view で、``point_offset`` はその先頭行。
     start_q / end_q:
         距離比較のための量子化座標（整数）。
         浮動小数の微小差で順序が揺れないよう、一定の分解能で丸めた値を使う。
@@ -340,9 +405,10 @@ class _Stroke:
 
     poly_idx: int
     seg_idx: int
-    points_canvas: list[tuple[float, float]]
+    points_canvas: np.ndarray
     start_q: tuple[int, int]
     end_q: tuple[int, int]
+    point_offset: int = 0
 
 
 def _order_strokes_in_layer(
@@ -550,6 +616,37 @@ _GCODE_HEADER = (
     "; ====== Body ======",
 )
 
+_MAX_DEFAULT_ENCODER_THREADS: Final = 8
+
+# bulk 整形は「出力値 × 10**decimals」を int64 で正確に持てる範囲だけを扱う。
+# 2**50 以下なら隣接する量子化値が float64 でも潰れず、`hypot(...) < 1e-12` の重複判定が
+# 整数の一致判定と同値になる（decimals <= 9 のとき量子化間隔は 1e-9 以上）。
+_BULK_MAX_DECIMALS: Final = 9
+_BULK_MAX_QUANTIZED: Final = float(2**50)
+
+_QUANTIZED_EXACT: Final = 0
+_QUANTIZED_NEAR_TIE: Final = 1
+_QUANTIZED_UNREPRESENTABLE: Final = 2
+
+_FRAGMENT_REVERSED: Final = 1
+_FRAGMENT_BRIDGE: Final = 2
+_FRAGMENT_OPENS_POLYLINE: Final = 4
+_FRAGMENT_CLOSES_POLYLINE: Final = 8
+
+_FEED_UNSET: Final = 0
+_FEED_TRAVEL: Final = 1
+_FEED_DRAW: Final = 2
+
+_TEXT_LAYER = np.frombuffer(b"; layer ", dtype=np.uint8)
+_TEXT_SOURCE_POLYLINE = np.frombuffer(b"; source_polyline ", dtype=np.uint8)
+_TEXT_STROKE = np.frombuffer(b"; stroke polyline ", dtype=np.uint8)
+_TEXT_SEG = np.frombuffer(b" seg ", dtype=np.uint8)
+_TEXT_REVERSED = np.frombuffer(b" reversed", dtype=np.uint8)
+_TEXT_START = np.frombuffer(b" start\n", dtype=np.uint8)
+_TEXT_END = np.frombuffer(b" end\n", dtype=np.uint8)
+_TEXT_MOVE_X = np.frombuffer(b"G1 X", dtype=np.uint8)
+_TEXT_MOVE_Y = np.frombuffer(b" Y", dtype=np.uint8)
+
 
 def _validated_canvas(canvas_size: tuple[float, float]) -> tuple[float, float]:
     """正の有限 canvas size を float tuple として返す。"""
@@ -560,46 +657,73 @@ def _validated_canvas(canvas_size: tuple[float, float]) -> tuple[float, float]:
     return canvas
 
 
+def _default_encoder_threads() -> int:
+    """呼び出し thread の numba thread 数（上限 8）を encoder thread 数の既定にする。
+
+    export worker は spawn 時に `ThreadBudget.child_allowance()` の値を
+    `apply_process_thread_allowance()` で numba へ設定し、`ThreadBudget.evaluation()`
+    の中ではその evaluation の allowance が設定される。どちらも numba の thread 数に
+    現れるので、budget の配分を超えて thread を起こさない。
+    """
+
+    return max(1, min(_MAX_DEFAULT_ENCODER_THREADS, int(get_num_threads())))
+
+
 def _collect_layer_strokes(
     layer: RealizedLayer,
     *,
     safe_rect: tuple[float, float, float, float],
     scale: int,
-) -> list[tuple[int, list[_Stroke]]]:
-    """1 layerをclipし、元polylineごとのfragment列を入力順で返す。"""
+) -> tuple[np.ndarray, list[tuple[int, list[_Stroke]]]]:
+    """1 layerをclipし、連結点列と元polylineごとのfragment列を入力順で返す。
 
-    coords = np.asarray(layer.realized.coords, dtype=np.float64)
-    offsets = np.asarray(layer.realized.offsets, dtype=np.int32)
-    strokes_by_polyline: list[tuple[int, list[_Stroke]]] = []
+    clip は `_clip_polylines_to_rect` が layer 全体を 1 回で行い、各 `_Stroke` は
+    その連結点列の view を持つ。
+    """
 
-    for poly_idx, (start, end) in enumerate(zip(offsets[:-1], offsets[1:])):
-        start_i, end_i = int(start), int(end)
-        if end_i - start_i < 2:
-            continue
-        polyline = np.ascontiguousarray(coords[start_i:end_i, :2], dtype=np.float64)
-        fragments: list[_Stroke] = []
-        for seg_idx, points in enumerate(_clip_polyline_to_rect(polyline, safe_rect)):
-            if len(points) < 2:
-                continue
-            start_xy, end_xy = points[0], points[-1]
-            fragments.append(
-                _Stroke(
-                    poly_idx=poly_idx,
-                    seg_idx=seg_idx,
-                    points_canvas=points,
-                    start_q=(
-                        int(round(float(start_xy[0]) * scale)),
-                        int(round(float(start_xy[1]) * scale)),
-                    ),
-                    end_q=(
-                        int(round(float(end_xy[0]) * scale)),
-                        int(round(float(end_xy[1]) * scale)),
-                    ),
-                )
+    coords = np.ascontiguousarray(layer.realized.coords[:, :2], dtype=np.float64)
+    offsets = np.asarray(layer.realized.offsets, dtype=np.int64)
+    x_min, x_max, y_min, y_max = safe_rect
+    packed, fragment_offsets, fragment_polylines, fragment_segments = _clip_polylines_to_rect(
+        coords,
+        offsets,
+        float(x_min),
+        float(x_max),
+        float(y_min),
+        float(y_max),
+    )
+    packed.setflags(write=False)
+    starts = fragment_offsets[:-1].tolist()
+    stops = fragment_offsets[1:].tolist()
+    start_q = _quantize_endpoints(packed[fragment_offsets[:-1]], scale)
+    end_q = _quantize_endpoints(packed[fragment_offsets[1:] - 1], scale)
+
+    strokes_by_polyline: list[tuple[int, list[_Stroke]]] = []
+    for fragment, poly_idx in enumerate(fragment_polylines.tolist()):
+        if not strokes_by_polyline or strokes_by_polyline[-1][0] != poly_idx:
+            strokes_by_polyline.append((poly_idx, []))
+        start, stop = starts[fragment], stops[fragment]
+        strokes_by_polyline[-1][1].append(
+            _Stroke(
+                poly_idx=poly_idx,
+                seg_idx=int(fragment_segments[fragment]),
+                points_canvas=packed[start:stop],
+                start_q=start_q[fragment],
+                end_q=end_q[fragment],
+                point_offset=start,
             )
-        if fragments:
-            strokes_by_polyline.append((poly_idx, fragments))
-    return strokes_by_polyline
+        )
+    return packed, strokes_by_polyline
+
+
+def _quantize_endpoints(points: np.ndarray, scale: int) -> list[tuple[int, int]]:
+    """fragment 端点を距離比較用の整数座標 ``round(xy * scale)`` にする。"""
+
+    scaled = points * float(scale)
+    if bool(np.all(np.abs(scaled) < 2.0**62)):
+        return [(x, y) for x, y in np.rint(scaled).astype(np.int64).tolist()]
+    # int64 に収まらない（または非有限の）値は Python の int で扱い、同じ例外を出す。
+    return [(int(round(x)), int(round(y))) for x, y in scaled.tolist()]
 
 
 def _order_polyline_fragments(
@@ -624,8 +748,257 @@ def _order_polyline_fragments(
     ]
 
 
+@dataclass(frozen=True, slots=True)
+class _EmitterState:
+    """layer 境界をまたいで引き継ぐ emitter 状態。
+
+    Notes
+    -----
+    fragment は必ず pen down で終わり、header 直後も pen down 扱いなので、layer 境界の
+    pen 状態は常に down。残るのは直前の feed と、最後に出力した丸め後 XY だけ。
+    """
+
+    feed: int | None = None
+    xy: tuple[float, float] | None = None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _PreparedLayer:
+    """clip・順序決定・量子化・bed 検証まで済ませた 1 layer。
+
+    Notes
+    -----
+    fragment_* は出力順に並んだ fragment ごとの値で、点列は
+    ``points_canvas[fragment_starts[i]:fragment_stops[i]]``（flags の reversed なら逆順）。
+    ``quantized`` は同じ行順の machine 座標を ``10**decimals`` 倍して丸めた int64。
+    bulk 整形で正確に表せない値を含む layer では None になり、`_GCodeEmitter` で
+    逐次整形する（decimals > 9、または出力値 × 10**decimals が 2**50 を超える場合）。
+    """
+
+    layer_index: int
+    points_canvas: np.ndarray
+    quantized: np.ndarray | None
+    fragment_polylines: np.ndarray
+    fragment_segments: np.ndarray
+    fragment_flags: np.ndarray
+    fragment_starts: np.ndarray
+    fragment_stops: np.ndarray
+    first_xy: tuple[float, float] | None
+    last_xy: tuple[float, float] | None
+
+    def exit_state(self, entry: _EmitterState, *, draw_feed: int) -> _EmitterState:
+        """この layer を出力し終えた後の emitter 状態を返す。"""
+
+        if self.last_xy is None:
+            return entry
+        return _EmitterState(feed=draw_feed, xy=self.last_xy)
+
+
+@njit(cache=True, nogil=True)
+def _quantize_coordinates(
+    values: np.ndarray,
+    scale: float,
+    limit: float,
+    out: np.ndarray,
+    status: np.ndarray,
+) -> None:
+    """``round(value * scale)`` を half-even で求め、正確さの分類を ``status`` に書く。
+
+    ``value * scale`` の浮動小数誤差で .5 の境界を跨ぎうる要素は NEAR_TIE として
+    呼び出し側の Python ``round()`` に任せる。
+    """
+
+    for index in range(values.shape[0]):
+        scaled = values[index] * scale
+        if not np.isfinite(scaled) or abs(scaled) > limit:
+            out[index] = 0
+            status[index] = _QUANTIZED_UNREPRESENTABLE
+            continue
+        nearest = np.rint(scaled)
+        out[index] = np.int64(nearest)
+        if abs(abs(scaled - nearest) - 0.5) <= abs(scaled) * 1e-15 + 1e-300:
+            status[index] = _QUANTIZED_NEAR_TIE
+        else:
+            status[index] = _QUANTIZED_EXACT
+
+
+@njit(cache=True, nogil=True)
+def _put_bytes(out: np.ndarray, pos: int, data: np.ndarray, measure: bool) -> int:
+    if not measure:
+        out[pos : pos + data.shape[0]] = data
+    return pos + data.shape[0]
+
+
+@njit(cache=True, nogil=True)
+def _put_uint(out: np.ndarray, pos: int, value: int, measure: bool) -> int:
+    digits = 1
+    probe = value
+    while probe >= 10:
+        probe //= 10
+        digits += 1
+    if not measure:
+        for offset in range(digits - 1, -1, -1):
+            out[pos + offset] = 48 + value % 10
+            value //= 10
+    return pos + digits
+
+
+@njit(cache=True, nogil=True)
+def _put_fixed(
+    out: np.ndarray,
+    pos: int,
+    value: int,
+    decimals: int,
+    scale: int,
+    measure: bool,
+) -> int:
+    """``value / scale`` を `_fmt_float` と同じ固定小数表記で書く。"""
+
+    if value < 0:
+        if not measure:
+            out[pos] = 45
+        pos += 1
+        value = -value
+    pos = _put_uint(out, pos, value // scale, measure)
+    if decimals > 0:
+        if not measure:
+            out[pos] = 46
+            fraction = value % scale
+            for offset in range(decimals, 0, -1):
+                out[pos + offset] = 48 + fraction % 10
+                fraction //= 10
+        pos += 1 + decimals
+    return pos
+
+
+@njit(cache=True, nogil=True)
+def _put_move(
+    out: np.ndarray,
+    pos: int,
+    x: int,
+    y: int,
+    decimals: int,
+    scale: int,
+    measure: bool,
+) -> int:
+    pos = _put_bytes(out, pos, _TEXT_MOVE_X, measure)
+    pos = _put_fixed(out, pos, x, decimals, scale, measure)
+    pos = _put_bytes(out, pos, _TEXT_MOVE_Y, measure)
+    pos = _put_fixed(out, pos, y, decimals, scale, measure)
+    if not measure:
+        out[pos] = 10
+    return pos + 1
+
+
+@njit(cache=True, nogil=True)
+def _write_layer_text(
+    out: np.ndarray,
+    measure: bool,
+    layer_index: int,
+    polylines: np.ndarray,
+    segments: np.ndarray,
+    flags: np.ndarray,
+    starts: np.ndarray,
+    stops: np.ndarray,
+    quantized: np.ndarray,
+    decimals: int,
+    scale: int,
+    pen_up_line: np.ndarray,
+    pen_down_line: np.ndarray,
+    travel_feed_line: np.ndarray,
+    draw_feed_line: np.ndarray,
+    feeds_equal: bool,
+    entry_feed: int,
+    skip_first_move: bool,
+) -> int:
+    """1 layer 分の G-code を書き、書いた byte 数を返す。``measure`` なら数えるだけ。
+
+    命令の並びと冗長命令の抑制は `_GCodeEmitter` / `_emit_fragment` と同じ。
+    """
+
+    pos = _put_bytes(out, 0, _TEXT_LAYER, measure)
+    pos = _put_uint(out, pos, layer_index, measure)
+    pos = _put_bytes(out, pos, _TEXT_START, measure)
+    feed = entry_feed
+    has_current = False
+    current_x = 0
+    current_y = 0
+    for fragment in range(flags.shape[0]):
+        flag = flags[fragment]
+        polyline = polylines[fragment]
+        if flag & _FRAGMENT_OPENS_POLYLINE:
+            pos = _put_bytes(out, pos, _TEXT_SOURCE_POLYLINE, measure)
+            pos = _put_uint(out, pos, polyline, measure)
+            pos = _put_bytes(out, pos, _TEXT_START, measure)
+        reversed_ = (flag & _FRAGMENT_REVERSED) != 0
+        pos = _put_bytes(out, pos, _TEXT_STROKE, measure)
+        pos = _put_uint(out, pos, polyline, measure)
+        pos = _put_bytes(out, pos, _TEXT_SEG, measure)
+        pos = _put_uint(out, pos, segments[fragment], measure)
+        if reversed_:
+            pos = _put_bytes(out, pos, _TEXT_REVERSED, measure)
+        if not measure:
+            out[pos] = 10
+        pos += 1
+
+        if reversed_:
+            first = stops[fragment] - 1
+            step = -1
+            stop = starts[fragment] - 1
+        else:
+            first = starts[fragment]
+            step = 1
+            stop = stops[fragment]
+        start_x = quantized[first, 0]
+        start_y = quantized[first, 1]
+        if not flag & _FRAGMENT_BRIDGE:
+            pos = _put_bytes(out, pos, pen_up_line, measure)
+            if not (feed == _FEED_TRAVEL or (feed == _FEED_DRAW and feeds_equal)):
+                pos = _put_bytes(out, pos, travel_feed_line, measure)
+                feed = _FEED_TRAVEL
+            if fragment == 0 and skip_first_move:
+                # 直前 layer の最終点と同じ位置。
+                has_current = True
+                current_x = start_x
+                current_y = start_y
+            elif not (has_current and start_x == current_x and start_y == current_y):
+                pos = _put_move(out, pos, start_x, start_y, decimals, scale, measure)
+                has_current = True
+                current_x = start_x
+                current_y = start_y
+            pos = _put_bytes(out, pos, pen_down_line, measure)
+            if not (feed == _FEED_DRAW or (feed == _FEED_TRAVEL and feeds_equal)):
+                pos = _put_bytes(out, pos, draw_feed_line, measure)
+                feed = _FEED_DRAW
+        for index in range(first, stop, step):
+            x = quantized[index, 0]
+            y = quantized[index, 1]
+            if has_current and x == current_x and y == current_y:
+                continue
+            pos = _put_move(out, pos, x, y, decimals, scale, measure)
+            has_current = True
+            current_x = x
+            current_y = y
+
+        if flag & _FRAGMENT_CLOSES_POLYLINE:
+            pos = _put_bytes(out, pos, _TEXT_SOURCE_POLYLINE, measure)
+            pos = _put_uint(out, pos, polyline, measure)
+            pos = _put_bytes(out, pos, _TEXT_END, measure)
+    pos = _put_bytes(out, pos, _TEXT_LAYER, measure)
+    pos = _put_uint(out, pos, layer_index, measure)
+    return _put_bytes(out, pos, _TEXT_END, measure)
+
+
 class _GCodeEmitter:
-    """座標検証と冗長命令抑制を所有する G-code dialect emitter。"""
+    """bulk 整形できない layer だけを 1 行ずつ書く G-code emitter。
+
+    Notes
+    -----
+    通常の layer は `_write_layer_text` が int64 の量子化値から直接書く。decimals が
+    9 を超える、または出力値 × 10**decimals が 2**50 を超える layer は int64 と
+    `hypot(...) < 1e-12` の重複判定が一致しないため、`_LayerEncoder._encode_with_emitter`
+    からだけここを使い、float の丸めと `_fmt_float` で整形する。
+    """
 
     def __init__(
         self,
@@ -633,16 +1006,16 @@ class _GCodeEmitter:
         stream: TextIO,
         params: GCodeParams,
         canvas: tuple[float, float],
+        state: _EmitterState | None = None,
     ) -> None:
+        entry = _EmitterState() if state is None else state
         self._stream = stream
         self.params = params
         self.canvas = canvas
         self.decimals = int(params.decimals)
         self._pen_is_down = True
-        self._current_feed: int | None = None
-        self._current_xy: tuple[float, float] | None = None
-        for line in _GCODE_HEADER:
-            self.write_line(line)
+        self._current_feed: int | None = entry.feed
+        self._current_xy: tuple[float, float] | None = entry.xy
 
     def write_line(self, line: str) -> None:
         """G-code/comment 1行を逐次出力する。"""
@@ -657,9 +1030,7 @@ class _GCodeEmitter:
             return
         self._pen_is_down = bool(down)
         z = float(self.params.z_down if down else self.params.z_up)
-        self.write_line(
-            f"G1 Z{_fmt_float(round(z, self.decimals), decimals=self.decimals)}"
-        )
+        self.write_line(_pen_line(z, decimals=self.decimals))
 
     def set_feed(self, feed: int) -> None:
         """必要な場合だけ feed command を追加する。"""
@@ -672,12 +1043,7 @@ class _GCodeEmitter:
     def move_xy(self, point: tuple[float, float]) -> None:
         """canvas point を安全検証し、重複しない XY command として追加する。"""
 
-        machine = _canvas_to_machine_xy(
-            point,
-            params=self.params,
-            canvas_size=self.canvas,
-        )
-        quantized = _quantize_xy(machine, decimals=self.decimals)
+        quantized = _machine_output_xy(point, params=self.params, canvas=self.canvas)
         _validate_bed_xy(
             quantized,
             bed_x_range=self.params.bed_x_range,
@@ -693,84 +1059,392 @@ class _GCodeEmitter:
         y_text = _fmt_float(quantized[1], decimals=self.decimals)
         self.write_line(f"G1 X{x_text} Y{y_text}")
 
-    def finish(self) -> None:
-        """安全な最終 Z command を追加する。"""
 
-        final_z = round(float(self.params.z_up + 20), self.decimals)
-        self.write_line("; ====== Footer ======")
-        self.write_line(f"G1 Z{_fmt_float(final_z, decimals=self.decimals)}")
+def _pen_line(z: float, *, decimals: int) -> str:
+    return f"G1 Z{_fmt_float(round(float(z), decimals), decimals=decimals)}"
+
+
+def _machine_output_xy(
+    point: tuple[float, float],
+    *,
+    params: GCodeParams,
+    canvas: tuple[float, float],
+) -> tuple[float, float]:
+    """canvas point を実際に出力する丸め後 machine 座標へ変換する。"""
+
+    machine = _canvas_to_machine_xy(point, params=params, canvas_size=canvas)
+    return _quantize_xy(machine, decimals=int(params.decimals))
 
 
-def _emit_polyline_fragments(
+def _emit_fragment(
     emitter: _GCodeEmitter,
-    ordered: Sequence[tuple[_Stroke, bool]],
+    points: np.ndarray,
     *,
-    bridge_draw_distance: float | None,
-    scale: int,
+    poly_idx: int,
+    seg_idx: int,
+    flags: int,
     travel_feed: int,
     draw_feed: int,
 ) -> None:
-    """順序確定済みの1元polylineのclip fragmentをemitterへ送る。"""
+    """順序と bridge 判定が確定した 1 clip fragment を emitter へ送る。"""
 
-    current_end_q: tuple[int, int] | None = None
-    for stroke, reversed_ in ordered:
-        points = stroke.points_canvas
-        if len(points) < 2:
-            continue
-        emitter.write_line(
-            f"; stroke polyline {stroke.poly_idx} seg {stroke.seg_idx}"
-            f"{' reversed' if reversed_ else ''}"
+    reversed_ = bool(flags & _FRAGMENT_REVERSED)
+    emitter.write_line(
+        f"; stroke polyline {poly_idx} seg {seg_idx}{' reversed' if reversed_ else ''}"
+    )
+    ordered = points[::-1] if reversed_ else points
+    start_xy = (float(ordered[0, 0]), float(ordered[0, 1]))
+    if flags & _FRAGMENT_BRIDGE:
+        emitter.set_pen_down(True)
+        emitter.set_feed(draw_feed)
+    else:
+        emitter.set_pen_down(False)
+        emitter.set_feed(travel_feed)
+        emitter.move_xy(start_xy)
+        emitter.set_pen_down(True)
+        emitter.set_feed(draw_feed)
+    emitter.move_xy(start_xy)
+    for x, y in ordered[1:].tolist():
+        emitter.move_xy((x, y))
+
+
+class _LayerEncoder:
+    """export 全体で共通の定数を持ち、layer 単位の準備と整形を行う。
+
+    Notes
+    -----
+    `prepare()` と `encode()` は layer ごとに独立なので worker thread から呼んでよい。
+    layer 間の依存は `encode()` に渡す入口状態（`_EmitterState`）だけ。
+    """
+
+    def __init__(
+        self,
+        *,
+        params: GCodeParams,
+        canvas: tuple[float, float],
+        safe_rect: tuple[float, float, float, float],
+    ) -> None:
+        bridge_distance = params.bridge_draw_distance
+        if bridge_distance is not None and float(bridge_distance) < 0.0:
+            raise ValueError("bridge_draw_distance は 0 以上である必要がある")
+        self._params = params
+        self._canvas = canvas
+        self._safe_rect = safe_rect
+        self._bridge_distance = None if bridge_distance is None else float(bridge_distance)
+        self.decimals = int(params.decimals)
+        self.scale = 10**self.decimals
+        self.travel_feed = int(round(float(params.travel_feed)))
+        self.draw_feed = int(round(float(params.draw_feed)))
+        self._bulk = self.decimals <= _BULK_MAX_DECIMALS
+        self._pen_up_line = _ascii_line(_pen_line(float(params.z_up), decimals=self.decimals))
+        self._pen_down_line = _ascii_line(_pen_line(float(params.z_down), decimals=self.decimals))
+        self._travel_feed_line = _ascii_line(f"G1 F{self.travel_feed}")
+        self._draw_feed_line = _ascii_line(f"G1 F{self.draw_feed}")
+
+    def prepare(self, layer_index: int, layer: RealizedLayer) -> _PreparedLayer:
+        """layer を clip・並び替え・量子化し、bulk 整形できる layer は bed 検証も済ませる。"""
+
+        packed, strokes_by_polyline = _collect_layer_strokes(
+            layer,
+            safe_rect=self._safe_rect,
+            scale=self.scale,
         )
-        if reversed_:
-            start_xy = points[-1]
-            rest: Iterable[tuple[float, float]] = reversed(points[:-1])
-            start_q, end_q = stroke.end_q, stroke.start_q
+        ordered_polylines = _order_polyline_fragments(
+            strokes_by_polyline,
+            optimize_travel=bool(self._params.optimize_travel),
+            allow_reverse=bool(self._params.allow_reverse),
+        )
+        polylines: list[int] = []
+        segments: list[int] = []
+        flags: list[int] = []
+        starts: list[int] = []
+        stops: list[int] = []
+        for poly_idx, ordered in ordered_polylines:
+            current_end_q: tuple[int, int] | None = None
+            for position, (stroke, reversed_) in enumerate(ordered):
+                if reversed_:
+                    start_q, end_q = stroke.end_q, stroke.start_q
+                else:
+                    start_q, end_q = stroke.start_q, stroke.end_q
+                flag = _FRAGMENT_REVERSED if reversed_ else 0
+                if position == 0:
+                    flag |= _FRAGMENT_OPENS_POLYLINE
+                if position == len(ordered) - 1:
+                    flag |= _FRAGMENT_CLOSES_POLYLINE
+                if self._bridge_distance is not None and current_end_q is not None:
+                    dx = int(start_q[0]) - int(current_end_q[0])
+                    dy = int(start_q[1]) - int(current_end_q[1])
+                    threshold = self._bridge_distance * float(self.scale)
+                    if float(dx * dx + dy * dy) < threshold * threshold:
+                        flag |= _FRAGMENT_BRIDGE
+                polylines.append(poly_idx)
+                segments.append(stroke.seg_idx)
+                flags.append(flag)
+                starts.append(stroke.point_offset)
+                stops.append(stroke.point_offset + len(stroke.points_canvas))
+                current_end_q = end_q
+
+        fragment_starts = np.asarray(starts, dtype=np.int64)
+        fragment_stops = np.asarray(stops, dtype=np.int64)
+        fragment_flags = np.asarray(flags, dtype=np.uint8)
+        first_xy: tuple[float, float] | None = None
+        last_xy: tuple[float, float] | None = None
+        if flags:
+            first_index = stops[0] - 1 if flags[0] & _FRAGMENT_REVERSED else starts[0]
+            last_index = starts[-1] if flags[-1] & _FRAGMENT_REVERSED else stops[-1] - 1
+            first_xy = self._output_xy(packed, first_index)
+            last_xy = self._output_xy(packed, last_index)
+
+        quantized = self._quantize(packed) if self._bulk else None
+        if quantized is not None:
+            self._validate_bed(quantized, fragment_starts, fragment_stops, fragment_flags)
+        return _PreparedLayer(
+            layer_index=layer_index,
+            points_canvas=packed,
+            quantized=quantized,
+            fragment_polylines=np.asarray(polylines, dtype=np.int64),
+            fragment_segments=np.asarray(segments, dtype=np.int64),
+            fragment_flags=fragment_flags,
+            fragment_starts=fragment_starts,
+            fragment_stops=fragment_stops,
+            first_xy=first_xy,
+            last_xy=last_xy,
+        )
+
+    def encode(self, prepared: _PreparedLayer, entry: _EmitterState) -> memoryview:
+        """入口状態 ``entry`` から始まる layer の G-code を ASCII bytes で返す。"""
+
+        if prepared.quantized is None:
+            return self._encode_with_emitter(prepared, entry)
+
+        skip_first_move = (
+            entry.xy is not None
+            and prepared.first_xy is not None
+            and hypot(
+                prepared.first_xy[0] - entry.xy[0],
+                prepared.first_xy[1] - entry.xy[1],
+            )
+            < 1e-12
+        )
+        if entry.feed == self.travel_feed:
+            entry_feed = _FEED_TRAVEL
+        elif entry.feed == self.draw_feed:
+            entry_feed = _FEED_DRAW
         else:
-            start_xy = points[0]
-            rest = points[1:]
-            start_q, end_q = stroke.start_q, stroke.end_q
-
-        draw_bridge = False
-        if bridge_draw_distance is not None and current_end_q is not None:
-            dx = int(start_q[0]) - int(current_end_q[0])
-            dy = int(start_q[1]) - int(current_end_q[1])
-            threshold = float(bridge_draw_distance) * float(scale)
-            draw_bridge = float(dx * dx + dy * dy) < threshold * threshold
-
-        if draw_bridge:
-            emitter.set_pen_down(True)
-            emitter.set_feed(draw_feed)
+            entry_feed = _FEED_UNSET
+
+        def write(out: np.ndarray, measure: bool) -> int:
+            return int(
+                _write_layer_text(
+                    out,
+                    measure,
+                    prepared.layer_index,
+                    prepared.fragment_polylines,
+                    prepared.fragment_segments,
+                    prepared.fragment_flags,
+                    prepared.fragment_starts,
+                    prepared.fragment_stops,
+                    prepared.quantized,
+                    self.decimals,
+                    self.scale,
+                    self._pen_up_line,
+                    self._pen_down_line,
+                    self._travel_feed_line,
+                    self._draw_feed_line,
+                    self.travel_feed == self.draw_feed,
+                    entry_feed,
+                    skip_first_move,
+                )
+            )
+
+        out = np.empty(write(np.empty(0, dtype=np.uint8), True), dtype=np.uint8)
+        write(out, False)
+        return memoryview(out)
+
+    def _encode_with_emitter(self, prepared: _PreparedLayer, entry: _EmitterState) -> memoryview:
+        stream = io.StringIO()
+        emitter = _GCodeEmitter(
+            stream=stream,
+            params=self._params,
+            canvas=self._canvas,
+            state=entry,
+        )
+        emitter.write_line(f"; layer {prepared.layer_index} start")
+        for fragment, flag in enumerate(prepared.fragment_flags.tolist()):
+            poly_idx = int(prepared.fragment_polylines[fragment])
+            if flag & _FRAGMENT_OPENS_POLYLINE:
+                emitter.write_line(f"; source_polyline {poly_idx} start")
+            _emit_fragment(
+                emitter,
+                prepared.points_canvas[
+                    prepared.fragment_starts[fragment] : prepared.fragment_stops[fragment]
+                ],
+                poly_idx=poly_idx,
+                seg_idx=int(prepared.fragment_segments[fragment]),
+                flags=flag,
+                travel_feed=self.travel_feed,
+                draw_feed=self.draw_feed,
+            )
+            if flag & _FRAGMENT_CLOSES_POLYLINE:
+                emitter.write_line(f"; source_polyline {poly_idx} end")
+        emitter.write_line(f"; layer {prepared.layer_index} end")
+        return memoryview(stream.getvalue().encode("ascii"))
+
+    def _output_xy(self, packed: np.ndarray, index: int) -> tuple[float, float]:
+        point = (float(packed[index, 0]), float(packed[index, 1]))
+        return _machine_output_xy(point, params=self._params, canvas=self._canvas)
+
+    def _quantize(self, packed: np.ndarray) -> np.ndarray | None:
+        """出力座標の整数表現を返す。bulk で正確に扱えない値があれば None。"""
+
+        params = self._params
+        machine = np.empty_like(packed)
+        ox, oy = params.origin
+        machine[:, 0] = packed[:, 0] + float(ox)
+        if params.y_down:
+            canvas_h = (
+                float(params.canvas_height_mm)
+                if params.canvas_height_mm is not None
+                else float(self._canvas[1])
+            )
+            machine[:, 1] = canvas_h - packed[:, 1]
+            machine[:, 1] += float(oy)
         else:
-            emitter.set_pen_down(False)
-            emitter.set_feed(travel_feed)
-            emitter.move_xy(start_xy)
-            emitter.set_pen_down(True)
-            emitter.set_feed(draw_feed)
-        emitter.move_xy(start_xy)
-        for point in rest:
-            emitter.move_xy(point)
-        current_end_q = end_q
+            machine[:, 1] = packed[:, 1] + float(oy)
+
+        values = machine.reshape(-1)
+        quantized = np.empty(values.shape[0], dtype=np.int64)
+        status = np.empty(values.shape[0], dtype=np.uint8)
+        _quantize_coordinates(values, float(self.scale), _BULK_MAX_QUANTIZED, quantized, status)
+        if bool(np.any(status == _QUANTIZED_UNREPRESENTABLE)):
+            return None
+        for index in np.flatnonzero(status == _QUANTIZED_NEAR_TIE).tolist():
+            rounded = round(float(values[index]), self.decimals)
+            quantized[index] = int(round(rounded * self.scale))
+        quantized = quantized.reshape(-1, 2)
+        quantized.setflags(write=False)
+        return quantized
+
+    def _validate_bed(
+        self,
+        quantized: np.ndarray,
+        starts: np.ndarray,
+        stops: np.ndarray,
+        flags: np.ndarray,
+    ) -> None:
+        """出力順で最初の範囲外点について `_validate_bed_xy` と同じ例外を送出する。"""
+
+        bed_x_range = self._params.bed_x_range
+        bed_y_range = self._params.bed_y_range
+        if bed_x_range is None and bed_y_range is None:
+            return
+        output = quantized / float(self.scale)
+        outside = np.zeros(quantized.shape[0], dtype=bool)
+        for axis, bed_range in enumerate((bed_x_range, bed_y_range)):
+            if bed_range is not None:
+                low, high = float(bed_range[0]), float(bed_range[1])
+                outside |= ~((low <= output[:, axis]) & (output[:, axis] <= high))
+        if not bool(outside.any()):
+            return
+        for start, stop, flag in zip(starts.tolist(), stops.tolist(), flags.tolist(), strict=True):
+            hits = np.flatnonzero(outside[start:stop])
+            if hits.size:
+                index = start + int(hits[-1] if flag & _FRAGMENT_REVERSED else hits[0])
+                _validate_bed_xy(
+                    (float(output[index, 0]), float(output[index, 1])),
+                    bed_x_range=bed_x_range,
+                    bed_y_range=bed_y_range,
+                )
+
+
+def _ascii_line(line: str) -> np.ndarray:
+    return np.frombuffer(f"{line}\n".encode("ascii"), dtype=np.uint8)
+
+
+def _encode_layers(
+    encoder: _LayerEncoder,
+    layers: Iterable[RealizedLayer],
+    *,
+    threads: int,
+) -> Iterator[memoryview]:
+    """layer ごとの G-code を入力順に yield する。
+
+    Notes
+    -----
+    ``threads > 1`` では準備と整形を worker thread で並列に進める。整形の入口状態は
+    直前 layer の準備結果だけで決まるので、準備が入力順に終わり次第、次の layer の
+    整形を投入できる。同時に抱える layer は ``2 * threads`` までに抑える。
+    例外は出力順で最初の layer のものを送出する。
+    """
+
+    state = _EmitterState()
+    if threads == 1:
+        for layer_index, layer in enumerate(layers):
+            prepared = encoder.prepare(layer_index, layer)
+            yield encoder.encode(prepared, state)
+            state = prepared.exit_state(state, draw_feed=encoder.draw_feed)
+        return
+
+    window = 2 * threads
+    layer_iter = enumerate(layers)
+    preparing: deque[Future[_PreparedLayer]] = deque()
+    encoding: deque[Future[memoryview]] = deque()
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="grafix-gcode") as executor:
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(preparing) + len(encoding) < window:
+                    item = next(layer_iter, None)
+                    if item is None:
+                        exhausted = True
+                    else:
+                        preparing.append(executor.submit(encoder.prepare, *item))
+                if preparing:
+                    head = preparing.popleft()
+                    try:
+                        prepared = head.result()
+                    except BaseException:
+                        # 先行 layer の整形で起きた例外を優先する。
+                        for earlier in encoding:
+                            earlier.result()
+                        raise
+                    encoding.append(executor.submit(encoder.encode, prepared, state))
+                    state = prepared.exit_state(state, draw_feed=encoder.draw_feed)
+                    if len(encoding) <= threads and not exhausted:
+                        continue
+                if not encoding:
+                    return
+                yield encoding.popleft().result()
+        finally:
+            for future in (*preparing, *encoding):
+                future.cancel()
 
 
 def export_gcode(
-    layers: Sequence[RealizedLayer],
+    layers: Iterable[RealizedLayer],
     path: str | Path,
     *,
     canvas_size: tuple[float, float],
     params: GCodeParams,
+    encoder_threads: int | None = None,
 ) -> Path:
     """Layer 列を決定的な G-code として保存する。
 
     Parameters
     ----------
-    layers : Sequence[RealizedLayer]
-        realize 済みの Layer 列。
+    layers : Iterable[RealizedLayer]
+        realize 済みの Layer 列。受け取った順に encode し、同時に抱えるのは
+        ``2 * encoder_threads`` layer まで。
     path : str or Path
         出力先パス。
     canvas_size : tuple[float, float]
         紙サイズ（mm）として扱うキャンバス寸法 ``(width, height)``。
     params : GCodeParams
         session/config 境界で確定した出力パラメータ。
+    encoder_threads : int or None, optional
+        layer の clip・量子化・整形に使う thread 数。None なら呼び出し thread に
+        `ThreadBudget` が配分した numba thread 数（上限 8）。出力内容は thread 数に
+        依存しない。
 
     Returns
     -------
@@ -784,42 +1458,22 @@ def export_gcode(
         canvas,
         paper_margin_mm=float(params.paper_margin_mm),
     )
-    bridge_distance = params.bridge_draw_distance
-    if bridge_distance is not None and float(bridge_distance) < 0.0:
-        raise ValueError("bridge_draw_distance は 0 以上である必要がある")
-
-    scale = 10 ** int(params.decimals)
-    travel_feed = int(round(float(params.travel_feed)))
-    draw_feed = int(round(float(params.draw_feed)))
-    with atomic_text_writer(destination, newline="\n") as stream:
-        emitter = _GCodeEmitter(stream=stream, params=params, canvas=canvas)
-
-        for layer_index, layer in enumerate(layers):
-            emitter.write_line(f"; layer {layer_index} start")
-            strokes_by_polyline = _collect_layer_strokes(
-                layer,
-                safe_rect=safe_rect,
-                scale=scale,
-            )
-            ordered_polylines = _order_polyline_fragments(
-                strokes_by_polyline,
-                optimize_travel=bool(params.optimize_travel),
-                allow_reverse=bool(params.allow_reverse),
+    encoder = _LayerEncoder(params=params, canvas=canvas, safe_rect=safe_rect)
+    threads = (
+        _default_encoder_threads()
+        if encoder_threads is None
+        else exact_integer(encoder_threads, name="encoder_threads", minimum=1)
+    )
+    final_z = float(params.z_up + 20)
+    with atomic_output_path(destination) as temp_path, temp_path.open("wb") as stream:
+        stream.write("".join(f"{line}\n" for line in _GCODE_HEADER).encode("ascii"))
+        for chunk in _encode_layers(encoder, layers, threads=threads):
+            stream.write(chunk)
+        stream.write(
+            f"; ====== Footer ======\n{_pen_line(final_z, decimals=encoder.decimals)}\n".encode(
+                "ascii"
             )
-            for poly_idx, ordered in ordered_polylines:
-                emitter.write_line(f"; source_polyline {poly_idx} start")
-                _emit_polyline_fragments(
-                    emitter,
-                    ordered,
-                    bridge_draw_distance=bridge_distance,
-                    scale=scale,
-                    travel_feed=travel_feed,
-                    draw_feed=draw_feed,
-                )
-                emitter.write_line(f"; source_polyline {poly_idx} end")
-            emitter.write_line(f"; layer {layer_index} end")
-
-        emitter.finish()
+        )
     return destination
 
 
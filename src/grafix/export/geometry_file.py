@@ -0,0 +1,62 @@
+"""
+どこで: `src/grafix/export/geometry_file.py`。
+何を: realize 済みシーンを grafix geometry file（compact binary container）として保存する。
+なぜ: 重い scene を job 間で再利用し、下流 tool へ SVG parse なしで geometry を渡すため。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from grafix.core.geometry_file import (
+    GeometryFileCompression,
+    GeometryFileLayer,
+    write_geometry_file,
+)
+from grafix.core.pipeline import RealizedLayer
+from grafix.file_io import atomic_output_path
+
+
+def _file_layers(layers: Iterable[RealizedLayer]) -> Iterator[GeometryFileLayer]:
+    for layer in layers:
+        yield GeometryFileLayer(
+            coords=layer.realized.coords,
+            offsets=layer.realized.offsets,
+            color=layer.color,
+            thickness=layer.thickness,
+            name=layer.layer.name,
+        )
+
+
+def export_geometry_file(
+    layers: Iterable[RealizedLayer],
+    path: str | Path,
+    *,
+    compression: GeometryFileCompression = "none",
+) -> Path:
+    """Layer 列を grafix geometry file として保存する。
+
+    Parameters
+    ----------
+    layers : Iterable[RealizedLayer]
+        realize 済みの Layer 列。受け取った順に 1 layer ずつ書き出す。
+    path : str or Path
+        保存先パス。
+    compression : {"none", "zlib"}, optional
+        ``"none"`` は `grafix.core.geometry_file.read_geometry_file` が memmap で
+        読める無圧縮形式。``"zlib"`` は座標の XOR delta と deflate で小さくする。
+
+    Returns
+    -------
+    Path
+        保存先パス（正規化済み）。
+    """
+
+    _path = Path(path)
+    with atomic_output_path(_path) as temp_path, temp_path.open("wb") as stream:
+        write_geometry_file(stream, _file_layers(layers), compression=compression)
+    return _path
+
+
+__all__ = ["export_geometry_file"]
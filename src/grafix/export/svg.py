@@ -6,7 +6,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import TextIO
 
@@ -68,7 +68,7 @@ def _write_polyline_path(
 
 
 def export_svg(
-    layers: Sequence[RealizedLayer],
+    layers: Iterable[RealizedLayer],
     path: str | Path,
     *,
     canvas_size: tuple[int, int],
@@ -77,8 +77,8 @@ def export_svg(
 
     Parameters
     ----------
-    layers : Sequence[RealizedLayer]
-        realize 済みの Layer 列。
+    layers : Iterable[RealizedLayer]
+        realize 済みの Layer 列。受け取った順に 1 layer ずつ書き出す。
     path : str or Path
         出力先パス。
     canvas_size : tuple[int, int]
@@ -0,0 +1,344 @@
+"""render 済み frame 列を PNG 化し、ffmpeg へ流して動画として保存する。
+
+interactive の ``VideoRecorder`` は GL window の readback を実時間で流すが、ここでは
+GPU を使わない。呼び出し側（通常は :func:`grafix.api.video.render_video`）の thread が
+frame を順に render し、rasterizer thread 群が SVG -> PNG を並列に行い、writer thread が
+frame 順に ffmpeg の stdin へ書く。render / rasterize / encode の 3 段は
+``max_pending_frames`` 件の bounded queue で繋がり、遅い段が前段を backpressure する。
+"""
+
+from __future__ import annotations
+
+import queue
+import subprocess
+import tempfile
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from grafix.core.export_format import ExportFormat
+from grafix.core.value_validation import (
+    exact_integer,
+    finite_real,
+    positive_integer_pair,
+)
+from grafix.export.capture import CaptureFrame, CaptureService
+from grafix.file_io import atomic_output_path
+
+DEFAULT_FRAME_TIMEOUT_S = 30.0
+DEFAULT_ENCODER_FINISH_TIMEOUT_S = 60.0
+_ABORT_TIMEOUT_S = 4.0
+# 停止要求を観測するための queue 待ち間隔。
+_POLL_INTERVAL_S = 0.05
+
+
+def ffmpeg_png_pipe_command(*, output_path: Path, fps: float) -> list[str]:
+    """PNG 連結 stream を stdin から受けて H.264 mp4 を書く ffmpeg command を返す。
+
+    PNG は上から下の行順なので、raw readback 用の ``vflip`` は付けない。奇数寸法は
+    右端・下端を 1 px pad して yuv420p の偶数寸法へ揃える。
+    """
+
+    if not isinstance(output_path, Path):
+        raise TypeError("output_path は Path である必要があります")
+    frame_rate = finite_real(
+        fps,
+        name="fps",
+        minimum=0.0,
+        minimum_inclusive=False,
+    )
+    return [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-y",
+        "-f",
+        "image2pipe",
+        "-framerate",
+        str(frame_rate),
+        "-c:v",
+        "png",
+        "-i",
+        "-",
+        "-vf",
+        "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+        "-an",
+        "-c:v",
+        "libx264",
+        "-pix_fmt",
+        "yuv420p",
+        str(output_path),
+    ]
+
+
+def _abort_encoder(proc: subprocess.Popen[bytes]) -> None:
+    """ffmpeg を best-effort で停止・回収する。cleanup error は元の error を隠さない。"""
+
+    if proc.poll() is None:
+        try:
+            proc.terminate()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=_ABORT_TIMEOUT_S / 2.0)
+        except subprocess.TimeoutExpired:
+            try:
+                proc.kill()
+                proc.wait(timeout=_ABORT_TIMEOUT_S / 2.0)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+    stdin = proc.stdin
+    if stdin is not None:
+        try:
+            stdin.close()
+        except OSError:
+            pass
+
+
+def _rasterize_frame(
+    capture: CaptureService,
+    frame: CaptureFrame,
+    *,
+    work_dir: Path,
+    index: int,
+    output_size: tuple[int, int],
+    timeout_s: float,
+) -> bytes:
+    """1 frame を private work dir で PNG 化し、その bytes を返す。"""
+
+    png_path = work_dir / f"frame-{index:08d}.png"
+    try:
+        capture.encode(
+            frame,
+            png_path,
+            format=ExportFormat.PNG,
+            output_size=output_size,
+            timeout_s=timeout_s,
+        )
+        return png_path.read_bytes()
+    finally:
+        png_path.unlink(missing_ok=True)
+
+
+def encode_video_frames(
+    frames: Iterable[CaptureFrame],
+    output_path: Path,
+    *,
+    fps: float,
+    output_size: tuple[int, int],
+    rasterizer_threads: int,
+    max_pending_frames: int,
+    frame_timeout_s: float = DEFAULT_FRAME_TIMEOUT_S,
+    finish_timeout_s: float = DEFAULT_ENCODER_FINISH_TIMEOUT_S,
+) -> int:
+    """frame 列を PNG 化しながら ffmpeg へ流し、``output_path`` へ atomic に保存する。
+
+    Parameters
+    ----------
+    frames : Iterable[CaptureFrame]
+        呼び出し thread で順に消費する frame 列。generator なら render も
+        rasterize/encode と並行する。
+    output_path : Path
+        最終動画 path。ffmpeg は sibling temp へ書き、成功時だけ置換する。
+    fps : float
+        出力 frame rate。
+    output_size : tuple[int, int]
+        PNG の (width, height) ピクセルサイズ。
+    rasterizer_threads : int
+        SVG -> PNG を並列に行う thread 数。
+    max_pending_frames : int
+        rasterize 中または encode 待ちで保持する frame の上限。
+    frame_timeout_s : float
+        1 frame の resvg 実行上限秒数。
+    finish_timeout_s : float
+        stdin を閉じた後に ffmpeg の終了を待つ上限秒数。
+
+    Returns
+    -------
+    int
+        encode した frame 数。
+
+    Raises
+    ------
+    RuntimeError
+        ffmpeg が見つからない、frame が空、または ffmpeg が失敗した場合。
+    """
+
+    if not isinstance(output_path, Path):
+        raise TypeError("output_path は Path である必要があります")
+    frame_rate = finite_real(fps, name="fps", minimum=0.0, minimum_inclusive=False)
+    size = positive_integer_pair(output_size, name="output_size")
+    threads = exact_integer(rasterizer_threads, name="rasterizer_threads", minimum=1)
+    pending_limit = exact_integer(
+        max_pending_frames,
+        name="max_pending_frames",
+        minimum=1,
+    )
+    frame_timeout = finite_real(
+        frame_timeout_s,
+        name="frame_timeout_s",
+        minimum=0.0,
+        minimum_inclusive=False,
+    )
+    finish_timeout = finite_real(
+        finish_timeout_s,
+        name="finish_timeout_s",
+        minimum=0.0,
+        minimum_inclusive=False,
+    )
+
+    capture = CaptureService()
+    with (
+        atomic_output_path(output_path) as temp_path,
+        tempfile.TemporaryDirectory(
+            prefix=f".{output_path.stem}.video-frames-",
+            dir=output_path.parent,
+        ) as raw_work_dir,
+    ):
+        work_dir = Path(raw_work_dir)
+        # stderr を PIPE にすると長い log で ffmpeg が詰まり得るため file へ逃がす。
+        with (work_dir / "ffmpeg.log").open("w+b") as stderr_file:
+            try:
+                proc = subprocess.Popen(
+                    ffmpeg_png_pipe_command(output_path=temp_path, fps=frame_rate),
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr_file,
+                )
+            except FileNotFoundError as exc:
+                raise RuntimeError(
+                    "ffmpeg が見つかりません（PATH を確認してください）"
+                ) from exc
+            try:
+                frame_count = _stream_frames(
+                    frames,
+                    proc,
+                    capture=capture,
+                    work_dir=work_dir,
+                    output_size=size,
+                    threads=threads,
+                    pending_limit=pending_limit,
+                    frame_timeout_s=frame_timeout,
+                )
+                try:
+                    returncode = proc.wait(timeout=finish_timeout)
+                except subprocess.TimeoutExpired as exc:
+                    raise RuntimeError("ffmpeg の終了がタイムアウトしました") from exc
+            except BaseException:
+                _abort_encoder(proc)
+                raise
+            if returncode != 0:
+                stderr_file.seek(0)
+                detail = stderr_file.read().decode("utf-8", errors="replace").strip()
+                raise RuntimeError(
+                    f"ffmpeg が失敗しました: returncode={returncode}"
+                    + (f"\n{detail}" if detail else "")
+                )
+    return frame_count
+
+
+def _stream_frames(
+    frames: Iterable[CaptureFrame],
+    proc: subprocess.Popen[bytes],
+    *,
+    capture: CaptureService,
+    work_dir: Path,
+    output_size: tuple[int, int],
+    threads: int,
+    pending_limit: int,
+    frame_timeout_s: float,
+) -> int:
+    """render -> rasterize -> ffmpeg stdin の 3 段 pipeline を回し、frame 数を返す。"""
+
+    stdin = proc.stdin
+    if stdin is None:
+        raise RuntimeError("ffmpeg stdin pipe の作成に失敗しました")
+    # future を submit 順に積む。writer が frame 順に result() を待つので、
+    # rasterizer の完了順に関係なく動画の frame 順は保たれる。
+    pending: queue.Queue[Future[bytes] | None] = queue.Queue(maxsize=pending_limit)
+    stop = threading.Event()
+    writer_errors: list[BaseException] = []
+
+    def write_frames() -> None:
+        try:
+            while True:
+                future = pending.get()
+                if future is None or stop.is_set():
+                    return
+                stdin.write(future.result())
+        except BaseException as exc:
+            writer_errors.append(exc)
+            stop.set()
+
+    def put(item: Future[bytes] | None) -> bool:
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=_POLL_INTERVAL_S)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    writer = threading.Thread(
+        target=write_frames,
+        name="grafix-video-writer",
+        daemon=True,
+    )
+    executor = ThreadPoolExecutor(
+        max_workers=threads,
+        thread_name_prefix="grafix-video-raster",
+    )
+    frame_count = 0
+    writer.start()
+    try:
+        for index, frame in enumerate(frames):
+            future = executor.submit(
+                _rasterize_frame,
+                capture,
+                frame,
+                work_dir=work_dir,
+                index=index,
+                output_size=output_size,
+                timeout_s=frame_timeout_s,
+            )
+            if not put(future):
+                future.cancel()
+                break
+            frame_count += 1
+        put(None)
+        writer.join()
+        if writer_errors:
+            raise writer_errors[0]
+        if frame_count == 0:
+            raise RuntimeError("動画に書き出す frame がありません")
+        stdin.close()
+    except BaseException:
+        stop.set()
+        # writer が stdin.write で詰まっていても pipe を閉じれば抜けられる。
+        _abort_encoder(proc)
+        while True:
+            try:
+                item = pending.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item.cancel()
+        try:
+            pending.put_nowait(None)
+        except queue.Full:
+            pass
+        writer.join(timeout=_ABORT_TIMEOUT_S)
+        raise
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return frame_count
+
+
+__all__ = [
+    "DEFAULT_ENCODER_FINISH_TIMEOUT_S",
+    "DEFAULT_FRAME_TIMEOUT_S",
+    "encode_video_frames",
+    "ffmpeg_png_pipe_command",
+]
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 import moderngl
 import numpy as np
 
+from grafix.core.instanced_geometry import InstancedGeometry
 from grafix.core.parameters.style import line_width_for_short_side
 from grafix.core.realize import GeometryCacheKey
 from grafix.core.realized_geometry import RealizedGeometry
@@ -349,7 +350,41 @@ class DrawRenderer:
         snapshot_revision: int,
         dynamic_slot: int | None = None,
     ) -> tuple[LineMesh | None, LineIndexStats]:
-        """upload（必要なら）を行い、描画に使う LineMesh を返す。"""
+        """upload（必要なら）を行い、描画に使う LineMesh を返す。
+
+        InstancedGeometry は展開せず、base の頂点だけを VBO へ、変換列を instance
+        buffer へ送る。統計は展開後の数を返す。
+        """
+        transforms = None
+        if type(realized) is InstancedGeometry:
+            transforms = realized.gpu_transforms
+            realized = realized.base
+        mesh, stats = self._prepare_base_mesh(
+            realized,
+            cache_key=cache_key,
+            scene_serial=scene_serial,
+            snapshot_revision=snapshot_revision,
+            dynamic_slot=dynamic_slot,
+        )
+        if mesh is not None and mesh.upload_instances(transforms):
+            self._record_mesh_upload()
+        if transforms is None:
+            return mesh, stats
+        count = int(transforms.shape[0])
+        return mesh, LineIndexStats(
+            draw_vertices=stats.draw_vertices * count,
+            draw_lines=stats.draw_lines * count,
+        )
+
+    def _prepare_base_mesh(
+        self,
+        realized: RealizedGeometry,
+        *,
+        cache_key: GeometryCacheKey,
+        scene_serial: int,
+        snapshot_revision: int,
+        dynamic_slot: int | None,
+    ) -> tuple[LineMesh | None, LineIndexStats]:
         slot = None if dynamic_slot is None else int(dynamic_slot)
         if slot is not None and slot < 0:
             raise ValueError("dynamic_slot は 0 以上である必要があります")
@@ -725,7 +760,14 @@ class DrawRenderer:
             self._last_draw_style = (normalized_thickness, color)
 
         # ボトルネックになりやすい: 多レイヤー/多 draw call 時はここ（ドライバ/GL 呼び出し）が支配しやすい。
-        mesh.vao.render(mode=self._ctx.LINE_STRIP, vertices=mesh.index_count)
+        if mesh.instance_count == 1:
+            mesh.vao.render(mode=self._ctx.LINE_STRIP, vertices=mesh.index_count)
+        else:
+            mesh.vao.render(
+                mode=self._ctx.LINE_STRIP,
+                vertices=mesh.index_count,
+                instances=mesh.instance_count,
+            )
 
     def release(self) -> None:
         """GPU リソースを解放する。"""
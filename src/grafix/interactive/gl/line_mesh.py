@@ -18,6 +18,9 @@ class LineMesh:
 
     PRIMITIVE_RESTART_INDEX = 0xFFFFFFFF
     BUFFER_GROWTH_FACTOR = 2
+    # instance attribute は column-major mat4（float32 × 16）。
+    INSTANCE_STRIDE = 16 * 4
+    IDENTITY_INSTANCE = np.eye(4, dtype=np.float32).reshape(1, 16)
 
     def __init__(
         self,
@@ -32,6 +35,7 @@ class LineMesh:
         VBO (Vertex Buffer Object): GPUに送る「頂点データ」を格納するメモリ。
         IBO (Index Buffer Object): GPUに「頂点の順序（描画のための索引）」を送るメモリ。
         VAO (Vertex Array Object): VBOとIBOを関連付けて、描画命令をシンプルに管理する仕組み。
+        Instance VBO: 同じ頂点列を何個の変換で描くかを表す mat4 列。既定は単位行列 1 個。
         Primitive Restart Index: 描画時に「ここで一旦区切る」という目印。
         """
         self.ctx = ctx
@@ -42,27 +46,41 @@ class LineMesh:
         # バッファ予約
         self.vbo = ctx.buffer(reserve=initial_reserve, dynamic=True)
         self.ibo = ctx.buffer(reserve=initial_reserve, dynamic=True)
-        self.vao = ctx.simple_vertex_array(
-            program, self.vbo, "in_vert", index_buffer=self.ibo
-        )
+        self.instance_vbo = ctx.buffer(self.IDENTITY_INSTANCE.tobytes(), dynamic=True)
+        self.vao = self._vertex_array(self.vbo, self.ibo, self.instance_vbo)
 
         # 描画ステート
         self.index_count: int = 0
+        self.instance_count: int = 1
+        self.instance_transforms: np.ndarray | None = None
         self.ctx.primitive_restart = True  # type: ignore
         self.ctx.primitive_restart_index = self.PRIMITIVE_RESTART_INDEX  # type: ignore
 
+    def _vertex_array(self, vbo: Any, ibo: Any, instance_vbo: Any) -> Any:
+        return self.ctx.vertex_array(
+            self.program,
+            [
+                (vbo, "3f", "in_vert"),
+                (instance_vbo, "16f/i", "in_model"),
+            ],
+            index_buffer=ibo,
+        )
+
     # ---------- バッファ操作 ----------
-    def _ensure_capacity(self, vbo_size: int, ibo_size: int) -> None:
+    def _ensure_capacity(self, vbo_size: int, ibo_size: int, instance_size: int = 0) -> None:
         """データが大きくなったらGPUのバッファを再確保"""
         grow_vbo = int(vbo_size) > int(self.vbo.size)
         grow_ibo = int(ibo_size) > int(self.ibo.size)
-        if not grow_vbo and not grow_ibo:
+        grow_instances = int(instance_size) > int(self.instance_vbo.size)
+        if not grow_vbo and not grow_ibo and not grow_instances:
             return
 
         old_vbo = self.vbo
         old_ibo = self.ibo
+        old_instances = self.instance_vbo
         new_vbo = old_vbo
         new_ibo = old_ibo
+        new_instances = old_instances
         try:
             if grow_vbo:
                 new_vbo = self.ctx.buffer(
@@ -74,17 +92,19 @@ class LineMesh:
                     reserve=self._grown_capacity(old_ibo.size, ibo_size),
                     dynamic=True,
                 )
-            new_vao = self.ctx.simple_vertex_array(
-                self.program,
-                new_vbo,
-                "in_vert",
-                index_buffer=new_ibo,
-            )
+            if grow_instances:
+                new_instances = self.ctx.buffer(
+                    reserve=self._grown_capacity(old_instances.size, instance_size),
+                    dynamic=True,
+                )
+            new_vao = self._vertex_array(new_vbo, new_ibo, new_instances)
         except BaseException:
             if new_vbo is not old_vbo:
                 new_vbo.release()
             if new_ibo is not old_ibo:
                 new_ibo.release()
+            if new_instances is not old_instances:
+                new_instances.release()
             raise
 
         self.vao.release()
@@ -92,8 +112,11 @@ class LineMesh:
             old_vbo.release()
         if new_ibo is not old_ibo:
             old_ibo.release()
+        if new_instances is not old_instances:
+            old_instances.release()
         self.vbo = new_vbo
         self.ibo = new_ibo
+        self.instance_vbo = new_instances
         self.vao = new_vao
 
     def _grown_capacity(self, current: int, required: int) -> int:
@@ -128,8 +151,36 @@ class LineMesh:
         self.vbo.orphan()
         self.vbo.write(vertices_f32)
 
+    def upload_instances(self, transforms: np.ndarray | None) -> bool:
+        """instance 変換列を GPU へ送り込み、送った場合だけ True を返す。
+
+        transforms は float32 shape (K,16) の column-major mat4 列。None は単位行列
+        1 個（通常描画）へ戻す。同じ配列・同じ内容なら再送しない。
+        """
+
+        current = self.instance_transforms
+        if transforms is None:
+            if current is None:
+                return False
+            data = self.IDENTITY_INSTANCE
+        else:
+            if current is transforms or (
+                current is not None
+                and current.shape == transforms.shape
+                and np.array_equal(current, transforms)
+            ):
+                return False
+            data = np.ascontiguousarray(transforms, dtype=np.float32)
+        # instance 列が縮んでも buffer は縮めない。描画する個数は instance_count で決まる。
+        self._ensure_capacity(0, 0, int(data.nbytes))
+        self.instance_vbo.write(data)
+        self.instance_transforms = transforms
+        self.instance_count = int(data.shape[0])
+        return True
+
     def release(self) -> None:
         """GPUのメモリを解放する（終了時に使う）"""
         self.vbo.release()
         self.ibo.release()
+        self.instance_vbo.release()
         self.vao.release()
@@ -1,6 +1,7 @@
 """
 どこで: `src/grafix/interactive/gl/shader.py`。
 何を: 線の太さをジオメトリシェーダで表現する最小頂点/ジオメトリ/フラグメントのセットを提供。
+頂点シェーダは instance 変換（mat4）を適用し、複製 geometry を instanced draw で描く。
 なぜ: 単純なラインを太さ付き四角形に展開し、視認性を高めるため。
 """
 
@@ -10,8 +11,11 @@ class Shader:
     #version 410
     uniform mat4 projection;
     in vec3 in_vert;
+    // instance ごとの affine 変換。通常描画では単位行列 1 個が入る。
+    in mat4 in_model;
     void main() {
-        gl_Position = projection * vec4(in_vert.xy, 0.0, 1.0);
+        vec4 world = in_model * vec4(in_vert, 1.0);
+        gl_Position = projection * vec4(world.xy, 0.0, 1.0);
     }
     """
     GEOMETRY_SHADER = """
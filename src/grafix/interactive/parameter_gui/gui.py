@@ -16,6 +16,7 @@ from grafix.core.parameters.history import (
     ParamSnapshotSlots,
     ParamStoreHistory,
 )
+from grafix.core.parameters.key import ParameterKey
 from grafix.core.parameters.reconcile_ops import list_reconcile_orphans
 from grafix.core.parameters.snapshot_ops import store_snapshot
 from grafix.core.parameters.store import ParamStore
@@ -31,7 +32,7 @@ from .catalog import ParameterGuiCatalog, current_parameter_gui_catalog
 from .midi_learn import MidiLearnState
 from .monitor_bar import monitor_alert_lines, render_monitor_alerts, render_monitor_status
 from .diagnostics_panel import render_diagnostics_panel
-from .help_pane import render_parameter_help_pane
+from .help_pane import render_parameter_edit_cost, render_parameter_help_pane
 from .profiler_panel import render_profiler_panel
 from .parameter_filter import ParameterActivityFilter
 from .pyglet_backend import (
@@ -1367,10 +1368,22 @@ class ParameterGUI:
             geometry.height,
         )
         try:
-            render_parameter_help_pane(
-                imgui,
-                self._session.help_row,
+            help_row = self._session.help_row
+            render_parameter_help_pane(imgui, help_row)
+            predictor = (
+                None if monitor_snapshot is None else monitor_snapshot.edit_predictor
             )
+            if predictor is not None and help_row is not None:
+                render_parameter_edit_cost(
+                    imgui,
+                    predictor(
+                        ParameterKey(
+                            op=help_row.op,
+                            site_id=help_row.site_id,
+                            arg=help_row.arg,
+                        )
+                    ),
+                )
         finally:
             _end_toolbar_surface(imgui)
 
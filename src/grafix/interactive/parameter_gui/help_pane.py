@@ -7,6 +7,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from grafix.core.operation_selector import selector_help_identity
+from grafix.core.parameter_dependencies import ParameterEditPrediction
 from grafix.core.parameters.view import ParameterRow
 
 NO_DESCRIPTION = "No description is available for this parameter."
@@ -64,10 +65,36 @@ def render_parameter_help_pane(imgui, row: ParameterRow | None) -> None:
     )
 
 
+def parameter_edit_cost_text(prediction: ParameterEditPrediction | None) -> str | None:
+    """再計算見積もりを Help pane の 1 行へ整形する。依存 node が無ければ None。"""
+
+    if prediction is None or prediction.nodes == 0:
+        return None
+    noun = "node" if prediction.nodes == 1 else "nodes"
+    if prediction.dominant_op is None:
+        return f"Recompute: {prediction.nodes} {noun} (not measured yet)"
+    seconds = prediction.predicted_ns / 1e9
+    duration = f"{seconds:.2f} s" if seconds >= 0.1 else f"{seconds * 1e3:.1f} ms"
+    return f"Recompute: {prediction.dominant_op} {duration} · {prediction.nodes} {noun}"
+
+
+def render_parameter_edit_cost(
+    imgui,
+    prediction: ParameterEditPrediction | None,
+) -> None:
+    """選択 parameter を編集した時の再計算見積もりを Help pane に追記する。"""
+
+    text = parameter_edit_cost_text(prediction)
+    if text is not None:
+        imgui.text_disabled(text)
+
+
 __all__ = [
     "NO_DESCRIPTION",
     "NOT_SPECIFIED",
     "ParameterHelpContent",
+    "parameter_edit_cost_text",
     "parameter_help_content",
+    "render_parameter_edit_cost",
     "render_parameter_help_pane",
 ]
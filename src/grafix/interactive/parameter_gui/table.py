@@ -6,8 +6,10 @@ from __future__ import annotations
 
 import json
 import math
+from bisect import bisect_left, bisect_right
 from collections.abc import Callable, Mapping, Sequence
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
+from itertools import accumulate
 from types import MappingProxyType
 from typing import Literal, assert_never
 
@@ -38,7 +40,7 @@ from .rules import ui_rules_for_row
 from .snippet import snippet_for_block
 from .table_model import EffectChainTableState
 from .theme import PARAMETER_GUI_PALETTE, source_badge_color
-from .widgets import render_value_widget
+from .widgets import render_value_widget, string_input_height
 
 SNIPPET_POPUP_WINDOW_SIZE_PX = (960.0, 720.0)
 SNIPPET_POPUP_VIEWPORT_MARGIN_PX = 24.0
@@ -72,6 +74,10 @@ PARAMETER_TABLE_SOURCE_COLUMN_WIDTH_PX = 250.0
 PARAMETER_TABLE_RANGE_COLUMN_WIDTH_PX = 130.0
 PARAMETER_TABLE_MIDI_COLUMN_WIDTH_PX = 165.0
 
+# 仮想化で可視域の上下に余分に描く line 数。行高の見積り誤差と、scroll が
+# 反映される 1 frame の遅れを吸収する。
+TABLE_VIRTUALIZATION_OVERSCAN_LINES = 4
+
 GROUP_HEADER_BASE_COLORS_RGBA: dict[str, tuple[int, int, int, int]] = {
     "style": (104, 164, 255, 94),
     "primitive": (229, 138, 125, 94),
@@ -894,10 +900,11 @@ def _render_effect_step_heading(
     *,
     step: EffectStepKey,
     state: EffectChainTableState | None,
+    min_row_height: float = 0.0,
 ) -> EffectOrderCommand | None:
     """drag handle、drop target、補助menuを持つeffect小見出しを描画する。"""
 
-    imgui.table_next_row()
+    _table_next_row(imgui, min_row_height)
     imgui.table_set_column_index(0)
     imgui.push_id(f"effect_step:{step[0]}:{step[1]}")
     try:
@@ -1372,6 +1379,7 @@ def render_parameter_row_4cols(
     midi_last_cc_change: tuple[int, int] | None = None,
     last_source: ValueSource | None = None,
     on_help_row: Callable[[ParameterRow, bool], None] | None = None,
+    min_row_height: float = 0.0,
 ) -> tuple[bool, ParameterRow, MidiLearnState | None]:
     """1 行（1 key）を 4 列テーブルとして描画し、更新後の row を返す。
 
@@ -1417,8 +1425,9 @@ def render_parameter_row_4cols(
     # ここで `row.arg` まで含めているのは、同じ op#ordinal でも arg が異なる可能性があるため。
     imgui.push_id(_row_id(row))
     try:
-        # 以降の描画は「この行」に対して行う。
-        imgui.table_next_row()
+        # 以降の描画は「この行」に対して行う。min_row_height は仮想化が見積もった
+        # 行高で、描画行と省略行の高さを一致させる。
+        _table_next_row(imgui, min_row_height)
 
         # --- Column 1: source selector + label ---
         source_changed, override, reset_to_code = _render_label_cell(
@@ -1511,220 +1520,619 @@ def render_parameter_row_4cols(
     return changed_any, updated, midi_learn_state
 
 
-def render_parameter_table(
+def visible_line_range(
+    line_offsets: Sequence[float],
+    *,
+    view_min_y: float,
+    view_max_y: float,
+) -> tuple[int, int]:
+    """累積 offset で表した line 列のうち、view と交差する半開区間を返す。
+
+    ``line_offsets`` は長さ ``line_count + 1`` の単調非減少列で、i 番目の line は
+    ``[line_offsets[i], line_offsets[i + 1])`` を占める。view も同じ座標系で渡す。
+    """
+
+    line_count = len(line_offsets) - 1
+    if line_count <= 0:
+        return 0, 0
+    start = bisect_right(line_offsets, float(view_min_y)) - 1
+    stop = bisect_left(line_offsets, float(view_max_y), 0, line_count)
+    start = min(max(0, start), line_count)
+    return start, max(start, stop)
+
+
+# table line は effect 小見出し（step key）か、block.items 内の序数（int）。
+_BlockLine = EffectStepKey | int
+# block 高さの計測結果を共有するキー。同じ構造の block は同じ高さを持つ。
+# kind=str の行は値で行高が変わるため、header_id を含めて block 固有にする。
+_BlockHeightKey = tuple[str | None, bool, bool, bool, int, int, float]
+
+
+@dataclass(frozen=True, slots=True)
+class _TablePlan:
+    """group layout と折りたたみ状態から決まる、frame 間で不変な block 配置。"""
+
+    group_layout: tuple[GroupBlockLayout, ...]
+    collapsed_headers: frozenset[CollapsedHeaderKey]
+    line_height: float
+    collapse_keys: tuple[CollapsedHeaderKey | None, ...]
+    height_keys: tuple[_BlockHeightKey | None, ...]
+    row_starts: tuple[int, ...]
+    row_indices: tuple[int, ...]
+    column_header_block: int | None
+
+
+@dataclass(slots=True)
+class _TableFrame:
+    """render_parameter_table の一 frame 分の可変 accumulator。"""
+
+    collapsed_headers: set[CollapsedHeaderKey]
+    midi_learn_state: MidiLearnState | None
+    updated_rows: list[ParameterRow]
+    effect_order_commands: list[EffectOrderCommand] = field(default_factory=list)
+    drew_column_headers: bool = False
+    snippet_popup_text: str | None = None
+
+
+def _table_plan(
     render_input: TableRenderInput,
     *,
-    on_help_row: Callable[[ParameterRow, bool], None] | None = None,
-) -> TableEdits:
-    """immutable snapshot を描画し、immutable edit 集合を返す。"""
+    line_height: float,
+) -> _TablePlan:
+    """render input に対応する block 配置を返す。同じ layout なら前 frame の値を再利用する。"""
 
-    import imgui
+    global _TABLE_PLAN
 
     group_layout = render_input.group_layout
+    collapsed_headers = render_input.collapsed_headers
+    cached = _TABLE_PLAN
+    if (
+        cached is not None
+        and cached.group_layout is group_layout
+        and cached.collapsed_headers == collapsed_headers
+        and cached.line_height == line_height
+    ):
+        return cached
+
+    model_rows = render_input.model_rows
+    collapse_keys: list[CollapsedHeaderKey | None] = []
+    height_keys: list[_BlockHeightKey | None] = []
+    row_starts: list[int] = []
+    row_indices: list[int] = []
+    column_header_block: int | None = None
+    for block_index, block in enumerate(group_layout):
+        first_row = None if not block.items else model_rows[block.items[0].row_index]
+        collapse_key = _collapse_key_for_group(block.group_id, first_row) if block.header else None
+        want_open = not block.header or (
+            collapse_key is not None and collapse_key not in collapsed_headers
+        )
+        draws_column_headers = want_open and column_header_block is None
+        if draws_column_headers:
+            column_header_block = block_index
+        collapse_keys.append(collapse_key)
+        block_rows = [model_rows[item.row_index] for item in block.items]
+        step_count = 0
+        if block.group_id[0] is GroupType.EFFECT_CHAIN:
+            step_count = len({(row.op, row.site_id) for row in block_rows})
+        # header の開閉が ImGui 側の状態に依存する block は高さを予測できない。
+        height_keys.append(
+            None
+            if block.header and collapse_key is None
+            else (
+                block.header_id if any(row.kind == "str" for row in block_rows) else None,
+                block_index > 0 and bool(block.header),
+                want_open,
+                draws_column_headers,
+                len(block.items),
+                step_count,
+                line_height,
+            )
+        )
+        row_starts.append(len(row_indices))
+        row_indices.extend(item.row_index for item in block.items)
+    plan = _TablePlan(
+        group_layout=group_layout,
+        collapsed_headers=collapsed_headers,
+        line_height=line_height,
+        collapse_keys=tuple(collapse_keys),
+        height_keys=tuple(height_keys),
+        row_starts=tuple(row_starts),
+        row_indices=tuple(row_indices),
+        column_header_block=column_header_block,
+    )
+    _TABLE_PLAN = plan
+    return plan
+
+
+def _table_next_row(imgui, min_row_height: float) -> None:
+    """min_row_height 指定時だけ行高を固定して次の table 行へ進む。"""
+
+    if min_row_height > 0.0:
+        imgui.table_next_row(min_row_height=float(min_row_height))
+    else:
+        imgui.table_next_row()
+
+
+def _table_cell_padding_y(imgui) -> float:
+    """table cell の縦 padding を返す。"""
+
+    return float(imgui.get_style().cell_padding[1])
+
+
+def _table_line_height(imgui) -> float:
+    """1 行 widget の parameter 行と effect 小見出しに共通の固定行高を返す。"""
+
+    return float(imgui.get_frame_height()) + 2.0 * _table_cell_padding_y(imgui)
+
+
+def _table_view_bounds(imgui) -> tuple[float, float]:
+    """現在の window の可視域を window-local な content 座標で返す。"""
+
+    scroll_y = float(imgui.get_scroll_y())
+    return scroll_y, scroll_y + float(imgui.get_window_height())
+
+
+def _block_lines(
+    block: GroupBlockLayout,
+    model_rows: Sequence[ParameterRow],
+) -> tuple[list[_BlockLine], dict[EffectStepKey, str]]:
+    """block 内の table line 列（effect 小見出し + parameter 行）を返す。"""
+
+    if block.group_id[0] is not GroupType.EFFECT_CHAIN:
+        return list(range(len(block.items))), {}
+
+    heading_by_step = _effect_step_heading_by_rows(
+        [model_rows[item.row_index] for item in block.items]
+    )
+    lines: list[_BlockLine] = []
+    previous_step: EffectStepKey | None = None
+    for ordinal, item in enumerate(block.items):
+        row = model_rows[item.row_index]
+        step = (row.op, row.site_id)
+        if step != previous_step:
+            lines.append(step)
+            previous_step = step
+        lines.append(ordinal)
+    return lines, heading_by_step
+
+
+def _block_line_offsets(
+    imgui,
+    block: GroupBlockLayout,
+    lines: Sequence[_BlockLine],
+    model_rows: Sequence[ParameterRow],
+    *,
+    line_height: float,
+) -> list[float]:
+    """各 line の高さを見積もり、先頭 line を 0 とした累積 offset を返す。"""
+
+    cell_padding = 2.0 * _table_cell_padding_y(imgui)
+    heights = [line_height] * len(lines)
+    for index, line in enumerate(lines):
+        if not isinstance(line, int):
+            continue
+        row = model_rows[block.items[line].row_index]
+        if row.kind == "str":
+            value = row.ui_value if isinstance(row.ui_value, str) else ""
+            heights[index] = max(
+                line_height,
+                string_input_height(imgui, value) + cell_padding,
+            )
+    return list(accumulate(heights, initial=0.0))
+
+
+def _emit_table_spacer(imgui, line_offsets: Sequence[float], start: int, stop: int) -> None:
+    """描画しない line ``[start, stop)`` と同じ高さの空行を出す。
+
+    TABLE_ROW_BACKGROUND は行番号の偶奇で色を交互にするため、省略した line 数と
+    同じ偶奇の空行数にして、可視行の背景色を scroll 位置に依存させない。
+    """
+
+    count = int(stop) - int(start)
+    if count <= 0:
+        return
+    if count % 2 == 1:
+        _table_next_row(imgui, float(line_offsets[stop] - line_offsets[start]))
+        return
+    middle = int(start) + 1
+    _table_next_row(imgui, float(line_offsets[middle] - line_offsets[start]))
+    _table_next_row(imgui, float(line_offsets[stop] - line_offsets[middle]))
+
+
+def _emit_vertical_skip(imgui, height: float) -> None:
+    """省略した block 群と同じだけ cursor を進める。"""
+
+    if height <= 0.0:
+        return
+    # dummy は item spacing を自分で足すため、その分を差し引く。
+    spacing_y = float(imgui.get_style().item_spacing[1])
+    imgui.dummy(0.0, max(0.0, float(height) - spacing_y))
+
+
+def _is_learn_target(row: ParameterRow, target: ParameterKey) -> bool:
+    """row が MIDI learn 待ちの key か返す。"""
+
+    return row.op == target.op and row.site_id == target.site_id and row.arg == target.arg
+
+
+def _pinned_line_indices(
+    block: GroupBlockLayout,
+    lines: Sequence[_BlockLine],
+    model_rows: Sequence[ParameterRow],
+    midi_learn_state: MidiLearnState | None,
+) -> set[int]:
+    """可視域外でも描画が必要な line index を返す。
+
+    MIDI learn 待ちの行は、受信 CC の割当を自分の MIDI cell で確定するため、
+    scroll で画面外へ出ても描画を止めない。
+    """
+
+    target = None if midi_learn_state is None else midi_learn_state.active_target
+    if target is None:
+        return set()
+    return {
+        index
+        for index, line in enumerate(lines)
+        if isinstance(line, int)
+        and _is_learn_target(model_rows[block.items[line].row_index], target)
+    }
+
+
+def _render_group_header(
+    imgui,
+    frame: _TableFrame,
+    render_input: TableRenderInput,
+    block: GroupBlockLayout,
+    *,
+    collapse_key: CollapsedHeaderKey | None,
+) -> bool:
+    """group の collapsing header と右端の操作群を描画し、open 状態を返す。"""
+
     model_rows = render_input.model_rows
-    catalog = render_input.catalog
-    metric_scale = render_input.metric_scale
-    step_info_by_site = render_input.step_info_by_site
     effect_chain_state_by_id = render_input.effect_chain_state_by_id
-    last_effective_by_key = render_input.last_effective_by_key
+    if collapse_key is not None:
+        want_open = collapse_key not in frame.collapsed_headers
+        imgui.set_next_item_open(bool(want_open), imgui.ALWAYS)
+
+    color_count = 0
+    header_kind = _header_kind_for_group_id(block.group_id)
+    base_rgba255 = GROUP_HEADER_BASE_COLORS_RGBA[header_kind]
+    base = _rgba01_from_rgba255(base_rgba255)
+    normal, hovered, active = _derive_header_colors(base)
+    imgui.push_style_color(imgui.COLOR_HEADER, *normal)
+    imgui.push_style_color(imgui.COLOR_HEADER_HOVERED, *hovered)
+    imgui.push_style_color(imgui.COLOR_HEADER_ACTIVE, *active)
+    color_count = 3
+    try:
+        # collapsing_header は (expanded, visible) を返す。
+        # visible=None なので close ボタン無しで常に表示する。
+        group_open, _visible = imgui.collapsing_header(
+            f"{humanize_identifier(block.header)}##group_header",
+            None,
+            flags=(imgui.TREE_NODE_DEFAULT_OPEN | imgui.TREE_NODE_ALLOW_ITEM_OVERLAP),
+        )
+        imgui.set_item_allow_overlap()
+    finally:
+        if color_count:
+            imgui.pop_style_color(color_count)
+
+    # ヘッダ行の右側に件数と Code ボタンを置く。
+    # collapsing_header は幅いっぱいを使うため、same_line(position=...) で明示配置する。
+    chain_state: EffectChainTableState | None = None
+    if block.group_id[0] is GroupType.EFFECT_CHAIN and effect_chain_state_by_id is not None:
+        chain_state = effect_chain_state_by_id.get(str(block.group_id[1]))
+    button_label = "Code"
+    text_w, _text_h = imgui.calc_text_size(button_label)
+    button_w = float(text_w) + 24.0
+    count_label = f"{len(block.items)} parameters"
+    count_w, _count_h = imgui.calc_text_size(count_label)
+    cluster_w = float(count_w) + 12.0 + float(button_w)
+    if chain_state is not None and chain_state.order_overridden:
+        ui_order_w, _ui_order_h = imgui.calc_text_size("UI order")
+        reset_w, _reset_h = imgui.calc_text_size("Reset")
+        cluster_w += float(ui_order_w) + float(reset_w) + 36.0
+    pos_x = float(imgui.get_window_width()) - cluster_w - 16.0
+    if pos_x > 0.0:
+        imgui.same_line(position=pos_x)
+    else:
+        imgui.same_line()
+    if chain_state is not None and chain_state.order_overridden:
+        imgui.text_colored(
+            "UI order",
+            *PARAMETER_GUI_PALETTE["success"],
+        )
+        imgui.same_line()
+        if imgui.small_button("Reset##effect_order_reset"):
+            frame.effect_order_commands.append(
+                EffectOrderCommand.reset(chain_id=chain_state.chain_id)
+            )
+        _set_item_tooltip(imgui, "Reset this chain to code order.")
+        imgui.same_line()
+    imgui.text_disabled(count_label)
+    imgui.same_line()
+    if imgui.small_button(button_label):
+        frame.snippet_popup_text = snippet_for_block(
+            block,
+            model_rows,
+            catalog=render_input.catalog,
+            last_effective_by_key=render_input.last_effective_by_key,
+            step_info_by_site=render_input.step_info_by_site,
+            raw_label_by_site=render_input.raw_label_by_site,
+        )
+
+    if collapse_key is not None:
+        if group_open:
+            frame.collapsed_headers.discard(collapse_key)
+        else:
+            frame.collapsed_headers.add(collapse_key)
+    return bool(group_open)
+
+
+def _render_group_table(
+    imgui,
+    frame: _TableFrame,
+    render_input: TableRenderInput,
+    block: GroupBlockLayout,
+    *,
+    row_start: int,
+    view: tuple[float, float],
+    line_height: float,
+    on_help_row: Callable[[ParameterRow, bool], None] | None,
+) -> None:
+    """open な group の行を 4 列テーブルとして描く。可視域外の行は空行で代替する。"""
+
+    model_rows = render_input.model_rows
     last_source_by_key = render_input.last_source_by_key
-    raw_label_by_site = render_input.raw_label_by_site
-    midi_learn_state = render_input.midi_learn_state
-    midi_last_cc_change = render_input.midi_last_cc_change
-    collapsed_headers = set(render_input.collapsed_headers)
-    effect_order_commands: list[EffectOrderCommand] = []
-    # 返り値として「更新後の row 群」を返すため、描画しながら新しい row を貯める。
-    # 注: グループを折りたたんで行を描画しない場合でも、group_layout の行と
-    # 1:1 で揃える（store_bridge が strict zip で差分適用するため）。
-    updated_rows: list[ParameterRow] = []
-
-    # --- Code（ポップアップ出力）---
-    # “トリガ（ボタン）” と “表示（ポップアップ）” を分離し、コピペ用途に寄せる。
-    global _SNIPPET_POPUP_TEXT, _SNIPPET_POPUP_FOCUS_NEXT
-    want_open_snippet_popup = False
-    snippet_popup_text_new: str | None = None
+    effect_chain_state_by_id = render_input.effect_chain_state_by_id
 
-    # 列ヘッダ（label/control/min-max/cc）は繰り返すとノイズになるので、
-    # 最初に開いたグループのテーブルで 1 回だけ描画する。
-    drew_column_headers = False
+    table_top_y = float(imgui.get_cursor_pos_y())
+    table_flags = (
+        imgui.TABLE_SIZING_FIXED_FIT
+        | imgui.TABLE_ROW_BACKGROUND
+        | imgui.TABLE_BORDERS_INNER_VERTICAL
+    )
+    table = imgui.begin_table("##parameters", 4, table_flags)
+    if not table.opened:
+        return
 
-    for block_index, block in enumerate(group_layout):
-        if block_index > 0 and block.header:
-            imgui.spacing()
-        # 折りたたみ状態の永続化と ID 衝突回避のため、group 固有 ID で push_id する。
-        # - collapsing_header の state（open/close）
-        # - begin_table の内部 ID
-        # の両方をブロック単位で分離できる。
-        imgui.push_id(block.header_id)
-        try:
-            # collapsing_header は (expanded, visible) を返す。
-            # visible=None なので close ボタン無しで常に表示する。
-            group_open = True
-            if block.header:
-                first_row = None if not block.items else model_rows[block.items[0].row_index]
-                collapse_key = _collapse_key_for_group(block.group_id, first_row)
-                if collapse_key is not None:
-                    want_open = collapse_key not in collapsed_headers
-                    imgui.set_next_item_open(bool(want_open), imgui.ALWAYS)
-
-                color_count = 0
-                header_kind = _header_kind_for_group_id(block.group_id)
-                base_rgba255 = GROUP_HEADER_BASE_COLORS_RGBA[header_kind]
-                base = _rgba01_from_rgba255(base_rgba255)
-                normal, hovered, active = _derive_header_colors(base)
-                imgui.push_style_color(imgui.COLOR_HEADER, *normal)
-                imgui.push_style_color(imgui.COLOR_HEADER_HOVERED, *hovered)
-                imgui.push_style_color(imgui.COLOR_HEADER_ACTIVE, *active)
-                color_count = 3
-                try:
-                    group_open, _visible = imgui.collapsing_header(
-                        f"{humanize_identifier(block.header)}##group_header",
-                        None,
-                        flags=(imgui.TREE_NODE_DEFAULT_OPEN | imgui.TREE_NODE_ALLOW_ITEM_OVERLAP),
-                    )
-                    imgui.set_item_allow_overlap()
-                finally:
-                    if color_count:
-                        imgui.pop_style_color(color_count)
-
-                # ヘッダ行の右側に件数と Code ボタンを置く。
-                # collapsing_header は幅いっぱいを使うため、same_line(position=...) で明示配置する。
-                chain_state: EffectChainTableState | None = None
-                if (
-                    block.group_id[0] is GroupType.EFFECT_CHAIN
-                    and effect_chain_state_by_id is not None
-                ):
-                    chain_state = effect_chain_state_by_id.get(str(block.group_id[1]))
-                button_label = "Code"
-                text_w, _text_h = imgui.calc_text_size(button_label)
-                button_w = float(text_w) + 24.0
-                count_label = f"{len(block.items)} parameters"
-                count_w, _count_h = imgui.calc_text_size(count_label)
-                cluster_w = float(count_w) + 12.0 + float(button_w)
-                if chain_state is not None and chain_state.order_overridden:
-                    ui_order_w, _ui_order_h = imgui.calc_text_size("UI order")
-                    reset_w, _reset_h = imgui.calc_text_size("Reset")
-                    cluster_w += float(ui_order_w) + float(reset_w) + 36.0
-                pos_x = float(imgui.get_window_width()) - cluster_w - 16.0
-                if pos_x > 0.0:
-                    imgui.same_line(position=pos_x)
-                else:
-                    imgui.same_line()
-                if chain_state is not None and chain_state.order_overridden:
-                    imgui.text_colored(
-                        "UI order",
-                        *PARAMETER_GUI_PALETTE["success"],
-                    )
-                    imgui.same_line()
-                    if imgui.small_button("Reset##effect_order_reset"):
-                        effect_order_commands.append(
-                            EffectOrderCommand.reset(chain_id=chain_state.chain_id)
-                        )
-                    _set_item_tooltip(imgui, "Reset this chain to code order.")
-                    imgui.same_line()
-                imgui.text_disabled(count_label)
-                imgui.same_line()
-                if imgui.small_button(button_label):
-                    snippet_popup_text_new = snippet_for_block(
-                        block,
-                        model_rows,
-                        catalog=catalog,
-                        last_effective_by_key=last_effective_by_key,
-                        step_info_by_site=step_info_by_site,
-                        raw_label_by_site=raw_label_by_site,
-                    )
-                    want_open_snippet_popup = True
-
-                if collapse_key is not None:
-                    if group_open:
-                        collapsed_headers.discard(collapse_key)
-                    else:
-                        collapsed_headers.add(collapse_key)
-
-            if not group_open:
-                # 折りたたみ中は描画しないが、rows_after の長さを揃えるため “変更なし” として返す。
-                for item in block.items:
-                    updated_rows.append(model_rows[item.row_index])
+    try:
+        # Source / Range / MIDI は logical px 固定、Value だけが残り幅を受け取る。
+        _setup_parameter_table_columns(
+            imgui,
+            metric_scale=render_input.metric_scale,
+        )
+        first_line_y = table_top_y
+        if not frame.drew_column_headers:
+            # カラム名（label/control/min-max/cc）をヘッダ行として描画する（1回だけ）。
+            imgui.table_headers_row()
+            frame.drew_column_headers = True
+            # TableHeadersRow の行高は 1 行 text + 上下 cell padding。
+            first_line_y += float(imgui.get_text_line_height())
+            first_line_y += 2.0 * _table_cell_padding_y(imgui)
+
+        lines, effect_heading_by_step = _block_lines(block, model_rows)
+        line_offsets = _block_line_offsets(
+            imgui,
+            block,
+            lines,
+            model_rows,
+            line_height=line_height,
+        )
+        overscan = float(TABLE_VIRTUALIZATION_OVERSCAN_LINES) * line_height
+        start, stop = visible_line_range(
+            line_offsets,
+            view_min_y=view[0] - first_line_y - overscan,
+            view_max_y=view[1] - first_line_y + overscan,
+        )
+        pinned = _pinned_line_indices(block, lines, model_rows, frame.midi_learn_state)
+        rendered = sorted(pinned.union(range(start, stop)))
+
+        chain_state = (
+            None
+            if block.group_id[0] is not GroupType.EFFECT_CHAIN or effect_chain_state_by_id is None
+            else effect_chain_state_by_id.get(str(block.group_id[1]))
+        )
+        next_line = 0
+        for line_index in rendered:
+            _emit_table_spacer(imgui, line_offsets, next_line, line_index)
+            next_line = line_index + 1
+            row_height = float(line_offsets[line_index + 1] - line_offsets[line_index])
+            line = lines[line_index]
+            if not isinstance(line, int):
+                command = _render_effect_step_heading(
+                    imgui,
+                    effect_heading_by_step[line],
+                    step=line,
+                    state=chain_state,
+                    min_row_height=row_height,
+                )
+                if command is not None:
+                    frame.effect_order_commands.append(command)
                 continue
+            item = block.items[line]
+            row = model_rows[item.row_index]
+            row_key = ParameterKey(
+                op=row.op,
+                site_id=row.site_id,
+                arg=row.arg,
+            )
+            _row_changed, updated, frame.midi_learn_state = render_parameter_row_4cols(
+                row,
+                catalog=render_input.catalog,
+                visible_label=item.visible_label,
+                midi_learn_state=frame.midi_learn_state,
+                midi_last_cc_change=render_input.midi_last_cc_change,
+                last_source=(
+                    None if last_source_by_key is None else last_source_by_key.get(row_key)
+                ),
+                on_help_row=on_help_row,
+                min_row_height=row_height,
+            )
+            frame.updated_rows[row_start + line] = updated
+        _emit_table_spacer(imgui, line_offsets, next_line, len(lines))
+    finally:
+        imgui.end_table()
+
 
-            # --- open のときだけ、当該グループの行を 4 列テーブルとして描く ---
-            #
-            table_flags = (
-                imgui.TABLE_SIZING_FIXED_FIT
-                | imgui.TABLE_ROW_BACKGROUND
-                | imgui.TABLE_BORDERS_INNER_VERTICAL
+def _render_group_block(
+    imgui,
+    frame: _TableFrame,
+    render_input: TableRenderInput,
+    plan: _TablePlan,
+    block_index: int,
+    *,
+    view: tuple[float, float],
+    on_help_row: Callable[[ParameterRow, bool], None] | None,
+) -> None:
+    """一つの group block（header + table）を描画し、高さを計測して記録する。"""
+
+    block = plan.group_layout[block_index]
+    block_top_y = float(imgui.get_cursor_pos_y())
+    if block_index > 0 and block.header:
+        imgui.spacing()
+    # 折りたたみ状態の永続化と ID 衝突回避のため、group 固有 ID で push_id する。
+    # - collapsing_header の state（open/close）
+    # - begin_table の内部 ID
+    # の両方をブロック単位で分離できる。
+    imgui.push_id(block.header_id)
+    try:
+        group_open = True
+        if block.header:
+            group_open = _render_group_header(
+                imgui,
+                frame,
+                render_input,
+                block,
+                collapse_key=plan.collapse_keys[block_index],
             )
-            table = imgui.begin_table("##parameters", 4, table_flags)
-            if not table.opened:
-                for item in block.items:
-                    updated_rows.append(model_rows[item.row_index])
-                continue
+        # 折りたたみ中は行を描画しない。updated_rows は model row のまま残る。
+        if group_open:
+            _render_group_table(
+                imgui,
+                frame,
+                render_input,
+                block,
+                row_start=plan.row_starts[block_index],
+                view=view,
+                line_height=plan.line_height,
+                on_help_row=on_help_row,
+            )
+    finally:
+        imgui.pop_id()
+    height_key = plan.height_keys[block_index]
+    if height_key is not None:
+        _MEASURED_BLOCK_HEIGHTS[height_key] = float(imgui.get_cursor_pos_y()) - block_top_y
 
-            try:
-                # Source / Range / MIDI は logical px 固定、Value だけが残り幅を受け取る。
-                _setup_parameter_table_columns(
-                    imgui,
-                    metric_scale=metric_scale,
-                )
-                if not drew_column_headers:
-                    # カラム名（label/control/min-max/cc）をヘッダ行として描画する（1回だけ）。
-                    imgui.table_headers_row()
-                    drew_column_headers = True
-
-                effect_heading_by_step = (
-                    _effect_step_heading_by_rows(
-                        [model_rows[item.row_index] for item in block.items]
-                    )
-                    if block.group_id[0] is GroupType.EFFECT_CHAIN
-                    else {}
+
+def render_parameter_table(
+    render_input: TableRenderInput,
+    *,
+    on_help_row: Callable[[ParameterRow, bool], None] | None = None,
+) -> TableEdits:
+    """immutable snapshot を描画し、immutable edit 集合を返す。
+
+    可視域外の group と行は ImGui item を作らず、同じ高さの空白で代替する
+    （list clipper 方式）。描画しなかった行も model row のまま
+    ``TableEdits.rows`` へ返すため、group_layout の行との 1:1 対応は保たれる。
+    """
+
+    import imgui
+
+    global _SNIPPET_POPUP_TEXT, _SNIPPET_POPUP_FOCUS_NEXT
+
+    model_rows = render_input.model_rows
+    line_height = _table_line_height(imgui)
+    plan = _table_plan(render_input, line_height=line_height)
+    # 返り値として「更新後の row 群」を返す。描画しない行（折りたたみ/画面外）は
+    # model row のまま残し、store_bridge の strict zip と 1:1 で揃える。
+    frame = _TableFrame(
+        collapsed_headers=set(render_input.collapsed_headers),
+        midi_learn_state=render_input.midi_learn_state,
+        updated_rows=[model_rows[row_index] for row_index in plan.row_indices],
+    )
+    view = _table_view_bounds(imgui)
+    overscan = float(TABLE_VIRTUALIZATION_OVERSCAN_LINES) * line_height
+
+    if len(_MEASURED_BLOCK_HEIGHTS) > 2 * len(plan.height_keys) + 256:
+        _MEASURED_BLOCK_HEIGHTS.clear()
+    # MIDI learn 待ちの行を含む block は可視域外でも描画する。
+    forced_blocks: set[int] = set()
+    active_target = None if frame.midi_learn_state is None else frame.midi_learn_state.active_target
+    if active_target is not None:
+        forced_blocks = {
+            block_index
+            for block_index, block in enumerate(plan.group_layout)
+            if any(
+                _is_learn_target(model_rows[item.row_index], active_target) for item in block.items
+            )
+        }
+
+    pending_skip_height = 0.0
+    block_count = len(plan.group_layout)
+    block_index = 0
+    while block_index < block_count:
+        # 高さ計測済みの block が続く区間 [block_index, run_stop) を伸ばす。
+        # 同じ構造の block は計測結果を共有するため、初回 frame でも区間の先頭
+        # だけを描画すれば残りは高さが分かる。
+        run_heights: list[float] = []
+        run_stop = block_index
+        while run_stop < block_count and run_stop not in forced_blocks:
+            height_key = plan.height_keys[run_stop]
+            height = None if height_key is None else _MEASURED_BLOCK_HEIGHTS.get(height_key)
+            if height is None:
+                break
+            run_heights.append(height)
+            run_stop += 1
+        if run_stop > block_index:
+            # 区間内は累積高さの二分探索で可視 block だけを選ぶ。
+            run_offsets = list(accumulate(run_heights, initial=0.0))
+            run_top_y = float(imgui.get_cursor_pos_y()) + pending_skip_height
+            start, stop = visible_line_range(
+                run_offsets,
+                view_min_y=view[0] - overscan - run_top_y,
+                view_max_y=view[1] + overscan - run_top_y,
+            )
+            pending_skip_height += run_offsets[start]
+            # 省略した block が column header 行を持つはずだった場合も、描画済みとして扱う。
+            column_header_block = plan.column_header_block
+            if column_header_block is not None and block_index <= column_header_block < run_stop:
+                frame.drew_column_headers = frame.drew_column_headers or not (
+                    block_index + start <= column_header_block < block_index + stop
                 )
-                previous_effect_step: EffectStepKey | None = None
-                chain_state = (
-                    None
-                    if block.group_id[0] is not GroupType.EFFECT_CHAIN
-                    or effect_chain_state_by_id is None
-                    else effect_chain_state_by_id.get(str(block.group_id[1]))
+            for visible_index in range(block_index + start, block_index + stop):
+                _emit_vertical_skip(imgui, pending_skip_height)
+                pending_skip_height = 0.0
+                _render_group_block(
+                    imgui,
+                    frame,
+                    render_input,
+                    plan,
+                    visible_index,
+                    view=view,
+                    on_help_row=on_help_row,
                 )
-                for item in block.items:
-                    row = model_rows[item.row_index]
-                    item_step = (row.op, row.site_id)
-                    if effect_heading_by_step and item_step != previous_effect_step:
-                        command = _render_effect_step_heading(
-                            imgui,
-                            effect_heading_by_step[item_step],
-                            step=item_step,
-                            state=chain_state,
-                        )
-                        if command is not None:
-                            effect_order_commands.append(command)
-                        previous_effect_step = item_step
-                    row_key = ParameterKey(
-                        op=row.op,
-                        site_id=row.site_id,
-                        arg=row.arg,
-                    )
-                    _row_changed, updated, midi_learn_state = render_parameter_row_4cols(
-                        row,
-                        catalog=catalog,
-                        visible_label=item.visible_label,
-                        midi_learn_state=midi_learn_state,
-                        midi_last_cc_change=midi_last_cc_change,
-                        last_source=(
-                            None if last_source_by_key is None else last_source_by_key.get(row_key)
-                        ),
-                        on_help_row=on_help_row,
-                    )
-                    updated_rows.append(updated)
-            finally:
-                imgui.end_table()
-        finally:
-            imgui.pop_id()
+            pending_skip_height += run_offsets[-1] - run_offsets[stop]
+            block_index = run_stop
+            continue
+        _emit_vertical_skip(imgui, pending_skip_height)
+        pending_skip_height = 0.0
+        _render_group_block(
+            imgui,
+            frame,
+            render_input,
+            plan,
+            block_index,
+            view=view,
+            on_help_row=on_help_row,
+        )
+        block_index += 1
+    _emit_vertical_skip(imgui, pending_skip_height)
 
     # --- Code popup ---
     #
     # open_popup と begin_popup_modal は “同じ ID スタック” が必要なので、push_id の外で扱う。
-    if want_open_snippet_popup and snippet_popup_text_new is not None:
-        _SNIPPET_POPUP_TEXT = str(snippet_popup_text_new)
+    if frame.snippet_popup_text is not None:
+        _SNIPPET_POPUP_TEXT = str(frame.snippet_popup_text)
         _SNIPPET_POPUP_FOCUS_NEXT = True
         imgui.open_popup("Code##snippet_popup")
 
@@ -1776,13 +2184,18 @@ def render_parameter_table(
                     imgui.set_clipboard_text(str(_SNIPPET_POPUP_TEXT))
 
     return TableEdits(
-        rows=tuple(updated_rows),
-        collapsed_headers=frozenset(collapsed_headers),
-        midi_learn_state=midi_learn_state,
-        effect_order_commands=tuple(effect_order_commands),
+        rows=tuple(frame.updated_rows),
+        collapsed_headers=frozenset(frame.collapsed_headers),
+        midi_learn_state=frame.midi_learn_state,
+        effect_order_commands=tuple(frame.effect_order_commands),
     )
 
 
 # Code popup の一時状態（永続化しない）。
 _SNIPPET_POPUP_TEXT = ""
 _SNIPPET_POPUP_FOCUS_NEXT = False
+
+# 仮想化用に、直近に描画した group block の高さ（spacing/header/table 込み）を
+# 保持する。画面外 block を描かずに同じ高さの空白で置き換えるために使う。
+_MEASURED_BLOCK_HEIGHTS: dict[_BlockHeightKey, float] = {}
+_TABLE_PLAN: _TablePlan | None = None
@@ -359,10 +359,19 @@ def widget_string_input(row: ParameterRow) -> tuple[bool, str]:
         str,
         validate_parameter_value(row.ui_value, kind="str", choices=None),
     )
+    height = string_input_height(imgui, value)
+    return imgui.input_text_multiline("##value", value, -1, 0.0, float(height))
+
+
+def string_input_height(imgui, value: str) -> float:
+    """kind=str の複数行入力欄の高さを返す。
+
+    table の仮想化は描画前に行高を見積もるため、widget と同じ式を共有する。
+    """
+
     line_count = int(value.count("\n")) + 1
     visible_lines = max(3, min(8, line_count))
-    height = float(imgui.get_text_line_height()) * float(visible_lines) + 8.0
-    return imgui.input_text_multiline("##value", value, -1, 0.0, float(height))
+    return float(imgui.get_text_line_height()) * float(visible_lines) + 8.0
 
 
 def widget_font_picker(row: ParameterRow) -> tuple[bool, str]:
@@ -15,6 +15,7 @@ from typing import Protocol
 from grafix.core.export_format import ExportFormat
 from grafix.core.lifecycle import CleanupErrors
 from grafix.core.runtime_limits import RuntimeLimits
+from grafix.core.thread_budget import ThreadBudget
 from grafix.export.capture import CaptureService
 from grafix.export.image import png_output_size
 from grafix.interactive.diagnostics import (
@@ -31,6 +32,7 @@ from grafix.interactive.runtime.export_job_system import (
     ExportQueueStatus,
     FrameExportSnapshot,
 )
+from grafix.interactive.runtime.warm_pool import WarmWorkerPool
 
 DEFAULT_CAPTURE_SHUTDOWN_TIMEOUT_S = 30.0
 _SHUTDOWN_POLL_INTERVAL_S = 0.01
@@ -114,6 +116,8 @@ class CaptureQueue:
         shutdown_snapshot: Callable[[], FrameExportSnapshot],
         monitor: CaptureQueueMonitor | None = None,
         export_jobs: _ExportJobs | None = None,
+        warm_pool: WarmWorkerPool | None = None,
+        thread_budget: ThreadBudget | None = None,
         announce: Callable[[str], object] = print,
         poll_interval_s: float = _SHUTDOWN_POLL_INTERVAL_S,
     ) -> None:
@@ -145,6 +149,8 @@ class CaptureQueue:
             ExportJobSystem(
                 runtime_limits=runtime_limits,
                 capture_service=capture_service,
+                warm_pool=warm_pool,
+                thread_budget=thread_budget,
             )
             if export_jobs is None
             else export_jobs
@@ -21,6 +21,8 @@ backpressure、worker lifecycle、通知は `CaptureQueue` へ委譲する。
 - GPU 描画: `DrawRenderer`（ModernGL）
 - ファイル書き出し: `CaptureQueue` / 録画 subsystem へ frame を渡す
 - 別プロセス: `CaptureQueue` が PNG/G-code worker を所有する
+- 予備プロセス: `WarmWorkerPool` が export/mp-draw worker を起動時に事前 spawn する
+  （生存 worker 数の上限は `_warm_pool_process_limit()`）
 """
 
 from __future__ import annotations
@@ -45,6 +47,7 @@ from grafix.core.capture_provenance import (
 )
 from grafix.export.output_paths import output_path_for_draw
 from grafix.core.runtime_config import RuntimeConfig, bind_runtime_config
+from grafix.core.thread_budget import ThreadBudget
 from grafix.core.render_options import RenderOptions
 from grafix.export.capture import CaptureService
 from grafix.export.capture_provenance import CaptureProvenanceBuilder
@@ -56,6 +59,7 @@ from grafix.interactive.pyglet_window_lifecycle import (
     close_pyglet_window,
 )
 from grafix.core.scene import SceneItem
+from grafix.core.value_validation import exact_integer
 from grafix.core.runtime_limits import (
     DEFAULT_RUNTIME_LIMIT_PROFILES,
     RuntimeLimitProfiles,
@@ -77,6 +81,7 @@ from grafix.interactive.runtime.export_job_system import (
 )
 from grafix.interactive.runtime.recording_session import RecordingSession
 from grafix.interactive.runtime.scene_runner import SceneRunner
+from grafix.interactive.runtime.warm_pool import WarmPoolStats, WarmWorkerPool
 from grafix.core.parameters.style_resolver import StyleResolver
 from grafix.core.parameters.source import MidiFrameSnapshot, ParameterLoadMode
 from grafix.core.preview_quality import PreviewQuality
@@ -103,6 +108,21 @@ class _FrameProvenanceToken:
     effective_revision: int
 
 
+def _warm_pool_process_limit(worker_count: int, thread_budget: ThreadBudget) -> int:
+    """warm pool が数える生存 worker process の上限を返す。
+
+    使用中の export worker 1 つと mp-draw worker 世代に、export の予備 1 つを加える。
+    mp-draw の予備世代は worker の RSS を倍にするため、親・export と両世代の worker へ
+    1 thread ずつ配れる thread budget があるときだけ加える。したがって上限は
+    ``2 + worker_count``、余裕があれば ``2 + 2 * worker_count`` になる。
+    """
+
+    limit = 2 + worker_count
+    if worker_count > 0 and thread_budget.total_threads >= limit + worker_count:
+        limit += worker_count
+    return limit
+
+
 class DrawWindowSystem:
     """描画（メインウィンドウ）のサブシステム。
 
@@ -136,6 +156,7 @@ class DrawWindowSystem:
         fps: float = 60.0,
         n_worker: int = 0,
         evaluation_timeout: float | None = 5.0,
+        refine_after: float | None = None,
         run_id: str | None = None,
         runtime_limit_profiles: RuntimeLimitProfiles = DEFAULT_RUNTIME_LIMIT_PROFILES,
         source_reload: SourceReloadController | None = None,
@@ -168,6 +189,7 @@ class DrawWindowSystem:
         if not isfinite(fps):
             raise ValueError("fps は有限値である必要があります")
         frame_rate = fps
+        worker_count = exact_integer(n_worker, name="n_worker", minimum=0)
 
         # 描画設定/draw 関数/ParamStore は 1 フレームごとに参照するため保持しておく。
         self._options = options
@@ -206,6 +228,11 @@ class DrawWindowSystem:
         renderer = None
         capture_queue = None
         scene_runner = None
+        # preview の realize と export worker が同じ CPU thread 予算を分け合う。
+        thread_budget = ThreadBudget.from_config(self._effective_config)
+        self._warm_pool = WarmWorkerPool(
+            max_processes=_warm_pool_process_limit(worker_count, thread_budget)
+        )
         try:
             # 描画用の pyglet window と、その OpenGL context に紐づく renderer。
             window = create_draw_window(options, render_scale=render_scale)
@@ -292,20 +319,27 @@ class DrawWindowSystem:
                 materialize_snapshot=self._materialize_capture_snapshot,
                 shutdown_snapshot=self._shutdown_export_snapshot,
                 monitor=monitor,
+                warm_pool=self._warm_pool,
+                thread_budget=thread_budget,
             )
             self._capture_queue = capture_queue
             window.push_handlers(on_key_press=self._on_key_press)
             scene_runner = SceneRunner(
                 draw,
                 perf=self._perf,
-                n_worker=n_worker,
+                n_worker=worker_count,
                 evaluation_timeout=evaluation_timeout,
+                refine_after=refine_after,
                 runtime_limit_profiles=profiles,
                 effective_config=self._effective_config,
                 definitions=definitions,
                 diagnostic_center=(None if monitor is None else monitor.diagnostic_center),
+                warm_pool=self._warm_pool,
+                thread_budget=thread_budget,
             )
             self._scene_runner = scene_runner
+            if monitor is not None:
+                monitor.set_edit_predictor(scene_runner.predict_parameter_edit)
             if source_reload is not None and diagnostic_center is not None:
                 diagnostic_center.register_action(
                     "retry",
@@ -326,6 +360,7 @@ class DrawWindowSystem:
                         lambda: capture_queue.close(timeout_s=0.0),
                     )
                 )
+            cleanup_steps.append(("warm worker pool", self._warm_pool.close))
             if renderer is not None and window is not None:
 
                 def release_renderer() -> None:
@@ -416,6 +451,12 @@ class DrawWindowSystem:
 
         return self._recording_session.is_recording
 
+    @property
+    def warm_pool_stats(self) -> WarmPoolStats:
+        """事前 spawn した worker の hit/miss と process 数を返す。"""
+
+        return self._warm_pool.stats
+
     @property
     def capture_service(self) -> CaptureService:
         """Inspector callback と keyboard capture が共有する service を返す。"""
@@ -935,8 +976,6 @@ class DrawWindowSystem:
             quality: PreviewQuality = (
                 "final" if recording or self._capture_queue.has_unbound_intents else "draft"
             )
-            profiles = self._runtime_limit_profiles
-            self._renderer.apply_runtime_limits(profiles.for_quality(quality))
             realized_layers = self._evaluate_scene(
                 t,
                 cc_snapshot=cc_snapshot,
@@ -944,6 +983,14 @@ class DrawWindowSystem:
                 recording=recording,
                 quality=quality,
             )
+            # 静止中の draft が final へ差し替わった場合は、表示 geometry に合わせて
+            # GPU cache 上限も final を使う。
+            profiles = self._runtime_limit_profiles
+            self._renderer.apply_runtime_limits(
+                profiles.for_quality(
+                    "final" if self._scene_runner.last_output_refined else quality
+                )
+            )
             perf.record_event(
                 "scene_ready",
                 frame_id=self._scene_runner.last_realized_frame_id,
@@ -1149,6 +1196,7 @@ class DrawWindowSystem:
 
         # --- mp-draw worker / scene 実行器 ---
         errors.attempt(self._scene_runner.close, "close scene runner")
+        errors.attempt(self._warm_pool.close, "close warm worker pool")
         errors.attempt(self._perf.close, "close performance trace")
 
         # renderer が保持している GPU resource は、所有 context の有効化に成功した
@@ -2,6 +2,10 @@
 どこで: `src/grafix/interactive/runtime/export_job_system.py`。
 何を: PNG/G-code 書き出しを 1 本の長寿命 worker へ委譲する bounded job system。
 なぜ: 重い export 中も描画ループを止めず、連打時の process・snapshot 増殖を防ぐため。
+
+snapshot の geometry 配列は受理時に shared memory segment へ一度だけ書き、worker は
+それを read-only で map する。Queue に載るのは geometry を持たない job と segment
+handle だけなので、admission は segment を 1 回分として数える。
 """
 
 from __future__ import annotations
@@ -23,9 +27,15 @@ from typing import Any
 from grafix.core.capture_provenance import CaptureProvenance
 from grafix.core.export_format import ExportFormat
 from grafix.core.gcode_params import GCodeParams
+from grafix.core.instanced_geometry import InstancedGeometry
 from grafix.core.lifecycle import CleanupErrors
 from grafix.core.pipeline import RealizedLayer
 from grafix.core.runtime_limits import DEFAULT_FINAL_RUNTIME_LIMITS, RuntimeLimits
+from grafix.core.thread_budget import (
+    ThreadBudget,
+    ThreadReservation,
+    apply_process_thread_allowance,
+)
 from grafix.core.value_validation import (
     exact_integer,
     exact_string_choice,
@@ -40,11 +50,20 @@ from grafix.export.capture_staging import (
     cleanup_capture_staging,
     validate_capture_staged_outputs,
 )
+from grafix.interactive.runtime.shared_snapshot import (
+    SharedSnapshotHandle,
+    SharedSnapshotSegment,
+    attached_snapshot_layers,
+    publish_shared_layers,
+    shared_layers_byte_size,
+)
+from grafix.interactive.runtime.warm_pool import WarmPoolSlot, WarmWorkerPool
 
 _WORKER_JOIN_TIMEOUT_S = 0.5
 _PARENT_TIMEOUT_GRACE_S = 0.25
 _COMPLETED_RESULT_LIMIT = 64
-# 1つのin-flight snapshotは、親のimmutable geometry、multiprocessing Queueの
+# shared memory を確保できず snapshot を pickle で送る fallback では、1つの
+# in-flight snapshotは、親のimmutable geometry、multiprocessing Queueの
 # serialization buffer、workerでunpickleしたgeometryの最大3世代を同時に持ち得る。
 # pending jobにも同じ係数を保守的に課し、queue全体がprocessをまたいでbudget内に
 # 収まる契約にする（Python objectの小さなoverheadは推定対象外）。
@@ -160,6 +179,18 @@ class FrameExportSnapshot:
         ):
             raise TypeError("gcode_params は GCodeParams または None である必要があります")
 
+        # exporter は展開済み配列を読むため、instanced layer は snapshot 作成時に
+        # 1 度だけ展開し、保持 byte 数の見積もりと worker への受け渡しを安定させる。
+        object.__setattr__(
+            self,
+            "layers",
+            tuple(
+                replace(layer, realized=layer.realized.expand())
+                if type(layer.realized) is InstancedGeometry
+                else layer
+                for layer in self.layers
+            ),
+        )
         object.__setattr__(self, "t", capture_t)
         object.__setattr__(self, "canvas_size", canvas_size)
         object.__setattr__(self, "background_color_rgb01", background)
@@ -228,13 +259,19 @@ def estimate_snapshot_retained_bytes(snapshot: FrameExportSnapshot) -> int:
 
 
 def _estimate_snapshot_process_bytes(snapshot: FrameExportSnapshot) -> int:
-    """queue輸送中にprocessをまたいで同時保持し得るbyte数を保守的に返す。"""
+    """pickle 輸送中にprocessをまたいで同時保持し得るbyte数を保守的に返す。"""
 
     return int(estimate_snapshot_retained_bytes(snapshot)) * int(
         _SNAPSHOT_PROCESS_COPY_FACTOR
     )
 
 
+def _estimate_snapshot_shared_bytes(snapshot: FrameExportSnapshot) -> int:
+    """shared memory segment 1 つ分（alignment 込み）の byte 数を返す。"""
+
+    return shared_layers_byte_size(snapshot.layers)
+
+
 @dataclass(frozen=True, slots=True)
 class ExportQueueStatus:
     """capture admission の現在値。GUI と拒否診断で同じ契約を共有する。"""
@@ -398,7 +435,26 @@ class _WorkerReady:
     pid: int
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _SharedSnapshotJob:
+    """geometry を shared memory に置いた job。``job.snapshot.layers`` は空。"""
+
+    job: ExportJob
+    snapshot: SharedSnapshotHandle
+
+
+@dataclass(slots=True)
+class _RetainedSnapshot:
+    """受理済み job が参照する snapshot と、その export 専有資源。"""
+
+    snapshot: FrameExportSnapshot
+    refcount: int
+    byte_size: int
+    segment: SharedSnapshotSegment | None
+
+
 _WorkerMessage = _WorkerReady | ExportJobResult
+_WorkerTask = ExportJob | _SharedSnapshotJob
 ExportBackend = Callable[[ExportJob], Sequence[Path]]
 
 
@@ -483,50 +539,83 @@ def _execute_export_job(job: ExportJob) -> tuple[Path, ...]:
     )
 
 
+def _run_worker_job(job: ExportJob, backend: ExportBackend) -> ExportJobResult:
+    """1 job を実行し、例外も含めて終端結果へ変換する。"""
+
+    try:
+        paths = validate_capture_staged_outputs(
+            job.staging_dir,
+            backend(job),
+        )
+        return ExportJobResult(
+            job_id=job.job_id,
+            format=job.format,
+            status=ExportJobStatus.SUCCESS,
+            output_path=job.output_path,
+            split_gcode_layers=job.split_gcode_layers,
+            paths=paths,
+        )
+    except TimeoutError:
+        return ExportJobResult(
+            job_id=job.job_id,
+            format=job.format,
+            status=ExportJobStatus.TIMEOUT,
+            output_path=job.output_path,
+            split_gcode_layers=job.split_gcode_layers,
+            error=traceback.format_exc(),
+        )
+    except Exception:
+        return ExportJobResult(
+            job_id=job.job_id,
+            format=job.format,
+            status=ExportJobStatus.ERROR,
+            output_path=job.output_path,
+            split_gcode_layers=job.split_gcode_layers,
+            error=traceback.format_exc(),
+        )
+
+
+def _run_worker_task(task: _WorkerTask, backend: ExportBackend) -> ExportJobResult:
+    """shared memory job は map 中だけ geometry を復元して実行する。"""
+
+    if not isinstance(task, _SharedSnapshotJob):
+        return _run_worker_job(task, backend)
+    job = task.job
+    try:
+        with attached_snapshot_layers(task.snapshot) as layers:
+            # 復元した snapshot は backend 呼び出しの間だけ参照し、unmap 前に手放す。
+            return _run_worker_job(
+                replace(job, snapshot=replace(job.snapshot, layers=layers)),
+                backend,
+            )
+    except Exception:
+        return ExportJobResult(
+            job_id=job.job_id,
+            format=job.format,
+            status=ExportJobStatus.ERROR,
+            output_path=job.output_path,
+            split_gcode_layers=job.split_gcode_layers,
+            error="shared snapshot の map に失敗しました:\n" + traceback.format_exc(),
+        )
+
+
 def _export_worker_main(
-    task_q: mp_queues.Queue[ExportJob | None],
+    task_q: mp_queues.Queue[_WorkerTask | None],
     result_q: mp_queues.Queue[_WorkerMessage],
     backend: ExportBackend,
+    thread_allowance: int | None = None,
 ) -> None:
     """長寿命 worker: job を直列実行し、必ず終端結果へ変換する。"""
 
+    if thread_allowance is not None:
+        apply_process_thread_allowance(thread_allowance)
     result_q.put(_WorkerReady(pid=os.getpid()))
     try:
         while True:
             job = task_q.get()
             if job is None:
                 return
-            try:
-                paths = validate_capture_staged_outputs(
-                    job.staging_dir,
-                    backend(job),
-                )
-                result = ExportJobResult(
-                    job_id=job.job_id,
-                    format=job.format,
-                    status=ExportJobStatus.SUCCESS,
-                    output_path=job.output_path,
-                    split_gcode_layers=job.split_gcode_layers,
-                    paths=paths,
-                )
-            except TimeoutError:
-                result = ExportJobResult(
-                    job_id=job.job_id,
-                    format=job.format,
-                    status=ExportJobStatus.TIMEOUT,
-                    output_path=job.output_path,
-                    split_gcode_layers=job.split_gcode_layers,
-                    error=traceback.format_exc(),
-                )
-            except Exception:
-                result = ExportJobResult(
-                    job_id=job.job_id,
-                    format=job.format,
-                    status=ExportJobStatus.ERROR,
-                    output_path=job.output_path,
-                    split_gcode_layers=job.split_gcode_layers,
-                    error=traceback.format_exc(),
-                )
+            result = _run_worker_task(job, backend)
             try:
                 result_q.put(result)
             finally:
@@ -543,15 +632,46 @@ def _export_worker_main(
                 pass
 
 
+@dataclass(frozen=True, slots=True, eq=False)
+class _WarmExportWorker:
+    """warm pool で待機させる、起動済み export worker と専用 Queue。"""
+
+    process: mp_process.BaseProcess
+    task_q: mp_queues.Queue[_WorkerTask | None]
+    result_q: mp_queues.Queue[_WorkerMessage]
+    thread_allowance: int | None = None
+
+    @property
+    def processes(self) -> tuple[mp_process.BaseProcess, ...]:
+        return (self.process,)
+
+    def close(self) -> None:
+        """未使用のまま pool から外れた worker を sentinel で止め、Queue を閉じる。"""
+
+        errors = CleanupErrors()
+        try:
+            self.task_q.put_nowait(None)
+        except (queue.Full, OSError, ValueError):
+            pass
+        errors.attempt(lambda: ExportJobSystem._join_process(self.process))
+        errors.attempt(lambda: ExportJobSystem._close_queue(self.task_q, cancel=True))
+        errors.attempt(lambda: ExportJobSystem._close_queue(self.result_q, cancel=True))
+        errors.raise_if_any()
+
+
 class ExportJobSystem:
     """PNG/G-code を bounded な 1 worker で非同期実行する。
 
     Notes
     -----
     - worker は最初の submit で spawn し、その後は job 間で再利用する。
+    - `warm_pool` を渡すと、起動時に予備 worker を background で spawn しておき、
+      最初の submit と worker 交換後の submit ではそれを引き継ぐ。
     - worker へ渡す in-flight job は 1 件、親の pending FIFO は bounded。
     - 明示した保存操作は置換せず順番に実行し、満杯なら明示的に拒否する。
     - worker death/timeout/cancel 後は Queue ごと交換し、古い job の再実行を防ぐ。
+    - `thread_budget` を渡すと、spawn 時に worker の numba thread 数を確定し、
+      job の実行中だけその thread 数を親の budget から予約する。
     """
 
     def __init__(
@@ -561,9 +681,13 @@ class ExportJobSystem:
         default_timeout_s: float = 30.0,
         runtime_limits: RuntimeLimits = DEFAULT_FINAL_RUNTIME_LIMITS,
         capture_service: CaptureService | None = None,
+        warm_pool: WarmWorkerPool | None = None,
+        thread_budget: ThreadBudget | None = None,
     ) -> None:
         if not isinstance(runtime_limits, RuntimeLimits):
             raise TypeError("runtime_limits は RuntimeLimits である必要があります")
+        if thread_budget is not None and not isinstance(thread_budget, ThreadBudget):
+            raise TypeError("thread_budget は ThreadBudget である必要があります")
         timeout_s = finite_real(
             default_timeout_s,
             name="default_timeout_s",
@@ -571,6 +695,9 @@ class ExportJobSystem:
             minimum_inclusive=False,
         )
 
+        if warm_pool is not None and not isinstance(warm_pool, WarmWorkerPool):
+            raise TypeError("warm_pool は WarmWorkerPool である必要があります")
+
         self._ctx = mp.get_context("spawn")
         self._backend = backend
         if capture_service is not None and not isinstance(
@@ -583,7 +710,7 @@ class ExportJobSystem:
         self._default_timeout_s = timeout_s
         self._max_pending_jobs = int(runtime_limits.capture_queue_pending_jobs)
         self._max_retained_bytes = int(runtime_limits.capture_queue_bytes)
-        self._task_q: mp.Queue[ExportJob | None]
+        self._task_q: mp.Queue[_WorkerTask | None]
         self._result_q: mp.Queue[_WorkerMessage]
         self._proc: mp_process.BaseProcess | None = None
         self._worker_generation = 0
@@ -594,15 +721,30 @@ class ExportJobSystem:
         self._pending: deque[ExportJob] = deque()
         self._completed: deque[ExportJobResult] = deque(maxlen=_COMPLETED_RESULT_LIMIT)
         # 同じ immutable snapshot を pause 中に連続保存する場合、親 process の
-        # geometry 参照は共有する。job ごとの refcount だけを増やし、親参照 +
-        # Queue serialization + worker copy の保守的な推定bytesを一度だけ数える。
-        self._retained_snapshots: dict[
-            int, tuple[FrameExportSnapshot, int, int]
-        ] = {}
+        # geometry 参照と shared memory segment は共有する。job ごとの refcount だけを
+        # 増やし、segment の bytes を一度だけ数える。親の geometry は提示中 frame と
+        # 共有する immutable 配列で、worker は segment を map するため copy を持たない。
+        self._retained_snapshots: dict[int, _RetainedSnapshot] = {}
         self._retained_job_ids: set[int] = set()
         self._retained_bytes = 0
+        self._warm_spawn_count = 0
+        self._thread_budget = thread_budget
+        self._worker_thread_allowance: int | None = None
+        self._thread_reservation: ThreadReservation | None = None
 
         self._create_queues()
+        self._warm_pool = warm_pool
+        self._warm_slot: WarmPoolSlot | None = None
+        if warm_pool is not None:
+            try:
+                self._warm_slot = warm_pool.register(
+                    "export",
+                    self._spawn_warm_worker,
+                    process_count=1,
+                )
+            except BaseException:
+                self._close_queues(cancel_pending=True)
+                raise
 
     @property
     def in_flight_job(self) -> ExportJob | None:
@@ -668,7 +810,7 @@ class ExportJobSystem:
     def _incremental_snapshot_bytes(self, snapshot: FrameExportSnapshot) -> int:
         if id(snapshot) in self._retained_snapshots:
             return 0
-        return _estimate_snapshot_process_bytes(snapshot)
+        return _estimate_snapshot_shared_bytes(snapshot)
 
     def _admission_error(
         self, snapshot: FrameExportSnapshot
@@ -700,22 +842,67 @@ class ExportJobSystem:
         if error is not None:
             raise error
 
-    def _retain_job(self, job: ExportJob) -> None:
+    def _share_snapshot(
+        self,
+        snapshot: CaptureExportSnapshot,
+    ) -> _RetainedSnapshot | None:
+        """未保持の snapshot を segment へ publish する。既に保持中なら None。
+
+        geometry が空なら segment は作らない。shared memory を確保できない場合は
+        pickle 輸送へ fallback し、3 copy 分の bytes で admission を再検査する。
+        """
+
+        if id(snapshot) in self._retained_snapshots:
+            return None
+        segment: SharedSnapshotSegment | None = None
+        if _estimate_snapshot_shared_bytes(snapshot) > 0:
+            try:
+                segment = publish_shared_layers(snapshot.layers)
+            except OSError:
+                segment = None
+        if segment is not None:
+            byte_size = segment.byte_size
+        else:
+            byte_size = _estimate_snapshot_process_bytes(snapshot)
+            if self.retained_bytes + byte_size > self.max_retained_bytes:
+                raise ExportQueueFullError(
+                    reason="bytes",
+                    request_count=self.request_count,
+                    request_limit=self.request_limit,
+                    retained_bytes=self.retained_bytes,
+                    requested_bytes=byte_size,
+                    byte_limit=self.max_retained_bytes,
+                )
+        return _RetainedSnapshot(
+            snapshot=snapshot,
+            refcount=0,
+            byte_size=byte_size,
+            segment=segment,
+        )
+
+    def _retain_job(
+        self,
+        job: ExportJob,
+        shared: _RetainedSnapshot | None = None,
+    ) -> None:
         if job.job_id in self._retained_job_ids:
             return
         snapshot_id = id(job.snapshot)
         current = self._retained_snapshots.get(snapshot_id)
         if current is None:
-            byte_size = _estimate_snapshot_process_bytes(job.snapshot)
-            self._retained_snapshots[snapshot_id] = (job.snapshot, 1, byte_size)
-            self._retained_bytes += byte_size
-        else:
-            snapshot, refcount, byte_size = current
-            self._retained_snapshots[snapshot_id] = (
-                snapshot,
-                refcount + 1,
-                byte_size,
+            current = (
+                _RetainedSnapshot(
+                    snapshot=job.snapshot,
+                    refcount=0,
+                    byte_size=_estimate_snapshot_process_bytes(job.snapshot),
+                    segment=None,
+                )
+                if shared is None
+                else shared
             )
+            self._retained_snapshots[snapshot_id] = current
+            self._retained_bytes += current.byte_size
+        current.refcount += 1
         self._retained_job_ids.add(job.job_id)
 
     def _release_job(self, job: ExportJob) -> None:
@@ -723,16 +910,24 @@ class ExportJobSystem:
             return
         self._retained_job_ids.remove(job.job_id)
         snapshot_id = id(job.snapshot)
-        snapshot, refcount, byte_size = self._retained_snapshots[snapshot_id]
-        if refcount <= 1:
+        retained = self._retained_snapshots[snapshot_id]
+        retained.refcount -= 1
+        if retained.refcount <= 0:
             del self._retained_snapshots[snapshot_id]
-            self._retained_bytes -= byte_size
-        else:
-            self._retained_snapshots[snapshot_id] = (
-                snapshot,
-                refcount - 1,
-                byte_size,
-            )
+            self._retained_bytes -= retained.byte_size
+            if retained.segment is not None:
+                retained.segment.close()
+
+    def _worker_task(self, job: ExportJob) -> _WorkerTask:
+        """segment があれば geometry を外した job と handle を worker へ送る。"""
+
+        retained = self._retained_snapshots.get(id(job.snapshot))
+        if retained is None or retained.segment is None:
+            return job
+        return _SharedSnapshotJob(
+            job=replace(job, snapshot=replace(job.snapshot, layers=())),
+            snapshot=retained.segment.handle,
+        )
 
     @property
     def has_work(self) -> bool:
@@ -741,7 +936,7 @@ class ExportJobSystem:
         return self._in_flight is not None or bool(self._pending)
 
     def _create_queues(self) -> None:
-        task_q: mp.Queue[ExportJob | None] | None = None
+        task_q: mp.Queue[_WorkerTask | None] | None = None
         try:
             task_q = self._ctx.Queue(maxsize=1)
             result_q: mp.Queue[_WorkerMessage] = self._ctx.Queue(maxsize=2)
@@ -756,17 +951,98 @@ class ExportJobSystem:
         self._task_q = task_q
         self._result_q = result_q
 
+    def _spawn_warm_worker(self) -> _WarmExportWorker:
+        """pool の background thread から呼ばれ、専用 Queue ごと予備 worker を起動する。"""
+
+        self._warm_spawn_count += 1
+        task_q: mp.Queue[_WorkerTask | None] = self._ctx.Queue(maxsize=1)
+        result_q: mp.Queue[_WorkerMessage] | None = None
+        thread_allowance = self._spawn_thread_allowance()
+        try:
+            result_q = self._ctx.Queue(maxsize=2)
+            proc = self._ctx.Process(
+                target=_export_worker_main,
+                args=(task_q, result_q, self._backend, thread_allowance),
+                name=f"grafix-export-warm-{self._warm_spawn_count}",
+            )
+            proc.start()
+        except BaseException:
+            for worker_queue in (task_q, result_q):
+                if worker_queue is not None:
+                    try:
+                        self._close_queue(worker_queue, cancel=True)
+                    except BaseException:
+                        pass
+            raise
+        return _WarmExportWorker(
+            process=proc,
+            task_q=task_q,
+            result_q=result_q,
+            thread_allowance=thread_allowance,
+        )
+
+    def _adopt_warm_worker(self) -> bool:
+        """pool に起動済み worker があれば、現在の空 Queue と置き換えて採用する。"""
+
+        if self._warm_pool is None or self._warm_slot is None:
+            return False
+        warm = self._warm_pool.acquire(self._warm_slot)
+        if warm is None:
+            return False
+        assert isinstance(warm, _WarmExportWorker)
+        previous_task_q = self._task_q
+        previous_result_q = self._result_q
+        self._task_q = warm.task_q
+        self._result_q = warm.result_q
+        self._worker_generation += 1
+        self._proc = warm.process
+        self._worker_thread_allowance = warm.thread_allowance
+        self._ready_pid = None
+        # 置き換えた Queue は worker 未起動なので未処理 job を持たない。
+        errors = CleanupErrors()
+        errors.attempt(lambda: self._close_queue(previous_task_q, cancel=True))
+        errors.attempt(lambda: self._close_queue(previous_result_q, cancel=True))
+        errors.raise_if_any()
+        return True
+
     def _start_worker(self) -> None:
+        if self._adopt_warm_worker():
+            return
         self._worker_generation += 1
+        thread_allowance = self._spawn_thread_allowance()
         proc = self._ctx.Process(
             target=_export_worker_main,
-            args=(self._task_q, self._result_q, self._backend),
+            args=(self._task_q, self._result_q, self._backend, thread_allowance),
             name=f"grafix-export-{self._worker_generation}",
         )
         proc.start()
+        if self._warm_pool is not None:
+            self._warm_pool.track((proc,))
         self._proc = proc
+        self._worker_thread_allowance = thread_allowance
         self._ready_pid = None
 
+    def _spawn_thread_allowance(self) -> int | None:
+        """これから spawn する worker の numba thread 数。budget が無ければ無制限。"""
+
+        budget = self._thread_budget
+        return None if budget is None else budget.child_allowance(1)
+
+    def _set_in_flight(self, job: ExportJob | None) -> None:
+        """in-flight job を更新し、worker が job を実行する間だけ thread を予約する。"""
+
+        self._in_flight = job
+        reservation = getattr(self, "_thread_reservation", None)
+        if job is None:
+            self._thread_reservation = None
+            if reservation is not None:
+                reservation.release()
+            return
+        budget = getattr(self, "_thread_budget", None)
+        allowance = getattr(self, "_worker_thread_allowance", None)
+        if reservation is None and budget is not None and allowance is not None:
+            self._thread_reservation = budget.reserve(allowance)
+
     @staticmethod
     def _join_process(proc: mp_process.BaseProcess) -> None:
         errors = CleanupErrors()
@@ -858,7 +1134,7 @@ class ExportJobSystem:
         try:
             if self._proc is None:
                 self._start_worker()
-            self._task_q.put_nowait(dispatched)
+            self._task_q.put_nowait(self._worker_task(dispatched))
         except Exception:
             cleanup_capture_staging(dispatched.staging_dir)
             self._completed.append(
@@ -870,7 +1146,7 @@ class ExportJobSystem:
             )
             self._release_job(job)
             return
-        self._in_flight = dispatched
+        self._set_in_flight(dispatched)
 
     def _drain_worker_messages(self) -> None:
         while True:
@@ -890,7 +1166,7 @@ class ExportJobSystem:
                 capture_service=self._capture_service,
             )
             self._completed.append(message)
-            self._in_flight = None
+            self._set_in_flight(None)
             self._release_job(current)
 
     def _recover_dead_worker(self) -> None:
@@ -912,7 +1188,7 @@ class ExportJobSystem:
                     worker_exitcode=proc.exitcode,
                 )
             )
-            self._in_flight = None
+            self._set_in_flight(None)
             self._release_job(current)
         try:
             self._replace_worker()
@@ -939,7 +1215,7 @@ class ExportJobSystem:
                 error=f"export timeout: {current.timeout_s:g}s",
             )
         )
-        self._in_flight = None
+        self._set_in_flight(None)
         self._release_job(current)
         try:
             self._replace_worker()
@@ -990,14 +1266,16 @@ class ExportJobSystem:
         if error is not None:
             raise error
 
+        shared = self._share_snapshot(snapshot)
         output = Path(output_path)
         base_output = output if base_output_path is None else Path(base_output_path)
         next_job_id = self._next_job_id + 1
-        staging = CaptureStaging.create(
-            output,
-            purpose=f"export-{next_job_id}",
-        )
+        staging: CaptureStaging | None = None
         try:
+            staging = CaptureStaging.create(
+                output,
+                purpose=f"export-{next_job_id}",
+            )
             job = ExportJob(
                 job_id=next_job_id,
                 format=format,
@@ -1010,11 +1288,14 @@ class ExportJobSystem:
                 output_size=normalized_output_size,
             )
         except BaseException:
-            staging.close()
+            if staging is not None:
+                staging.close()
+            if shared is not None and shared.segment is not None:
+                shared.segment.close()
             raise
         self._next_job_id = next_job_id
 
-        self._retain_job(job)
+        self._retain_job(job, shared)
 
         if self._in_flight is None:
             self._dispatch(job)
@@ -1072,7 +1353,7 @@ class ExportJobSystem:
                     error="cancelled",
                 )
             )
-            self._in_flight = None
+            self._set_in_flight(None)
             self._release_job(current)
             cancelled = True
             try:
@@ -1090,6 +1371,9 @@ class ExportJobSystem:
         if self._closed:
             return
         self._closed = True
+        warm_pool = getattr(self, "_warm_pool", None)
+        if warm_pool is not None and self._warm_slot is not None:
+            warm_pool.unregister(self._warm_slot)
 
         current = self._in_flight
         jobs_to_cancel = (() if current is None else (current,)) + tuple(self._pending)
@@ -1104,7 +1388,7 @@ class ExportJobSystem:
                 )
                 self._release_job(job)
         had_in_flight = self._in_flight is not None
-        self._in_flight = None
+        self._set_in_flight(None)
         self._pending.clear()
 
         errors = CleanupErrors()
@@ -22,7 +22,11 @@ from grafix.interactive.diagnostics import (
     DiagnosticCenter,
     DiagnosticEvent,
 )
-from grafix.interactive.telemetry import MonitorSnapshot, PerfSnapshot
+from grafix.interactive.telemetry import (
+    MonitorSnapshot,
+    ParameterEditPredictor,
+    PerfSnapshot,
+)
 
 
 def _optional_string(value: object, *, name: str) -> str | None:
@@ -102,6 +106,7 @@ class RuntimeMonitor:
         self._autosave_error: str | None = None
         self._recovered_session = False
         self._profiler: PerfSnapshot | None = None
+        self._edit_predictor: ParameterEditPredictor | None = None
 
         self._process = psutil.Process(os.getpid())
 
@@ -316,6 +321,13 @@ class RuntimeMonitor:
             raise TypeError("snapshot は PerfSnapshot である必要があります")
         self._profiler = snapshot
 
+    def set_edit_predictor(self, predictor: ParameterEditPredictor | None) -> None:
+        """Help pane が選択 parameter の再計算見積もりに使う callable を設定する。"""
+
+        if predictor is not None and not callable(predictor):
+            raise TypeError("predictor は callable または None である必要があります")
+        self._edit_predictor = predictor
+
     def snapshot(self) -> MonitorSnapshot:
         """現在の監視値をスナップショットとして返す。"""
 
@@ -341,6 +353,7 @@ class RuntimeMonitor:
             autosave_error=self._autosave_error,
             recovered_session=self._recovered_session,
             profiler=self._profiler,
+            edit_predictor=self._edit_predictor,
         )
 
     def _cpu_times_s(self, proc: psutil.Process) -> float:
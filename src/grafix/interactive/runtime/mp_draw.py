@@ -10,6 +10,8 @@
    - snapshot 本体は revision 変更時だけ worker 別 control queue へ broadcast する。
    - worker の revision 適用を未確認なら task 自体にも snapshot を同梱し、ACK 待ちを
      draw 開始の barrier にしない。
+   - worker が適用済みの revision を基準に、変更された `ParameterKey` の entry だけを
+     差分として送る。基準を持たない worker は resync を返し、全体（keyframe）を受け取る。
 2. worker プロセスが task と同じ revision の snapshot を固定して `draw(t)` を実行する。
 3. worker が `DrawResult` を返し、メインは `poll_latest()` で最も新しい結果だけを採用する。
 4. メインは受け取った `layers` を描画パイプライン（例: `realize_scene()`）へ渡して表示/出力する。
@@ -23,6 +25,10 @@
 - worker は初期化後に ready message を返す。`SystemExit`、native crash など process 自体の
   異常終了は submit/poll 共通の health check が `MpDrawWorkerError` として通知する。
 - evaluation timeout は hung worker 世代を terminate/restart し、直近の成功結果を保持する。
+  `warm_pool` があれば予備の worker 世代を事前に spawn しておき、restart ではそれへ
+  `_SourceSwap` で現在の draw と世代を渡して引き継ぐ。
+- source reload では `swap_draw()` が control queue 経由で新しい draw と authoring recipe を
+  既存 worker へ渡し、process を起動し直さずに世代を進める。交換に失敗した場合だけ restart する。
 - parameter 観測（FrameParamRecord/FrameLabelRecord）は worker で収集して返し、
   メイン側で当該フレームの `FrameParamsBuffer` にマージして使う（例: SceneRunner）。
 """
@@ -33,6 +39,7 @@ import multiprocessing as mp
 import multiprocessing.process as mp_process
 import multiprocessing.queues as mp_queues
 import os
+import pickle
 import queue
 import time
 import traceback
@@ -55,11 +62,16 @@ from grafix.core.operation_diagnostics import (
 from grafix.core.parameters import (
     EffectOrderSnapshot,
     FrameEffectChainRecord,
+    FrameGeometrySiteRecord,
     FrameLabelRecord,
     FrameParamRecord,
 )
 from grafix.core.parameters.context import parameter_context_from_snapshot
-from grafix.core.parameters.snapshot_ops import ParamSnapshot, materialize_snapshot
+from grafix.core.parameters.snapshot_ops import (
+    ParamSnapshot,
+    materialize_snapshot,
+    snapshot_delta,
+)
 from grafix.core.parameters.source import MidiFrameSnapshot
 from grafix.core.operation_catalog import bind_operation_catalog
 from grafix.core.preview_quality import PreviewQuality, preview_quality_context
@@ -69,17 +81,31 @@ from grafix.core.runtime_config import (
     bind_runtime_config,
 )
 from grafix.core.scene import SceneItem, normalize_scene
+from grafix.core.thread_budget import apply_process_thread_allowance
 from grafix.core.value_validation import (
     exact_integer,
     exact_string,
     exact_string_choice,
     finite_real,
 )
+from grafix.interactive.runtime.source_reload import ReloadedDraw
+from grafix.interactive.runtime.warm_pool import WarmPoolSlot, WarmWorkerPool
 
 _WORKER_READY_TIMEOUT_S = 10.0
 _WORKER_JOIN_TIMEOUT_S = 1.0
 _WORKER_RESTART_JOIN_TIMEOUT_S = 0.05
 _MAX_SUBMITTED_TIMESTAMPS = 256
+# 親/worker が差分の基準として保持する直近 revision 数。
+_SNAPSHOT_HISTORY_REVISIONS = 8
+# 差分だけが続く revision 数の上限。超えたら keyframe（全体）を送り直す。
+_SNAPSHOT_KEYFRAME_INTERVAL = 240
+# snapshot update 1 件に加え、source swap 1 件を worker の drain を待たずに積める容量。
+_CONTROL_QUEUE_MAXSIZE = 2
+# 新世代 task を先に受け取った worker が、対応する source swap の到着を待つ上限。
+_SOURCE_SWAP_WAIT_S = 1.0
+# idle worker は 10 ms 間隔で control queue を drain する。これを超えて空かない
+# worker は draw 実行中とみなし、restart へ fallback する。
+_SOURCE_SWAP_PUT_TIMEOUT_S = 0.1
 
 
 def _non_empty_string(value: object, *, name: str) -> str:
@@ -174,6 +200,7 @@ class _DrawTask:
     -----
     - worker が revision を適用済みと確認できた通常時は snapshot を省略する。
     - 未確認時は snapshot を同梱し、control queue の ACK より先に評価を進める。
+    - `snapshot_base_revision` がある場合、`snapshot` はその revision からの差分。
     - `frame_id` はメインプロセス側で単調増加し、結果の新旧判定に使う。
     """
 
@@ -186,6 +213,7 @@ class _DrawTask:
     epoch: int
     generation: int
     quality: PreviewQuality
+    snapshot_base_revision: int | None = None
 
     def __post_init__(self) -> None:
         """task の scalar と同梱 snapshot を Queue 投入前に検証する。"""
@@ -230,16 +258,33 @@ class _DrawTask:
                 self.effect_order_snapshot,
                 name="effect_order_snapshot",
             )
+        if self.snapshot_base_revision is not None:
+            if self.snapshot is None:
+                raise ValueError("snapshot_base_revision には差分 snapshot が必要です")
+            object.__setattr__(
+                self,
+                "snapshot_base_revision",
+                _base_revision(
+                    self.snapshot_base_revision,
+                    revision=self.snapshot_revision,
+                    name="snapshot_base_revision",
+                ),
+            )
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class _SnapshotUpdate:
-    """worker ごとに broadcast する parameter snapshot 更新。"""
+    """worker ごとに broadcast する parameter snapshot 更新。
+
+    `base_revision` が None なら `snapshot` は全体（keyframe）、それ以外は
+    `base_revision` から変わった entry だけの差分。
+    """
 
     revision: int
     snapshot: ParamSnapshot
     effect_order_snapshot: EffectOrderSnapshot
     generation: int
+    base_revision: int | None = None
 
     def __post_init__(self) -> None:
         object.__setattr__(
@@ -257,6 +302,25 @@ class _SnapshotUpdate:
             self.effect_order_snapshot,
             name="effect_order_snapshot",
         )
+        if self.base_revision is not None:
+            object.__setattr__(
+                self,
+                "base_revision",
+                _base_revision(
+                    self.base_revision,
+                    revision=self.revision,
+                    name="base_revision",
+                ),
+            )
+
+
+def _base_revision(value: object, *, revision: int, name: str) -> int:
+    """差分の基準 revision が適用先 revision より古いことを検証する。"""
+
+    base = exact_integer(value, name=name, minimum=0)
+    if base >= revision:
+        raise ValueError(f"{name} は revision より小さい必要があります: {base} >= {revision}")
+    return base
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -305,7 +369,7 @@ class _SnapshotAck:
             exact_string_choice(
                 self.status,
                 name="status",
-                choices=("applied", "current", "stale"),
+                choices=("applied", "current", "stale", "resync"),
             ),
         )
         object.__setattr__(
@@ -368,7 +432,7 @@ class _TaskRejected:
             exact_string_choice(
                 self.reason,
                 name="reason",
-                choices=("unknown", "stale"),
+                choices=("unknown", "stale", "resync"),
             ),
         )
         object.__setattr__(
@@ -426,6 +490,8 @@ class DrawResult:
     - `epoch` は transport discontinuity の識別子。現在より古い結果は親側で破棄する。
     - `generation` は timeout/restart をまたぐ worker 世代。旧世代の結果は親側で破棄する。
     - `snapshot_revision` は worker が実際に評価へ使った parameter snapshot の revision。
+    - `geometry_sites` は site ごとに生成した Geometry node の記録で、親側の
+      parameter 依存グラフに使う。error result では空になる。
     """
 
     frame_id: int
@@ -441,6 +507,7 @@ class DrawResult:
     worker_pid: int | None = None
     diagnostics: tuple[OperationDiagnostic, ...] = ()
     worker_lag_ms: float | None = None
+    geometry_sites: tuple[FrameGeometrySiteRecord, ...] = ()
 
     def __post_init__(self) -> None:
         """worker result の scalar と container shape を受信前に固定する。"""
@@ -486,16 +553,27 @@ class DrawResult:
             name="effect_chains",
             item_type=FrameEffectChainRecord,
         )
+        _require_tuple_of(
+            self.geometry_sites,
+            name="geometry_sites",
+            item_type=FrameGeometrySiteRecord,
+        )
         if self.error is not None:
             object.__setattr__(
                 self,
                 "error",
                 exact_string(self.error, name="error"),
             )
-            if self.layers or self.records or self.labels or self.effect_chains:
+            if (
+                self.layers
+                or self.records
+                or self.labels
+                or self.effect_chains
+                or self.geometry_sites
+            ):
                 raise ValueError(
-                    "error result の layers、records、labels、effect_chains "
-                    "は空である必要があります"
+                    "error result の layers、records、labels、effect_chains、"
+                    "geometry_sites は空である必要があります"
                 )
         if self.worker_pid is not None:
             object.__setattr__(
@@ -545,22 +623,85 @@ class _WorkerReady:
         )
 
 
-_WorkerMessage = DrawResult | _WorkerReady | _SnapshotAck | _TaskRejected | _TaskStarted
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _SourceSwap:
+    """既存 worker の draw と authoring recipe を新世代へ交換する control message。
+
+    Notes
+    -----
+    `draw_payload` は親で一度だけ pickle した draw。unpickle の失敗を worker 側で
+    `_SourceSwapFailed` として返せるよう、queue 上では bytes のまま運ぶ。
+    """
+
+    draw_payload: bytes
+    authoring_recipe: AuthoringDefinitionsRecipe
+    generation: int
+
+    def __post_init__(self) -> None:
+        if type(self.draw_payload) is not bytes:
+            raise TypeError("draw_payload は bytes である必要があります")
+        if not isinstance(self.authoring_recipe, AuthoringDefinitionsRecipe):
+            raise TypeError("authoring_recipe は AuthoringDefinitionsRecipe である必要があります")
+        object.__setattr__(
+            self,
+            "generation",
+            exact_integer(self.generation, name="generation", minimum=1),
+        )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _SourceSwapFailed:
+    """worker が source swap を適用できなかったことを親へ通知する。"""
+
+    worker: str
+    pid: int
+    generation: int
+    error: str
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "worker",
+            _non_empty_string(self.worker, name="worker"),
+        )
+        object.__setattr__(
+            self,
+            "pid",
+            exact_integer(self.pid, name="pid", minimum=1),
+        )
+        object.__setattr__(
+            self,
+            "generation",
+            exact_integer(self.generation, name="generation", minimum=0),
+        )
+        object.__setattr__(
+            self,
+            "error",
+            _non_empty_string(self.error, name="error"),
+        )
+
+
+_WorkerMessage = (
+    DrawResult | _WorkerReady | _SnapshotAck | _TaskRejected | _TaskStarted | _SourceSwapFailed
+)
+_ControlMessage = _SnapshotUpdate | _SourceSwap
 
 
 def _draw_worker_main(
     task_q: mp_queues.Queue[_DrawTask | None],
-    control_q: mp_queues.Queue[_SnapshotUpdate],
+    control_q: mp_queues.Queue[_ControlMessage],
     result_q: mp_queues.Queue[_WorkerMessage],
     draw: Callable[[float], SceneItem],
     generation: int,
     effective_config: RuntimeConfig,
     authoring_recipe: AuthoringDefinitionsRecipe,
+    thread_allowance: int | None = None,
 ) -> None:
     """worker プロセスのエントリポイント。
 
     `task_q` から `_DrawTask` を受け取り、`draw(t)` を実行して `DrawResult` を `result_q`
-    に返す。`task_q` に `None` が入ってきたら終了する。
+    に返す。`task_q` に `None` が入ってきたら終了する。`control_q` の `_SourceSwap` で
+    process を維持したまま draw と世代を交換する。
 
     Notes
     -----
@@ -576,6 +717,8 @@ def _draw_worker_main(
         name="generation",
         minimum=0,
     )
+    if thread_allowance is not None:
+        apply_process_thread_allowance(thread_allowance)
     # 親が capture した exact source recipe から immutable snapshot を再構築する。
     # config directory は worker 側で再走査しない。
     # ReloadedDraw は呼び出し中に、source bytes から再構築したより狭い candidate
@@ -583,45 +726,130 @@ def _draw_worker_main(
     worker_definitions = load_authoring_definitions_recipe(authoring_recipe)
     result_q.put(_WorkerReady(worker=worker, pid=pid, generation=worker_generation))
 
-    snapshot: ParamSnapshot | None = None
-    effect_order_snapshot: EffectOrderSnapshot | None = None
+    # 適用済み revision の snapshot を直近分だけ保持し、差分の基準に使う。
+    snapshots: OrderedDict[int, tuple[ParamSnapshot, EffectOrderSnapshot]] = OrderedDict()
     snapshot_revision: int | None = None
 
-    def apply_snapshot(update: _SnapshotUpdate) -> None:
-        """新しい snapshot だけを適用し、処理結果を必ず ack する。"""
+    def resolve_snapshot(
+        update: _SnapshotUpdate,
+    ) -> tuple[ParamSnapshot, EffectOrderSnapshot] | None:
+        """keyframe または保持中の基準 + 差分から、update の全体 snapshot を作る。"""
 
-        nonlocal snapshot, effect_order_snapshot, snapshot_revision
+        if update.base_revision is None:
+            return update.snapshot, update.effect_order_snapshot
+        base = snapshots.get(update.base_revision)
+        if base is None:
+            return None
+        resolved = dict(base[0])
+        resolved.update(update.snapshot)
+        return resolved, update.effect_order_snapshot
+
+    def apply_snapshot(
+        update: _SnapshotUpdate,
+    ) -> tuple[ParamSnapshot, EffectOrderSnapshot] | None:
+        """新しい snapshot だけを適用し、処理結果を必ず ack する。
+
+        update の revision に対応する全体 snapshot を返す。差分の基準を
+        持たず復元できない場合は None を返し、親へ resync を要求する。
+        """
+
+        nonlocal snapshot_revision
         if update.generation != worker_generation:
-            return
+            return None
         requested = update.revision
+        resolved: tuple[ParamSnapshot, EffectOrderSnapshot] | None
         if snapshot_revision is None or requested > snapshot_revision:
-            snapshot = update.snapshot
-            effect_order_snapshot = update.effect_order_snapshot
-            snapshot_revision = requested
-            status = "applied"
+            resolved = resolve_snapshot(update)
+            if resolved is None:
+                status = "resync"
+            else:
+                snapshots[requested] = resolved
+                while len(snapshots) > _SNAPSHOT_HISTORY_REVISIONS:
+                    snapshots.popitem(last=False)
+                snapshot_revision = requested
+                status = "applied"
         elif requested == snapshot_revision:
+            resolved = snapshots[requested]
             status = "current"
         else:
+            resolved = snapshots.get(requested) or resolve_snapshot(update)
             status = "stale"
-        assert snapshot_revision is not None
         result_q.put(
             _SnapshotAck(
                 worker=worker,
                 pid=pid,
                 requested_revision=requested,
-                applied_revision=snapshot_revision,
+                applied_revision=(requested if snapshot_revision is None else snapshot_revision),
                 status=status,
                 generation=worker_generation,
             )
         )
+        return resolved
+
+    def apply_source_swap(swap: _SourceSwap) -> None:
+        """新しい draw/recipe を読み込めた場合だけ、世代と snapshot 状態を切り替える。"""
+
+        nonlocal draw, worker_definitions, worker_generation, snapshot_revision
+        if swap.generation <= worker_generation:
+            return
+        try:
+            next_draw = pickle.loads(swap.draw_payload)
+            next_definitions = load_authoring_definitions_recipe(swap.authoring_recipe)
+        except Exception:
+            result_q.put(
+                _SourceSwapFailed(
+                    worker=worker,
+                    pid=pid,
+                    generation=swap.generation,
+                    error=traceback.format_exc(),
+                )
+            )
+            return
+        previous_draw = draw
+        draw = next_draw
+        worker_definitions = next_definitions
+        worker_generation = swap.generation
+        # 旧世代の draw はもう呼ばれないため、worker が import した module tree を外す。
+        if (
+            isinstance(previous_draw, ReloadedDraw)
+            and not (
+                isinstance(next_draw, ReloadedDraw)
+                and next_draw.worker_module_name == previous_draw.worker_module_name
+            )
+        ):
+            previous_draw.release_worker_modules()
+        # 親も新世代の snapshot bookkeeping を空から始めるため、差分の基準を共有しない。
+        snapshots.clear()
+        snapshot_revision = None
+        result_q.put(_WorkerReady(worker=worker, pid=pid, generation=worker_generation))
+
+    def apply_control(message: _ControlMessage) -> None:
+        if isinstance(message, _SourceSwap):
+            apply_source_swap(message)
+        else:
+            apply_snapshot(message)
 
     def drain_snapshot_updates() -> None:
         while True:
             try:
-                update = control_q.get_nowait()
+                message = control_q.get_nowait()
             except queue.Empty:
                 return
-            apply_snapshot(update)
+            apply_control(message)
+
+    def await_source_swap(generation: int) -> None:
+        """task queue と control queue の到着順は保証されないため、新世代の swap を待つ。"""
+
+        deadline = time.monotonic() + _SOURCE_SWAP_WAIT_S
+        while worker_generation < generation:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0.0:
+                return
+            try:
+                message = control_q.get(timeout=min(0.01, remaining))
+            except queue.Empty:
+                continue
+            apply_control(message)
 
     try:
         while True:
@@ -632,33 +860,35 @@ def _draw_worker_main(
                 continue
             if task is None:
                 return
+            if task.generation > worker_generation:
+                await_source_swap(task.generation)
             if task.generation != worker_generation:
                 continue
             drain_snapshot_updates()
             requested_revision = task.snapshot_revision
-            evaluation_snapshot = task.snapshot
-            evaluation_effect_order_snapshot = task.effect_order_snapshot
+            evaluation = None
             if task.snapshot is not None:
                 # task と snapshot を同じ work item に束ねることで、slider drag 中に
                 # control ACK が 1 revision 遅れても、この task の評価を開始できる。
                 assert task.effect_order_snapshot is not None
-                apply_snapshot(
+                evaluation = apply_snapshot(
                     _SnapshotUpdate(
                         revision=requested_revision,
                         snapshot=task.snapshot,
                         effect_order_snapshot=task.effect_order_snapshot,
                         generation=worker_generation,
+                        base_revision=task.snapshot_base_revision,
                     )
                 )
             elif snapshot_revision == requested_revision:
-                evaluation_snapshot = snapshot
-                evaluation_effect_order_snapshot = effect_order_snapshot
-            if evaluation_snapshot is None:
-                reason = (
-                    "unknown"
-                    if snapshot_revision is None or requested_revision > snapshot_revision
-                    else "stale"
-                )
+                evaluation = snapshots[requested_revision]
+            if evaluation is None:
+                if task.snapshot is not None:
+                    reason = "resync"
+                elif snapshot_revision is None or requested_revision > snapshot_revision:
+                    reason = "unknown"
+                else:
+                    reason = "stale"
                 result_q.put(
                     _TaskRejected(
                         frame_id=task.frame_id,
@@ -671,6 +901,7 @@ def _draw_worker_main(
                     )
                 )
                 continue
+            evaluation_snapshot, evaluation_effect_order_snapshot = evaluation
             result_q.put(
                 _TaskStarted(
                     frame_id=task.frame_id,
@@ -707,6 +938,7 @@ def _draw_worker_main(
                         records=tuple(frame_params.records),
                         labels=tuple(frame_params.labels),
                         effect_chains=tuple(frame_params.effect_chains),
+                        geometry_sites=tuple(frame_params.geometry_sites),
                         error=None,
                         t=task.t,
                         epoch=task.epoch,
@@ -747,6 +979,40 @@ def _draw_worker_main(
                 pass
 
 
+@dataclass(frozen=True, slots=True, eq=False)
+class _WarmDrawGeneration:
+    """warm pool で待機させる、世代 0 で起動済みの worker 群と専用 Queue。"""
+
+    procs: tuple[mp_process.BaseProcess, ...]
+    task_q: mp_queues.Queue[_DrawTask | None]
+    control_qs: tuple[mp_queues.Queue[_ControlMessage], ...]
+    result_q: mp_queues.Queue[_WorkerMessage]
+
+    @property
+    def processes(self) -> tuple[mp_process.BaseProcess, ...]:
+        return self.procs
+
+    def close(self) -> None:
+        """未使用のまま pool から外れた worker 群を停止し、Queue を閉じる。"""
+
+        for _ in self.procs:
+            try:
+                self.task_q.put_nowait(None)
+            except (queue.Full, OSError, ValueError):
+                break
+        procs = list(self.procs)
+        MpDraw._join_processes(procs, timeout=_WORKER_JOIN_TIMEOUT_S)
+        for proc in procs:
+            if proc.is_alive():
+                try:
+                    proc.kill()
+                except (AttributeError, OSError, ValueError):
+                    pass
+        MpDraw._join_processes(procs, timeout=_WORKER_JOIN_TIMEOUT_S)
+        for worker_queue in (self.task_q, *self.control_qs, self.result_q):
+            MpDraw._close_queue(cast(mp_queues.Queue[Any], worker_queue), cancel_pending=True)
+
+
 class MpDraw:
     """`draw(t)` を worker プロセスで実行し、最新結果を保持する。
 
@@ -767,6 +1033,8 @@ class MpDraw:
         event_callback: _PerfEventCallback | None = None,
         effective_config: RuntimeConfig,
         definitions: AuthoringDefinitionsSnapshot | None = None,
+        warm_pool: WarmWorkerPool | None = None,
+        thread_allowance: int | None = None,
     ) -> None:
         """worker 群を起動して mp-draw を開始する。
 
@@ -782,6 +1050,10 @@ class MpDraw:
         definitions : AuthoringDefinitionsSnapshot | None
             親 session が確定済みなら同じ snapshot を渡す。その recipe だけを
             spawn へ送り、callable catalog 自体は pickle しない。
+        warm_pool : WarmWorkerPool | None
+            渡した場合、restart 用の予備 worker 世代を起動後に background で用意する。
+        thread_allowance : int | None
+            各 worker の numba thread 数の上限。`None` の場合は制限しない。
 
         Raises
         ------
@@ -794,6 +1066,11 @@ class MpDraw:
         """
 
         worker_count = exact_integer(n_worker, name="n_worker", minimum=1)
+        self._thread_allowance = (
+            None
+            if thread_allowance is None
+            else exact_integer(thread_allowance, name="thread_allowance", minimum=1)
+        )
         if evaluation_timeout is None:
             timeout = None
         else:
@@ -814,6 +1091,8 @@ class MpDraw:
         if not isinstance(effective_config, RuntimeConfig):
             raise TypeError("effective_config は RuntimeConfig である必要があります")
         self._effective_config = effective_config
+        if warm_pool is not None and not isinstance(warm_pool, WarmWorkerPool):
+            raise TypeError("warm_pool は WarmWorkerPool である必要があります")
         selected_definitions = authoring_definitions_for_draw(
             draw,
             config=effective_config,
@@ -825,9 +1104,15 @@ class MpDraw:
                 "mp-draw には親 generation の exact authoring recipe が必要です"
             )
         self._authoring_recipe = authoring_recipe
+        self._warm_pool = warm_pool
+        self._warm_slot: WarmPoolSlot | None = None
+        self._warm_spawn_count = 0
+        self._warm_restart_count = 0
         self._generation = 0
         self._restart_count = 0
         self._last_restart_reason: str | None = None
+        self._source_swap_count = 0
+        self._source_swap_fallback_count = 0
         self._retired_procs: list[mp_process.BaseProcess] = []
         self._closed = False
 
@@ -846,6 +1131,10 @@ class MpDraw:
         self._snapshot_broadcast_count = 0
         self._snapshot_ack_count = 0
         self._snapshot_payload_copy_count = 0
+        self._snapshot_keyframe_count = 0
+        self._snapshot_delta_count = 0
+        self._snapshot_delta_entry_count = 0
+        self._snapshot_resync_count = 0
         self._last_snapshot_ack: _SnapshotAck | None = None
         self._task_enqueue_count = 0
         self._task_drop_count = 0
@@ -862,7 +1151,7 @@ class MpDraw:
         # Queue 本体は作成に成功した順に属性へ束縛し、partial failure 時にも
         # 取得済み endpoint だけを確実に閉じられるようにする。
         self._procs: list[mp_process.BaseProcess] = []
-        self._control_qs: list[mp.Queue[_SnapshotUpdate]] = []
+        self._control_qs: list[mp.Queue[_ControlMessage]] = []
         self._ready_worker_pids: set[int] = set()
         self._worker_snapshot_revisions: dict[int, int] = {}
         self._control_index_by_pid: dict[int, int] = {}
@@ -874,6 +1163,14 @@ class MpDraw:
         self._snapshot_payload_revision: int | None = None
         self._snapshot_payload: ParamSnapshot | None = None
         self._effect_order_snapshot_payload: EffectOrderSnapshot | None = None
+        # 差分の基準にする直近 revision の source snapshot と、worker ごとに ack で
+        # 確認できた適用済み revision。
+        self._snapshot_history: OrderedDict[int, tuple[ParamSnapshot, EffectOrderSnapshot]] = (
+            OrderedDict()
+        )
+        self._worker_applied_revisions: dict[int, tuple[int, ...]] = {}
+        self._snapshot_keyframe_revision: int | None = None
+        self._last_task: _DrawTask | None = None
 
         try:
             self._create_generation_resources()
@@ -892,6 +1189,17 @@ class MpDraw:
         except BaseException:
             self._close_after_start_failure()
             raise
+        if warm_pool is not None:
+            # 初回世代の ready 後に予備を起動し、起動時の CPU 競合を避ける。
+            try:
+                self._warm_slot = warm_pool.register(
+                    "mp-draw",
+                    self._spawn_warm_generation,
+                    process_count=worker_count,
+                )
+            except BaseException:
+                self._close_after_start_failure()
+                raise
 
     def _create_generation_resources(self) -> None:
         """現在世代専用の Queue と bookkeeping を作る。"""
@@ -900,22 +1208,31 @@ class MpDraw:
         # 書き込んだ message を新世代が誤って採用する経路そのものを断つ。
         self._procs = []
         self._control_qs = []
+        self._control_index_by_pid = {}
+        self._active_tasks_by_pid = {}
+        self._reset_generation_state()
+
+        self._task_q = self._ctx.Queue(maxsize=self._n_worker)
+        for _ in range(self._n_worker):
+            self._control_qs.append(self._ctx.Queue(maxsize=_CONTROL_QUEUE_MAXSIZE))
+        self._result_q: mp.Queue[_WorkerMessage] = self._ctx.Queue()
+
+    def _reset_generation_state(self) -> None:
+        """process と Queue 以外の、世代に紐づく snapshot/task bookkeeping を空にする。"""
+
         self._ready_worker_pids = set()
         self._worker_snapshot_revisions = {}
-        self._control_index_by_pid = {}
         self._pending_snapshot_updates = {}
         self._queued_snapshot_revisions = {}
-        self._active_tasks_by_pid = {}
         self._pending_task = None
         self._snapshot_broadcast_revision = None
         self._snapshot_payload_revision = None
         self._snapshot_payload = None
         self._effect_order_snapshot_payload = None
-
-        self._task_q = self._ctx.Queue(maxsize=self._n_worker)
-        for _ in range(self._n_worker):
-            self._control_qs.append(self._ctx.Queue(maxsize=1))
-        self._result_q: mp.Queue[_WorkerMessage] = self._ctx.Queue()
+        self._snapshot_history = OrderedDict()
+        self._worker_applied_revisions = {}
+        self._snapshot_keyframe_revision = None
+        self._last_task = None
 
     def _start_generation(self, *, wait_ready: bool) -> None:
         """現在世代の worker を起動する。restart 時は ready を待たない。"""
@@ -932,6 +1249,7 @@ class MpDraw:
                     generation,
                     self._effective_config,
                     self._authoring_recipe,
+                    self._thread_allowance,
                 ),
                 name=f"grafix-mp-draw-g{generation}-{i}",
             )
@@ -941,9 +1259,94 @@ class MpDraw:
             proc.start()
             if proc.pid is not None:
                 self._control_index_by_pid[proc.pid] = i
+        if self._warm_pool is not None:
+            # 予備世代の補充が、この世代と合わせて pool の上限を超えないようにする。
+            self._warm_pool.track(self._procs)
         if wait_ready:
             self._await_workers_ready()
 
+    def _spawn_warm_generation(self) -> _WarmDrawGeneration:
+        """pool の background thread から呼ばれ、予備の worker 世代を起動する。
+
+        予備は世代 0 で起動し、採用時の `_SourceSwap` で現在の draw と世代を受け取る。
+        """
+
+        self._warm_spawn_count += 1
+        spare = self._warm_spawn_count
+        task_q: mp.Queue[_DrawTask | None] = self._ctx.Queue(maxsize=self._n_worker)
+        control_qs: list[mp.Queue[_ControlMessage]] = []
+        result_q: mp.Queue[_WorkerMessage] | None = None
+        procs: list[mp_process.BaseProcess] = []
+        try:
+            for _ in range(self._n_worker):
+                control_qs.append(self._ctx.Queue(maxsize=_CONTROL_QUEUE_MAXSIZE))
+            result_q = self._ctx.Queue()
+            for i, control_q in enumerate(control_qs):
+                proc = self._ctx.Process(
+                    target=_draw_worker_main,
+                    args=(
+                        task_q,
+                        control_q,
+                        result_q,
+                        self._draw,
+                        0,
+                        self._effective_config,
+                        self._authoring_recipe,
+                        self._thread_allowance,
+                    ),
+                    name=f"grafix-mp-draw-warm{spare}-{i}",
+                )
+                procs.append(proc)
+                proc.start()
+        except BaseException:
+            for proc in procs:
+                try:
+                    if proc.is_alive():
+                        proc.kill()
+                except (AttributeError, OSError, ValueError):
+                    pass
+            self._join_processes(procs, timeout=_WORKER_JOIN_TIMEOUT_S)
+            for worker_queue in (task_q, *control_qs, result_q):
+                if worker_queue is not None:
+                    self._close_queue(worker_queue, cancel_pending=True)
+            raise
+        return _WarmDrawGeneration(
+            procs=tuple(procs),
+            task_q=task_q,
+            control_qs=tuple(control_qs),
+            result_q=result_q,
+        )
+
+    def _adopt_warm_generation(self) -> bool:
+        """予備の worker 世代があれば現在世代として採用し、draw を送る。"""
+
+        if self._warm_pool is None or self._warm_slot is None:
+            return False
+        warm = self._warm_pool.acquire(self._warm_slot)
+        if warm is None:
+            return False
+        assert isinstance(warm, _WarmDrawGeneration)
+        self._procs = list(warm.procs)
+        self._task_q = warm.task_q
+        self._control_qs = list(warm.control_qs)
+        self._result_q = warm.result_q
+        self._control_index_by_pid = {
+            proc.pid: i for i, proc in enumerate(self._procs) if proc.pid is not None
+        }
+        self._active_tasks_by_pid = {}
+        self._reset_generation_state()
+        self._warm_restart_count += 1
+        swap = _SourceSwap(
+            draw_payload=pickle.dumps(self._draw, protocol=pickle.HIGHEST_PROTOCOL),
+            authoring_recipe=self._authoring_recipe,
+            generation=self._generation,
+        )
+        # 予備の control queue は空なので、swap は必ず入る。起動時の世代 0 ready は
+        # 旧世代 message として drain 時に捨てられる。
+        for control_q in self._control_qs:
+            control_q.put_nowait(swap)
+        return True
+
     def _close_after_start_failure(self) -> None:
         """起動失敗の根本例外を保ったまま、取得済み resource を全て解放する。"""
 
@@ -1008,6 +1411,7 @@ class MpDraw:
         直近の成功結果は preview fallback として保持する。一方、旧世代の未完了
         task/result/snapshot 状態は引き継がない。新 worker の ready 待ちは後続の
         `submit()` / `poll_latest()` に委ね、restart 自体を有界時間に保つ。
+        warm pool に予備世代があれば spawn せずにそれを採用する。
         """
 
         if self._closed:
@@ -1025,8 +1429,9 @@ class MpDraw:
         self._submitted_revision_by_frame.clear()
 
         try:
-            self._create_generation_resources()
-            self._start_generation(wait_ready=False)
+            if not self._adopt_warm_generation():
+                self._create_generation_resources()
+                self._start_generation(wait_ready=False)
         except Exception as exc:
             self._close_after_start_failure()
             raise RuntimeError("mp-draw の worker 再起動に失敗しました") from exc
@@ -1035,6 +1440,88 @@ class MpDraw:
             raise
         return self._generation
 
+    def swap_draw(
+        self,
+        draw: Callable[[float], SceneItem],
+        *,
+        definitions: AuthoringDefinitionsSnapshot | None = None,
+    ) -> int:
+        """worker process を維持したまま draw と authoring recipe を新世代へ交換する。
+
+        spawn・import・numba JIT 済みの process をそのまま使うため、source reload
+        ごとの再起動を避けられる。新世代の ready は後続の `submit()` /
+        `poll_latest()` で反映する。worker 側で交換に失敗した場合や、control queue に
+        空きが無い場合は `restart()` へ fallback する。
+
+        Returns
+        -------
+        int
+            新しい世代番号。
+
+        Raises
+        ------
+        TypeError
+            `draw` が callable でない場合。
+        ValueError
+            exact authoring recipe を得られない場合。
+        pickle.PicklingError
+            `draw` を worker へ送れない場合。いずれの失敗でも現在世代は変更しない。
+        """
+
+        self._check_health()
+        if not callable(draw):
+            raise TypeError("draw は callable である必要があります")
+        selected_definitions = authoring_definitions_for_draw(
+            draw,
+            config=self._effective_config,
+            definitions=definitions,
+        )
+        authoring_recipe = selected_definitions.recipe
+        if authoring_recipe is None:
+            raise ValueError(
+                "mp-draw には親 generation の exact authoring recipe が必要です"
+            )
+        draw_payload = pickle.dumps(draw, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # 旧世代で既に届いた結果を accounting してから境界を進める。
+        self._drain_result_queue()
+        self._draw = draw
+        self._authoring_recipe = authoring_recipe
+        self._generation += 1
+        self._source_swap_count += 1
+        self._latest_received = None
+        self._submitted_at_by_frame.clear()
+        self._submitted_revision_by_frame.clear()
+        self._reset_generation_state()
+        # 未開始の旧世代 task は worker 側でも破棄されるが、新世代 task の枠を空ける。
+        while True:
+            try:
+                queued = self._task_q.get_nowait()
+            except queue.Empty:
+                break
+            if queued is None:
+                try:
+                    self._task_q.put_nowait(None)
+                except queue.Full:
+                    pass
+                break
+            self._task_drop_count += 1
+
+        swap = _SourceSwap(
+            draw_payload=draw_payload,
+            authoring_recipe=authoring_recipe,
+            generation=self._generation,
+        )
+        for control_q in self._control_qs:
+            try:
+                control_q.put(swap, timeout=_SOURCE_SWAP_PUT_TIMEOUT_S)
+            except queue.Full:
+                # 長い draw の実行中で control queue を読めない worker がいる。
+                # process ごと新世代へ切り替える。
+                self._source_swap_fallback_count += 1
+                return self.restart("source swap: control queue full")
+        return self._generation
+
     def _restart_if_timed_out(self) -> bool:
         """実行中 task が deadline を超えた場合に世代を再起動する。"""
 
@@ -1138,7 +1625,19 @@ class MpDraw:
             current_generation = self._generation
             message_generation = message.generation
             if message_generation != current_generation:
-                if isinstance(message, DrawResult):
+                if isinstance(message, _TaskStarted):
+                    # source swap 前に開始した旧世代 task も同じ process を占有するため、
+                    # 完了まで timeout 監視を続ける。
+                    self._active_tasks_by_pid[message.pid] = (
+                        message.frame_id,
+                        time.monotonic(),
+                    )
+                elif isinstance(message, DrawResult):
+                    worker_pid = message.worker_pid
+                    if worker_pid is not None:
+                        active = self._active_tasks_by_pid.get(worker_pid)
+                        if active is not None and active[0] == message.frame_id:
+                            self._active_tasks_by_pid.pop(worker_pid, None)
                     self._stale_generation_result_count += 1
                     self._last_stale_generation_result = (
                         message.frame_id,
@@ -1147,21 +1646,34 @@ class MpDraw:
                     )
                 continue
 
+            if isinstance(message, _SourceSwapFailed):
+                self._source_swap_fallback_count += 1
+                error_summary = message.error.strip().splitlines()[-1]
+                self.restart(f"source swap failed: pid={message.pid}: {error_summary}")
+                return
             if isinstance(message, _WorkerReady):
                 self._ready_worker_pids.add(message.pid)
             elif isinstance(message, _SnapshotAck):
                 pid = message.pid
                 applied = message.applied_revision
+                self._snapshot_ack_count += 1
+                self._last_snapshot_ack = message
+                control_index = self._control_index_by_pid.get(pid)
+                if message.status == "resync":
+                    self._resync_worker_snapshot(pid, requested=message.requested_revision)
+                    continue
                 previous = self._worker_snapshot_revisions.get(pid)
                 if previous is None or applied > previous:
                     self._worker_snapshot_revisions[pid] = applied
-                self._snapshot_ack_count += 1
-                self._last_snapshot_ack = message
+                applied_revisions = self._worker_applied_revisions.get(pid, ())
+                if applied not in applied_revisions:
+                    self._worker_applied_revisions[pid] = (*applied_revisions, applied)[
+                        -_SNAPSHOT_HISTORY_REVISIONS:
+                    ]
                 self._record_event(
                     "mp_snapshot_applied",
                     revision=message.applied_revision,
                 )
-                control_index = self._control_index_by_pid.get(pid)
                 if control_index is not None:
                     queued_revision = self._queued_snapshot_revisions.get(control_index)
                     if queued_revision == message.requested_revision:
@@ -1172,6 +1684,8 @@ class MpDraw:
             elif isinstance(message, _TaskRejected):
                 self._rejected_task_count += 1
                 self._last_rejection = message
+                if message.reason == "resync":
+                    self._resubmit_latest_task_as_keyframe(message.frame_id)
             elif isinstance(message, _TaskStarted):
                 self._active_tasks_by_pid[message.pid] = (
                     message.frame_id,
@@ -1250,27 +1764,104 @@ class MpDraw:
         )
         return payload, order_payload
 
-    def _broadcast_snapshot(
+    def _remember_snapshot(
         self,
         *,
         revision: int,
         snapshot: ParamSnapshot,
         effect_order_snapshot: EffectOrderSnapshot,
     ) -> None:
-        """snapshot 本体を各 worker へ 1 回ずつ配信する。"""
+        """差分の基準にできるよう、直近 revision の source snapshot を保持する。"""
+
+        history = self._snapshot_history
+        if revision in history:
+            return
+        history[revision] = (snapshot, effect_order_snapshot)
+        while len(history) > _SNAPSHOT_HISTORY_REVISIONS:
+            history.popitem(last=False)
+
+    def _common_snapshot_base(self, pids: tuple[int, ...]) -> int | None:
+        """指定 worker 全員が適用済みで、親も保持している最新 revision を返す。"""
+
+        if not pids:
+            return None
+        common = set(self._snapshot_history)
+        for pid in pids:
+            common.intersection_update(self._worker_applied_revisions.get(pid, ()))
+        return max(common, default=None)
+
+    def _snapshot_payload_for(
+        self,
+        *,
+        revision: int,
+        base_revision: int | None,
+    ) -> tuple[ParamSnapshot, EffectOrderSnapshot, int | None]:
+        """revision の queue 用 payload を返す。可能なら base_revision からの差分にする。
+
+        Returns
+        -------
+        tuple
+            `(snapshot, effect_order_snapshot, base_revision)`。base_revision が None
+            なら snapshot は全体（keyframe）。
+        """
 
-        # `snapshot` は submit() が revision ごとに一度だけ plain dict 化した payload。
-        # task 同梱分と control 配布分で全 ParamStore を二重コピーしない。
-        update = _SnapshotUpdate(
+        snapshot, effect_order_snapshot = self._snapshot_history[revision]
+        keyframe_revision = self._snapshot_keyframe_revision
+        if (
+            base_revision is not None
+            and base_revision < revision
+            and keyframe_revision is not None
+            and revision - keyframe_revision < _SNAPSHOT_KEYFRAME_INTERVAL
+        ):
+            base = self._snapshot_history.get(base_revision)
+            delta = None if base is None else snapshot_delta(base[0], snapshot)
+            # 差分が全体の半分を超えるなら keyframe の方が安い。
+            if delta is not None and 2 * len(delta) <= len(snapshot):
+                self._snapshot_delta_count += 1
+                self._snapshot_delta_entry_count += len(delta)
+                return delta, dict(effect_order_snapshot), base_revision
+        payload, order_payload = self._plain_snapshot_for_revision(
+            revision=revision,
+            snapshot=snapshot,
+            effect_order_snapshot=effect_order_snapshot,
+        )
+        if keyframe_revision is None or revision > keyframe_revision:
+            self._snapshot_keyframe_revision = revision
+        self._snapshot_keyframe_count += 1
+        return payload, order_payload, None
+
+    def _snapshot_update(
+        self,
+        *,
+        revision: int,
+        pid: int | None,
+    ) -> _SnapshotUpdate:
+        """worker 1 つ向けの control update を、その worker の適用済み revision 基準で作る。"""
+
+        base_revision = None if pid is None else self._common_snapshot_base((pid,))
+        snapshot, effect_order_snapshot, base = self._snapshot_payload_for(
+            revision=revision,
+            base_revision=base_revision,
+        )
+        return _SnapshotUpdate(
             revision=revision,
             snapshot=snapshot,
             effect_order_snapshot=effect_order_snapshot,
             generation=self._generation,
+            base_revision=base,
         )
+
+    def _broadcast_snapshot(self, *, revision: int) -> None:
+        """snapshot を各 worker へ 1 回ずつ配信する。"""
+
         # worker ごとに「queue 内 1 件 + 親側 latest 1 件」だけを保持する。
         # 既に古い update が queue にある場合は、それが ack された後に latest を送る。
+        pid_by_index = {index: pid for pid, index in self._control_index_by_pid.items()}
         for index in range(len(self._control_qs)):
-            self._pending_snapshot_updates[index] = update
+            self._pending_snapshot_updates[index] = self._snapshot_update(
+                revision=revision,
+                pid=pid_by_index.get(index),
+            )
         self._flush_snapshot_updates()
         self._snapshot_broadcast_revision = revision
         self._snapshot_broadcast_count += 1
@@ -1279,6 +1870,50 @@ class MpDraw:
             revision=revision,
         )
 
+    def _resync_worker_snapshot(self, pid: int, *, requested: int) -> None:
+        """差分の基準を失った worker へ、最新 revision を keyframe で送り直す。"""
+
+        self._snapshot_resync_count += 1
+        # 親が把握していた適用済み revision は worker 側で失われている。
+        self._worker_applied_revisions.pop(pid, None)
+        control_index = self._control_index_by_pid.get(pid)
+        if control_index is None:
+            return
+        if self._queued_snapshot_revisions.get(control_index) == requested:
+            self._queued_snapshot_revisions.pop(control_index, None)
+        if not self._snapshot_history:
+            return
+        latest = next(reversed(self._snapshot_history))
+        self._pending_snapshot_updates[control_index] = self._snapshot_update(
+            revision=latest,
+            pid=None,
+        )
+        self._flush_snapshot_updates()
+
+    def _resubmit_latest_task_as_keyframe(self, frame_id: int) -> None:
+        """差分を復元できず拒否された最新 task を、keyframe 同梱で投入し直す。"""
+
+        task = self._last_task
+        if (
+            task is None
+            or task.frame_id != frame_id
+            or self._pending_task is not None
+            or task.snapshot_revision not in self._snapshot_history
+        ):
+            return
+        snapshot, effect_order_snapshot, _base = self._snapshot_payload_for(
+            revision=task.snapshot_revision,
+            base_revision=None,
+        )
+        retry = replace(
+            task,
+            snapshot=snapshot,
+            effect_order_snapshot=effect_order_snapshot,
+            snapshot_base_revision=None,
+        )
+        self._last_task = retry
+        self._pending_task = retry
+
     def _record_event(
         self,
         name: str,
@@ -1463,28 +2098,34 @@ class MpDraw:
             needs_control_broadcast = (
                 self._n_worker > 1 and self._snapshot_broadcast_revision != revision
             )
+            self._remember_snapshot(
+                revision=revision,
+                snapshot=snapshot,
+                effect_order_snapshot=effect_order_snapshot,
+            )
+            # どの worker が task を取るか分からないため、task 同梱分は全 worker が
+            # 適用済みの revision を差分の基準にする。
             payload = (
                 None
-                if worker_snapshot_confirmed and not needs_control_broadcast
-                else self._plain_snapshot_for_revision(
+                if worker_snapshot_confirmed
+                else self._snapshot_payload_for(
                     revision=revision,
-                    snapshot=snapshot,
-                    effect_order_snapshot=effect_order_snapshot,
+                    base_revision=self._common_snapshot_base(tuple(self._ready_worker_pids)),
                 )
             )
-            parameter_payload = None if payload is None else payload[0]
-            order_payload = None if payload is None else payload[1]
             task = _DrawTask(
                 frame_id=self._next_frame_id,
                 t=render_t,
                 snapshot_revision=revision,
                 cc_snapshot=cc_snapshot,
-                snapshot=(None if worker_snapshot_confirmed else parameter_payload),
-                effect_order_snapshot=(None if worker_snapshot_confirmed else order_payload),
+                snapshot=(None if payload is None else payload[0]),
+                effect_order_snapshot=(None if payload is None else payload[1]),
                 quality=preview_quality,
                 epoch=requested_epoch,
                 generation=self._generation,
+                snapshot_base_revision=(None if payload is None else payload[2]),
             )
+            self._last_task = task
             submitted_at = self._submitted_at_by_frame
             submitted_at[task.frame_id] = time.monotonic()
             while len(submitted_at) > _MAX_SUBMITTED_TIMESTAMPS:
@@ -1500,12 +2141,7 @@ class MpDraw:
                     revision=revision,
                 )
             if needs_control_broadcast:
-                assert payload is not None
-                self._broadcast_snapshot(
-                    revision=revision,
-                    snapshot=payload[0],
-                    effect_order_snapshot=payload[1],
-                )
+                self._broadcast_snapshot(revision=revision)
             elif self._n_worker == 1:
                 # 1 worker では task-carried snapshot の apply ACK だけで全 worker が
                 # current になる。control queue へ同じ payload を重複送信しない。
@@ -1586,6 +2222,30 @@ class MpDraw:
 
         return self._snapshot_payload_copy_count
 
+    @property
+    def snapshot_keyframe_count(self) -> int:
+        """全体 snapshot を task/control update へ載せた回数を返す。"""
+
+        return self._snapshot_keyframe_count
+
+    @property
+    def snapshot_delta_count(self) -> int:
+        """差分 snapshot を task/control update へ載せた回数を返す。"""
+
+        return self._snapshot_delta_count
+
+    @property
+    def snapshot_delta_entry_count(self) -> int:
+        """差分 snapshot で送った entry 数の合計を返す。"""
+
+        return self._snapshot_delta_entry_count
+
+    @property
+    def snapshot_resync_count(self) -> int:
+        """差分の基準を失った worker から resync を要求された回数を返す。"""
+
+        return self._snapshot_resync_count
+
     @property
     def worker_snapshot_revisions(self) -> dict[int, int]:
         """worker pid ごとの適用済み snapshot revision を返す。"""
@@ -1637,6 +2297,24 @@ class MpDraw:
 
         return self._generation
 
+    @property
+    def source_swap_count(self) -> int:
+        """`swap_draw()` で worker process を維持したまま世代を進めた回数を返す。"""
+
+        return self._source_swap_count
+
+    @property
+    def source_swap_fallback_count(self) -> int:
+        """source swap から restart へ fallback した回数を返す。"""
+
+        return self._source_swap_fallback_count
+
+    @property
+    def warm_restart_count(self) -> int:
+        """warm pool の予備世代を引き継いだ restart の回数。"""
+
+        return self._warm_restart_count
+
     @property
     def restart_count(self) -> int:
         """worker 世代を再起動した回数を返す。"""
@@ -1783,6 +2461,8 @@ class MpDraw:
         # health check より先に正常終了状態へ遷移し、sentinel による exitcode=0 を
         # 「予期せぬ worker death」と誤認しないようにする。
         self._closed = True
+        if self._warm_pool is not None and self._warm_slot is not None:
+            self._warm_pool.unregister(self._warm_slot)
 
         procs = list(self._procs)
         retired_procs = list(self._retired_procs)
@@ -21,6 +21,7 @@ from grafix.interactive.telemetry import (
     PerfTiming,
 )
 
+from grafix.core.thread_budget import ThreadBudgetSnapshot
 from grafix.core.value_validation import (
     exact_bool,
     exact_integer,
@@ -332,6 +333,7 @@ class PerfCollector:
         self._preview_revision_lag_sum = 0
         self._preview_revision_lag_max = 0
         self._preview_revision_lag_samples = 0
+        self._thread_budget: ThreadBudgetSnapshot | None = None
         self._snapshot = PerfSnapshot()
 
     @classmethod
@@ -664,6 +666,15 @@ class PerfCollector:
         self._worker_lag_max_ms = max(self._worker_lag_max_ms, value)
         self._worker_lag_samples += 1
 
+    def record_thread_budget(self, snapshot: ThreadBudgetSnapshot) -> None:
+        """CPU thread budget の最新の配分状況を記録する。"""
+
+        if type(snapshot) is not ThreadBudgetSnapshot:
+            raise TypeError("snapshot は ThreadBudgetSnapshot である必要があります")
+        if not self.enabled:
+            return
+        self._thread_budget = snapshot
+
     def record_preview_result(
         self,
         *,
@@ -785,6 +796,7 @@ class PerfCollector:
         writer = self._trace_writer
         lag_samples = self._worker_lag_samples
         revision_lag_samples = self._preview_revision_lag_samples
+        threads = self._thread_budget
         self._snapshot = PerfSnapshot(
             frame_index=self._frame_index,
             frame_count=self._window_frames,
@@ -863,6 +875,14 @@ class PerfCollector:
                 if input_max_ns is None
                 else input_max_ns / 1_000_000.0
             ),
+            cpu_threads=0 if threads is None else threads.total_threads,
+            cpu_thread_demand=0 if threads is None else threads.demand_threads,
+            cpu_thread_peak_demand=(
+                0 if threads is None else threads.peak_demand_threads
+            ),
+            cpu_oversubscribed_evaluations=(
+                0 if threads is None else threads.oversubscribed_evaluations
+            ),
         )
 
     def _duration_distributions(
@@ -931,6 +951,12 @@ class PerfCollector:
                     f"{snapshot.preview_fresh_result_ratio * 100.0:.0f}%"
                     f" stale-max={snapshot.preview_max_consecutive_stale_frames}"
                 )
+            if snapshot.cpu_oversubscribed_evaluations:
+                parts.append(
+                    "threads="
+                    f"{snapshot.cpu_thread_peak_demand}/{snapshot.cpu_threads}"
+                    f" oversubscribed={snapshot.cpu_oversubscribed_evaluations}"
+                )
             print("[grafix-perf]", " ".join(parts))
 
         writer = self._trace_writer
@@ -0,0 +1,205 @@
+"""
+どこで: `src/grafix/interactive/runtime/refinement.py`。
+何を: draft preview が一定時間静止したら final quality の scene を background thread で
+評価し、完成後に preview へ差し替える `ProgressiveRefiner` を提供する。
+なぜ: growth / reaction_diffusion などは draft で反復数を抑えるため、final の見た目を
+確認するには export が必要だった。編集が止まった時だけ裏で仕上げ、次の編集で破棄する。
+
+設計上のポイント
+----------------
+- 静止判定は presented scene の root Geometry id 列で行う。Geometry は content address
+  なので、parameter 編集・時刻変化・draw の差し替えはすべて id 列の変化として現れる。
+- final 評価は draft と同じ Geometry DAG を final session で realize するだけで、
+  draw(t) を再実行しない。style（色・線幅）は毎 frame の draft 出力から引き継ぐ。
+- 評価中に id 列が変わったら job の `CancellationToken` を取り消す。growth などの
+  長い kernel は反復 chunk の境界で、realize は node の開始前に確認して打ち切る。
+  取り消し前に完成した node は content address で有効なので cache へ残す。
+- final 評価の失敗（resource limit 等）は draft 表示を保ったまま、その scene では
+  再試行しない。
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+
+from grafix.core.cancellation import (
+    CancellationToken,
+    EvaluationCancelled,
+    cancellation_context,
+)
+from grafix.core.geometry import Geometry, GeometryId
+from grafix.core.pipeline import RealizedLayer
+from grafix.core.realize import GeometryCacheKey, RealizeSession
+from grafix.core.realized_geometry import RealizedGeometry
+from grafix.core.resource_budget import ensure_resource_usage
+from grafix.core.value_validation import finite_real
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class _RefinedScene:
+    """final session で realize 済みの layer 列。"""
+
+    realized: tuple[RealizedGeometry, ...]
+    cache_keys: tuple[GeometryCacheKey, ...]
+
+
+class ProgressiveRefiner:
+    """静止した draft scene を final quality へ段階的に置き換える。"""
+
+    def __init__(
+        self,
+        *,
+        session: RealizeSession,
+        idle_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if type(session) is not RealizeSession:
+            raise TypeError("session は exact RealizeSession である必要があります")
+        self._session = session
+        self._idle_s = finite_real(idle_s, name="idle_s", minimum=0.0)
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="grafix-refine",
+        )
+        self._signature: tuple[GeometryId, ...] | None = None
+        self._idle_since = 0.0
+        self._cancel: CancellationToken | None = None
+        self._job: Future[_RefinedScene] | None = None
+        self._refined: _RefinedScene | None = None
+        self._failed = False
+        self._last_output_refined = False
+        self._closed = False
+
+    @property
+    def last_output_refined(self) -> bool:
+        """直近の `observe()` が final quality の geometry を返したか。"""
+
+        return self._last_output_refined
+
+    def observe(self, layers: Sequence[RealizedLayer]) -> list[RealizedLayer]:
+        """表示予定の draft layers を受け取り、準備済みなら final へ差し替えて返す。"""
+
+        self._last_output_refined = False
+        output = list(layers)
+        if self._closed or not output:
+            self.cancel()
+            return output
+
+        signature = tuple(item.layer.geometry.id for item in output)
+        if signature != self._signature:
+            self.cancel()
+            self._signature = signature
+            self._idle_since = self._clock()
+            return output
+
+        self._collect_finished_job()
+        refined = self._refined
+        if refined is not None:
+            self._last_output_refined = True
+            return [
+                replace(item, realized=realized, cache_key=cache_key)
+                for item, realized, cache_key in zip(
+                    output,
+                    refined.realized,
+                    refined.cache_keys,
+                    strict=True,
+                )
+            ]
+        if (
+            self._job is None
+            and not self._failed
+            and self._clock() - self._idle_since >= self._idle_s
+        ):
+            cancel = CancellationToken()
+            self._cancel = cancel
+            self._job = self._executor.submit(
+                self._refine,
+                tuple(item.layer.geometry for item in output),
+                cancel,
+            )
+        return output
+
+    def cancel(self) -> None:
+        """実行中 job を取り消し、保持中の final 結果を破棄する。"""
+
+        cancel = self._cancel
+        if cancel is not None:
+            cancel.cancel()
+        self._cancel = None
+        self._job = None
+        self._refined = None
+        self._failed = False
+        self._signature = None
+
+    def close(self) -> None:
+        """job を取り消して thread を止める。実行中 operation の完了は待たない。"""
+
+        if self._closed:
+            return
+        self._closed = True
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _collect_finished_job(self) -> None:
+        job = self._job
+        if job is None or not job.done():
+            return
+        self._job = None
+        self._cancel = None
+        try:
+            self._refined = job.result()
+        except EvaluationCancelled:
+            return
+        except Exception:
+            # final 評価が失敗しても draft 表示は正しいため、同じ scene では再試行しない。
+            _logger.debug("final quality refinement failed", exc_info=True)
+            self._failed = True
+
+    def _refine(
+        self,
+        geometries: tuple[Geometry, ...],
+        cancel: CancellationToken,
+    ) -> _RefinedScene:
+        session = self._session
+        realized: list[RealizedGeometry] = []
+        cache_keys: list[GeometryCacheKey] = []
+        total_vertices = 0
+        total_lines = 0
+        total_bytes = 0
+        with (
+            cancellation_context(cancel),
+            session.cache_transaction() as cache_transaction,
+        ):
+            try:
+                for geometry in geometries:
+                    result, cache_key = session.realize_with_key(geometry)
+                    total_vertices += result.vertex_count
+                    total_lines += result.line_count
+                    total_bytes += int(result.byte_size)
+                    ensure_resource_usage(
+                        "scene aggregate",
+                        vertices=total_vertices,
+                        lines=total_lines,
+                        byte_size=total_bytes,
+                        budget=session.runtime_limits.scene,
+                        hint="final quality の preview 仕上げを scene 上限内に収めてください",
+                    )
+                    realized.append(result)
+                    cache_keys.append(cache_key)
+            except EvaluationCancelled:
+                # 取り消し前に完成した node は次の idle や export で再利用できる。
+                cache_transaction.commit()
+                raise
+            cache_transaction.commit()
+        cancel.raise_if_cancelled()
+        return _RefinedScene(realized=tuple(realized), cache_keys=tuple(cache_keys))
+
+
+__all__ = ["ProgressiveRefiner"]
@@ -16,9 +16,16 @@ from grafix.core.operation_diagnostics import (
     OperationDiagnosticBuffer,
     extend_operation_diagnostics,
 )
+from grafix.core.geometry import Geometry
+from grafix.core.parameter_dependencies import (
+    ParameterDependencyGraph,
+    ParameterEditPrediction,
+)
 from grafix.core.parameters import (
+    FrameGeometrySiteRecord,
     MidiFrameSnapshot,
     ParamStore,
+    ParameterKey,
     current_effect_order_snapshot,
     current_frame_params,
     current_param_snapshot,
@@ -35,11 +42,18 @@ from grafix.core.runtime_limits import (
 )
 from grafix.core.runtime_config import RuntimeConfig
 from grafix.core.scene import SceneItem
+from grafix.core.thread_budget import ThreadBudget
 from grafix.core.value_validation import exact_integer, finite_real
 from grafix.interactive.runtime.mp_draw import MpDraw
 from grafix.interactive.runtime.perf import PerfCollector
+from grafix.interactive.runtime.refinement import ProgressiveRefiner
+from grafix.interactive.runtime.warm_pool import WarmWorkerPool
 from grafix.interactive.diagnostics import DiagnosticCenter, DiagnosticEvent
 
+# mp-draw worker は draw(t) で Geometry DAG を組むだけで realize しないため、numba の
+# parallel kernel を使わない。worker ごとに 1 thread だけを budget から予約する。
+_DRAW_WORKER_THREADS = 1
+
 
 def _make_evaluation_generation(
     definitions: AuthoringDefinitionsSnapshot,
@@ -48,6 +62,7 @@ def _make_evaluation_generation(
     profiles: RuntimeLimitProfiles,
     cache_store: RealizeCacheStore,
     profiler: PerfCollector,
+    thread_budget: ThreadBudget,
 ) -> tuple[
     OperationCatalog,
     dict[PreviewQuality, EvaluationContext],
@@ -79,6 +94,7 @@ def _make_evaluation_generation(
                 cache_store=cache_store,
                 runtime_limits=limits,
                 profiler=profiler,
+                thread_budget=thread_budget,
             )
     except BaseException:
         for session in sessions.values():
@@ -124,8 +140,16 @@ class SceneRunner:
         diagnostic_center: DiagnosticCenter | None = None,
         effective_config: RuntimeConfig,
         definitions: AuthoringDefinitionsSnapshot | None = None,
+        warm_pool: WarmWorkerPool | None = None,
+        refine_after: float | None = None,
+        thread_budget: ThreadBudget | None = None,
     ) -> None:
         worker_count = exact_integer(n_worker, name="n_worker", minimum=0)
+        refine_idle_s = (
+            None
+            if refine_after is None
+            else finite_real(refine_after, name="refine_after", minimum=0.0)
+        )
         timeout = (
             None
             if evaluation_timeout is None
@@ -146,10 +170,19 @@ class SceneRunner:
         self._perf = perf
         self._worker_count = worker_count
         self._evaluation_timeout = timeout
+        self._warm_pool = warm_pool
         self._runtime_limit_profiles = runtime_limit_profiles
         if not isinstance(effective_config, RuntimeConfig):
             raise TypeError("effective_config は RuntimeConfig である必要があります")
         self._effective_config = effective_config
+        if thread_budget is not None and not isinstance(thread_budget, ThreadBudget):
+            raise TypeError("thread_budget は ThreadBudget である必要があります")
+        # 同じ process の export worker と配分を共有する場合は owner が注入する。
+        self._thread_budget = (
+            ThreadBudget.from_config(effective_config)
+            if thread_budget is None
+            else thread_budget
+        )
         selected_definitions = authoring_definitions_for_draw(
             draw,
             config=effective_config,
@@ -164,6 +197,10 @@ class SceneRunner:
                 runtime_limit_profiles.preview.cpu_cache_entries,
                 runtime_limit_profiles.final.cpu_cache_entries,
             ),
+            compact=(
+                runtime_limit_profiles.preview.cpu_cache_compact
+                or runtime_limit_profiles.final.cpu_cache_compact
+            ),
         )
         try:
             (
@@ -177,6 +214,7 @@ class SceneRunner:
                 profiles=runtime_limit_profiles,
                 cache_store=cache_store,
                 profiler=perf,
+                thread_budget=self._thread_budget,
             )
         except BaseException:
             cache_store.close()
@@ -189,6 +227,9 @@ class SceneRunner:
         self._realize_sessions = realize_sessions
         self._diagnostic_center = diagnostic_center
         self._last_operation_diagnostics: tuple[OperationDiagnostic, ...] = ()
+        self._draw_worker_threads = self._thread_budget.reserve(
+            worker_count * _DRAW_WORKER_THREADS
+        )
         try:
             self._mp_draw: MpDraw | None = (
                 MpDraw(
@@ -197,16 +238,19 @@ class SceneRunner:
                     evaluation_timeout=timeout,
                     effective_config=self._effective_config,
                     definitions=selected_definitions,
+                    thread_allowance=_DRAW_WORKER_THREADS,
                     **(
                         {"event_callback": perf.record_event}
                         if perf.enabled
                         else {}
                     ),
+                    **({} if warm_pool is None else {"warm_pool": warm_pool}),
                 )
                 if worker_count >= 1
                 else None
             )
         except BaseException:
+            self._draw_worker_threads.release()
             try:
                 _close_evaluation_generation(
                     self._realize_sessions,
@@ -243,6 +287,15 @@ class SceneRunner:
         self._last_transport_epoch: int | None = None
         self._last_recording: bool | None = None
         self._last_quality: PreviewQuality | None = None
+        # 依存グラフは GUI が予測を求めた時だけ作る。毎 frame は scene root と
+        # site 記録の参照を差し替えるだけにして、DAG 走査を描画経路へ載せない。
+        self._dependency_roots: tuple[Geometry, ...] = ()
+        self._dependency_sites: tuple[FrameGeometrySiteRecord, ...] = ()
+        self._dependency_graph: ParameterDependencyGraph | None = None
+        # draft preview が静止したら final session で仕上げる。None なら無効。
+        self._refine_idle_s = refine_idle_s
+        self._refiner = self._make_refiner()
+        self._last_output_refined = False
 
     def replace_draw(
         self,
@@ -252,9 +305,11 @@ class SceneRunner:
     ) -> None:
         """draw callable と background worker 世代を一つの境界で交換する。
 
-        新 worker の構築に失敗した場合は現在の callable/worker/last-good frame を
-        変更しない。成功時は旧 worker の結果を無効化し、次の fresh result までは
-        直近の表示を維持する。ParamStore と realize cache の寿命は変えない。
+        稼働中の mp-draw があれば `MpDraw.swap_draw()` で worker process を維持した
+        まま世代を進め、無ければ新しい worker 群を構築する。交換の開始に失敗した
+        場合は現在の callable/worker/last-good frame を変更しない。成功時は旧世代の
+        結果を無効化し、次の fresh result までは直近の表示を維持する。ParamStore と
+        realize cache の寿命は変えない。
         """
 
         if not callable(draw):
@@ -278,24 +333,34 @@ class SceneRunner:
             profiles=self._runtime_limit_profiles,
             cache_store=self._cache_store,
             profiler=self._perf,
+            thread_budget=self._thread_budget,
         )
+        current = self._mp_draw
         try:
-            if self._worker_count >= 1:
+            if current is not None:
+                # process の spawn/import/JIT を繰り返さず、既存 worker へ新しい
+                # source 世代を渡す。worker 側の失敗は MpDraw が restart で吸収する。
+                current.swap_draw(draw, definitions=next_definitions)
+                current.begin_epoch(next_epoch)
+                replacement = current
+            elif self._worker_count >= 1:
                 replacement = MpDraw(
                     draw,
                     n_worker=self._worker_count,
                     evaluation_timeout=self._evaluation_timeout,
                     effective_config=self._effective_config,
                     definitions=next_definitions,
+                    thread_allowance=_DRAW_WORKER_THREADS,
                     **(
                         {"event_callback": self._perf.record_event}
                         if self._perf.enabled
                         else {}
                     ),
+                    **({} if self._warm_pool is None else {"warm_pool": self._warm_pool}),
                 )
                 replacement.begin_epoch(next_epoch)
         except BaseException as startup_error:  # noqa: BLE001
-            if replacement is not None:
+            if replacement is not None and replacement is not current:
                 try:
                     replacement.close()
                 except BaseException:  # noqa: BLE001
@@ -309,6 +374,7 @@ class SceneRunner:
         previous = self._mp_draw
         previous_sessions = self._realize_sessions
         previous_resources = self._evaluation_resources
+        previous_refiner = self._refiner
         self._draw = draw
         self._mp_draw = replacement
         self._definitions = next_definitions
@@ -316,6 +382,8 @@ class SceneRunner:
         self._evaluation_contexts = next_contexts
         self._evaluation_resources = next_resources
         self._realize_sessions = next_sessions
+        self._refiner = self._make_refiner()
+        self._last_output_refined = False
         self._mp_epoch = next_epoch
         self._last_merged_mp_success_frame_id = None
         self._last_merged_mp_success_epoch = None
@@ -330,7 +398,9 @@ class SceneRunner:
         self._waiting_for_fresh_result = replacement is not None
 
         close_errors: list[BaseException] = []
-        if previous is not None:
+        if previous_refiner is not None:
+            previous_refiner.close()
+        if previous is not None and previous is not replacement:
             try:
                 previous.close()
             except BaseException as error:  # noqa: BLE001
@@ -379,6 +449,12 @@ class SceneRunner:
 
         return bool(self._last_output_updated)
 
+    @property
+    def last_output_refined(self) -> bool:
+        """直近 `run()` が draft scene を final quality の geometry へ差し替えたか。"""
+
+        return bool(self._last_output_refined)
+
     @property
     def last_evaluation_t(self) -> float | None:
         """直近に新しく成功した scene が評価された `t` を返す。"""
@@ -453,6 +529,66 @@ class SceneRunner:
 
         return self._cache_store
 
+    def predict_parameter_edit(
+        self,
+        key: ParameterKey,
+    ) -> ParameterEditPrediction | None:
+        """直近の表示 frame で ``key`` を編集した場合の再計算量を見積もる。
+
+        dirty node は site 記録から root までの祖先で、所要時間は直近 quality の
+        session が記録した node 単位の評価時間を合計する。表示 frame が無い場合は
+        None を返す。
+        """
+
+        if not self._dependency_roots:
+            return None
+        graph = self._dependency_graph
+        if graph is None:
+            graph = ParameterDependencyGraph(
+                self._dependency_roots,
+                self._dependency_sites,
+            )
+            self._dependency_graph = graph
+        quality = "draft" if self._last_quality is None else self._last_quality
+        return graph.predict(key, self._realize_sessions[quality].node_cost_ns)
+
+    def _make_refiner(self) -> ProgressiveRefiner | None:
+        if self._refine_idle_s is None:
+            return None
+        return ProgressiveRefiner(
+            session=self._realize_sessions["final"],
+            idle_s=self._refine_idle_s,
+        )
+
+    def _refine_output(
+        self,
+        layers: list[RealizedLayer],
+        *,
+        quality: PreviewQuality,
+    ) -> list[RealizedLayer]:
+        """draft 出力を refiner へ通し、final 評価中は仕上げを取り消す。"""
+
+        refiner = self._refiner
+        if refiner is None:
+            return layers
+        if quality != "draft":
+            refiner.cancel()
+            return layers
+        refined = refiner.observe(layers)
+        self._last_output_refined = refiner.last_output_refined
+        return refined
+
+    def _observe_dependencies(
+        self,
+        layers: Sequence[Layer],
+        sites: Sequence[FrameGeometrySiteRecord],
+    ) -> None:
+        """表示 frame の scene root と site 記録を依存予測用に保持する。"""
+
+        self._dependency_roots = tuple(layer.geometry for layer in layers)
+        self._dependency_sites = tuple(sites)
+        self._dependency_graph = None
+
     def _commit_operation_diagnostics(
         self,
         buffer: OperationDiagnosticBuffer | None,
@@ -530,6 +666,7 @@ class SceneRunner:
             )
         self._last_evaluation_succeeded = None
         self._last_output_updated = False
+        self._last_output_refined = False
         self._last_evaluation_t = None
         self._last_realized_t = None
         self._last_realized_snapshot_revision = None
@@ -555,6 +692,10 @@ class SceneRunner:
                     frame_params = current_frame_params()
                     if frame_params is not None:
                         frame_params.complete_effect_chain_observation()
+                        self._observe_dependencies(
+                            [item.layer for item in realized_layers],
+                            frame_params.geometry_sites,
+                        )
                     self._last_evaluation_succeeded = True
                     self._last_output_updated = True
                     self._last_evaluation_t = float(t)
@@ -568,14 +709,17 @@ class SceneRunner:
                         source_layers=[item.layer for item in realized_layers],
                         style_revision=int(store.style_revision),
                     )
-                    return realized_layers
-                return self._run_mp(
-                    t,
-                    snapshot_revision=store.revision,
-                    cc_snapshot=cc_snapshot,
-                    defaults=defaults,
+                    return self._refine_output(realized_layers, quality=quality)
+                return self._refine_output(
+                    self._run_mp(
+                        t,
+                        snapshot_revision=store.revision,
+                        cc_snapshot=cc_snapshot,
+                        defaults=defaults,
+                        quality=quality,
+                        style_revision=int(store.style_revision),
+                    ),
                     quality=quality,
-                    style_revision=int(store.style_revision),
                 )
         except Exception as exc:
             self._last_evaluation_succeeded = False
@@ -584,6 +728,8 @@ class SceneRunner:
             raise
         finally:
             self._commit_operation_diagnostics(operation_diagnostics)
+            if self._perf.enabled:
+                self._perf.record_thread_budget(self._thread_budget.snapshot())
 
     def _update_epoch(
         self,
@@ -859,6 +1005,10 @@ class SceneRunner:
                 # chainが0件のworker resultも完全な成功観測であることを明示し、
                 # result待ちの空bufferとは区別する。
                 frame_params.complete_effect_chain_observation()
+            self._observe_dependencies(
+                latest_successful.layers,
+                latest_successful.geometry_sites,
+            )
         self._last_realized_t = float(latest_successful.t)
         self._last_realized_snapshot_revision = int(
             latest_successful.snapshot_revision
@@ -881,16 +1031,21 @@ class SceneRunner:
         return realized_layers
 
     def close(self) -> None:
-        """worker、generation resources、共有 cache の順に終了する。"""
+        """refiner、worker、generation resources、共有 cache の順に終了する。"""
 
         mp_draw = self._mp_draw
         self._mp_draw = None
         sessions = self._realize_sessions
         resources = self._evaluation_resources
+        refiner = self._refiner
+        self._refiner = None
         try:
+            if refiner is not None:
+                refiner.close()
             if mp_draw is not None:
                 mp_draw.close()
         finally:
+            self._draw_worker_threads.release()
             try:
                 _close_evaluation_generation(sessions, resources)
             finally:
@@ -0,0 +1,280 @@
+"""
+どこで: `src/grafix/interactive/runtime/shared_snapshot.py`。
+何を: export snapshot の geometry 配列を shared memory segment へ一度だけ書き、
+export worker が read-only view として map するための handle を提供する。
+なぜ: multiprocessing Queue の pickle buffer と worker の unpickle copy を無くし、
+1 snapshot の export 専有 bytes を segment 1 つとして数えられるようにするため。
+
+設計上のポイント
+----------------
+- segment は親 process が所有する。`SharedSnapshotSegment.close()` が unmap と unlink を
+  行い、job 完了・取消・timeout で ExportJobSystem が呼ぶ。
+- Queue に載せるのは segment 名と各配列の位置を持つ小さな `SharedSnapshotHandle` だけ。
+- 同じ array を複数 layer が共有する場合は segment 内でも 1 回だけ書く。
+- worker は `attached_snapshot_layers()` の間だけ segment を map する。view は
+  writeable=False で、`RealizedGeometry` は copy せずに view を包む。
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from grafix.core.layer import Layer
+from grafix.core.pipeline import RealizedLayer
+from grafix.core.realize import GeometryCacheKey
+from grafix.core.realized_geometry import realized_geometry_from_readonly_views
+
+# 各配列の先頭を float32/int32 view に十分な境界へ揃える。
+_ALIGNMENT = 8
+# close() できなかった worker 側 mapping。view が全て消えた後に次の attach で閉じる。
+_LINGERING_ATTACHMENTS: list[shared_memory.SharedMemory] = []
+
+
+@dataclass(frozen=True, slots=True)
+class _ArraySpan:
+    """segment 内の 1 配列の位置。"""
+
+    offset: int
+    shape: tuple[int, ...]
+    dtype: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SharedLayerRecord:
+    """geometry 配列以外の layer 情報と、segment 内の配列位置。"""
+
+    layer: Layer
+    cache_key: GeometryCacheKey
+    color: tuple[float, float, float]
+    thickness: float
+    coords: _ArraySpan
+    offsets: _ArraySpan
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SharedSnapshotHandle:
+    """worker へ送る、shared memory 上の layer 列への参照。"""
+
+    segment_name: str
+    byte_size: int
+    layers: tuple[SharedLayerRecord, ...]
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def shared_layers_byte_size(layers: Sequence[RealizedLayer]) -> int:
+    """layer 列を segment へ書いたときの byte 数（alignment padding 込み）を返す。"""
+
+    seen: set[int] = set()
+    size = 0
+    for layer in layers:
+        for array in (layer.realized.coords, layer.realized.offsets):
+            if id(array) in seen:
+                continue
+            seen.add(id(array))
+            size = _aligned(size) + int(array.nbytes)
+    return size
+
+
+class SharedSnapshotSegment:
+    """親 process が所有する 1 snapshot 分の shared memory segment。"""
+
+    def __init__(
+        self,
+        shm: shared_memory.SharedMemory,
+        handle: SharedSnapshotHandle,
+    ) -> None:
+        self._shm: shared_memory.SharedMemory | None = shm
+        self._handle = handle
+
+    @property
+    def handle(self) -> SharedSnapshotHandle:
+        """worker へ送る handle。"""
+
+        return self._handle
+
+    @property
+    def byte_size(self) -> int:
+        """segment の byte 数。"""
+
+        return self._handle.byte_size
+
+    @property
+    def closed(self) -> bool:
+        return self._shm is None
+
+    def close(self) -> None:
+        """mapping を閉じて segment 名を削除する（複数回呼んでもよい）。
+
+        worker が map 中でも unlink でき、物理 memory は最後の mapping が閉じた時点で
+        解放される。
+        """
+
+        shm = self._shm
+        if shm is None:
+            return
+        self._shm = None
+        try:
+            shm.close()
+        finally:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def publish_shared_layers(layers: Sequence[RealizedLayer]) -> SharedSnapshotSegment:
+    """layer 列の geometry 配列を新しい segment へ copy し、所有 handle を返す。
+
+    Raises
+    ------
+    ValueError
+        書き込む geometry bytes が 0 の場合。
+    OSError
+        shared memory を確保できない場合。
+    """
+
+    byte_size = shared_layers_byte_size(layers)
+    if byte_size <= 0:
+        raise ValueError("shared memory へ書く geometry がありません")
+    shm = shared_memory.SharedMemory(create=True, size=byte_size)
+    try:
+        spans: dict[int, _ArraySpan] = {}
+        records: list[SharedLayerRecord] = []
+        cursor = 0
+        for layer in layers:
+            layer_spans: list[_ArraySpan] = []
+            for array in (layer.realized.coords, layer.realized.offsets):
+                span = spans.get(id(array))
+                if span is None:
+                    cursor = _aligned(cursor)
+                    span = _ArraySpan(
+                        offset=cursor,
+                        shape=tuple(int(dim) for dim in array.shape),
+                        dtype=array.dtype.str,
+                    )
+                    if array.nbytes:
+                        target = np.ndarray(
+                            array.shape,
+                            dtype=array.dtype,
+                            buffer=shm.buf,
+                            offset=cursor,
+                        )
+                        target[...] = array
+                        del target
+                    cursor += int(array.nbytes)
+                    spans[id(array)] = span
+                layer_spans.append(span)
+            records.append(
+                SharedLayerRecord(
+                    layer=layer.layer,
+                    cache_key=layer.cache_key,
+                    color=layer.color,
+                    thickness=layer.thickness,
+                    coords=layer_spans[0],
+                    offsets=layer_spans[1],
+                )
+            )
+        handle = SharedSnapshotHandle(
+            segment_name=shm.name,
+            byte_size=byte_size,
+            layers=tuple(records),
+        )
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    return SharedSnapshotSegment(shm, handle)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        # segment の寿命は親が所有するため、worker 側では resource tracker に登録しない。
+        return shared_memory.SharedMemory(name=name, track=False)
+    # 3.12 以前の spawn worker は親と同じ resource tracker を共有するので、
+    # attach 時の登録は親の登録と重複するだけで、worker 終了時に unlink されない。
+    return shared_memory.SharedMemory(name=name)
+
+
+def _readonly_view(shm: shared_memory.SharedMemory, span: _ArraySpan) -> np.ndarray:
+    dtype = np.dtype(span.dtype)
+    if int(np.prod(span.shape, dtype=np.int64)) == 0:
+        view = np.empty(span.shape, dtype=dtype)
+    else:
+        view = np.ndarray(span.shape, dtype=dtype, buffer=shm.buf, offset=span.offset)
+    view.flags.writeable = False
+    return view
+
+
+def _close_attachment(shm: shared_memory.SharedMemory) -> bool:
+    try:
+        shm.close()
+    except BufferError:
+        return False
+    return True
+
+
+@contextmanager
+def attached_snapshot_layers(
+    handle: SharedSnapshotHandle,
+) -> Iterator[tuple[RealizedLayer, ...]]:
+    """segment を map し、read-only view を包んだ layer 列を yield する。
+
+    呼び出し側は block の外へ layer を持ち出さない。外に残った view があると
+    mapping を閉じられないため、次回の attach まで閉じるのを遅らせる。
+    """
+
+    _LINGERING_ATTACHMENTS[:] = [
+        shm for shm in _LINGERING_ATTACHMENTS if not _close_attachment(shm)
+    ]
+    shm = _attach(handle.segment_name)
+    try:
+        views: dict[_ArraySpan, np.ndarray] = {}
+
+        def view(span: _ArraySpan) -> np.ndarray:
+            array = views.get(span)
+            if array is None:
+                array = _readonly_view(shm, span)
+                views[span] = array
+            return array
+
+        layers = tuple(
+            RealizedLayer(
+                layer=record.layer,
+                realized=realized_geometry_from_readonly_views(
+                    view(record.coords),
+                    view(record.offsets),
+                ),
+                cache_key=record.cache_key,
+                color=record.color,
+                thickness=record.thickness,
+            )
+            for record in handle.layers
+        )
+        views.clear()
+        yield layers
+    finally:
+        layers = None
+        if not _close_attachment(shm):
+            gc.collect()
+            if not _close_attachment(shm):
+                _LINGERING_ATTACHMENTS.append(shm)
+
+
+__all__ = [
+    "SharedLayerRecord",
+    "SharedSnapshotHandle",
+    "SharedSnapshotSegment",
+    "attached_snapshot_layers",
+    "publish_shared_layers",
+    "shared_layers_byte_size",
+]
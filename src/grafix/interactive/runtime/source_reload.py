@@ -701,7 +701,7 @@ class ReloadedDraw:
         _module, draw, definitions = _execute_source_generation(
             path=self._path,
             source_package=source_package,
-            module_name=f"{self._module_name}_worker",
+            module_name=self.worker_module_name,
             draw_attribute=self._draw_attribute,
             baseline=baseline,
             config=self._config,
@@ -711,6 +711,23 @@ class ReloadedDraw:
         self._baseline = baseline
         self._source_package = source_package
 
+    @property
+    def worker_module_name(self) -> str:
+        """worker process で source generation を import する package 名。"""
+
+        return f"{self._module_name}_worker"
+
+    def release_worker_modules(self) -> None:
+        """worker process が import したこの世代の module tree を sys.modules から外す。
+
+        親の `SourceReloadController` が旧世代を破棄するのと同じく、hot swap で
+        置き換えた draw の module を worker 側でも残さない。
+        """
+
+        _remove_source_modules(self.worker_module_name)
+        self._loaded_draw = None
+        self._definitions = None
+
     def __call__(self, t: float) -> SceneItem:
         render_t = finite_real(t, name="t")
         draw = self._loaded_draw
@@ -0,0 +1,321 @@
+"""
+どこで: `src/grafix/interactive/runtime/warm_pool.py`。
+何を: export worker や mp-draw worker 世代を事前に spawn して待機させる共有 warm pool。
+なぜ: `spawn` process の interpreter 起動と grafix import を、最初の PNG 書き出しや
+timeout restart の直後ではなく、`run()` 起動時の background で済ませておくため。
+
+設計上のポイント
+----------------
+- pool は process の中身を知らない。各 subsystem が `register()` で factory を登録し、
+  factory が返す `WarmWorkerSet`（process 群 + 所有 Queue）を `acquire()` で受け取る。
+- slot ごとに待機させる set は 1 つだけ。`acquire()` で取り出すと background thread が
+  次の予備を補充する。
+- `max_processes` は生存している grafix worker process の合計上限。pool が spawn した
+  process（待機中 + 貸出中）に加え、各 subsystem が miss 時や初回に同期 spawn して
+  `track()` で届け出た process も数える。上限を超える補充は行わず、`acquire()` は miss
+  として従来どおりの同期 spawn へ委ねる。同期 spawn 自体は止めないが、予備の補充で
+  生存数が `max_processes` を超えることはない。
+- 待機中に終了した set は `acquire()` 時に破棄し、miss として扱う。
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing.process as mp_process
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Protocol
+
+from grafix.core.value_validation import exact_integer, exact_string
+
+_logger = logging.getLogger(__name__)
+
+
+class WarmWorkerSet(Protocol):
+    """pool が待機させる、起動済み process 群と付随資源の束。"""
+
+    @property
+    def processes(self) -> tuple[mp_process.BaseProcess, ...]: ...
+
+    def close(self) -> None: ...
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class WarmPoolSlot:
+    """`WarmWorkerPool.register()` が返す登録 handle。identity で比較する。"""
+
+    name: str
+    process_count: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class WarmPoolStats:
+    """warm pool の hit/miss と process 数の telemetry。"""
+
+    hits: int
+    misses: int
+    spawned_processes: int
+    discarded_sets: int
+    capped_fills: int
+    failed_fills: int
+    idle_processes: int
+    leased_processes: int
+    max_processes: int
+
+
+def _is_running(proc: mp_process.BaseProcess) -> bool:
+    try:
+        return proc.exitcode is None
+    except ValueError:
+        # close 済み process object は所有者が回収済み。
+        return False
+
+
+def _close_set(worker_set: WarmWorkerSet, *, label: str) -> None:
+    try:
+        worker_set.close()
+    except Exception:
+        _logger.exception("Failed to close warm worker set: %s", label)
+
+
+class WarmWorkerPool:
+    """複数 subsystem で共有する、事前 spawn 済み worker の pool。"""
+
+    def __init__(self, *, max_processes: int) -> None:
+        self._max_processes = exact_integer(
+            max_processes,
+            name="max_processes",
+            minimum=0,
+        )
+        self._lock = threading.Lock()
+        self._factories: dict[WarmPoolSlot, Callable[[], WarmWorkerSet]] = {}
+        self._idle: dict[WarmPoolSlot, WarmWorkerSet] = {}
+        self._spawning: set[WarmPoolSlot] = set()
+        # 上限超過や factory 失敗の slot は、次の acquire() まで補充を試みない。
+        self._fill_blocked: set[WarmPoolSlot] = set()
+        # 貸出済み set と track() された同期 spawn の process。生存中は上限に数える。
+        self._leased: list[mp_process.BaseProcess] = []
+        self._fill_thread: threading.Thread | None = None
+        self._closed = False
+        self._hits = 0
+        self._misses = 0
+        self._spawned_processes = 0
+        self._discarded_sets = 0
+        self._capped_fills = 0
+        self._failed_fills = 0
+
+    @property
+    def max_processes(self) -> int:
+        """待機中・貸出中・track 済みで生存している worker process の合計上限。"""
+
+        return self._max_processes
+
+    @property
+    def stats(self) -> WarmPoolStats:
+        """現在の hit/miss と process 数を返す。"""
+
+        with self._lock:
+            self._prune_leased_locked()
+            return WarmPoolStats(
+                hits=self._hits,
+                misses=self._misses,
+                spawned_processes=self._spawned_processes,
+                discarded_sets=self._discarded_sets,
+                capped_fills=self._capped_fills,
+                failed_fills=self._failed_fills,
+                idle_processes=self._idle_process_count_locked(),
+                leased_processes=len(self._leased),
+                max_processes=self._max_processes,
+            )
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], WarmWorkerSet],
+        *,
+        process_count: int,
+    ) -> WarmPoolSlot:
+        """factory を登録し、予備 set の background spawn を開始する。
+
+        Parameters
+        ----------
+        name : str
+            telemetry/log 用の slot 名。
+        factory : Callable[[], WarmWorkerSet]
+            process を起動済みの set を返す。background thread から呼ばれる。
+        process_count : int
+            factory が 1 回で起動する process 数。上限判定に使う。
+        """
+
+        normalized_name = exact_string(name, name="name")
+        if not normalized_name:
+            raise ValueError("name は空にできません")
+        if not callable(factory):
+            raise TypeError("factory は callable である必要があります")
+        slot = WarmPoolSlot(
+            name=normalized_name,
+            process_count=exact_integer(
+                process_count,
+                name="process_count",
+                minimum=1,
+            ),
+        )
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("WarmWorkerPool は close 済みです")
+            self._factories[slot] = factory
+            self._schedule_fill_locked()
+        return slot
+
+    def unregister(self, slot: WarmPoolSlot) -> None:
+        """slot の登録を外し、待機中の set を閉じる（複数回呼んでもよい）。"""
+
+        with self._lock:
+            self._factories.pop(slot, None)
+            self._fill_blocked.discard(slot)
+            idle = self._idle.pop(slot, None)
+        if idle is not None:
+            _close_set(idle, label=slot.name)
+
+    def acquire(self, slot: WarmPoolSlot) -> WarmWorkerSet | None:
+        """待機中の set を所有権ごと渡す。無ければ None（miss）を返す。
+
+        返した set の process は以後呼び出し側が停止・回収する。pool は上限判定の
+        ためだけに生存を観測し、取り出し後は次の予備を background で補充する。
+        """
+
+        with self._lock:
+            if self._closed or slot not in self._factories:
+                return None
+            worker_set = self._idle.pop(slot, None)
+        if worker_set is not None and not all(
+            _is_running(proc) for proc in worker_set.processes
+        ):
+            _close_set(worker_set, label=slot.name)
+            with self._lock:
+                self._discarded_sets += 1
+            worker_set = None
+        with self._lock:
+            if worker_set is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._leased.extend(worker_set.processes)
+            self._fill_blocked.discard(slot)
+            if not self._closed:
+                self._schedule_fill_locked()
+        return worker_set
+
+    def track(self, processes: Iterable[mp_process.BaseProcess]) -> None:
+        """pool を経ずに同期 spawn した worker process を上限判定に加える。
+
+        初回の worker 世代や miss 時の spawn を数えないと、予備と合わせた生存数が
+        `max_processes` を超える。終了した process は次の判定で自然に外れる。
+        """
+
+        tracked = tuple(processes)
+        with self._lock:
+            if self._closed:
+                return
+            self._leased.extend(tracked)
+
+    def join_fill(self, timeout: float | None = None) -> bool:
+        """実行中の background 補充を待つ。補充が終わっていれば True を返す。"""
+
+        with self._lock:
+            thread = self._fill_thread
+        if thread is None:
+            return True
+        thread.join(timeout=timeout)
+        return not thread.is_alive()
+
+    def close(self) -> None:
+        """補充を止め、待機中の set を全て閉じる（複数回呼んでもよい）。
+
+        貸出済みの process は各 subsystem の close が回収する。
+        """
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._fill_thread
+        if thread is not None:
+            # spawn 途中の set は thread 自身が closed を見て閉じる。
+            thread.join()
+        with self._lock:
+            idle = list(self._idle.items())
+            self._idle.clear()
+            self._factories.clear()
+            self._fill_blocked.clear()
+            self._leased.clear()
+        for slot, worker_set in idle:
+            _close_set(worker_set, label=slot.name)
+
+    def _idle_process_count_locked(self) -> int:
+        return sum(len(worker_set.processes) for worker_set in self._idle.values())
+
+    def _prune_leased_locked(self) -> None:
+        self._leased = [proc for proc in self._leased if _is_running(proc)]
+
+    def _schedule_fill_locked(self) -> None:
+        if self._fill_thread is not None:
+            return
+        thread = threading.Thread(
+            target=self._fill,
+            name="grafix-warm-pool-fill",
+            daemon=True,
+        )
+        self._fill_thread = thread
+        thread.start()
+
+    def _next_fill_slot_locked(self) -> WarmPoolSlot | None:
+        """上限内で補充できる次の slot を予約する。"""
+
+        if self._closed:
+            return None
+        self._prune_leased_locked()
+        reserved = self._idle_process_count_locked() + len(self._leased)
+        reserved += sum(slot.process_count for slot in self._spawning)
+        for slot in self._factories:
+            if slot in self._idle or slot in self._spawning or slot in self._fill_blocked:
+                continue
+            if reserved + slot.process_count > self._max_processes:
+                self._capped_fills += 1
+                self._fill_blocked.add(slot)
+                continue
+            self._spawning.add(slot)
+            return slot
+        return None
+
+    def _fill(self) -> None:
+        while True:
+            with self._lock:
+                slot = self._next_fill_slot_locked()
+                if slot is None:
+                    self._fill_thread = None
+                    return
+                factory = self._factories[slot]
+            worker_set: WarmWorkerSet | None = None
+            try:
+                worker_set = factory()
+            except Exception:
+                _logger.exception("Failed to pre-spawn warm worker set: %s", slot.name)
+            discard: WarmWorkerSet | None = None
+            with self._lock:
+                self._spawning.discard(slot)
+                if worker_set is None:
+                    self._failed_fills += 1
+                    self._fill_blocked.add(slot)
+                else:
+                    self._spawned_processes += len(worker_set.processes)
+                    if self._closed or slot not in self._factories:
+                        discard = worker_set
+                    else:
+                        self._idle[slot] = worker_set
+            if discard is not None:
+                _close_set(discard, label=slot.name)
+
+
+__all__ = ["WarmPoolSlot", "WarmPoolStats", "WarmWorkerPool", "WarmWorkerSet"]
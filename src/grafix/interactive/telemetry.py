@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Protocol, TypeAlias
 
+from grafix.core.parameter_dependencies import ParameterEditPrediction
+from grafix.core.parameters.key import ParameterKey
 from grafix.core.value_validation import (
     exact_bool,
     exact_integer,
@@ -15,6 +18,13 @@ from grafix.core.value_validation import (
 from grafix.interactive.diagnostics import DiagnosticCenter, DiagnosticEvent
 
 
+ParameterEditPredictor: TypeAlias = Callable[
+    [ParameterKey],
+    ParameterEditPrediction | None,
+]
+"""ParameterKey 編集時の再計算見積もりを返す callable。"""
+
+
 def _optional_string(value: object, *, name: str) -> str | None:
     if value is None:
         return None
@@ -125,6 +135,10 @@ class PerfSnapshot:
     input_to_present_p95_ms: float | None = None
     input_to_present_p99_ms: float | None = None
     input_to_present_max_ms: float | None = None
+    cpu_threads: int = 0
+    cpu_thread_demand: int = 0
+    cpu_thread_peak_demand: int = 0
+    cpu_oversubscribed_evaluations: int = 0
 
     @property
     def cache_hit_rate(self) -> float:
@@ -199,6 +213,12 @@ class PerfSnapshot:
                 "p99_ms": self.input_to_present_p99_ms,
                 "max_ms": self.input_to_present_max_ms,
             },
+            "threads": {
+                "total": self.cpu_threads,
+                "demand": self.cpu_thread_demand,
+                "peak_demand": self.cpu_thread_peak_demand,
+                "oversubscribed_evaluations": self.cpu_oversubscribed_evaluations,
+            },
         }
 
 
@@ -227,6 +247,7 @@ class MonitorSnapshot:
     autosave_error: str | None = None
     recovered_session: bool = False
     profiler: PerfSnapshot | None = None
+    edit_predictor: ParameterEditPredictor | None = None
 
     def __post_init__(self) -> None:
         for field_name in ("fps", "cpu_percent", "rss_mb"):
@@ -283,6 +304,8 @@ class MonitorSnapshot:
             raise TypeError("diagnostics は DiagnosticEvent の tuple である必要があります")
         if self.profiler is not None and not isinstance(self.profiler, PerfSnapshot):
             raise TypeError("profiler は PerfSnapshot または None である必要があります")
+        if self.edit_predictor is not None and not callable(self.edit_predictor):
+            raise TypeError("edit_predictor は callable または None である必要があります")
 
 
 class TelemetrySource(Protocol):
@@ -296,6 +319,7 @@ class TelemetrySource(Protocol):
 
 __all__ = [
     "MonitorSnapshot",
+    "ParameterEditPredictor",
     "PerfDurationDistribution",
     "PerfEvent",
     "PerfSnapshot",
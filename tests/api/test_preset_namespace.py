@@ -8,11 +8,11 @@ from pathlib import Path
 
 import pytest
 
-from grafix import P
+from grafix import G, P
 from grafix.api import preset
 from grafix.core.authoring_definitions import RegistrationTarget, registration_scope
 from grafix.core.geometry import Geometry
-from grafix.core.parameters import ParamStore
+from grafix.core.parameters import ParamStore, current_frame_params
 from grafix.core.parameters.context import parameter_context
 from grafix.core.parameters.snapshot_ops import store_snapshot
 from grafix.core.preset_catalog import bind_preset_catalog, preset_declaration
@@ -108,6 +108,22 @@ def test_preset_namespace_supports_p_call_name_without_signature() -> None:
     assert any(site_id.endswith("|int:1") for site_id in site_ids)
 
 
+def test_preset_records_returned_geometry_as_its_parameter_dependency() -> None:
+    @preset(meta={"n": {"kind": "int"}})
+    def dependency_sample(*, n: int = 3) -> list[Geometry]:
+        return [G.polygon(n_sides=n), G.polygon(n_sides=n + 1)]
+
+    with parameter_context(store=ParamStore(), cc_snapshot=None):
+        out = P.dependency_sample(n=5)
+        frame_params = current_frame_params()
+        assert frame_params is not None
+        sites = tuple(frame_params.geometry_sites)
+
+    # preset 本体の G 呼び出しは mute されるため、preset の site だけが残る。
+    assert {record.op for record in sites} == {"preset.dependency_sample"}
+    assert [record.geometry_id for record in sites] == [item.id for item in out]
+
+
 def test_preset_decorator_builds_one_complete_immutable_schema() -> None:
     target = RegistrationTarget()
     visible = {"mode": lambda values: values["count"] > 0}
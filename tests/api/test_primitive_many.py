@@ -0,0 +1,89 @@
+"""``G.<name>.many`` の batched primitive node を検証する。"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from grafix.api import G
+from grafix.core.array_argument import ArrayArgument
+from grafix.core.parameters import ParamStore
+from grafix.core.parameters.context import parameter_context
+from grafix.core.parameters.snapshot_ops import store_snapshot
+from grafix.core.realize import realize
+
+
+def _centers_and_radii(count: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(7)
+    return rng.uniform(-50.0, 50.0, (count, 3)), rng.uniform(0.5, 5.0, count)
+
+
+def test_circle_many_matches_individual_circles_bit_for_bit() -> None:
+    centers, radii = _centers_and_radii(12)
+
+    batched = G.circle.many(center=centers, radius=radii, segments=24)
+
+    assert batched.op == "circle"
+    assert batched.inputs == ()
+    args = dict(batched.args)
+    assert type(args["center"]) is ArrayArgument
+    assert type(args["radius"]) is ArrayArgument
+    assert args["segments"] == 24
+
+    result = realize(batched)
+    singles = [
+        realize(
+            G.circle(
+                center=tuple(float(value) for value in center),
+                radius=float(radius),
+                segments=24,
+            )
+        )
+        for center, radius in zip(centers, radii, strict=True)
+    ]
+    np.testing.assert_array_equal(
+        result.coords,
+        np.concatenate([single.coords for single in singles]),
+    )
+    assert result.offsets.tolist() == [25 * index for index in range(13)]
+
+
+def test_circle_many_broadcasts_shared_arguments() -> None:
+    centers, _radii = _centers_and_radii(4)
+
+    result = realize(G.circle.many(center=centers, radius=2.0, segments=8))
+
+    assert result.offsets.tolist() == [0, 9, 18, 27, 36]
+    first = result.coords[:9]
+    np.testing.assert_allclose(
+        np.hypot(first[:, 0] - centers[0, 0], first[:, 1] - centers[0, 1]),
+        2.0,
+        rtol=1e-5,
+    )
+
+
+def test_circle_many_exposes_only_shared_arguments_to_parameter_gui() -> None:
+    centers, radii = _centers_and_radii(3)
+    store = ParamStore()
+    with parameter_context(store):
+        G.circle.many(center=centers, radius=radii, segments=16)
+
+    observed = {key.arg for key in store_snapshot(store) if key.op == "circle"}
+    assert "segments" in observed
+    assert "center" not in observed
+    assert "radius" not in observed
+
+
+def test_circle_many_rejects_mismatched_or_missing_arrays() -> None:
+    centers, radii = _centers_and_radii(3)
+
+    with pytest.raises(ValueError, match="同じ要素数"):
+        G.circle.many(center=centers, radius=radii[:2])
+    with pytest.raises(ValueError, match=r"shape \(N, 3\)"):
+        G.circle.many(center=centers[:, :2])
+    with pytest.raises(TypeError, match="配列引数"):
+        G.circle.many(radius=1.0)
+
+
+def test_many_is_only_available_for_primitives_declaring_batch_args() -> None:
+    assert not hasattr(G.line, "many")
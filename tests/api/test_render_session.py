@@ -8,7 +8,8 @@ from typing import Literal
 
 import pytest
 
-from grafix import G, P, Frame, RenderOptions, RenderSession, RuntimeLimits, render
+from grafix import G, L, P, Frame, RenderOptions, RenderSession, RuntimeLimits, export, render
+from grafix.api.render import FrameStream
 from grafix.core.font_resources import FontResources
 from grafix.core.parameters import ParamStore
 from grafix.core.resource_budget import ResourceBudget, ResourceLimitError
@@ -78,6 +79,48 @@ def test_render_session_reuses_store_config_style_and_realize_cache() -> None:
     session.close()
 
 
+def _two_layer_draw():
+    grid = G.grid(nx=8, ny=8, center=(50.0, 50.0, 0.0), scale=40.0)
+    polygon = G.polygon(n_sides=7, center=(60.0, 40.0, 0.0), scale=30.0)
+
+    def draw(_t: float):
+        return [
+            L.layer(grid, key="grid"),
+            L.layer(polygon, key="polygon"),
+        ]
+
+    return draw
+
+
+@pytest.mark.parametrize("suffix", [".svg", ".gcode"])
+def test_streamed_export_matches_rendered_export(tmp_path: Path, suffix: str) -> None:
+    draw = _two_layer_draw()
+    with RenderSession(draw) as session:
+        rendered = export(session.render(0.5), tmp_path / f"rendered{suffix}")
+    with RenderSession(draw) as session:
+        stream = session.stream(0.5)
+        assert isinstance(stream, FrameStream)
+        streamed = export(stream, tmp_path / f"streamed{suffix}")
+        # stream 側の新規 Geometry は realize cache に残らない。
+        assert session.realize_session.stats().entries == 0
+        assert stream.provenance.frame.frame_index == 0
+
+    assert streamed.path.read_bytes() == rendered.path.read_bytes()
+
+
+def test_frame_stream_layers_are_single_use() -> None:
+    with RenderSession(_two_layer_draw()) as session:
+        stream = session.stream(0.0)
+        with pytest.raises(RuntimeError, match="provenance"):
+            _ = stream.provenance
+        layers = list(stream.layers)
+        with pytest.raises(RuntimeError, match="layers"):
+            _ = stream.layers
+        assert len(layers) == 2
+        assert stream.provenance.frame.frame_index == 0
+        assert session.render(0.0).provenance.frame.frame_index == 1
+
+
 def test_render_session_is_context_managed_and_close_is_idempotent() -> None:
     with RenderSession(_constant_draw()) as session:
         frame = session.render(2.5)
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import io
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from grafix import G, RenderOptions, VideoRenderResult, render, render_video
+from grafix.api.video import video_frame_times
+from grafix.export import capture as capture_module
+from grafix.export import video as video_module
+
+
+def _moving_draw(t: float):
+    return G.line(
+        center=(0.0, 0.0, 0.0),
+        anchor="left",
+        length=10.0 + 10.0 * t,
+        angle=0.0,
+    )
+
+
+class _FakeStdin(io.BytesIO):
+    def __init__(self, proc: _FakeFfmpeg) -> None:
+        super().__init__()
+        self._proc = proc
+
+    def close(self) -> None:
+        if not self.closed:
+            self._proc.received = self.getvalue()
+        super().close()
+
+
+class _FakeFfmpeg:
+    """stdin を記録し、正常終了時に最後の引数の path へ出力を書く。"""
+
+    instances: list[_FakeFfmpeg] = []
+    returncode_on_finish = 0
+
+    def __init__(self, cmd, *, stdin, stdout, stderr) -> None:
+        assert stdin is subprocess.PIPE
+        self.cmd = list(cmd)
+        self.stdin = _FakeStdin(self)
+        self.received: bytes | None = None
+        self.returncode: int | None = None
+        self.terminated = False
+        self._stderr = stderr
+        type(self).instances.append(self)
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        if self.returncode is None:
+            self.returncode = type(self).returncode_on_finish
+            if self.returncode == 0:
+                Path(self.cmd[-1]).write_bytes(b"mp4:" + (self.received or b""))
+            else:
+                self._stderr.write(b"encoder exploded")
+        return self.returncode
+
+    def terminate(self) -> None:
+        self.terminated = True
+        self.returncode = -15
+
+    def kill(self) -> None:
+        self.returncode = -9
+
+
+_REAL_POPEN = subprocess.Popen
+
+
+def _popen_routing_ffmpeg(factory):
+    # provenance の git 呼び出しなど、ffmpeg 以外の subprocess は実物へ通す。
+    def popen(cmd, *args, **kwargs):
+        if list(cmd)[:1] == ["ffmpeg"]:
+            return factory(cmd, *args, **kwargs)
+        return _REAL_POPEN(cmd, *args, **kwargs)
+
+    return popen
+
+
+@pytest.fixture
+def fake_ffmpeg(monkeypatch: pytest.MonkeyPatch) -> type[_FakeFfmpeg]:
+    _FakeFfmpeg.instances = []
+    _FakeFfmpeg.returncode_on_finish = 0
+    monkeypatch.setattr(
+        video_module.subprocess,
+        "Popen",
+        _popen_routing_ffmpeg(_FakeFfmpeg),
+    )
+    return _FakeFfmpeg
+
+
+@pytest.fixture
+def raster_calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[int, int]]:
+    calls: list[tuple[int, int]] = []
+    lock = threading.Lock()
+
+    def fake_rasterize(svg_path, png_path, *, output_size, **_kwargs):
+        svg = Path(svg_path).read_bytes()
+        with lock:
+            calls.append(output_size)
+            order = len(calls)
+        # 先に投入した frame ほど遅く終わらせ、完了順と frame 順をずらす。
+        time.sleep(0.02 if order % 2 else 0.0)
+        Path(png_path).write_bytes(b"<png>" + svg + b"</png>")
+        return Path(png_path)
+
+    monkeypatch.setattr(capture_module, "rasterize_svg_to_png", fake_rasterize)
+    return calls
+
+
+def _expected_png_stream(times: tuple[float, ...], tmp_path: Path) -> bytes:
+    chunks = []
+    for index, t in enumerate(times):
+        frame = render(_moving_draw, t, options=RenderOptions(canvas_size=(40, 30)))
+        svg_path = tmp_path / f"expected-{index}.svg"
+        capture_module.export_svg(frame.layers, svg_path, canvas_size=frame.canvas_size)
+        chunks.append(b"<png>" + svg_path.read_bytes() + b"</png>")
+    return b"".join(chunks)
+
+
+def test_video_frame_times_use_half_open_range_without_accumulated_error() -> None:
+    assert video_frame_times((0.0, 1.0), 4.0) == (0.0, 0.25, 0.5, 0.75)
+    assert video_frame_times((1.0, 1.1), 30.0) == (1.0, 1.0 + 1.0 / 30.0, 1.0 + 2.0 / 30.0)
+    times = video_frame_times((0.0, 100.0), 30.0)
+    assert len(times) == 3000
+    assert times[-1] == 2999 / 30.0
+    with pytest.raises(ValueError, match="start < stop"):
+        video_frame_times((1.0, 1.0), 30.0)
+    with pytest.raises(TypeError, match="t_range"):
+        video_frame_times([0.0, 1.0], 30.0)  # type: ignore[arg-type]
+
+
+def test_render_video_streams_frames_in_order_through_bounded_pipeline(
+    tmp_path: Path,
+    fake_ffmpeg: type[_FakeFfmpeg],
+    raster_calls: list[tuple[int, int]],
+) -> None:
+    output = tmp_path / "clips" / "wave.mp4"
+
+    result = render_video(
+        _moving_draw,
+        (0.0, 1.0),
+        6.0,
+        path=output,
+        options=RenderOptions(canvas_size=(40, 30)),
+        scale=2.0,
+        rasterizer_threads=3,
+        max_pending_frames=2,
+    )
+
+    times = video_frame_times((0.0, 1.0), 6.0)
+    assert result == VideoRenderResult(
+        path=output,
+        frame_count=6,
+        fps=6.0,
+        t_range=(0.0, 1.0),
+        output_size=(80, 60),
+    )
+    assert raster_calls == [(80, 60)] * 6
+    (proc,) = fake_ffmpeg.instances
+    assert proc.cmd[proc.cmd.index("-f") + 1] == "image2pipe"
+    assert "vflip" not in " ".join(proc.cmd)
+    assert Path(proc.cmd[-1]) != output
+    assert output.read_bytes() == b"mp4:" + _expected_png_stream(times, tmp_path)
+    # PNG 中間物と ffmpeg の staging は残さない。
+    assert sorted(path.name for path in output.parent.iterdir()) == ["wave.mp4"]
+
+
+def test_render_video_aborts_encoder_and_keeps_no_output_when_rasterize_fails(
+    tmp_path: Path,
+    fake_ffmpeg: type[_FakeFfmpeg],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = 0
+
+    def failing_rasterize(svg_path, png_path, **_kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 3:
+            raise RuntimeError("resvg failed")
+        Path(png_path).write_bytes(b"png")
+        return Path(png_path)
+
+    monkeypatch.setattr(capture_module, "rasterize_svg_to_png", failing_rasterize)
+    output = tmp_path / "broken.mp4"
+
+    with pytest.raises(RuntimeError, match="resvg failed"):
+        render_video(
+            _moving_draw,
+            (0.0, 10.0),
+            10.0,
+            path=output,
+            options=RenderOptions(canvas_size=(40, 30)),
+            rasterizer_threads=2,
+            max_pending_frames=2,
+        )
+
+    (proc,) = fake_ffmpeg.instances
+    assert proc.terminated
+    # bounded queue のため、失敗後に全 100 frame を rasterize しない。
+    assert calls < 20
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_render_video_reports_ffmpeg_failure_with_stderr(
+    tmp_path: Path,
+    fake_ffmpeg: type[_FakeFfmpeg],
+    raster_calls: list[tuple[int, int]],
+) -> None:
+    fake_ffmpeg.returncode_on_finish = 1
+
+    with pytest.raises(RuntimeError, match="encoder exploded"):
+        render_video(
+            _moving_draw,
+            (0.0, 0.5),
+            4.0,
+            path=tmp_path / "fail.mp4",
+            options=RenderOptions(canvas_size=(40, 30)),
+            rasterizer_threads=1,
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_render_video_reports_missing_ffmpeg(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def missing(*_args, **_kwargs):
+        raise FileNotFoundError("ffmpeg")
+
+    monkeypatch.setattr(
+        video_module.subprocess,
+        "Popen",
+        _popen_routing_ffmpeg(missing),
+    )
+
+    with pytest.raises(RuntimeError, match="ffmpeg が見つかりません"):
+        render_video(
+            _moving_draw,
+            (0.0, 0.5),
+            4.0,
+            path=tmp_path / "none.mp4",
+            options=RenderOptions(canvas_size=(40, 30)),
+        )
+
+    assert list(tmp_path.iterdir()) == []
@@ -78,6 +78,13 @@ def test_run_rejects_invalid_evaluation_timeout(timeout: object) -> None:
         runner_module.run(_draw, evaluation_timeout=timeout)  # type: ignore[arg-type]
 
 
+@pytest.mark.parametrize("idle_s", [True, "1", -1.0, float("inf"), float("nan")])
+def test_run_rejects_invalid_refine_after(idle_s: object) -> None:
+    expected_error = TypeError if isinstance(idle_s, (bool, str)) else ValueError
+    with pytest.raises(expected_error, match="refine_after"):
+        runner_module.run(_draw, refine_after=idle_s)  # type: ignore[arg-type]
+
+
 @pytest.mark.parametrize("field", ["parameter_gui", "parameter_persistence"])
 @pytest.mark.parametrize("value", [0, 1, "false", None])
 def test_run_requires_exact_boolean_flags_before_side_effect(
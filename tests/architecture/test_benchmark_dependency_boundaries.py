@@ -13,6 +13,7 @@ _PROVIDERS = {
     "mp_draw_benchmark",
     "parameter_edit_benchmark",
     "parameter_hotpath_benchmark",
+    "parameter_table_render_benchmark",
     "perf_hotpath_benchmark",
     "primitive_benchmark",
     "remaining_effect_benchmark",
@@ -25,6 +26,7 @@ _ALLOWED_PROVIDER_DEPENDENCIES = {
         "renderer_benchmark",
     },
     "parameter_edit_benchmark": {"parameter_hotpath_benchmark"},
+    "parameter_table_render_benchmark": {"parameter_hotpath_benchmark"},
 }
 
 
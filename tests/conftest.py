@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+
+import pytest
+
+from grafix.core import fingerprint_cache, glyph_outline_cache
+
+_CACHE_DIR_ENVS = ("GRAFIX_FINGERPRINT_CACHE_DIR", "GRAFIX_GLYPH_CACHE_DIR")
+_saved_cache_dir_envs: dict[str, str | None] = {}
+
+
+def _reset_default_caches() -> None:
+    fingerprint_cache._default_fingerprint_cache.cache_clear()
+    glyph_outline_cache._default_glyph_outline_cache.cache_clear()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """collection 中の import が利用者の ~/.cache/grafix へ書かないよう無効化する。"""
+
+    for name in _CACHE_DIR_ENVS:
+        _saved_cache_dir_envs[name] = os.environ.get(name)
+        os.environ[name] = ""
+    _reset_default_caches()
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    for name, value in _saved_cache_dir_envs.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+    _saved_cache_dir_envs.clear()
+    _reset_default_caches()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def isolated_grafix_caches(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """fingerprint / glyph の on-disk cache を session 専用 directory へ向ける。
+
+    spawn worker も環境変数を引き継ぐため、子 process の書き込みも隔離される。
+    """
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv(
+            "GRAFIX_FINGERPRINT_CACHE_DIR",
+            str(tmp_path_factory.mktemp("fingerprint-cache")),
+        )
+        patch.setenv("GRAFIX_GLYPH_CACHE_DIR", str(tmp_path_factory.mktemp("glyph-cache")))
+        _reset_default_caches()
+        try:
+            yield
+        finally:
+            _reset_default_caches()
@@ -8,9 +8,15 @@ import numpy as np
 import pytest
 
 from grafix.api import E, G
+from grafix.core.cancellation import (
+    CancellationToken,
+    EvaluationCancelled,
+    cancellation_context,
+    check_cancelled,
+)
 from grafix.core.operation_diagnostics import operation_diagnostic_context
 from grafix.core.preview_quality import preview_quality_context
-from grafix.core.realize import RealizeError, realize
+from grafix.core.realize import RealizeError, RealizeSession, realize
 
 
 def _geometry_digest(geometry: tuple[np.ndarray, np.ndarray]) -> str:
@@ -368,3 +374,59 @@ def test_growth_draft_bounds_repulsion_hash_before_force_allocation(
     assert width * height <= 128
     assert result.force_grid_requested_cells > 128
     assert result.force_grid_effective_cells == width * height
+
+
+def test_growth_stops_at_iteration_boundary_when_cancelled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import grafix.core.effects.growth as module
+
+    token = CancellationToken()
+    polls: list[int] = []
+
+    def check() -> None:
+        polls.append(len(polls))
+        if len(polls) == 3:
+            token.cancel()
+        check_cancelled()
+
+    monkeypatch.setattr(module, "check_cancelled", check)
+    geometry = E.growth(seed_count=2, iters=40, seed=5)(G.polygon(n_sides=4, scale=60.0))
+
+    with RealizeSession() as session:
+        with cancellation_context(token):
+            with pytest.raises(EvaluationCancelled):
+                session.realize(geometry)
+        assert len(polls) == 3
+        out = session.realize(geometry)
+
+    assert out.coords.shape[0] > 0
+    assert len(polls) == 3 + 40
+
+
+def test_growth_resumes_from_checkpoint_when_iterations_increase(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import grafix.core.effects.growth as module
+
+    polls: list[int] = []
+
+    def check() -> None:
+        polls.append(len(polls))
+
+    monkeypatch.setattr(module, "check_cancelled", check)
+    mask = G.polygon(n_sides=4, scale=60.0)
+
+    with RealizeSession() as session:
+        session.realize(E.growth(seed_count=2, iters=70, seed=9)(mask))
+        assert len(polls) == 70
+        resumed = session.realize(E.growth(seed_count=2, iters=75, seed=9)(mask))
+        assert len(polls) == 75
+        # 反復数を戻した場合は interval ごとの 64 反復目から再開する。
+        session.realize(E.growth(seed_count=2, iters=68, seed=9)(mask))
+        assert len(polls) == 75 + 4
+
+    fresh = realize(E.growth(seed_count=2, iters=75, seed=9)(mask))
+
+    np.testing.assert_array_equal(resumed.coords, fresh.coords)
+    np.testing.assert_array_equal(resumed.offsets, fresh.offsets)
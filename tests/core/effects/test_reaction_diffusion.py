@@ -9,9 +9,18 @@ import numpy as np
 import pytest
 
 from grafix.api import E, G
+from grafix.core.cancellation import (
+    CancellationToken,
+    EvaluationCancelled,
+    cancellation_context,
+)
 from grafix.core.operation_diagnostics import operation_diagnostic_context
 from grafix.core.preview_quality import preview_quality_context
 from grafix.core.realize import RealizeError, realize
+from grafix.core.simulation_checkpoints import (
+    SimulationCheckpoints,
+    simulation_checkpoint_context,
+)
 
 
 def _circle_ring(radius: float, sides: int) -> np.ndarray:
@@ -370,3 +379,116 @@ def test_reaction_diffusion_draft_with_center_hole_is_nonempty_and_deterministic
     assert first[0].shape[0] > 0
     np.testing.assert_array_equal(first[0], second[0])
     np.testing.assert_array_equal(first[1], second[1])
+
+
+@pytest.mark.parametrize("use_parallel_threads", [1, 4])
+def test_reaction_diffusion_cancellable_chunks_match_single_kernel_call(
+    monkeypatch: pytest.MonkeyPatch,
+    use_parallel_threads: int,
+) -> None:
+    import grafix.core.effects.reaction_diffusion as module
+
+    u0, v0, mask = _kernel_fixture()
+    kwargs = {
+        "steps": 11,
+        "du": 0.16,
+        "dv": 0.08,
+        "feed": 0.035,
+        "kill": 0.062,
+        "dt": 1.0,
+        "boundary": 0,
+    }
+    expected = module._gray_scott_simulate_masked_serial(u0, v0, mask, **kwargs)
+    monkeypatch.setattr(module, "get_num_threads", lambda: use_parallel_threads)
+    monkeypatch.setattr(module, "_PARALLEL_MIN_GRID_CELLS", 1)
+    # 30 cells なので 1 chunk は 3 step。奇数 chunk と端数 chunk の両方を通す。
+    monkeypatch.setattr(module, "_CANCELLATION_CHUNK_CELL_STEPS", 90)
+
+    with cancellation_context(CancellationToken()):
+        actual = module._gray_scott_simulate_masked(u0, v0, mask, **kwargs)
+
+    assert actual.tobytes() == expected.tobytes()
+
+
+def test_reaction_diffusion_cancelled_between_step_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import grafix.core.effects.reaction_diffusion as module
+
+    token = CancellationToken()
+    advanced: list[int] = []
+    serial = module._gray_scott_advance_masked_serial
+
+    def advance(
+        u: np.ndarray,
+        v: np.ndarray,
+        grid_mask: np.ndarray,
+        steps: int,
+        *rest: object,
+    ) -> None:
+        advanced.append(steps)
+        serial(u, v, grid_mask, steps, *rest)
+        if len(advanced) == 2:
+            token.cancel()
+
+    monkeypatch.setattr(module, "_gray_scott_advance_masked_serial", advance)
+    monkeypatch.setattr(module, "_CANCELLATION_CHUNK_CELL_STEPS", 120)
+    u0, v0, mask = _kernel_fixture()
+
+    with cancellation_context(token):
+        with pytest.raises(EvaluationCancelled):
+            module._gray_scott_simulate_masked(
+                u0,
+                v0,
+                mask,
+                steps=40,
+                du=0.16,
+                dv=0.08,
+                feed=0.035,
+                kill=0.062,
+                dt=1.0,
+                boundary=1,
+            )
+
+    assert advanced == [4, 4]
+
+
+def test_reaction_diffusion_resumes_from_checkpoint_bit_exactly(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import grafix.core.effects.reaction_diffusion as module
+
+    advanced: list[int] = []
+    serial = module._gray_scott_advance_masked_serial
+
+    def advance(
+        u: np.ndarray,
+        v: np.ndarray,
+        grid_mask: np.ndarray,
+        steps: int,
+        *rest: object,
+    ) -> None:
+        advanced.append(steps)
+        serial(u, v, grid_mask, steps, *rest)
+
+    monkeypatch.setattr(module, "_gray_scott_advance_masked_serial", advance)
+    u0, v0, mask = _kernel_fixture()
+    kwargs = {
+        "du": 0.16,
+        "dv": 0.08,
+        "feed": 0.035,
+        "kill": 0.062,
+        "dt": 1.0,
+        "boundary": 0,
+    }
+    checkpoints = SimulationCheckpoints(max_bytes=1 << 20)
+
+    with simulation_checkpoint_context(checkpoints):
+        module._gray_scott_simulate_masked(u0, v0, mask, steps=6, **kwargs)
+        resumed = module._gray_scott_simulate_masked(u0, v0, mask, steps=11, **kwargs)
+        repeated = module._gray_scott_simulate_masked(u0, v0, mask, steps=11, **kwargs)
+    expected = module._gray_scott_simulate_masked_serial(u0, v0, mask, steps=11, **kwargs)
+
+    assert advanced == [6, 5]
+    assert resumed.tobytes() == expected.tobytes()
+    assert repeated.tobytes() == expected.tobytes()
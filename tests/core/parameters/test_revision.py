@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pickle
 from dataclasses import FrozenInstanceError, replace
 from typing import Any, cast
 
@@ -12,7 +13,11 @@ from grafix.core.parameters.labels_ops import set_label
 from grafix.core.parameters.merge_ops import merge_frame_params
 from grafix.core.parameters import merge_ops
 from grafix.core.parameters.meta import ParamMeta
-from grafix.core.parameters.snapshot_ops import materialize_snapshot, store_snapshot
+from grafix.core.parameters.snapshot_ops import (
+    materialize_snapshot,
+    snapshot_delta,
+    store_snapshot,
+)
 from grafix.core.parameters.store import ParamStore
 from grafix.core.parameters.style import STYLE_GLOBAL_THICKNESS, style_key
 from grafix.core.parameters.style_ops import ensure_style_entries
@@ -116,6 +121,42 @@ def test_large_unchanged_snapshot_is_built_once() -> None:
     assert len(snapshots[0]) == 1_000
 
 
+def test_snapshot_delta_contains_only_value_changes_over_shared_base() -> None:
+    store = ParamStore()
+    records = [_record(index) for index in range(5_000)]
+    merge_frame_params(store, records)
+    previous = store_snapshot(store)
+
+    assert snapshot_delta(previous, previous) == {}
+
+    changed = records[1_234]
+    assert update_state_from_ui(store, changed.key, 42.0, meta=changed.meta)[0]
+    current = store_snapshot(store)
+    delta = snapshot_delta(previous, current)
+
+    assert delta is not None
+    assert set(delta) == {changed.key}
+    assert delta[changed.key] == current[changed.key]
+    assert {**materialize_snapshot(previous), **delta} == materialize_snapshot(current)
+    assert len(pickle.dumps(delta)) * 100 < len(pickle.dumps(materialize_snapshot(current)))
+
+    # 差分を戻した key も、previous との比較で差分に含める。
+    assert update_state_from_ui(store, changed.key, float(1_234), meta=changed.meta)[0]
+    reverted = store_snapshot(store)
+    assert snapshot_delta(current, reverted) == {changed.key: reverted[changed.key]}
+    assert snapshot_delta(previous, reverted) == {}
+
+
+def test_snapshot_delta_is_none_after_structure_change() -> None:
+    store = ParamStore()
+    merge_frame_params(store, [_record(1)])
+    previous = store_snapshot(store)
+
+    merge_frame_params(store, [_record(1), _record(2)])
+
+    assert snapshot_delta(previous, store_snapshot(store)) is None
+
+
 def test_effective_revision_advances_once_only_when_final_snapshot_changes() -> None:
     store = ParamStore()
     first = replace(_record(1), source="code")
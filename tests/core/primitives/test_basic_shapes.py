@@ -76,13 +76,26 @@ def test_polyline_empty_input_is_empty_geometry() -> None:
     assert result.offsets.tolist() == [0]
 
 
-def test_polyline_rejects_ndarray_before_evaluation() -> None:
-    points = np.array([[0.0, 0.0], [1.0, 1.0]], dtype=np.float64)
+def test_polyline_rejects_integer_ndarray_before_evaluation() -> None:
+    points = np.array([[0, 0], [1, 1]], dtype=np.int64)
 
     with pytest.raises(TypeError, match="immutable"):
         G.polyline(points=points)
 
 
+def test_polyline_accepts_float_ndarray_points() -> None:
+    points = np.array([[0.0, 0.0], [1.0, 1.0]], dtype=np.float64)
+
+    result = realize(G.polyline(points=points, closed=True))
+
+    assert result.coords.tolist() == [
+        [0.0, 0.0, 0.0],
+        [1.0, 1.0, 0.0],
+        [0.0, 0.0, 0.0],
+    ]
+    assert result.offsets.tolist() == [0, 3]
+
+
 @pytest.mark.parametrize(
     "points",
     [
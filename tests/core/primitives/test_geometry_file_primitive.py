@@ -0,0 +1,67 @@
+"""geometry_file プリミティブ（保存済み layer の読み込み）のテスト。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from grafix.api import G
+from grafix.core.geometry_file import GeometryFileLayer, write_geometry_file
+from grafix.core.realize import RealizeError, RealizeSession, realize
+
+
+def _save(path: Path, *coords_list: list[list[float]]) -> None:
+    layers = [
+        GeometryFileLayer(
+            coords=np.asarray(coords, dtype=np.float32),
+            offsets=np.array([0, len(coords)], dtype=np.int32),
+            color=(0.0, 0.0, 0.0),
+            thickness=0.001,
+        )
+        for coords in coords_list
+    ]
+    with path.open("wb") as stream:
+        write_geometry_file(stream, layers)
+
+
+def test_geometry_file_reads_selected_layer_and_places_it(tmp_path: Path) -> None:
+    path = tmp_path / "scene.ggeom"
+    _save(path, [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]], [[0.0, 1.0, 0.0], [2.0, 3.0, 1.0]])
+
+    realized = realize(
+        G.geometry_file(path=str(path), layer=1, center=(10.0, 20.0, 0.0), scale=2.0)
+    )
+
+    np.testing.assert_array_equal(
+        realized.coords,
+        np.array([[10.0, 22.0, 0.0], [14.0, 26.0, 2.0]], dtype=np.float32),
+    )
+    np.testing.assert_array_equal(realized.offsets, np.array([0, 2], dtype=np.int32))
+    assert realize(G.geometry_file()).coords.shape == (0, 3)
+
+
+def test_geometry_file_rereads_rewritten_file_in_same_session(tmp_path: Path) -> None:
+    path = tmp_path / "scene.ggeom"
+    geometry = G.geometry_file(path=str(path))
+    _save(path, [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]])
+
+    with RealizeSession() as session:
+        first = session.realize(geometry)
+        assert session.realize(geometry) is first
+        # 同じ path・同じ引数でも内容 digest が cache key に入るので読み直す。
+        _save(path, [[5.0, 5.0, 0.0], [6.0, 5.0, 0.0]])
+        second = session.realize(geometry)
+
+    assert second is not first
+    assert float(second.coords[0, 0]) == 5.0
+
+
+def test_geometry_file_rejects_missing_layer(tmp_path: Path) -> None:
+    path = tmp_path / "scene.ggeom"
+    _save(path, [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]])
+
+    with pytest.raises(RealizeError) as excinfo:
+        realize(G.geometry_file(path=str(path), layer=1))
+    assert "layer" in str(excinfo.value.__cause__)
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 import pytest
 
 from grafix import G
+from grafix.core.primitives import lsystem as lsystem_module
 from grafix.core.primitives.lsystem import (
     _expand_preset,
     _turtle_to_geom_tuple,
     lsystem as raw_lsystem,
 )
+from grafix.core.resource_budget import (
+    ResourceBudget,
+    ResourceLimitError,
+    resource_budget_context,
+)
 from grafix.core.realize import RealizeError, realize
 from grafix.core.primitives import lsystem as _lsystem_module  # noqa: F401
 
@@ -140,6 +148,26 @@ def test_lsystem_cached_preset_returns_fresh_writable_arrays() -> None:
     assert not np.shares_memory(first_offsets, second_offsets)
 
 
+def test_lsystem_keeps_only_small_preset_expansions_cached(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """大きな展開結果は LRU に残さず、小さいものだけ再利用する。"""
+
+    monkeypatch.setattr(lsystem_module, "_PRESET_CACHE_MAX_BYTES", 1_000)
+    _expand_preset.cache_clear()
+    try:
+        large_coords, _ = raw_lsystem(kind="plant", iters=4)
+        assert _expand_preset.cache_info().currsize == 0
+        raw_lsystem(kind="plant", iters=3)
+        assert _expand_preset.cache_info().currsize == 1
+
+        monkeypatch.setattr(lsystem_module, "_PRESET_CACHE_MAX_BYTES", 1 << 20)
+        cached_coords, _ = raw_lsystem(kind="plant", iters=4)
+        np.testing.assert_array_equal(large_coords, cached_coords)
+    finally:
+        _expand_preset.cache_clear()
+
+
 @pytest.mark.parametrize(
     ("kwargs", "parameter"),
     [
@@ -194,3 +222,114 @@ def test_lsystem_batched_preset_random_values_match_scalar_draws(
 
     np.testing.assert_array_equal(batch_coords, scalar_coords)
     np.testing.assert_array_equal(batch_offsets, scalar_offsets)
+
+
+def _reference_lsystem(
+    axiom: str,
+    rules: dict[str, str],
+    *,
+    iters: int,
+    heading_deg: float,
+    angle_deg: float,
+    step: float,
+    jitter: float,
+    seed: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """文字列展開と 1 文字ずつの Python タートル解釈による参照実装。"""
+
+    program = axiom
+    for _ in range(iters):
+        program = "".join(rules.get(ch, ch) for ch in program)
+    rng = np.random.default_rng(seed)
+    x, y, heading = 0.0, 0.0, math.radians(heading_deg)
+    angle = math.radians(angle_deg)
+    lines: list[list[tuple[float, float]]] = []
+    current = [(x, y)]
+    stack: list[tuple[float, float, float, list[tuple[float, float]]]] = []
+    for ch in program:
+        if ch in "Ff+-" and jitter > 0.0:
+            scale = 1.0 + float(rng.uniform(-jitter, jitter))
+        else:
+            scale = 1.0
+        if ch in "Ff":
+            x += step * scale * math.cos(heading)
+            y += step * scale * math.sin(heading)
+            if ch == "F":
+                current.append((x, y))
+            else:
+                if len(current) >= 2:
+                    lines.append(current)
+                current = [(x, y)]
+        elif ch in "+-":
+            heading = heading + angle * scale if ch == "+" else heading - angle * scale
+        elif ch == "[":
+            stack.append((x, y, heading, current))
+            current = [(x, y)]
+        elif ch == "]" and stack:
+            if len(current) >= 2:
+                lines.append(current)
+            x, y, heading, current = stack.pop()
+    lines.extend([current, *reversed([item[3] for item in stack])])
+    lines = [line for line in lines if len(line) >= 2]
+    if not lines:
+        return np.zeros((0, 3), dtype=np.float32), np.zeros((1,), dtype=np.int32)
+    coords = np.zeros((sum(len(line) for line in lines), 3), dtype=np.float32)
+    coords[:, :2] = np.concatenate([np.asarray(line, dtype=np.float32) for line in lines])
+    offsets = np.concatenate([[0], np.cumsum([len(line) for line in lines])]).astype(np.int32)
+    return coords, offsets
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+@pytest.mark.parametrize(
+    ("axiom", "rules", "iters"),
+    [
+        ("X", {"X": "F-[[X]+X]+F[+FX]-X", "F": "FF"}, 4),
+        ("A", {"A": "F[+A]]B", "B": "f-A["}, 5),
+        ("ff[F]]]F[[[", {}, 0),
+        ("Xé", {"X": "Fé+X", "é": "f"}, 6),
+    ],
+)
+@pytest.mark.parametrize("jitter", [0.0, 0.1])
+def test_lsystem_compiled_turtle_matches_python_reference(
+    axiom: str,
+    rules: dict[str, str],
+    iters: int,
+    jitter: float,
+) -> None:
+    rules_text = "\n".join(f"{key}={value}" for key, value in rules.items())
+    coords, offsets = raw_lsystem(
+        kind="custom",
+        axiom=axiom,
+        rules=rules_text,
+        iters=iters,
+        heading=33.0,
+        angle=91.0,
+        step=2.0,
+        jitter=jitter,
+        seed=3,
+    )
+    expected_coords, expected_offsets = _reference_lsystem(
+        axiom,
+        rules,
+        iters=iters,
+        heading_deg=33.0,
+        angle_deg=91.0,
+        step=2.0,
+        jitter=jitter,
+        seed=3,
+    )
+
+    np.testing.assert_array_equal(coords, expected_coords)
+    np.testing.assert_array_equal(offsets, expected_offsets)
+
+
+def test_lsystem_rejects_budget_before_expanding(monkeypatch: pytest.MonkeyPatch) -> None:
+    def expand(*_args: object, **_kwargs: object) -> np.ndarray:
+        raise AssertionError("budget 超過の program を展開しました")
+
+    monkeypatch.setattr(lsystem_module, "_expand_codes", expand)
+    with resource_budget_context(ResourceBudget(max_output_vertices=10_000)):
+        with pytest.raises(ResourceLimitError, match="lsystem"):
+            raw_lsystem(kind="custom", axiom="F", rules="F=FF", iters=20)
+    with pytest.raises(ValueError, match="大きすぎます"):
+        raw_lsystem(kind="custom", axiom="F", rules="F=FF", iters=40)
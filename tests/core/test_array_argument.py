@@ -0,0 +1,105 @@
+"""配列 Geometry 引数の内容 digest 署名と zero-copy 受け渡しを検証する。"""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+from grafix import G
+from grafix.core.array_argument import ArrayArgument
+from grafix.core.authoring_definitions import RegistrationTarget, registration_scope
+from grafix.core.geometry import Geometry
+from grafix.core.operation_authoring import primitive
+from grafix.core.realize import realize
+from grafix.core.realized_geometry import GeomTuple
+
+
+def _trace(count: int) -> np.ndarray:
+    t = np.linspace(0.0, 20.0, count)
+    return np.column_stack((t, np.sin(t)))
+
+
+def test_array_points_match_tuple_points_and_are_signed_by_content() -> None:
+    points = _trace(64)
+
+    from_array = G.polyline(points=points, closed=True)
+    from_tuple = G.polyline(points=tuple(map(tuple, points.tolist())), closed=True)
+
+    array_result = realize(from_array)
+    tuple_result = realize(from_tuple)
+    np.testing.assert_array_equal(array_result.coords, tuple_result.coords)
+    np.testing.assert_array_equal(array_result.offsets, tuple_result.offsets)
+
+    (argument,) = (value for name, value in from_array.args if name == "points")
+    assert type(argument) is ArrayArgument
+    assert repr(argument) == (
+        f"ArrayArgument(dtype='<f8', shape=(64, 2), digest={argument.digest!r})"
+    )
+    # 同じ内容の別配列は同じ id、dtype や 1 要素の違いは別 id になる。
+    assert G.polyline(points=points.copy(), closed=True).id == from_array.id
+    assert G.polyline(points=points.astype(np.float32), closed=True).id != from_array.id
+    changed = points.copy()
+    changed[10, 1] += 1e-9
+    assert G.polyline(points=changed, closed=True).id != from_array.id
+
+
+def test_array_argument_snapshots_caller_array_and_reaches_evaluator_zero_copy() -> None:
+    received: list[np.ndarray] = []
+    target = RegistrationTarget()
+    with registration_scope(target):
+
+        @primitive
+        def array_probe(*, samples: np.ndarray) -> GeomTuple:
+            received.append(samples)
+            return np.zeros((0, 3), dtype=np.float32), np.zeros(1, dtype=np.int32)
+
+    entry = target.snapshot().operations.resolve("primitive", "array_probe")
+    samples = _trace(8)
+    geometry = Geometry.create("array_probe", params={"samples": samples})
+    samples[:] = 0.0  # 作成後の caller 側変更は recipe に影響しない。
+
+    (argument,) = (value for _name, value in geometry.args)
+    entry.declaration.evaluator(geometry.args)
+
+    (seen,) = received
+    assert seen is argument.array
+    assert not seen.flags.writeable
+    with pytest.raises(ValueError):
+        seen.flags.writeable = True
+    np.testing.assert_array_equal(seen, _trace(8))
+    # bytes-backed の配列を再度渡しても copy し直さない。
+    assert ArrayArgument(argument.array).array is argument.array
+
+
+def test_geometry_pickle_carries_array_as_one_bytes_payload() -> None:
+    points = _trace(20_000)
+    geometry = G.polyline(points=points)
+
+    payload = pickle.dumps(geometry)
+    restored = pickle.loads(payload)
+
+    assert restored.id == geometry.id
+    # 点ごとの tuple ではなく、配列 bytes 1 つと小さな header だけを運ぶ。
+    assert len(payload) < points.nbytes + 4096
+    (argument,) = (value for name, value in restored.args if name == "points")
+    assert not argument.array.flags.writeable
+    np.testing.assert_array_equal(argument.array, points)
+
+
+@pytest.mark.parametrize(
+    ("value", "error"),
+    [
+        (np.array([[0.0, np.nan]]), ValueError),
+        (np.array([[0.0, 1.0]], dtype=np.float16), TypeError),
+    ],
+)
+def test_invalid_float_arrays_are_rejected(value: np.ndarray, error: type) -> None:
+    with pytest.raises(error, match="points"):
+        G.polyline(points=value)
+
+
+def test_arrays_are_only_accepted_as_top_level_argument_values() -> None:
+    with pytest.raises(TypeError):
+        Geometry.create("array-nesting", params={"value": (np.zeros(3),)})
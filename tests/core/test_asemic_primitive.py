@@ -156,6 +156,47 @@ def test_asemic_rng_adjacency_matches_small_reference() -> None:
     assert asemic_module._build_rng_adjacency(points) == expected
 
 
+def _brute_force_rng_adjacency(points: np.ndarray) -> list[set[int]]:
+    matrix = asemic_module._build_rng_adjacency_matrix(points)
+    return [set(np.flatnonzero(matrix[i]).tolist()) for i in range(len(points))]
+
+
+@pytest.mark.parametrize("n", [3, 40, 161, 400])
+@pytest.mark.parametrize("seed", range(6))
+def test_asemic_delaunay_rng_matches_brute_force(
+    n: int,
+    seed: int,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rng = np.random.default_rng(seed)
+    if seed % 2:
+        points = asemic_module._best_candidate_points(rng, n=n, candidates=10)
+    else:
+        points = rng.uniform(-0.5, 0.5, size=(n, 2))
+    monkeypatch.setattr(asemic_module, "_DELAUNAY_RNG_MIN_NODES", 3)
+
+    actual = asemic_module._build_rng_adjacency(points, use_numpy=False)
+    expected = _brute_force_rng_adjacency(points)
+
+    assert actual == expected
+    assert [list(item) for item in actual] == [list(item) for item in expected]
+
+
+def test_asemic_delaunay_rng_handles_ties_duplicates_and_collinear_points(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(asemic_module, "_DELAUNAY_RNG_MIN_NODES", 3)
+    lattice = np.stack(np.meshgrid(np.arange(12.0), np.arange(12.0)), axis=-1).reshape(-1, 2)
+    duplicated = np.concatenate([lattice, lattice[:5]])
+    collinear = np.stack([np.arange(20.0), np.arange(20.0) * 0.5], axis=1)
+
+    assert asemic_module._delaunay_edge_candidates(duplicated) is None
+    for points in (lattice, duplicated, collinear):
+        assert asemic_module._build_rng_adjacency(
+            points, use_numpy=False
+        ) == _brute_force_rng_adjacency(points)
+
+
 def test_asemic_glyph_cache_is_bounded_and_reused_across_layouts() -> None:
     asemic_module._generate_asemic_glyph.cache_clear()
 
@@ -0,0 +1,108 @@
+"""cancellation token の束縛と RealizeSession の取り消し契約を検証する。"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from grafix import E, G
+from grafix.core.cancellation import (
+    CancellationToken,
+    EvaluationCancelled,
+    cancellation_context,
+    check_cancelled,
+    current_cancellation_token,
+)
+from grafix.core.realize import RealizeSession
+from grafix.core.realized_geometry import RealizedGeometry
+
+
+def test_cancellation_context_binds_and_restores_token() -> None:
+    token = CancellationToken()
+
+    assert current_cancellation_token() is None
+    check_cancelled()
+    with cancellation_context(token):
+        assert current_cancellation_token() is token
+        check_cancelled()
+        token.cancel()
+        assert token.cancelled is True
+        with pytest.raises(EvaluationCancelled):
+            check_cancelled()
+        with cancellation_context(None):
+            check_cancelled()
+    assert current_cancellation_token() is None
+
+
+def test_cancellation_context_rejects_non_token() -> None:
+    with pytest.raises(TypeError, match="CancellationToken"):
+        with cancellation_context(threading.Event()):  # type: ignore[arg-type]
+            pass
+
+
+def test_cancelled_realize_is_not_wrapped_and_leaves_session_usable() -> None:
+    geometry = E.rotate(rotation=(0.0, 0.0, 30.0))(G.polygon(n_sides=8))
+    token = CancellationToken()
+    token.cancel()
+
+    with RealizeSession() as session:
+        with cancellation_context(token):
+            with pytest.raises(EvaluationCancelled) as exc_info:
+                session.realize(geometry)
+        assert exc_info.value.__cause__ is None
+        assert session.stats().entries == 0
+
+        realized = session.realize(geometry)
+
+    assert realized.coords.shape[0] > 0
+
+
+def test_waiter_takes_over_node_whose_owner_was_cancelled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import grafix.core.effects.reaction_diffusion as module
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def simulate(u0: np.ndarray, *_args: object, **_kwargs: object) -> np.ndarray:
+        started.set()
+        release.wait(timeout=10.0)
+        check_cancelled()
+        return np.zeros_like(u0)
+
+    monkeypatch.setattr(module, "_gray_scott_simulate_masked", simulate)
+    geometry = E.reaction_diffusion(grid_pitch=2.0, steps=10)(
+        G.polygon(n_sides=4, scale=20.0)
+    )
+    token = CancellationToken()
+    outcomes: dict[str, object] = {}
+
+    with RealizeSession() as session:
+
+        def owner() -> None:
+            with cancellation_context(token):
+                try:
+                    session.realize(geometry)
+                except EvaluationCancelled as error:
+                    outcomes["owner"] = error
+
+        def waiter() -> None:
+            outcomes["waiter"] = session.realize(geometry)
+
+        owner_thread = threading.Thread(target=owner)
+        owner_thread.start()
+        assert started.wait(timeout=10.0)
+        waiter_thread = threading.Thread(target=waiter)
+        waiter_thread.start()
+        time.sleep(0.05)
+        token.cancel()
+        release.set()
+        owner_thread.join(timeout=10.0)
+        waiter_thread.join(timeout=10.0)
+
+    assert isinstance(outcomes["owner"], EvaluationCancelled)
+    assert isinstance(outcomes["waiter"], RealizedGeometry)
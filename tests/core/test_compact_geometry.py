@@ -0,0 +1,91 @@
+"""RealizeCacheStore compact tier の可逆 encoding を検証する。"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from grafix.core.compact_geometry import compact_geometry
+from grafix.core.realized_geometry import RealizedGeometry
+
+
+def _geometry(coords: np.ndarray) -> RealizedGeometry:
+    count = int(coords.shape[0])
+    return RealizedGeometry(
+        coords=np.ascontiguousarray(coords, dtype=np.float32),
+        offsets=np.array([0, count // 2, count], dtype=np.int32),
+    )
+
+
+def _assert_bit_exact(decoded: RealizedGeometry, source: RealizedGeometry) -> None:
+    assert decoded.coords.tobytes() == source.coords.tobytes()
+    assert decoded.offsets is source.offsets
+    assert not decoded.coords.flags.writeable
+
+
+def test_grid_aligned_planar_geometry_is_quantized_to_two_uint16_columns() -> None:
+    rng = np.random.default_rng(3)
+    xy = rng.integers(-20_000, 20_000, size=(1_000, 2)) / 1_000.0
+    source = _geometry(np.column_stack([xy, np.full(1_000, 2.5)]))
+
+    compact = compact_geometry(source, decimals=3)
+
+    assert compact is not None
+    assert compact.encoding == "quantized"
+    assert compact.columns.dtype == np.uint16
+    assert compact.columns.shape == (1_000, 2)
+    assert compact.logical_byte_size == source.byte_size
+    assert compact.byte_size < source.byte_size * 0.4
+    _assert_bit_exact(compact.decode(), source)
+
+
+def test_grid_aligned_mm_canvas_curves_use_per_line_int16_deltas() -> None:
+    t = np.linspace(0.0, 2.0 * np.pi, 1_000)
+    ring = np.column_stack([148.0 + 50.0 * np.cos(t), 105.0 + 50.0 * np.sin(t)])
+    # 2 本目は 1 本目から紙の反対側へ飛び、間に空 line を挟む。
+    xy = np.round(np.concatenate([ring, ring[::-1] * 0.5 + 10.0]), 3) + 0.0
+    source = RealizedGeometry(
+        coords=np.column_stack([xy, np.zeros(2_000)]).astype(np.float32),
+        offsets=np.array([0, 1_000, 1_000, 2_000], dtype=np.int32),
+    )
+
+    compact = compact_geometry(source, decimals=3)
+
+    assert compact is not None
+    assert compact.encoding == "delta"
+    assert compact.columns.dtype == np.int16
+    assert compact.grid_base.shape == (3, 2)
+    assert source.byte_size / compact.byte_size > 2.5
+    _assert_bit_exact(compact.decode(), source)
+
+
+def test_off_grid_planar_geometry_keeps_exact_float_columns() -> None:
+    t = np.linspace(0.0, 2.0 * np.pi, 999)
+    source = _geometry(np.column_stack([np.cos(t) * 33.3, np.sin(t) * 33.3, np.zeros_like(t)]))
+
+    compact = compact_geometry(source, decimals=3)
+
+    assert compact is not None
+    assert compact.encoding == "planar"
+    assert compact.columns.dtype == np.float32
+    _assert_bit_exact(compact.decode(), source)
+
+
+def test_non_planar_off_grid_and_empty_geometry_are_not_compacted() -> None:
+    t = np.linspace(0.0, 1.0, 100)
+    spiral = _geometry(np.column_stack([np.cos(t), np.sin(t), t]))
+    signed_zero = _geometry(np.array([[0.0, 0.0, 0.0], [1.0, 1.0, -0.0]]))
+    empty = RealizedGeometry(
+        coords=np.empty((0, 3), dtype=np.float32),
+        offsets=np.zeros(1, dtype=np.int32),
+    )
+
+    assert compact_geometry(spiral, decimals=3) is None
+    assert compact_geometry(empty, decimals=3) is None
+    # z の 0.0 と -0.0 は bit が違うので planar とみなさない。
+    compact = compact_geometry(signed_zero, decimals=3)
+    assert compact is None or compact.encoding == "quantized"
+    if compact is not None:
+        _assert_bit_exact(compact.decode(), signed_zero)
+    with pytest.raises(ValueError, match="decimals"):
+        compact_geometry(spiral, decimals=-1)
@@ -0,0 +1,250 @@
+"""definition fingerprint の on-disk cache と無効化を検証する。"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import grafix.core.definition_fingerprint as definition_fingerprint
+from grafix.core.authoring_loader import load_config_authoring_definitions
+from grafix.core.builtins import builtin_operation_catalog
+from grafix.core.definition_fingerprint import (
+    fingerprint_evaluation_spec,
+    fingerprint_parameter_schema,
+)
+from grafix.core.fingerprint_cache import (
+    FingerprintCache,
+    FingerprintCacheEntry,
+    current_fingerprint_cache,
+    default_fingerprint_cache_directory,
+    fingerprint_cache_context,
+)
+from grafix.core.operation_schema import ParameterOpSchema
+from grafix.core.parameters.meta import ParamMeta
+from grafix.core.runtime_config import load_runtime_config
+
+_DIGEST = "0" * 64
+
+
+def _entry_count(cache: FingerprintCache) -> int:
+    return sum(1 for _ in cache.directory.rglob("*.json"))
+
+
+def _import_fresh(monkeypatch: pytest.MonkeyPatch, name: str) -> Any:
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    module = importlib.import_module(name)
+    monkeypatch.setitem(sys.modules, name, module)
+    return module
+
+
+def _forbid_encoding(monkeypatch: pytest.MonkeyPatch) -> None:
+    def encode(*_args: object, **_kwargs: object) -> bytes:
+        raise AssertionError("cache hit のはずが fingerprint を再計算しました")
+
+    monkeypatch.setattr(definition_fingerprint._CanonicalEncoder, "encode", encode)
+
+
+def test_store_load_round_trip_and_unreadable_entries_miss(tmp_path: Path) -> None:
+    cache = FingerprintCache(tmp_path)
+    key = "ab" + "1" * 62
+    entry = FingerprintCacheEntry(
+        digest=_DIGEST,
+        dependencies=(("pkg.mod", "f" * 64),),
+        global_values=(("pkg.mod", "SCALE", "e" * 64),),
+    )
+
+    assert cache.load(key) is None
+    cache.store(key, entry)
+    assert cache.load(key) == entry
+
+    path = tmp_path / "ab" / f"{'1' * 62}.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert cache.load(key) is None
+    path.write_text('{"format": 1, "digest": "short", "dependencies": []}', encoding="utf-8")
+    assert cache.load(key) is None
+    with pytest.raises(ValueError, match="key"):
+        cache.load("not-a-digest")
+
+
+def test_cache_directory_follows_environment(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("GRAFIX_FINGERPRINT_CACHE_DIR", str(tmp_path / "explicit"))
+    assert default_fingerprint_cache_directory() == tmp_path / "explicit"
+    monkeypatch.setenv("GRAFIX_FINGERPRINT_CACHE_DIR", "")
+    assert default_fingerprint_cache_directory() is None
+    monkeypatch.delenv("GRAFIX_FINGERPRINT_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert default_fingerprint_cache_directory() == tmp_path / "xdg" / "grafix" / "fingerprints"
+
+    with fingerprint_cache_context(None):
+        assert current_fingerprint_cache() is None
+    with pytest.raises(TypeError, match="FingerprintCache"):
+        with fingerprint_cache_context(tmp_path):  # type: ignore[arg-type]
+            pass
+
+
+def test_module_definition_is_reused_and_invalidated_by_helper_content(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    package = tmp_path / "src"
+    package.mkdir()
+    helper_path = package / "fp_cache_helper.py"
+    helper_path.write_text("def scale(value):\n    return value * 2\n", encoding="utf-8")
+    (package / "fp_cache_operation.py").write_text(
+        "from fp_cache_helper import scale\n"
+        "\n"
+        "def evaluate(value=3):\n"
+        "    return scale(value)\n"
+        "\n"
+        "def visible_when_positive(values):\n"
+        "    return values['value'] > 0\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(package))
+    _import_fresh(monkeypatch, "fp_cache_helper")
+    operation = _import_fresh(monkeypatch, "fp_cache_operation")
+    schema = ParameterOpSchema(
+        meta={"value": ParamMeta(kind="int", ui_min=0, ui_max=10)},
+        defaults={"value": 3},
+        param_order=("value",),
+        ui_visible={"value": lambda values: operation.visible_when_positive(values)},
+    )
+    cache = FingerprintCache(tmp_path / "cache")
+
+    with fingerprint_cache_context(cache):
+        evaluation = fingerprint_evaluation_spec(operation.evaluate)
+        schema_fingerprint = fingerprint_parameter_schema(schema)
+    assert _entry_count(cache) == 2
+
+    with monkeypatch.context() as patch, fingerprint_cache_context(cache):
+        _forbid_encoding(patch)
+        assert fingerprint_evaluation_spec(operation.evaluate) == evaluation
+        assert fingerprint_parameter_schema(schema) == schema_fingerprint
+
+    helper_path.write_text("def scale(value):\n    return value * 20\n", encoding="utf-8")
+    with fingerprint_cache_context(cache):
+        changed = fingerprint_evaluation_spec(operation.evaluate)
+    with fingerprint_cache_context(None):
+        uncached = fingerprint_evaluation_spec(operation.evaluate)
+    assert changed != evaluation
+    assert changed == uncached
+
+
+def test_module_global_reassigned_after_import_invalidates_entry(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    package = tmp_path / "src"
+    package.mkdir()
+    (package / "fp_cache_global_operation.py").write_text(
+        "FACTOR = 2\n"
+        "OFFSETS = [1]\n"
+        "\n"
+        "def evaluate(value=3):\n"
+        "    return value * FACTOR\n"
+        "\n"
+        "def evaluate_offset(value=3):\n"
+        "    return value + OFFSETS[0]\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(package))
+    operation = _import_fresh(monkeypatch, "fp_cache_global_operation")
+    cache = FingerprintCache(tmp_path / "cache")
+
+    with fingerprint_cache_context(cache):
+        original = fingerprint_evaluation_spec(operation.evaluate)
+    assert _entry_count(cache) == 1
+
+    monkeypatch.setattr(operation, "FACTOR", 20)
+    with fingerprint_cache_context(cache):
+        changed = fingerprint_evaluation_spec(operation.evaluate)
+    with fingerprint_cache_context(None):
+        uncached = fingerprint_evaluation_spec(operation.evaluate)
+    assert changed != original
+    assert changed == uncached
+
+    # 中身を書き換えられる global を参照する定義は値で照合できないため保存しない。
+    entries_before = _entry_count(cache)
+    with fingerprint_cache_context(cache):
+        fingerprint_evaluation_spec(operation.evaluate_offset)
+    assert _entry_count(cache) == entries_before
+
+
+def test_definitions_without_module_identity_are_not_stored(tmp_path: Path) -> None:
+    namespace: dict[str, Any] = {"__name__": "fp_cache_unregistered"}
+    exec(compile("def evaluate(value):\n    return value + 1\n", "x.py", "exec"), namespace)
+    cache = FingerprintCache(tmp_path)
+
+    with fingerprint_cache_context(cache):
+        first = fingerprint_evaluation_spec(namespace["evaluate"])
+    with fingerprint_cache_context(None):
+        second = fingerprint_evaluation_spec(namespace["evaluate"])
+
+    assert first == second
+    assert _entry_count(cache) == 0
+
+
+def test_unchanged_candidate_module_reuses_entries_after_sibling_edit(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root = tmp_path / "operations"
+    root.mkdir()
+    (root / "stable.py").write_text(
+        "from grafix.api import primitive\n"
+        "@primitive(meta={})\n"
+        "def fp_cache_stable_primitive():\n"
+        "    return ((), ())\n",
+        encoding="utf-8",
+    )
+    edited = root / "edited.py"
+    edited.write_text(
+        "from grafix.api import primitive\n"
+        "@primitive(meta={})\n"
+        "def fp_cache_edited_primitive():\n"
+        "    return ((), ())\n",
+        encoding="utf-8",
+    )
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "version: 1\n"
+        "paths:\n"
+        '  output_dir: "output"\n'
+        "  preset_module_dirs:\n"
+        f'    - "{root.as_posix()}"\n',
+        encoding="utf-8",
+    )
+    config = load_runtime_config(config_path)
+    cache = FingerprintCache(tmp_path / "cache")
+    builtin_operation_catalog()
+    stored: list[str] = []
+    original_store = FingerprintCache.store
+
+    def store(self: FingerprintCache, key: str, entry: FingerprintCacheEntry) -> None:
+        stored.append(key)
+        original_store(self, key, entry)
+
+    monkeypatch.setattr(FingerprintCache, "store", store)
+
+    with fingerprint_cache_context(cache):
+        first = load_config_authoring_definitions(config)
+    first_stores = len(stored)
+    assert first_stores > 0
+
+    edited.write_text(edited.read_text(encoding="utf-8") + "# edited\n", encoding="utf-8")
+    with fingerprint_cache_context(cache):
+        second = load_config_authoring_definitions(config)
+
+    # 編集した module の evaluator だけを再計算し、stable.py と共通 schema は再利用する。
+    assert len(stored) == first_stores + 1
+    first_entry = first.operations.resolve("primitive", "fp_cache_stable_primitive")
+    second_entry = second.operations.resolve("primitive", "fp_cache_stable_primitive")
+    assert first_entry.evaluation_fingerprint == second_entry.evaluation_fingerprint
+    assert first_entry.schema_fingerprint == second_entry.schema_fingerprint
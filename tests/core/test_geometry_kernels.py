@@ -3,6 +3,8 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
+from grafix import E, G
+from grafix.core.geometry import Geometry
 from grafix.core.geometry_kernels.grid import plan_grid_from_bbox
 from grafix.core.geometry_kernels.marching import marching_squares_loops
 from grafix.core.geometry_kernels.packed import (
@@ -12,11 +14,15 @@ from grafix.core.geometry_kernels.packed import (
 from grafix.core.geometry_kernels.planar import (
     PlanarFrame,
     PlanarRing,
+    SharedFrameStats,
     canonical_planar_frame,
     close_curve,
     extract_planar_rings,
     pack_planar_rings,
     planarity_threshold,
+    shared_frame_stats,
+    shared_local_coords,
+    shared_planar_frame,
 )
 from grafix.core.geometry_kernels.raster import (
     rasterize_ring_boundary_mask,
@@ -28,6 +34,10 @@ from grafix.core.geometry_kernels.resample import (
     ResamplePlan,
     resample_polylines,
 )
+from grafix.core.instanced_geometry import InstancedGeometry
+from grafix.core.realize import CacheStats, RealizeSession, realize
+from grafix.core.realized_geometry import RealizedGeometry
+from grafix.core.runtime_limits import RuntimeLimits
 
 
 def _two_open_lines() -> tuple[np.ndarray, np.ndarray]:
@@ -697,6 +707,99 @@ def test_planar_frame_clean_packed_many_short_lines_matches_cleaning_fallback(
     np.testing.assert_array_equal(actual.inverse, expected.inverse)
 
 
+def test_shared_planar_frame_reuses_frame_and_local_coords_per_snapshot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import grafix.core.geometry_kernels.planar as module
+
+    t = np.linspace(0.0, 2.0 * np.pi, 65)
+    ring = np.column_stack([np.cos(t), np.sin(t), 0.5 * np.cos(t)]).astype(np.float32)
+    geometry = RealizedGeometry(coords=ring, offsets=np.asarray([0, 65], dtype=np.int32))
+    calls = 0
+    original = module.PlanarFrame.from_points
+
+    def counting_from_points(*args: object, **kwargs: object) -> PlanarFrame:
+        nonlocal calls
+        calls += 1
+        return original(*args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(module.PlanarFrame, "from_points", counting_from_points)
+    module._shared_frames.clear()
+
+    frame = shared_planar_frame(geometry.coords, geometry.offsets)
+    local = shared_local_coords(frame, geometry.coords)
+    assert shared_planar_frame(geometry.coords, geometry.offsets) is frame
+    assert shared_local_coords(frame, geometry.coords) is local
+    assert calls == 1
+    assert not local.flags.writeable
+    np.testing.assert_array_equal(local, original(ring, geometry.offsets).to_local(ring))
+
+    # canonical 版は別 entry になり、from_points の結果は変えない。
+    canonical = shared_planar_frame(geometry.coords, geometry.offsets, canonical=True)
+    np.testing.assert_array_equal(
+        canonical.basis,
+        canonical_planar_frame(ring, geometry.offsets).basis,
+    )
+    assert shared_planar_frame(geometry.coords, geometry.offsets) is frame
+
+
+def test_shared_planar_frame_does_not_memo_mutable_arrays() -> None:
+    ring = np.asarray(
+        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 0.0, 0.0]],
+        dtype=np.float32,
+    )
+    offsets = np.asarray([0, 4], dtype=np.int32)
+
+    first = shared_planar_frame(ring, offsets)
+    ring[:, 2] = ring[:, 0]  # 同じ配列を書き換えても古い frame は返らない。
+    second = shared_planar_frame(ring, offsets)
+
+    assert second is not first
+    assert not np.array_equal(second.normal, first.normal)
+    with pytest.raises(ValueError, match="allow_linear"):
+        shared_planar_frame(ring, offsets, allow_linear=True)
+
+
+def _realize_fill_twice(
+    source: Geometry,
+    limits: RuntimeLimits,
+) -> tuple[SharedFrameStats, SharedFrameStats, CacheStats]:
+    import grafix.core.geometry_kernels.planar as module
+
+    module._shared_frames.clear()
+    with RealizeSession(runtime_limits=limits) as session:
+        session.realize(E.fill(density=10.0)(source))
+        first = shared_frame_stats()
+        # 入力は cache hit だが、compact 展開や instanced 展開で配列 identity は変わる。
+        session.realize(E.fill(density=12.0)(source))
+        second = shared_frame_stats()
+        stats = session.stats()
+    return first, second, stats
+
+
+def test_shared_planar_frame_hits_for_compact_tier_inputs() -> None:
+    source = G.polygon(n_sides=64, scale=20.0)
+
+    first, second, stats = _realize_fill_twice(
+        source,
+        RuntimeLimits(cpu_cache_compact=True),
+    )
+
+    assert stats.compact_entries >= 1
+    assert second.misses == first.misses
+    assert second.hits >= first.hits + 2
+
+
+def test_shared_planar_frame_hits_for_instanced_inputs() -> None:
+    source = E.repeat(count=5, offset=(30.0, 0.0, 0.0))(G.polygon(n_sides=64, scale=10.0))
+    assert type(realize(source)) is InstancedGeometry
+
+    first, second, _ = _realize_fill_twice(source, RuntimeLimits())
+
+    assert second.misses == first.misses
+    assert second.hits >= first.hits + 2
+
+
 def _pack_test_rings(
     rings: list[np.ndarray],
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
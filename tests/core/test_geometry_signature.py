@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import gc
+import pickle
+import weakref
 from enum import Enum, IntEnum
 from itertools import combinations
 from math import copysign
 from types import MappingProxyType
 from typing import Any
 
+import numpy as np
 import pytest
 
+import grafix.core.geometry as geometry_module
 from grafix.core.geometry import Geometry, _restore_geometry_dag
 
 
@@ -229,3 +234,86 @@ def test_pickle_restore_rejects_unknown_input_and_root_ids() -> None:
 
     with pytest.raises(ValueError, match="root id"):
         _restore_geometry_dag(records, "missing-root")  # type: ignore[arg-type]
+
+
+def test_live_identical_recipe_is_interned_without_recomputing_id(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+    compute = geometry_module.compute_geometry_id
+
+    def counting_compute(*args: Any, **kwargs: Any) -> str:
+        calls.append(kwargs["op"])
+        return compute(*args, **kwargs)
+
+    monkeypatch.setattr(geometry_module, "compute_geometry_id", counting_compute)
+    base = Geometry.create("intern-base", params={"value": 1, "vector": (1.0, 2.0)})
+    effect = Geometry.create("intern-effect", inputs=(base,), params={"amount": 0.5})
+    calls.clear()
+
+    rebuilt_base = Geometry.create(
+        "intern-base",
+        params={"vector": [1.0, 2.0], "value": 1},
+    )
+    rebuilt_effect = Geometry.create(
+        "intern-effect",
+        inputs=(rebuilt_base,),
+        params={"amount": 0.5},
+    )
+
+    assert rebuilt_base is base
+    assert rebuilt_effect is effect
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        (True, 1, 1.0),
+        ((1,), (1.0,), (True,)),
+        ("1", 1),
+    ],
+)
+def test_interning_keeps_numerically_equal_types_apart(values: tuple[Any, ...]) -> None:
+    geometries = tuple(_geometry(value) for value in values)
+
+    for geometry, value in zip(geometries, values, strict=True):
+        assert _typed_equal(geometry.args, (("value", value),))
+        assert _geometry(value) is geometry
+    assert len({geometry.id for geometry in geometries}) == len(values)
+
+
+def test_interning_releases_unreferenced_nodes() -> None:
+    geometry = _geometry("released")
+    geometry_id = geometry.id
+    released = weakref.ref(geometry)
+
+    del geometry
+    gc.collect()
+
+    assert released() is None
+    assert all(
+        node.id != geometry_id
+        for node in list(geometry_module._INTERNED_GEOMETRIES.values())
+    )
+    assert _geometry("released").id == geometry_id
+
+
+def test_interning_shares_array_arguments_by_content_digest() -> None:
+    first = Geometry.create("intern-array", params={"points": np.arange(6.0)})
+    second = Geometry.create("intern-array", params={"points": np.arange(6.0)})
+    digest_text = Geometry.create(
+        "intern-array",
+        params={"points": dict(first.args)["points"].digest},
+    )
+
+    assert second is first
+    assert digest_text is not first
+    assert digest_text.id != first.id
+
+
+def test_pickle_restore_returns_live_interned_node() -> None:
+    base = Geometry.create("pickle-intern", params={"value": 1})
+    geometry = Geometry.create("pickle-intern-effect", inputs=(base,))
+
+    assert pickle.loads(pickle.dumps(geometry)) is geometry
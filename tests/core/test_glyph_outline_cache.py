@@ -0,0 +1,159 @@
+"""平坦化済み glyph 輪郭の on-disk cache を検証する。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from grafix.core.font_resources import FontResources, TextRenderer
+from grafix.core.glyph_outline_cache import (
+    CONTOUR_CLOSED,
+    CONTOUR_ENDED,
+    GlyphOutline,
+    GlyphOutlineCache,
+    current_glyph_outline_cache,
+    default_glyph_outline_cache_directory,
+    glyph_outline_cache_context,
+)
+from grafix.core.primitives._text_flatten import flatten_recording
+from grafix.core.runtime_config import load_runtime_config
+
+_KEY = "cd" + "2" * 62
+
+
+def _outline() -> GlyphOutline:
+    return GlyphOutline(
+        coords=np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 0.0], [5.0, 5.0]]),
+        contour_offsets=np.array([0, 3, 4]),
+        contour_closures=np.array([CONTOUR_CLOSED, CONTOUR_ENDED]),
+    )
+
+
+def _glyph_polylines(renderer: TextRenderer, lease, text: str) -> list[np.ndarray]:
+    font = renderer.get_font(lease)
+    cmap = font.getBestCmap()
+    polylines: list[np.ndarray] = []
+    for char in text:
+        polylines.extend(
+            renderer.get_glyph_polylines(
+                char=char,
+                lease=lease,
+                flat_seg_len_units=12.0,
+                tt_font=font,
+                cmap=cmap,
+            )
+        )
+    return polylines
+
+
+def test_store_load_round_trip_and_unreadable_entries_miss(tmp_path: Path) -> None:
+    cache = GlyphOutlineCache(tmp_path)
+    outline = _outline()
+
+    assert cache.load(_KEY) is None
+    cache.store(_KEY, outline)
+    loaded = cache.load(_KEY)
+    assert loaded is not None
+    assert np.array_equal(loaded.coords, outline.coords)
+    assert np.array_equal(loaded.contour_offsets, outline.contour_offsets)
+    assert np.array_equal(loaded.contour_closures, outline.contour_closures)
+    assert not loaded.coords.flags.writeable
+
+    path = tmp_path / "cd" / f"{'2' * 62}.outline"
+    payload = path.read_bytes()
+    path.write_bytes(payload[:-1])
+    assert cache.load(_KEY) is None
+    broken = bytearray(payload)
+    broken[-1] = 7
+    path.write_bytes(bytes(broken))
+    assert cache.load(_KEY) is None
+    with pytest.raises(ValueError, match="key"):
+        cache.load("not-a-digest")
+    with pytest.raises(ValueError, match="contour_offsets"):
+        GlyphOutline(
+            coords=np.zeros((2, 2)),
+            contour_offsets=np.array([0, 3]),
+            contour_closures=np.array([CONTOUR_CLOSED]),
+        )
+
+
+def test_cache_directory_follows_environment(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("GRAFIX_GLYPH_CACHE_DIR", str(tmp_path / "explicit"))
+    assert default_glyph_outline_cache_directory() == tmp_path / "explicit"
+    monkeypatch.setenv("GRAFIX_GLYPH_CACHE_DIR", "")
+    assert default_glyph_outline_cache_directory() is None
+    monkeypatch.delenv("GRAFIX_GLYPH_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert default_glyph_outline_cache_directory() == tmp_path / "xdg" / "grafix" / "glyphs"
+
+    with glyph_outline_cache_context(None):
+        assert current_glyph_outline_cache() is None
+    with pytest.raises(TypeError, match="GlyphOutlineCache"):
+        with glyph_outline_cache_context(tmp_path):  # type: ignore[arg-type]
+            pass
+
+
+def test_new_session_reuses_stored_glyphs_without_flattening(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = GlyphOutlineCache(tmp_path)
+    config = load_runtime_config()
+    text = "Agé高"
+
+    with glyph_outline_cache_context(None), FontResources() as resources:
+        lease = resources.resolve("GoogleSans-Regular.ttf", 0, config=config)
+        uncached = _glyph_polylines(lease.renderer, lease, text)
+    with glyph_outline_cache_context(cache), FontResources() as resources:
+        lease = resources.resolve("GoogleSans-Regular.ttf", 0, config=config)
+        first = _glyph_polylines(lease.renderer, lease, text)
+    # cmap に無い文字は保存しない。
+    assert sum(1 for _ in tmp_path.rglob("*.outline")) == 3
+
+    def flatten(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("cache hit のはずが glyph を平坦化しました")
+
+    monkeypatch.setattr(TextRenderer, "_flatten_glyph", staticmethod(flatten))
+    with glyph_outline_cache_context(cache), FontResources() as resources:
+        lease = resources.resolve("GoogleSans-Regular.ttf", 0, config=config)
+        second = _glyph_polylines(lease.renderer, lease, text)
+        assert lease.renderer.stats().glyph_commands == len(text)
+
+    for expected in (first, second):
+        assert len(expected) == len(uncached)
+        for left, right in zip(expected, uncached, strict=True):
+            assert left.dtype == right.dtype == np.float32
+            assert np.array_equal(left, right)
+            assert not left.flags.writeable
+
+
+def test_flattening_keeps_degenerate_segments_and_open_contours() -> None:
+    from fontTools.pens.recordingPen import RecordingPen
+
+    recording = RecordingPen()
+    recording.moveTo((0, 0))
+    recording.lineTo((0, 0))
+    recording.curveTo((0, 0), (8, 0), (8, 0))
+    recording.qCurveTo((8, 0), (8, 8))
+    recording.endPath()
+    recording.moveTo((1.5, 1.5))
+    recording.curveTo((1.5, 5.5), (5.5, 5.5), (5.5, 1.5))
+
+    commands = flatten_recording(recording, approximate_segment_length=4)
+
+    assert commands == (
+        ("moveTo", ((0.0, 0.0),)),
+        ("lineTo", ((4.0, 0.0),)),
+        ("lineTo", ((8.0, 0.0),)),
+        ("lineTo", ((8.0, 4.0),)),
+        ("lineTo", ((8.0, 8.0),)),
+        ("endPath", ()),
+        ("moveTo", ((1.5, 1.5),)),
+        ("lineTo", ((3.5, 4.5),)),
+        ("lineTo", ((5.5, 1.5),)),
+    )
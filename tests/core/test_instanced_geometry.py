@@ -0,0 +1,186 @@
+"""repeat / 放射 mirror の InstancedGeometry 表現を検証する。"""
+
+from __future__ import annotations
+
+import importlib
+import pickle
+
+import numpy as np
+import pytest
+
+from grafix import E, G
+from grafix.core.effects.mirror import mirror as mirror_raw
+from grafix.core.effects.repeat import repeat as repeat_raw
+from grafix.core.instanced_geometry import InstancedGeometry, instanced_geometry
+from grafix.core.realize import RealizeCacheStore, RealizeSession, realize
+from grafix.core.realized_geometry import RealizedGeometry
+from grafix.core.runtime_limits import RuntimeLimits
+
+instanced_module = importlib.import_module("grafix.core.instanced_geometry")
+
+
+def _source_tuple(geometry: RealizedGeometry) -> tuple[np.ndarray, np.ndarray]:
+    return np.array(geometry.coords), np.array(geometry.offsets)
+
+
+def test_repeat_realizes_to_compact_instances_matching_raw_effect() -> None:
+    source = G.polygon(n_sides=128, scale=10.0)
+    params = {
+        "count": 99,
+        "offset": (3.0, 1.0, 0.0),
+        "rotation_step": (0.0, 0.0, 7.0),
+        "scale": (0.5, 0.5, 1.0),
+        "cumulative_rotate": True,
+    }
+
+    result = realize(E.repeat(**params)(source))
+
+    assert type(result) is InstancedGeometry
+    assert result.instance_count == 100
+    assert result.vertex_count == 129 * 100
+    assert result.line_count == 100
+    expected_coords, expected_offsets = repeat_raw(
+        _source_tuple(realize(source)),
+        **params,
+    )
+    np.testing.assert_allclose(result.coords, expected_coords, rtol=0, atol=1e-4)
+    np.testing.assert_array_equal(result.offsets, expected_offsets)
+    assert result.byte_size < expected_coords.nbytes // 5
+
+
+def test_instanced_cache_entry_accounts_base_and_transforms_only() -> None:
+    limits = RuntimeLimits()
+    store = RealizeCacheStore.from_runtime_limits(limits)
+    geometry = E.repeat(count=499, offset=(1.0, 0.0, 0.0))(G.polygon(n_sides=64))
+    try:
+        with RealizeSession(cache_store=store, runtime_limits=limits) as session:
+            result = session.realize(geometry)
+            _ = result.coords  # 展開しても cache 上の占有量は増えない。
+            assert session.realize(geometry) is result
+        stats = store.stats()
+    finally:
+        store.close()
+
+    assert type(result) is InstancedGeometry
+    assert stats.bytes < 65 * 500 * 12
+    assert result.byte_size == result.base.byte_size + 500 * 16 * 8
+
+
+def test_instanced_geometry_pickles_without_expanding() -> None:
+    result = realize(
+        E.repeat(count=999, offset=(1.0, 0.0, 0.0))(G.polygon(n_sides=128))
+    )
+    assert type(result) is InstancedGeometry
+
+    payload = pickle.dumps(result)
+    restored = pickle.loads(payload)
+
+    assert type(restored) is InstancedGeometry
+    assert len(payload) < result.vertex_count * 12 // 5
+    np.testing.assert_array_equal(restored.coords, result.coords)
+    np.testing.assert_array_equal(restored.offsets, result.offsets)
+
+
+def test_downstream_effect_sees_flat_expanded_geometry() -> None:
+    repeated = E.repeat(count=3, offset=(10.0, 0.0, 0.0))(G.polygon())
+
+    instanced = realize(repeated)
+    moved = realize(E.translate(delta=(0.0, 5.0, 0.0))(repeated))
+
+    assert type(moved) is RealizedGeometry
+    np.testing.assert_allclose(
+        moved.coords,
+        instanced.coords + np.array([0.0, 5.0, 0.0], dtype=np.float32),
+        rtol=0,
+        atol=1e-5,
+    )
+    np.testing.assert_array_equal(moved.offsets, instanced.offsets)
+
+
+def test_realize_expands_instanced_input_once_per_evaluation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    expand = instanced_module._expand_coords_instance_major
+    calls = 0
+
+    def counting_expand(*args: object) -> None:
+        nonlocal calls
+        calls += 1
+        expand(*args)
+
+    monkeypatch.setattr(instanced_module, "_expand_coords_instance_major", counting_expand)
+    repeated = E.repeat(count=4, offset=(12.0, 0.0, 0.0))(G.polygon(n_sides=6, scale=10.0))
+    filled = E.fill(density=10.0)(repeated)
+    scene = filled + E.fill(density=10.0, angle=0.0)(repeated) + repeated
+
+    with RealizeSession() as session:
+        assert type(session.realize(repeated)) is InstancedGeometry
+        calls = 0
+        result = session.realize(scene)
+
+    assert calls == 1
+    assert result.vertex_count > realize(repeated).vertex_count
+
+
+def test_repeat_of_repeat_composes_into_single_base() -> None:
+    tile = E.repeat(count=9, offset=(10.0, 0.0, 0.0))(G.polygon(n_sides=8))
+    grid = E.repeat(count=9, offset=(0.0, 10.0, 0.0))(tile)
+
+    result = realize(grid)
+
+    assert type(result) is InstancedGeometry
+    assert result.instance_count == 100
+    assert result.base.vertex_count == 9
+    inner = realize(tile)
+    expected_coords, expected_offsets = repeat_raw(
+        _source_tuple(inner),
+        count=9,
+        offset=(0.0, 10.0, 0.0),
+    )
+    np.testing.assert_allclose(result.coords, expected_coords, rtol=0, atol=1e-4)
+    np.testing.assert_array_equal(result.offsets, expected_offsets)
+
+
+def test_radial_mirror_is_instanced_and_matches_raw_effect() -> None:
+    source = G.polygon(n_sides=5, center=(20.0, 6.0, 0.0), scale=8.0)
+    params = {"n_mirror": 6, "cx": 1.0, "cy": -2.0}
+
+    result = realize(E.mirror(**params)(source))
+
+    assert type(result) is InstancedGeometry
+    assert result.instance_count == 12
+    expected_coords, expected_offsets = mirror_raw(
+        _source_tuple(realize(source)),
+        **params,
+    )
+    np.testing.assert_allclose(result.coords, expected_coords, rtol=0, atol=1e-4)
+    np.testing.assert_array_equal(result.offsets, expected_offsets)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"n_mirror": 1},
+        {"n_mirror": 2},
+        {"n_mirror": 6, "show_planes": True},
+    ],
+)
+def test_deduplicating_mirror_modes_stay_flat(params: dict[str, object]) -> None:
+    source = G.polygon(n_sides=5, center=(20.0, 6.0, 0.0), scale=8.0)
+
+    result = realize(E.mirror(**params)(source))
+
+    assert type(result) is RealizedGeometry
+
+
+def test_instanced_geometry_rejects_non_affine_transforms() -> None:
+    base = realize(G.polygon())
+    transforms = np.tile(np.eye(4), (2, 1, 1))
+    transforms[1, 3, 0] = 1.0
+
+    with pytest.raises(ValueError, match="最終行"):
+        instanced_geometry(base, transforms)
+    with pytest.raises(TypeError, match="float64"):
+        instanced_geometry(base, np.eye(4, dtype=np.float32)[None])
+    with pytest.raises(TypeError, match="instanced_geometry"):
+        InstancedGeometry()
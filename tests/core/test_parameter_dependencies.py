@@ -0,0 +1,121 @@
+"""ParameterKey → dirty Geometry node の依存追跡を検証する。"""
+
+from __future__ import annotations
+
+import pytest
+
+from grafix import E, G
+from grafix.core.geometry import Geometry
+from grafix.core.parameter_dependencies import (
+    ParameterDependencyGraph,
+    ParameterEditPrediction,
+)
+from grafix.core.parameters import (
+    FrameGeometrySiteRecord,
+    ParameterKey,
+    ParamStore,
+    current_frame_params,
+)
+from grafix.core.parameters.context import parameter_context
+from grafix.core.realize import RealizeSession
+
+
+def _record_scene() -> tuple[dict[str, Geometry], tuple[FrameGeometrySiteRecord, ...]]:
+    with parameter_context(store=ParamStore(), cc_snapshot=None):
+        left = G.polygon(n_sides=5, key="dep-left")
+        right = G.polygon(n_sides=7, key="dep-right")
+        moved = E.translate(delta=(1.0, 0.0, 0.0), key="dep-move")(left)
+        scaled = E.scale(scale=(2.0, 2.0, 1.0), key="dep-scale")(moved)
+        frame_params = current_frame_params()
+        assert frame_params is not None
+        sites = tuple(frame_params.geometry_sites)
+    nodes = {"left": left, "right": right, "moved": moved, "scaled": scaled}
+    return nodes, sites
+
+
+def _key_for(
+    sites: tuple[FrameGeometrySiteRecord, ...],
+    geometry: Geometry,
+    arg: str,
+) -> ParameterKey:
+    (record,) = [item for item in sites if item.geometry_id == geometry.id]
+    return ParameterKey(op=record.op, site_id=record.site_id, arg=arg)
+
+
+def test_api_calls_record_the_node_built_for_each_site() -> None:
+    nodes, sites = _record_scene()
+
+    recorded = {record.geometry_id for record in sites}
+
+    assert recorded == {geometry.id for geometry in nodes.values()}
+
+
+def test_dirty_nodes_are_the_ancestors_of_the_edited_site_only() -> None:
+    nodes, sites = _record_scene()
+    scene = Geometry.create("concat", inputs=(nodes["scaled"], nodes["right"]))
+    graph = ParameterDependencyGraph((scene,), sites)
+
+    left_dirty = graph.dirty_nodes(_key_for(sites, nodes["left"], "n_sides"))
+    move_dirty = graph.dirty_nodes(_key_for(sites, nodes["moved"], "delta"))
+
+    assert left_dirty == {
+        nodes["left"].id,
+        nodes["moved"].id,
+        nodes["scaled"].id,
+        scene.id,
+    }
+    assert move_dirty == {nodes["moved"].id, nodes["scaled"].id, scene.id}
+    assert nodes["right"].id not in left_dirty
+    assert graph.node_count == 5
+    assert graph.dirty_nodes(ParameterKey(op="polygon", site_id="none", arg="x")) == (
+        frozenset()
+    )
+
+
+def test_nodes_outside_the_scene_are_ignored() -> None:
+    nodes, sites = _record_scene()
+    graph = ParameterDependencyGraph((nodes["right"],), sites)
+
+    assert graph.dirty_nodes(_key_for(sites, nodes["left"], "n_sides")) == frozenset()
+
+
+def test_predict_sums_measured_costs_and_names_dominant_op() -> None:
+    nodes, sites = _record_scene()
+    graph = ParameterDependencyGraph((nodes["scaled"], nodes["right"]), sites)
+    costs = {nodes["left"].id: 30, nodes["moved"].id: 50}
+
+    prediction = graph.predict(
+        _key_for(sites, nodes["left"], "n_sides"),
+        costs.get,
+    )
+
+    assert prediction == ParameterEditPrediction(
+        nodes=3,
+        measured_nodes=2,
+        predicted_ns=80,
+        dominant_op="translate",
+    )
+
+
+def test_prediction_rejects_inconsistent_counts() -> None:
+    with pytest.raises(ValueError, match="measured_nodes"):
+        ParameterEditPrediction(
+            nodes=1,
+            measured_nodes=2,
+            predicted_ns=0,
+            dominant_op=None,
+        )
+
+
+def test_realize_session_records_exclusive_node_cost() -> None:
+    base = G.polygon(n_sides=6)
+    moved = E.translate(delta=(0.0, 1.0, 0.0))(base)
+
+    with RealizeSession() as session:
+        assert session.node_cost_ns(moved.id) is None
+        session.realize(moved)
+        base_cost = session.node_cost_ns(base.id)
+        moved_cost = session.node_cost_ns(moved.id)
+
+    assert base_cost is not None and base_cost > 0
+    assert moved_cost is not None and moved_cost > 0
@@ -20,7 +20,7 @@ from grafix.core.parameters.layer_style import (
     layer_style_key,
 )
 from grafix.core.parameters.ui_ops import update_state_from_ui
-from grafix.core.pipeline import realize_scene
+from grafix.core.pipeline import iter_realize_scene, realize_scene
 from grafix.core.preset_catalog import (
     PresetCatalogBuilder,
     PresetDeclaration,
@@ -66,6 +66,32 @@ def test_realize_scene_reuses_explicit_session_between_frames() -> None:
     assert second[0].cache_key == first[0].cache_key
 
 
+def test_iter_realize_scene_matches_realize_scene_without_keeping_cache() -> None:
+    g1 = G.polygon(n_sides=3)
+    g2 = G.polygon(n_sides=6)
+
+    def draw(_t: float):
+        return [g1, Layer(g2, site_id="layer:2", color=(1.0, 0.0, 0.0), thickness=0.2)]
+
+    defaults = LayerStyleDefaults(color=(0.1, 0.2, 0.3), thickness=0.05)
+    expected = realize_scene(draw, t=0.0, defaults=defaults)
+    with RealizeSession() as session:
+        streamed = iter_realize_scene(draw, t=0.0, defaults=defaults, session=session)
+        first = next(streamed)
+        # 次の layer は要求されるまで realize しない。
+        assert session.stats().misses == 1
+        layers = [first, *streamed]
+        assert session.stats().entries == 0
+
+    assert [item.cache_key for item in layers] == [item.cache_key for item in expected]
+    assert [(item.color, item.thickness) for item in layers] == [
+        (item.color, item.thickness) for item in expected
+    ]
+    for left, right in zip(layers, expected, strict=True):
+        assert np.array_equal(left.realized.coords, right.realized.coords)
+        assert np.array_equal(left.realized.offsets, right.realized.offsets)
+
+
 def test_realize_scene_binds_explicit_preset_snapshot() -> None:
     calls: list[str] = []
 
@@ -46,6 +46,7 @@ from grafix.core.realized_geometry import RealizedGeometry
 from grafix.core.resource_budget import ResourceBudget
 from grafix.core.runtime_limits import RuntimeLimits
 from grafix.core.runtime_config import runtime_config
+from grafix.core.simulation_checkpoints import SimulationCheckpoint
 
 realize_module = importlib.import_module("grafix.core.realize")
 
@@ -599,9 +600,13 @@ def test_lru_evicts_least_recently_used_entry_by_byte_budget(
     primitives.register("shape", _primitive_spec(evaluate))
     geometries = [Geometry.create("shape", params={"n": n}) for n in (3, 4, 5)]
     entry_size = _realized(5).byte_size
+    geometry_bytes = entry_size * 2
+    # 上限の 1/4 は simulation checkpoint tier へ割かれるため、その分を上乗せする。
+    cache_bytes = geometry_bytes + geometry_bytes // 3
+    assert cache_bytes - cache_bytes // 4 == geometry_bytes
 
     with RealizeSession(
-        runtime_limits=RuntimeLimits(cpu_cache_bytes=entry_size * 2)
+        runtime_limits=RuntimeLimits(cpu_cache_bytes=cache_bytes)
     ) as session:
         first = session.realize(geometries[0])
         second = session.realize(geometries[1])
@@ -716,6 +721,102 @@ def test_result_larger_than_budget_is_delivered_but_not_cached(
     assert stats.bytes == 0
 
 
+def test_compact_tier_stores_planar_entries_losslessly_and_reports_ratio(
+    isolated_catalog: _CatalogPair,
+) -> None:
+    primitives, _ = isolated_catalog
+    calls = 0
+
+    def evaluate(args: tuple[tuple[str, object], ...]) -> RealizedGeometry:
+        nonlocal calls
+        calls += 1
+        t = np.linspace(0.0, 2.0 * np.pi, 1_000)
+        radius = float(cast(float, dict(args)["radius"]))
+        coords = np.column_stack([radius * np.cos(t), radius * np.sin(t), np.zeros_like(t)])
+        if dict(args)["snap"]:
+            # -0.0 は格子番号 0 から bit 単位で戻らないので +0.0 へ揃える。
+            coords = np.round(coords, 3) + 0.0
+        return RealizedGeometry(
+            coords=coords.astype(np.float32),
+            offsets=np.asarray([0, 1_000], dtype=np.int32),
+        )
+
+    primitives.register("ring", _primitive_spec(evaluate))
+    geometries = [
+        Geometry.create("ring", params={"radius": 7.3, "snap": snap})
+        for snap in (False, True)
+    ]
+    limits = RuntimeLimits(cpu_cache_compact=True)
+
+    with RealizeSession(runtime_limits=limits) as session:
+        first = [session.realize(geometry) for geometry in geometries]
+        second = [session.realize(geometry) for geometry in geometries]
+        stats = session.stats()
+
+    assert calls == 2
+    for miss, hit in zip(first, second, strict=True):
+        assert hit is not miss
+        assert hit.coords.tobytes() == miss.coords.tobytes()
+        assert hit.offsets is miss.offsets
+    assert stats.hits == 2
+    assert stats.compact_entries == 2
+    assert stats.logical_bytes == sum(result.byte_size for result in first)
+    # planar float32 2 列で 2/3、格子上の座標は uint16 2 列で約 1/3 になる。
+    assert stats.compression_ratio > 1.9
+
+
+def test_compact_tier_is_disabled_by_default(isolated_catalog: _CatalogPair) -> None:
+    primitives, _ = isolated_catalog
+    primitives.register("shape", _primitive_spec(lambda _args: _realized(64)))
+    geometry = Geometry.create("shape")
+
+    with RealizeSession() as session:
+        first = session.realize(geometry)
+        assert session.realize(geometry) is first
+        stats = session.stats()
+
+    assert stats.compact_entries == 0
+    assert stats.logical_bytes == stats.bytes == first.byte_size
+    assert stats.compression_ratio == 1.0
+    with pytest.raises(TypeError, match="compact"):
+        RealizeCacheStore(max_bytes=1, max_entries=1, compact=1)  # type: ignore[arg-type]
+
+
+def test_geometry_and_checkpoint_tiers_share_the_cpu_cache_limit(
+    isolated_catalog: _CatalogPair,
+) -> None:
+    primitives, _ = isolated_catalog
+    primitives.register(
+        "shape",
+        _primitive_spec(lambda args: _realized(8 + int(cast(int, dict(args)["n"])))),
+    )
+    result_size = _realized(8).byte_size
+    max_bytes = 8 * result_size
+    store = RealizeCacheStore(max_bytes=max_bytes, max_entries=64)
+
+    with RealizeSession(cache_store=store) as session:
+        for n in range(16):
+            session.realize(Geometry.create("shape", params={"n": n}))
+        for iteration in range(1, 16):
+            store.checkpoints.put(
+                "growth",
+                SimulationCheckpoint(
+                    iteration=iteration,
+                    state=iteration,
+                    byte_size=result_size,
+                ),
+            )
+        stats = session.stats()
+    store.close()
+
+    assert stats.evictions > 0
+    assert stats.bytes > 0
+    assert stats.checkpoint_bytes > 0
+    assert stats.bytes <= max_bytes - max_bytes // 4
+    assert stats.checkpoint_bytes <= max_bytes // 4
+    assert stats.bytes + stats.checkpoint_bytes <= max_bytes
+
+
 def test_inflight_avoids_duplicate_computation_under_concurrency(
     isolated_catalog: _CatalogPair,
 ) -> None:
@@ -117,6 +117,7 @@ def test_output_root_dir_uses_packaged_defaults(tmp_path: Path, monkeypatch: pyt
     assert cfg.gcode.allow_reverse is True
     assert cfg.gcode.canvas_height_mm is None
     assert cfg.midi_inputs == ()
+    assert cfg.cpu_threads is None
 
 
 def test_discovered_config_overrides_packaged_defaults(
@@ -388,6 +389,42 @@ def test_gcode_decimals_requires_an_integer_without_coercion(
         load_runtime_config(config_path)
 
 
+def test_performance_cpu_threads_is_loaded(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _isolate_config_discovery(tmp_path, monkeypatch)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("performance:\n  cpu_threads: 6\n", encoding="utf-8")
+
+    assert load_runtime_config(config_path).cpu_threads == 6
+
+
+@pytest.mark.parametrize(
+    ("yaml_value", "error", "match"),
+    (
+        ("0", ValueError, "1 以上"),
+        ("true", RuntimeError, "整数"),
+        ("2.0", RuntimeError, "整数"),
+    ),
+)
+def test_performance_cpu_threads_requires_a_positive_integer(
+    yaml_value: str,
+    error: type[Exception],
+    match: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _isolate_config_discovery(tmp_path, monkeypatch)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        f"performance:\n  cpu_threads: {yaml_value}\n",
+        encoding="utf-8",
+    )
+    with pytest.raises(error, match=f"performance\\.cpu_threads.*{match}"):
+        load_runtime_config(config_path)
+
+
 @pytest.mark.parametrize("yaml_value", ("1", '"true"'))
 def test_gcode_boolean_requires_a_boolean_without_coercion(
     yaml_value: str,
@@ -0,0 +1,89 @@
+"""simulation checkpoint tier の lookup と容量制御を検証する。"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from grafix.core.realize import RealizeCacheStore
+from grafix.core.simulation_checkpoints import (
+    SimulationCheckpoint,
+    SimulationCheckpoints,
+    current_simulation_checkpoints,
+    simulation_checkpoint_context,
+    simulation_checkpoint_key,
+)
+
+
+def _checkpoint(iteration: int, byte_size: int = 10) -> SimulationCheckpoint:
+    return SimulationCheckpoint(iteration=iteration, state=iteration, byte_size=byte_size)
+
+
+def test_nearest_returns_most_advanced_checkpoint_not_past_target() -> None:
+    checkpoints = SimulationCheckpoints(max_bytes=1_000)
+    for iteration in (64, 128, 192):
+        checkpoints.put("a", _checkpoint(iteration))
+
+    assert checkpoints.nearest("a", 63) is None
+    assert checkpoints.nearest("a", 64).iteration == 64  # type: ignore[union-attr]
+    assert checkpoints.nearest("a", 150).iteration == 128  # type: ignore[union-attr]
+    assert checkpoints.nearest("a", 10_000).iteration == 192  # type: ignore[union-attr]
+    assert checkpoints.nearest("b", 10_000) is None
+
+
+def test_put_evicts_least_recently_used_checkpoints_by_bytes() -> None:
+    checkpoints = SimulationCheckpoints(max_bytes=30)
+    checkpoints.put("a", _checkpoint(1))
+    checkpoints.put("a", _checkpoint(2))
+    checkpoints.put("b", _checkpoint(1))
+    assert checkpoints.nearest("a", 1) is not None
+
+    checkpoints.put("b", _checkpoint(2))
+    checkpoints.put("c", _checkpoint(1, byte_size=31))
+
+    assert checkpoints.entries == 3
+    assert checkpoints.bytes == 30
+    assert checkpoints.nearest("a", 2).iteration == 1  # type: ignore[union-attr]
+    assert checkpoints.nearest("c", 1) is None
+
+
+def test_zeroth_iteration_is_not_stored() -> None:
+    checkpoints = SimulationCheckpoints(max_bytes=100)
+
+    checkpoints.put("a", _checkpoint(0))
+
+    assert checkpoints.entries == 0
+
+
+def test_key_distinguishes_array_content_dtype_and_scalars() -> None:
+    base = np.zeros((2, 2), dtype=np.float32)
+
+    key = simulation_checkpoint_key("ns", base, 1.0)
+
+    assert key == simulation_checkpoint_key("ns", base.copy(), 1.0)
+    assert key != simulation_checkpoint_key("ns", base.astype(np.float64), 1.0)
+    assert key != simulation_checkpoint_key("ns", base.reshape(4), 1.0)
+    assert key != simulation_checkpoint_key("ns", base, 1.5)
+    assert key != simulation_checkpoint_key("other", base, 1.0)
+
+
+def test_context_binds_tier_and_rejects_other_types() -> None:
+    checkpoints = SimulationCheckpoints(max_bytes=0)
+
+    with simulation_checkpoint_context(checkpoints):
+        assert current_simulation_checkpoints() is checkpoints
+    assert current_simulation_checkpoints() is None
+    with pytest.raises(TypeError, match="SimulationCheckpoints"):
+        with simulation_checkpoint_context(object()):  # type: ignore[arg-type]
+            pass
+
+
+def test_realize_cache_store_owns_a_quarter_budget_tier_and_clears_it() -> None:
+    store = RealizeCacheStore(max_bytes=400, max_entries=10)
+    store.checkpoints.put("a", _checkpoint(1, byte_size=100))
+    store.checkpoints.put("b", _checkpoint(1, byte_size=101))
+
+    assert store.checkpoints.entries == 1
+    store.clear()
+    assert store.checkpoints.entries == 0
+    store.close()
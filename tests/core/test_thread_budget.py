@@ -0,0 +1,122 @@
+"""ThreadBudget の配分と RealizeSession への適用を検証する。"""
+
+from __future__ import annotations
+
+import numba
+import numpy as np
+import pytest
+
+from grafix import E, G
+from grafix.core.realize import RealizeSession
+from grafix.core.runtime_config import runtime_config
+from grafix.core.thread_budget import ThreadBudget, apply_process_thread_allowance
+
+_NUMBA_LIMIT = int(numba.config.NUMBA_NUM_THREADS)
+
+
+def test_child_allowance_and_reservations_share_the_total() -> None:
+    budget = ThreadBudget(total_threads=8)
+
+    assert budget.child_allowance(1) == 4
+    assert budget.child_allowance(3) == 2
+    first = budget.reserve(3)
+    assert budget.process_allowance() == 5
+    assert budget.child_allowance(1) == 2
+    second = budget.reserve(5)
+    assert budget.process_allowance() == 1
+    assert budget.child_allowance(1) == 1
+
+    first.release()
+    first.release()
+    second.release()
+    assert budget.process_allowance() == 8
+    assert budget.snapshot().reserved_threads == 0
+
+
+def test_evaluation_sets_numba_threads_and_divides_between_concurrent_evaluations() -> None:
+    budget = ThreadBudget(total_threads=8)
+    before = numba.get_num_threads()
+
+    with budget.evaluation() as outer:
+        assert outer == 8
+        assert numba.get_num_threads() == min(8, _NUMBA_LIMIT)
+        with budget.evaluation() as inner:
+            assert inner == 4
+            assert numba.get_num_threads() == min(4, _NUMBA_LIMIT)
+            assert budget.snapshot().active_evaluations == 2
+        assert numba.get_num_threads() == min(8, _NUMBA_LIMIT)
+
+    assert numba.get_num_threads() == before
+    snapshot = budget.snapshot()
+    assert snapshot.active_evaluations == 0
+    assert snapshot.peak_demand_threads == 12
+    assert snapshot.oversubscribed_evaluations == 1
+
+
+def test_reserved_children_leave_one_thread_and_report_oversubscription() -> None:
+    budget = ThreadBudget(total_threads=2)
+    reservation = budget.reserve(2)
+    try:
+        with budget.evaluation() as allowance:
+            assert allowance == 1
+            assert numba.get_num_threads() == 1
+            assert budget.snapshot().oversubscribed is True
+    finally:
+        reservation.release()
+
+    snapshot = budget.snapshot()
+    assert snapshot.oversubscribed is False
+    assert snapshot.oversubscribed_evaluations == 1
+    assert snapshot.peak_demand_threads == 3
+
+
+def test_budget_defaults_to_configured_cpu_threads() -> None:
+    assert ThreadBudget.from_config(runtime_config()).total_threads >= 1
+    with pytest.raises(ValueError, match="total_threads"):
+        ThreadBudget(total_threads=0)
+    with pytest.raises(TypeError, match="total_threads"):
+        ThreadBudget(total_threads=True)
+
+
+def test_apply_process_thread_allowance_is_clamped_to_numba_pool() -> None:
+    before = numba.get_num_threads()
+    try:
+        assert apply_process_thread_allowance(_NUMBA_LIMIT + 8) == _NUMBA_LIMIT
+        assert apply_process_thread_allowance(1) == 1
+        assert numba.get_num_threads() == 1
+    finally:
+        numba.set_num_threads(before)
+
+
+def test_realize_session_evaluates_with_budget_allowance(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import grafix.core.effects.reaction_diffusion as module
+
+    observed: list[int] = []
+
+    def simulate(u0: np.ndarray, *_args: object, **_kwargs: object) -> np.ndarray:
+        observed.append(numba.get_num_threads())
+        return np.zeros_like(u0)
+
+    monkeypatch.setattr(module, "_gray_scott_simulate_masked", simulate)
+    geometry = E.reaction_diffusion(grid_pitch=2.0, steps=10)(
+        G.polygon(n_sides=4, scale=20.0)
+    )
+    budget = ThreadBudget(total_threads=4)
+    reservation = budget.reserve(3)
+    before = numba.get_num_threads()
+    try:
+        with RealizeSession(thread_budget=budget) as session:
+            session.realize(geometry)
+    finally:
+        reservation.release()
+
+    assert observed == [1]
+    assert numba.get_num_threads() == before
+    assert budget.snapshot().active_evaluations == 0
+
+
+def test_realize_session_rejects_non_budget() -> None:
+    with pytest.raises(TypeError, match="thread_budget"):
+        RealizeSession(thread_budget=object())  # type: ignore[arg-type]
@@ -39,6 +39,9 @@ def test_slider_interactive_target_is_a_hard_contract(
             "checksum_matches_sync": True,
             "snapshot_broadcasts": 0,
             "snapshot_payload_copies": 1,
+            "snapshot_keyframes": 1,
+            "snapshot_deltas": 0,
+            "snapshot_delta_entries": 0,
             "snapshot_acks": 1,
             "submitted_tasks": 1,
             "enqueued_tasks": 1,
@@ -118,3 +118,20 @@ def test_target_effect_speedup_cases_cover_actual_work_and_geometry_shapes() ->
             many_rings.coords[start],
             many_rings.coords[stop - 1],
         )
+
+
+def test_planar_chain_case_reuses_region_frame_between_fill_and_clip() -> None:
+    definitions = {definition.case_id: definition for definition in case_definitions()}
+    chain = definitions["effect.chain.fill_clip_boolean.rings_2"]
+    state = chain.setup(dict(chain.parameters), 0)
+
+    first = chain.workload(state)
+    second = chain.workload(state)
+    metrics = {metric.name: metric.value for metric in second.metrics}
+
+    assert "shared-planar-frame" in chain.tags
+    assert metrics["work.hatch_lines"] > 0
+    # fill の frame/局所座標を clip の mask 側が再利用し、新しい hatch だけ変換する。
+    assert metrics["work.shared_frame_hits"] == 4
+    assert metrics["work.shared_frame_misses"] == 1
+    assert second.value.coords.tobytes() == first.value.coords.tobytes()
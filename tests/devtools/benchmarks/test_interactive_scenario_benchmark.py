@@ -137,6 +137,7 @@ def test_hosted_renderer_does_not_advance_scene_serial_for_stale_redisplay(
             self.last_realized_snapshot_revision: int | None = None
             self.last_evaluation_succeeded: bool | None = None
             self.last_output_updated = False
+            self.last_output_refined = False
 
         def run(self, *args: object, **kwargs: object) -> list[Any]:
             self._calls += 1
@@ -3,6 +3,7 @@ from __future__ import annotations
 from grafix.devtools.benchmarks.mp_draw_benchmark import (
     run_mp_draw_benchmarks,
     run_mp_slider_churn_benchmarks,
+    workload_mp_reload,
 )
 
 
@@ -56,4 +57,20 @@ def test_mp_slider_churn_benchmark_checks_progress_revision_and_checksum() -> No
         assert changing["last_result_revision"] == changing["final_input_revision"]
         assert changing["checksum_matches_sync"] is True
         assert changing["rejected_tasks"] == 0
+        # slider drag 中は 1 key だけが変わるため、keyframe 以降は差分で送られる。
+        assert changing["snapshot_deltas"] > 0
+        assert changing["snapshot_delta_entries"] <= changing["snapshot_deltas"]
         assert changing["progress_contract_met"] is True
+
+
+def test_mp_reload_benchmark_hot_swaps_without_respawning_workers() -> None:
+    output = workload_mp_reload({"reloads": 2, "n_worker": 2})
+
+    assert output.value["reloads"] == 2
+    contracts = {contract.contract_id: contract for contract in output.contracts}
+    assert contracts["mp.reload.hot_swap.checksum"].passed
+    assert contracts["mp.reload.restart.checksum"].passed
+    assert contracts["mp.reload.hot_swap.no_respawn"].passed
+    metrics = {metric.name: metric for metric in output.metrics}
+    assert metrics["modes.hot_swap.source_swaps"].value == 2
+    assert metrics["modes.restart.source_swaps"].value == 0
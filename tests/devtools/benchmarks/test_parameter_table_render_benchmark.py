@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pytest
+
+from grafix.devtools.benchmarks.catalog import case_definitions
+from grafix.devtools.benchmarks.parameter_table_render_benchmark import (
+    make_parameter_table_render_scenario,
+    run_parameter_table_render_scenario,
+)
+from grafix.devtools.benchmarks.runner import run_case_isolated
+
+pytest.importorskip("imgui")
+
+
+def test_large_table_frame_draws_bounded_rows_and_returns_every_row() -> None:
+    result = run_parameter_table_render_scenario(
+        make_parameter_table_render_scenario({"rows": 1_000, "frames": 3})
+    )
+
+    assert result.value == {
+        "scope": "parameter-table-renderer(real-imgui,headless,no-gpu)",
+        "rows": 1_000,
+        "frames": 3,
+        "rendered_rows_bounded": True,
+        "edit_rows_exact": True,
+        "identity_preserved": True,
+        "content_height_stable": True,
+        "real_imgui_measured": True,
+        "gpu_measured": False,
+    }
+    assert all(contract.passed for contract in result.contracts)
+
+    metrics = {metric.name: metric for metric in result.metrics}
+    frame = metrics["param_table.frame.render"]
+    assert frame.kind == "distribution"
+    assert frame.unit == "ms"
+    assert frame.distribution is not None
+    assert frame.distribution.count == 3
+    assert 0 < metrics["param_table.frame.max_rendered_rows"].value <= 64
+
+
+def test_registry_scopes_parameter_table_frame_cases() -> None:
+    definitions = {definition.case_id: definition for definition in case_definitions()}
+    small = definitions["gui.parameter_table_frame.rows_100"]
+    medium = definitions["gui.parameter_table_frame.rows_1000"]
+    large = definitions["gui.parameter_table_frame.rows_10000"]
+
+    assert small.parameters == {"rows": 100, "frames": 12}
+    assert small.selectable_suites == ("smoke", "gui")
+    assert medium.selectable_suites == ("gui",)
+    assert large.parameters == {"rows": 10_000, "frames": 12}
+    assert large.selectable_suites == ("gui", "soak")
+    assert all("PARAM-02" in definition.tags for definition in (small, medium, large))
+
+
+def test_formal_case_returns_typed_metrics_and_passes_contracts() -> None:
+    definition = next(
+        definition
+        for definition in case_definitions()
+        if definition.case_id == "gui.parameter_table_frame.rows_100"
+    )
+
+    result = run_case_isolated(
+        definition,
+        seed=0,
+        mode="warm",
+        samples=1,
+        warmup=0,
+        target_ns=0,
+        disable_gc=False,
+        timeout_seconds=60.0,
+    )
+
+    assert result.status == "ok", result.error
+    assert all(metric.kind in {"counter", "gauge", "distribution"} for metric in result.metrics)
+    assert result.contracts
+    assert all(contract.passed for contract in result.contracts)
@@ -25,6 +25,7 @@ _BUILTIN_PRIMITIVES = {
     "bezier",
     "circle",
     "ellipse",
+    "geometry_file",
     "grid",
     "laplace_field_grid",
     "line",
@@ -68,7 +69,7 @@ def test_primitive_suite_covers_every_builtin_with_direct_actual_work() -> None:
     assert {definition.parameters["primitive"] for definition in definitions} == (
         _BUILTIN_PRIMITIVES
     )
-    assert len(definitions) == 25
+    assert len(definitions) == 27
     for definition in definitions:
         assert definition.category == "primitive"
         assert definition.suite == "primitives"
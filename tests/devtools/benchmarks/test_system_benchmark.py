@@ -49,3 +49,16 @@ def test_cold_import_runs_in_fresh_process_and_reports_rss() -> None:
     assert result["median_ms"] >= 0.0
     assert result["peak_rss_bytes"] > 0
     assert result["output"] == {"module": "grafix"}
+
+
+def test_dag_construction_rebuild_reuses_live_scene_nodes() -> None:
+    state = system_benchmark.setup_dag_construction({"nodes": 30}, 0)
+    previous_root = state["root"]  # type: ignore[index]
+
+    output = system_benchmark.workload_dag_construction(state)
+
+    assert output.value is previous_root
+    metrics = {metric.name: metric.value for metric in output.metrics}
+    assert metrics["nodes"] == 31
+    assert metrics["reused_leaves"] == 10
+    assert metrics["recipe_id"] == previous_root.id
@@ -708,3 +708,160 @@ def test_export_gcode_requires_explicit_params(tmp_path) -> None:
         export_gcode(layers, out_path, canvas_size=(10.0, 10.0))  # type: ignore[call-arg]
 
     assert not out_path.exists()
+
+
+def _multi_layer_scene(seed: int) -> list[RealizedLayer]:
+    rng = np.random.default_rng(seed)
+    layers = []
+    for _ in range(5):
+        coords: list[list[float]] = []
+        offsets = [0]
+        for _ in range(6):
+            # 0.0005 刻みは decimals=3 で丸めの境界に乗り、紙外への出入りも含む。
+            points = rng.integers(-400, 2400, size=(12, 2)) * 0.0005 * 10
+            coords.extend([float(x), float(y), 0.0] for x, y in points)
+            offsets.append(len(coords))
+        layers.append(_realized_layer(coords=coords, offsets=offsets))
+    layers.insert(2, _realized_layer(coords=[[-5.0, -5.0, 0.0], [-4.0, -5.0, 0.0]], offsets=[0, 2]))
+    return layers
+
+
+@pytest.mark.parametrize("bridge_draw_distance", [None, 2.0])
+def test_export_gcode_bulk_encoding_matches_emitter_per_layer(bridge_draw_distance) -> None:
+    from grafix.export.gcode import _EmitterState, _LayerEncoder, _paper_safe_rect
+
+    params = GCodeParams(
+        origin=(0.25, 0.5),
+        y_down=True,
+        paper_margin_mm=0.5,
+        decimals=3,
+        travel_feed=1500.0,
+        optimize_travel=True,
+        allow_reverse=True,
+        bridge_draw_distance=bridge_draw_distance,
+    )
+    canvas = (10.0, 10.0)
+    encoder = _LayerEncoder(
+        params=params,
+        canvas=canvas,
+        safe_rect=_paper_safe_rect(canvas, paper_margin_mm=0.5),
+    )
+
+    state = _EmitterState()
+    for layer_index, layer in enumerate(_multi_layer_scene(0)):
+        prepared = encoder.prepare(layer_index, layer)
+        assert prepared.quantized is not None
+        bulk = bytes(encoder.encode(prepared, state))
+        assert bulk == bytes(encoder._encode_with_emitter(prepared, state))
+        state = prepared.exit_state(state, draw_feed=encoder.draw_feed)
+
+
+def test_export_gcode_output_does_not_depend_on_encoder_threads(tmp_path) -> None:
+    layers = _multi_layer_scene(1)
+    outputs = []
+    for decimals in (3, 10):
+        params = GCodeParams(decimals=decimals, optimize_travel=True, bridge_draw_distance=1.0)
+        for threads in (1, 3):
+            out_path = tmp_path / f"out-{decimals}-{threads}.gcode"
+            export_gcode(
+                layers,
+                out_path,
+                canvas_size=(10.0, 10.0),
+                params=params,
+                encoder_threads=threads,
+            )
+            outputs.append(out_path.read_bytes())
+
+    assert outputs[0] == outputs[1]
+    assert outputs[2] == outputs[3]
+    with pytest.raises(ValueError, match="encoder_threads"):
+        export_gcode(
+            layers,
+            tmp_path / "invalid.gcode",
+            canvas_size=(10.0, 10.0),
+            params=GCodeParams(),
+            encoder_threads=0,
+        )
+
+
+def test_default_encoder_threads_follow_thread_budget_allowance() -> None:
+    from grafix.core.thread_budget import ThreadBudget
+    from grafix.export.gcode import _default_encoder_threads
+
+    with ThreadBudget(total_threads=1).evaluation() as allowance:
+        assert allowance == 1
+        assert _default_encoder_threads() == 1
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+def test_export_gcode_reports_first_bed_violation_in_output_order(tmp_path, threads) -> None:
+    inside = _realized_layer(coords=[[1.0, 1.0, 0.0], [2.0, 1.0, 0.0]], offsets=[0, 2])
+    layers = [
+        inside,
+        _realized_layer(coords=[[1.0, 9.5, 0.0], [1.0, 8.5, 0.0]], offsets=[0, 2]),
+        _realized_layer(coords=[[9.5, 1.0, 0.0], [9.5, 2.0, 0.0]], offsets=[0, 2]),
+        inside,
+    ]
+    params = GCodeParams(
+        origin=(0.0, 0.0),
+        y_down=False,
+        paper_margin_mm=0.0,
+        decimals=3,
+        bed_x_range=(0.0, 9.0),
+        bed_y_range=(0.0, 9.0),
+    )
+
+    out_path = tmp_path / "out.gcode"
+    with pytest.raises(ValueError, match="bed_y_range"):
+        export_gcode(
+            layers,
+            out_path,
+            canvas_size=(10.0, 10.0),
+            params=params,
+            encoder_threads=threads,
+        )
+    assert not out_path.exists()
+
+
+def test_clip_kernel_packs_fragments_with_source_polyline_indices() -> None:
+    from grafix.export.gcode import _clip_polylines_to_rect
+
+    coords = np.array(
+        [
+            [5.0, 5.0],
+            # 1 点だけの polyline は fragment を作らない。
+            [1.0, 1.0],
+            [5.0, 1.0],
+            [15.0, 1.0],
+            [15.0, 3.0],
+            [5.0, 3.0],
+            [-5.0, 5.0],
+            [-5.0, 6.0],
+            # 重複点は fragment 内で間引く。
+            [5.0, 9.0],
+            [5.0, 9.0],
+            [6.0, 9.0],
+        ]
+    )
+    offsets = np.array([0, 1, 8, 11], dtype=np.int64)
+
+    points, fragment_offsets, polylines, segments = _clip_polylines_to_rect(
+        coords,
+        offsets,
+        0.0,
+        10.0,
+        0.0,
+        10.0,
+    )
+
+    fragments = [
+        points[start:stop].tolist()
+        for start, stop in zip(fragment_offsets[:-1], fragment_offsets[1:], strict=True)
+    ]
+    assert fragments == [
+        [[1.0, 1.0], [5.0, 1.0], [10.0, 1.0]],
+        [[10.0, 3.0], [5.0, 3.0], [0.0, 4.0]],
+        [[5.0, 9.0], [6.0, 9.0]],
+    ]
+    assert polylines.tolist() == [1, 1, 2]
+    assert segments.tolist() == [0, 1, 0]
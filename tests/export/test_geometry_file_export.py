@@ -0,0 +1,54 @@
+"""geometry file export（`grafix.export.geometry_file.export_geometry_file`）のテスト。"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from grafix import G, L, RenderSession
+from grafix.core.geometry_file import read_geometry_file
+from grafix.export.geometry_file import export_geometry_file
+
+
+def _draw(_t: float):
+    return [
+        L.layer(G.polygon(n_sides=7, center=(50.0, 50.0, 0.0), scale=30.0)),
+        L.layer(
+            G.grid(nx=6, ny=4, center=(60.0, 40.0, 0.0), scale=20.0),
+            color=(1.0, 0.0, 0.0),
+            thickness=0.004,
+        ),
+    ]
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib"])
+def test_export_round_trips_rendered_layers(tmp_path: Path, compression: str) -> None:
+    with RenderSession(_draw) as session:
+        frame = session.render(0.0)
+        path = export_geometry_file(
+            frame.layers,
+            tmp_path / "out" / "scene.ggeom",
+            compression=compression,
+        )
+
+    assert path == tmp_path / "out" / "scene.ggeom"
+    assert sorted(item.name for item in path.parent.iterdir()) == ["scene.ggeom"]
+    loaded = read_geometry_file(path, verify=True)
+    assert len(loaded.layers) == len(frame.layers)
+    for actual, expected in zip(loaded.layers, frame.layers, strict=True):
+        assert np.array_equal(actual.coords, expected.realized.coords)
+        assert np.array_equal(actual.offsets, expected.realized.offsets)
+        assert actual.color == expected.color
+        assert actual.thickness == expected.thickness
+        assert actual.name == expected.layer.name
+
+
+def test_streamed_export_matches_rendered_export(tmp_path: Path) -> None:
+    with RenderSession(_draw) as session:
+        rendered = export_geometry_file(session.render(0.0).layers, tmp_path / "a.ggeom")
+    with RenderSession(_draw) as session:
+        streamed = export_geometry_file(session.stream(0.0).layers, tmp_path / "b.ggeom")
+
+    assert streamed.read_bytes() == rendered.read_bytes()
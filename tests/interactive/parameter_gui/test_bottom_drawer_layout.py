@@ -44,11 +44,17 @@ def test_dynamic_drawer_content_does_not_move_or_narrow_parameter_table(
             clear=lambda: None,
         )
         renderer = SimpleNamespace(render=lambda _draw_data: None)
-        quiet = SimpleNamespace(profiler=None, diagnostics=(), alert_count=0)
+        quiet = SimpleNamespace(
+            profiler=None,
+            diagnostics=(),
+            alert_count=0,
+            edit_predictor=None,
+        )
         noisy = SimpleNamespace(
             profiler=object(),
             diagnostics=tuple(range(40)),
             alert_count=20,
+            edit_predictor=None,
         )
         monitor = SimpleNamespace(
             current=quiet,
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 
 from grafix import E, G
+from grafix.core.parameter_dependencies import ParameterEditPrediction
 from grafix.core.parameters.codec import (
     decode_param_store_result,
     encode_param_store,
@@ -13,6 +14,7 @@ from grafix.core.parameters.view import ParameterRow
 from grafix.interactive.parameter_gui.help_pane import (
     NO_DESCRIPTION,
     NOT_SPECIFIED,
+    parameter_edit_cost_text,
     parameter_help_content,
 )
 from grafix.interactive.parameter_gui.store_bridge import (
@@ -151,3 +153,27 @@ def test_loaded_builtin_meta_is_upgraded_before_gui_help() -> None:
 
     length_row = next(row for row in rows if row.op == "line" and row.arg == "length")
     assert (length_row.ui_min, length_row.ui_max) == (-10.0, 10.0)
+
+
+def test_edit_cost_text_reports_dominant_op_duration_and_node_count() -> None:
+    def prediction(nodes: int, ns: int, op: str | None) -> ParameterEditPrediction:
+        return ParameterEditPrediction(
+            nodes=nodes,
+            measured_nodes=0 if op is None else nodes,
+            predicted_ns=ns,
+            dominant_op=op,
+        )
+
+    assert parameter_edit_cost_text(None) is None
+    assert parameter_edit_cost_text(prediction(0, 0, None)) is None
+    assert (
+        parameter_edit_cost_text(prediction(14, 2_100_000_000, "growth"))
+        == "Recompute: growth 2.10 s · 14 nodes"
+    )
+    assert (
+        parameter_edit_cost_text(prediction(1, 3_250_000, "rotate"))
+        == "Recompute: rotate 3.2 ms · 1 node"
+    )
+    assert parameter_edit_cost_text(prediction(3, 0, None)) == (
+        "Recompute: 3 nodes (not measured yet)"
+    )
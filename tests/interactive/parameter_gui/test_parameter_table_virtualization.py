@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import pytest
+
+from grafix.core.parameters.frame_params import FrameParamRecord
+from grafix.core.parameters.key import ParameterKey
+from grafix.core.parameters.merge_ops import merge_frame_params
+from grafix.core.parameters.meta import ParamMeta
+from grafix.core.parameters.store import ParamStore
+from grafix.interactive.parameter_gui import table as table_module
+from grafix.interactive.parameter_gui.midi_learn import MidiLearnState
+from grafix.interactive.parameter_gui.store_bridge import (
+    _rows_for_table_view,
+    parameter_table_view_for_store,
+)
+from grafix.interactive.parameter_gui.table import (
+    TableEdits,
+    TableRenderInput,
+    visible_line_range,
+)
+
+
+def test_visible_line_range_returns_lines_intersecting_view() -> None:
+    offsets = [0.0, 10.0, 20.0, 30.0, 40.0]
+
+    assert visible_line_range(offsets, view_min_y=15.0, view_max_y=25.0) == (1, 3)
+    assert visible_line_range(offsets, view_min_y=10.0, view_max_y=20.0) == (1, 2)
+    assert visible_line_range(offsets, view_min_y=-5.0, view_max_y=-1.0) == (0, 0)
+    assert visible_line_range(offsets, view_min_y=50.0, view_max_y=60.0) == (4, 4)
+    assert visible_line_range([0.0], view_min_y=0.0, view_max_y=5.0) == (0, 0)
+
+
+def _large_store(rows: int) -> ParamStore:
+    meta = ParamMeta(kind="float", ui_min=0.0, ui_max=float(rows))
+    store = ParamStore()
+    merge_frame_params(
+        store,
+        [
+            FrameParamRecord(
+                key=ParameterKey(op="line", site_id=f"virtual-{index:05d}", arg="length"),
+                base=float(index),
+                meta=meta,
+                explicit=False,
+                effective=float(index),
+                source="code",
+            )
+            for index in range(rows)
+        ],
+    )
+    return store
+
+
+class _TableHarness:
+    """実 pyimgui で scroll 可能な child window に table を描く。"""
+
+    def __init__(self, imgui, render_input: TableRenderInput) -> None:
+        self.imgui = imgui
+        self.render_input = render_input
+        self.rendered: list[str] = []
+        self.scroll_y = 0.0
+        self.scroll_max_y = 0.0
+
+    def frame(
+        self,
+        *,
+        scroll_to: float | None = None,
+        midi_learn_state: MidiLearnState | None = None,
+    ) -> TableEdits:
+        imgui = self.imgui
+        self.rendered.clear()
+        imgui.new_frame()
+        imgui.set_next_window_position(0.0, 0.0)
+        imgui.set_next_window_size(800.0, 600.0)
+        imgui.begin("virtualization")
+        imgui.begin_child("##parameter_table_scroll", 0.0, 0.0)
+        if scroll_to is not None:
+            imgui.set_scroll_y(float(scroll_to))
+        render_input = self.render_input
+        if midi_learn_state is not None:
+            render_input = TableRenderInput(
+                group_layout=render_input.group_layout,
+                model_rows=render_input.model_rows,
+                catalog=render_input.catalog,
+                collapsed_headers=render_input.collapsed_headers,
+                midi_learn_state=midi_learn_state,
+            )
+        edits = table_module.render_parameter_table(render_input)
+        self.scroll_y = float(imgui.get_scroll_y())
+        self.scroll_max_y = float(imgui.get_scroll_max_y())
+        imgui.end_child()
+        imgui.end()
+        imgui.render()
+        return edits
+
+
+@pytest.fixture
+def harness(monkeypatch: pytest.MonkeyPatch):
+    imgui = pytest.importorskip("imgui")
+    context = imgui.create_context()
+    try:
+        io = imgui.get_io()
+        io.ini_file_name = None
+        io.display_size = (800.0, 600.0)
+        io.delta_time = 1.0 / 60.0
+        io.fonts.get_tex_data_as_rgba32()
+        store = _large_store(2_000)
+        view = parameter_table_view_for_store(store, show_inactive_params=True)
+        render_rows, _view_rows = _rows_for_table_view(view)
+        harness = _TableHarness(
+            imgui,
+            TableRenderInput(
+                group_layout=view.group_layout,
+                model_rows=render_rows,
+                catalog=view.model.catalog,
+                collapsed_headers=store.collapsed_headers(),
+            ),
+        )
+        original = table_module.render_parameter_row_4cols
+
+        def counting_row(row, **kwargs):
+            harness.rendered.append(row.site_id)
+            return original(row, **kwargs)
+
+        monkeypatch.setattr(table_module, "render_parameter_row_4cols", counting_row)
+        yield harness
+    finally:
+        imgui.destroy_context(context)
+
+
+def test_large_table_renders_only_rows_near_the_view(harness: _TableHarness) -> None:
+    row_count = len(harness.render_input.model_rows)
+    for _ in range(3):
+        edits = harness.frame()
+
+    assert 0 < len(harness.rendered) < 60
+    assert harness.rendered[0] == "virtual-00000"
+    assert len(edits.rows) == row_count
+    expected = [
+        harness.render_input.model_rows[item.row_index]
+        for block in harness.render_input.group_layout
+        for item in block.items
+    ]
+    assert all(after is before for after, before in zip(edits.rows, expected, strict=True))
+
+
+def test_scrolled_table_keeps_content_height_and_renders_matching_rows(
+    harness: _TableHarness,
+) -> None:
+    for _ in range(3):
+        harness.frame()
+    content_max_y = harness.scroll_max_y
+    assert content_max_y > 0.0
+
+    harness.frame(scroll_to=content_max_y / 2.0)
+    harness.frame()
+
+    assert harness.scroll_max_y == pytest.approx(content_max_y)
+    assert 0 < len(harness.rendered) < 60
+    middle = [int(site_id.rsplit("-", 1)[1]) for site_id in harness.rendered]
+    assert min(middle) <= 1_000 <= max(middle)
+
+
+def test_midi_learn_target_row_is_rendered_while_scrolled_away(
+    harness: _TableHarness,
+) -> None:
+    for _ in range(3):
+        harness.frame()
+    target = ParameterKey(op="line", site_id="virtual-01999", arg="length")
+
+    harness.frame(midi_learn_state=MidiLearnState(active_target=target))
+
+    assert "virtual-01999" in harness.rendered
+    assert "virtual-01000" not in harness.rendered
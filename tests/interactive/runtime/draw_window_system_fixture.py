@@ -204,6 +204,7 @@ class FakeSceneRunner:
         self.last_realized_snapshot_revision: int | None = None
         self.last_realized_frame_id: int | None = None
         self.last_output_updated = False
+        self.last_output_refined = False
         self.is_waiting_for_fresh_result = False
 
     def run(self, *args: object, **kwargs: object) -> list[RealizedLayer]:
@@ -38,6 +38,7 @@ from grafix.core.realize import GeometryCacheKey
 from grafix.core.realized_geometry import RealizedGeometry
 from grafix.core.runtime_config import current_runtime_config, runtime_config
 from grafix.core.runtime_limits import RuntimeLimits
+from grafix.core.thread_budget import ThreadBudget
 from grafix.interactive.midi import MidiSession
 from grafix.interactive.midi.midi_controller import CcSnapshotLoadResult
 from grafix.interactive.runtime.draw_window_system import DrawWindowSystem
@@ -121,6 +122,24 @@ def _realized_layer(*, site_id: str) -> RealizedLayer:
     )
 
 
+@pytest.mark.parametrize(
+    ("worker_count", "total_threads", "expected"),
+    [
+        (0, 1, 2),
+        (4, 8, 6),
+        (4, 10, 10),
+    ],
+)
+def test_warm_pool_keeps_spare_draw_generation_only_within_thread_budget(
+    worker_count: int,
+    total_threads: int,
+    expected: int,
+) -> None:
+    budget = ThreadBudget(total_threads=total_threads)
+
+    assert draw_window_module._warm_pool_process_limit(worker_count, budget) == expected
+
+
 @pytest.mark.parametrize(
     ("fps", "error_type"),
     [
@@ -353,6 +372,7 @@ class _FakeSceneRunner:
         self.last_realized_snapshot_revision: int | None = None
         self.last_realized_frame_id: int | None = None
         self.last_output_updated = False
+        self.last_output_refined = False
         self.is_waiting_for_fresh_result = False
         self.realized_t_override: float | None = None
         self.snapshot_revision_override: int | None = None
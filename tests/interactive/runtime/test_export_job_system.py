@@ -3,15 +3,18 @@ from __future__ import annotations
 import multiprocessing as mp
 import os
 import json
+import pickle
 import queue
 import time
 import weakref
 from collections import deque
+from multiprocessing import shared_memory
 from dataclasses import FrozenInstanceError, replace
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, cast
 
+import numba
 import pytest
 import numpy as np
 
@@ -30,6 +33,7 @@ from grafix.core.realize import GeometryCacheKey
 from grafix.core.realized_geometry import RealizedGeometry
 from grafix.core.runtime_config import runtime_config
 from grafix.core.runtime_limits import RuntimeLimits
+from grafix.core.thread_budget import ThreadBudget
 from grafix.export import capture as capture_module
 from grafix.interactive.runtime import export_job_system
 from grafix.interactive.runtime.export_job_system import (
@@ -42,6 +46,7 @@ from grafix.interactive.runtime.export_job_system import (
     FrameExportSnapshot,
     estimate_snapshot_retained_bytes,
 )
+from grafix.interactive.runtime.warm_pool import WarmWorkerPool
 
 _WAIT_TIMEOUT_S = 8.0
 
@@ -526,6 +531,12 @@ def _outside_staging_backend(job: ExportJob) -> tuple[Path, ...]:
     return (job.output_path,)
 
 
+def _thread_probe_backend(job: ExportJob) -> tuple[Path, ...]:
+    path = job.staging_dir / job.output_path.name
+    path.write_text(str(numba.get_num_threads()), encoding="utf-8")
+    return (path,)
+
+
 def _wait_for_job(
     system: ExportJobSystem,
     job_id: int,
@@ -913,6 +924,29 @@ def test_two_second_backend_does_not_block_frame_polling(tmp_path: Path) -> None
         system.close()
 
 
+def test_worker_thread_allowance_is_reserved_only_while_job_runs(
+    tmp_path: Path,
+) -> None:
+    budget = ThreadBudget(total_threads=4)
+    system = ExportJobSystem(backend=_thread_probe_backend, thread_budget=budget)
+    try:
+        job = system.submit(
+            format=ExportFormat.GCODE,
+            snapshot=_snapshot(),
+            output_path=tmp_path / "threads.gcode",
+        )
+        assert budget.snapshot().reserved_threads == 2
+        result = _wait_for_job(system, job.job_id)
+        assert result.status is ExportJobStatus.SUCCESS
+        assert budget.snapshot().reserved_threads == 0
+    finally:
+        system.close()
+
+    assert job.output_path.read_text(encoding="utf-8") == str(
+        min(2, int(numba.config.NUMBA_NUM_THREADS))
+    )
+
+
 def test_repeated_submit_uses_a_bounded_fifo_without_replacing_jobs(
     tmp_path: Path,
 ) -> None:
@@ -968,8 +1002,8 @@ def test_capture_queue_enforces_aggregate_bytes_and_shares_same_snapshot(
         default_timeout_s=5.0,
         runtime_limits=RuntimeLimits(
             capture_queue_pending_jobs=3,
-            # raw geometry 80 bytes x (parent + serialization + worker) 3 copies。
-            capture_queue_bytes=300,
+            # raw geometry 80 bytes は shared memory segment として 1 回だけ数える。
+            capture_queue_bytes=100,
         ),
     )
     try:
@@ -978,7 +1012,7 @@ def test_capture_queue_enforces_aggregate_bytes_and_shares_same_snapshot(
             snapshot=snapshot,
             output_path=tmp_path / "one.gcode",
         )
-        # 同じ immutable snapshot の連続 capture は親 geometry 参照を共有する。
+        # 同じ immutable snapshot の連続 capture は親 geometry 参照と segment を共有する。
         system.submit(
             format=ExportFormat.PNG,
             snapshot=snapshot,
@@ -987,7 +1021,7 @@ def test_capture_queue_enforces_aggregate_bytes_and_shares_same_snapshot(
         )
 
         assert system.queue_status.request_count == 2
-        assert system.queue_status.retained_bytes == 240
+        assert system.queue_status.retained_bytes == 80
         with pytest.raises(ExportQueueFullError) as exc_info:
             system.submit(
                 format=ExportFormat.GCODE,
@@ -997,9 +1031,9 @@ def test_capture_queue_enforces_aggregate_bytes_and_shares_same_snapshot(
 
         error = exc_info.value
         assert error.reason == "bytes"
-        assert error.retained_bytes == 240
-        assert error.requested_bytes == 240
-        assert error.byte_limit == 300
+        assert error.retained_bytes == 80
+        assert error.requested_bytes == 80
+        assert error.byte_limit == 100
         assert "requests=2/4" in str(error)
         assert not (tmp_path / "rejected.gcode").exists()
 
@@ -1018,7 +1052,7 @@ def test_capture_queue_releases_byte_budget_after_success(tmp_path: Path) -> Non
         default_timeout_s=5.0,
         runtime_limits=RuntimeLimits(
             capture_queue_pending_jobs=0,
-            capture_queue_bytes=240,
+            capture_queue_bytes=80,
         ),
     )
     try:
@@ -1027,7 +1061,7 @@ def test_capture_queue_releases_byte_budget_after_success(tmp_path: Path) -> Non
             snapshot=first_snapshot,
             output_path=tmp_path / "first.gcode",
         )
-        assert system.retained_bytes == 240
+        assert system.retained_bytes == 80
         assert _wait_for_job(system, first.job_id).status is ExportJobStatus.SUCCESS
         assert system.retained_bytes == 0
         assert system.request_count == 0
@@ -1046,6 +1080,133 @@ def test_capture_queue_releases_byte_budget_after_success(tmp_path: Path) -> Non
         system.close()
 
 
+def _patterned_snapshot() -> CaptureExportSnapshot:
+    snapshot = _sized_snapshot(8 + 12 * 4)
+    (layer,) = snapshot.layers
+    realized = RealizedGeometry(
+        coords=np.arange(12, dtype=np.float32).reshape(4, 3),
+        offsets=np.asarray((0, 4), dtype=np.int32),
+    )
+    # 2 layer が同じ配列を共有する snapshot。segment にも 1 回だけ書く。
+    shared_layer = replace(layer, realized=realized)
+    return replace(snapshot, layers=(shared_layer, shared_layer))
+
+
+def _geometry_probe_backend(job: ExportJob) -> tuple[Path, ...]:
+    path = job.staging_dir / job.output_path.name
+    coords = [layer.realized.coords for layer in job.snapshot.layers]
+    path.write_text(
+        json.dumps(
+            {
+                "sums": [float(array.sum()) for array in coords],
+                "writeable": any(array.flags.writeable for array in coords),
+                "owndata": any(array.flags.owndata for array in coords),
+                "shared_identity": coords[0] is coords[-1],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return (path,)
+
+
+@pytest.mark.parametrize("shared_memory_available", [True, False])
+def test_worker_maps_shared_snapshot_read_only_and_budget_counts_it_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    shared_memory_available: bool,
+) -> None:
+    snapshot = _patterned_snapshot()
+    published: list[Any] = []
+    real_publish = export_job_system.publish_shared_layers
+
+    def publish(layers):
+        if not shared_memory_available:
+            raise OSError("no shared memory")
+        segment = real_publish(layers)
+        published.append(segment)
+        return segment
+
+    monkeypatch.setattr(export_job_system, "publish_shared_layers", publish)
+    system = ExportJobSystem(backend=_geometry_probe_backend, default_timeout_s=5.0)
+    try:
+        job = system.submit(
+            format=ExportFormat.GCODE,
+            snapshot=snapshot,
+            output_path=tmp_path / "probe.gcode",
+        )
+        # 56 bytes の geometry。fallback の pickle 輸送だけが 3 copy 分を数える。
+        assert system.retained_bytes == (56 if shared_memory_available else 168)
+        result = _wait_for_job(system, job.job_id)
+        assert result.status is ExportJobStatus.SUCCESS, result.error
+        assert system.retained_bytes == 0
+    finally:
+        system.close()
+
+    probe = json.loads(result.paths[0].read_text(encoding="utf-8"))
+    assert probe["sums"] == [66.0, 66.0]
+    # pickle fallback も memo で同じ配列を共有する。
+    assert probe["shared_identity"] is True
+    if shared_memory_available:
+        assert probe["writeable"] is False
+        assert probe["owndata"] is False
+        (segment,) = published
+        # job 完了で親が segment を unlink する。
+        assert segment.closed
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=segment.handle.segment_name)
+
+
+def test_shared_snapshot_job_carries_no_geometry_in_queue_payload(
+    tmp_path: Path,
+) -> None:
+    class CaptureQueue:
+        def __init__(self) -> None:
+            self.items: list[object] = []
+
+        def put_nowait(self, value: object) -> None:
+            self.items.append(value)
+
+    system = ExportJobSystem(backend=_success_backend, default_timeout_s=5.0)
+    real_task_q = system._task_q
+    task_q = CaptureQueue()
+    system._task_q = cast(Any, task_q)
+    system._proc = cast(
+        Any,
+        SimpleNamespace(
+            exitcode=None,
+            is_alive=lambda: False,
+            join=lambda timeout=None: None,
+            close=lambda: None,
+        ),
+    )
+    try:
+        snapshot = _sized_snapshot(8 + 12 * 100_000)
+        snapshot = replace(snapshot, layers=snapshot.layers * 2)
+        job = system.submit(
+            format=ExportFormat.GCODE,
+            snapshot=snapshot,
+            output_path=tmp_path / "payload.gcode",
+        )
+        (task,) = task_q.items
+        assert isinstance(task, export_job_system._SharedSnapshotJob)
+        assert task.job.job_id == job.job_id
+        assert task.job.snapshot.layers == ()
+        assert system.retained_bytes == estimate_snapshot_retained_bytes(snapshot)
+        assert len(pickle.dumps(task)) < 16 * 1024
+        assert [record.coords for record in task.snapshot.layers] == [
+            task.snapshot.layers[0].coords
+        ] * 2
+        system._task_q = real_task_q
+        assert system.cancel()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=task.snapshot.segment_name)
+    finally:
+        if system._task_q is task_q:
+            system._task_q = real_task_q
+        system._proc = None
+        system.close()
+
+
 def test_cancel_rejects_implicit_job_id_coercion() -> None:
     system = ExportJobSystem(backend=_success_backend)
     try:
@@ -1281,6 +1442,41 @@ def test_timeout_cancels_job_and_restarts_worker(tmp_path: Path) -> None:
         system.close()
 
 
+def test_warm_pool_worker_is_adopted_for_first_and_restarted_jobs(
+    tmp_path: Path,
+) -> None:
+    pool = WarmWorkerPool(max_processes=2)
+    system = ExportJobSystem(backend=_conditional_backend, warm_pool=pool)
+    try:
+        assert pool.join_fill(timeout=_WAIT_TIMEOUT_S)
+        assert pool.stats.idle_processes == 1
+        timed_out = system.submit(
+            format=ExportFormat.PNG,
+            snapshot=_snapshot(),
+            output_path=tmp_path / "slow.png",
+            timeout_s=0.15,
+            output_size=(100, 80),
+        )
+        assert _wait_for_job(system, timed_out.job_id).status is ExportJobStatus.TIMEOUT
+        assert pool.join_fill(timeout=_WAIT_TIMEOUT_S)
+
+        succeeded = system.submit(
+            format=ExportFormat.PNG,
+            snapshot=_snapshot(),
+            output_path=tmp_path / "ok.png",
+            output_size=(100, 80),
+        )
+
+        assert _wait_for_job(system, succeeded.job_id).status is ExportJobStatus.SUCCESS
+        stats = pool.stats
+        assert (stats.hits, stats.misses) == (2, 0)
+        assert stats.idle_processes + stats.leased_processes <= 2
+    finally:
+        system.close()
+        pool.close()
+    assert pool.stats.idle_processes == 0
+
+
 def test_cancel_in_flight_dispatches_pending_job(tmp_path: Path) -> None:
     system = ExportJobSystem(backend=_conditional_backend, default_timeout_s=5.0)
     try:
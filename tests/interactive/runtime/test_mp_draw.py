@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import multiprocessing as mp
 import os
+import pickle
 import queue
 import time
 from collections.abc import Callable, Iterator
@@ -22,6 +23,7 @@ from grafix.core.parameters import (
     EffectOrderSnapshot,
     EffectStepTopology,
     FrameEffectChainRecord,
+    FrameGeometrySiteRecord,
     FrameLabelRecord,
     FrameParamRecord,
     MidiFrameSnapshot,
@@ -57,6 +59,7 @@ from grafix.interactive.runtime.mp_draw import (
 )
 from grafix.interactive.runtime.perf import PerfCollector
 from grafix.interactive.runtime.scene_runner import SceneRunner
+from grafix.interactive.runtime.warm_pool import WarmWorkerPool
 
 _WAIT_TIMEOUT_S = 8.0
 _EFFECTIVE_CONFIG = runtime_config()
@@ -734,6 +737,27 @@ def test_draw_task_requires_snapshot_pair() -> None:
         replace(_valid_draw_task(), snapshot=None)
 
 
+@pytest.mark.parametrize(
+    ("changes", "error_type"),
+    [
+        pytest.param({"snapshot_base_revision": True}, TypeError, id="base-bool"),
+        pytest.param({"snapshot_base_revision": 1}, ValueError, id="base-not-older"),
+        pytest.param(
+            {"snapshot_base_revision": 0, "snapshot": None, "effect_order_snapshot": None},
+            ValueError,
+            id="base-without-snapshot",
+        ),
+    ],
+)
+def test_draw_task_rejects_invalid_snapshot_base_revision(
+    changes: dict[str, object],
+    error_type: type[Exception],
+) -> None:
+    task = replace(_valid_draw_task(), snapshot_revision=1)
+    with pytest.raises(error_type, match="snapshot_base_revision"):
+        replace(task, **changes)
+
+
 def _valid_draw_result() -> DrawResult:
     return DrawResult(
         frame_id=1,
@@ -1463,6 +1487,33 @@ def test_draw_result_uses_keyword_constructor() -> None:
     assert result.snapshot_revision == 0
 
 
+def test_draw_result_carries_geometry_sites_only_for_successful_frames() -> None:
+    layers = tuple(normalize_scene(_empty_draw(0.0)))
+    site = FrameGeometrySiteRecord(
+        op="concat",
+        site_id="site",
+        geometry_id=layers[0].geometry.id,
+    )
+    common: dict[str, Any] = {
+        "frame_id": 3,
+        "t": 0.0,
+        "epoch": 0,
+        "generation": 0,
+        "snapshot_revision": 0,
+        "records": (),
+        "labels": (),
+        "effect_chains": (),
+    }
+
+    result = DrawResult(layers=layers, geometry_sites=(site,), **common)
+
+    assert pickle.loads(pickle.dumps(result)).geometry_sites == (site,)
+    with pytest.raises(TypeError, match="geometry_sites"):
+        DrawResult(layers=layers, geometry_sites=[site], **common)
+    with pytest.raises(ValueError, match="geometry_sites"):
+        DrawResult(layers=(), geometry_sites=(site,), error="failed", **common)
+
+
 def test_result_drain_discards_old_epoch_and_keeps_diagnostic(
     initialized_mp_draw: MpDraw,
 ) -> None:
@@ -1832,16 +1883,27 @@ class _IdleMpDraw:
         evaluation_timeout: float | None,
         effective_config: object,
         definitions: object,
+        thread_allowance: int | None = None,
     ) -> None:
         self.n_worker = int(n_worker)
         self.evaluation_timeout = evaluation_timeout
         self.effective_config = effective_config
         self.definitions = definitions
         self.submit_calls: list[dict[str, object]] = []
+        self.swap_calls: list[tuple[Callable[[float], Geometry], object]] = []
         self.close_calls = 0
         self.last_submitted_frame_id = 0
         type(self).instances.append(self)
 
+    def swap_draw(
+        self,
+        draw: Callable[[float], Geometry],
+        *,
+        definitions: object = None,
+    ) -> int:
+        self.swap_calls.append((draw, definitions))
+        return len(self.swap_calls)
+
     def submit(self, **kwargs: object) -> None:
         self.last_submitted_frame_id += 1
         self.submit_calls.append(dict(kwargs))
@@ -2038,7 +2100,7 @@ def test_scene_runner_passes_evaluation_timeout_to_mp_draw(
         runner.close()
 
 
-def test_scene_runner_replace_draw_retires_old_worker_and_keeps_configuration(
+def test_scene_runner_replace_draw_swaps_source_in_place_and_keeps_configuration(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     _IdleMpDraw.instances = []
@@ -2056,17 +2118,18 @@ def test_scene_runner_replace_draw_retires_old_worker_and_keeps_configuration(
     )
     first_worker = _IdleMpDraw.instances[-1]
     runner.replace_draw(second_draw)
-    second_worker = _IdleMpDraw.instances[-1]
 
-    assert second_worker is not first_worker
-    assert first_worker.close_calls == 1
-    assert second_worker.n_worker == 2
-    assert second_worker.evaluation_timeout == pytest.approx(0.75)
+    assert _IdleMpDraw.instances == [first_worker]
+    assert [draw for draw, _definitions in first_worker.swap_calls] == [second_draw]
+    assert first_worker.swap_calls[0][1] is runner._definitions
+    assert first_worker.close_calls == 0
+    assert first_worker.n_worker == 2
+    assert first_worker.evaluation_timeout == pytest.approx(0.75)
     assert runner._draw is second_draw
-    assert runner._mp_draw is second_worker
+    assert runner._mp_draw is first_worker
 
     runner.close()
-    assert second_worker.close_calls == 1
+    assert first_worker.close_calls == 1
 
 
 def test_scene_runner_replace_draw_failure_keeps_current_worker(
@@ -2081,11 +2144,11 @@ def test_scene_runner_replace_draw_failure_keeps_current_worker(
     )
     current_worker = _IdleMpDraw.instances[-1]
 
-    def fail_to_start(*_args: object, **_kwargs: object) -> None:
-        raise RuntimeError("spawn failed")
+    def fail_to_swap(*_args: object, **_kwargs: object) -> int:
+        raise RuntimeError("swap failed")
 
-    monkeypatch.setattr(scene_runner_module, "MpDraw", fail_to_start)
-    with pytest.raises(RuntimeError, match="spawn failed"):
+    monkeypatch.setattr(current_worker, "swap_draw", fail_to_swap)
+    with pytest.raises(RuntimeError, match="swap failed"):
         runner.replace_draw(lambda _t: Geometry.create(op="concat"))
 
     assert runner._draw is _empty_draw
@@ -2987,6 +3050,212 @@ def test_worker_rejects_unknown_and_stale_revision_and_acks_stale_update() -> No
         mp_draw.close()
 
 
+def test_worker_requests_resync_when_delta_base_is_missing() -> None:
+    mp_draw = _mp_draw(_empty_draw, n_worker=1)
+    try:
+        mp_draw.submit(
+            t=0.0,
+            snapshot_revision=5,
+            snapshot={},
+            effect_order_snapshot={},
+            epoch=0,
+            quality="draft",
+        )
+        _wait_for_result(mp_draw)
+
+        mp_draw._control_qs[0].put(
+            _SnapshotUpdate(
+                revision=6,
+                snapshot={},
+                effect_order_snapshot={},
+                generation=mp_draw.generation,
+                base_revision=3,
+            )
+        )
+
+        def resync_was_requested() -> bool:
+            mp_draw.poll_latest()
+            return mp_draw.snapshot_resync_count == 1
+
+        _wait_until(resync_was_requested, message="snapshot resync timeout")
+        assert set(mp_draw.worker_snapshot_revisions.values()) == {5}
+
+        rejected_before = mp_draw.rejected_task_count
+        mp_draw._task_q.put(
+            _DrawTask(
+                frame_id=10_003,
+                t=0.0,
+                snapshot_revision=6,
+                cc_snapshot=None,
+                snapshot={},
+                effect_order_snapshot={},
+                epoch=0,
+                generation=0,
+                quality="draft",
+                snapshot_base_revision=3,
+            )
+        )
+
+        def delta_task_was_rejected() -> bool:
+            mp_draw.poll_latest()
+            return mp_draw.rejected_task_count > rejected_before
+
+        _wait_until(delta_task_was_rejected, message="resync rejection timeout")
+        assert mp_draw.last_rejection == (6, 5, "resync")
+    finally:
+        mp_draw.close()
+
+
+def _swapped_draw(_t: float) -> Layer:
+    return Layer(
+        geometry=Geometry.create(op="concat"),
+        site_id="swapped-draw",
+        name="swapped",
+    )
+
+
+# worker process 内で draw が一度でも評価されたかを表す。spawn 直後の unpickle は
+# 成功させ、稼働中 worker への source swap だけを失敗させるために使う。
+_WORKER_HAS_DRAWN = False
+
+
+def _marking_empty_draw(_t: float) -> Geometry:
+    global _WORKER_HAS_DRAWN
+    _WORKER_HAS_DRAWN = True
+    return Geometry.create(op="concat")
+
+
+def _rebuild_swap_rejecting_draw() -> _SwapRejectingDraw:
+    if _WORKER_HAS_DRAWN:
+        raise RuntimeError("source swap rejected by running worker")
+    return _SwapRejectingDraw()
+
+
+class _SwapRejectingDraw:
+    """稼働中 worker での unpickle だけが失敗する draw。"""
+
+    def __call__(self, t: float) -> Layer:
+        return _swapped_draw(t)
+
+    def __reduce__(self) -> tuple[Callable[[], _SwapRejectingDraw], tuple[()]]:
+        return _rebuild_swap_rejecting_draw, ()
+
+
+def _wait_for_swapped_result(mp_draw: MpDraw) -> DrawResult:
+    deadline = time.monotonic() + _WAIT_TIMEOUT_S
+    frame = 0
+    while time.monotonic() < deadline:
+        frame += 1
+        mp_draw.submit(
+            t=float(frame),
+            snapshot_revision=1,
+            snapshot={},
+            effect_order_snapshot={},
+            epoch=mp_draw.current_epoch,
+            quality="draft",
+        )
+        result = mp_draw.poll_latest()
+        if result is not None and result.generation == mp_draw.generation:
+            return result
+        time.sleep(0.01)
+    pytest.fail("swapped draw result timeout")
+
+
+@pytest.mark.parametrize("n_worker", [1, 2])
+def test_swap_draw_reuses_worker_processes(n_worker: int) -> None:
+    mp_draw = _mp_draw(_empty_draw, n_worker=n_worker)
+    try:
+        mp_draw.submit(
+            t=0.0,
+            snapshot_revision=1,
+            snapshot={},
+            effect_order_snapshot={},
+            epoch=0,
+            quality="draft",
+        )
+        _wait_for_result(mp_draw)
+        pids_before = sorted(proc.pid for proc in mp_draw._procs)
+
+        assert mp_draw.swap_draw(_swapped_draw) == 1
+        result = _wait_for_swapped_result(mp_draw)
+
+        assert result.error is None
+        assert [layer.site_id for layer in result.layers] == ["swapped-draw"]
+        assert sorted(proc.pid for proc in mp_draw._procs) == pids_before
+        assert result.worker_pid in pids_before
+        assert mp_draw.source_swap_count == 1
+        assert mp_draw.source_swap_fallback_count == 0
+        assert mp_draw.restart_count == 0
+    finally:
+        mp_draw.close()
+
+
+def test_restart_adopts_prespawned_generation_with_current_draw() -> None:
+    pool = WarmWorkerPool(max_processes=2)
+    mp_draw = _mp_draw(_empty_draw, n_worker=1, warm_pool=pool)
+    try:
+        assert pool.join_fill(timeout=_WAIT_TIMEOUT_S)
+        assert pool.stats.idle_processes == 1
+        # 予備は旧 draw で起動済み。restart 時の source swap で現在の draw を受け取る。
+        mp_draw.swap_draw(_swapped_draw)
+        _wait_for_swapped_result(mp_draw)
+        pids_before = {proc.pid for proc in mp_draw._procs}
+
+        mp_draw.restart("warm pool test")
+        result = _wait_for_swapped_result(mp_draw)
+
+        assert result.error is None
+        assert [layer.site_id for layer in result.layers] == ["swapped-draw"]
+        assert mp_draw.warm_restart_count == 1
+        assert mp_draw.restart_count == 1
+        assert {proc.pid for proc in mp_draw._procs}.isdisjoint(pids_before)
+        assert (pool.stats.hits, pool.stats.misses) == (1, 0)
+    finally:
+        mp_draw.close()
+        pool.close()
+    assert pool.stats.idle_processes == 0
+
+
+def test_swap_draw_rejects_unpicklable_draw_without_changing_generation() -> None:
+    mp_draw = _mp_draw(_empty_draw, n_worker=1)
+    try:
+        with pytest.raises((pickle.PicklingError, AttributeError, TypeError)):
+            mp_draw.swap_draw(lambda _t: Geometry.create(op="concat"))
+
+        assert mp_draw.generation == 0
+        assert mp_draw.source_swap_count == 0
+    finally:
+        mp_draw.close()
+
+
+def test_failed_source_swap_falls_back_to_worker_restart() -> None:
+    mp_draw = _mp_draw(_marking_empty_draw, n_worker=1)
+    try:
+        mp_draw.submit(
+            t=0.0,
+            snapshot_revision=1,
+            snapshot={},
+            effect_order_snapshot={},
+            epoch=0,
+            quality="draft",
+        )
+        _wait_for_result(mp_draw)
+        pids_before = [proc.pid for proc in mp_draw._procs]
+
+        mp_draw.swap_draw(_SwapRejectingDraw())
+        result = _wait_for_swapped_result(mp_draw)
+
+        assert result.error is None
+        assert [layer.site_id for layer in result.layers] == ["swapped-draw"]
+        assert mp_draw.source_swap_fallback_count == 1
+        assert mp_draw.restart_count == 1
+        assert mp_draw.last_restart_reason is not None
+        assert "source swap rejected" in mp_draw.last_restart_reason
+        assert [proc.pid for proc in mp_draw._procs] != pids_before
+    finally:
+        mp_draw.close()
+
+
 def test_rapid_revision_changes_keep_snapshot_control_backlog_bounded() -> None:
     mp_draw = _mp_draw(_empty_draw, n_worker=2)
     try:
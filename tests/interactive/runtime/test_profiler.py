@@ -14,6 +14,7 @@ from grafix.core.pipeline import realize_scene
 from grafix.core.realize import RealizeSession
 from grafix.core.runtime_limits import RuntimeLimits
 from grafix.core.runtime_config import runtime_config
+from grafix.core.thread_budget import ThreadBudget
 from grafix.interactive.runtime.mp_draw import DrawResult
 from grafix.interactive.runtime.perf import PerfCollector
 from grafix.interactive.runtime.scene_runner import SceneRunner
@@ -362,8 +363,9 @@ def test_realize_cache_eviction_is_forwarded_to_profiler() -> None:
     first = G.polygon(n_sides=5)
     second = G.polygon(n_sides=6)
 
+    # 1/4 は simulation checkpoint tier に割かれ、geometry tier は 105 byte（polygon 1 つ分）。
     with RealizeSession(
-        runtime_limits=RuntimeLimits(cpu_cache_bytes=100),
+        runtime_limits=RuntimeLimits(cpu_cache_bytes=140),
         profiler=perf,
     ) as session:
         with perf.frame():
@@ -444,6 +446,47 @@ def test_scene_runner_records_worker_submit_to_result_lag() -> None:
     assert snapshot.worker_lag_ms == pytest.approx(24.5)
 
 
+def test_scene_runner_reports_thread_budget_oversubscription() -> None:
+    perf = PerfCollector(enabled=True, console_output=False)
+    budget = ThreadBudget(total_threads=1)
+    reservation = budget.reserve(1)
+    runner = SceneRunner(
+        lambda _t: G.polygon(n_sides=5),
+        perf=perf,
+        n_worker=0,
+        effective_config=runtime_config(),
+        thread_budget=budget,
+    )
+    try:
+        with perf.frame():
+            runner.run(
+                0.0,
+                store=ParamStore(),
+                cc_snapshot=None,
+                defaults=LayerStyleDefaults(
+                    color=(0.0, 0.0, 0.0),
+                    thickness=0.01,
+                ),
+                recording=False,
+                transport_epoch=0,
+                quality="draft",
+            )
+    finally:
+        runner.close()
+        reservation.release()
+
+    snapshot = perf.snapshot()
+    assert snapshot.cpu_threads == 1
+    assert snapshot.cpu_thread_peak_demand == 2
+    assert snapshot.cpu_oversubscribed_evaluations >= 1
+    assert snapshot.as_dict()["threads"] == {
+        "total": 1,
+        "demand": 2,
+        "peak_demand": 2,
+        "oversubscribed_evaluations": snapshot.cpu_oversubscribed_evaluations,
+    }
+
+
 def test_structured_json_trace_works_without_gui(tmp_path) -> None:
     trace_path = tmp_path / "performance.jsonl"
     perf = PerfCollector(
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+
+import numpy as np
+
+from grafix import E, G
+from grafix.core.geometry import Geometry
+from grafix.core.layer import LayerStyleDefaults
+from grafix.core.parameters import ParamStore
+from grafix.core.pipeline import RealizedLayer, realize_scene
+from grafix.core.preview_quality import PreviewQuality, preview_quality_context
+from grafix.core.realize import RealizeSession
+from grafix.core.resource_budget import ResourceBudget
+from grafix.core.runtime_config import runtime_config
+from grafix.core.runtime_limits import RuntimeLimits
+from grafix.interactive.runtime.perf import PerfCollector
+from grafix.interactive.runtime.refinement import ProgressiveRefiner
+from grafix.interactive.runtime.scene_runner import SceneRunner
+
+_DEFAULTS = LayerStyleDefaults(color=(0.2, 0.3, 0.4), thickness=0.01)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@contextmanager
+def _session(quality: PreviewQuality, **kwargs: object) -> Iterator[RealizeSession]:
+    with preview_quality_context(quality):
+        session = RealizeSession(**kwargs)  # type: ignore[arg-type]
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _draft(session: RealizeSession, geometry: Geometry) -> list[RealizedLayer]:
+    return realize_scene(lambda _t: geometry, 0.0, _DEFAULTS, session=session)
+
+
+def _keys(layers: list[RealizedLayer]) -> list[object]:
+    return [item.cache_key for item in layers]
+
+
+def _wait(refiner: ProgressiveRefiner) -> None:
+    job = refiner._job
+    assert job is not None
+    with suppress(Exception):
+        job.result(timeout=60)
+
+
+def test_idle_scene_is_swapped_for_final_quality_geometry() -> None:
+    geometry = E.rotate(rotation=(0.0, 0.0, 10.0))(G.polygon(n_sides=12))
+    clock = _Clock()
+    with _session("draft") as draft_session, _session("final") as final_session:
+        refiner = ProgressiveRefiner(session=final_session, idle_s=1.0, clock=clock)
+        try:
+            draft = _draft(draft_session, geometry)
+
+            assert _keys(refiner.observe(draft)) == _keys(draft)
+            clock.now = 0.5
+            assert _keys(refiner.observe(draft)) == _keys(draft)
+            assert refiner._job is None
+            clock.now = 1.0
+            assert _keys(refiner.observe(draft)) == _keys(draft)
+            _wait(refiner)
+            refined = refiner.observe(draft)
+        finally:
+            refiner.close()
+
+    assert refiner.last_output_refined is True
+    (item,) = refined
+    assert item.cache_key != draft[0].cache_key
+    assert item.cache_key.geometry_id == geometry.id
+    assert item.color == draft[0].color
+    assert item.thickness == draft[0].thickness
+    np.testing.assert_array_equal(item.realized.coords, draft[0].realized.coords)
+
+
+def test_new_scene_discards_refined_result_and_restarts_idle_timer() -> None:
+    first = G.polygon(n_sides=5)
+    second = G.polygon(n_sides=6)
+    clock = _Clock()
+    with _session("draft") as draft_session, _session("final") as final_session:
+        refiner = ProgressiveRefiner(session=final_session, idle_s=0.0, clock=clock)
+        try:
+            first_draft = _draft(draft_session, first)
+            refiner.observe(first_draft)
+            refiner.observe(first_draft)
+            _wait(refiner)
+            assert _keys(refiner.observe(first_draft)) != _keys(first_draft)
+
+            second_draft = _draft(draft_session, second)
+            assert _keys(refiner.observe(second_draft)) == _keys(second_draft)
+            assert refiner.last_output_refined is False
+            assert _keys(refiner.observe(first_draft)) == _keys(first_draft)
+            assert refiner.last_output_refined is False
+        finally:
+            refiner.close()
+
+
+def test_failed_final_evaluation_keeps_draft_without_retrying() -> None:
+    geometry = G.polygon(n_sides=64)
+    tight = RuntimeLimits(
+        scene=ResourceBudget(
+            max_output_vertices=8,
+            max_output_lines=100,
+            max_output_bytes=1_000_000,
+        )
+    )
+    clock = _Clock()
+    with (
+        _session("draft") as draft_session,
+        _session("final", runtime_limits=tight) as final_session,
+    ):
+        refiner = ProgressiveRefiner(session=final_session, idle_s=0.0, clock=clock)
+        try:
+            draft = _draft(draft_session, geometry)
+            refiner.observe(draft)
+            refiner.observe(draft)
+            _wait(refiner)
+
+            assert _keys(refiner.observe(draft)) == _keys(draft)
+            assert _keys(refiner.observe(draft)) == _keys(draft)
+            assert refiner._job is None
+        finally:
+            refiner.close()
+
+
+def test_scene_runner_refines_static_draft_preview() -> None:
+    def draw(_t: float) -> Geometry:
+        return G.polygon(n_sides=9, key="refine-static")
+
+    runner = SceneRunner(
+        draw,
+        perf=PerfCollector(enabled=False),
+        n_worker=0,
+        effective_config=runtime_config(),
+        refine_after=0.0,
+    )
+    store = ParamStore()
+
+    def run(quality: PreviewQuality) -> list[RealizedLayer]:
+        return runner.run(
+            0.0,
+            store=store,
+            cc_snapshot=None,
+            defaults=_DEFAULTS,
+            recording=False,
+            transport_epoch=0,
+            quality=quality,
+        )
+
+    try:
+        draft = run("draft")
+        assert _keys(run("draft")) == _keys(draft)
+        assert runner._refiner is not None
+        _wait(runner._refiner)
+        refined = run("draft")
+        refined_flag = runner.last_output_refined
+        final = run("final")
+        final_flag = runner.last_output_refined
+    finally:
+        runner.close()
+
+    assert refined_flag is True
+    assert refined[0].cache_key == final[0].cache_key
+    assert final_flag is False
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from grafix import E, G
+from grafix.core.layer import LayerStyleDefaults
+from grafix.core.parameters import ParameterKey, ParamStore
+from grafix.core.parameters.snapshot_ops import store_snapshot
+from grafix.core.runtime_config import runtime_config
+from grafix.interactive.runtime.perf import PerfCollector
+from grafix.interactive.runtime.scene_runner import SceneRunner
+
+
+def _draw(_t: float):
+    base = G.polygon(n_sides=64, key="dep-base")
+    return [
+        E.rotate(rotation=(0.0, 0.0, 15.0), key="dep-rotate")(base),
+        G.polygon(n_sides=3, key="dep-other"),
+    ]
+
+
+def test_sync_frame_predicts_recompute_of_dirty_subtree() -> None:
+    runner = SceneRunner(
+        _draw,
+        perf=PerfCollector(enabled=False),
+        n_worker=0,
+        effective_config=runtime_config(),
+    )
+    store = ParamStore()
+    try:
+        assert runner.predict_parameter_edit(
+            ParameterKey(op="polygon", site_id="dep-base", arg="n_sides")
+        ) is None
+        runner.run(
+            0.0,
+            store=store,
+            cc_snapshot=None,
+            defaults=LayerStyleDefaults(color=(0.0, 0.0, 0.0), thickness=0.01),
+            recording=False,
+            transport_epoch=0,
+            quality="draft",
+        )
+        keys = [key for key in store_snapshot(store) if key.op == "polygon"]
+        base_key = next(key for key in keys if "dep-base" in key.site_id)
+        other_key = next(key for key in keys if "dep-other" in key.site_id)
+
+        base = runner.predict_parameter_edit(base_key)
+        other = runner.predict_parameter_edit(other_key)
+    finally:
+        runner.close()
+
+    assert base is not None and other is not None
+    assert base.nodes == 2
+    assert base.measured_nodes == 2
+    assert base.predicted_ns > 0
+    assert base.dominant_op in {"polygon", "rotate"}
+    assert other.nodes == 1
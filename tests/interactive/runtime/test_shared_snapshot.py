@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from grafix.core.evaluation_context import (
+    EMPTY_EXTERNAL_DEPENDENCIES_FINGERPRINT,
+    EvaluationFingerprint,
+)
+from grafix.core.geometry import Geometry
+from grafix.core.layer import Layer
+from grafix.core.pipeline import RealizedLayer
+from grafix.core.realize import GeometryCacheKey
+from grafix.core.realized_geometry import RealizedGeometry
+from grafix.interactive.runtime.shared_snapshot import (
+    attached_snapshot_layers,
+    publish_shared_layers,
+    shared_layers_byte_size,
+)
+
+
+def _layer(coords: np.ndarray, offsets: np.ndarray, *, site_id: str) -> RealizedLayer:
+    geometry = Geometry.create("shared-snapshot-test")
+    return RealizedLayer(
+        layer=Layer(geometry=geometry, site_id=site_id),
+        realized=RealizedGeometry(coords=coords, offsets=offsets),
+        cache_key=GeometryCacheKey(
+            geometry_id=geometry.id,
+            evaluation=EvaluationFingerprint("0" * 64),
+            external_dependencies=EMPTY_EXTERNAL_DEPENDENCIES_FINGERPRINT,
+        ),
+        color=(0.25, 0.5, 0.75),
+        thickness=0.02,
+    )
+
+
+def test_publish_and_attach_round_trip_read_only_views_without_copy() -> None:
+    first = _layer(
+        np.arange(9, dtype=np.float32).reshape(3, 3),
+        np.asarray((0, 2, 3), dtype=np.int32),
+        site_id="first",
+    )
+    # 同じ coords/offsets 配列を共有し、style だけが異なる layer。
+    second = RealizedLayer(
+        layer=first.layer,
+        realized=first.realized._with_coords(first.realized.coords),
+        cache_key=first.cache_key,
+        color=(1.0, 0.0, 0.0),
+        thickness=0.5,
+    )
+    empty = _layer(
+        np.empty((0, 3), dtype=np.float32),
+        np.zeros((1,), dtype=np.int32),
+        site_id="empty",
+    )
+    layers = (first, second, empty)
+
+    segment = publish_shared_layers(layers)
+    try:
+        # coords 36 + align 4 + offsets 12 + align 4 + 空 coords 0 + 空 offsets 4。
+        # 共有配列は 2 回目を書かない。
+        assert segment.byte_size == shared_layers_byte_size(layers) == 60
+        with attached_snapshot_layers(segment.handle) as attached:
+            assert [layer.color for layer in attached] == [
+                layer.color for layer in layers
+            ]
+            for restored, original in zip(attached, layers, strict=True):
+                assert restored.layer == original.layer
+                assert restored.cache_key == original.cache_key
+                np.testing.assert_array_equal(
+                    restored.realized.coords,
+                    original.realized.coords,
+                )
+                np.testing.assert_array_equal(
+                    restored.realized.offsets,
+                    original.realized.offsets,
+                )
+                assert not restored.realized.coords.flags.writeable
+            assert not attached[0].realized.coords.flags.owndata
+            assert attached[0].realized.coords is attached[1].realized.coords
+            assert attached[0].realized.offsets is attached[1].realized.offsets
+            with pytest.raises(ValueError):
+                attached[0].realized.coords[0, 0] = 1.0
+            del restored
+        del attached
+    finally:
+        segment.close()
+    segment.close()
+
+    assert segment.closed
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=segment.handle.segment_name)
+
+
+def test_publish_rejects_snapshot_without_geometry_bytes() -> None:
+    empty = _layer(
+        np.empty((0, 3), dtype=np.float32),
+        np.zeros((1,), dtype=np.int32),
+        site_id="empty",
+    )
+
+    assert shared_layers_byte_size(()) == 0
+    with pytest.raises(ValueError, match="geometry"):
+        publish_shared_layers(())
+    assert shared_layers_byte_size((empty,)) == 4
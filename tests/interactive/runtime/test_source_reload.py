@@ -785,6 +785,69 @@ def test_spawn_worker_uses_parent_config_recipe_after_helper_disk_edit(
             worker.close()
 
 
+_MODULE_COUNT_MAIN = """
+import sys
+from . import helper as _helper
+from grafix import G
+
+def draw(t):
+    return G.line(length=float(len(sys.modules)) + _helper.OFFSET)
+"""
+
+
+def test_worker_hot_swap_evicts_previous_source_generation_modules(
+    tmp_path: Path,
+) -> None:
+    source_path = tmp_path / "sketch.py"
+    helper_path = tmp_path / "helper.py"
+    _write_source(source_path, _MODULE_COUNT_MAIN)
+    _write_source(helper_path, "OFFSET = 0.0\n")
+
+    def worker_module_count(worker: MpDraw) -> int:
+        deadline = time.monotonic() + 8.0
+        frame = 0
+        while time.monotonic() < deadline:
+            frame += 1
+            worker.submit(
+                t=float(frame),
+                snapshot_revision=0,
+                snapshot={},
+                effect_order_snapshot={},
+                epoch=worker.current_epoch,
+                quality="draft",
+            )
+            result = worker.poll_latest()
+            if result is not None and result.generation == worker.generation:
+                assert result.error is None
+                return int(dict(result.layers[0].geometry.args)["length"])
+            time.sleep(0.01)
+        pytest.fail("worker result timeout")
+
+    with SourceReloadController(source_path) as controller:
+        worker = MpDraw(
+            controller.draw,
+            n_worker=1,
+            effective_config=runtime_config(),
+        )
+        try:
+            worker_module_count(worker)
+            counts = []
+            for _ in range(2):
+                _write_source(helper_path, "OFFSET = 0.0\n")
+                assert controller.poll(force=True).status == "reloaded"
+                worker.swap_draw(controller.draw, definitions=controller.definitions)
+                counts.append(worker_module_count(worker))
+
+            assert worker.source_swap_count == 2
+            assert worker.restart_count == 0
+        finally:
+            worker.close()
+
+    # 各世代は entry と helper を含む module tree を import する。旧世代を外さないと
+    # 2 回目の swap 後に worker の sys.modules がその分だけ増える。
+    assert counts[1] == counts[0]
+
+
 def test_reload_removes_presets_deleted_from_source(tmp_path: Path) -> None:
     source_path = tmp_path / "sketch.py"
     _write_source(
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import pytest
+
+from grafix.interactive.runtime.warm_pool import WarmPoolStats, WarmWorkerPool
+
+
+class _FakeProcess:
+    def __init__(self) -> None:
+        self.exitcode: int | None = None
+
+
+class _FakeSet:
+    def __init__(self, process_count: int) -> None:
+        self.processes = tuple(_FakeProcess() for _ in range(process_count))
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+        for proc in self.processes:
+            proc.exitcode = 0
+
+
+class _Factory:
+    def __init__(self, process_count: int = 1) -> None:
+        self.process_count = process_count
+        self.created: list[_FakeSet] = []
+
+    def __call__(self) -> _FakeSet:
+        worker_set = _FakeSet(self.process_count)
+        self.created.append(worker_set)
+        return worker_set
+
+
+def _filled(pool: WarmWorkerPool) -> WarmPoolStats:
+    assert pool.join_fill(timeout=5.0)
+    return pool.stats
+
+
+def test_pool_prespawns_on_register_and_refills_after_hit() -> None:
+    pool = WarmWorkerPool(max_processes=4)
+    factory = _Factory()
+    try:
+        slot = pool.register("export", factory, process_count=1)
+        assert _filled(pool).idle_processes == 1
+
+        first = pool.acquire(slot)
+
+        assert first is factory.created[0]
+        stats = _filled(pool)
+        assert (stats.hits, stats.misses) == (1, 0)
+        assert stats.idle_processes == 1
+        assert stats.leased_processes == 1
+        assert stats.spawned_processes == 2
+    finally:
+        pool.close()
+    assert factory.created[1].closed
+    assert not factory.created[0].closed
+
+
+def test_pool_discards_dead_idle_set_and_counts_miss() -> None:
+    pool = WarmWorkerPool(max_processes=2)
+    factory = _Factory()
+    try:
+        slot = pool.register("export", factory, process_count=1)
+        _filled(pool)
+        factory.created[0].processes[0].exitcode = 1
+
+        assert pool.acquire(slot) is None
+
+        stats = _filled(pool)
+        assert factory.created[0].closed
+        assert (stats.hits, stats.misses, stats.discarded_sets) == (0, 1, 1)
+        assert stats.idle_processes == 1
+    finally:
+        pool.close()
+
+
+def test_pool_never_exceeds_process_cap() -> None:
+    pool = WarmWorkerPool(max_processes=3)
+    export_factory = _Factory(1)
+    draw_factory = _Factory(2)
+    try:
+        export_slot = pool.register("export", export_factory, process_count=1)
+        draw_slot = pool.register("mp-draw", draw_factory, process_count=2)
+        assert _filled(pool).idle_processes == 3
+
+        assert pool.acquire(draw_slot) is not None
+        stats = _filled(pool)
+        # 貸出中 2 + 待機中 1 で上限に達し、mp-draw の予備は補充しない。
+        assert stats.idle_processes + stats.leased_processes == 3
+        assert stats.capped_fills == 1
+        assert len(draw_factory.created) == 1
+
+        # 貸出中 process が終了すると、次の acquire を契機に補充できる。
+        for proc in draw_factory.created[0].processes:
+            proc.exitcode = 0
+        assert pool.acquire(draw_slot) is None
+        assert _filled(pool).idle_processes == 3
+        assert pool.acquire(export_slot) is export_factory.created[0]
+    finally:
+        pool.close()
+
+
+def test_unregister_and_close_release_idle_sets_and_stop_filling() -> None:
+    pool = WarmWorkerPool(max_processes=4)
+    factory = _Factory()
+    slot = pool.register("export", factory, process_count=1)
+    _filled(pool)
+
+    pool.unregister(slot)
+
+    assert factory.created[0].closed
+    assert pool.acquire(slot) is None
+    assert pool.stats.misses == 0
+    pool.close()
+    pool.close()
+    with pytest.raises(RuntimeError, match="close 済み"):
+        pool.register("export", factory, process_count=1)
+
+
+def test_failed_fill_is_retried_on_next_acquire() -> None:
+    pool = WarmWorkerPool(max_processes=2)
+    calls = 0
+
+    def flaky() -> _FakeSet:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise OSError("spawn failed")
+        return _FakeSet(1)
+
+    try:
+        slot = pool.register("export", flaky, process_count=1)
+        assert _filled(pool).failed_fills == 1
+
+        assert pool.acquire(slot) is None
+        assert _filled(pool).idle_processes == 1
+        assert pool.acquire(slot) is not None
+    finally:
+        pool.close()
+
+
+def test_tracked_synchronous_spawns_count_toward_process_cap() -> None:
+    pool = WarmWorkerPool(max_processes=3)
+    current_generation = _FakeSet(2)
+    draw_factory = _Factory(2)
+    export_factory = _Factory(1)
+    try:
+        # 初回世代は pool を経ずに同期 spawn され、track() で届け出られる。
+        pool.track(current_generation.processes)
+        draw_slot = pool.register("mp-draw", draw_factory, process_count=2)
+        pool.register("export", export_factory, process_count=1)
+
+        stats = _filled(pool)
+        # 生存 2 + 予備 export 1 で上限に達し、mp-draw の予備世代は持たない。
+        assert stats.idle_processes + stats.leased_processes == 3
+        assert stats.capped_fills == 1
+        assert draw_factory.created == []
+
+        # 同期 spawn した世代が終了すると、次の acquire を契機に予備世代を補充できる。
+        current_generation.close()
+        assert pool.acquire(draw_slot) is None
+        assert _filled(pool).idle_processes == 3
+    finally:
+        pool.close()
@@ -10,6 +10,7 @@ from grafix.core.evaluation_context import (
     EMPTY_EXTERNAL_DEPENDENCIES_FINGERPRINT,
     EvaluationFingerprint,
 )
+from grafix.core.instanced_geometry import instanced_geometry
 from grafix.core.realize import GeometryCacheKey
 from grafix.core.realized_geometry import RealizedGeometry
 from grafix.core.runtime_limits import RuntimeLimits
@@ -30,12 +31,17 @@ class _FakeMesh:
         self.vertices_only_upload_count = 0
         self.vertex_upload_count = 0
         self.index_upload_count = 0
+        self.instance_count = 1
+        self.instance_transforms: np.ndarray | None = None
+        self.instance_upload_count = 0
         self.released = False
         _FakeMesh.instances.append(self)
 
     def upload(self, vertices: np.ndarray, indices: np.ndarray) -> None:
         assert vertices.dtype == np.float32
         assert indices.dtype == np.uint32
+        self.last_vertex_rows = int(vertices.shape[0])
+        self.index_count = int(indices.shape[0])
         self.upload_count += 1
         self.vertex_upload_count += 1
         self.index_upload_count += 1
@@ -45,6 +51,14 @@ class _FakeMesh:
         self.vertices_only_upload_count += 1
         self.vertex_upload_count += 1
 
+    def upload_instances(self, transforms: np.ndarray | None) -> bool:
+        if transforms is self.instance_transforms:
+            return False
+        self.instance_transforms = transforms
+        self.instance_count = 1 if transforms is None else int(transforms.shape[0])
+        self.instance_upload_count += 1
+        return True
+
     def release(self) -> None:
         self.released = True
 
@@ -148,6 +162,7 @@ def _draw_mesh(name: str, draw_order: list[str]) -> SimpleNamespace:
     return SimpleNamespace(
         vao=_FakeVao(name, draw_order),
         index_count=6,
+        instance_count=1,
     )
 
 
@@ -922,3 +937,47 @@ def test_renderer_release_drops_scratch_topology_reference() -> None:
     assert renderer._scratch_mesh.released is True
     assert not renderer._mesh_candidates
     assert not renderer._dynamic_meshes
+
+
+def test_renderer_uploads_instanced_base_once_and_draws_all_instances(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _FakeMesh.instances.clear()
+    monkeypatch.setattr(renderer_module, "LineMesh", _FakeMesh)
+    renderer, _uniforms = _draw_renderer()
+    transforms = np.tile(np.eye(4, dtype=np.float64), (50, 1, 1))
+    transforms[:, 0, 3] = np.arange(50, dtype=np.float64) * 5.0
+    instanced = instanced_geometry(_geometry(), transforms)
+    draw_order: list[str] = []
+    vao = _FakeVao("instanced", draw_order)
+    renderer._scratch_mesh.vao = vao
+
+    mesh, stats = renderer.prepare_layer_mesh(
+        instanced,
+        cache_key=_cache_key("instanced"),
+        scene_serial=1,
+        snapshot_revision=1,
+    )
+
+    assert mesh is renderer._scratch_mesh
+    # 展開後の 150 頂点ではなく base の 3 頂点だけを送る。
+    assert mesh.last_vertex_rows == 3
+    assert mesh.instance_transforms is instanced.gpu_transforms
+    assert stats.draw_vertices == 150
+    assert stats.draw_lines == 50
+    renderer.draw_prepared_mesh(mesh, color=(0.0, 0.0, 0.0), thickness=0.01)
+    assert vao.calls == [{"mode": 3, "vertices": mesh.index_count, "instances": 50}]
+    np.testing.assert_array_equal(
+        instanced.gpu_transforms[7].reshape(4, 4).T,
+        transforms[7].astype(np.float32),
+    )
+
+    plain, _stats = renderer.prepare_layer_mesh(
+        _geometry(shift=1.0),
+        cache_key=_cache_key("plain"),
+        scene_serial=1,
+        snapshot_revision=1,
+    )
+    assert plain is renderer._scratch_mesh
+    assert plain.instance_transforms is None
+    assert plain.instance_count == 1
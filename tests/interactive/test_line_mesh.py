@@ -41,25 +41,33 @@ class _Context:
         self.primitive_restart = False
         self.primitive_restart_index = 0
 
-    def buffer(self, *, reserve: int, dynamic: bool) -> _Buffer:
+    def buffer(
+        self,
+        data: bytes | None = None,
+        *,
+        reserve: int = 0,
+        dynamic: bool,
+    ) -> _Buffer:
         assert dynamic is True
         if self.fail_reserve == reserve:
             raise RuntimeError("allocation failed")
-        buffer = _Buffer(reserve)
+        buffer = _Buffer(reserve if data is None else len(data))
         self.buffers.append(buffer)
         return buffer
 
-    def simple_vertex_array(
+    def vertex_array(
         self,
         program: Any,
-        vbo: _Buffer,
-        attribute: str,
+        content: list[tuple[_Buffer, str, str]],
         *,
         index_buffer: _Buffer,
     ) -> _VertexArray:
         assert program is not None
-        assert attribute == "in_vert"
-        assert not vbo.released
+        assert [(layout, name) for _buffer, layout, name in content] == [
+            ("3f", "in_vert"),
+            ("16f/i", "in_model"),
+        ]
+        assert not any(buffer.released for buffer, _layout, _name in content)
         assert not index_buffer.released
         vao = _VertexArray()
         self.vertex_arrays.append(vao)
@@ -83,7 +91,8 @@ def test_line_mesh_uses_geometric_buffer_growth() -> None:
     assert mesh.vbo.size == 64
     assert mesh.ibo.size == 64
 
-    assert len(context.buffers) == 8
+    # VBO/IBO/instance VBO の初期 3 本 + 成長ごとの VBO/IBO 2 本。
+    assert len(context.buffers) == 9
     assert len(context.vertex_arrays) == 4
 
 
@@ -164,3 +173,25 @@ def test_line_mesh_accepts_empty_vertex_and_index_uploads() -> None:
     assert mesh.vbo.write_sizes == [0, 0]
     assert mesh.ibo.orphan_count == 1
     assert mesh.ibo.write_sizes == [0]
+
+
+def test_line_mesh_uploads_instances_once_and_resets_to_identity() -> None:
+    context = _Context()
+    mesh = LineMesh(context, object(), initial_reserve=8)
+    transforms = np.tile(np.eye(4, dtype=np.float32).reshape(1, 16), (3, 1))
+
+    assert mesh.instance_count == 1
+    assert mesh.upload_instances(transforms) is True
+    assert mesh.upload_instances(transforms) is False
+    assert mesh.upload_instances(transforms.copy()) is False
+
+    assert mesh.instance_count == 3
+    assert mesh.instance_vbo.size == 3 * LineMesh.INSTANCE_STRIDE
+    assert mesh.instance_vbo.write_sizes == [3 * LineMesh.INSTANCE_STRIDE]
+    assert len(context.vertex_arrays) == 2
+
+    assert mesh.upload_instances(None) is True
+    assert mesh.upload_instances(None) is False
+    assert mesh.instance_count == 1
+    assert mesh.instance_transforms is None
+    assert mesh.instance_vbo.write_sizes[-1] == LineMesh.INSTANCE_STRIDE